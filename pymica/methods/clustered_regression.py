@@ -115,7 +115,9 @@ class ClusteredRegression:
                     out[x_data_idx[data[0]["id"]]] = data[1]
         return out
 
-    def apply_clustered_regression(self, raster_data, raster_fields, mask):
+    def apply_clustered_regression(
+        self, raster_data, raster_fields, mask, valid_mask=None, nodata=np.nan
+    ):
         """The same as apply_regression, but using a "clustered regresion".
         The result is weighed by a mask array.
 
@@ -130,16 +132,39 @@ class ClusteredRegression:
                             value 1 and the others with value 0.
                             Intermediate values are allowed to overlap zones.
                             Use *create_clusters_file* to generate the data.
+            valid_mask (nd.array, optional): A 2-D array with the valid pixels
+                            different than 0. Only these pixels are computed.
+                            Defaults to None, all the pixels.
+            nodata (float, optional): Value of the pixels out of `valid_mask`.
+                            Defaults to NaN.
 
         Returns:
         nd.array: The final value array, after overlapping all the clusters.
         """
-
-        result = np.zeros((mask.shape[1], mask.shape[2]), dtype=np.float64)
+        if valid_mask is None:
+            result = np.zeros((mask.shape[1], mask.shape[2]), dtype=np.float64)
+            for i, regr in enumerate(self.final_regr):
+                result += (
+                    __apply_regression__(regr, raster_data, raster_fields) * mask[i]
+                )
+
+            return result / mask.sum(axis=0)
+
+        # Only the valid pixels of each layer are read, one layer at a time
+        valid = np.asarray(valid_mask) != 0
+        values = np.zeros(np.count_nonzero(valid), dtype=np.float64)
+        weights = np.zeros_like(values)
         for i, regr in enumerate(self.final_regr):
-            result += __apply_regression__(regr, raster_data, raster_fields) * mask[i]
+            cluster_weights = mask[i][valid]
+            values += (
+                __apply_regression__(regr, raster_data, raster_fields, valid)
+                * cluster_weights
+            )
+            weights += cluster_weights
 
-        return result / mask.sum(axis=0)
+        result = np.full(valid.shape, nodata, dtype=np.float64)
+        result[valid] = values / weights
+        return result
 
 
 def __filter_data_by_cluster__(data, cluster):
@@ -188,7 +213,7 @@ def __get_cluster_mse__(residuals_all, data_in_cluster):
     return residuals_sum / len(data_in_cluster)
 
 
-def __apply_regression__(regr, raster_data, raster_fields):
+def __apply_regression__(regr, raster_data, raster_fields, valid=None):
     """Applies the regression formula to an array, to
     get all the values for each point
 
@@ -200,6 +225,9 @@ def __apply_regression__(regr, raster_data, raster_fields):
         raster_fields (list): The variable names as passed into MultiRegression
                             and in the order they appear in raster_data.
                             Used to apply the fields in the correct order.
+        valid (nd.array, optional): A 2-D boolean array. If provided, only
+                            these pixels are computed, as a 1-D array.
+                            Defaults to None, all the pixels.
 
     Raises:
         ValueError: The array has wrong dimensions
@@ -210,10 +238,16 @@ def __apply_regression__(regr, raster_data, raster_fields):
     if not isinstance(raster_data, np.ndarray) or len(raster_data.shape) != 3:
         raise ValueError("raster_data must be a 3 dimensional array")
     coefs = regr.get_coefs()
-    out_data = coefs[1] * np.ones((raster_data[0].shape[0], raster_data[0].shape[1]))
-
+    if valid is None:
+        out_data = np.full(raster_data.shape[1:], coefs[1], dtype=np.float64)
+    else:
+        out_data = np.full(np.count_nonzero(valid), coefs[1], dtype=np.float64)
+    term = np.empty_like(out_data)
     for i, coef in enumerate(coefs[0]):
-        field_pos = raster_fields.index(regr.used_vars[i])
-        out_data += coef * raster_data[field_pos]
+        field = raster_data[raster_fields.index(regr.used_vars[i])]
+        if valid is not None:
+            field = field[valid]
+        np.multiply(field, coef, out=term, dtype=np.float64)
+        out_data += term
 
     return out_data
@@ -10,6 +10,10 @@ Credits:
 https://en.wikipedia.org/wiki/Inverse_distance_weighting
 """
 
+import hashlib
+import os
+import tempfile
+
 import numpy as np
 from scipy.spatial import cKDTree
 
@@ -58,7 +62,15 @@ class Tree(object):
         return self.__init__(coordinates, scores, leafsize)
 
     def __call__(
-        self, coordinates, num_nearest=6, eps=1e-6, p_norm=2, regularize_by=1e-9
+        self,
+        coordinates,
+        num_nearest=6,
+        eps=1e-6,
+        p_norm=2,
+        regularize_by=1e-9,
+        workers=1,
+        chunk_size=65536,
+        out=None,
     ):
         """
         Compute the score of query points based on the scores of their
@@ -81,18 +93,98 @@ class Tree(object):
             regularize_by (float): (default 1e-9)
                 Regularize distances to prevent division by zero
                 for sample points with the same location as query points.
+            workers (int): Defaults to 1
+                Number of threads of the KD-tree queries. -1 uses all the
+                available cores.
+            chunk_size (int): Defaults to 65536
+                Number of query points processed at once, which bounds the
+                memory of the temporary arrays.
+            out ((N,) ndarray, optional): Defaults to None.
+                Array where the scores are written.
+
+        Raises:
+            ValueError: If `out` does not have shape (N,).
 
         Returns:
-            (N,) ndarray: Corresponding scores.
+            (N,) ndarray: Corresponding scores, `out` if it was provided.
+        """
+        coordinates = np.asarray(coordinates)
+        num_points = coordinates.shape[0]
+        if out is None:
+            out = np.empty(num_points)
+        elif out.shape != (num_points,):
+            raise ValueError("out must have shape " + str((num_points,)))
+
+        for start in range(0, num_points, chunk_size):
+            end = min(start + chunk_size, num_points)
+            distances, idx = self.neighbours(
+                coordinates[start:end], num_nearest, eps, p_norm, workers
+            )
+            self.weighted_scores(distances, idx, regularize_by, out[start:end])
+
+        return out
+
+    def neighbours(self, coordinates, num_nearest=6, eps=1e-6, p_norm=2, workers=1):
+        """Distances and indices of the k-nearest neighbours of query points.
+
+        Args:
+            coordinates ((N, d) ndarray):
+                Coordinates of N query points in a d-dimensional space.
+            num_nearest (int): Defaults to 6
+                Number of nearest neighbours to use.
+            eps (float): Defaults to 1e-6
+                Approximation of the neighbours, as in `__call__`.
+            p_norm (int or inf): Defaults to 2
+                Which Minkowski p-norm to use, as in `__call__`.
+            workers (int): Defaults to 1
+                Number of threads of the KD-tree queries, as in `__call__`.
+
+        Returns:
+            tuple: (N, num_nearest) ndarrays with the distances and the
+                indices of the neighbours.
         """
-        distances, idx = self.tree.query(coordinates, num_nearest, eps=eps, p=p_norm)
-        distances += regularize_by
-        weights = self.scores[idx.ravel()].reshape(idx.shape)
-        m_w = np.sum(weights / distances, axis=1) / np.sum(1.0 / distances, axis=1)
-        return m_w
+        distances, idx = self.tree.query(
+            coordinates, num_nearest, eps=eps, p=p_norm, workers=workers
+        )
+        # A single neighbour is returned without the neighbours axis
+        return distances.reshape(len(coordinates), -1), idx.reshape(
+            len(coordinates), -1
+        )
+
+    def weighted_scores(self, distances, idx, regularize_by=1e-9, out=None):
+        """Scores of query points from the distances and indices of their
+        neighbours, as returned by `neighbours`.
+
+        Args:
+            distances ((N, k) ndarray): Distances to the neighbours.
+            idx ((N, k) ndarray): Indices of the neighbours.
+            regularize_by (float): Defaults to 1e-9
+                Regularize distances to prevent division by zero
+                for sample points with the same location as query points.
+            out ((N,) ndarray, optional): Defaults to None.
+                Array where the scores are written.
+
+        Returns:
+            (N,) ndarray: Corresponding scores, `out` if it was provided.
+        """
+        distances = distances + regularize_by
+        weights = self.scores[idx]
+        result = np.sum(weights / distances, axis=1) / np.sum(1.0 / distances, axis=1)
+        if out is None:
+            return result
+        out[...] = result
+        return out
 
     def transform(
-        self, coordinates, num_nearest=6, p_norm=2, eps=1e-6, regularize_by=1e-9
+        self,
+        coordinates,
+        num_nearest=6,
+        p_norm=2,
+        eps=1e-6,
+        regularize_by=1e-9,
+        workers=1,
+        chunk_size=65536,
+        out=None,
     ):
         """Compute the score of query points based on the scores of their
         k-nearest neighbours, weighted by the inverse of their distances.
@@ -114,14 +206,38 @@ class Tree(object):
             regularize_by (float): Defaults to 1e-9
                 Regularize distances to prevent division by zero
                 for sample points with the same location as query points.
+            workers (int): Defaults to 1
+                Number of threads of the KD-tree queries, as in `__call__`.
+            chunk_size (int): Defaults to 65536
+                Number of query points processed at once, as in `__call__`.
+            out ((N,) ndarray, optional): Defaults to None.
+                Array where the scores are written.
         Returns:
             (N,) ndarray: Corresponding scores.
 
         """
-        return self.__call__(coordinates, num_nearest, eps, p_norm, regularize_by)
+        return self.__call__(
+            coordinates,
+            num_nearest,
+            eps,
+            p_norm,
+            regularize_by,
+            workers=workers,
+            chunk_size=chunk_size,
+            out=out,
+        )
 
 
-def idw(residues, size, geotransform, num_nearest=6):
+def idw(
+    residues,
+    size,
+    geotransform,
+    num_nearest=6,
+    workers=1,
+    chunk_size=65536,
+    out=None,
+    cache_dir=None,
+):
     """Interpolates the residues field using the inverse of the distance
         weighting method
 
@@ -133,8 +249,35 @@ def idw(residues, size, geotransform, num_nearest=6):
                                 the matrix.
                                 See https://www.gdal.org/gdal_datamodel.html
                                 for more information
+        num_nearest (int, optional): Number of nearest neighbours to use.
+                                Defaults to 6.
+        workers (int, optional): Number of threads of the KD-tree queries.
+                                -1 uses all the available cores. Defaults
+                                to 1.
+        chunk_size (int, optional): Number of pixels processed at once. The
+                                grid is queried in blocks of whole rows with
+                                about this number of pixels, so the memory
+                                does not grow with the field size. Defaults
+                                to 65536.
+        out (np.array, optional): C-contiguous float array with shape `size`
+                                where the field is written. Defaults to
+                                None, a new float64 array.
+        cache_dir (str, optional): Directory of the neighbours cache. The
+                                neighbours of each pixel are saved in a .npy
+                                file named after a hash of the station
+                                coordinates, the geotransform, the size and
+                                `num_nearest`, and later calls with the same
+                                network and grid only weight the saved
+                                neighbours. The file is written and read
+                                by chunks through a memory map. Defaults to
+                                None, no cache.
+
+    Raises:
+        ValueError: If `out` is not a C-contiguous float array with shape
+                    `size`.
+
     Returns:
-        list: The interpolated residues
+        list: The interpolated residues, `out` if it was provided
 
     """
     coords = []
@@ -142,23 +285,149 @@ def idw(residues, size, geotransform, num_nearest=6):
     for key in residues.keys():
         coords.append([residues[key]["x"], residues[key]["y"]])
         values.append(residues[key]["value"])
-    coords = np.array(coords)
+    coords = np.array(coords, dtype=np.float64)
     values = np.array(values)
 
-    idw_tree = Tree(coords, values)
+    rows, cols = int(size[0]), int(size[1])
+    if out is None:
+        out = np.empty((rows, cols))
+    elif (
+        not isinstance(out, np.ndarray)
+        or out.shape != (rows, cols)
+        or out.dtype not in (np.float32, np.float64)
+        or not out.flags["C_CONTIGUOUS"]
+    ):
+        raise ValueError(
+            "out must be a C-contiguous float32 or float64 array with shape "
+            + str((rows, cols))
+        )
+
+    if cache_dir is None:
+        idw_tree = Tree(coords, values)
+        for row0, row1, xy_coords in _grid_chunks(size, geotransform, chunk_size):
+            idw_tree(
+                xy_coords,
+                num_nearest,
+                workers=workers,
+                chunk_size=chunk_size,
+                out=out[row0:row1].reshape(-1),
+            )
+        return out
 
-    x_coords = np.arange(
-        geotransform[0], geotransform[0] + size[1] * geotransform[1], geotransform[1]
+    cache_file = os.path.join(
+        cache_dir, "idw_" + _cache_key(coords, size, geotransform, num_nearest) + ".npy"
     )
+    out_pixels = out.reshape(-1)
+    neighbours = _read_cache(cache_file, rows * cols, num_nearest)
+    if neighbours is not None:
+        idw_tree = Tree(scores=values)
+        for start in range(0, rows * cols, chunk_size):
+            pixels = slice(start, start + chunk_size)
+            idw_tree.weighted_scores(
+                neighbours["distances"][pixels],
+                neighbours["idx"][pixels],
+                out=out_pixels[pixels],
+            )
+        return out
+
+    idw_tree = Tree(coords, values)
+    with _CacheWriter(cache_file, rows * cols, num_nearest) as cache:
+        for row0, row1, xy_coords in _grid_chunks(size, geotransform, chunk_size):
+            pixels = slice(row0 * cols, row1 * cols)
+            distances, idx = idw_tree.neighbours(
+                xy_coords, num_nearest, workers=workers
+            )
+            cache.neighbours["distances"][pixels] = distances
+            cache.neighbours["idx"][pixels] = idx
+            idw_tree.weighted_scores(distances, idx, out=out_pixels[pixels])
+
+    return out
 
-    y_coords = np.arange(
-        geotransform[3], geotransform[3] + size[0] * geotransform[5], geotransform[5]
+
+def _grid_chunks(size, geotransform, chunk_size):
+    """Yields the first and last rows and the pixel coordinates of blocks of
+    whole rows with about `chunk_size` pixels."""
+    rows, cols = int(size[0]), int(size[1])
+    x_coords = geotransform[0] + np.arange(cols) * geotransform[1]
+    chunk_rows = max(1, chunk_size // max(cols, 1))
+    for row0 in range(0, rows, chunk_rows):
+        row1 = min(row0 + chunk_rows, rows)
+        y_coords = geotransform[3] + np.arange(row0, row1) * geotransform[5]
+        xy_coords = np.empty(((row1 - row0) * cols, 2))
+        xy_coords[:, 0] = np.tile(x_coords, row1 - row0)
+        xy_coords[:, 1] = np.repeat(y_coords, cols)
+        yield row0, row1, xy_coords
+
+
+def _cache_key(coords, size, geotransform, num_nearest):
+    """Hash of the station network and the grid of a neighbours cache."""
+    key = hashlib.sha1()
+    key.update(np.ascontiguousarray(coords, dtype=np.float64).tobytes())
+    key.update(np.asarray(size, dtype=np.int64).tobytes())
+    key.update(np.asarray(geotransform, dtype=np.float64).tobytes())
+    key.update(np.asarray(num_nearest, dtype=np.int64).tobytes())
+    return key.hexdigest()
+
+
+def _cache_dtype(num_nearest):
+    """Dtype of the records of a neighbours cache, one per pixel."""
+    return np.dtype(
+        [("distances", np.float64, (num_nearest,)), ("idx", np.int32, (num_nearest,))]
     )
 
-    xy_coords = np.meshgrid(x_coords, y_coords)
-    xy_coords = np.reshape(xy_coords, (2, -1)).T
 
-    idw_array = idw_tree(xy_coords, num_nearest)
-    idw_array = idw_array.reshape(size)
+def _read_cache(cache_file, num_pixels, num_nearest):
+    """Maps the neighbours cache records, or returns None if the file does not
+    exist or is not valid."""
+    if not os.path.exists(cache_file):
+        return None
+    try:
+        neighbours = np.load(cache_file, mmap_mode="r")
+    except (OSError, ValueError):
+        return None
+    if neighbours.dtype != _cache_dtype(num_nearest) or neighbours.shape != (
+        num_pixels,
+    ):
+        return None
+    return neighbours
+
+
+class _CacheWriter:
+    """Context manager with the memory mapped `neighbours` records of a new
+    neighbours cache, written to a temporary file that replaces `cache_file`
+    on exit, so concurrent runs never read a partial file."""
+
+    def __init__(self, cache_file, num_pixels, num_nearest):
+        self.cache_file = cache_file
+        self.num_pixels = num_pixels
+        self.num_nearest = num_nearest
+        self.tmp_file = None
+        self.neighbours = None
+
+    def __enter__(self):
+        cache_dir = os.path.dirname(self.cache_file) or "."
+        os.makedirs(cache_dir, exist_ok=True)
+        file_handle, self.tmp_file = tempfile.mkstemp(dir=cache_dir, suffix=".npy")
+        os.close(file_handle)
+        try:
+            self.neighbours = np.lib.format.open_memmap(
+                self.tmp_file,
+                mode="w+",
+                dtype=_cache_dtype(self.num_nearest),
+                shape=(self.num_pixels,),
+            )
+        except BaseException:
+            os.remove(self.tmp_file)
+            raise
+        return self
 
-    return idw_array
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.neighbours.flush()
+        # The map is closed before moving or removing the file
+        self.neighbours = None
+        if exc_type is None:
+            os.replace(self.tmp_file, self.cache_file)
+        else:
+            os.remove(self.tmp_file)
+        return False
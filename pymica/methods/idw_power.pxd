@@ -0,0 +1,83 @@
+"""
+Weights of the inverse of the distance kernels, shared by inverse_distance,
+inverse_distance_3d and inverse_distance_tree.
+
+The weights are dist_sq ** (-power / 2). Powers multiple of 0.5, like the
+usual 1, 1.5, 2, 2.5 and 3, are split once into a whole power of dist_sq
+and a number of quarter powers, which only need multiplications and square
+roots. Any other power uses a single exp and log.
+"""
+
+from libc.math cimport exp, expf, floor, log, logf, sqrt, sqrtf
+
+
+cdef struct IdwPower:
+    double power
+    # Whole power of dist_sq, or -1 if the power is not a multiple of 0.5
+    int whole
+    # Quarter powers of dist_sq left, from 0 to 3
+    int quarters
+
+
+cdef inline IdwPower make_power(double power) noexcept nogil:
+    cdef IdwPower result
+    cdef double quarters = 2.0 * power
+    result.power = power
+    if 0 <= quarters <= 256 and quarters == floor(quarters):
+        result.whole = <int> quarters // 4
+        result.quarters = <int> quarters % 4
+    else:
+        result.whole = -1
+        result.quarters = 0
+    return result
+
+
+cdef inline double station_weight(double dist_sq,
+                                  IdwPower power) noexcept nogil:
+    cdef double dist, result
+    if power.whole == 1 and power.quarters == 0:
+        return 1.0 / dist_sq
+    if power.whole < 0:
+        return exp(-0.5 * power.power * log(dist_sq))
+
+    result = fast_pow(dist_sq, power.whole)
+    if power.quarters == 1:
+        result *= sqrt(sqrt(dist_sq))
+    elif power.quarters == 2:
+        result *= sqrt(dist_sq)
+    elif power.quarters == 3:
+        dist = sqrt(dist_sq)
+        result *= dist * sqrt(dist)
+    return 1.0 / result
+
+
+cdef inline float station_weight32(float dist_sq,
+                                   IdwPower power) noexcept nogil:
+    """station_weight in float32."""
+    cdef float one = 1.0
+    cdef float dist, result
+    cdef int k
+    if power.whole < 0:
+        return expf(<float> (-0.5 * power.power) * logf(dist_sq))
+
+    result = one
+    for k in range(power.whole):
+        result = result * dist_sq
+    if power.quarters == 1:
+        result = result * sqrtf(sqrtf(dist_sq))
+    elif power.quarters == 2:
+        result = result * sqrtf(dist_sq)
+    elif power.quarters == 3:
+        dist = sqrtf(dist_sq)
+        result = result * dist * sqrtf(dist)
+    return one / result
+
+
+cdef inline double fast_pow(double base, int exp) noexcept nogil:
+    cdef double result = 1.0
+    while exp > 0:
+        if exp & 1:
+            result *= base
+        base *= base
+        exp >>= 1
+    return result
@@ -0,0 +1,217 @@
+"""Inverse of the distance field that can be updated one station at a time,
+keeping the weighted sum of the values and the sum of the weights of every
+pixel.
+"""
+
+import numpy as np
+
+
+class IncrementalInverseDistance:
+    """Inverse of the distance field whose stations can be added, removed or
+    corrected one at a time. Each change costs one pass over the pixels,
+    instead of interpolating all the stations again.
+
+    The field is the same as the one from
+    :meth:`pymica.methods.inverse_distance.inverse_distance`, or from
+    :meth:`pymica.methods.inverse_distance_3d.inverse_distance_3d` if a DEM is
+    provided.
+    """
+
+    def __init__(
+        self,
+        size: list,
+        geotransform: list,
+        power: float = 2,
+        smoothing: float = 0.0,
+        dem: np.ndarray = None,
+        penalization: float = 30,
+        rebuild_ratio: float = 1e3,
+    ) -> None:
+        """Start with an empty set of stations.
+
+        Args:
+            size (list): Field size as [rows, cols].
+            geotransform (list): The geotransform of the field.
+            power (float, optional): Inverse of the distance power. Defaults to 2.
+            smoothing (float, optional): Smoothing distance. Defaults to 0.0.
+            dem (np.ndarray, optional): 2-D array of altitudes with the field size.
+                If provided, the 3D inverse of the distance is used and stations
+                need an altitude. Defaults to None.
+            penalization (float, optional): Altitude penalization used with `dem`.
+                Defaults to 30.
+            rebuild_ratio (float, optional): The accumulators are recomputed from
+                the remaining stations when the weight removed or updated at a
+                pixel is larger than this times its current weight, so the
+                cancellation error of the removals and updates stays under about
+                1e-13 times this value, relative to the field. Defaults to 1e3.
+
+        Raises:
+            ValueError: If `dem` does not have the field size.
+        """
+        self.size = (int(size[0]), int(size[1]))
+        self.geotransform = list(geotransform)
+        self.power = power
+        self.smoothing = smoothing
+        self.penalization = penalization
+        self.rebuild_ratio = rebuild_ratio
+
+        if dem is not None:
+            if np.shape(dem) != self.size:
+                raise ValueError("dem must have the same size as the field")
+            dem = np.asarray(dem, dtype=np.float64)
+        self.dem = dem
+
+        self.x_coords = geotransform[0] + np.arange(self.size[1]) * geotransform[1]
+        self.y_coords = geotransform[3] + np.arange(self.size[0]) * geotransform[5]
+
+        self.numerator = np.zeros(self.size)
+        self.denominator = np.zeros(self.size)
+        self.removed_weight = np.zeros(self.size)
+        self.stations = {}
+        # Pixels on top of a station take its value, the first station added
+        # if there are more than one.
+        self.coincident = {}
+
+    def add_stations(self, data: list) -> None:
+        """Add several stations.
+
+        Args:
+            data (list): List of dictionaries with, at least, {'id', 'x', 'y',
+                'value'} keys, and 'altitude' if a DEM is used.
+        """
+        for point in data:
+            self.add_station(
+                point["id"],
+                point["x"],
+                point["y"],
+                point["value"],
+                point.get("altitude"),
+            )
+
+    def add_station(
+        self, station_id, x: float, y: float, value: float, altitude: float = None
+    ) -> None:
+        """Add a station to the field.
+
+        Args:
+            station_id: Station identifier.
+            x (float): Station x coordinate.
+            y (float): Station y coordinate.
+            value (float): Station value.
+            altitude (float, optional): Station altitude, required with a DEM.
+
+        Raises:
+            KeyError: If the station was already added.
+            ValueError: If a DEM is used and `altitude` is None.
+        """
+        if station_id in self.stations:
+            raise KeyError(str(station_id) + " already added.")
+        if self.dem is not None and altitude is None:
+            raise ValueError("altitude must be provided if a DEM is used.")
+
+        self.stations[station_id] = (x, y, altitude, value)
+        weights, coincident = self._station_weights(x, y, altitude)
+
+        self.numerator += value * weights
+        self.denominator += weights
+        for pixel in zip(*np.nonzero(coincident)):
+            self.coincident.setdefault(pixel, []).append(station_id)
+
+    def remove_station(self, station_id) -> None:
+        """Remove a station from the field. Its weights are subtracted from the
+        accumulators, which are recomputed instead if no station is left or if
+        the removed weight of a pixel is over `rebuild_ratio` times its weight.
+
+        Args:
+            station_id: Station identifier.
+
+        Raises:
+            KeyError: If the station is not in the field.
+        """
+        x, y, altitude, value = self.stations.pop(station_id)
+        weights, coincident = self._station_weights(x, y, altitude)
+
+        self.numerator -= value * weights
+        self.denominator -= weights
+        self.removed_weight += weights
+        for pixel in zip(*np.nonzero(coincident)):
+            self.coincident[pixel].remove(station_id)
+            if not self.coincident[pixel]:
+                del self.coincident[pixel]
+
+        if not self.stations or np.any(
+            self.removed_weight > self.rebuild_ratio * self.denominator
+        ):
+            self.rebuild()
+
+    def update_station(self, station_id, value: float) -> None:
+        """Change the value of a station already in the field. Its old value is
+        subtracted from the numerator, so its weights count as removed weight and
+        the accumulators are recomputed as in :meth:`remove_station`.
+
+        Args:
+            station_id: Station identifier.
+            value (float): New station value.
+
+        Raises:
+            KeyError: If the station is not in the field.
+        """
+        x, y, altitude, old_value = self.stations[station_id]
+        weights, _ = self._station_weights(x, y, altitude)
+
+        self.numerator += (value - old_value) * weights
+        self.removed_weight += weights
+        self.stations[station_id] = (x, y, altitude, value)
+
+        if np.any(self.removed_weight > self.rebuild_ratio * self.denominator):
+            self.rebuild()
+
+    def rebuild(self) -> None:
+        """Recompute the accumulators from the current stations. Removing and
+        updating stations subtracts from the accumulators, so after many
+        changes the field can drift slightly from an exact recomputation."""
+        stations = self.stations
+        self.numerator = np.zeros(self.size)
+        self.denominator = np.zeros(self.size)
+        self.removed_weight = np.zeros(self.size)
+        self.stations = {}
+        self.coincident = {}
+        for station_id, (x, y, altitude, value) in stations.items():
+            self.add_station(station_id, x, y, value, altitude)
+
+    @property
+    def field(self) -> np.ndarray:
+        """Interpolated field with the current stations.
+
+        Returns:
+            np.ndarray: The (rows, cols) field. Pixels without any weight are 0.
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            field = np.where(
+                self.denominator != 0.0, self.numerator / self.denominator, 0.0
+            )
+        for pixel, station_ids in self.coincident.items():
+            field[pixel] = self.stations[station_ids[0]][3]
+
+        return field
+
+    def _station_weights(self, x, y, altitude):
+        """Weights of a station for every pixel, with the pixels on top of the
+        station set to 0 and flagged apart."""
+        d_x = self.x_coords - x
+        d_y = self.y_coords - y
+        dist_sq = d_y[:, None] ** 2 + d_x[None, :] ** 2
+
+        if self.dem is None:
+            dist_sq += self.smoothing * self.smoothing
+            coincident = dist_sq < 1e-11
+        else:
+            coincident = np.sqrt(dist_sq) < 1e-11
+            dist_sq += (self.penalization * (self.dem - altitude)) ** 2
+            dist_sq += self.smoothing * self.smoothing
+
+        with np.errstate(divide="ignore"):
+            weights = 1.0 / dist_sq ** (self.power / 2.0)
+        weights[coincident] = 0.0
+
+        return weights, coincident
@@ -4,14 +4,21 @@
 {
     "distutils": {
         "depends": [
-            "/home/ecm/miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/_core/include/numpy/arrayobject.h",
-            "/home/ecm/miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/_core/include/numpy/arrayscalars.h",
-            "/home/ecm/miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/_core/include/numpy/ndarrayobject.h",
-            "/home/ecm/miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/_core/include/numpy/ndarraytypes.h",
-            "/home/ecm/miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/_core/include/numpy/ufuncobject.h"
+            "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/_core/include/numpy/arrayobject.h",
+            "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/_core/include/numpy/arrayscalars.h",
+            "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/_core/include/numpy/ndarrayobject.h",
+            "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/_core/include/numpy/ndarraytypes.h",
+            "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/_core/include/numpy/ufuncobject.h"
+        ],
+        "extra_compile_args": [
+            "-fopenmp",
+            "-fno-math-errno"
+        ],
+        "extra_link_args": [
+            "-fopenmp"
         ],
         "include_dirs": [
-            "/home/ecm/miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/_core/include"
+            "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/_core/include"
         ],
         "name": "pymica.methods.inverse_distance",
         "sources": [
@@ -1269,6 +1276,7 @@ static CYTHON_INLINE float __PYX_NAN() {
 #include "numpy/arrayscalars.h"
 #include "numpy/ufuncobject.h"
 #include <math.h>
+#include <stdlib.h>
 #include <stddef.h>
 #include "pythread.h"
 
@@ -1280,7 +1288,6 @@ static CYTHON_INLINE float __PYX_NAN() {
     #endif
     #endif
     
-#include <stdlib.h>
 #ifdef _OPENMP
 #include <omp.h>
 #endif /* _OPENMP */
@@ -1556,6 +1563,7 @@ static const char *__pyx_f[] = {
   "__init__.cython-30.pxd",
   "contextvars.pxd",
   "array.pxd",
+  "pymica/methods/idw_power.pxd",
   "type.pxd",
   "bool.pxd",
   "complex.pxd",
@@ -1704,7 +1712,7 @@ typedef struct {
 
 /* #### Code section: numeric_typedefs ### */
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":787
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":744
  * # in Cython to enable them only on the right systems.
  * 
  * ctypedef npy_int8       int8_t             # <<<<<<<<<<<<<<
@@ -1713,7 +1721,7 @@ typedef struct {
  */
 typedef npy_int8 __pyx_t_5numpy_int8_t;
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":788
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":745
  * 
  * ctypedef npy_int8       int8_t
  * ctypedef npy_int16      int16_t             # <<<<<<<<<<<<<<
@@ -1722,26 +1730,26 @@ typedef npy_int8 __pyx_t_5numpy_int8_t;
  */
 typedef npy_int16 __pyx_t_5numpy_int16_t;
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":789
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":746
  * ctypedef npy_int8       int8_t
  * ctypedef npy_int16      int16_t
  * ctypedef npy_int32      int32_t             # <<<<<<<<<<<<<<
  * ctypedef npy_int64      int64_t
- * #ctypedef npy_int96      int96_t
+ * 
  */
 typedef npy_int32 __pyx_t_5numpy_int32_t;
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":790
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":747
  * ctypedef npy_int16      int16_t
  * ctypedef npy_int32      int32_t
  * ctypedef npy_int64      int64_t             # <<<<<<<<<<<<<<
- * #ctypedef npy_int96      int96_t
- * #ctypedef npy_int128     int128_t
+ * 
+ * ctypedef npy_uint8      uint8_t
  */
 typedef npy_int64 __pyx_t_5numpy_int64_t;
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":794
- * #ctypedef npy_int128     int128_t
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":749
+ * ctypedef npy_int64      int64_t
  * 
  * ctypedef npy_uint8      uint8_t             # <<<<<<<<<<<<<<
  * ctypedef npy_uint16     uint16_t
@@ -1749,7 +1757,7 @@ typedef npy_int64 __pyx_t_5numpy_int64_t;
  */
 typedef npy_uint8 __pyx_t_5numpy_uint8_t;
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":795
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":750
  * 
  * ctypedef npy_uint8      uint8_t
  * ctypedef npy_uint16     uint16_t             # <<<<<<<<<<<<<<
@@ -1758,26 +1766,26 @@ typedef npy_uint8 __pyx_t_5numpy_uint8_t;
  */
 typedef npy_uint16 __pyx_t_5numpy_uint16_t;
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":796
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":751
  * ctypedef npy_uint8      uint8_t
  * ctypedef npy_uint16     uint16_t
  * ctypedef npy_uint32     uint32_t             # <<<<<<<<<<<<<<
  * ctypedef npy_uint64     uint64_t
- * #ctypedef npy_uint96     uint96_t
+ * 
  */
 typedef npy_uint32 __pyx_t_5numpy_uint32_t;
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":797
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":752
  * ctypedef npy_uint16     uint16_t
  * ctypedef npy_uint32     uint32_t
  * ctypedef npy_uint64     uint64_t             # <<<<<<<<<<<<<<
- * #ctypedef npy_uint96     uint96_t
- * #ctypedef npy_uint128    uint128_t
+ * 
+ * ctypedef npy_float32    float32_t
  */
 typedef npy_uint64 __pyx_t_5numpy_uint64_t;
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":801
- * #ctypedef npy_uint128    uint128_t
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":754
+ * ctypedef npy_uint64     uint64_t
  * 
  * ctypedef npy_float32    float32_t             # <<<<<<<<<<<<<<
  * ctypedef npy_float64    float64_t
@@ -1785,7 +1793,7 @@ typedef npy_uint64 __pyx_t_5numpy_uint64_t;
  */
 typedef npy_float32 __pyx_t_5numpy_float32_t;
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":802
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":755
  * 
  * ctypedef npy_float32    float32_t
  * ctypedef npy_float64    float64_t             # <<<<<<<<<<<<<<
@@ -1794,7 +1802,7 @@ typedef npy_float32 __pyx_t_5numpy_float32_t;
  */
 typedef npy_float64 __pyx_t_5numpy_float64_t;
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":809
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":762
  * ctypedef double complex complex128_t
  * 
  * ctypedef npy_longlong   longlong_t             # <<<<<<<<<<<<<<
@@ -1803,7 +1811,7 @@ typedef npy_float64 __pyx_t_5numpy_float64_t;
  */
 typedef npy_longlong __pyx_t_5numpy_longlong_t;
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":810
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":763
  * 
  * ctypedef npy_longlong   longlong_t
  * ctypedef npy_ulonglong  ulonglong_t             # <<<<<<<<<<<<<<
@@ -1812,7 +1820,7 @@ typedef npy_longlong __pyx_t_5numpy_longlong_t;
  */
 typedef npy_ulonglong __pyx_t_5numpy_ulonglong_t;
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":812
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":765
  * ctypedef npy_ulonglong  ulonglong_t
  * 
  * ctypedef npy_intp       intp_t             # <<<<<<<<<<<<<<
@@ -1821,7 +1829,7 @@ typedef npy_ulonglong __pyx_t_5numpy_ulonglong_t;
  */
 typedef npy_intp __pyx_t_5numpy_intp_t;
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":813
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":766
  * 
  * ctypedef npy_intp       intp_t
  * ctypedef npy_uintp      uintp_t             # <<<<<<<<<<<<<<
@@ -1830,7 +1838,7 @@ typedef npy_intp __pyx_t_5numpy_intp_t;
  */
 typedef npy_uintp __pyx_t_5numpy_uintp_t;
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":815
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":768
  * ctypedef npy_uintp      uintp_t
  * 
  * ctypedef npy_double     float_t             # <<<<<<<<<<<<<<
@@ -1839,7 +1847,7 @@ typedef npy_uintp __pyx_t_5numpy_uintp_t;
  */
 typedef npy_double __pyx_t_5numpy_float_t;
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":816
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":769
  * 
  * ctypedef npy_double     float_t
  * ctypedef npy_double     double_t             # <<<<<<<<<<<<<<
@@ -1848,7 +1856,7 @@ typedef npy_double __pyx_t_5numpy_float_t;
  */
 typedef npy_double __pyx_t_5numpy_double_t;
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":817
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":770
  * ctypedef npy_double     float_t
  * ctypedef npy_double     double_t
  * ctypedef npy_longdouble longdouble_t             # <<<<<<<<<<<<<<
@@ -1857,12 +1865,12 @@ typedef npy_double __pyx_t_5numpy_double_t;
  */
 typedef npy_longdouble __pyx_t_5numpy_longdouble_t;
 
-/* "pymica/methods/inverse_distance.pyx":16
+/* "pymica/methods/inverse_distance.pyx":26
  * 
  * DTYPE = np.float64
  * ctypedef np.float64_t DTYPE_t             # <<<<<<<<<<<<<<
  * 
- * def inverse_distance(data: List[Dict[str, float]],
+ * def inverse_distance(data: Union[List[Dict[str, float]], np.ndarray],
  */
 typedef __pyx_t_5numpy_float64_t __pyx_t_6pymica_7methods_16inverse_distance_DTYPE_t;
 /* #### Code section: complex_type_declarations ### */
@@ -1939,28 +1947,62 @@ struct __pyx_opt_args_7cpython_11contextvars_get_value_no_default {
   int __pyx_n;
   PyObject *default_value;
 };
+struct __pyx_t_6pymica_7methods_9idw_power_IdwPower;
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1113
+/* "pymica/methods/idw_power.pxd":14
  * 
- * # Iterator API added in v1.6
- * ctypedef int (*NpyIter_IterNextFunc)(NpyIter* it) noexcept nogil             # <<<<<<<<<<<<<<
- * ctypedef void (*NpyIter_GetMultiIndexFunc)(NpyIter* it, npy_intp* outcoords) noexcept nogil
  * 
+ * cdef struct IdwPower:             # <<<<<<<<<<<<<<
+ *     double power
+ *     # Whole power of dist_sq, or -1 if the power is not a multiple of 0.5
  */
-typedef int (*__pyx_t_5numpy_NpyIter_IterNextFunc)(NpyIter *);
+struct __pyx_t_6pymica_7methods_9idw_power_IdwPower {
+  double power;
+  int whole;
+  int quarters;
+};
+struct __pyx_t_6pymica_7methods_16inverse_distance_GridIndex;
+struct __pyx_defaults;
+typedef struct __pyx_defaults __pyx_defaults;
+struct __pyx_defaults1;
+typedef struct __pyx_defaults1 __pyx_defaults1;
+
+/* "pymica/methods/inverse_distance.pyx":203
+ * # Both are tabulated for the tile and the station block, leaving two additions
+ * # per pixel and station instead of recomputing the differences.
+ * cdef enum:             # <<<<<<<<<<<<<<
+ *     TILE_ROWS = 32
+ *     TILE_COLS = 32
+ */
+enum  {
+  __pyx_e_6pymica_7methods_16inverse_distance_TILE_ROWS = 32,
+  __pyx_e_6pymica_7methods_16inverse_distance_TILE_COLS = 32,
+  __pyx_e_6pymica_7methods_16inverse_distance_STATION_BLOCK = 0x80
+};
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1114
- * # Iterator API added in v1.6
- * ctypedef int (*NpyIter_IterNextFunc)(NpyIter* it) noexcept nogil
- * ctypedef void (*NpyIter_GetMultiIndexFunc)(NpyIter* it, npy_intp* outcoords) noexcept nogil             # <<<<<<<<<<<<<<
+/* "pymica/methods/inverse_distance.pyx":480
+ * 
  * 
- * cdef extern from "numpy/arrayobject.h":
+ * cdef struct GridIndex:             # <<<<<<<<<<<<<<
+ *     # Stations sorted by bucket, so the stations of a bucket are contiguous.
+ *     const double *xpos
  */
-typedef void (*__pyx_t_5numpy_NpyIter_GetMultiIndexFunc)(NpyIter *, npy_intp *);
-struct __pyx_defaults;
-typedef struct __pyx_defaults __pyx_defaults;
+struct __pyx_t_6pymica_7methods_16inverse_distance_GridIndex {
+  double const *xpos;
+  double const *ypos;
+  double const *values;
+  int const *start;
+  int nx;
+  int ny;
+  double x0;
+  double y0;
+  double cell_size;
+};
 struct __pyx_defaults {
-  PyObject *__pyx_arg_power;
+  double __pyx_arg_nodata;
+};
+struct __pyx_defaults1 {
+  double __pyx_arg_nodata;
 };
 
 /* "View.MemoryView":114
@@ -2673,26 +2715,19 @@ static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name);
 /* HasAttr.proto */
 static CYTHON_INLINE int __Pyx_HasAttr(PyObject *, PyObject *);
 
-/* ListAppend.proto */
-#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
-static CYTHON_INLINE int __Pyx_PyList_Append(PyObject* list, PyObject* x) {
-    PyListObject* L = (PyListObject*) list;
-    Py_ssize_t len = Py_SIZE(list);
-    if (likely(L->allocated > len) & likely(len > (L->allocated >> 1))) {
-        Py_INCREF(x);
-        #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030d0000
-        L->ob_item[len] = x;
-        #else
-        PyList_SET_ITEM(list, len, x);
-        #endif
-        __Pyx_SET_SIZE(list, len + 1);
-        return 0;
-    }
-    return PyList_Append(list, x);
-}
-#else
-#define __Pyx_PyList_Append(L,x) PyList_Append(L,x)
-#endif
+/* ModInt[long].proto */
+static CYTHON_INLINE long __Pyx_mod_long(long, long);
+
+/* WriteUnraisableException.proto */
+static void __Pyx_WriteUnraisable(const char *name, int clineno,
+                                  int lineno, const char *filename,
+                                  int full_traceback, int nogil);
+
+/* IterFinish.proto */
+static CYTHON_INLINE int __Pyx_IterFinish(void);
+
+/* UnpackItemEndCheck.proto */
+static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected);
 
 /* DictGetItem.proto */
 #if PY_MAJOR_VERSION >= 3 && !CYTHON_COMPILING_IN_PYPY
@@ -2705,8 +2740,50 @@ static PyObject *__Pyx_PyDict_GetItem(PyObject *d, PyObject* key);
 #define __Pyx_PyObject_Dict_GetItem(obj, name)  PyObject_GetItem(obj, name)
 #endif
 
-/* ErrOccurredWithGIL.proto */
-static CYTHON_INLINE int __Pyx_ErrOccurredWithGIL(void);
+/* PyObject_Str.proto */
+#define __Pyx_PyObject_Str(obj)\
+    (likely(PyString_CheckExact(obj)) ? __Pyx_NewRef(obj) : PyObject_Str(obj))
+
+/* PyIntCompare.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_NeObjC(PyObject *op1, PyObject *op2, long intval, long inplace);
+
+/* PyIntBinop.proto */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyInt_AddObjC(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check);
+#else
+#define __Pyx_PyInt_AddObjC(op1, op2, intval, inplace, zerodivision_check)\
+    (inplace ? PyNumber_InPlaceAdd(op1, op2) : PyNumber_Add(op1, op2))
+#endif
+
+/* PyIntBinop.proto */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyInt_MultiplyCObj(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check);
+#else
+#define __Pyx_PyInt_MultiplyCObj(op1, op2, intval, inplace, zerodivision_check)\
+    (inplace ? PyNumber_InPlaceMultiply(op1, op2) : PyNumber_Multiply(op1, op2))
+#endif
+
+/* PyIntBinop.proto */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyInt_MultiplyObjC(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check);
+#else
+#define __Pyx_PyInt_MultiplyObjC(op1, op2, intval, inplace, zerodivision_check)\
+    (inplace ? PyNumber_InPlaceMultiply(op1, op2) : PyNumber_Multiply(op1, op2))
+#endif
+
+/* PyIntBinop.proto */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyInt_SubtractObjC(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check);
+#else
+#define __Pyx_PyInt_SubtractObjC(op1, op2, intval, inplace, zerodivision_check)\
+    (inplace ? PyNumber_InPlaceSubtract(op1, op2) : PyNumber_Subtract(op1, op2))
+#endif
+
+/* SliceObject.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetSlice(
+        PyObject* obj, Py_ssize_t cstart, Py_ssize_t cstop,
+        PyObject** py_start, PyObject** py_stop, PyObject** py_slice,
+        int has_cstart, int has_cstop, int wraparound);
 
 /* PyObject_GenericGetAttrNoDict.proto */
 #if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
@@ -3119,12 +3196,26 @@ static int __Pyx_ValidateAndInit_memviewslice(
                 __Pyx_memviewslice *memviewslice,
                 PyObject *original_obj);
 
+/* ObjectToMemviewSlice.proto */
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_double__const__(PyObject *, int writable_flag);
+
 /* ObjectToMemviewSlice.proto */
 static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_ds_double(PyObject *, int writable_flag);
 
+/* ObjectToMemviewSlice.proto */
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_dc_unsigned_char__const__(PyObject *, int writable_flag);
+
+/* ObjectToMemviewSlice.proto */
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_dc_float(PyObject *, int writable_flag);
+
+/* ObjectToMemviewSlice.proto */
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_dc_double(PyObject *, int writable_flag);
+
 /* MemviewDtypeToObject.proto */
-static CYTHON_INLINE PyObject *__pyx_memview_get_double(const char *itemp);
-static CYTHON_INLINE int __pyx_memview_set_double(const char *itemp, PyObject *obj);
+static CYTHON_INLINE PyObject *__pyx_memview_get_double__const__(const char *itemp);
+
+/* ObjectToMemviewSlice.proto */
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_int__const__(PyObject *, int writable_flag);
 
 /* RealImag.proto */
 #if CYTHON_CCOMPLEX
@@ -3294,15 +3385,15 @@ static CYTHON_INLINE int __pyx_sub_acquisition_count_locked(
 static CYTHON_INLINE void __Pyx_INC_MEMVIEW(__Pyx_memviewslice *, int, int);
 static CYTHON_INLINE void __Pyx_XCLEAR_MEMVIEW(__Pyx_memviewslice *, int, int);
 
-/* CIntToPy.proto */
-static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
-
 /* CIntFromPy.proto */
 static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
 
 /* CIntToPy.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
 
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
+
 /* CIntFromPy.proto */
 static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
 
@@ -3456,11 +3547,25 @@ static CYTHON_INLINE double __pyx_f_7cpython_7complex_7complex_4imag_imag(PyComp
 
 /* Module declarations from "libc.math" */
 
+/* Module declarations from "libc.stdlib" */
+
 /* Module declarations from "array" */
 
 /* Module declarations from "cpython.array" */
 static CYTHON_INLINE int __pyx_f_7cpython_5array_extend_buffer(arrayobject *, char *, Py_ssize_t); /*proto*/
 
+/* Module declarations from "cython.view" */
+
+/* Module declarations from "cython.dataclasses" */
+
+/* Module declarations from "cython" */
+
+/* Module declarations from "pymica.methods.idw_power" */
+static CYTHON_INLINE struct __pyx_t_6pymica_7methods_9idw_power_IdwPower __pyx_f_6pymica_7methods_9idw_power_make_power(double); /*proto*/
+static CYTHON_INLINE double __pyx_f_6pymica_7methods_9idw_power_station_weight(double, struct __pyx_t_6pymica_7methods_9idw_power_IdwPower); /*proto*/
+static CYTHON_INLINE float __pyx_f_6pymica_7methods_9idw_power_station_weight32(float, struct __pyx_t_6pymica_7methods_9idw_power_IdwPower); /*proto*/
+static CYTHON_INLINE double __pyx_f_6pymica_7methods_9idw_power_fast_pow(double, int); /*proto*/
+
 /* Module declarations from "pymica.methods.inverse_distance" */
 static PyObject *__pyx_collections_abc_Sequence = 0;
 static PyObject *generic = 0;
@@ -3470,8 +3575,21 @@ static PyObject *contiguous = 0;
 static PyObject *indirect_contiguous = 0;
 static int __pyx_memoryview_thread_locks_used;
 static PyThread_type_lock __pyx_memoryview_thread_locks[8];
-static CYTHON_INLINE float __pyx_f_6pymica_7methods_16inverse_distance_point_residue(double, double, __Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, int, int, float); /*proto*/
-static CYTHON_INLINE double __pyx_f_6pymica_7methods_16inverse_distance_fast_pow(double, int); /*proto*/
+static double __pyx_f_6pymica_7methods_16inverse_distance_nearest_residue(double, double, struct __pyx_t_6pymica_7methods_16inverse_distance_GridIndex const *, int, double, int *, double *, struct __pyx_t_6pymica_7methods_9idw_power_IdwPower, float); /*proto*/
+static CYTHON_INLINE int __pyx_f_6pymica_7methods_16inverse_distance_scan_bucket(double, double, struct __pyx_t_6pymica_7methods_16inverse_distance_GridIndex const *, long, long, int, double, int *, double *, int); /*proto*/
+static double __pyx_f_6pymica_7methods_16inverse_distance_radius_residue(double, double, struct __pyx_t_6pymica_7methods_16inverse_distance_GridIndex const *, double, struct __pyx_t_6pymica_7methods_9idw_power_IdwPower, float); /*proto*/
+static void __pyx_fuse_0__pyx_f_6pymica_7methods_16inverse_distance_fill_field(__Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, struct __pyx_t_6pymica_7methods_9idw_power_IdwPower, float, int, int, double, unsigned char const *, double, int); /*proto*/
+static void __pyx_fuse_1__pyx_f_6pymica_7methods_16inverse_distance_fill_field(__Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, struct __pyx_t_6pymica_7methods_9idw_power_IdwPower, float, int, int, double, unsigned char const *, double, int); /*proto*/
+static void __pyx_fuse_0__pyx_f_6pymica_7methods_16inverse_distance_tiled_field(__Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, struct __pyx_t_6pymica_7methods_9idw_power_IdwPower, float, int, unsigned char const *, double); /*proto*/
+static void __pyx_fuse_1__pyx_f_6pymica_7methods_16inverse_distance_tiled_field(__Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, struct __pyx_t_6pymica_7methods_9idw_power_IdwPower, float, int, unsigned char const *, double); /*proto*/
+static void __pyx_fuse_0__pyx_f_6pymica_7methods_16inverse_distance_fill_tile(__Pyx_memviewslice, int, int, __Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, struct __pyx_t_6pymica_7methods_9idw_power_IdwPower, float, unsigned char const *, double, double *, double *, char *, double *, double *); /*proto*/
+static void __pyx_fuse_1__pyx_f_6pymica_7methods_16inverse_distance_fill_tile(__Pyx_memviewslice, int, int, __Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, struct __pyx_t_6pymica_7methods_9idw_power_IdwPower, float, unsigned char const *, double, double *, double *, char *, double *, double *); /*proto*/
+static void __pyx_fuse_0__pyx_f_6pymica_7methods_16inverse_distance_tiled_field32(__Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, struct __pyx_t_6pymica_7methods_9idw_power_IdwPower, float, int, unsigned char const *, double); /*proto*/
+static void __pyx_fuse_1__pyx_f_6pymica_7methods_16inverse_distance_tiled_field32(__Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, struct __pyx_t_6pymica_7methods_9idw_power_IdwPower, float, int, unsigned char const *, double); /*proto*/
+static void __pyx_fuse_0__pyx_f_6pymica_7methods_16inverse_distance_fill_tile32(__Pyx_memviewslice, int, int, __Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, struct __pyx_t_6pymica_7methods_9idw_power_IdwPower, float, unsigned char const *, double, double *, double *, char *, float *, float *); /*proto*/
+static void __pyx_fuse_1__pyx_f_6pymica_7methods_16inverse_distance_fill_tile32(__Pyx_memviewslice, int, int, __Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, struct __pyx_t_6pymica_7methods_9idw_power_IdwPower, float, unsigned char const *, double, double *, double *, char *, float *, float *); /*proto*/
+static void __pyx_fuse_0__pyx_f_6pymica_7methods_16inverse_distance_neighbour_field(__Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, struct __pyx_t_6pymica_7methods_9idw_power_IdwPower, float, int, int, double, unsigned char const *, double); /*proto*/
+static void __pyx_fuse_1__pyx_f_6pymica_7methods_16inverse_distance_neighbour_field(__Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, struct __pyx_t_6pymica_7methods_9idw_power_IdwPower, float, int, int, double, unsigned char const *, double); /*proto*/
 static int __pyx_array_allocate_buffer(struct __pyx_array_obj *); /*proto*/
 static struct __pyx_array_obj *__pyx_array_new(PyObject *, Py_ssize_t, char *, char *, char *); /*proto*/
 static PyObject *__pyx_memoryview_new(PyObject *, int, int, __Pyx_TypeInfo *); /*proto*/
@@ -3507,7 +3625,11 @@ static void __pyx_memoryview_slice_assign_scalar(__Pyx_memviewslice *, int, size
 static void __pyx_memoryview__slice_assign_scalar(char *, Py_ssize_t *, Py_ssize_t *, int, size_t, void *); /*proto*/
 static PyObject *__pyx_unpickle_Enum__set_state(struct __pyx_MemviewEnum_obj *, PyObject *); /*proto*/
 /* #### Code section: typeinfo ### */
+static __Pyx_TypeInfo __Pyx_TypeInfo_double__const__ = { "const double", NULL, sizeof(double const ), { 0 }, 0, 'R', 0, 0 };
 static __Pyx_TypeInfo __Pyx_TypeInfo_double = { "double", NULL, sizeof(double), { 0 }, 0, 'R', 0, 0 };
+static __Pyx_TypeInfo __Pyx_TypeInfo_unsigned_char__const__ = { "const unsigned char", NULL, sizeof(unsigned char const ), { 0 }, 0, __PYX_IS_UNSIGNED(unsigned char const ) ? 'U' : 'I', __PYX_IS_UNSIGNED(unsigned char const ), 0 };
+static __Pyx_TypeInfo __Pyx_TypeInfo_float = { "float", NULL, sizeof(float), { 0 }, 0, 'R', 0, 0 };
+static __Pyx_TypeInfo __Pyx_TypeInfo_int__const__ = { "const int", NULL, sizeof(int const ), { 0 }, 0, __PYX_IS_UNSIGNED(int const ) ? 'U' : 'I', __PYX_IS_UNSIGNED(int const ), 0 };
 /* #### Code section: before_global_var ### */
 #define __Pyx_MODULE_NAME "pymica.methods.inverse_distance"
 extern int __pyx_module_is_main_pymica__methods__inverse_distance;
@@ -3515,9 +3637,9 @@ int __pyx_module_is_main_pymica__methods__inverse_distance = 0;
 
 /* Implementation of "pymica.methods.inverse_distance" */
 /* #### Code section: global_var ### */
+static PyObject *__pyx_builtin_ValueError;
 static PyObject *__pyx_builtin_range;
 static PyObject *__pyx_builtin___import__;
-static PyObject *__pyx_builtin_ValueError;
 static PyObject *__pyx_builtin_MemoryError;
 static PyObject *__pyx_builtin_enumerate;
 static PyObject *__pyx_builtin_TypeError;
@@ -3532,107 +3654,148 @@ static const char __pyx_k_N[] = "N";
 static const char __pyx_k_O[] = "O";
 static const char __pyx_k_c[] = "c";
 static const char __pyx_k_d[] = "d";
-static const char __pyx_k_i[] = "i";
-static const char __pyx_k_j[] = "j";
 static const char __pyx_k_x[] = "x";
 static const char __pyx_k_y[] = "y";
 static const char __pyx_k__2[] = ".";
 static const char __pyx_k__3[] = "*";
 static const char __pyx_k__6[] = "'";
 static const char __pyx_k__7[] = ")";
-static const char __pyx_k_da[] = "da";
 static const char __pyx_k_gc[] = "gc";
 static const char __pyx_k_id[] = "id";
 static const char __pyx_k_np[] = "np";
-static const char __pyx_k__24[] = "?";
+static const char __pyx_k_nx[] = "nx";
+static const char __pyx_k_ny[] = "ny";
+static const char __pyx_k_os[] = "os";
+static const char __pyx_k_x0[] = "x0";
+static const char __pyx_k_y0[] = "y0";
+static const char __pyx_k__34[] = "?";
 static const char __pyx_k_abc[] = "abc";
 static const char __pyx_k_and[] = " and ";
-static const char __pyx_k_cda[] = "cda";
 static const char __pyx_k_got[] = " (got ";
-static const char __pyx_k_int[] = "int";
+static const char __pyx_k_max[] = "max";
+static const char __pyx_k_min[] = "min";
+static const char __pyx_k_nan[] = "nan";
 static const char __pyx_k_new[] = "__new__";
 static const char __pyx_k_obj[] = "obj";
+static const char __pyx_k_out[] = "out";
 static const char __pyx_k_sys[] = "sys";
 static const char __pyx_k_Dict[] = "Dict";
 static const char __pyx_k_List[] = "List";
 static const char __pyx_k_base[] = "base";
 static const char __pyx_k_data[] = "data";
 static const char __pyx_k_dict[] = "__dict__";
+static const char __pyx_k_intc[] = "intc";
+static const char __pyx_k_kind[] = "kind";
 static const char __pyx_k_main[] = "__main__";
+static const char __pyx_k_mask[] = "mask";
 static const char __pyx_k_mode[] = "mode";
 static const char __pyx_k_name[] = "name";
 static const char __pyx_k_ndim[] = "ndim";
 static const char __pyx_k_pack[] = "pack";
 static const char __pyx_k_size[] = "size";
 static const char __pyx_k_spec[] = "__spec__";
+static const char __pyx_k_sqrt[] = "sqrt";
 static const char __pyx_k_step[] = "step";
 static const char __pyx_k_stop[] = "stop";
 static const char __pyx_k_test[] = "__test__";
+static const char __pyx_k_view[] = "view";
 static const char __pyx_k_xpos[] = "xpos";
 static const char __pyx_k_ypos[] = "ypos";
 static const char __pyx_k_ASCII[] = "ASCII";
 static const char __pyx_k_DTYPE[] = "DTYPE";
+static const char __pyx_k_Union[] = "Union";
 static const char __pyx_k_array[] = "array";
 static const char __pyx_k_class[] = "__class__";
+static const char __pyx_k_cmask[] = "cmask";
 static const char __pyx_k_count[] = "count";
 static const char __pyx_k_cxpos[] = "cxpos";
 static const char __pyx_k_cypos[] = "cypos";
+static const char __pyx_k_dtype[] = "dtype";
+static const char __pyx_k_empty[] = "empty";
 static const char __pyx_k_error[] = "error";
 static const char __pyx_k_flags[] = "flags";
 static const char __pyx_k_float[] = "float";
 static const char __pyx_k_index[] = "index";
 static const char __pyx_k_numpy[] = "numpy";
+static const char __pyx_k_order[] = "order";
+static const char __pyx_k_out32[] = "out32";
+static const char __pyx_k_out64[] = "out64";
 static const char __pyx_k_power[] = "power";
 static const char __pyx_k_range[] = "range";
 static const char __pyx_k_shape[] = "shape";
 static const char __pyx_k_start[] = "start";
+static const char __pyx_k_uint8[] = "uint8";
 static const char __pyx_k_value[] = "value";
-static const char __pyx_k_xpos0[] = "xpos0";
+static const char __pyx_k_width[] = "width";
 static const char __pyx_k_xsize[] = "xsize";
-static const char __pyx_k_ypos0[] = "ypos0";
 static const char __pyx_k_ysize[] = "ysize";
+static const char __pyx_k_zeros[] = "zeros";
+static const char __pyx_k_astype[] = "astype";
+static const char __pyx_k_bucket[] = "bucket";
+static const char __pyx_k_cpower[] = "cpower";
+static const char __pyx_k_cumsum[] = "cumsum";
 static const char __pyx_k_enable[] = "enable";
 static const char __pyx_k_encode[] = "encode";
 static const char __pyx_k_format[] = "format";
+static const char __pyx_k_height[] = "height";
 static const char __pyx_k_import[] = "__import__";
 static const char __pyx_k_name_2[] = "__name__";
+static const char __pyx_k_nodata[] = "nodata";
 static const char __pyx_k_pickle[] = "pickle";
 static const char __pyx_k_reduce[] = "__reduce__";
+static const char __pyx_k_single[] = "single";
+static const char __pyx_k_stable[] = "stable";
 static const char __pyx_k_struct[] = "struct";
 static const char __pyx_k_typing[] = "typing";
 static const char __pyx_k_unpack[] = "unpack";
 static const char __pyx_k_update[] = "update";
 static const char __pyx_k_values[] = "values";
+static const char __pyx_k_argsort[] = "argsort";
+static const char __pyx_k_asarray[] = "asarray";
 static const char __pyx_k_cvalues[] = "cvalues";
 static const char __pyx_k_disable[] = "disable";
+static const char __pyx_k_float32[] = "float32";
 static const char __pyx_k_float64[] = "float64";
 static const char __pyx_k_fortran[] = "fortran";
 static const char __pyx_k_memview[] = "memview";
-static const char __pyx_k_reshape[] = "reshape";
-static const char __pyx_k_values0[] = "values0";
+static const char __pyx_k_minimum[] = "minimum";
 static const char __pyx_k_Ellipsis[] = "Ellipsis";
 static const char __pyx_k_List_int[] = "List[int]";
 static const char __pyx_k_Sequence[] = "Sequence";
+static const char __pyx_k_bincount[] = "bincount";
+static const char __pyx_k_bucket_x[] = "bucket_x";
+static const char __pyx_k_bucket_y[] = "bucket_y";
 static const char __pyx_k_getstate[] = "__getstate__";
 static const char __pyx_k_itemsize[] = "itemsize";
+static const char __pyx_k_mask_ptr[] = "mask_ptr";
 static const char __pyx_k_pyx_type[] = "__pyx_type";
 static const char __pyx_k_register[] = "register";
 static const char __pyx_k_setstate[] = "__setstate__";
 static const char __pyx_k_TypeError[] = "TypeError";
+static const char __pyx_k_cell_size[] = "cell_size";
+static const char __pyx_k_cpu_count[] = "cpu_count";
 static const char __pyx_k_enumerate[] = "enumerate";
 static const char __pyx_k_isenabled[] = "isenabled";
+static const char __pyx_k_k_nearest[] = "k_nearest";
+static const char __pyx_k_minlength[] = "minlength";
+static const char __pyx_k_precision[] = "precision";
 static const char __pyx_k_pyx_state[] = "__pyx_state";
 static const char __pyx_k_reduce_ex[] = "__reduce_ex__";
 static const char __pyx_k_smoothing[] = "smoothing";
 static const char __pyx_k_IndexError[] = "IndexError";
 static const char __pyx_k_ValueError[] = "ValueError";
-static const char __pyx_k_data_array[] = "data_array";
+static const char __pyx_k_csmoothing[] = "csmoothing";
+static const char __pyx_k_max_radius[] = "max_radius";
+static const char __pyx_k_n_stations[] = "n_stations";
+static const char __pyx_k_per_bucket[] = "per_bucket";
 static const char __pyx_k_pyx_result[] = "__pyx_result";
 static const char __pyx_k_pyx_vtable[] = "__pyx_vtable__";
 static const char __pyx_k_ImportError[] = "ImportError";
 static const char __pyx_k_MemoryError[] = "MemoryError";
 static const char __pyx_k_PickleError[] = "PickleError";
 static const char __pyx_k_collections[] = "collections";
+static const char __pyx_k_num_threads[] = "num_threads";
+static const char __pyx_k_C_CONTIGUOUS[] = "C_CONTIGUOUS";
 static const char __pyx_k_geotransform[] = "geotransform";
 static const char __pyx_k_initializing[] = "_initializing";
 static const char __pyx_k_is_coroutine[] = "_is_coroutine";
@@ -3644,18 +3807,21 @@ static const char __pyx_k_class_getitem[] = "__class_getitem__";
 static const char __pyx_k_geotransform0[] = "geotransform0";
 static const char __pyx_k_reduce_cython[] = "__reduce_cython__";
 static const char __pyx_k_AssertionError[] = "AssertionError";
+static const char __pyx_k_station_arrays[] = "station_arrays";
 static const char __pyx_k_View_MemoryView[] = "View.MemoryView";
 static const char __pyx_k_allocate_buffer[] = "allocate_buffer";
 static const char __pyx_k_collections_abc[] = "collections.abc";
 static const char __pyx_k_dtype_is_object[] = "dtype_is_object";
 static const char __pyx_k_pyx_PickleError[] = "__pyx_PickleError";
 static const char __pyx_k_setstate_cython[] = "__setstate_cython__";
+static const char __pyx_k_build_grid_index[] = "build_grid_index";
 static const char __pyx_k_inverse_distance[] = "inverse_distance";
+static const char __pyx_k_ascontiguousarray[] = "ascontiguousarray";
 static const char __pyx_k_pyx_unpickle_Enum[] = "__pyx_unpickle_Enum";
 static const char __pyx_k_asyncio_coroutines[] = "asyncio.coroutines";
 static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
 static const char __pyx_k_strided_and_direct[] = "<strided and direct>";
-static const char __pyx_k_List_Dict_str_float[] = "List[Dict[str, float]]";
+static const char __pyx_k_mask_must_have_shape[] = "mask must have shape ";
 static const char __pyx_k_strided_and_indirect[] = "<strided and indirect>";
 static const char __pyx_k_Invalid_shape_in_axis[] = "Invalid shape in axis ";
 static const char __pyx_k_contiguous_and_direct[] = "<contiguous and direct>";
@@ -3663,10 +3829,12 @@ static const char __pyx_k_Cannot_index_with_type[] = "Cannot index with type '";
 static const char __pyx_k_MemoryView_of_r_object[] = "<MemoryView of %r object>";
 static const char __pyx_k_MemoryView_of_r_at_0x_x[] = "<MemoryView of %r at 0x%x>";
 static const char __pyx_k_contiguous_and_indirect[] = "<contiguous and indirect>";
+static const char __pyx_k_inverse_distance_arrays[] = "inverse_distance_arrays";
 static const char __pyx_k_Dimension_d_is_not_direct[] = "Dimension %d is not direct";
 static const char __pyx_k_Index_out_of_bounds_axis_d[] = "Index out of bounds (axis %d)";
 static const char __pyx_k_Step_may_not_be_zero_axis_d[] = "Step may not be zero (axis %d)";
 static const char __pyx_k_itemsize_0_for_cython_array[] = "itemsize <= 0 for cython.array";
+static const char __pyx_k_pymica_methods_station_arrays[] = "pymica.methods.station_arrays";
 static const char __pyx_k_unable_to_allocate_array_data[] = "unable to allocate array data.";
 static const char __pyx_k_strided_and_direct_or_indirect[] = "<strided and direct or indirect>";
 static const char __pyx_k_A_residue_value_is_calculated_f[] = "\nA residue value is calculated for a point considering the quadratic inverse\nof the distance between the point and all the stations.\n";
@@ -3683,11 +3851,17 @@ static const char __pyx_k_Indirect_dimensions_not_supporte[] = "Indirect dimensi
 static const char __pyx_k_Invalid_mode_expected_c_or_fortr[] = "Invalid mode, expected 'c' or 'fortran', got ";
 static const char __pyx_k_Out_of_bounds_on_buffer_access_a[] = "Out of bounds on buffer access (axis ";
 static const char __pyx_k_Unable_to_convert_item_to_object[] = "Unable to convert item to object";
+static const char __pyx_k_Union_List_Dict_str_float_np_nda[] = "Union[List[Dict[str, float]], np.ndarray]";
 static const char __pyx_k_got_differing_extents_in_dimensi[] = "got differing extents in dimension ";
+static const char __pyx_k_k_nearest_must_be_0_or_a_positiv[] = "k_nearest must be 0 or a positive number of stations";
+static const char __pyx_k_max_radius_must_be_0_or_a_positi[] = "max_radius must be 0 or a positive distance";
 static const char __pyx_k_no_default___reduce___due_to_non[] = "no default __reduce__ due to non-trivial __cinit__";
 static const char __pyx_k_numpy__core_multiarray_failed_to[] = "numpy._core.multiarray failed to import";
 static const char __pyx_k_numpy__core_umath_failed_to_impo[] = "numpy._core.umath failed to import";
+static const char __pyx_k_out_must_be_a_C_contiguous_float[] = "out must be a C-contiguous float32 or float64 array with shape ";
+static const char __pyx_k_precision_must_be_float32_or_flo[] = "precision must be 'float32' or 'float64'";
 static const char __pyx_k_unable_to_allocate_shape_and_str[] = "unable to allocate shape and strides.";
+static const char __pyx_k_xpos_ypos_and_values_must_have_t[] = "xpos, ypos and values must have the same length";
 static const char __pyx_k_pymica_methods_inverse_distance_2[] = "pymica.methods.inverse_distance";
 /* #### Code section: decls ### */
 static int __pyx_array___pyx_pf_15View_dot_MemoryView_5array___cinit__(struct __pyx_array_obj *__pyx_v_self, PyObject *__pyx_v_shape, Py_ssize_t __pyx_v_itemsize, PyObject *__pyx_v_format, PyObject *__pyx_v_mode, int __pyx_v_allocate_buffer); /* proto */
@@ -3733,8 +3907,11 @@ static PyObject *__pyx_pf___pyx_memoryviewslice_2__setstate_cython__(CYTHON_UNUS
 static PyObject *__pyx_pf_15View_dot_MemoryView___pyx_unpickle_Enum(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state); /* proto */
 static int __pyx_pf_7cpython_5array_5array___getbuffer__(arrayobject *__pyx_v_self, Py_buffer *__pyx_v_info, CYTHON_UNUSED int __pyx_v_flags); /* proto */
 static void __pyx_pf_7cpython_5array_5array_2__releasebuffer__(CYTHON_UNUSED arrayobject *__pyx_v_self, Py_buffer *__pyx_v_info); /* proto */
-static PyObject *__pyx_pf_6pymica_7methods_16inverse_distance_2__defaults__(CYTHON_UNUSED PyObject *__pyx_self); /* proto */
-static PyObject *__pyx_pf_6pymica_7methods_16inverse_distance_inverse_distance(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_data, PyObject *__pyx_v_size, PyObject *__pyx_v_geotransform, PyObject *__pyx_v_power, double __pyx_v_smoothing); /* proto */
+static PyObject *__pyx_pf_6pymica_7methods_16inverse_distance_6__defaults__(CYTHON_UNUSED PyObject *__pyx_self); /* proto */
+static PyObject *__pyx_pf_6pymica_7methods_16inverse_distance_inverse_distance(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_data, PyObject *__pyx_v_size, PyObject *__pyx_v_geotransform, double __pyx_v_power, double __pyx_v_smoothing, int __pyx_v_num_threads, int __pyx_v_k_nearest, double __pyx_v_max_radius, PyObject *__pyx_v_out, PyObject *__pyx_v_mask, double __pyx_v_nodata, PyObject *__pyx_v_precision); /* proto */
+static PyObject *__pyx_pf_6pymica_7methods_16inverse_distance_8__defaults__(CYTHON_UNUSED PyObject *__pyx_self); /* proto */
+static PyObject *__pyx_pf_6pymica_7methods_16inverse_distance_2inverse_distance_arrays(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_xpos, PyObject *__pyx_v_ypos, PyObject *__pyx_v_values, PyObject *__pyx_v_size, PyObject *__pyx_v_geotransform, double __pyx_v_power, double __pyx_v_smoothing, int __pyx_v_num_threads, int __pyx_v_k_nearest, double __pyx_v_max_radius, PyObject *__pyx_v_out, PyObject *__pyx_v_mask, double __pyx_v_nodata, PyObject *__pyx_v_precision); /* proto */
+static PyObject *__pyx_pf_6pymica_7methods_16inverse_distance_4build_grid_index(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_xpos, PyObject *__pyx_v_ypos, PyObject *__pyx_v_values, int __pyx_v_k_nearest); /* proto */
 static PyObject *__pyx_tp_new_array(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_tp_new_Enum(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_tp_new_memoryview(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
@@ -3880,8 +4057,18 @@ typedef struct {
   #endif
   #if CYTHON_USE_MODULE_STATE
   #endif
+  #if CYTHON_USE_MODULE_STATE
+  #endif
   PyTypeObject *__pyx_ptype_7cpython_5array_array;
   #if CYTHON_USE_MODULE_STATE
+  #endif
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  #if CYTHON_USE_MODULE_STATE
+  #endif
+  #if CYTHON_USE_MODULE_STATE
   PyObject *__pyx_type___pyx_array;
   PyObject *__pyx_type___pyx_MemviewEnum;
   PyObject *__pyx_type___pyx_memoryview;
@@ -3896,6 +4083,7 @@ typedef struct {
   PyObject *__pyx_kp_s_All_dimensions_preceding_dimensi;
   PyObject *__pyx_n_s_AssertionError;
   PyObject *__pyx_kp_s_Buffer_view_does_not_expose_stri;
+  PyObject *__pyx_n_s_C_CONTIGUOUS;
   PyObject *__pyx_kp_s_Can_only_create_a_buffer_that_is;
   PyObject *__pyx_kp_s_Cannot_assign_to_read_only_memor;
   PyObject *__pyx_kp_s_Cannot_create_writable_memory_vi;
@@ -3914,7 +4102,6 @@ typedef struct {
   PyObject *__pyx_kp_u_Invalid_mode_expected_c_or_fortr;
   PyObject *__pyx_kp_u_Invalid_shape_in_axis;
   PyObject *__pyx_n_s_List;
-  PyObject *__pyx_kp_s_List_Dict_str_float;
   PyObject *__pyx_kp_s_List_int;
   PyObject *__pyx_n_s_MemoryError;
   PyObject *__pyx_kp_s_MemoryView_of_r_at_0x_x;
@@ -3927,47 +4114,64 @@ typedef struct {
   PyObject *__pyx_kp_s_Step_may_not_be_zero_axis_d;
   PyObject *__pyx_n_s_TypeError;
   PyObject *__pyx_kp_s_Unable_to_convert_item_to_object;
+  PyObject *__pyx_n_s_Union;
+  PyObject *__pyx_kp_s_Union_List_Dict_str_float_np_nda;
   PyObject *__pyx_n_s_ValueError;
   PyObject *__pyx_n_s_View_MemoryView;
   PyObject *__pyx_kp_u__2;
-  PyObject *__pyx_n_s__24;
   PyObject *__pyx_n_s__3;
+  PyObject *__pyx_n_s__34;
   PyObject *__pyx_kp_u__6;
   PyObject *__pyx_kp_u__7;
   PyObject *__pyx_n_s_abc;
   PyObject *__pyx_n_s_allocate_buffer;
   PyObject *__pyx_kp_u_and;
+  PyObject *__pyx_n_s_argsort;
   PyObject *__pyx_n_s_array;
+  PyObject *__pyx_n_s_asarray;
+  PyObject *__pyx_n_s_ascontiguousarray;
+  PyObject *__pyx_n_s_astype;
   PyObject *__pyx_n_s_asyncio_coroutines;
   PyObject *__pyx_n_s_base;
+  PyObject *__pyx_n_s_bincount;
+  PyObject *__pyx_n_s_bucket;
+  PyObject *__pyx_n_s_bucket_x;
+  PyObject *__pyx_n_s_bucket_y;
+  PyObject *__pyx_n_s_build_grid_index;
   PyObject *__pyx_n_s_c;
   PyObject *__pyx_n_u_c;
-  PyObject *__pyx_n_s_cda;
+  PyObject *__pyx_n_s_cell_size;
   PyObject *__pyx_n_s_cgeotransform;
   PyObject *__pyx_n_s_class;
   PyObject *__pyx_n_s_class_getitem;
   PyObject *__pyx_n_s_cline_in_traceback;
+  PyObject *__pyx_n_s_cmask;
   PyObject *__pyx_n_s_collections;
   PyObject *__pyx_kp_s_collections_abc;
   PyObject *__pyx_kp_s_contiguous_and_direct;
   PyObject *__pyx_kp_s_contiguous_and_indirect;
   PyObject *__pyx_n_s_count;
+  PyObject *__pyx_n_s_cpower;
+  PyObject *__pyx_n_s_cpu_count;
+  PyObject *__pyx_n_s_csmoothing;
+  PyObject *__pyx_n_s_cumsum;
   PyObject *__pyx_n_s_cvalues;
   PyObject *__pyx_n_s_cxpos;
   PyObject *__pyx_n_s_cypos;
   PyObject *__pyx_n_s_d;
-  PyObject *__pyx_n_s_da;
   PyObject *__pyx_n_s_data;
-  PyObject *__pyx_n_s_data_array;
   PyObject *__pyx_n_s_dict;
   PyObject *__pyx_kp_u_disable;
+  PyObject *__pyx_n_s_dtype;
   PyObject *__pyx_n_s_dtype_is_object;
+  PyObject *__pyx_n_s_empty;
   PyObject *__pyx_kp_u_enable;
   PyObject *__pyx_n_s_encode;
   PyObject *__pyx_n_s_enumerate;
   PyObject *__pyx_n_s_error;
   PyObject *__pyx_n_s_flags;
   PyObject *__pyx_n_s_float;
+  PyObject *__pyx_n_s_float32;
   PyObject *__pyx_n_s_float64;
   PyObject *__pyx_n_s_format;
   PyObject *__pyx_n_s_fortran;
@@ -3978,36 +4182,64 @@ typedef struct {
   PyObject *__pyx_n_s_getstate;
   PyObject *__pyx_kp_u_got;
   PyObject *__pyx_kp_u_got_differing_extents_in_dimensi;
-  PyObject *__pyx_n_s_i;
+  PyObject *__pyx_n_s_height;
   PyObject *__pyx_n_s_id;
   PyObject *__pyx_n_s_import;
   PyObject *__pyx_n_s_index;
   PyObject *__pyx_n_s_initializing;
-  PyObject *__pyx_n_s_int;
+  PyObject *__pyx_n_s_intc;
   PyObject *__pyx_n_s_inverse_distance;
+  PyObject *__pyx_n_s_inverse_distance_arrays;
   PyObject *__pyx_n_s_is_coroutine;
   PyObject *__pyx_kp_u_isenabled;
   PyObject *__pyx_n_s_itemsize;
   PyObject *__pyx_kp_s_itemsize_0_for_cython_array;
-  PyObject *__pyx_n_s_j;
+  PyObject *__pyx_n_s_k_nearest;
+  PyObject *__pyx_kp_s_k_nearest_must_be_0_or_a_positiv;
+  PyObject *__pyx_n_s_kind;
   PyObject *__pyx_n_s_main;
+  PyObject *__pyx_n_s_mask;
+  PyObject *__pyx_kp_s_mask_must_have_shape;
+  PyObject *__pyx_n_s_mask_ptr;
+  PyObject *__pyx_n_s_max;
+  PyObject *__pyx_n_s_max_radius;
+  PyObject *__pyx_kp_s_max_radius_must_be_0_or_a_positi;
   PyObject *__pyx_n_s_memview;
+  PyObject *__pyx_n_s_min;
+  PyObject *__pyx_n_s_minimum;
+  PyObject *__pyx_n_s_minlength;
   PyObject *__pyx_n_s_mode;
+  PyObject *__pyx_n_s_n_stations;
   PyObject *__pyx_n_s_name;
   PyObject *__pyx_n_s_name_2;
+  PyObject *__pyx_n_s_nan;
   PyObject *__pyx_n_s_ndim;
   PyObject *__pyx_n_s_new;
   PyObject *__pyx_kp_s_no_default___reduce___due_to_non;
+  PyObject *__pyx_n_s_nodata;
   PyObject *__pyx_n_s_np;
+  PyObject *__pyx_n_s_num_threads;
   PyObject *__pyx_n_s_numpy;
   PyObject *__pyx_kp_s_numpy__core_multiarray_failed_to;
   PyObject *__pyx_kp_s_numpy__core_umath_failed_to_impo;
+  PyObject *__pyx_n_s_nx;
+  PyObject *__pyx_n_s_ny;
   PyObject *__pyx_n_s_obj;
+  PyObject *__pyx_n_s_order;
+  PyObject *__pyx_n_s_os;
+  PyObject *__pyx_n_s_out;
+  PyObject *__pyx_n_s_out32;
+  PyObject *__pyx_n_s_out64;
+  PyObject *__pyx_kp_s_out_must_be_a_C_contiguous_float;
   PyObject *__pyx_n_s_pack;
+  PyObject *__pyx_n_s_per_bucket;
   PyObject *__pyx_n_s_pickle;
   PyObject *__pyx_n_s_power;
+  PyObject *__pyx_n_s_precision;
+  PyObject *__pyx_kp_s_precision_must_be_float32_or_flo;
   PyObject *__pyx_kp_s_pymica_methods_inverse_distance;
   PyObject *__pyx_n_s_pymica_methods_inverse_distance_2;
+  PyObject *__pyx_n_s_pymica_methods_station_arrays;
   PyObject *__pyx_n_s_pyx_PickleError;
   PyObject *__pyx_n_s_pyx_checksum;
   PyObject *__pyx_n_s_pyx_result;
@@ -4020,14 +4252,17 @@ typedef struct {
   PyObject *__pyx_n_s_reduce_cython;
   PyObject *__pyx_n_s_reduce_ex;
   PyObject *__pyx_n_s_register;
-  PyObject *__pyx_n_s_reshape;
   PyObject *__pyx_n_s_setstate;
   PyObject *__pyx_n_s_setstate_cython;
   PyObject *__pyx_n_s_shape;
+  PyObject *__pyx_n_s_single;
   PyObject *__pyx_n_s_size;
   PyObject *__pyx_n_s_smoothing;
   PyObject *__pyx_n_s_spec;
+  PyObject *__pyx_n_s_sqrt;
+  PyObject *__pyx_n_s_stable;
   PyObject *__pyx_n_s_start;
+  PyObject *__pyx_n_s_station_arrays;
   PyObject *__pyx_n_s_step;
   PyObject *__pyx_n_s_stop;
   PyObject *__pyx_kp_s_strided_and_direct;
@@ -4038,26 +4273,33 @@ typedef struct {
   PyObject *__pyx_n_s_sys;
   PyObject *__pyx_n_s_test;
   PyObject *__pyx_n_s_typing;
+  PyObject *__pyx_n_s_uint8;
   PyObject *__pyx_kp_s_unable_to_allocate_array_data;
   PyObject *__pyx_kp_s_unable_to_allocate_shape_and_str;
   PyObject *__pyx_n_s_unpack;
   PyObject *__pyx_n_s_update;
   PyObject *__pyx_n_s_value;
   PyObject *__pyx_n_s_values;
-  PyObject *__pyx_n_s_values0;
   PyObject *__pyx_n_s_version_info;
+  PyObject *__pyx_n_s_view;
+  PyObject *__pyx_n_s_width;
   PyObject *__pyx_n_s_x;
+  PyObject *__pyx_n_s_x0;
   PyObject *__pyx_n_s_xpos;
-  PyObject *__pyx_n_s_xpos0;
+  PyObject *__pyx_kp_s_xpos_ypos_and_values_must_have_t;
   PyObject *__pyx_n_s_xsize;
   PyObject *__pyx_n_s_y;
+  PyObject *__pyx_n_s_y0;
   PyObject *__pyx_n_s_ypos;
-  PyObject *__pyx_n_s_ypos0;
   PyObject *__pyx_n_s_ysize;
+  PyObject *__pyx_n_s_zeros;
+  PyObject *__pyx_float_1_0;
   PyObject *__pyx_int_0;
   PyObject *__pyx_int_1;
   PyObject *__pyx_int_2;
   PyObject *__pyx_int_3;
+  PyObject *__pyx_int_4;
+  PyObject *__pyx_int_16;
   PyObject *__pyx_int_112105877;
   PyObject *__pyx_int_136983863;
   PyObject *__pyx_int_184977713;
@@ -4066,20 +4308,30 @@ typedef struct {
   PyObject *__pyx_tuple__4;
   PyObject *__pyx_tuple__8;
   PyObject *__pyx_tuple__9;
+  PyObject *__pyx_slice__16;
   PyObject *__pyx_tuple__10;
   PyObject *__pyx_tuple__11;
   PyObject *__pyx_tuple__12;
   PyObject *__pyx_tuple__13;
   PyObject *__pyx_tuple__14;
   PyObject *__pyx_tuple__15;
-  PyObject *__pyx_tuple__16;
   PyObject *__pyx_tuple__17;
   PyObject *__pyx_tuple__18;
   PyObject *__pyx_tuple__19;
   PyObject *__pyx_tuple__20;
+  PyObject *__pyx_tuple__21;
   PyObject *__pyx_tuple__22;
-  PyObject *__pyx_codeobj__21;
-  PyObject *__pyx_codeobj__23;
+  PyObject *__pyx_tuple__23;
+  PyObject *__pyx_tuple__24;
+  PyObject *__pyx_tuple__25;
+  PyObject *__pyx_tuple__26;
+  PyObject *__pyx_tuple__28;
+  PyObject *__pyx_tuple__30;
+  PyObject *__pyx_tuple__32;
+  PyObject *__pyx_codeobj__27;
+  PyObject *__pyx_codeobj__29;
+  PyObject *__pyx_codeobj__31;
+  PyObject *__pyx_codeobj__33;
 } __pyx_mstate;
 
 #if CYTHON_USE_MODULE_STATE
@@ -4154,6 +4406,7 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_kp_s_All_dimensions_preceding_dimensi);
   Py_CLEAR(clear_module_state->__pyx_n_s_AssertionError);
   Py_CLEAR(clear_module_state->__pyx_kp_s_Buffer_view_does_not_expose_stri);
+  Py_CLEAR(clear_module_state->__pyx_n_s_C_CONTIGUOUS);
   Py_CLEAR(clear_module_state->__pyx_kp_s_Can_only_create_a_buffer_that_is);
   Py_CLEAR(clear_module_state->__pyx_kp_s_Cannot_assign_to_read_only_memor);
   Py_CLEAR(clear_module_state->__pyx_kp_s_Cannot_create_writable_memory_vi);
@@ -4172,7 +4425,6 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_kp_u_Invalid_mode_expected_c_or_fortr);
   Py_CLEAR(clear_module_state->__pyx_kp_u_Invalid_shape_in_axis);
   Py_CLEAR(clear_module_state->__pyx_n_s_List);
-  Py_CLEAR(clear_module_state->__pyx_kp_s_List_Dict_str_float);
   Py_CLEAR(clear_module_state->__pyx_kp_s_List_int);
   Py_CLEAR(clear_module_state->__pyx_n_s_MemoryError);
   Py_CLEAR(clear_module_state->__pyx_kp_s_MemoryView_of_r_at_0x_x);
@@ -4185,47 +4437,64 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_kp_s_Step_may_not_be_zero_axis_d);
   Py_CLEAR(clear_module_state->__pyx_n_s_TypeError);
   Py_CLEAR(clear_module_state->__pyx_kp_s_Unable_to_convert_item_to_object);
+  Py_CLEAR(clear_module_state->__pyx_n_s_Union);
+  Py_CLEAR(clear_module_state->__pyx_kp_s_Union_List_Dict_str_float_np_nda);
   Py_CLEAR(clear_module_state->__pyx_n_s_ValueError);
   Py_CLEAR(clear_module_state->__pyx_n_s_View_MemoryView);
   Py_CLEAR(clear_module_state->__pyx_kp_u__2);
-  Py_CLEAR(clear_module_state->__pyx_n_s__24);
   Py_CLEAR(clear_module_state->__pyx_n_s__3);
+  Py_CLEAR(clear_module_state->__pyx_n_s__34);
   Py_CLEAR(clear_module_state->__pyx_kp_u__6);
   Py_CLEAR(clear_module_state->__pyx_kp_u__7);
   Py_CLEAR(clear_module_state->__pyx_n_s_abc);
   Py_CLEAR(clear_module_state->__pyx_n_s_allocate_buffer);
   Py_CLEAR(clear_module_state->__pyx_kp_u_and);
+  Py_CLEAR(clear_module_state->__pyx_n_s_argsort);
   Py_CLEAR(clear_module_state->__pyx_n_s_array);
+  Py_CLEAR(clear_module_state->__pyx_n_s_asarray);
+  Py_CLEAR(clear_module_state->__pyx_n_s_ascontiguousarray);
+  Py_CLEAR(clear_module_state->__pyx_n_s_astype);
   Py_CLEAR(clear_module_state->__pyx_n_s_asyncio_coroutines);
   Py_CLEAR(clear_module_state->__pyx_n_s_base);
+  Py_CLEAR(clear_module_state->__pyx_n_s_bincount);
+  Py_CLEAR(clear_module_state->__pyx_n_s_bucket);
+  Py_CLEAR(clear_module_state->__pyx_n_s_bucket_x);
+  Py_CLEAR(clear_module_state->__pyx_n_s_bucket_y);
+  Py_CLEAR(clear_module_state->__pyx_n_s_build_grid_index);
   Py_CLEAR(clear_module_state->__pyx_n_s_c);
   Py_CLEAR(clear_module_state->__pyx_n_u_c);
-  Py_CLEAR(clear_module_state->__pyx_n_s_cda);
+  Py_CLEAR(clear_module_state->__pyx_n_s_cell_size);
   Py_CLEAR(clear_module_state->__pyx_n_s_cgeotransform);
   Py_CLEAR(clear_module_state->__pyx_n_s_class);
   Py_CLEAR(clear_module_state->__pyx_n_s_class_getitem);
   Py_CLEAR(clear_module_state->__pyx_n_s_cline_in_traceback);
+  Py_CLEAR(clear_module_state->__pyx_n_s_cmask);
   Py_CLEAR(clear_module_state->__pyx_n_s_collections);
   Py_CLEAR(clear_module_state->__pyx_kp_s_collections_abc);
   Py_CLEAR(clear_module_state->__pyx_kp_s_contiguous_and_direct);
   Py_CLEAR(clear_module_state->__pyx_kp_s_contiguous_and_indirect);
   Py_CLEAR(clear_module_state->__pyx_n_s_count);
+  Py_CLEAR(clear_module_state->__pyx_n_s_cpower);
+  Py_CLEAR(clear_module_state->__pyx_n_s_cpu_count);
+  Py_CLEAR(clear_module_state->__pyx_n_s_csmoothing);
+  Py_CLEAR(clear_module_state->__pyx_n_s_cumsum);
   Py_CLEAR(clear_module_state->__pyx_n_s_cvalues);
   Py_CLEAR(clear_module_state->__pyx_n_s_cxpos);
   Py_CLEAR(clear_module_state->__pyx_n_s_cypos);
   Py_CLEAR(clear_module_state->__pyx_n_s_d);
-  Py_CLEAR(clear_module_state->__pyx_n_s_da);
   Py_CLEAR(clear_module_state->__pyx_n_s_data);
-  Py_CLEAR(clear_module_state->__pyx_n_s_data_array);
   Py_CLEAR(clear_module_state->__pyx_n_s_dict);
   Py_CLEAR(clear_module_state->__pyx_kp_u_disable);
+  Py_CLEAR(clear_module_state->__pyx_n_s_dtype);
   Py_CLEAR(clear_module_state->__pyx_n_s_dtype_is_object);
+  Py_CLEAR(clear_module_state->__pyx_n_s_empty);
   Py_CLEAR(clear_module_state->__pyx_kp_u_enable);
   Py_CLEAR(clear_module_state->__pyx_n_s_encode);
   Py_CLEAR(clear_module_state->__pyx_n_s_enumerate);
   Py_CLEAR(clear_module_state->__pyx_n_s_error);
   Py_CLEAR(clear_module_state->__pyx_n_s_flags);
   Py_CLEAR(clear_module_state->__pyx_n_s_float);
+  Py_CLEAR(clear_module_state->__pyx_n_s_float32);
   Py_CLEAR(clear_module_state->__pyx_n_s_float64);
   Py_CLEAR(clear_module_state->__pyx_n_s_format);
   Py_CLEAR(clear_module_state->__pyx_n_s_fortran);
@@ -4236,36 +4505,64 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_n_s_getstate);
   Py_CLEAR(clear_module_state->__pyx_kp_u_got);
   Py_CLEAR(clear_module_state->__pyx_kp_u_got_differing_extents_in_dimensi);
-  Py_CLEAR(clear_module_state->__pyx_n_s_i);
+  Py_CLEAR(clear_module_state->__pyx_n_s_height);
   Py_CLEAR(clear_module_state->__pyx_n_s_id);
   Py_CLEAR(clear_module_state->__pyx_n_s_import);
   Py_CLEAR(clear_module_state->__pyx_n_s_index);
   Py_CLEAR(clear_module_state->__pyx_n_s_initializing);
-  Py_CLEAR(clear_module_state->__pyx_n_s_int);
+  Py_CLEAR(clear_module_state->__pyx_n_s_intc);
   Py_CLEAR(clear_module_state->__pyx_n_s_inverse_distance);
+  Py_CLEAR(clear_module_state->__pyx_n_s_inverse_distance_arrays);
   Py_CLEAR(clear_module_state->__pyx_n_s_is_coroutine);
   Py_CLEAR(clear_module_state->__pyx_kp_u_isenabled);
   Py_CLEAR(clear_module_state->__pyx_n_s_itemsize);
   Py_CLEAR(clear_module_state->__pyx_kp_s_itemsize_0_for_cython_array);
-  Py_CLEAR(clear_module_state->__pyx_n_s_j);
+  Py_CLEAR(clear_module_state->__pyx_n_s_k_nearest);
+  Py_CLEAR(clear_module_state->__pyx_kp_s_k_nearest_must_be_0_or_a_positiv);
+  Py_CLEAR(clear_module_state->__pyx_n_s_kind);
   Py_CLEAR(clear_module_state->__pyx_n_s_main);
+  Py_CLEAR(clear_module_state->__pyx_n_s_mask);
+  Py_CLEAR(clear_module_state->__pyx_kp_s_mask_must_have_shape);
+  Py_CLEAR(clear_module_state->__pyx_n_s_mask_ptr);
+  Py_CLEAR(clear_module_state->__pyx_n_s_max);
+  Py_CLEAR(clear_module_state->__pyx_n_s_max_radius);
+  Py_CLEAR(clear_module_state->__pyx_kp_s_max_radius_must_be_0_or_a_positi);
   Py_CLEAR(clear_module_state->__pyx_n_s_memview);
+  Py_CLEAR(clear_module_state->__pyx_n_s_min);
+  Py_CLEAR(clear_module_state->__pyx_n_s_minimum);
+  Py_CLEAR(clear_module_state->__pyx_n_s_minlength);
   Py_CLEAR(clear_module_state->__pyx_n_s_mode);
+  Py_CLEAR(clear_module_state->__pyx_n_s_n_stations);
   Py_CLEAR(clear_module_state->__pyx_n_s_name);
   Py_CLEAR(clear_module_state->__pyx_n_s_name_2);
+  Py_CLEAR(clear_module_state->__pyx_n_s_nan);
   Py_CLEAR(clear_module_state->__pyx_n_s_ndim);
   Py_CLEAR(clear_module_state->__pyx_n_s_new);
   Py_CLEAR(clear_module_state->__pyx_kp_s_no_default___reduce___due_to_non);
+  Py_CLEAR(clear_module_state->__pyx_n_s_nodata);
   Py_CLEAR(clear_module_state->__pyx_n_s_np);
+  Py_CLEAR(clear_module_state->__pyx_n_s_num_threads);
   Py_CLEAR(clear_module_state->__pyx_n_s_numpy);
   Py_CLEAR(clear_module_state->__pyx_kp_s_numpy__core_multiarray_failed_to);
   Py_CLEAR(clear_module_state->__pyx_kp_s_numpy__core_umath_failed_to_impo);
+  Py_CLEAR(clear_module_state->__pyx_n_s_nx);
+  Py_CLEAR(clear_module_state->__pyx_n_s_ny);
   Py_CLEAR(clear_module_state->__pyx_n_s_obj);
+  Py_CLEAR(clear_module_state->__pyx_n_s_order);
+  Py_CLEAR(clear_module_state->__pyx_n_s_os);
+  Py_CLEAR(clear_module_state->__pyx_n_s_out);
+  Py_CLEAR(clear_module_state->__pyx_n_s_out32);
+  Py_CLEAR(clear_module_state->__pyx_n_s_out64);
+  Py_CLEAR(clear_module_state->__pyx_kp_s_out_must_be_a_C_contiguous_float);
   Py_CLEAR(clear_module_state->__pyx_n_s_pack);
+  Py_CLEAR(clear_module_state->__pyx_n_s_per_bucket);
   Py_CLEAR(clear_module_state->__pyx_n_s_pickle);
   Py_CLEAR(clear_module_state->__pyx_n_s_power);
+  Py_CLEAR(clear_module_state->__pyx_n_s_precision);
+  Py_CLEAR(clear_module_state->__pyx_kp_s_precision_must_be_float32_or_flo);
   Py_CLEAR(clear_module_state->__pyx_kp_s_pymica_methods_inverse_distance);
   Py_CLEAR(clear_module_state->__pyx_n_s_pymica_methods_inverse_distance_2);
+  Py_CLEAR(clear_module_state->__pyx_n_s_pymica_methods_station_arrays);
   Py_CLEAR(clear_module_state->__pyx_n_s_pyx_PickleError);
   Py_CLEAR(clear_module_state->__pyx_n_s_pyx_checksum);
   Py_CLEAR(clear_module_state->__pyx_n_s_pyx_result);
@@ -4278,14 +4575,17 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_n_s_reduce_cython);
   Py_CLEAR(clear_module_state->__pyx_n_s_reduce_ex);
   Py_CLEAR(clear_module_state->__pyx_n_s_register);
-  Py_CLEAR(clear_module_state->__pyx_n_s_reshape);
   Py_CLEAR(clear_module_state->__pyx_n_s_setstate);
   Py_CLEAR(clear_module_state->__pyx_n_s_setstate_cython);
   Py_CLEAR(clear_module_state->__pyx_n_s_shape);
+  Py_CLEAR(clear_module_state->__pyx_n_s_single);
   Py_CLEAR(clear_module_state->__pyx_n_s_size);
   Py_CLEAR(clear_module_state->__pyx_n_s_smoothing);
   Py_CLEAR(clear_module_state->__pyx_n_s_spec);
+  Py_CLEAR(clear_module_state->__pyx_n_s_sqrt);
+  Py_CLEAR(clear_module_state->__pyx_n_s_stable);
   Py_CLEAR(clear_module_state->__pyx_n_s_start);
+  Py_CLEAR(clear_module_state->__pyx_n_s_station_arrays);
   Py_CLEAR(clear_module_state->__pyx_n_s_step);
   Py_CLEAR(clear_module_state->__pyx_n_s_stop);
   Py_CLEAR(clear_module_state->__pyx_kp_s_strided_and_direct);
@@ -4296,26 +4596,33 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_n_s_sys);
   Py_CLEAR(clear_module_state->__pyx_n_s_test);
   Py_CLEAR(clear_module_state->__pyx_n_s_typing);
+  Py_CLEAR(clear_module_state->__pyx_n_s_uint8);
   Py_CLEAR(clear_module_state->__pyx_kp_s_unable_to_allocate_array_data);
   Py_CLEAR(clear_module_state->__pyx_kp_s_unable_to_allocate_shape_and_str);
   Py_CLEAR(clear_module_state->__pyx_n_s_unpack);
   Py_CLEAR(clear_module_state->__pyx_n_s_update);
   Py_CLEAR(clear_module_state->__pyx_n_s_value);
   Py_CLEAR(clear_module_state->__pyx_n_s_values);
-  Py_CLEAR(clear_module_state->__pyx_n_s_values0);
   Py_CLEAR(clear_module_state->__pyx_n_s_version_info);
+  Py_CLEAR(clear_module_state->__pyx_n_s_view);
+  Py_CLEAR(clear_module_state->__pyx_n_s_width);
   Py_CLEAR(clear_module_state->__pyx_n_s_x);
+  Py_CLEAR(clear_module_state->__pyx_n_s_x0);
   Py_CLEAR(clear_module_state->__pyx_n_s_xpos);
-  Py_CLEAR(clear_module_state->__pyx_n_s_xpos0);
+  Py_CLEAR(clear_module_state->__pyx_kp_s_xpos_ypos_and_values_must_have_t);
   Py_CLEAR(clear_module_state->__pyx_n_s_xsize);
   Py_CLEAR(clear_module_state->__pyx_n_s_y);
+  Py_CLEAR(clear_module_state->__pyx_n_s_y0);
   Py_CLEAR(clear_module_state->__pyx_n_s_ypos);
-  Py_CLEAR(clear_module_state->__pyx_n_s_ypos0);
   Py_CLEAR(clear_module_state->__pyx_n_s_ysize);
+  Py_CLEAR(clear_module_state->__pyx_n_s_zeros);
+  Py_CLEAR(clear_module_state->__pyx_float_1_0);
   Py_CLEAR(clear_module_state->__pyx_int_0);
   Py_CLEAR(clear_module_state->__pyx_int_1);
   Py_CLEAR(clear_module_state->__pyx_int_2);
   Py_CLEAR(clear_module_state->__pyx_int_3);
+  Py_CLEAR(clear_module_state->__pyx_int_4);
+  Py_CLEAR(clear_module_state->__pyx_int_16);
   Py_CLEAR(clear_module_state->__pyx_int_112105877);
   Py_CLEAR(clear_module_state->__pyx_int_136983863);
   Py_CLEAR(clear_module_state->__pyx_int_184977713);
@@ -4324,20 +4631,30 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_tuple__4);
   Py_CLEAR(clear_module_state->__pyx_tuple__8);
   Py_CLEAR(clear_module_state->__pyx_tuple__9);
+  Py_CLEAR(clear_module_state->__pyx_slice__16);
   Py_CLEAR(clear_module_state->__pyx_tuple__10);
   Py_CLEAR(clear_module_state->__pyx_tuple__11);
   Py_CLEAR(clear_module_state->__pyx_tuple__12);
   Py_CLEAR(clear_module_state->__pyx_tuple__13);
   Py_CLEAR(clear_module_state->__pyx_tuple__14);
   Py_CLEAR(clear_module_state->__pyx_tuple__15);
-  Py_CLEAR(clear_module_state->__pyx_tuple__16);
   Py_CLEAR(clear_module_state->__pyx_tuple__17);
   Py_CLEAR(clear_module_state->__pyx_tuple__18);
   Py_CLEAR(clear_module_state->__pyx_tuple__19);
   Py_CLEAR(clear_module_state->__pyx_tuple__20);
+  Py_CLEAR(clear_module_state->__pyx_tuple__21);
   Py_CLEAR(clear_module_state->__pyx_tuple__22);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__21);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__23);
+  Py_CLEAR(clear_module_state->__pyx_tuple__23);
+  Py_CLEAR(clear_module_state->__pyx_tuple__24);
+  Py_CLEAR(clear_module_state->__pyx_tuple__25);
+  Py_CLEAR(clear_module_state->__pyx_tuple__26);
+  Py_CLEAR(clear_module_state->__pyx_tuple__28);
+  Py_CLEAR(clear_module_state->__pyx_tuple__30);
+  Py_CLEAR(clear_module_state->__pyx_tuple__32);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__27);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__29);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__31);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__33);
   return 0;
 }
 #endif
@@ -4390,6 +4707,7 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_kp_s_All_dimensions_preceding_dimensi);
   Py_VISIT(traverse_module_state->__pyx_n_s_AssertionError);
   Py_VISIT(traverse_module_state->__pyx_kp_s_Buffer_view_does_not_expose_stri);
+  Py_VISIT(traverse_module_state->__pyx_n_s_C_CONTIGUOUS);
   Py_VISIT(traverse_module_state->__pyx_kp_s_Can_only_create_a_buffer_that_is);
   Py_VISIT(traverse_module_state->__pyx_kp_s_Cannot_assign_to_read_only_memor);
   Py_VISIT(traverse_module_state->__pyx_kp_s_Cannot_create_writable_memory_vi);
@@ -4408,7 +4726,6 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_kp_u_Invalid_mode_expected_c_or_fortr);
   Py_VISIT(traverse_module_state->__pyx_kp_u_Invalid_shape_in_axis);
   Py_VISIT(traverse_module_state->__pyx_n_s_List);
-  Py_VISIT(traverse_module_state->__pyx_kp_s_List_Dict_str_float);
   Py_VISIT(traverse_module_state->__pyx_kp_s_List_int);
   Py_VISIT(traverse_module_state->__pyx_n_s_MemoryError);
   Py_VISIT(traverse_module_state->__pyx_kp_s_MemoryView_of_r_at_0x_x);
@@ -4421,47 +4738,64 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_kp_s_Step_may_not_be_zero_axis_d);
   Py_VISIT(traverse_module_state->__pyx_n_s_TypeError);
   Py_VISIT(traverse_module_state->__pyx_kp_s_Unable_to_convert_item_to_object);
+  Py_VISIT(traverse_module_state->__pyx_n_s_Union);
+  Py_VISIT(traverse_module_state->__pyx_kp_s_Union_List_Dict_str_float_np_nda);
   Py_VISIT(traverse_module_state->__pyx_n_s_ValueError);
   Py_VISIT(traverse_module_state->__pyx_n_s_View_MemoryView);
   Py_VISIT(traverse_module_state->__pyx_kp_u__2);
-  Py_VISIT(traverse_module_state->__pyx_n_s__24);
   Py_VISIT(traverse_module_state->__pyx_n_s__3);
+  Py_VISIT(traverse_module_state->__pyx_n_s__34);
   Py_VISIT(traverse_module_state->__pyx_kp_u__6);
   Py_VISIT(traverse_module_state->__pyx_kp_u__7);
   Py_VISIT(traverse_module_state->__pyx_n_s_abc);
   Py_VISIT(traverse_module_state->__pyx_n_s_allocate_buffer);
   Py_VISIT(traverse_module_state->__pyx_kp_u_and);
+  Py_VISIT(traverse_module_state->__pyx_n_s_argsort);
   Py_VISIT(traverse_module_state->__pyx_n_s_array);
+  Py_VISIT(traverse_module_state->__pyx_n_s_asarray);
+  Py_VISIT(traverse_module_state->__pyx_n_s_ascontiguousarray);
+  Py_VISIT(traverse_module_state->__pyx_n_s_astype);
   Py_VISIT(traverse_module_state->__pyx_n_s_asyncio_coroutines);
   Py_VISIT(traverse_module_state->__pyx_n_s_base);
+  Py_VISIT(traverse_module_state->__pyx_n_s_bincount);
+  Py_VISIT(traverse_module_state->__pyx_n_s_bucket);
+  Py_VISIT(traverse_module_state->__pyx_n_s_bucket_x);
+  Py_VISIT(traverse_module_state->__pyx_n_s_bucket_y);
+  Py_VISIT(traverse_module_state->__pyx_n_s_build_grid_index);
   Py_VISIT(traverse_module_state->__pyx_n_s_c);
   Py_VISIT(traverse_module_state->__pyx_n_u_c);
-  Py_VISIT(traverse_module_state->__pyx_n_s_cda);
+  Py_VISIT(traverse_module_state->__pyx_n_s_cell_size);
   Py_VISIT(traverse_module_state->__pyx_n_s_cgeotransform);
   Py_VISIT(traverse_module_state->__pyx_n_s_class);
   Py_VISIT(traverse_module_state->__pyx_n_s_class_getitem);
   Py_VISIT(traverse_module_state->__pyx_n_s_cline_in_traceback);
+  Py_VISIT(traverse_module_state->__pyx_n_s_cmask);
   Py_VISIT(traverse_module_state->__pyx_n_s_collections);
   Py_VISIT(traverse_module_state->__pyx_kp_s_collections_abc);
   Py_VISIT(traverse_module_state->__pyx_kp_s_contiguous_and_direct);
   Py_VISIT(traverse_module_state->__pyx_kp_s_contiguous_and_indirect);
   Py_VISIT(traverse_module_state->__pyx_n_s_count);
+  Py_VISIT(traverse_module_state->__pyx_n_s_cpower);
+  Py_VISIT(traverse_module_state->__pyx_n_s_cpu_count);
+  Py_VISIT(traverse_module_state->__pyx_n_s_csmoothing);
+  Py_VISIT(traverse_module_state->__pyx_n_s_cumsum);
   Py_VISIT(traverse_module_state->__pyx_n_s_cvalues);
   Py_VISIT(traverse_module_state->__pyx_n_s_cxpos);
   Py_VISIT(traverse_module_state->__pyx_n_s_cypos);
   Py_VISIT(traverse_module_state->__pyx_n_s_d);
-  Py_VISIT(traverse_module_state->__pyx_n_s_da);
   Py_VISIT(traverse_module_state->__pyx_n_s_data);
-  Py_VISIT(traverse_module_state->__pyx_n_s_data_array);
   Py_VISIT(traverse_module_state->__pyx_n_s_dict);
   Py_VISIT(traverse_module_state->__pyx_kp_u_disable);
+  Py_VISIT(traverse_module_state->__pyx_n_s_dtype);
   Py_VISIT(traverse_module_state->__pyx_n_s_dtype_is_object);
+  Py_VISIT(traverse_module_state->__pyx_n_s_empty);
   Py_VISIT(traverse_module_state->__pyx_kp_u_enable);
   Py_VISIT(traverse_module_state->__pyx_n_s_encode);
   Py_VISIT(traverse_module_state->__pyx_n_s_enumerate);
   Py_VISIT(traverse_module_state->__pyx_n_s_error);
   Py_VISIT(traverse_module_state->__pyx_n_s_flags);
   Py_VISIT(traverse_module_state->__pyx_n_s_float);
+  Py_VISIT(traverse_module_state->__pyx_n_s_float32);
   Py_VISIT(traverse_module_state->__pyx_n_s_float64);
   Py_VISIT(traverse_module_state->__pyx_n_s_format);
   Py_VISIT(traverse_module_state->__pyx_n_s_fortran);
@@ -4472,36 +4806,64 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_n_s_getstate);
   Py_VISIT(traverse_module_state->__pyx_kp_u_got);
   Py_VISIT(traverse_module_state->__pyx_kp_u_got_differing_extents_in_dimensi);
-  Py_VISIT(traverse_module_state->__pyx_n_s_i);
+  Py_VISIT(traverse_module_state->__pyx_n_s_height);
   Py_VISIT(traverse_module_state->__pyx_n_s_id);
   Py_VISIT(traverse_module_state->__pyx_n_s_import);
   Py_VISIT(traverse_module_state->__pyx_n_s_index);
   Py_VISIT(traverse_module_state->__pyx_n_s_initializing);
-  Py_VISIT(traverse_module_state->__pyx_n_s_int);
+  Py_VISIT(traverse_module_state->__pyx_n_s_intc);
   Py_VISIT(traverse_module_state->__pyx_n_s_inverse_distance);
+  Py_VISIT(traverse_module_state->__pyx_n_s_inverse_distance_arrays);
   Py_VISIT(traverse_module_state->__pyx_n_s_is_coroutine);
   Py_VISIT(traverse_module_state->__pyx_kp_u_isenabled);
   Py_VISIT(traverse_module_state->__pyx_n_s_itemsize);
   Py_VISIT(traverse_module_state->__pyx_kp_s_itemsize_0_for_cython_array);
-  Py_VISIT(traverse_module_state->__pyx_n_s_j);
+  Py_VISIT(traverse_module_state->__pyx_n_s_k_nearest);
+  Py_VISIT(traverse_module_state->__pyx_kp_s_k_nearest_must_be_0_or_a_positiv);
+  Py_VISIT(traverse_module_state->__pyx_n_s_kind);
   Py_VISIT(traverse_module_state->__pyx_n_s_main);
+  Py_VISIT(traverse_module_state->__pyx_n_s_mask);
+  Py_VISIT(traverse_module_state->__pyx_kp_s_mask_must_have_shape);
+  Py_VISIT(traverse_module_state->__pyx_n_s_mask_ptr);
+  Py_VISIT(traverse_module_state->__pyx_n_s_max);
+  Py_VISIT(traverse_module_state->__pyx_n_s_max_radius);
+  Py_VISIT(traverse_module_state->__pyx_kp_s_max_radius_must_be_0_or_a_positi);
   Py_VISIT(traverse_module_state->__pyx_n_s_memview);
+  Py_VISIT(traverse_module_state->__pyx_n_s_min);
+  Py_VISIT(traverse_module_state->__pyx_n_s_minimum);
+  Py_VISIT(traverse_module_state->__pyx_n_s_minlength);
   Py_VISIT(traverse_module_state->__pyx_n_s_mode);
+  Py_VISIT(traverse_module_state->__pyx_n_s_n_stations);
   Py_VISIT(traverse_module_state->__pyx_n_s_name);
   Py_VISIT(traverse_module_state->__pyx_n_s_name_2);
+  Py_VISIT(traverse_module_state->__pyx_n_s_nan);
   Py_VISIT(traverse_module_state->__pyx_n_s_ndim);
   Py_VISIT(traverse_module_state->__pyx_n_s_new);
   Py_VISIT(traverse_module_state->__pyx_kp_s_no_default___reduce___due_to_non);
+  Py_VISIT(traverse_module_state->__pyx_n_s_nodata);
   Py_VISIT(traverse_module_state->__pyx_n_s_np);
+  Py_VISIT(traverse_module_state->__pyx_n_s_num_threads);
   Py_VISIT(traverse_module_state->__pyx_n_s_numpy);
   Py_VISIT(traverse_module_state->__pyx_kp_s_numpy__core_multiarray_failed_to);
   Py_VISIT(traverse_module_state->__pyx_kp_s_numpy__core_umath_failed_to_impo);
+  Py_VISIT(traverse_module_state->__pyx_n_s_nx);
+  Py_VISIT(traverse_module_state->__pyx_n_s_ny);
   Py_VISIT(traverse_module_state->__pyx_n_s_obj);
+  Py_VISIT(traverse_module_state->__pyx_n_s_order);
+  Py_VISIT(traverse_module_state->__pyx_n_s_os);
+  Py_VISIT(traverse_module_state->__pyx_n_s_out);
+  Py_VISIT(traverse_module_state->__pyx_n_s_out32);
+  Py_VISIT(traverse_module_state->__pyx_n_s_out64);
+  Py_VISIT(traverse_module_state->__pyx_kp_s_out_must_be_a_C_contiguous_float);
   Py_VISIT(traverse_module_state->__pyx_n_s_pack);
+  Py_VISIT(traverse_module_state->__pyx_n_s_per_bucket);
   Py_VISIT(traverse_module_state->__pyx_n_s_pickle);
   Py_VISIT(traverse_module_state->__pyx_n_s_power);
+  Py_VISIT(traverse_module_state->__pyx_n_s_precision);
+  Py_VISIT(traverse_module_state->__pyx_kp_s_precision_must_be_float32_or_flo);
   Py_VISIT(traverse_module_state->__pyx_kp_s_pymica_methods_inverse_distance);
   Py_VISIT(traverse_module_state->__pyx_n_s_pymica_methods_inverse_distance_2);
+  Py_VISIT(traverse_module_state->__pyx_n_s_pymica_methods_station_arrays);
   Py_VISIT(traverse_module_state->__pyx_n_s_pyx_PickleError);
   Py_VISIT(traverse_module_state->__pyx_n_s_pyx_checksum);
   Py_VISIT(traverse_module_state->__pyx_n_s_pyx_result);
@@ -4514,14 +4876,17 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_n_s_reduce_cython);
   Py_VISIT(traverse_module_state->__pyx_n_s_reduce_ex);
   Py_VISIT(traverse_module_state->__pyx_n_s_register);
-  Py_VISIT(traverse_module_state->__pyx_n_s_reshape);
   Py_VISIT(traverse_module_state->__pyx_n_s_setstate);
   Py_VISIT(traverse_module_state->__pyx_n_s_setstate_cython);
   Py_VISIT(traverse_module_state->__pyx_n_s_shape);
+  Py_VISIT(traverse_module_state->__pyx_n_s_single);
   Py_VISIT(traverse_module_state->__pyx_n_s_size);
   Py_VISIT(traverse_module_state->__pyx_n_s_smoothing);
   Py_VISIT(traverse_module_state->__pyx_n_s_spec);
+  Py_VISIT(traverse_module_state->__pyx_n_s_sqrt);
+  Py_VISIT(traverse_module_state->__pyx_n_s_stable);
   Py_VISIT(traverse_module_state->__pyx_n_s_start);
+  Py_VISIT(traverse_module_state->__pyx_n_s_station_arrays);
   Py_VISIT(traverse_module_state->__pyx_n_s_step);
   Py_VISIT(traverse_module_state->__pyx_n_s_stop);
   Py_VISIT(traverse_module_state->__pyx_kp_s_strided_and_direct);
@@ -4532,26 +4897,33 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_n_s_sys);
   Py_VISIT(traverse_module_state->__pyx_n_s_test);
   Py_VISIT(traverse_module_state->__pyx_n_s_typing);
+  Py_VISIT(traverse_module_state->__pyx_n_s_uint8);
   Py_VISIT(traverse_module_state->__pyx_kp_s_unable_to_allocate_array_data);
   Py_VISIT(traverse_module_state->__pyx_kp_s_unable_to_allocate_shape_and_str);
   Py_VISIT(traverse_module_state->__pyx_n_s_unpack);
   Py_VISIT(traverse_module_state->__pyx_n_s_update);
   Py_VISIT(traverse_module_state->__pyx_n_s_value);
   Py_VISIT(traverse_module_state->__pyx_n_s_values);
-  Py_VISIT(traverse_module_state->__pyx_n_s_values0);
   Py_VISIT(traverse_module_state->__pyx_n_s_version_info);
+  Py_VISIT(traverse_module_state->__pyx_n_s_view);
+  Py_VISIT(traverse_module_state->__pyx_n_s_width);
   Py_VISIT(traverse_module_state->__pyx_n_s_x);
+  Py_VISIT(traverse_module_state->__pyx_n_s_x0);
   Py_VISIT(traverse_module_state->__pyx_n_s_xpos);
-  Py_VISIT(traverse_module_state->__pyx_n_s_xpos0);
+  Py_VISIT(traverse_module_state->__pyx_kp_s_xpos_ypos_and_values_must_have_t);
   Py_VISIT(traverse_module_state->__pyx_n_s_xsize);
   Py_VISIT(traverse_module_state->__pyx_n_s_y);
+  Py_VISIT(traverse_module_state->__pyx_n_s_y0);
   Py_VISIT(traverse_module_state->__pyx_n_s_ypos);
-  Py_VISIT(traverse_module_state->__pyx_n_s_ypos0);
   Py_VISIT(traverse_module_state->__pyx_n_s_ysize);
+  Py_VISIT(traverse_module_state->__pyx_n_s_zeros);
+  Py_VISIT(traverse_module_state->__pyx_float_1_0);
   Py_VISIT(traverse_module_state->__pyx_int_0);
   Py_VISIT(traverse_module_state->__pyx_int_1);
   Py_VISIT(traverse_module_state->__pyx_int_2);
   Py_VISIT(traverse_module_state->__pyx_int_3);
+  Py_VISIT(traverse_module_state->__pyx_int_4);
+  Py_VISIT(traverse_module_state->__pyx_int_16);
   Py_VISIT(traverse_module_state->__pyx_int_112105877);
   Py_VISIT(traverse_module_state->__pyx_int_136983863);
   Py_VISIT(traverse_module_state->__pyx_int_184977713);
@@ -4560,20 +4932,30 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_tuple__4);
   Py_VISIT(traverse_module_state->__pyx_tuple__8);
   Py_VISIT(traverse_module_state->__pyx_tuple__9);
+  Py_VISIT(traverse_module_state->__pyx_slice__16);
   Py_VISIT(traverse_module_state->__pyx_tuple__10);
   Py_VISIT(traverse_module_state->__pyx_tuple__11);
   Py_VISIT(traverse_module_state->__pyx_tuple__12);
   Py_VISIT(traverse_module_state->__pyx_tuple__13);
   Py_VISIT(traverse_module_state->__pyx_tuple__14);
   Py_VISIT(traverse_module_state->__pyx_tuple__15);
-  Py_VISIT(traverse_module_state->__pyx_tuple__16);
   Py_VISIT(traverse_module_state->__pyx_tuple__17);
   Py_VISIT(traverse_module_state->__pyx_tuple__18);
   Py_VISIT(traverse_module_state->__pyx_tuple__19);
   Py_VISIT(traverse_module_state->__pyx_tuple__20);
+  Py_VISIT(traverse_module_state->__pyx_tuple__21);
   Py_VISIT(traverse_module_state->__pyx_tuple__22);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__21);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__23);
+  Py_VISIT(traverse_module_state->__pyx_tuple__23);
+  Py_VISIT(traverse_module_state->__pyx_tuple__24);
+  Py_VISIT(traverse_module_state->__pyx_tuple__25);
+  Py_VISIT(traverse_module_state->__pyx_tuple__26);
+  Py_VISIT(traverse_module_state->__pyx_tuple__28);
+  Py_VISIT(traverse_module_state->__pyx_tuple__30);
+  Py_VISIT(traverse_module_state->__pyx_tuple__32);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__27);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__29);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__31);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__33);
   return 0;
 }
 #endif
@@ -4716,8 +5098,18 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #endif
 #if CYTHON_USE_MODULE_STATE
 #endif
+#if CYTHON_USE_MODULE_STATE
+#endif
 #define __pyx_ptype_7cpython_5array_array __pyx_mstate_global->__pyx_ptype_7cpython_5array_array
 #if CYTHON_USE_MODULE_STATE
+#endif
+#if CYTHON_USE_MODULE_STATE
+#endif
+#if CYTHON_USE_MODULE_STATE
+#endif
+#if CYTHON_USE_MODULE_STATE
+#endif
+#if CYTHON_USE_MODULE_STATE
 #define __pyx_type___pyx_array __pyx_mstate_global->__pyx_type___pyx_array
 #define __pyx_type___pyx_MemviewEnum __pyx_mstate_global->__pyx_type___pyx_MemviewEnum
 #define __pyx_type___pyx_memoryview __pyx_mstate_global->__pyx_type___pyx_memoryview
@@ -4732,6 +5124,7 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_kp_s_All_dimensions_preceding_dimensi __pyx_mstate_global->__pyx_kp_s_All_dimensions_preceding_dimensi
 #define __pyx_n_s_AssertionError __pyx_mstate_global->__pyx_n_s_AssertionError
 #define __pyx_kp_s_Buffer_view_does_not_expose_stri __pyx_mstate_global->__pyx_kp_s_Buffer_view_does_not_expose_stri
+#define __pyx_n_s_C_CONTIGUOUS __pyx_mstate_global->__pyx_n_s_C_CONTIGUOUS
 #define __pyx_kp_s_Can_only_create_a_buffer_that_is __pyx_mstate_global->__pyx_kp_s_Can_only_create_a_buffer_that_is
 #define __pyx_kp_s_Cannot_assign_to_read_only_memor __pyx_mstate_global->__pyx_kp_s_Cannot_assign_to_read_only_memor
 #define __pyx_kp_s_Cannot_create_writable_memory_vi __pyx_mstate_global->__pyx_kp_s_Cannot_create_writable_memory_vi
@@ -4750,7 +5143,6 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_kp_u_Invalid_mode_expected_c_or_fortr __pyx_mstate_global->__pyx_kp_u_Invalid_mode_expected_c_or_fortr
 #define __pyx_kp_u_Invalid_shape_in_axis __pyx_mstate_global->__pyx_kp_u_Invalid_shape_in_axis
 #define __pyx_n_s_List __pyx_mstate_global->__pyx_n_s_List
-#define __pyx_kp_s_List_Dict_str_float __pyx_mstate_global->__pyx_kp_s_List_Dict_str_float
 #define __pyx_kp_s_List_int __pyx_mstate_global->__pyx_kp_s_List_int
 #define __pyx_n_s_MemoryError __pyx_mstate_global->__pyx_n_s_MemoryError
 #define __pyx_kp_s_MemoryView_of_r_at_0x_x __pyx_mstate_global->__pyx_kp_s_MemoryView_of_r_at_0x_x
@@ -4763,47 +5155,64 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_kp_s_Step_may_not_be_zero_axis_d __pyx_mstate_global->__pyx_kp_s_Step_may_not_be_zero_axis_d
 #define __pyx_n_s_TypeError __pyx_mstate_global->__pyx_n_s_TypeError
 #define __pyx_kp_s_Unable_to_convert_item_to_object __pyx_mstate_global->__pyx_kp_s_Unable_to_convert_item_to_object
+#define __pyx_n_s_Union __pyx_mstate_global->__pyx_n_s_Union
+#define __pyx_kp_s_Union_List_Dict_str_float_np_nda __pyx_mstate_global->__pyx_kp_s_Union_List_Dict_str_float_np_nda
 #define __pyx_n_s_ValueError __pyx_mstate_global->__pyx_n_s_ValueError
 #define __pyx_n_s_View_MemoryView __pyx_mstate_global->__pyx_n_s_View_MemoryView
 #define __pyx_kp_u__2 __pyx_mstate_global->__pyx_kp_u__2
-#define __pyx_n_s__24 __pyx_mstate_global->__pyx_n_s__24
 #define __pyx_n_s__3 __pyx_mstate_global->__pyx_n_s__3
+#define __pyx_n_s__34 __pyx_mstate_global->__pyx_n_s__34
 #define __pyx_kp_u__6 __pyx_mstate_global->__pyx_kp_u__6
 #define __pyx_kp_u__7 __pyx_mstate_global->__pyx_kp_u__7
 #define __pyx_n_s_abc __pyx_mstate_global->__pyx_n_s_abc
 #define __pyx_n_s_allocate_buffer __pyx_mstate_global->__pyx_n_s_allocate_buffer
 #define __pyx_kp_u_and __pyx_mstate_global->__pyx_kp_u_and
+#define __pyx_n_s_argsort __pyx_mstate_global->__pyx_n_s_argsort
 #define __pyx_n_s_array __pyx_mstate_global->__pyx_n_s_array
+#define __pyx_n_s_asarray __pyx_mstate_global->__pyx_n_s_asarray
+#define __pyx_n_s_ascontiguousarray __pyx_mstate_global->__pyx_n_s_ascontiguousarray
+#define __pyx_n_s_astype __pyx_mstate_global->__pyx_n_s_astype
 #define __pyx_n_s_asyncio_coroutines __pyx_mstate_global->__pyx_n_s_asyncio_coroutines
 #define __pyx_n_s_base __pyx_mstate_global->__pyx_n_s_base
+#define __pyx_n_s_bincount __pyx_mstate_global->__pyx_n_s_bincount
+#define __pyx_n_s_bucket __pyx_mstate_global->__pyx_n_s_bucket
+#define __pyx_n_s_bucket_x __pyx_mstate_global->__pyx_n_s_bucket_x
+#define __pyx_n_s_bucket_y __pyx_mstate_global->__pyx_n_s_bucket_y
+#define __pyx_n_s_build_grid_index __pyx_mstate_global->__pyx_n_s_build_grid_index
 #define __pyx_n_s_c __pyx_mstate_global->__pyx_n_s_c
 #define __pyx_n_u_c __pyx_mstate_global->__pyx_n_u_c
-#define __pyx_n_s_cda __pyx_mstate_global->__pyx_n_s_cda
+#define __pyx_n_s_cell_size __pyx_mstate_global->__pyx_n_s_cell_size
 #define __pyx_n_s_cgeotransform __pyx_mstate_global->__pyx_n_s_cgeotransform
 #define __pyx_n_s_class __pyx_mstate_global->__pyx_n_s_class
 #define __pyx_n_s_class_getitem __pyx_mstate_global->__pyx_n_s_class_getitem
 #define __pyx_n_s_cline_in_traceback __pyx_mstate_global->__pyx_n_s_cline_in_traceback
+#define __pyx_n_s_cmask __pyx_mstate_global->__pyx_n_s_cmask
 #define __pyx_n_s_collections __pyx_mstate_global->__pyx_n_s_collections
 #define __pyx_kp_s_collections_abc __pyx_mstate_global->__pyx_kp_s_collections_abc
 #define __pyx_kp_s_contiguous_and_direct __pyx_mstate_global->__pyx_kp_s_contiguous_and_direct
 #define __pyx_kp_s_contiguous_and_indirect __pyx_mstate_global->__pyx_kp_s_contiguous_and_indirect
 #define __pyx_n_s_count __pyx_mstate_global->__pyx_n_s_count
+#define __pyx_n_s_cpower __pyx_mstate_global->__pyx_n_s_cpower
+#define __pyx_n_s_cpu_count __pyx_mstate_global->__pyx_n_s_cpu_count
+#define __pyx_n_s_csmoothing __pyx_mstate_global->__pyx_n_s_csmoothing
+#define __pyx_n_s_cumsum __pyx_mstate_global->__pyx_n_s_cumsum
 #define __pyx_n_s_cvalues __pyx_mstate_global->__pyx_n_s_cvalues
 #define __pyx_n_s_cxpos __pyx_mstate_global->__pyx_n_s_cxpos
 #define __pyx_n_s_cypos __pyx_mstate_global->__pyx_n_s_cypos
 #define __pyx_n_s_d __pyx_mstate_global->__pyx_n_s_d
-#define __pyx_n_s_da __pyx_mstate_global->__pyx_n_s_da
 #define __pyx_n_s_data __pyx_mstate_global->__pyx_n_s_data
-#define __pyx_n_s_data_array __pyx_mstate_global->__pyx_n_s_data_array
 #define __pyx_n_s_dict __pyx_mstate_global->__pyx_n_s_dict
 #define __pyx_kp_u_disable __pyx_mstate_global->__pyx_kp_u_disable
+#define __pyx_n_s_dtype __pyx_mstate_global->__pyx_n_s_dtype
 #define __pyx_n_s_dtype_is_object __pyx_mstate_global->__pyx_n_s_dtype_is_object
+#define __pyx_n_s_empty __pyx_mstate_global->__pyx_n_s_empty
 #define __pyx_kp_u_enable __pyx_mstate_global->__pyx_kp_u_enable
 #define __pyx_n_s_encode __pyx_mstate_global->__pyx_n_s_encode
 #define __pyx_n_s_enumerate __pyx_mstate_global->__pyx_n_s_enumerate
 #define __pyx_n_s_error __pyx_mstate_global->__pyx_n_s_error
 #define __pyx_n_s_flags __pyx_mstate_global->__pyx_n_s_flags
 #define __pyx_n_s_float __pyx_mstate_global->__pyx_n_s_float
+#define __pyx_n_s_float32 __pyx_mstate_global->__pyx_n_s_float32
 #define __pyx_n_s_float64 __pyx_mstate_global->__pyx_n_s_float64
 #define __pyx_n_s_format __pyx_mstate_global->__pyx_n_s_format
 #define __pyx_n_s_fortran __pyx_mstate_global->__pyx_n_s_fortran
@@ -4814,36 +5223,64 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_n_s_getstate __pyx_mstate_global->__pyx_n_s_getstate
 #define __pyx_kp_u_got __pyx_mstate_global->__pyx_kp_u_got
 #define __pyx_kp_u_got_differing_extents_in_dimensi __pyx_mstate_global->__pyx_kp_u_got_differing_extents_in_dimensi
-#define __pyx_n_s_i __pyx_mstate_global->__pyx_n_s_i
+#define __pyx_n_s_height __pyx_mstate_global->__pyx_n_s_height
 #define __pyx_n_s_id __pyx_mstate_global->__pyx_n_s_id
 #define __pyx_n_s_import __pyx_mstate_global->__pyx_n_s_import
 #define __pyx_n_s_index __pyx_mstate_global->__pyx_n_s_index
 #define __pyx_n_s_initializing __pyx_mstate_global->__pyx_n_s_initializing
-#define __pyx_n_s_int __pyx_mstate_global->__pyx_n_s_int
+#define __pyx_n_s_intc __pyx_mstate_global->__pyx_n_s_intc
 #define __pyx_n_s_inverse_distance __pyx_mstate_global->__pyx_n_s_inverse_distance
+#define __pyx_n_s_inverse_distance_arrays __pyx_mstate_global->__pyx_n_s_inverse_distance_arrays
 #define __pyx_n_s_is_coroutine __pyx_mstate_global->__pyx_n_s_is_coroutine
 #define __pyx_kp_u_isenabled __pyx_mstate_global->__pyx_kp_u_isenabled
 #define __pyx_n_s_itemsize __pyx_mstate_global->__pyx_n_s_itemsize
 #define __pyx_kp_s_itemsize_0_for_cython_array __pyx_mstate_global->__pyx_kp_s_itemsize_0_for_cython_array
-#define __pyx_n_s_j __pyx_mstate_global->__pyx_n_s_j
+#define __pyx_n_s_k_nearest __pyx_mstate_global->__pyx_n_s_k_nearest
+#define __pyx_kp_s_k_nearest_must_be_0_or_a_positiv __pyx_mstate_global->__pyx_kp_s_k_nearest_must_be_0_or_a_positiv
+#define __pyx_n_s_kind __pyx_mstate_global->__pyx_n_s_kind
 #define __pyx_n_s_main __pyx_mstate_global->__pyx_n_s_main
+#define __pyx_n_s_mask __pyx_mstate_global->__pyx_n_s_mask
+#define __pyx_kp_s_mask_must_have_shape __pyx_mstate_global->__pyx_kp_s_mask_must_have_shape
+#define __pyx_n_s_mask_ptr __pyx_mstate_global->__pyx_n_s_mask_ptr
+#define __pyx_n_s_max __pyx_mstate_global->__pyx_n_s_max
+#define __pyx_n_s_max_radius __pyx_mstate_global->__pyx_n_s_max_radius
+#define __pyx_kp_s_max_radius_must_be_0_or_a_positi __pyx_mstate_global->__pyx_kp_s_max_radius_must_be_0_or_a_positi
 #define __pyx_n_s_memview __pyx_mstate_global->__pyx_n_s_memview
+#define __pyx_n_s_min __pyx_mstate_global->__pyx_n_s_min
+#define __pyx_n_s_minimum __pyx_mstate_global->__pyx_n_s_minimum
+#define __pyx_n_s_minlength __pyx_mstate_global->__pyx_n_s_minlength
 #define __pyx_n_s_mode __pyx_mstate_global->__pyx_n_s_mode
+#define __pyx_n_s_n_stations __pyx_mstate_global->__pyx_n_s_n_stations
 #define __pyx_n_s_name __pyx_mstate_global->__pyx_n_s_name
 #define __pyx_n_s_name_2 __pyx_mstate_global->__pyx_n_s_name_2
+#define __pyx_n_s_nan __pyx_mstate_global->__pyx_n_s_nan
 #define __pyx_n_s_ndim __pyx_mstate_global->__pyx_n_s_ndim
 #define __pyx_n_s_new __pyx_mstate_global->__pyx_n_s_new
 #define __pyx_kp_s_no_default___reduce___due_to_non __pyx_mstate_global->__pyx_kp_s_no_default___reduce___due_to_non
+#define __pyx_n_s_nodata __pyx_mstate_global->__pyx_n_s_nodata
 #define __pyx_n_s_np __pyx_mstate_global->__pyx_n_s_np
+#define __pyx_n_s_num_threads __pyx_mstate_global->__pyx_n_s_num_threads
 #define __pyx_n_s_numpy __pyx_mstate_global->__pyx_n_s_numpy
 #define __pyx_kp_s_numpy__core_multiarray_failed_to __pyx_mstate_global->__pyx_kp_s_numpy__core_multiarray_failed_to
 #define __pyx_kp_s_numpy__core_umath_failed_to_impo __pyx_mstate_global->__pyx_kp_s_numpy__core_umath_failed_to_impo
+#define __pyx_n_s_nx __pyx_mstate_global->__pyx_n_s_nx
+#define __pyx_n_s_ny __pyx_mstate_global->__pyx_n_s_ny
 #define __pyx_n_s_obj __pyx_mstate_global->__pyx_n_s_obj
+#define __pyx_n_s_order __pyx_mstate_global->__pyx_n_s_order
+#define __pyx_n_s_os __pyx_mstate_global->__pyx_n_s_os
+#define __pyx_n_s_out __pyx_mstate_global->__pyx_n_s_out
+#define __pyx_n_s_out32 __pyx_mstate_global->__pyx_n_s_out32
+#define __pyx_n_s_out64 __pyx_mstate_global->__pyx_n_s_out64
+#define __pyx_kp_s_out_must_be_a_C_contiguous_float __pyx_mstate_global->__pyx_kp_s_out_must_be_a_C_contiguous_float
 #define __pyx_n_s_pack __pyx_mstate_global->__pyx_n_s_pack
+#define __pyx_n_s_per_bucket __pyx_mstate_global->__pyx_n_s_per_bucket
 #define __pyx_n_s_pickle __pyx_mstate_global->__pyx_n_s_pickle
 #define __pyx_n_s_power __pyx_mstate_global->__pyx_n_s_power
+#define __pyx_n_s_precision __pyx_mstate_global->__pyx_n_s_precision
+#define __pyx_kp_s_precision_must_be_float32_or_flo __pyx_mstate_global->__pyx_kp_s_precision_must_be_float32_or_flo
 #define __pyx_kp_s_pymica_methods_inverse_distance __pyx_mstate_global->__pyx_kp_s_pymica_methods_inverse_distance
 #define __pyx_n_s_pymica_methods_inverse_distance_2 __pyx_mstate_global->__pyx_n_s_pymica_methods_inverse_distance_2
+#define __pyx_n_s_pymica_methods_station_arrays __pyx_mstate_global->__pyx_n_s_pymica_methods_station_arrays
 #define __pyx_n_s_pyx_PickleError __pyx_mstate_global->__pyx_n_s_pyx_PickleError
 #define __pyx_n_s_pyx_checksum __pyx_mstate_global->__pyx_n_s_pyx_checksum
 #define __pyx_n_s_pyx_result __pyx_mstate_global->__pyx_n_s_pyx_result
@@ -4856,14 +5293,17 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_n_s_reduce_cython __pyx_mstate_global->__pyx_n_s_reduce_cython
 #define __pyx_n_s_reduce_ex __pyx_mstate_global->__pyx_n_s_reduce_ex
 #define __pyx_n_s_register __pyx_mstate_global->__pyx_n_s_register
-#define __pyx_n_s_reshape __pyx_mstate_global->__pyx_n_s_reshape
 #define __pyx_n_s_setstate __pyx_mstate_global->__pyx_n_s_setstate
 #define __pyx_n_s_setstate_cython __pyx_mstate_global->__pyx_n_s_setstate_cython
 #define __pyx_n_s_shape __pyx_mstate_global->__pyx_n_s_shape
+#define __pyx_n_s_single __pyx_mstate_global->__pyx_n_s_single
 #define __pyx_n_s_size __pyx_mstate_global->__pyx_n_s_size
 #define __pyx_n_s_smoothing __pyx_mstate_global->__pyx_n_s_smoothing
 #define __pyx_n_s_spec __pyx_mstate_global->__pyx_n_s_spec
+#define __pyx_n_s_sqrt __pyx_mstate_global->__pyx_n_s_sqrt
+#define __pyx_n_s_stable __pyx_mstate_global->__pyx_n_s_stable
 #define __pyx_n_s_start __pyx_mstate_global->__pyx_n_s_start
+#define __pyx_n_s_station_arrays __pyx_mstate_global->__pyx_n_s_station_arrays
 #define __pyx_n_s_step __pyx_mstate_global->__pyx_n_s_step
 #define __pyx_n_s_stop __pyx_mstate_global->__pyx_n_s_stop
 #define __pyx_kp_s_strided_and_direct __pyx_mstate_global->__pyx_kp_s_strided_and_direct
@@ -4874,26 +5314,33 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_n_s_sys __pyx_mstate_global->__pyx_n_s_sys
 #define __pyx_n_s_test __pyx_mstate_global->__pyx_n_s_test
 #define __pyx_n_s_typing __pyx_mstate_global->__pyx_n_s_typing
+#define __pyx_n_s_uint8 __pyx_mstate_global->__pyx_n_s_uint8
 #define __pyx_kp_s_unable_to_allocate_array_data __pyx_mstate_global->__pyx_kp_s_unable_to_allocate_array_data
 #define __pyx_kp_s_unable_to_allocate_shape_and_str __pyx_mstate_global->__pyx_kp_s_unable_to_allocate_shape_and_str
 #define __pyx_n_s_unpack __pyx_mstate_global->__pyx_n_s_unpack
 #define __pyx_n_s_update __pyx_mstate_global->__pyx_n_s_update
 #define __pyx_n_s_value __pyx_mstate_global->__pyx_n_s_value
 #define __pyx_n_s_values __pyx_mstate_global->__pyx_n_s_values
-#define __pyx_n_s_values0 __pyx_mstate_global->__pyx_n_s_values0
 #define __pyx_n_s_version_info __pyx_mstate_global->__pyx_n_s_version_info
+#define __pyx_n_s_view __pyx_mstate_global->__pyx_n_s_view
+#define __pyx_n_s_width __pyx_mstate_global->__pyx_n_s_width
 #define __pyx_n_s_x __pyx_mstate_global->__pyx_n_s_x
+#define __pyx_n_s_x0 __pyx_mstate_global->__pyx_n_s_x0
 #define __pyx_n_s_xpos __pyx_mstate_global->__pyx_n_s_xpos
-#define __pyx_n_s_xpos0 __pyx_mstate_global->__pyx_n_s_xpos0
+#define __pyx_kp_s_xpos_ypos_and_values_must_have_t __pyx_mstate_global->__pyx_kp_s_xpos_ypos_and_values_must_have_t
 #define __pyx_n_s_xsize __pyx_mstate_global->__pyx_n_s_xsize
 #define __pyx_n_s_y __pyx_mstate_global->__pyx_n_s_y
+#define __pyx_n_s_y0 __pyx_mstate_global->__pyx_n_s_y0
 #define __pyx_n_s_ypos __pyx_mstate_global->__pyx_n_s_ypos
-#define __pyx_n_s_ypos0 __pyx_mstate_global->__pyx_n_s_ypos0
 #define __pyx_n_s_ysize __pyx_mstate_global->__pyx_n_s_ysize
+#define __pyx_n_s_zeros __pyx_mstate_global->__pyx_n_s_zeros
+#define __pyx_float_1_0 __pyx_mstate_global->__pyx_float_1_0
 #define __pyx_int_0 __pyx_mstate_global->__pyx_int_0
 #define __pyx_int_1 __pyx_mstate_global->__pyx_int_1
 #define __pyx_int_2 __pyx_mstate_global->__pyx_int_2
 #define __pyx_int_3 __pyx_mstate_global->__pyx_int_3
+#define __pyx_int_4 __pyx_mstate_global->__pyx_int_4
+#define __pyx_int_16 __pyx_mstate_global->__pyx_int_16
 #define __pyx_int_112105877 __pyx_mstate_global->__pyx_int_112105877
 #define __pyx_int_136983863 __pyx_mstate_global->__pyx_int_136983863
 #define __pyx_int_184977713 __pyx_mstate_global->__pyx_int_184977713
@@ -4902,20 +5349,30 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_tuple__4 __pyx_mstate_global->__pyx_tuple__4
 #define __pyx_tuple__8 __pyx_mstate_global->__pyx_tuple__8
 #define __pyx_tuple__9 __pyx_mstate_global->__pyx_tuple__9
+#define __pyx_slice__16 __pyx_mstate_global->__pyx_slice__16
 #define __pyx_tuple__10 __pyx_mstate_global->__pyx_tuple__10
 #define __pyx_tuple__11 __pyx_mstate_global->__pyx_tuple__11
 #define __pyx_tuple__12 __pyx_mstate_global->__pyx_tuple__12
 #define __pyx_tuple__13 __pyx_mstate_global->__pyx_tuple__13
 #define __pyx_tuple__14 __pyx_mstate_global->__pyx_tuple__14
 #define __pyx_tuple__15 __pyx_mstate_global->__pyx_tuple__15
-#define __pyx_tuple__16 __pyx_mstate_global->__pyx_tuple__16
 #define __pyx_tuple__17 __pyx_mstate_global->__pyx_tuple__17
 #define __pyx_tuple__18 __pyx_mstate_global->__pyx_tuple__18
 #define __pyx_tuple__19 __pyx_mstate_global->__pyx_tuple__19
 #define __pyx_tuple__20 __pyx_mstate_global->__pyx_tuple__20
+#define __pyx_tuple__21 __pyx_mstate_global->__pyx_tuple__21
 #define __pyx_tuple__22 __pyx_mstate_global->__pyx_tuple__22
-#define __pyx_codeobj__21 __pyx_mstate_global->__pyx_codeobj__21
-#define __pyx_codeobj__23 __pyx_mstate_global->__pyx_codeobj__23
+#define __pyx_tuple__23 __pyx_mstate_global->__pyx_tuple__23
+#define __pyx_tuple__24 __pyx_mstate_global->__pyx_tuple__24
+#define __pyx_tuple__25 __pyx_mstate_global->__pyx_tuple__25
+#define __pyx_tuple__26 __pyx_mstate_global->__pyx_tuple__26
+#define __pyx_tuple__28 __pyx_mstate_global->__pyx_tuple__28
+#define __pyx_tuple__30 __pyx_mstate_global->__pyx_tuple__30
+#define __pyx_tuple__32 __pyx_mstate_global->__pyx_tuple__32
+#define __pyx_codeobj__27 __pyx_mstate_global->__pyx_codeobj__27
+#define __pyx_codeobj__29 __pyx_mstate_global->__pyx_codeobj__29
+#define __pyx_codeobj__31 __pyx_mstate_global->__pyx_codeobj__31
+#define __pyx_codeobj__33 __pyx_mstate_global->__pyx_codeobj__33
 /* #### Code section: module_code ### */
 
 /* "View.MemoryView":131
@@ -18546,7 +19003,7 @@ static PyObject *__pyx_unpickle_Enum__set_state(struct __pyx_MemviewEnum_obj *__
   return __pyx_r;
 }
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":287
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":244
  * 
  *         @property
  *         cdef inline npy_intp itemsize(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18557,7 +19014,7 @@ static PyObject *__pyx_unpickle_Enum__set_state(struct __pyx_MemviewEnum_obj *__
 static CYTHON_INLINE npy_intp __pyx_f_5numpy_5dtype_8itemsize_itemsize(PyArray_Descr *__pyx_v_self) {
   npy_intp __pyx_r;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":288
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":245
  *         @property
  *         cdef inline npy_intp itemsize(self) noexcept nogil:
  *             return PyDataType_ELSIZE(self)             # <<<<<<<<<<<<<<
@@ -18567,7 +19024,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_5dtype_8itemsize_itemsize(PyArray_D
   __pyx_r = PyDataType_ELSIZE(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":287
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":244
  * 
  *         @property
  *         cdef inline npy_intp itemsize(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18580,7 +19037,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_5dtype_8itemsize_itemsize(PyArray_D
   return __pyx_r;
 }
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":291
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":248
  * 
  *         @property
  *         cdef inline npy_intp alignment(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18591,7 +19048,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_5dtype_8itemsize_itemsize(PyArray_D
 static CYTHON_INLINE npy_intp __pyx_f_5numpy_5dtype_9alignment_alignment(PyArray_Descr *__pyx_v_self) {
   npy_intp __pyx_r;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":292
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":249
  *         @property
  *         cdef inline npy_intp alignment(self) noexcept nogil:
  *             return PyDataType_ALIGNMENT(self)             # <<<<<<<<<<<<<<
@@ -18601,7 +19058,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_5dtype_9alignment_alignment(PyArray
   __pyx_r = PyDataType_ALIGNMENT(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":291
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":248
  * 
  *         @property
  *         cdef inline npy_intp alignment(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18614,7 +19071,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_5dtype_9alignment_alignment(PyArray
   return __pyx_r;
 }
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":297
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":254
  *         # for this using PyDataType_HASFIELDS.
  *         @property
  *         cdef inline object fields(self):             # <<<<<<<<<<<<<<
@@ -18628,7 +19085,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_5dtype_6fields_fields(PyArray_Desc
   PyObject *__pyx_t_1;
   __Pyx_RefNannySetupContext("fields", 1);
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":298
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":255
  *         @property
  *         cdef inline object fields(self):
  *             return <object>PyDataType_FIELDS(self)             # <<<<<<<<<<<<<<
@@ -18641,7 +19098,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_5dtype_6fields_fields(PyArray_Desc
   __pyx_r = ((PyObject *)__pyx_t_1);
   goto __pyx_L0;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":297
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":254
  *         # for this using PyDataType_HASFIELDS.
  *         @property
  *         cdef inline object fields(self):             # <<<<<<<<<<<<<<
@@ -18656,7 +19113,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_5dtype_6fields_fields(PyArray_Desc
   return __pyx_r;
 }
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":301
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":258
  * 
  *         @property
  *         cdef inline tuple names(self):             # <<<<<<<<<<<<<<
@@ -18670,7 +19127,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_5dtype_5names_names(PyArray_Descr
   PyObject *__pyx_t_1;
   __Pyx_RefNannySetupContext("names", 1);
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":302
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":259
  *         @property
  *         cdef inline tuple names(self):
  *             return <tuple>PyDataType_NAMES(self)             # <<<<<<<<<<<<<<
@@ -18683,7 +19140,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_5dtype_5names_names(PyArray_Descr
   __pyx_r = ((PyObject*)__pyx_t_1);
   goto __pyx_L0;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":301
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":258
  * 
  *         @property
  *         cdef inline tuple names(self):             # <<<<<<<<<<<<<<
@@ -18698,7 +19155,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_5dtype_5names_names(PyArray_Descr
   return __pyx_r;
 }
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":308
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":265
  *         # this field via the inline helper method PyDataType_SHAPE.
  *         @property
  *         cdef inline PyArray_ArrayDescr* subarray(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18709,7 +19166,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_5dtype_5names_names(PyArray_Descr
 static CYTHON_INLINE PyArray_ArrayDescr *__pyx_f_5numpy_5dtype_8subarray_subarray(PyArray_Descr *__pyx_v_self) {
   PyArray_ArrayDescr *__pyx_r;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":309
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":266
  *         @property
  *         cdef inline PyArray_ArrayDescr* subarray(self) noexcept nogil:
  *             return PyDataType_SUBARRAY(self)             # <<<<<<<<<<<<<<
@@ -18719,7 +19176,7 @@ static CYTHON_INLINE PyArray_ArrayDescr *__pyx_f_5numpy_5dtype_8subarray_subarra
   __pyx_r = PyDataType_SUBARRAY(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":308
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":265
  *         # this field via the inline helper method PyDataType_SHAPE.
  *         @property
  *         cdef inline PyArray_ArrayDescr* subarray(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18732,7 +19189,7 @@ static CYTHON_INLINE PyArray_ArrayDescr *__pyx_f_5numpy_5dtype_8subarray_subarra
   return __pyx_r;
 }
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":312
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":269
  * 
  *         @property
  *         cdef inline npy_uint64 flags(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18743,7 +19200,7 @@ static CYTHON_INLINE PyArray_ArrayDescr *__pyx_f_5numpy_5dtype_8subarray_subarra
 static CYTHON_INLINE npy_uint64 __pyx_f_5numpy_5dtype_5flags_flags(PyArray_Descr *__pyx_v_self) {
   npy_uint64 __pyx_r;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":314
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":271
  *         cdef inline npy_uint64 flags(self) noexcept nogil:
  *             """The data types flags."""
  *             return PyDataType_FLAGS(self)             # <<<<<<<<<<<<<<
@@ -18753,7 +19210,7 @@ static CYTHON_INLINE npy_uint64 __pyx_f_5numpy_5dtype_5flags_flags(PyArray_Descr
   __pyx_r = PyDataType_FLAGS(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":312
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":269
  * 
  *         @property
  *         cdef inline npy_uint64 flags(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18766,7 +19223,7 @@ static CYTHON_INLINE npy_uint64 __pyx_f_5numpy_5dtype_5flags_flags(PyArray_Descr
   return __pyx_r;
 }
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":324
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":281
  * 
  *         @property
  *         cdef inline int numiter(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18777,7 +19234,7 @@ static CYTHON_INLINE npy_uint64 __pyx_f_5numpy_5dtype_5flags_flags(PyArray_Descr
 static CYTHON_INLINE int __pyx_f_5numpy_9broadcast_7numiter_numiter(PyArrayMultiIterObject *__pyx_v_self) {
   int __pyx_r;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":326
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":283
  *         cdef inline int numiter(self) noexcept nogil:
  *             """The number of arrays that need to be broadcast to the same shape."""
  *             return PyArray_MultiIter_NUMITER(self)             # <<<<<<<<<<<<<<
@@ -18787,7 +19244,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_9broadcast_7numiter_numiter(PyArrayMulti
   __pyx_r = PyArray_MultiIter_NUMITER(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":324
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":281
  * 
  *         @property
  *         cdef inline int numiter(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18800,7 +19257,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_9broadcast_7numiter_numiter(PyArrayMulti
   return __pyx_r;
 }
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":329
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":286
  * 
  *         @property
  *         cdef inline npy_intp size(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18811,7 +19268,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_9broadcast_7numiter_numiter(PyArrayMulti
 static CYTHON_INLINE npy_intp __pyx_f_5numpy_9broadcast_4size_size(PyArrayMultiIterObject *__pyx_v_self) {
   npy_intp __pyx_r;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":331
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":288
  *         cdef inline npy_intp size(self) noexcept nogil:
  *             """The total broadcasted size."""
  *             return PyArray_MultiIter_SIZE(self)             # <<<<<<<<<<<<<<
@@ -18821,7 +19278,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_9broadcast_4size_size(PyArrayMultiI
   __pyx_r = PyArray_MultiIter_SIZE(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":329
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":286
  * 
  *         @property
  *         cdef inline npy_intp size(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18834,7 +19291,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_9broadcast_4size_size(PyArrayMultiI
   return __pyx_r;
 }
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":334
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":291
  * 
  *         @property
  *         cdef inline npy_intp index(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18845,7 +19302,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_9broadcast_4size_size(PyArrayMultiI
 static CYTHON_INLINE npy_intp __pyx_f_5numpy_9broadcast_5index_index(PyArrayMultiIterObject *__pyx_v_self) {
   npy_intp __pyx_r;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":336
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":293
  *         cdef inline npy_intp index(self) noexcept nogil:
  *             """The current (1-d) index into the broadcasted result."""
  *             return PyArray_MultiIter_INDEX(self)             # <<<<<<<<<<<<<<
@@ -18855,7 +19312,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_9broadcast_5index_index(PyArrayMult
   __pyx_r = PyArray_MultiIter_INDEX(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":334
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":291
  * 
  *         @property
  *         cdef inline npy_intp index(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18868,7 +19325,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_9broadcast_5index_index(PyArrayMult
   return __pyx_r;
 }
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":339
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":296
  * 
  *         @property
  *         cdef inline int nd(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18879,7 +19336,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_9broadcast_5index_index(PyArrayMult
 static CYTHON_INLINE int __pyx_f_5numpy_9broadcast_2nd_nd(PyArrayMultiIterObject *__pyx_v_self) {
   int __pyx_r;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":341
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":298
  *         cdef inline int nd(self) noexcept nogil:
  *             """The number of dimensions in the broadcasted result."""
  *             return PyArray_MultiIter_NDIM(self)             # <<<<<<<<<<<<<<
@@ -18889,7 +19346,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_9broadcast_2nd_nd(PyArrayMultiIterObject
   __pyx_r = PyArray_MultiIter_NDIM(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":339
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":296
  * 
  *         @property
  *         cdef inline int nd(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18902,7 +19359,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_9broadcast_2nd_nd(PyArrayMultiIterObject
   return __pyx_r;
 }
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":344
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":301
  * 
  *         @property
  *         cdef inline npy_intp* dimensions(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18913,7 +19370,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_9broadcast_2nd_nd(PyArrayMultiIterObject
 static CYTHON_INLINE npy_intp *__pyx_f_5numpy_9broadcast_10dimensions_dimensions(PyArrayMultiIterObject *__pyx_v_self) {
   npy_intp *__pyx_r;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":346
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":303
  *         cdef inline npy_intp* dimensions(self) noexcept nogil:
  *             """The shape of the broadcasted result."""
  *             return PyArray_MultiIter_DIMS(self)             # <<<<<<<<<<<<<<
@@ -18923,7 +19380,7 @@ static CYTHON_INLINE npy_intp *__pyx_f_5numpy_9broadcast_10dimensions_dimensions
   __pyx_r = PyArray_MultiIter_DIMS(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":344
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":301
  * 
  *         @property
  *         cdef inline npy_intp* dimensions(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18936,7 +19393,7 @@ static CYTHON_INLINE npy_intp *__pyx_f_5numpy_9broadcast_10dimensions_dimensions
   return __pyx_r;
 }
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":349
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":306
  * 
  *         @property
  *         cdef inline void** iters(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18947,7 +19404,7 @@ static CYTHON_INLINE npy_intp *__pyx_f_5numpy_9broadcast_10dimensions_dimensions
 static CYTHON_INLINE void **__pyx_f_5numpy_9broadcast_5iters_iters(PyArrayMultiIterObject *__pyx_v_self) {
   void **__pyx_r;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":352
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":309
  *             """An array of iterator objects that holds the iterators for the arrays to be broadcast together.
  *             On return, the iterators are adjusted for broadcasting."""
  *             return PyArray_MultiIter_ITERS(self)             # <<<<<<<<<<<<<<
@@ -18957,7 +19414,7 @@ static CYTHON_INLINE void **__pyx_f_5numpy_9broadcast_5iters_iters(PyArrayMultiI
   __pyx_r = PyArray_MultiIter_ITERS(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":349
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":306
  * 
  *         @property
  *         cdef inline void** iters(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18970,7 +19427,7 @@ static CYTHON_INLINE void **__pyx_f_5numpy_9broadcast_5iters_iters(PyArrayMultiI
   return __pyx_r;
 }
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":367
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":324
  * 
  *         @property
  *         cdef inline PyObject* base(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -18981,7 +19438,7 @@ static CYTHON_INLINE void **__pyx_f_5numpy_9broadcast_5iters_iters(PyArrayMultiI
 static CYTHON_INLINE PyObject *__pyx_f_5numpy_7ndarray_4base_base(PyArrayObject *__pyx_v_self) {
   PyObject *__pyx_r;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":370
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":327
  *             """Returns a borrowed reference to the object owning the data/memory.
  *             """
  *             return PyArray_BASE(self)             # <<<<<<<<<<<<<<
@@ -18991,7 +19448,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_7ndarray_4base_base(PyArrayObject
   __pyx_r = PyArray_BASE(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":367
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":324
  * 
  *         @property
  *         cdef inline PyObject* base(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -19004,7 +19461,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_7ndarray_4base_base(PyArrayObject
   return __pyx_r;
 }
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":373
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":330
  * 
  *         @property
  *         cdef inline dtype descr(self):             # <<<<<<<<<<<<<<
@@ -19018,7 +19475,7 @@ static CYTHON_INLINE PyArray_Descr *__pyx_f_5numpy_7ndarray_5descr_descr(PyArray
   PyArray_Descr *__pyx_t_1;
   __Pyx_RefNannySetupContext("descr", 1);
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":376
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":333
  *             """Returns an owned reference to the dtype of the array.
  *             """
  *             return <dtype>PyArray_DESCR(self)             # <<<<<<<<<<<<<<
@@ -19031,7 +19488,7 @@ static CYTHON_INLINE PyArray_Descr *__pyx_f_5numpy_7ndarray_5descr_descr(PyArray
   __pyx_r = ((PyArray_Descr *)__pyx_t_1);
   goto __pyx_L0;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":373
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":330
  * 
  *         @property
  *         cdef inline dtype descr(self):             # <<<<<<<<<<<<<<
@@ -19046,7 +19503,7 @@ static CYTHON_INLINE PyArray_Descr *__pyx_f_5numpy_7ndarray_5descr_descr(PyArray
   return __pyx_r;
 }
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":379
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":336
  * 
  *         @property
  *         cdef inline int ndim(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -19057,7 +19514,7 @@ static CYTHON_INLINE PyArray_Descr *__pyx_f_5numpy_7ndarray_5descr_descr(PyArray
 static CYTHON_INLINE int __pyx_f_5numpy_7ndarray_4ndim_ndim(PyArrayObject *__pyx_v_self) {
   int __pyx_r;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":382
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":339
  *             """Returns the number of dimensions in the array.
  *             """
  *             return PyArray_NDIM(self)             # <<<<<<<<<<<<<<
@@ -19067,7 +19524,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_7ndarray_4ndim_ndim(PyArrayObject *__pyx
   __pyx_r = PyArray_NDIM(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":379
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":336
  * 
  *         @property
  *         cdef inline int ndim(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -19080,7 +19537,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_7ndarray_4ndim_ndim(PyArrayObject *__pyx
   return __pyx_r;
 }
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":385
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":342
  * 
  *         @property
  *         cdef inline npy_intp *shape(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -19091,7 +19548,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_7ndarray_4ndim_ndim(PyArrayObject *__pyx
 static CYTHON_INLINE npy_intp *__pyx_f_5numpy_7ndarray_5shape_shape(PyArrayObject *__pyx_v_self) {
   npy_intp *__pyx_r;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":390
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":347
  *             Can return NULL for 0-dimensional arrays.
  *             """
  *             return PyArray_DIMS(self)             # <<<<<<<<<<<<<<
@@ -19101,7 +19558,7 @@ static CYTHON_INLINE npy_intp *__pyx_f_5numpy_7ndarray_5shape_shape(PyArrayObjec
   __pyx_r = PyArray_DIMS(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":385
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":342
  * 
  *         @property
  *         cdef inline npy_intp *shape(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -19114,7 +19571,7 @@ static CYTHON_INLINE npy_intp *__pyx_f_5numpy_7ndarray_5shape_shape(PyArrayObjec
   return __pyx_r;
 }
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":393
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":350
  * 
  *         @property
  *         cdef inline npy_intp *strides(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -19125,7 +19582,7 @@ static CYTHON_INLINE npy_intp *__pyx_f_5numpy_7ndarray_5shape_shape(PyArrayObjec
 static CYTHON_INLINE npy_intp *__pyx_f_5numpy_7ndarray_7strides_strides(PyArrayObject *__pyx_v_self) {
   npy_intp *__pyx_r;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":397
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":354
  *             The number of elements matches the number of dimensions of the array (ndim).
  *             """
  *             return PyArray_STRIDES(self)             # <<<<<<<<<<<<<<
@@ -19135,7 +19592,7 @@ static CYTHON_INLINE npy_intp *__pyx_f_5numpy_7ndarray_7strides_strides(PyArrayO
   __pyx_r = PyArray_STRIDES(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":393
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":350
  * 
  *         @property
  *         cdef inline npy_intp *strides(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -19148,7 +19605,7 @@ static CYTHON_INLINE npy_intp *__pyx_f_5numpy_7ndarray_7strides_strides(PyArrayO
   return __pyx_r;
 }
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":400
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":357
  * 
  *         @property
  *         cdef inline npy_intp size(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -19159,7 +19616,7 @@ static CYTHON_INLINE npy_intp *__pyx_f_5numpy_7ndarray_7strides_strides(PyArrayO
 static CYTHON_INLINE npy_intp __pyx_f_5numpy_7ndarray_4size_size(PyArrayObject *__pyx_v_self) {
   npy_intp __pyx_r;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":403
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":360
  *             """Returns the total size (in number of elements) of the array.
  *             """
  *             return PyArray_SIZE(self)             # <<<<<<<<<<<<<<
@@ -19169,7 +19626,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_7ndarray_4size_size(PyArrayObject *
   __pyx_r = PyArray_SIZE(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":400
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":357
  * 
  *         @property
  *         cdef inline npy_intp size(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -19182,7 +19639,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_7ndarray_4size_size(PyArrayObject *
   return __pyx_r;
 }
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":406
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":363
  * 
  *         @property
  *         cdef inline char* data(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -19193,7 +19650,7 @@ static CYTHON_INLINE npy_intp __pyx_f_5numpy_7ndarray_4size_size(PyArrayObject *
 static CYTHON_INLINE char *__pyx_f_5numpy_7ndarray_4data_data(PyArrayObject *__pyx_v_self) {
   char *__pyx_r;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":412
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":369
  *             of `PyArray_DATA()` instead, which returns a 'void*'.
  *             """
  *             return PyArray_BYTES(self)             # <<<<<<<<<<<<<<
@@ -19203,7 +19660,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy_7ndarray_4data_data(PyArrayObject *__p
   __pyx_r = PyArray_BYTES(__pyx_v_self);
   goto __pyx_L0;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":406
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":363
  * 
  *         @property
  *         cdef inline char* data(self) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -19216,7 +19673,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy_7ndarray_4data_data(PyArrayObject *__p
   return __pyx_r;
 }
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":824
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":777
  * ctypedef long double complex clongdouble_t
  * 
  * cdef inline object PyArray_MultiIterNew1(a):             # <<<<<<<<<<<<<<
@@ -19233,7 +19690,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew1(PyObject *__
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew1", 1);
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":825
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":778
  * 
  * cdef inline object PyArray_MultiIterNew1(a):
  *     return PyArray_MultiIterNew(1, <void*>a)             # <<<<<<<<<<<<<<
@@ -19241,13 +19698,13 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew1(PyObject *__
  * cdef inline object PyArray_MultiIterNew2(a, b):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyArray_MultiIterNew(1, ((void *)__pyx_v_a)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 825, __pyx_L1_error)
+  __pyx_t_1 = PyArray_MultiIterNew(1, ((void *)__pyx_v_a)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 778, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":824
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":777
  * ctypedef long double complex clongdouble_t
  * 
  * cdef inline object PyArray_MultiIterNew1(a):             # <<<<<<<<<<<<<<
@@ -19266,7 +19723,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew1(PyObject *__
   return __pyx_r;
 }
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":827
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":780
  *     return PyArray_MultiIterNew(1, <void*>a)
  * 
  * cdef inline object PyArray_MultiIterNew2(a, b):             # <<<<<<<<<<<<<<
@@ -19283,7 +19740,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew2(PyObject *__
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew2", 1);
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":828
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":781
  * 
  * cdef inline object PyArray_MultiIterNew2(a, b):
  *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)             # <<<<<<<<<<<<<<
@@ -19291,13 +19748,13 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew2(PyObject *__
  * cdef inline object PyArray_MultiIterNew3(a, b, c):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyArray_MultiIterNew(2, ((void *)__pyx_v_a), ((void *)__pyx_v_b)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 828, __pyx_L1_error)
+  __pyx_t_1 = PyArray_MultiIterNew(2, ((void *)__pyx_v_a), ((void *)__pyx_v_b)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 781, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":827
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":780
  *     return PyArray_MultiIterNew(1, <void*>a)
  * 
  * cdef inline object PyArray_MultiIterNew2(a, b):             # <<<<<<<<<<<<<<
@@ -19316,7 +19773,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew2(PyObject *__
   return __pyx_r;
 }
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":830
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":783
  *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
  * 
  * cdef inline object PyArray_MultiIterNew3(a, b, c):             # <<<<<<<<<<<<<<
@@ -19333,7 +19790,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew3(PyObject *__
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew3", 1);
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":831
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":784
  * 
  * cdef inline object PyArray_MultiIterNew3(a, b, c):
  *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)             # <<<<<<<<<<<<<<
@@ -19341,13 +19798,13 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew3(PyObject *__
  * cdef inline object PyArray_MultiIterNew4(a, b, c, d):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyArray_MultiIterNew(3, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 831, __pyx_L1_error)
+  __pyx_t_1 = PyArray_MultiIterNew(3, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 784, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":830
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":783
  *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
  * 
  * cdef inline object PyArray_MultiIterNew3(a, b, c):             # <<<<<<<<<<<<<<
@@ -19366,7 +19823,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew3(PyObject *__
   return __pyx_r;
 }
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":833
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":786
  *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
  * 
  * cdef inline object PyArray_MultiIterNew4(a, b, c, d):             # <<<<<<<<<<<<<<
@@ -19383,7 +19840,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew4(PyObject *__
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew4", 1);
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":834
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":787
  * 
  * cdef inline object PyArray_MultiIterNew4(a, b, c, d):
  *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)             # <<<<<<<<<<<<<<
@@ -19391,13 +19848,13 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew4(PyObject *__
  * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyArray_MultiIterNew(4, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c), ((void *)__pyx_v_d)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 834, __pyx_L1_error)
+  __pyx_t_1 = PyArray_MultiIterNew(4, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c), ((void *)__pyx_v_d)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 787, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":833
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":786
  *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
  * 
  * cdef inline object PyArray_MultiIterNew4(a, b, c, d):             # <<<<<<<<<<<<<<
@@ -19416,7 +19873,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew4(PyObject *__
   return __pyx_r;
 }
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":836
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":789
  *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
  * 
  * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):             # <<<<<<<<<<<<<<
@@ -19433,7 +19890,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew5(PyObject *__
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew5", 1);
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":837
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":790
  * 
  * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):
  *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)             # <<<<<<<<<<<<<<
@@ -19441,13 +19898,13 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew5(PyObject *__
  * cdef inline tuple PyDataType_SHAPE(dtype d):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyArray_MultiIterNew(5, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c), ((void *)__pyx_v_d), ((void *)__pyx_v_e)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 837, __pyx_L1_error)
+  __pyx_t_1 = PyArray_MultiIterNew(5, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c), ((void *)__pyx_v_d), ((void *)__pyx_v_e)); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 790, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":836
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":789
  *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
  * 
  * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):             # <<<<<<<<<<<<<<
@@ -19466,7 +19923,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew5(PyObject *__
   return __pyx_r;
 }
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":839
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":792
  *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
  * 
  * cdef inline tuple PyDataType_SHAPE(dtype d):             # <<<<<<<<<<<<<<
@@ -19481,7 +19938,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyDataType_SHAPE(PyArray_Descr *__
   PyObject *__pyx_t_2;
   __Pyx_RefNannySetupContext("PyDataType_SHAPE", 1);
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":840
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":793
  * 
  * cdef inline tuple PyDataType_SHAPE(dtype d):
  *     if PyDataType_HASSUBARRAY(d):             # <<<<<<<<<<<<<<
@@ -19491,7 +19948,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyDataType_SHAPE(PyArray_Descr *__
   __pyx_t_1 = PyDataType_HASSUBARRAY(__pyx_v_d);
   if (__pyx_t_1) {
 
-    /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":841
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":794
  * cdef inline tuple PyDataType_SHAPE(dtype d):
  *     if PyDataType_HASSUBARRAY(d):
  *         return <tuple>d.subarray.shape             # <<<<<<<<<<<<<<
@@ -19504,7 +19961,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyDataType_SHAPE(PyArray_Descr *__
     __pyx_r = ((PyObject*)__pyx_t_2);
     goto __pyx_L0;
 
-    /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":840
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":793
  * 
  * cdef inline tuple PyDataType_SHAPE(dtype d):
  *     if PyDataType_HASSUBARRAY(d):             # <<<<<<<<<<<<<<
@@ -19513,7 +19970,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyDataType_SHAPE(PyArray_Descr *__
  */
   }
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":843
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":796
  *         return <tuple>d.subarray.shape
  *     else:
  *         return ()             # <<<<<<<<<<<<<<
@@ -19527,7 +19984,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyDataType_SHAPE(PyArray_Descr *__
     goto __pyx_L0;
   }
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":839
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":792
  *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
  * 
  * cdef inline tuple PyDataType_SHAPE(dtype d):             # <<<<<<<<<<<<<<
@@ -19542,7 +19999,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyDataType_SHAPE(PyArray_Descr *__
   return __pyx_r;
 }
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1027
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":995
  *     int _import_umath() except -1
  * 
  * cdef inline void set_array_base(ndarray arr, object base) except *:             # <<<<<<<<<<<<<<
@@ -19556,7 +20013,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1028
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":996
  * 
  * cdef inline void set_array_base(ndarray arr, object base) except *:
  *     Py_INCREF(base) # important to do this before stealing the reference below!             # <<<<<<<<<<<<<<
@@ -19565,16 +20022,16 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
  */
   Py_INCREF(__pyx_v_base);
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1029
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":997
  * cdef inline void set_array_base(ndarray arr, object base) except *:
  *     Py_INCREF(base) # important to do this before stealing the reference below!
  *     PyArray_SetBaseObject(arr, base)             # <<<<<<<<<<<<<<
  * 
  * cdef inline object get_array_base(ndarray arr):
  */
-  __pyx_t_1 = PyArray_SetBaseObject(__pyx_v_arr, __pyx_v_base); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(2, 1029, __pyx_L1_error)
+  __pyx_t_1 = PyArray_SetBaseObject(__pyx_v_arr, __pyx_v_base); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(2, 997, __pyx_L1_error)
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1027
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":995
  *     int _import_umath() except -1
  * 
  * cdef inline void set_array_base(ndarray arr, object base) except *:             # <<<<<<<<<<<<<<
@@ -19589,7 +20046,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   __pyx_L0:;
 }
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1031
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":999
  *     PyArray_SetBaseObject(arr, base)
  * 
  * cdef inline object get_array_base(ndarray arr):             # <<<<<<<<<<<<<<
@@ -19604,7 +20061,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("get_array_base", 1);
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1032
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1000
  * 
  * cdef inline object get_array_base(ndarray arr):
  *     base = PyArray_BASE(arr)             # <<<<<<<<<<<<<<
@@ -19613,7 +20070,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
  */
   __pyx_v_base = PyArray_BASE(__pyx_v_arr);
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1033
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1001
  * cdef inline object get_array_base(ndarray arr):
  *     base = PyArray_BASE(arr)
  *     if base is NULL:             # <<<<<<<<<<<<<<
@@ -19623,7 +20080,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
   __pyx_t_1 = (__pyx_v_base == NULL);
   if (__pyx_t_1) {
 
-    /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1034
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1002
  *     base = PyArray_BASE(arr)
  *     if base is NULL:
  *         return None             # <<<<<<<<<<<<<<
@@ -19634,7 +20091,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
     __pyx_r = Py_None; __Pyx_INCREF(Py_None);
     goto __pyx_L0;
 
-    /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1033
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1001
  * cdef inline object get_array_base(ndarray arr):
  *     base = PyArray_BASE(arr)
  *     if base is NULL:             # <<<<<<<<<<<<<<
@@ -19643,7 +20100,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
  */
   }
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1035
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1003
  *     if base is NULL:
  *         return None
  *     return <object>base             # <<<<<<<<<<<<<<
@@ -19655,7 +20112,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
   __pyx_r = ((PyObject *)__pyx_v_base);
   goto __pyx_L0;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1031
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":999
  *     PyArray_SetBaseObject(arr, base)
  * 
  * cdef inline object get_array_base(ndarray arr):             # <<<<<<<<<<<<<<
@@ -19670,7 +20127,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
   return __pyx_r;
 }
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1039
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1007
  * # Versions of the import_* functions which are more suitable for
  * # Cython code.
  * cdef inline int import_array() except -1:             # <<<<<<<<<<<<<<
@@ -19694,7 +20151,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("import_array", 1);
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1040
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1008
  * # Cython code.
  * cdef inline int import_array() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -19710,16 +20167,16 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
     __Pyx_XGOTREF(__pyx_t_3);
     /*try:*/ {
 
-      /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1041
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1009
  * cdef inline int import_array() except -1:
  *     try:
  *         __pyx_import_array()             # <<<<<<<<<<<<<<
  *     except Exception:
  *         raise ImportError("numpy._core.multiarray failed to import")
  */
-      __pyx_t_4 = _import_array(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(2, 1041, __pyx_L3_error)
+      __pyx_t_4 = _import_array(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(2, 1009, __pyx_L3_error)
 
-      /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1040
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1008
  * # Cython code.
  * cdef inline int import_array() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -19733,7 +20190,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
     goto __pyx_L8_try_end;
     __pyx_L3_error:;
 
-    /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1042
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1010
  *     try:
  *         __pyx_import_array()
  *     except Exception:             # <<<<<<<<<<<<<<
@@ -19743,27 +20200,27 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
     __pyx_t_4 = __Pyx_PyErr_ExceptionMatches(((PyObject *)(&((PyTypeObject*)PyExc_Exception)[0])));
     if (__pyx_t_4) {
       __Pyx_AddTraceback("numpy.import_array", __pyx_clineno, __pyx_lineno, __pyx_filename);
-      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7) < 0) __PYX_ERR(2, 1042, __pyx_L5_except_error)
+      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7) < 0) __PYX_ERR(2, 1010, __pyx_L5_except_error)
       __Pyx_XGOTREF(__pyx_t_5);
       __Pyx_XGOTREF(__pyx_t_6);
       __Pyx_XGOTREF(__pyx_t_7);
 
-      /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1043
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1011
  *         __pyx_import_array()
  *     except Exception:
  *         raise ImportError("numpy._core.multiarray failed to import")             # <<<<<<<<<<<<<<
  * 
  * cdef inline int import_umath() except -1:
  */
-      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__9, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(2, 1043, __pyx_L5_except_error)
+      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__9, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(2, 1011, __pyx_L5_except_error)
       __Pyx_GOTREF(__pyx_t_8);
       __Pyx_Raise(__pyx_t_8, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-      __PYX_ERR(2, 1043, __pyx_L5_except_error)
+      __PYX_ERR(2, 1011, __pyx_L5_except_error)
     }
     goto __pyx_L5_except_error;
 
-    /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1040
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1008
  * # Cython code.
  * cdef inline int import_array() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -19779,7 +20236,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
     __pyx_L8_try_end:;
   }
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1039
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1007
  * # Versions of the import_* functions which are more suitable for
  * # Cython code.
  * cdef inline int import_array() except -1:             # <<<<<<<<<<<<<<
@@ -19802,7 +20259,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
   return __pyx_r;
 }
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1045
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1013
  *         raise ImportError("numpy._core.multiarray failed to import")
  * 
  * cdef inline int import_umath() except -1:             # <<<<<<<<<<<<<<
@@ -19826,7 +20283,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("import_umath", 1);
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1046
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1014
  * 
  * cdef inline int import_umath() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -19842,16 +20299,16 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
     __Pyx_XGOTREF(__pyx_t_3);
     /*try:*/ {
 
-      /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1047
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1015
  * cdef inline int import_umath() except -1:
  *     try:
  *         _import_umath()             # <<<<<<<<<<<<<<
  *     except Exception:
  *         raise ImportError("numpy._core.umath failed to import")
  */
-      __pyx_t_4 = _import_umath(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(2, 1047, __pyx_L3_error)
+      __pyx_t_4 = _import_umath(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(2, 1015, __pyx_L3_error)
 
-      /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1046
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1014
  * 
  * cdef inline int import_umath() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -19865,7 +20322,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
     goto __pyx_L8_try_end;
     __pyx_L3_error:;
 
-    /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1048
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1016
  *     try:
  *         _import_umath()
  *     except Exception:             # <<<<<<<<<<<<<<
@@ -19875,27 +20332,27 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
     __pyx_t_4 = __Pyx_PyErr_ExceptionMatches(((PyObject *)(&((PyTypeObject*)PyExc_Exception)[0])));
     if (__pyx_t_4) {
       __Pyx_AddTraceback("numpy.import_umath", __pyx_clineno, __pyx_lineno, __pyx_filename);
-      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7) < 0) __PYX_ERR(2, 1048, __pyx_L5_except_error)
+      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7) < 0) __PYX_ERR(2, 1016, __pyx_L5_except_error)
       __Pyx_XGOTREF(__pyx_t_5);
       __Pyx_XGOTREF(__pyx_t_6);
       __Pyx_XGOTREF(__pyx_t_7);
 
-      /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1049
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1017
  *         _import_umath()
  *     except Exception:
  *         raise ImportError("numpy._core.umath failed to import")             # <<<<<<<<<<<<<<
  * 
  * cdef inline int import_ufunc() except -1:
  */
-      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__10, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(2, 1049, __pyx_L5_except_error)
+      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__10, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(2, 1017, __pyx_L5_except_error)
       __Pyx_GOTREF(__pyx_t_8);
       __Pyx_Raise(__pyx_t_8, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-      __PYX_ERR(2, 1049, __pyx_L5_except_error)
+      __PYX_ERR(2, 1017, __pyx_L5_except_error)
     }
     goto __pyx_L5_except_error;
 
-    /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1046
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1014
  * 
  * cdef inline int import_umath() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -19911,7 +20368,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
     __pyx_L8_try_end:;
   }
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1045
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1013
  *         raise ImportError("numpy._core.multiarray failed to import")
  * 
  * cdef inline int import_umath() except -1:             # <<<<<<<<<<<<<<
@@ -19934,7 +20391,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
   return __pyx_r;
 }
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1051
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1019
  *         raise ImportError("numpy._core.umath failed to import")
  * 
  * cdef inline int import_ufunc() except -1:             # <<<<<<<<<<<<<<
@@ -19958,7 +20415,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("import_ufunc", 1);
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1052
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1020
  * 
  * cdef inline int import_ufunc() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -19974,16 +20431,16 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
     __Pyx_XGOTREF(__pyx_t_3);
     /*try:*/ {
 
-      /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1053
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1021
  * cdef inline int import_ufunc() except -1:
  *     try:
  *         _import_umath()             # <<<<<<<<<<<<<<
  *     except Exception:
  *         raise ImportError("numpy._core.umath failed to import")
  */
-      __pyx_t_4 = _import_umath(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(2, 1053, __pyx_L3_error)
+      __pyx_t_4 = _import_umath(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(2, 1021, __pyx_L3_error)
 
-      /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1052
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1020
  * 
  * cdef inline int import_ufunc() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -19997,7 +20454,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
     goto __pyx_L8_try_end;
     __pyx_L3_error:;
 
-    /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1054
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1022
  *     try:
  *         _import_umath()
  *     except Exception:             # <<<<<<<<<<<<<<
@@ -20007,27 +20464,27 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
     __pyx_t_4 = __Pyx_PyErr_ExceptionMatches(((PyObject *)(&((PyTypeObject*)PyExc_Exception)[0])));
     if (__pyx_t_4) {
       __Pyx_AddTraceback("numpy.import_ufunc", __pyx_clineno, __pyx_lineno, __pyx_filename);
-      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7) < 0) __PYX_ERR(2, 1054, __pyx_L5_except_error)
+      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7) < 0) __PYX_ERR(2, 1022, __pyx_L5_except_error)
       __Pyx_XGOTREF(__pyx_t_5);
       __Pyx_XGOTREF(__pyx_t_6);
       __Pyx_XGOTREF(__pyx_t_7);
 
-      /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1055
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1023
  *         _import_umath()
  *     except Exception:
  *         raise ImportError("numpy._core.umath failed to import")             # <<<<<<<<<<<<<<
  * 
  * 
  */
-      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__10, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(2, 1055, __pyx_L5_except_error)
+      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__10, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(2, 1023, __pyx_L5_except_error)
       __Pyx_GOTREF(__pyx_t_8);
       __Pyx_Raise(__pyx_t_8, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-      __PYX_ERR(2, 1055, __pyx_L5_except_error)
+      __PYX_ERR(2, 1023, __pyx_L5_except_error)
     }
     goto __pyx_L5_except_error;
 
-    /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1052
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1020
  * 
  * cdef inline int import_ufunc() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -20043,7 +20500,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
     __pyx_L8_try_end:;
   }
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1051
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1019
  *         raise ImportError("numpy._core.umath failed to import")
  * 
  * cdef inline int import_ufunc() except -1:             # <<<<<<<<<<<<<<
@@ -20066,7 +20523,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
   return __pyx_r;
 }
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1058
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1026
  * 
  * 
  * cdef inline bint is_timedelta64_object(object obj) noexcept:             # <<<<<<<<<<<<<<
@@ -20077,7 +20534,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
 static CYTHON_INLINE int __pyx_f_5numpy_is_timedelta64_object(PyObject *__pyx_v_obj) {
   int __pyx_r;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1070
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1038
  *     bool
  *     """
  *     return PyObject_TypeCheck(obj, &PyTimedeltaArrType_Type)             # <<<<<<<<<<<<<<
@@ -20087,7 +20544,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_is_timedelta64_object(PyObject *__pyx_v_
   __pyx_r = PyObject_TypeCheck(__pyx_v_obj, (&PyTimedeltaArrType_Type));
   goto __pyx_L0;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1058
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1026
  * 
  * 
  * cdef inline bint is_timedelta64_object(object obj) noexcept:             # <<<<<<<<<<<<<<
@@ -20100,7 +20557,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_is_timedelta64_object(PyObject *__pyx_v_
   return __pyx_r;
 }
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1073
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1041
  * 
  * 
  * cdef inline bint is_datetime64_object(object obj) noexcept:             # <<<<<<<<<<<<<<
@@ -20111,7 +20568,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_is_timedelta64_object(PyObject *__pyx_v_
 static CYTHON_INLINE int __pyx_f_5numpy_is_datetime64_object(PyObject *__pyx_v_obj) {
   int __pyx_r;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1085
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1053
  *     bool
  *     """
  *     return PyObject_TypeCheck(obj, &PyDatetimeArrType_Type)             # <<<<<<<<<<<<<<
@@ -20121,7 +20578,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_is_datetime64_object(PyObject *__pyx_v_o
   __pyx_r = PyObject_TypeCheck(__pyx_v_obj, (&PyDatetimeArrType_Type));
   goto __pyx_L0;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1073
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1041
  * 
  * 
  * cdef inline bint is_datetime64_object(object obj) noexcept:             # <<<<<<<<<<<<<<
@@ -20134,7 +20591,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_is_datetime64_object(PyObject *__pyx_v_o
   return __pyx_r;
 }
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1088
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1056
  * 
  * 
  * cdef inline npy_datetime get_datetime64_value(object obj) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -20145,7 +20602,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_is_datetime64_object(PyObject *__pyx_v_o
 static CYTHON_INLINE npy_datetime __pyx_f_5numpy_get_datetime64_value(PyObject *__pyx_v_obj) {
   npy_datetime __pyx_r;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1095
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1063
  *     also needed.  That can be found using `get_datetime64_unit`.
  *     """
  *     return (<PyDatetimeScalarObject*>obj).obval             # <<<<<<<<<<<<<<
@@ -20155,7 +20612,7 @@ static CYTHON_INLINE npy_datetime __pyx_f_5numpy_get_datetime64_value(PyObject *
   __pyx_r = ((PyDatetimeScalarObject *)__pyx_v_obj)->obval;
   goto __pyx_L0;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1088
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1056
  * 
  * 
  * cdef inline npy_datetime get_datetime64_value(object obj) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -20168,7 +20625,7 @@ static CYTHON_INLINE npy_datetime __pyx_f_5numpy_get_datetime64_value(PyObject *
   return __pyx_r;
 }
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1098
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1066
  * 
  * 
  * cdef inline npy_timedelta get_timedelta64_value(object obj) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -20179,7 +20636,7 @@ static CYTHON_INLINE npy_datetime __pyx_f_5numpy_get_datetime64_value(PyObject *
 static CYTHON_INLINE npy_timedelta __pyx_f_5numpy_get_timedelta64_value(PyObject *__pyx_v_obj) {
   npy_timedelta __pyx_r;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1102
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1070
  *     returns the int64 value underlying scalar numpy timedelta64 object
  *     """
  *     return (<PyTimedeltaScalarObject*>obj).obval             # <<<<<<<<<<<<<<
@@ -20189,7 +20646,7 @@ static CYTHON_INLINE npy_timedelta __pyx_f_5numpy_get_timedelta64_value(PyObject
   __pyx_r = ((PyTimedeltaScalarObject *)__pyx_v_obj)->obval;
   goto __pyx_L0;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1098
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1066
  * 
  * 
  * cdef inline npy_timedelta get_timedelta64_value(object obj) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -20202,7 +20659,7 @@ static CYTHON_INLINE npy_timedelta __pyx_f_5numpy_get_timedelta64_value(PyObject
   return __pyx_r;
 }
 
-/* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1105
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1073
  * 
  * 
  * cdef inline NPY_DATETIMEUNIT get_datetime64_unit(object obj) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -20213,7 +20670,7 @@ static CYTHON_INLINE npy_timedelta __pyx_f_5numpy_get_timedelta64_value(PyObject
 static CYTHON_INLINE NPY_DATETIMEUNIT __pyx_f_5numpy_get_datetime64_unit(PyObject *__pyx_v_obj) {
   NPY_DATETIMEUNIT __pyx_r;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1109
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1077
  *     returns the unit part of the dtype for a numpy datetime64 object.
  *     """
  *     return <NPY_DATETIMEUNIT>(<PyDatetimeScalarObject*>obj).obmeta.base             # <<<<<<<<<<<<<<
@@ -20223,7 +20680,7 @@ static CYTHON_INLINE NPY_DATETIMEUNIT __pyx_f_5numpy_get_datetime64_unit(PyObjec
   __pyx_r = ((NPY_DATETIMEUNIT)((PyDatetimeScalarObject *)__pyx_v_obj)->obmeta.base);
   goto __pyx_L0;
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1105
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1073
  * 
  * 
  * cdef inline NPY_DATETIMEUNIT get_datetime64_unit(object obj) noexcept nogil:             # <<<<<<<<<<<<<<
@@ -21170,66 +21627,779 @@ static CYTHON_INLINE void __pyx_f_7cpython_5array_zero(arrayobject *__pyx_v_self
   /* function exit code */
 }
 
-/* "pymica/methods/inverse_distance.pyx":18
+/* "pymica/methods/idw_power.pxd":22
+ * 
+ * 
+ * cdef inline IdwPower make_power(double power) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef IdwPower result
+ *     cdef double quarters = 2.0 * power
+ */
+
+static CYTHON_INLINE struct __pyx_t_6pymica_7methods_9idw_power_IdwPower __pyx_f_6pymica_7methods_9idw_power_make_power(double __pyx_v_power) {
+  struct __pyx_t_6pymica_7methods_9idw_power_IdwPower __pyx_v_result;
+  double __pyx_v_quarters;
+  struct __pyx_t_6pymica_7methods_9idw_power_IdwPower __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+
+  /* "pymica/methods/idw_power.pxd":24
+ * cdef inline IdwPower make_power(double power) noexcept nogil:
+ *     cdef IdwPower result
+ *     cdef double quarters = 2.0 * power             # <<<<<<<<<<<<<<
+ *     result.power = power
+ *     if 0 <= quarters <= 256 and quarters == floor(quarters):
+ */
+  __pyx_v_quarters = (2.0 * __pyx_v_power);
+
+  /* "pymica/methods/idw_power.pxd":25
+ *     cdef IdwPower result
+ *     cdef double quarters = 2.0 * power
+ *     result.power = power             # <<<<<<<<<<<<<<
+ *     if 0 <= quarters <= 256 and quarters == floor(quarters):
+ *         result.whole = <int> quarters // 4
+ */
+  __pyx_v_result.power = __pyx_v_power;
+
+  /* "pymica/methods/idw_power.pxd":26
+ *     cdef double quarters = 2.0 * power
+ *     result.power = power
+ *     if 0 <= quarters <= 256 and quarters == floor(quarters):             # <<<<<<<<<<<<<<
+ *         result.whole = <int> quarters // 4
+ *         result.quarters = <int> quarters % 4
+ */
+  __pyx_t_2 = (0.0 <= __pyx_v_quarters);
+  if (__pyx_t_2) {
+    __pyx_t_2 = (__pyx_v_quarters <= 256.0);
+  }
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_v_quarters == floor(__pyx_v_quarters));
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "pymica/methods/idw_power.pxd":27
+ *     result.power = power
+ *     if 0 <= quarters <= 256 and quarters == floor(quarters):
+ *         result.whole = <int> quarters // 4             # <<<<<<<<<<<<<<
+ *         result.quarters = <int> quarters % 4
+ *     else:
+ */
+    __pyx_v_result.whole = __Pyx_div_long(((int)__pyx_v_quarters), 4);
+
+    /* "pymica/methods/idw_power.pxd":28
+ *     if 0 <= quarters <= 256 and quarters == floor(quarters):
+ *         result.whole = <int> quarters // 4
+ *         result.quarters = <int> quarters % 4             # <<<<<<<<<<<<<<
+ *     else:
+ *         result.whole = -1
+ */
+    __pyx_v_result.quarters = __Pyx_mod_long(((int)__pyx_v_quarters), 4);
+
+    /* "pymica/methods/idw_power.pxd":26
+ *     cdef double quarters = 2.0 * power
+ *     result.power = power
+ *     if 0 <= quarters <= 256 and quarters == floor(quarters):             # <<<<<<<<<<<<<<
+ *         result.whole = <int> quarters // 4
+ *         result.quarters = <int> quarters % 4
+ */
+    goto __pyx_L3;
+  }
+
+  /* "pymica/methods/idw_power.pxd":30
+ *         result.quarters = <int> quarters % 4
+ *     else:
+ *         result.whole = -1             # <<<<<<<<<<<<<<
+ *         result.quarters = 0
+ *     return result
+ */
+  /*else*/ {
+    __pyx_v_result.whole = -1;
+
+    /* "pymica/methods/idw_power.pxd":31
+ *     else:
+ *         result.whole = -1
+ *         result.quarters = 0             # <<<<<<<<<<<<<<
+ *     return result
+ * 
+ */
+    __pyx_v_result.quarters = 0;
+  }
+  __pyx_L3:;
+
+  /* "pymica/methods/idw_power.pxd":32
+ *         result.whole = -1
+ *         result.quarters = 0
+ *     return result             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = __pyx_v_result;
+  goto __pyx_L0;
+
+  /* "pymica/methods/idw_power.pxd":22
+ * 
+ * 
+ * cdef inline IdwPower make_power(double power) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef IdwPower result
+ *     cdef double quarters = 2.0 * power
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "pymica/methods/idw_power.pxd":35
+ * 
+ * 
+ * cdef inline double station_weight(double dist_sq,             # <<<<<<<<<<<<<<
+ *                                   IdwPower power) noexcept nogil:
+ *     cdef double dist, result
+ */
+
+static CYTHON_INLINE double __pyx_f_6pymica_7methods_9idw_power_station_weight(double __pyx_v_dist_sq, struct __pyx_t_6pymica_7methods_9idw_power_IdwPower __pyx_v_power) {
+  double __pyx_v_dist;
+  double __pyx_v_result;
+  double __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  #ifdef WITH_THREAD
+  PyGILState_STATE __pyx_gilstate_save;
+  #endif
+
+  /* "pymica/methods/idw_power.pxd":38
+ *                                   IdwPower power) noexcept nogil:
+ *     cdef double dist, result
+ *     if power.whole == 1 and power.quarters == 0:             # <<<<<<<<<<<<<<
+ *         return 1.0 / dist_sq
+ *     if power.whole < 0:
+ */
+  __pyx_t_2 = (__pyx_v_power.whole == 1);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_v_power.quarters == 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "pymica/methods/idw_power.pxd":39
+ *     cdef double dist, result
+ *     if power.whole == 1 and power.quarters == 0:
+ *         return 1.0 / dist_sq             # <<<<<<<<<<<<<<
+ *     if power.whole < 0:
+ *         return exp(-0.5 * power.power * log(dist_sq))
+ */
+    if (unlikely(__pyx_v_dist_sq == 0)) {
+      #ifdef WITH_THREAD
+      PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+      #endif
+      PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+      #ifdef WITH_THREAD
+      __Pyx_PyGILState_Release(__pyx_gilstate_save);
+      #endif
+      __PYX_ERR(5, 39, __pyx_L1_error)
+    }
+    __pyx_r = (1.0 / __pyx_v_dist_sq);
+    goto __pyx_L0;
+
+    /* "pymica/methods/idw_power.pxd":38
+ *                                   IdwPower power) noexcept nogil:
+ *     cdef double dist, result
+ *     if power.whole == 1 and power.quarters == 0:             # <<<<<<<<<<<<<<
+ *         return 1.0 / dist_sq
+ *     if power.whole < 0:
+ */
+  }
+
+  /* "pymica/methods/idw_power.pxd":40
+ *     if power.whole == 1 and power.quarters == 0:
+ *         return 1.0 / dist_sq
+ *     if power.whole < 0:             # <<<<<<<<<<<<<<
+ *         return exp(-0.5 * power.power * log(dist_sq))
+ * 
+ */
+  __pyx_t_1 = (__pyx_v_power.whole < 0);
+  if (__pyx_t_1) {
+
+    /* "pymica/methods/idw_power.pxd":41
+ *         return 1.0 / dist_sq
+ *     if power.whole < 0:
+ *         return exp(-0.5 * power.power * log(dist_sq))             # <<<<<<<<<<<<<<
+ * 
+ *     result = fast_pow(dist_sq, power.whole)
+ */
+    __pyx_r = exp(((-0.5 * __pyx_v_power.power) * log(__pyx_v_dist_sq)));
+    goto __pyx_L0;
+
+    /* "pymica/methods/idw_power.pxd":40
+ *     if power.whole == 1 and power.quarters == 0:
+ *         return 1.0 / dist_sq
+ *     if power.whole < 0:             # <<<<<<<<<<<<<<
+ *         return exp(-0.5 * power.power * log(dist_sq))
+ * 
+ */
+  }
+
+  /* "pymica/methods/idw_power.pxd":43
+ *         return exp(-0.5 * power.power * log(dist_sq))
+ * 
+ *     result = fast_pow(dist_sq, power.whole)             # <<<<<<<<<<<<<<
+ *     if power.quarters == 1:
+ *         result *= sqrt(sqrt(dist_sq))
+ */
+  __pyx_v_result = __pyx_f_6pymica_7methods_9idw_power_fast_pow(__pyx_v_dist_sq, __pyx_v_power.whole);
+
+  /* "pymica/methods/idw_power.pxd":44
+ * 
+ *     result = fast_pow(dist_sq, power.whole)
+ *     if power.quarters == 1:             # <<<<<<<<<<<<<<
+ *         result *= sqrt(sqrt(dist_sq))
+ *     elif power.quarters == 2:
+ */
+  switch (__pyx_v_power.quarters) {
+    case 1:
+
+    /* "pymica/methods/idw_power.pxd":45
+ *     result = fast_pow(dist_sq, power.whole)
+ *     if power.quarters == 1:
+ *         result *= sqrt(sqrt(dist_sq))             # <<<<<<<<<<<<<<
+ *     elif power.quarters == 2:
+ *         result *= sqrt(dist_sq)
+ */
+    __pyx_v_result = (__pyx_v_result * sqrt(sqrt(__pyx_v_dist_sq)));
+
+    /* "pymica/methods/idw_power.pxd":44
+ * 
+ *     result = fast_pow(dist_sq, power.whole)
+ *     if power.quarters == 1:             # <<<<<<<<<<<<<<
+ *         result *= sqrt(sqrt(dist_sq))
+ *     elif power.quarters == 2:
+ */
+    break;
+    case 2:
+
+    /* "pymica/methods/idw_power.pxd":47
+ *         result *= sqrt(sqrt(dist_sq))
+ *     elif power.quarters == 2:
+ *         result *= sqrt(dist_sq)             # <<<<<<<<<<<<<<
+ *     elif power.quarters == 3:
+ *         dist = sqrt(dist_sq)
+ */
+    __pyx_v_result = (__pyx_v_result * sqrt(__pyx_v_dist_sq));
+
+    /* "pymica/methods/idw_power.pxd":46
+ *     if power.quarters == 1:
+ *         result *= sqrt(sqrt(dist_sq))
+ *     elif power.quarters == 2:             # <<<<<<<<<<<<<<
+ *         result *= sqrt(dist_sq)
+ *     elif power.quarters == 3:
+ */
+    break;
+    case 3:
+
+    /* "pymica/methods/idw_power.pxd":49
+ *         result *= sqrt(dist_sq)
+ *     elif power.quarters == 3:
+ *         dist = sqrt(dist_sq)             # <<<<<<<<<<<<<<
+ *         result *= dist * sqrt(dist)
+ *     return 1.0 / result
+ */
+    __pyx_v_dist = sqrt(__pyx_v_dist_sq);
+
+    /* "pymica/methods/idw_power.pxd":50
+ *     elif power.quarters == 3:
+ *         dist = sqrt(dist_sq)
+ *         result *= dist * sqrt(dist)             # <<<<<<<<<<<<<<
+ *     return 1.0 / result
+ * 
+ */
+    __pyx_v_result = (__pyx_v_result * (__pyx_v_dist * sqrt(__pyx_v_dist)));
+
+    /* "pymica/methods/idw_power.pxd":48
+ *     elif power.quarters == 2:
+ *         result *= sqrt(dist_sq)
+ *     elif power.quarters == 3:             # <<<<<<<<<<<<<<
+ *         dist = sqrt(dist_sq)
+ *         result *= dist * sqrt(dist)
+ */
+    break;
+    default: break;
+  }
+
+  /* "pymica/methods/idw_power.pxd":51
+ *         dist = sqrt(dist_sq)
+ *         result *= dist * sqrt(dist)
+ *     return 1.0 / result             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  if (unlikely(__pyx_v_result == 0)) {
+    #ifdef WITH_THREAD
+    PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+    #endif
+    PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+    #ifdef WITH_THREAD
+    __Pyx_PyGILState_Release(__pyx_gilstate_save);
+    #endif
+    __PYX_ERR(5, 51, __pyx_L1_error)
+  }
+  __pyx_r = (1.0 / __pyx_v_result);
+  goto __pyx_L0;
+
+  /* "pymica/methods/idw_power.pxd":35
+ * 
+ * 
+ * cdef inline double station_weight(double dist_sq,             # <<<<<<<<<<<<<<
+ *                                   IdwPower power) noexcept nogil:
+ *     cdef double dist, result
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  #ifdef WITH_THREAD
+  __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+  #endif
+  __Pyx_WriteUnraisable("pymica.methods.idw_power.station_weight", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __pyx_r = 0;
+  #ifdef WITH_THREAD
+  __Pyx_PyGILState_Release(__pyx_gilstate_save);
+  #endif
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "pymica/methods/idw_power.pxd":54
+ * 
+ * 
+ * cdef inline float station_weight32(float dist_sq,             # <<<<<<<<<<<<<<
+ *                                    IdwPower power) noexcept nogil:
+ *     """station_weight in float32."""
+ */
+
+static CYTHON_INLINE float __pyx_f_6pymica_7methods_9idw_power_station_weight32(float __pyx_v_dist_sq, struct __pyx_t_6pymica_7methods_9idw_power_IdwPower __pyx_v_power) {
+  float __pyx_v_one;
+  float __pyx_v_dist;
+  float __pyx_v_result;
+  CYTHON_UNUSED int __pyx_v_k;
+  float __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  #ifdef WITH_THREAD
+  PyGILState_STATE __pyx_gilstate_save;
+  #endif
+
+  /* "pymica/methods/idw_power.pxd":57
+ *                                    IdwPower power) noexcept nogil:
+ *     """station_weight in float32."""
+ *     cdef float one = 1.0             # <<<<<<<<<<<<<<
+ *     cdef float dist, result
+ *     cdef int k
+ */
+  __pyx_v_one = 1.0;
+
+  /* "pymica/methods/idw_power.pxd":60
+ *     cdef float dist, result
+ *     cdef int k
+ *     if power.whole < 0:             # <<<<<<<<<<<<<<
+ *         return expf(<float> (-0.5 * power.power) * logf(dist_sq))
+ * 
+ */
+  __pyx_t_1 = (__pyx_v_power.whole < 0);
+  if (__pyx_t_1) {
+
+    /* "pymica/methods/idw_power.pxd":61
+ *     cdef int k
+ *     if power.whole < 0:
+ *         return expf(<float> (-0.5 * power.power) * logf(dist_sq))             # <<<<<<<<<<<<<<
+ * 
+ *     result = one
+ */
+    __pyx_r = expf((((float)(-0.5 * __pyx_v_power.power)) * logf(__pyx_v_dist_sq)));
+    goto __pyx_L0;
+
+    /* "pymica/methods/idw_power.pxd":60
+ *     cdef float dist, result
+ *     cdef int k
+ *     if power.whole < 0:             # <<<<<<<<<<<<<<
+ *         return expf(<float> (-0.5 * power.power) * logf(dist_sq))
+ * 
+ */
+  }
+
+  /* "pymica/methods/idw_power.pxd":63
+ *         return expf(<float> (-0.5 * power.power) * logf(dist_sq))
+ * 
+ *     result = one             # <<<<<<<<<<<<<<
+ *     for k in range(power.whole):
+ *         result = result * dist_sq
+ */
+  __pyx_v_result = __pyx_v_one;
+
+  /* "pymica/methods/idw_power.pxd":64
+ * 
+ *     result = one
+ *     for k in range(power.whole):             # <<<<<<<<<<<<<<
+ *         result = result * dist_sq
+ *     if power.quarters == 1:
+ */
+  __pyx_t_2 = __pyx_v_power.whole;
+  __pyx_t_3 = __pyx_t_2;
+  for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+    __pyx_v_k = __pyx_t_4;
+
+    /* "pymica/methods/idw_power.pxd":65
+ *     result = one
+ *     for k in range(power.whole):
+ *         result = result * dist_sq             # <<<<<<<<<<<<<<
+ *     if power.quarters == 1:
+ *         result = result * sqrtf(sqrtf(dist_sq))
+ */
+    __pyx_v_result = (__pyx_v_result * __pyx_v_dist_sq);
+  }
+
+  /* "pymica/methods/idw_power.pxd":66
+ *     for k in range(power.whole):
+ *         result = result * dist_sq
+ *     if power.quarters == 1:             # <<<<<<<<<<<<<<
+ *         result = result * sqrtf(sqrtf(dist_sq))
+ *     elif power.quarters == 2:
+ */
+  switch (__pyx_v_power.quarters) {
+    case 1:
+
+    /* "pymica/methods/idw_power.pxd":67
+ *         result = result * dist_sq
+ *     if power.quarters == 1:
+ *         result = result * sqrtf(sqrtf(dist_sq))             # <<<<<<<<<<<<<<
+ *     elif power.quarters == 2:
+ *         result = result * sqrtf(dist_sq)
+ */
+    __pyx_v_result = (__pyx_v_result * sqrtf(sqrtf(__pyx_v_dist_sq)));
+
+    /* "pymica/methods/idw_power.pxd":66
+ *     for k in range(power.whole):
+ *         result = result * dist_sq
+ *     if power.quarters == 1:             # <<<<<<<<<<<<<<
+ *         result = result * sqrtf(sqrtf(dist_sq))
+ *     elif power.quarters == 2:
+ */
+    break;
+    case 2:
+
+    /* "pymica/methods/idw_power.pxd":69
+ *         result = result * sqrtf(sqrtf(dist_sq))
+ *     elif power.quarters == 2:
+ *         result = result * sqrtf(dist_sq)             # <<<<<<<<<<<<<<
+ *     elif power.quarters == 3:
+ *         dist = sqrtf(dist_sq)
+ */
+    __pyx_v_result = (__pyx_v_result * sqrtf(__pyx_v_dist_sq));
+
+    /* "pymica/methods/idw_power.pxd":68
+ *     if power.quarters == 1:
+ *         result = result * sqrtf(sqrtf(dist_sq))
+ *     elif power.quarters == 2:             # <<<<<<<<<<<<<<
+ *         result = result * sqrtf(dist_sq)
+ *     elif power.quarters == 3:
+ */
+    break;
+    case 3:
+
+    /* "pymica/methods/idw_power.pxd":71
+ *         result = result * sqrtf(dist_sq)
+ *     elif power.quarters == 3:
+ *         dist = sqrtf(dist_sq)             # <<<<<<<<<<<<<<
+ *         result = result * dist * sqrtf(dist)
+ *     return one / result
+ */
+    __pyx_v_dist = sqrtf(__pyx_v_dist_sq);
+
+    /* "pymica/methods/idw_power.pxd":72
+ *     elif power.quarters == 3:
+ *         dist = sqrtf(dist_sq)
+ *         result = result * dist * sqrtf(dist)             # <<<<<<<<<<<<<<
+ *     return one / result
+ * 
+ */
+    __pyx_v_result = ((__pyx_v_result * __pyx_v_dist) * sqrtf(__pyx_v_dist));
+
+    /* "pymica/methods/idw_power.pxd":70
+ *     elif power.quarters == 2:
+ *         result = result * sqrtf(dist_sq)
+ *     elif power.quarters == 3:             # <<<<<<<<<<<<<<
+ *         dist = sqrtf(dist_sq)
+ *         result = result * dist * sqrtf(dist)
+ */
+    break;
+    default: break;
+  }
+
+  /* "pymica/methods/idw_power.pxd":73
+ *         dist = sqrtf(dist_sq)
+ *         result = result * dist * sqrtf(dist)
+ *     return one / result             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  if (unlikely(__pyx_v_result == 0)) {
+    #ifdef WITH_THREAD
+    PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+    #endif
+    PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+    #ifdef WITH_THREAD
+    __Pyx_PyGILState_Release(__pyx_gilstate_save);
+    #endif
+    __PYX_ERR(5, 73, __pyx_L1_error)
+  }
+  __pyx_r = (__pyx_v_one / __pyx_v_result);
+  goto __pyx_L0;
+
+  /* "pymica/methods/idw_power.pxd":54
+ * 
+ * 
+ * cdef inline float station_weight32(float dist_sq,             # <<<<<<<<<<<<<<
+ *                                    IdwPower power) noexcept nogil:
+ *     """station_weight in float32."""
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  #ifdef WITH_THREAD
+  __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+  #endif
+  __Pyx_WriteUnraisable("pymica.methods.idw_power.station_weight32", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __pyx_r = 0;
+  #ifdef WITH_THREAD
+  __Pyx_PyGILState_Release(__pyx_gilstate_save);
+  #endif
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "pymica/methods/idw_power.pxd":76
+ * 
+ * 
+ * cdef inline double fast_pow(double base, int exp) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef double result = 1.0
+ *     while exp > 0:
+ */
+
+static CYTHON_INLINE double __pyx_f_6pymica_7methods_9idw_power_fast_pow(double __pyx_v_base, int __pyx_v_exp) {
+  double __pyx_v_result;
+  double __pyx_r;
+  int __pyx_t_1;
+
+  /* "pymica/methods/idw_power.pxd":77
+ * 
+ * cdef inline double fast_pow(double base, int exp) noexcept nogil:
+ *     cdef double result = 1.0             # <<<<<<<<<<<<<<
+ *     while exp > 0:
+ *         if exp & 1:
+ */
+  __pyx_v_result = 1.0;
+
+  /* "pymica/methods/idw_power.pxd":78
+ * cdef inline double fast_pow(double base, int exp) noexcept nogil:
+ *     cdef double result = 1.0
+ *     while exp > 0:             # <<<<<<<<<<<<<<
+ *         if exp & 1:
+ *             result *= base
+ */
+  while (1) {
+    __pyx_t_1 = (__pyx_v_exp > 0);
+    if (!__pyx_t_1) break;
+
+    /* "pymica/methods/idw_power.pxd":79
+ *     cdef double result = 1.0
+ *     while exp > 0:
+ *         if exp & 1:             # <<<<<<<<<<<<<<
+ *             result *= base
+ *         base *= base
+ */
+    __pyx_t_1 = ((__pyx_v_exp & 1) != 0);
+    if (__pyx_t_1) {
+
+      /* "pymica/methods/idw_power.pxd":80
+ *     while exp > 0:
+ *         if exp & 1:
+ *             result *= base             # <<<<<<<<<<<<<<
+ *         base *= base
+ *         exp >>= 1
+ */
+      __pyx_v_result = (__pyx_v_result * __pyx_v_base);
+
+      /* "pymica/methods/idw_power.pxd":79
+ *     cdef double result = 1.0
+ *     while exp > 0:
+ *         if exp & 1:             # <<<<<<<<<<<<<<
+ *             result *= base
+ *         base *= base
+ */
+    }
+
+    /* "pymica/methods/idw_power.pxd":81
+ *         if exp & 1:
+ *             result *= base
+ *         base *= base             # <<<<<<<<<<<<<<
+ *         exp >>= 1
+ *     return result
+ */
+    __pyx_v_base = (__pyx_v_base * __pyx_v_base);
+
+    /* "pymica/methods/idw_power.pxd":82
+ *             result *= base
+ *         base *= base
+ *         exp >>= 1             # <<<<<<<<<<<<<<
+ *     return result
+ */
+    __pyx_v_exp = (__pyx_v_exp >> 1);
+  }
+
+  /* "pymica/methods/idw_power.pxd":83
+ *         base *= base
+ *         exp >>= 1
+ *     return result             # <<<<<<<<<<<<<<
+ */
+  __pyx_r = __pyx_v_result;
+  goto __pyx_L0;
+
+  /* "pymica/methods/idw_power.pxd":76
+ * 
+ * 
+ * cdef inline double fast_pow(double base, int exp) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef double result = 1.0
+ *     while exp > 0:
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "pymica/methods/inverse_distance.pyx":28
  * ctypedef np.float64_t DTYPE_t
  * 
- * def inverse_distance(data: List[Dict[str, float]],             # <<<<<<<<<<<<<<
+ * def inverse_distance(data: Union[List[Dict[str, float]], np.ndarray],             # <<<<<<<<<<<<<<
  *                      size: List[int], geotransform: List[int],
- *                      power: int=2, smoothing: float=0.0):
+ *                      power: float=2, smoothing: float=0.0, int num_threads=1,
  */
 
-static PyObject *__pyx_pf_6pymica_7methods_16inverse_distance_2__defaults__(CYTHON_UNUSED PyObject *__pyx_self) {
+static PyObject *__pyx_pf_6pymica_7methods_16inverse_distance_6__defaults__(CYTHON_UNUSED PyObject *__pyx_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__defaults__", 1);
   __Pyx_XDECREF(__pyx_r);
 
-  /* "pymica/methods/inverse_distance.pyx":20
- * def inverse_distance(data: List[Dict[str, float]],
+  /* "pymica/methods/inverse_distance.pyx":30
+ * def inverse_distance(data: Union[List[Dict[str, float]], np.ndarray],
  *                      size: List[int], geotransform: List[int],
- *                      power: int=2, smoothing: float=0.0):             # <<<<<<<<<<<<<<
- *     """
- *     inverse_distance(data, size, geotransform)
+ *                      power: float=2, smoothing: float=0.0, int num_threads=1,             # <<<<<<<<<<<<<<
+ *                      int k_nearest=0, double max_radius=0.0, out=None,
+ *                      mask=None, double nodata=np.nan, precision='float64'):
  */
-  __pyx_t_1 = PyFloat_FromDouble(((double)0.0)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 20, __pyx_L1_error)
+  __pyx_t_1 = PyFloat_FromDouble(((double)2.0)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 30, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyFloat_FromDouble(((double)0.0)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 30, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyInt_From_int(((int)1)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 30, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
 
-  /* "pymica/methods/inverse_distance.pyx":18
+  /* "pymica/methods/inverse_distance.pyx":31
+ *                      size: List[int], geotransform: List[int],
+ *                      power: float=2, smoothing: float=0.0, int num_threads=1,
+ *                      int k_nearest=0, double max_radius=0.0, out=None,             # <<<<<<<<<<<<<<
+ *                      mask=None, double nodata=np.nan, precision='float64'):
+ *     """
+ */
+  __pyx_t_4 = __Pyx_PyInt_From_int(((int)0)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 31, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = PyFloat_FromDouble(((double)0.0)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 31, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+
+  /* "pymica/methods/inverse_distance.pyx":28
  * ctypedef np.float64_t DTYPE_t
  * 
- * def inverse_distance(data: List[Dict[str, float]],             # <<<<<<<<<<<<<<
+ * def inverse_distance(data: Union[List[Dict[str, float]], np.ndarray],             # <<<<<<<<<<<<<<
  *                      size: List[int], geotransform: List[int],
- *                      power: int=2, smoothing: float=0.0):
+ *                      power: float=2, smoothing: float=0.0, int num_threads=1,
  */
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 18, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_INCREF(__Pyx_CyFunction_Defaults(__pyx_defaults, __pyx_self)->__pyx_arg_power);
-  __Pyx_GIVEREF(__Pyx_CyFunction_Defaults(__pyx_defaults, __pyx_self)->__pyx_arg_power);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, __Pyx_CyFunction_Defaults(__pyx_defaults, __pyx_self)->__pyx_arg_power)) __PYX_ERR(0, 18, __pyx_L1_error);
+  __pyx_t_6 = PyFloat_FromDouble(__Pyx_CyFunction_Defaults(__pyx_defaults, __pyx_self)->__pyx_arg_nodata); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 28, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_7 = PyTuple_New(9); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 28, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
   __Pyx_GIVEREF(__pyx_t_1);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_1)) __PYX_ERR(0, 18, __pyx_L1_error);
-  __pyx_t_1 = 0;
-  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 18, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_1)) __PYX_ERR(0, 28, __pyx_L1_error);
   __Pyx_GIVEREF(__pyx_t_2);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_2)) __PYX_ERR(0, 18, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 1, __pyx_t_2)) __PYX_ERR(0, 28, __pyx_L1_error);
+  __Pyx_GIVEREF(__pyx_t_3);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 2, __pyx_t_3)) __PYX_ERR(0, 28, __pyx_L1_error);
+  __Pyx_GIVEREF(__pyx_t_4);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 3, __pyx_t_4)) __PYX_ERR(0, 28, __pyx_L1_error);
+  __Pyx_GIVEREF(__pyx_t_5);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 4, __pyx_t_5)) __PYX_ERR(0, 28, __pyx_L1_error);
   __Pyx_INCREF(Py_None);
   __Pyx_GIVEREF(Py_None);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 1, Py_None)) __PYX_ERR(0, 18, __pyx_L1_error);
-  __pyx_t_2 = 0;
-  __pyx_r = __pyx_t_1;
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 5, Py_None)) __PYX_ERR(0, 28, __pyx_L1_error);
+  __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(Py_None);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 6, Py_None)) __PYX_ERR(0, 28, __pyx_L1_error);
+  __Pyx_GIVEREF(__pyx_t_6);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 7, __pyx_t_6)) __PYX_ERR(0, 28, __pyx_L1_error);
+  __Pyx_INCREF(((PyObject*)__pyx_n_s_float64));
+  __Pyx_GIVEREF(((PyObject*)__pyx_n_s_float64));
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 8, ((PyObject*)__pyx_n_s_float64))) __PYX_ERR(0, 28, __pyx_L1_error);
   __pyx_t_1 = 0;
+  __pyx_t_2 = 0;
+  __pyx_t_3 = 0;
+  __pyx_t_4 = 0;
+  __pyx_t_5 = 0;
+  __pyx_t_6 = 0;
+  __pyx_t_6 = PyTuple_New(2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 28, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_GIVEREF(__pyx_t_7);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_7)) __PYX_ERR(0, 28, __pyx_L1_error);
+  __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(Py_None);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_6, 1, Py_None)) __PYX_ERR(0, 28, __pyx_L1_error);
+  __pyx_t_7 = 0;
+  __pyx_r = __pyx_t_6;
+  __pyx_t_6 = 0;
   goto __pyx_L0;
 
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
   __Pyx_AddTraceback("pymica.methods.inverse_distance.__defaults__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
@@ -21246,7 +22416,7 @@ PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-PyDoc_STRVAR(__pyx_doc_6pymica_7methods_16inverse_distance_inverse_distance, "\n    inverse_distance(data, size, geotransform)\n\n    Interpolates the data field using the inverse of the distance method\n    \n    Args:\n        data (dict): The data dict\n        size (list): x X y\n        geotransform (list): The geotransform to apply to relate the data coordinates\n                             and the position in the matrix.\n                             See https://www.gdal.org/gdal_datamodel.html for more information\n\n    Returns:\n        list: The interpolated data\n    ");
+PyDoc_STRVAR(__pyx_doc_6pymica_7methods_16inverse_distance_inverse_distance, "\n    inverse_distance(data, size, geotransform)\n\n    Interpolates the data field using the inverse of the distance method\n    \n    Args:\n        data (dict): The data dict. A structured array with the x, y and value\n                     fields is also accepted.\n        size (list): x X y\n        geotransform (list): The geotransform to apply to relate the data coordinates\n                             and the position in the matrix.\n                             See https://www.gdal.org/gdal_datamodel.html for more information\n        power (float): The power of the distance in the weights. Any real\n                       value is accepted, multiples of 0.5 are the fastest.\n                       Defaults to 2.\n        smoothing (float): Smoothing distance added to the distances.\n                           Defaults to 0.\n        num_threads (int): Number of OpenMP threads used to compute the rows of\n                           the field. 1 runs serially, 0 or less uses all the\n                           available cores. The result does not depend on it.\n        k_nearest (int): If greater than 0, only the k nearest stations to each\n                         point are used. Defaults to 0, all the stations.\n        max_radius (float): If greater than 0, only the stations closer than\n                            max_radius to each point are used. Points without\n                            any station in the radius are set to 0.\n                            Defaults to 0, no limit.\n        out (np.array): Optional C-contiguous float32 or float64 array with\n                        shape `size` where the field is written. Defaults to\n                        None, a new float64 array.\n        mask (np.array): Optional 2-D array with shape `size`. Only the pixels\n                         where it is not 0 are interpolated. Defaults to None,\n                         all the pixels.\n        nodata (float): Value of the masked pixels. Defaults to NaN.""\n        precision (str): 'float64' or 'float32', the precision of the weights\n                         when all the stations are used. The float32 kernel\n                         computes twice as many weights per vector\n                         instruction, with a relative error around 1e-6. The\n                         neighbour search with k_nearest or max_radius always\n                         works in float64. Defaults to 'float64'.\n\n    Returns:\n        np.array: The interpolated data, `out` if it was provided\n    ");
 static PyMethodDef __pyx_mdef_6pymica_7methods_16inverse_distance_1inverse_distance = {"inverse_distance", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_6pymica_7methods_16inverse_distance_1inverse_distance, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_6pymica_7methods_16inverse_distance_inverse_distance};
 static PyObject *__pyx_pw_6pymica_7methods_16inverse_distance_1inverse_distance(PyObject *__pyx_self, 
 #if CYTHON_METH_FASTCALL
@@ -21258,13 +22428,20 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   PyObject *__pyx_v_data = 0;
   PyObject *__pyx_v_size = 0;
   PyObject *__pyx_v_geotransform = 0;
-  PyObject *__pyx_v_power = 0;
+  double __pyx_v_power;
   double __pyx_v_smoothing;
+  int __pyx_v_num_threads;
+  int __pyx_v_k_nearest;
+  double __pyx_v_max_radius;
+  PyObject *__pyx_v_out = 0;
+  PyObject *__pyx_v_mask = 0;
+  double __pyx_v_nodata;
+  PyObject *__pyx_v_precision = 0;
   #if !CYTHON_METH_FASTCALL
   CYTHON_UNUSED Py_ssize_t __pyx_nargs;
   #endif
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[5] = {0,0,0,0,0};
+  PyObject* values[12] = {0,0,0,0,0,0,0,0,0,0,0,0};
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -21280,12 +22457,44 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   #endif
   __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
   {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_data,&__pyx_n_s_size,&__pyx_n_s_geotransform,&__pyx_n_s_power,&__pyx_n_s_smoothing,0};
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_data,&__pyx_n_s_size,&__pyx_n_s_geotransform,&__pyx_n_s_power,&__pyx_n_s_smoothing,&__pyx_n_s_num_threads,&__pyx_n_s_k_nearest,&__pyx_n_s_max_radius,&__pyx_n_s_out,&__pyx_n_s_mask,&__pyx_n_s_nodata,&__pyx_n_s_precision,0};
     __pyx_defaults *__pyx_dynamic_args = __Pyx_CyFunction_Defaults(__pyx_defaults, __pyx_self);
-    values[3] = __Pyx_Arg_NewRef_FASTCALL(__pyx_dynamic_args->__pyx_arg_power);
+
+    /* "pymica/methods/inverse_distance.pyx":31
+ *                      size: List[int], geotransform: List[int],
+ *                      power: float=2, smoothing: float=0.0, int num_threads=1,
+ *                      int k_nearest=0, double max_radius=0.0, out=None,             # <<<<<<<<<<<<<<
+ *                      mask=None, double nodata=np.nan, precision='float64'):
+ *     """
+ */
+    values[8] = __Pyx_Arg_NewRef_FASTCALL(((PyObject *)Py_None));
+
+    /* "pymica/methods/inverse_distance.pyx":32
+ *                      power: float=2, smoothing: float=0.0, int num_threads=1,
+ *                      int k_nearest=0, double max_radius=0.0, out=None,
+ *                      mask=None, double nodata=np.nan, precision='float64'):             # <<<<<<<<<<<<<<
+ *     """
+ *     inverse_distance(data, size, geotransform)
+ */
+    values[9] = __Pyx_Arg_NewRef_FASTCALL(((PyObject *)Py_None));
+    values[11] = __Pyx_Arg_NewRef_FASTCALL(((PyObject *)((PyObject*)__pyx_n_s_float64)));
     if (__pyx_kwds) {
       Py_ssize_t kw_args;
       switch (__pyx_nargs) {
+        case 12: values[11] = __Pyx_Arg_FASTCALL(__pyx_args, 11);
+        CYTHON_FALLTHROUGH;
+        case 11: values[10] = __Pyx_Arg_FASTCALL(__pyx_args, 10);
+        CYTHON_FALLTHROUGH;
+        case 10: values[9] = __Pyx_Arg_FASTCALL(__pyx_args, 9);
+        CYTHON_FALLTHROUGH;
+        case  9: values[8] = __Pyx_Arg_FASTCALL(__pyx_args, 8);
+        CYTHON_FALLTHROUGH;
+        case  8: values[7] = __Pyx_Arg_FASTCALL(__pyx_args, 7);
+        CYTHON_FALLTHROUGH;
+        case  7: values[6] = __Pyx_Arg_FASTCALL(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
+        case  6: values[5] = __Pyx_Arg_FASTCALL(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
         case  5: values[4] = __Pyx_Arg_FASTCALL(__pyx_args, 4);
         CYTHON_FALLTHROUGH;
         case  4: values[3] = __Pyx_Arg_FASTCALL(__pyx_args, 3);
@@ -21306,7 +22515,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 18, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 28, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
         CYTHON_FALLTHROUGH;
         case  1:
@@ -21314,9 +22523,9 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 18, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 28, __pyx_L3_error)
         else {
-          __Pyx_RaiseArgtupleInvalid("inverse_distance", 0, 3, 5, 1); __PYX_ERR(0, 18, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("inverse_distance", 0, 3, 12, 1); __PYX_ERR(0, 28, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
@@ -21324,31 +22533,94 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[2]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 18, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 28, __pyx_L3_error)
         else {
-          __Pyx_RaiseArgtupleInvalid("inverse_distance", 0, 3, 5, 2); __PYX_ERR(0, 18, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("inverse_distance", 0, 3, 12, 2); __PYX_ERR(0, 28, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  3:
         if (kw_args > 0) {
           PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_power);
           if (value) { values[3] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 18, __pyx_L3_error)
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 28, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  4:
         if (kw_args > 0) {
           PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_smoothing);
           if (value) { values[4] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 18, __pyx_L3_error)
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 28, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  5:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_num_threads);
+          if (value) { values[5] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 28, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  6:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_k_nearest);
+          if (value) { values[6] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 28, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  7:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_max_radius);
+          if (value) { values[7] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 28, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  8:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_out);
+          if (value) { values[8] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 28, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  9:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_mask);
+          if (value) { values[9] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 28, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case 10:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_nodata);
+          if (value) { values[10] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 28, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case 11:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_precision);
+          if (value) { values[11] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 28, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "inverse_distance") < 0)) __PYX_ERR(0, 18, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "inverse_distance") < 0)) __PYX_ERR(0, 28, __pyx_L3_error)
       }
     } else {
       switch (__pyx_nargs) {
+        case 12: values[11] = __Pyx_Arg_FASTCALL(__pyx_args, 11);
+        CYTHON_FALLTHROUGH;
+        case 11: values[10] = __Pyx_Arg_FASTCALL(__pyx_args, 10);
+        CYTHON_FALLTHROUGH;
+        case 10: values[9] = __Pyx_Arg_FASTCALL(__pyx_args, 9);
+        CYTHON_FALLTHROUGH;
+        case  9: values[8] = __Pyx_Arg_FASTCALL(__pyx_args, 8);
+        CYTHON_FALLTHROUGH;
+        case  8: values[7] = __Pyx_Arg_FASTCALL(__pyx_args, 7);
+        CYTHON_FALLTHROUGH;
+        case  7: values[6] = __Pyx_Arg_FASTCALL(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
+        case  6: values[5] = __Pyx_Arg_FASTCALL(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
         case  5: values[4] = __Pyx_Arg_FASTCALL(__pyx_args, 4);
         CYTHON_FALLTHROUGH;
         case  4: values[3] = __Pyx_Arg_FASTCALL(__pyx_args, 3);
@@ -21360,19 +22632,46 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
         default: goto __pyx_L5_argtuple_error;
       }
     }
-    __pyx_v_data = ((PyObject*)values[0]);
+    __pyx_v_data = values[0];
     __pyx_v_size = ((PyObject*)values[1]);
     __pyx_v_geotransform = ((PyObject*)values[2]);
-    __pyx_v_power = ((PyObject*)values[3]);
+    if (values[3]) {
+      __pyx_v_power = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_power == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 30, __pyx_L3_error)
+    } else {
+      __pyx_v_power = ((double)((double)2.0));
+    }
     if (values[4]) {
-      __pyx_v_smoothing = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_smoothing == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 20, __pyx_L3_error)
+      __pyx_v_smoothing = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_smoothing == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 30, __pyx_L3_error)
     } else {
       __pyx_v_smoothing = ((double)((double)0.0));
     }
+    if (values[5]) {
+      __pyx_v_num_threads = __Pyx_PyInt_As_int(values[5]); if (unlikely((__pyx_v_num_threads == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 30, __pyx_L3_error)
+    } else {
+      __pyx_v_num_threads = ((int)((int)1));
+    }
+    if (values[6]) {
+      __pyx_v_k_nearest = __Pyx_PyInt_As_int(values[6]); if (unlikely((__pyx_v_k_nearest == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 31, __pyx_L3_error)
+    } else {
+      __pyx_v_k_nearest = ((int)((int)0));
+    }
+    if (values[7]) {
+      __pyx_v_max_radius = __pyx_PyFloat_AsDouble(values[7]); if (unlikely((__pyx_v_max_radius == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 31, __pyx_L3_error)
+    } else {
+      __pyx_v_max_radius = ((double)((double)0.0));
+    }
+    __pyx_v_out = values[8];
+    __pyx_v_mask = values[9];
+    if (values[10]) {
+      __pyx_v_nodata = __pyx_PyFloat_AsDouble(values[10]); if (unlikely((__pyx_v_nodata == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 32, __pyx_L3_error)
+    } else {
+      __pyx_v_nodata = __pyx_dynamic_args->__pyx_arg_nodata;
+    }
+    __pyx_v_precision = values[11];
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("inverse_distance", 0, 3, 5, __pyx_nargs); __PYX_ERR(0, 18, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("inverse_distance", 0, 3, 12, __pyx_nargs); __PYX_ERR(0, 28, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -21386,11 +22685,17 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_data), (&PyList_Type), 0, "data", 1))) __PYX_ERR(0, 18, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_size), (&PyList_Type), 0, "size", 1))) __PYX_ERR(0, 19, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_geotransform), (&PyList_Type), 0, "geotransform", 1))) __PYX_ERR(0, 19, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_power), (&PyInt_Type), 0, "power", 1))) __PYX_ERR(0, 20, __pyx_L1_error)
-  __pyx_r = __pyx_pf_6pymica_7methods_16inverse_distance_inverse_distance(__pyx_self, __pyx_v_data, __pyx_v_size, __pyx_v_geotransform, __pyx_v_power, __pyx_v_smoothing);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_size), (&PyList_Type), 0, "size", 1))) __PYX_ERR(0, 29, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_geotransform), (&PyList_Type), 0, "geotransform", 1))) __PYX_ERR(0, 29, __pyx_L1_error)
+  __pyx_r = __pyx_pf_6pymica_7methods_16inverse_distance_inverse_distance(__pyx_self, __pyx_v_data, __pyx_v_size, __pyx_v_geotransform, __pyx_v_power, __pyx_v_smoothing, __pyx_v_num_threads, __pyx_v_k_nearest, __pyx_v_max_radius, __pyx_v_out, __pyx_v_mask, __pyx_v_nodata, __pyx_v_precision);
+
+  /* "pymica/methods/inverse_distance.pyx":28
+ * ctypedef np.float64_t DTYPE_t
+ * 
+ * def inverse_distance(data: Union[List[Dict[str, float]], np.ndarray],             # <<<<<<<<<<<<<<
+ *                      size: List[int], geotransform: List[int],
+ *                      power: float=2, smoothing: float=0.0, int num_threads=1,
+ */
 
   /* function exit code */
   goto __pyx_L0;
@@ -21407,890 +22712,10643 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_6pymica_7methods_16inverse_distance_inverse_distance(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_data, PyObject *__pyx_v_size, PyObject *__pyx_v_geotransform, PyObject *__pyx_v_power, double __pyx_v_smoothing) {
-  arrayobject *__pyx_v_da = 0;
-  __Pyx_memviewslice __pyx_v_cda = { 0, 0, { 0 }, { 0 }, { 0 } };
-  PyObject *__pyx_v_xpos0 = NULL;
-  PyObject *__pyx_v_ypos0 = NULL;
-  PyObject *__pyx_v_values0 = NULL;
-  PyObject *__pyx_v_d = NULL;
-  int __pyx_v_N;
-  arrayobject *__pyx_v_xpos = 0;
-  __Pyx_memviewslice __pyx_v_cxpos = { 0, 0, { 0 }, { 0 }, { 0 } };
-  arrayobject *__pyx_v_ypos = 0;
-  __Pyx_memviewslice __pyx_v_cypos = { 0, 0, { 0 }, { 0 }, { 0 } };
-  arrayobject *__pyx_v_values = 0;
-  __Pyx_memviewslice __pyx_v_cvalues = { 0, 0, { 0 }, { 0 }, { 0 } };
-  int __pyx_v_i;
-  int __pyx_v_j;
-  int __pyx_v_xsize;
-  int __pyx_v_ysize;
-  double __pyx_v_y;
-  double __pyx_v_x;
-  arrayobject *__pyx_v_geotransform0 = 0;
-  __Pyx_memviewslice __pyx_v_cgeotransform = { 0, 0, { 0 }, { 0 }, { 0 } };
-  PyObject *__pyx_v_data_array = NULL;
+static PyObject *__pyx_pf_6pymica_7methods_16inverse_distance_inverse_distance(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_data, PyObject *__pyx_v_size, PyObject *__pyx_v_geotransform, double __pyx_v_power, double __pyx_v_smoothing, int __pyx_v_num_threads, int __pyx_v_k_nearest, double __pyx_v_max_radius, PyObject *__pyx_v_out, PyObject *__pyx_v_mask, double __pyx_v_nodata, PyObject *__pyx_v_precision) {
+  PyObject *__pyx_v_xpos = NULL;
+  PyObject *__pyx_v_ypos = NULL;
+  PyObject *__pyx_v_values = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
-  Py_ssize_t __pyx_t_3;
-  int __pyx_t_4;
-  __Pyx_memviewslice __pyx_t_5 = { 0, 0, { 0 }, { 0 }, { 0 } };
-  int __pyx_t_6;
-  int __pyx_t_7;
-  int __pyx_t_8;
-  Py_ssize_t __pyx_t_9;
-  Py_ssize_t __pyx_t_10;
-  int __pyx_t_11;
-  int __pyx_t_12;
-  int __pyx_t_13;
-  int __pyx_t_14;
-  float __pyx_t_15;
-  PyObject *__pyx_t_16 = NULL;
-  PyObject *__pyx_t_17 = NULL;
-  unsigned int __pyx_t_18;
+  PyObject *__pyx_t_3 = NULL;
+  unsigned int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *(*__pyx_t_7)(PyObject *);
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("inverse_distance", 1);
 
-  /* "pymica/methods/inverse_distance.pyx":37
+  /* "pymica/methods/inverse_distance.pyx":76
+ *         np.array: The interpolated data, `out` if it was provided
  *     """
+ *     xpos, ypos, values = station_arrays(data, ('x', 'y', 'value'))             # <<<<<<<<<<<<<<
  * 
- *     cdef array.array da = array.array('d', [])             # <<<<<<<<<<<<<<
- *     array.resize(da, size[0] * size[1])
- *     cdef double[:] cda = da
+ *     return inverse_distance_arrays(xpos, ypos, values, size, geotransform,
  */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 37, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 37, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_station_arrays); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 76, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_INCREF(__pyx_n_s_d);
-  __Pyx_GIVEREF(__pyx_n_s_d);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_n_s_d)) __PYX_ERR(0, 37, __pyx_L1_error);
-  __Pyx_GIVEREF(__pyx_t_1);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_1)) __PYX_ERR(0, 37, __pyx_L1_error);
-  __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_7cpython_5array_array), __pyx_t_2, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 37, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_v_da = ((arrayobject *)__pyx_t_1);
-  __pyx_t_1 = 0;
+  __pyx_t_3 = NULL;
+  __pyx_t_4 = 0;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+      __pyx_t_4 = 1;
+    }
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[3] = {__pyx_t_3, __pyx_v_data, __pyx_tuple__11};
+    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_4, 2+__pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 76, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  }
+  if ((likely(PyTuple_CheckExact(__pyx_t_1))) || (PyList_CheckExact(__pyx_t_1))) {
+    PyObject* sequence = __pyx_t_1;
+    Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
+    if (unlikely(size != 3)) {
+      if (size > 3) __Pyx_RaiseTooManyValuesError(3);
+      else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+      __PYX_ERR(0, 76, __pyx_L1_error)
+    }
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    if (likely(PyTuple_CheckExact(sequence))) {
+      __pyx_t_2 = PyTuple_GET_ITEM(sequence, 0); 
+      __pyx_t_3 = PyTuple_GET_ITEM(sequence, 1); 
+      __pyx_t_5 = PyTuple_GET_ITEM(sequence, 2); 
+    } else {
+      __pyx_t_2 = PyList_GET_ITEM(sequence, 0); 
+      __pyx_t_3 = PyList_GET_ITEM(sequence, 1); 
+      __pyx_t_5 = PyList_GET_ITEM(sequence, 2); 
+    }
+    __Pyx_INCREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx_t_3);
+    __Pyx_INCREF(__pyx_t_5);
+    #else
+    __pyx_t_2 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 76, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 76, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_5 = PySequence_ITEM(sequence, 2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 76, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    #endif
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  } else {
+    Py_ssize_t index = -1;
+    __pyx_t_6 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 76, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_7 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_6);
+    index = 0; __pyx_t_2 = __pyx_t_7(__pyx_t_6); if (unlikely(!__pyx_t_2)) goto __pyx_L3_unpacking_failed;
+    __Pyx_GOTREF(__pyx_t_2);
+    index = 1; __pyx_t_3 = __pyx_t_7(__pyx_t_6); if (unlikely(!__pyx_t_3)) goto __pyx_L3_unpacking_failed;
+    __Pyx_GOTREF(__pyx_t_3);
+    index = 2; __pyx_t_5 = __pyx_t_7(__pyx_t_6); if (unlikely(!__pyx_t_5)) goto __pyx_L3_unpacking_failed;
+    __Pyx_GOTREF(__pyx_t_5);
+    if (__Pyx_IternextUnpackEndCheck(__pyx_t_7(__pyx_t_6), 3) < 0) __PYX_ERR(0, 76, __pyx_L1_error)
+    __pyx_t_7 = NULL;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    goto __pyx_L4_unpacking_done;
+    __pyx_L3_unpacking_failed:;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __pyx_t_7 = NULL;
+    if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+    __PYX_ERR(0, 76, __pyx_L1_error)
+    __pyx_L4_unpacking_done:;
+  }
+  __pyx_v_xpos = __pyx_t_2;
+  __pyx_t_2 = 0;
+  __pyx_v_ypos = __pyx_t_3;
+  __pyx_t_3 = 0;
+  __pyx_v_values = __pyx_t_5;
+  __pyx_t_5 = 0;
 
-  /* "pymica/methods/inverse_distance.pyx":38
- * 
- *     cdef array.array da = array.array('d', [])
- *     array.resize(da, size[0] * size[1])             # <<<<<<<<<<<<<<
- *     cdef double[:] cda = da
+  /* "pymica/methods/inverse_distance.pyx":78
+ *     xpos, ypos, values = station_arrays(data, ('x', 'y', 'value'))
  * 
+ *     return inverse_distance_arrays(xpos, ypos, values, size, geotransform,             # <<<<<<<<<<<<<<
+ *                                    power, smoothing, num_threads, k_nearest,
+ *                                    max_radius, out, mask, nodata, precision)
  */
-  __pyx_t_1 = PyNumber_Multiply(PyList_GET_ITEM(__pyx_v_size, 0), PyList_GET_ITEM(__pyx_v_size, 1)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 38, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = __Pyx_PyIndex_AsSsize_t(__pyx_t_1); if (unlikely((__pyx_t_3 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 38, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_4 = resize(__pyx_v_da, __pyx_t_3); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(0, 38, __pyx_L1_error)
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_inverse_distance_arrays); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 78, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
 
-  /* "pymica/methods/inverse_distance.pyx":39
- *     cdef array.array da = array.array('d', [])
- *     array.resize(da, size[0] * size[1])
- *     cdef double[:] cda = da             # <<<<<<<<<<<<<<
+  /* "pymica/methods/inverse_distance.pyx":79
  * 
- *     xpos0 = []
- */
-  __pyx_t_5 = __Pyx_PyObject_to_MemoryviewSlice_ds_double(((PyObject *)__pyx_v_da), PyBUF_WRITABLE); if (unlikely(!__pyx_t_5.memview)) __PYX_ERR(0, 39, __pyx_L1_error)
-  __pyx_v_cda = __pyx_t_5;
-  __pyx_t_5.memview = NULL;
-  __pyx_t_5.data = NULL;
-
-  /* "pymica/methods/inverse_distance.pyx":41
- *     cdef double[:] cda = da
+ *     return inverse_distance_arrays(xpos, ypos, values, size, geotransform,
+ *                                    power, smoothing, num_threads, k_nearest,             # <<<<<<<<<<<<<<
+ *                                    max_radius, out, mask, nodata, precision)
  * 
- *     xpos0 = []             # <<<<<<<<<<<<<<
- *     ypos0 = []
- *     values0 = []
  */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 41, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_xpos0 = ((PyObject*)__pyx_t_1);
-  __pyx_t_1 = 0;
+  __pyx_t_3 = PyFloat_FromDouble(__pyx_v_power); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 79, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_2 = PyFloat_FromDouble(__pyx_v_smoothing); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 79, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_6 = __Pyx_PyInt_From_int(__pyx_v_num_threads); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 79, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_8 = __Pyx_PyInt_From_int(__pyx_v_k_nearest); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 79, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
 
-  /* "pymica/methods/inverse_distance.pyx":42
+  /* "pymica/methods/inverse_distance.pyx":80
+ *     return inverse_distance_arrays(xpos, ypos, values, size, geotransform,
+ *                                    power, smoothing, num_threads, k_nearest,
+ *                                    max_radius, out, mask, nodata, precision)             # <<<<<<<<<<<<<<
  * 
- *     xpos0 = []
- *     ypos0 = []             # <<<<<<<<<<<<<<
- *     values0 = []
  * 
  */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 42, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_ypos0 = ((PyObject*)__pyx_t_1);
+  __pyx_t_9 = PyFloat_FromDouble(__pyx_v_max_radius); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 80, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __pyx_t_10 = PyFloat_FromDouble(__pyx_v_nodata); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 80, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_10);
+  __pyx_t_11 = NULL;
+  __pyx_t_4 = 0;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_5))) {
+    __pyx_t_11 = PyMethod_GET_SELF(__pyx_t_5);
+    if (likely(__pyx_t_11)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+      __Pyx_INCREF(__pyx_t_11);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_5, function);
+      __pyx_t_4 = 1;
+    }
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[15] = {__pyx_t_11, __pyx_v_xpos, __pyx_v_ypos, __pyx_v_values, __pyx_v_size, __pyx_v_geotransform, __pyx_t_3, __pyx_t_2, __pyx_t_6, __pyx_t_8, __pyx_t_9, __pyx_v_out, __pyx_v_mask, __pyx_t_10, __pyx_v_precision};
+    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_5, __pyx_callargs+1-__pyx_t_4, 14+__pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_11); __pyx_t_11 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 78, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  }
+  __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
+  goto __pyx_L0;
 
-  /* "pymica/methods/inverse_distance.pyx":43
- *     xpos0 = []
- *     ypos0 = []
- *     values0 = []             # <<<<<<<<<<<<<<
+  /* "pymica/methods/inverse_distance.pyx":28
+ * ctypedef np.float64_t DTYPE_t
  * 
- *     for d in data:
+ * def inverse_distance(data: Union[List[Dict[str, float]], np.ndarray],             # <<<<<<<<<<<<<<
+ *                      size: List[int], geotransform: List[int],
+ *                      power: float=2, smoothing: float=0.0, int num_threads=1,
  */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 43, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_values0 = ((PyObject*)__pyx_t_1);
-  __pyx_t_1 = 0;
 
-  /* "pymica/methods/inverse_distance.pyx":45
- *     values0 = []
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_AddTraceback("pymica.methods.inverse_distance.inverse_distance", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_xpos);
+  __Pyx_XDECREF(__pyx_v_ypos);
+  __Pyx_XDECREF(__pyx_v_values);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "pymica/methods/inverse_distance.pyx":83
  * 
- *     for d in data:             # <<<<<<<<<<<<<<
- *         xpos0.append(d['x'])
- *         ypos0.append(d['y'])
+ * 
+ * def inverse_distance_arrays(xpos, ypos, values,             # <<<<<<<<<<<<<<
+ *                             size: List[int], geotransform: List[int],
+ *                             power: float=2, smoothing: float=0.0,
  */
-  __pyx_t_1 = __pyx_v_data; __Pyx_INCREF(__pyx_t_1);
-  __pyx_t_3 = 0;
-  for (;;) {
-    {
-      Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_1);
-      #if !CYTHON_ASSUME_SAFE_MACROS
-      if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 45, __pyx_L1_error)
-      #endif
-      if (__pyx_t_3 >= __pyx_temp) break;
-    }
-    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-    __pyx_t_2 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_3); __Pyx_INCREF(__pyx_t_2); __pyx_t_3++; if (unlikely((0 < 0))) __PYX_ERR(0, 45, __pyx_L1_error)
-    #else
-    __pyx_t_2 = __Pyx_PySequence_ITEM(__pyx_t_1, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 45, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    #endif
-    __Pyx_XDECREF_SET(__pyx_v_d, __pyx_t_2);
-    __pyx_t_2 = 0;
 
-    /* "pymica/methods/inverse_distance.pyx":46
- * 
- *     for d in data:
- *         xpos0.append(d['x'])             # <<<<<<<<<<<<<<
- *         ypos0.append(d['y'])
- *         values0.append(d['value'])
+static PyObject *__pyx_pf_6pymica_7methods_16inverse_distance_8__defaults__(CYTHON_UNUSED PyObject *__pyx_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__defaults__", 1);
+  __Pyx_XDECREF(__pyx_r);
+
+  /* "pymica/methods/inverse_distance.pyx":85
+ * def inverse_distance_arrays(xpos, ypos, values,
+ *                             size: List[int], geotransform: List[int],
+ *                             power: float=2, smoothing: float=0.0,             # <<<<<<<<<<<<<<
+ *                             int num_threads=1, int k_nearest=0,
+ *                             double max_radius=0.0, out=None, mask=None,
  */
-    __pyx_t_2 = __Pyx_PyObject_Dict_GetItem(__pyx_v_d, __pyx_n_s_x); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 46, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_6 = __Pyx_PyList_Append(__pyx_v_xpos0, __pyx_t_2); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(0, 46, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_1 = PyFloat_FromDouble(((double)2.0)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 85, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyFloat_FromDouble(((double)0.0)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 85, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
 
-    /* "pymica/methods/inverse_distance.pyx":47
- *     for d in data:
- *         xpos0.append(d['x'])
- *         ypos0.append(d['y'])             # <<<<<<<<<<<<<<
- *         values0.append(d['value'])
- * 
+  /* "pymica/methods/inverse_distance.pyx":86
+ *                             size: List[int], geotransform: List[int],
+ *                             power: float=2, smoothing: float=0.0,
+ *                             int num_threads=1, int k_nearest=0,             # <<<<<<<<<<<<<<
+ *                             double max_radius=0.0, out=None, mask=None,
+ *                             double nodata=np.nan, precision='float64'):
  */
-    __pyx_t_2 = __Pyx_PyObject_Dict_GetItem(__pyx_v_d, __pyx_n_s_y); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 47, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_6 = __Pyx_PyList_Append(__pyx_v_ypos0, __pyx_t_2); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(0, 47, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_3 = __Pyx_PyInt_From_int(((int)1)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 86, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_PyInt_From_int(((int)0)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 86, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
 
-    /* "pymica/methods/inverse_distance.pyx":48
- *         xpos0.append(d['x'])
- *         ypos0.append(d['y'])
- *         values0.append(d['value'])             # <<<<<<<<<<<<<<
- * 
- *     cdef int N
+  /* "pymica/methods/inverse_distance.pyx":87
+ *                             power: float=2, smoothing: float=0.0,
+ *                             int num_threads=1, int k_nearest=0,
+ *                             double max_radius=0.0, out=None, mask=None,             # <<<<<<<<<<<<<<
+ *                             double nodata=np.nan, precision='float64'):
+ *     """
  */
-    __pyx_t_2 = __Pyx_PyObject_Dict_GetItem(__pyx_v_d, __pyx_n_s_value); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 48, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_6 = __Pyx_PyList_Append(__pyx_v_values0, __pyx_t_2); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(0, 48, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_5 = PyFloat_FromDouble(((double)0.0)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 87, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
 
-    /* "pymica/methods/inverse_distance.pyx":45
- *     values0 = []
+  /* "pymica/methods/inverse_distance.pyx":83
  * 
- *     for d in data:             # <<<<<<<<<<<<<<
- *         xpos0.append(d['x'])
- *         ypos0.append(d['y'])
+ * 
+ * def inverse_distance_arrays(xpos, ypos, values,             # <<<<<<<<<<<<<<
+ *                             size: List[int], geotransform: List[int],
+ *                             power: float=2, smoothing: float=0.0,
+ */
+  __pyx_t_6 = PyFloat_FromDouble(__Pyx_CyFunction_Defaults(__pyx_defaults1, __pyx_self)->__pyx_arg_nodata); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 83, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_7 = PyTuple_New(9); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 83, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_GIVEREF(__pyx_t_1);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_1)) __PYX_ERR(0, 83, __pyx_L1_error);
+  __Pyx_GIVEREF(__pyx_t_2);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 1, __pyx_t_2)) __PYX_ERR(0, 83, __pyx_L1_error);
+  __Pyx_GIVEREF(__pyx_t_3);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 2, __pyx_t_3)) __PYX_ERR(0, 83, __pyx_L1_error);
+  __Pyx_GIVEREF(__pyx_t_4);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 3, __pyx_t_4)) __PYX_ERR(0, 83, __pyx_L1_error);
+  __Pyx_GIVEREF(__pyx_t_5);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 4, __pyx_t_5)) __PYX_ERR(0, 83, __pyx_L1_error);
+  __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(Py_None);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 5, Py_None)) __PYX_ERR(0, 83, __pyx_L1_error);
+  __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(Py_None);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 6, Py_None)) __PYX_ERR(0, 83, __pyx_L1_error);
+  __Pyx_GIVEREF(__pyx_t_6);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 7, __pyx_t_6)) __PYX_ERR(0, 83, __pyx_L1_error);
+  __Pyx_INCREF(((PyObject*)__pyx_n_s_float64));
+  __Pyx_GIVEREF(((PyObject*)__pyx_n_s_float64));
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 8, ((PyObject*)__pyx_n_s_float64))) __PYX_ERR(0, 83, __pyx_L1_error);
+  __pyx_t_1 = 0;
+  __pyx_t_2 = 0;
+  __pyx_t_3 = 0;
+  __pyx_t_4 = 0;
+  __pyx_t_5 = 0;
+  __pyx_t_6 = 0;
+  __pyx_t_6 = PyTuple_New(2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 83, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __Pyx_GIVEREF(__pyx_t_7);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_7)) __PYX_ERR(0, 83, __pyx_L1_error);
+  __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(Py_None);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_6, 1, Py_None)) __PYX_ERR(0, 83, __pyx_L1_error);
+  __pyx_t_7 = 0;
+  __pyx_r = __pyx_t_6;
+  __pyx_t_6 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("pymica.methods.inverse_distance.__defaults__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_6pymica_7methods_16inverse_distance_3inverse_distance_arrays(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_6pymica_7methods_16inverse_distance_2inverse_distance_arrays, "\n    inverse_distance_arrays(xpos, ypos, values, size, geotransform)\n\n    Same as inverse_distance, but taking the station coordinates and values\n    as 1-D arrays. Contiguous float64 arrays are used without any copy.\n\n    Args:\n        xpos (np.array): The x coordinate of the stations\n        ypos (np.array): The y coordinate of the stations\n        values (np.array): The station values\n        size (list): x X y\n        geotransform (list): The geotransform to apply to relate the data coordinates\n                             and the position in the matrix.\n        power (float): Power of the distance, as in inverse_distance.\n        smoothing (float): Smoothing distance, as in inverse_distance.\n        num_threads (int): Number of OpenMP threads, as in inverse_distance.\n        k_nearest (int): Number of nearest stations, as in inverse_distance.\n        max_radius (float): Search radius, as in inverse_distance.\n        out (np.array): Output array, as in inverse_distance.\n        mask (np.array): Valid pixels, as in inverse_distance.\n        nodata (float): Value of the masked pixels, as in inverse_distance.\n        precision (str): Precision of the weights, as in inverse_distance.\n\n    Returns:\n        np.array: The interpolated data, `out` if it was provided\n    ");
+static PyMethodDef __pyx_mdef_6pymica_7methods_16inverse_distance_3inverse_distance_arrays = {"inverse_distance_arrays", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_6pymica_7methods_16inverse_distance_3inverse_distance_arrays, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_6pymica_7methods_16inverse_distance_2inverse_distance_arrays};
+static PyObject *__pyx_pw_6pymica_7methods_16inverse_distance_3inverse_distance_arrays(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  PyObject *__pyx_v_xpos = 0;
+  PyObject *__pyx_v_ypos = 0;
+  PyObject *__pyx_v_values = 0;
+  PyObject *__pyx_v_size = 0;
+  PyObject *__pyx_v_geotransform = 0;
+  double __pyx_v_power;
+  double __pyx_v_smoothing;
+  int __pyx_v_num_threads;
+  int __pyx_v_k_nearest;
+  double __pyx_v_max_radius;
+  PyObject *__pyx_v_out = 0;
+  PyObject *__pyx_v_mask = 0;
+  double __pyx_v_nodata;
+  PyObject *__pyx_v_precision = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[14] = {0,0,0,0,0,0,0,0,0,0,0,0,0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("inverse_distance_arrays (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_xpos,&__pyx_n_s_ypos,&__pyx_n_s_values,&__pyx_n_s_size,&__pyx_n_s_geotransform,&__pyx_n_s_power,&__pyx_n_s_smoothing,&__pyx_n_s_num_threads,&__pyx_n_s_k_nearest,&__pyx_n_s_max_radius,&__pyx_n_s_out,&__pyx_n_s_mask,&__pyx_n_s_nodata,&__pyx_n_s_precision,0};
+    __pyx_defaults1 *__pyx_dynamic_args = __Pyx_CyFunction_Defaults(__pyx_defaults1, __pyx_self);
+
+    /* "pymica/methods/inverse_distance.pyx":87
+ *                             power: float=2, smoothing: float=0.0,
+ *                             int num_threads=1, int k_nearest=0,
+ *                             double max_radius=0.0, out=None, mask=None,             # <<<<<<<<<<<<<<
+ *                             double nodata=np.nan, precision='float64'):
+ *     """
  */
+    values[10] = __Pyx_Arg_NewRef_FASTCALL(((PyObject *)Py_None));
+    values[11] = __Pyx_Arg_NewRef_FASTCALL(((PyObject *)Py_None));
+    values[13] = __Pyx_Arg_NewRef_FASTCALL(((PyObject *)((PyObject*)__pyx_n_s_float64)));
+    if (__pyx_kwds) {
+      Py_ssize_t kw_args;
+      switch (__pyx_nargs) {
+        case 14: values[13] = __Pyx_Arg_FASTCALL(__pyx_args, 13);
+        CYTHON_FALLTHROUGH;
+        case 13: values[12] = __Pyx_Arg_FASTCALL(__pyx_args, 12);
+        CYTHON_FALLTHROUGH;
+        case 12: values[11] = __Pyx_Arg_FASTCALL(__pyx_args, 11);
+        CYTHON_FALLTHROUGH;
+        case 11: values[10] = __Pyx_Arg_FASTCALL(__pyx_args, 10);
+        CYTHON_FALLTHROUGH;
+        case 10: values[9] = __Pyx_Arg_FASTCALL(__pyx_args, 9);
+        CYTHON_FALLTHROUGH;
+        case  9: values[8] = __Pyx_Arg_FASTCALL(__pyx_args, 8);
+        CYTHON_FALLTHROUGH;
+        case  8: values[7] = __Pyx_Arg_FASTCALL(__pyx_args, 7);
+        CYTHON_FALLTHROUGH;
+        case  7: values[6] = __Pyx_Arg_FASTCALL(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
+        case  6: values[5] = __Pyx_Arg_FASTCALL(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = __Pyx_Arg_FASTCALL(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = __Pyx_Arg_FASTCALL(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = __Pyx_Arg_FASTCALL(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
+      switch (__pyx_nargs) {
+        case  0:
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_xpos)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 83, __pyx_L3_error)
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_ypos)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 83, __pyx_L3_error)
+        else {
+          __Pyx_RaiseArgtupleInvalid("inverse_distance_arrays", 0, 5, 14, 1); __PYX_ERR(0, 83, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_values)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[2]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 83, __pyx_L3_error)
+        else {
+          __Pyx_RaiseArgtupleInvalid("inverse_distance_arrays", 0, 5, 14, 2); __PYX_ERR(0, 83, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_size)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[3]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 83, __pyx_L3_error)
+        else {
+          __Pyx_RaiseArgtupleInvalid("inverse_distance_arrays", 0, 5, 14, 3); __PYX_ERR(0, 83, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (likely((values[4] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_geotransform)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[4]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 83, __pyx_L3_error)
+        else {
+          __Pyx_RaiseArgtupleInvalid("inverse_distance_arrays", 0, 5, 14, 4); __PYX_ERR(0, 83, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  5:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_power);
+          if (value) { values[5] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 83, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  6:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_smoothing);
+          if (value) { values[6] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 83, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  7:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_num_threads);
+          if (value) { values[7] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 83, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  8:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_k_nearest);
+          if (value) { values[8] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 83, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  9:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_max_radius);
+          if (value) { values[9] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 83, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case 10:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_out);
+          if (value) { values[10] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 83, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case 11:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_mask);
+          if (value) { values[11] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 83, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case 12:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_nodata);
+          if (value) { values[12] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 83, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case 13:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_precision);
+          if (value) { values[13] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 83, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        const Py_ssize_t kwd_pos_args = __pyx_nargs;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "inverse_distance_arrays") < 0)) __PYX_ERR(0, 83, __pyx_L3_error)
+      }
+    } else {
+      switch (__pyx_nargs) {
+        case 14: values[13] = __Pyx_Arg_FASTCALL(__pyx_args, 13);
+        CYTHON_FALLTHROUGH;
+        case 13: values[12] = __Pyx_Arg_FASTCALL(__pyx_args, 12);
+        CYTHON_FALLTHROUGH;
+        case 12: values[11] = __Pyx_Arg_FASTCALL(__pyx_args, 11);
+        CYTHON_FALLTHROUGH;
+        case 11: values[10] = __Pyx_Arg_FASTCALL(__pyx_args, 10);
+        CYTHON_FALLTHROUGH;
+        case 10: values[9] = __Pyx_Arg_FASTCALL(__pyx_args, 9);
+        CYTHON_FALLTHROUGH;
+        case  9: values[8] = __Pyx_Arg_FASTCALL(__pyx_args, 8);
+        CYTHON_FALLTHROUGH;
+        case  8: values[7] = __Pyx_Arg_FASTCALL(__pyx_args, 7);
+        CYTHON_FALLTHROUGH;
+        case  7: values[6] = __Pyx_Arg_FASTCALL(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
+        case  6: values[5] = __Pyx_Arg_FASTCALL(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = __Pyx_Arg_FASTCALL(__pyx_args, 4);
+        values[3] = __Pyx_Arg_FASTCALL(__pyx_args, 3);
+        values[2] = __Pyx_Arg_FASTCALL(__pyx_args, 2);
+        values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+        values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_xpos = values[0];
+    __pyx_v_ypos = values[1];
+    __pyx_v_values = values[2];
+    __pyx_v_size = ((PyObject*)values[3]);
+    __pyx_v_geotransform = ((PyObject*)values[4]);
+    if (values[5]) {
+      __pyx_v_power = __pyx_PyFloat_AsDouble(values[5]); if (unlikely((__pyx_v_power == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 85, __pyx_L3_error)
+    } else {
+      __pyx_v_power = ((double)((double)2.0));
+    }
+    if (values[6]) {
+      __pyx_v_smoothing = __pyx_PyFloat_AsDouble(values[6]); if (unlikely((__pyx_v_smoothing == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 85, __pyx_L3_error)
+    } else {
+      __pyx_v_smoothing = ((double)((double)0.0));
+    }
+    if (values[7]) {
+      __pyx_v_num_threads = __Pyx_PyInt_As_int(values[7]); if (unlikely((__pyx_v_num_threads == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 86, __pyx_L3_error)
+    } else {
+      __pyx_v_num_threads = ((int)((int)1));
+    }
+    if (values[8]) {
+      __pyx_v_k_nearest = __Pyx_PyInt_As_int(values[8]); if (unlikely((__pyx_v_k_nearest == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 86, __pyx_L3_error)
+    } else {
+      __pyx_v_k_nearest = ((int)((int)0));
+    }
+    if (values[9]) {
+      __pyx_v_max_radius = __pyx_PyFloat_AsDouble(values[9]); if (unlikely((__pyx_v_max_radius == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 87, __pyx_L3_error)
+    } else {
+      __pyx_v_max_radius = ((double)((double)0.0));
+    }
+    __pyx_v_out = values[10];
+    __pyx_v_mask = values[11];
+    if (values[12]) {
+      __pyx_v_nodata = __pyx_PyFloat_AsDouble(values[12]); if (unlikely((__pyx_v_nodata == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 88, __pyx_L3_error)
+    } else {
+      __pyx_v_nodata = __pyx_dynamic_args->__pyx_arg_nodata;
+    }
+    __pyx_v_precision = values[13];
   }
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("inverse_distance_arrays", 0, 5, 14, __pyx_nargs); __PYX_ERR(0, 83, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_AddTraceback("pymica.methods.inverse_distance.inverse_distance_arrays", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_size), (&PyList_Type), 0, "size", 1))) __PYX_ERR(0, 84, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_geotransform), (&PyList_Type), 0, "geotransform", 1))) __PYX_ERR(0, 84, __pyx_L1_error)
+  __pyx_r = __pyx_pf_6pymica_7methods_16inverse_distance_2inverse_distance_arrays(__pyx_self, __pyx_v_xpos, __pyx_v_ypos, __pyx_v_values, __pyx_v_size, __pyx_v_geotransform, __pyx_v_power, __pyx_v_smoothing, __pyx_v_num_threads, __pyx_v_k_nearest, __pyx_v_max_radius, __pyx_v_out, __pyx_v_mask, __pyx_v_nodata, __pyx_v_precision);
 
-  /* "pymica/methods/inverse_distance.pyx":51
+  /* "pymica/methods/inverse_distance.pyx":83
  * 
- *     cdef int N
- *     N = len(xpos0)             # <<<<<<<<<<<<<<
- *     #http://cython.readthedocs.io/en/latest/src/tutorial/array.html
- *     cdef array.array xpos = array.array('d', xpos0)
+ * 
+ * def inverse_distance_arrays(xpos, ypos, values,             # <<<<<<<<<<<<<<
+ *                             size: List[int], geotransform: List[int],
+ *                             power: float=2, smoothing: float=0.0,
  */
-  __pyx_t_3 = __Pyx_PyList_GET_SIZE(__pyx_v_xpos0); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(0, 51, __pyx_L1_error)
-  __pyx_v_N = __pyx_t_3;
 
-  /* "pymica/methods/inverse_distance.pyx":53
- *     N = len(xpos0)
- *     #http://cython.readthedocs.io/en/latest/src/tutorial/array.html
- *     cdef array.array xpos = array.array('d', xpos0)             # <<<<<<<<<<<<<<
- *     cdef double[:] cxpos = xpos
- *     cdef array.array ypos = array.array('d', ypos0)
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_6pymica_7methods_16inverse_distance_2inverse_distance_arrays(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_xpos, PyObject *__pyx_v_ypos, PyObject *__pyx_v_values, PyObject *__pyx_v_size, PyObject *__pyx_v_geotransform, double __pyx_v_power, double __pyx_v_smoothing, int __pyx_v_num_threads, int __pyx_v_k_nearest, double __pyx_v_max_radius, PyObject *__pyx_v_out, PyObject *__pyx_v_mask, double __pyx_v_nodata, PyObject *__pyx_v_precision) {
+  __Pyx_memviewslice __pyx_v_cxpos = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_cypos = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_cvalues = { 0, 0, { 0 }, { 0 }, { 0 } };
+  int __pyx_v_N;
+  int __pyx_v_single;
+  int __pyx_v_xsize;
+  int __pyx_v_ysize;
+  struct __pyx_t_6pymica_7methods_9idw_power_IdwPower __pyx_v_cpower;
+  float __pyx_v_csmoothing;
+  arrayobject *__pyx_v_geotransform0 = 0;
+  __Pyx_memviewslice __pyx_v_cgeotransform = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_cmask = { 0, 0, { 0 }, { 0 }, { 0 } };
+  unsigned char const *__pyx_v_mask_ptr;
+  __Pyx_memviewslice __pyx_v_out32 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_out64 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  __Pyx_memviewslice __pyx_t_5 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_t_6 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_t_7 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  int __pyx_t_8;
+  int __pyx_t_9;
+  int __pyx_t_10;
+  __Pyx_memviewslice __pyx_t_11 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  int __pyx_t_12;
+  unsigned int __pyx_t_13;
+  PyObject *__pyx_t_14 = NULL;
+  __Pyx_memviewslice __pyx_t_15 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  Py_ssize_t __pyx_t_16;
+  Py_ssize_t __pyx_t_17;
+  int __pyx_t_18;
+  __Pyx_memviewslice __pyx_t_19 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_t_20 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("inverse_distance_arrays", 0);
+  __Pyx_INCREF(__pyx_v_out);
+  __Pyx_INCREF(__pyx_v_mask);
+
+  /* "pymica/methods/inverse_distance.pyx":115
+ *         np.array: The interpolated data, `out` if it was provided
+ *     """
+ *     cdef const double[::1] cxpos = np.ascontiguousarray(xpos, dtype=DTYPE)             # <<<<<<<<<<<<<<
+ *     cdef const double[::1] cypos = np.ascontiguousarray(ypos, dtype=DTYPE)
+ *     cdef const double[::1] cvalues = np.ascontiguousarray(values, dtype=DTYPE)
  */
-  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 53, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 115, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_INCREF(__pyx_n_s_d);
-  __Pyx_GIVEREF(__pyx_n_s_d);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_d)) __PYX_ERR(0, 53, __pyx_L1_error);
-  __Pyx_INCREF(__pyx_v_xpos0);
-  __Pyx_GIVEREF(__pyx_v_xpos0);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_v_xpos0)) __PYX_ERR(0, 53, __pyx_L1_error);
-  __pyx_t_2 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_7cpython_5array_array), __pyx_t_1, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 53, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_ascontiguousarray); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 115, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_v_xpos = ((arrayobject *)__pyx_t_2);
-  __pyx_t_2 = 0;
-
-  /* "pymica/methods/inverse_distance.pyx":54
- *     #http://cython.readthedocs.io/en/latest/src/tutorial/array.html
- *     cdef array.array xpos = array.array('d', xpos0)
- *     cdef double[:] cxpos = xpos             # <<<<<<<<<<<<<<
- *     cdef array.array ypos = array.array('d', ypos0)
- *     cdef double[:] cypos = ypos
- */
-  __pyx_t_5 = __Pyx_PyObject_to_MemoryviewSlice_ds_double(((PyObject *)__pyx_v_xpos), PyBUF_WRITABLE); if (unlikely(!__pyx_t_5.memview)) __PYX_ERR(0, 54, __pyx_L1_error)
+  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 115, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_v_xpos);
+  __Pyx_GIVEREF(__pyx_v_xpos);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_xpos)) __PYX_ERR(0, 115, __pyx_L1_error);
+  __pyx_t_3 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 115, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_DTYPE); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 115, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_dtype, __pyx_t_4) < 0) __PYX_ERR(0, 115, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_1, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 115, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_5 = __Pyx_PyObject_to_MemoryviewSlice_dc_double__const__(__pyx_t_4, 0); if (unlikely(!__pyx_t_5.memview)) __PYX_ERR(0, 115, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __pyx_v_cxpos = __pyx_t_5;
   __pyx_t_5.memview = NULL;
   __pyx_t_5.data = NULL;
 
-  /* "pymica/methods/inverse_distance.pyx":55
- *     cdef array.array xpos = array.array('d', xpos0)
- *     cdef double[:] cxpos = xpos
- *     cdef array.array ypos = array.array('d', ypos0)             # <<<<<<<<<<<<<<
- *     cdef double[:] cypos = ypos
- *     cdef array.array values = array.array('d', values0)
+  /* "pymica/methods/inverse_distance.pyx":116
+ *     """
+ *     cdef const double[::1] cxpos = np.ascontiguousarray(xpos, dtype=DTYPE)
+ *     cdef const double[::1] cypos = np.ascontiguousarray(ypos, dtype=DTYPE)             # <<<<<<<<<<<<<<
+ *     cdef const double[::1] cvalues = np.ascontiguousarray(values, dtype=DTYPE)
+ * 
  */
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 55, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_INCREF(__pyx_n_s_d);
-  __Pyx_GIVEREF(__pyx_n_s_d);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_n_s_d)) __PYX_ERR(0, 55, __pyx_L1_error);
-  __Pyx_INCREF(__pyx_v_ypos0);
-  __Pyx_GIVEREF(__pyx_v_ypos0);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_v_ypos0)) __PYX_ERR(0, 55, __pyx_L1_error);
-  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_7cpython_5array_array), __pyx_t_2, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 55, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 116, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_ascontiguousarray); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 116, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 116, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_INCREF(__pyx_v_ypos);
+  __Pyx_GIVEREF(__pyx_v_ypos);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_ypos)) __PYX_ERR(0, 116, __pyx_L1_error);
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 116, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_DTYPE); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 116, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_dtype, __pyx_t_2) < 0) __PYX_ERR(0, 116, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_v_ypos = ((arrayobject *)__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "pymica/methods/inverse_distance.pyx":56
- *     cdef double[:] cxpos = xpos
- *     cdef array.array ypos = array.array('d', ypos0)
- *     cdef double[:] cypos = ypos             # <<<<<<<<<<<<<<
- *     cdef array.array values = array.array('d', values0)
- *     cdef double[:] cvalues = values
- */
-  __pyx_t_5 = __Pyx_PyObject_to_MemoryviewSlice_ds_double(((PyObject *)__pyx_v_ypos), PyBUF_WRITABLE); if (unlikely(!__pyx_t_5.memview)) __PYX_ERR(0, 56, __pyx_L1_error)
-  __pyx_v_cypos = __pyx_t_5;
-  __pyx_t_5.memview = NULL;
-  __pyx_t_5.data = NULL;
+  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_4, __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 116, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_6 = __Pyx_PyObject_to_MemoryviewSlice_dc_double__const__(__pyx_t_2, 0); if (unlikely(!__pyx_t_6.memview)) __PYX_ERR(0, 116, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_cypos = __pyx_t_6;
+  __pyx_t_6.memview = NULL;
+  __pyx_t_6.data = NULL;
 
-  /* "pymica/methods/inverse_distance.pyx":57
- *     cdef array.array ypos = array.array('d', ypos0)
- *     cdef double[:] cypos = ypos
- *     cdef array.array values = array.array('d', values0)             # <<<<<<<<<<<<<<
- *     cdef double[:] cvalues = values
+  /* "pymica/methods/inverse_distance.pyx":117
+ *     cdef const double[::1] cxpos = np.ascontiguousarray(xpos, dtype=DTYPE)
+ *     cdef const double[::1] cypos = np.ascontiguousarray(ypos, dtype=DTYPE)
+ *     cdef const double[::1] cvalues = np.ascontiguousarray(values, dtype=DTYPE)             # <<<<<<<<<<<<<<
  * 
+ *     cdef int N
  */
-  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 57, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 117, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_ascontiguousarray); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 117, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_INCREF(__pyx_n_s_d);
-  __Pyx_GIVEREF(__pyx_n_s_d);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_d)) __PYX_ERR(0, 57, __pyx_L1_error);
-  __Pyx_INCREF(__pyx_v_values0);
-  __Pyx_GIVEREF(__pyx_v_values0);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_v_values0)) __PYX_ERR(0, 57, __pyx_L1_error);
-  __pyx_t_2 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_7cpython_5array_array), __pyx_t_1, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 57, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 117, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_v_values);
+  __Pyx_GIVEREF(__pyx_v_values);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_v_values)) __PYX_ERR(0, 117, __pyx_L1_error);
+  __pyx_t_4 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 117, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_DTYPE); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 117, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_dtype, __pyx_t_3) < 0) __PYX_ERR(0, 117, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_2, __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 117, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_v_values = ((arrayobject *)__pyx_t_2);
-  __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_7 = __Pyx_PyObject_to_MemoryviewSlice_dc_double__const__(__pyx_t_3, 0); if (unlikely(!__pyx_t_7.memview)) __PYX_ERR(0, 117, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_v_cvalues = __pyx_t_7;
+  __pyx_t_7.memview = NULL;
+  __pyx_t_7.data = NULL;
 
-  /* "pymica/methods/inverse_distance.pyx":58
- *     cdef double[:] cypos = ypos
- *     cdef array.array values = array.array('d', values0)
- *     cdef double[:] cvalues = values             # <<<<<<<<<<<<<<
+  /* "pymica/methods/inverse_distance.pyx":120
  * 
- *     cdef int i, j
+ *     cdef int N
+ *     N = cvalues.shape[0]             # <<<<<<<<<<<<<<
+ *     if cxpos.shape[0] != N or cypos.shape[0] != N:
+ *         raise ValueError("xpos, ypos and values must have the same length")
  */
-  __pyx_t_5 = __Pyx_PyObject_to_MemoryviewSlice_ds_double(((PyObject *)__pyx_v_values), PyBUF_WRITABLE); if (unlikely(!__pyx_t_5.memview)) __PYX_ERR(0, 58, __pyx_L1_error)
-  __pyx_v_cvalues = __pyx_t_5;
-  __pyx_t_5.memview = NULL;
-  __pyx_t_5.data = NULL;
+  __pyx_v_N = (__pyx_v_cvalues.shape[0]);
+
+  /* "pymica/methods/inverse_distance.pyx":121
+ *     cdef int N
+ *     N = cvalues.shape[0]
+ *     if cxpos.shape[0] != N or cypos.shape[0] != N:             # <<<<<<<<<<<<<<
+ *         raise ValueError("xpos, ypos and values must have the same length")
+ *     if k_nearest < 0:
+ */
+  __pyx_t_9 = ((__pyx_v_cxpos.shape[0]) != __pyx_v_N);
+  if (!__pyx_t_9) {
+  } else {
+    __pyx_t_8 = __pyx_t_9;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_9 = ((__pyx_v_cypos.shape[0]) != __pyx_v_N);
+  __pyx_t_8 = __pyx_t_9;
+  __pyx_L4_bool_binop_done:;
+  if (unlikely(__pyx_t_8)) {
+
+    /* "pymica/methods/inverse_distance.pyx":122
+ *     N = cvalues.shape[0]
+ *     if cxpos.shape[0] != N or cypos.shape[0] != N:
+ *         raise ValueError("xpos, ypos and values must have the same length")             # <<<<<<<<<<<<<<
+ *     if k_nearest < 0:
+ *         raise ValueError("k_nearest must be 0 or a positive number of stations")
+ */
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__12, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 122, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(0, 122, __pyx_L1_error)
+
+    /* "pymica/methods/inverse_distance.pyx":121
+ *     cdef int N
+ *     N = cvalues.shape[0]
+ *     if cxpos.shape[0] != N or cypos.shape[0] != N:             # <<<<<<<<<<<<<<
+ *         raise ValueError("xpos, ypos and values must have the same length")
+ *     if k_nearest < 0:
+ */
+  }
+
+  /* "pymica/methods/inverse_distance.pyx":123
+ *     if cxpos.shape[0] != N or cypos.shape[0] != N:
+ *         raise ValueError("xpos, ypos and values must have the same length")
+ *     if k_nearest < 0:             # <<<<<<<<<<<<<<
+ *         raise ValueError("k_nearest must be 0 or a positive number of stations")
+ *     if max_radius < 0:
+ */
+  __pyx_t_8 = (__pyx_v_k_nearest < 0);
+  if (unlikely(__pyx_t_8)) {
+
+    /* "pymica/methods/inverse_distance.pyx":124
+ *         raise ValueError("xpos, ypos and values must have the same length")
+ *     if k_nearest < 0:
+ *         raise ValueError("k_nearest must be 0 or a positive number of stations")             # <<<<<<<<<<<<<<
+ *     if max_radius < 0:
+ *         raise ValueError("max_radius must be 0 or a positive distance")
+ */
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__13, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 124, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(0, 124, __pyx_L1_error)
+
+    /* "pymica/methods/inverse_distance.pyx":123
+ *     if cxpos.shape[0] != N or cypos.shape[0] != N:
+ *         raise ValueError("xpos, ypos and values must have the same length")
+ *     if k_nearest < 0:             # <<<<<<<<<<<<<<
+ *         raise ValueError("k_nearest must be 0 or a positive number of stations")
+ *     if max_radius < 0:
+ */
+  }
+
+  /* "pymica/methods/inverse_distance.pyx":125
+ *     if k_nearest < 0:
+ *         raise ValueError("k_nearest must be 0 or a positive number of stations")
+ *     if max_radius < 0:             # <<<<<<<<<<<<<<
+ *         raise ValueError("max_radius must be 0 or a positive distance")
+ *     if precision not in ('float32', 'float64'):
+ */
+  __pyx_t_8 = (__pyx_v_max_radius < 0.0);
+  if (unlikely(__pyx_t_8)) {
+
+    /* "pymica/methods/inverse_distance.pyx":126
+ *         raise ValueError("k_nearest must be 0 or a positive number of stations")
+ *     if max_radius < 0:
+ *         raise ValueError("max_radius must be 0 or a positive distance")             # <<<<<<<<<<<<<<
+ *     if precision not in ('float32', 'float64'):
+ *         raise ValueError("precision must be 'float32' or 'float64'")
+ */
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__14, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 126, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(0, 126, __pyx_L1_error)
+
+    /* "pymica/methods/inverse_distance.pyx":125
+ *     if k_nearest < 0:
+ *         raise ValueError("k_nearest must be 0 or a positive number of stations")
+ *     if max_radius < 0:             # <<<<<<<<<<<<<<
+ *         raise ValueError("max_radius must be 0 or a positive distance")
+ *     if precision not in ('float32', 'float64'):
+ */
+  }
+
+  /* "pymica/methods/inverse_distance.pyx":127
+ *     if max_radius < 0:
+ *         raise ValueError("max_radius must be 0 or a positive distance")
+ *     if precision not in ('float32', 'float64'):             # <<<<<<<<<<<<<<
+ *         raise ValueError("precision must be 'float32' or 'float64'")
+ *     cdef bint single = precision == 'float32'
+ */
+  __Pyx_INCREF(__pyx_v_precision);
+  __pyx_t_3 = __pyx_v_precision;
+  __pyx_t_9 = (__Pyx_PyString_Equals(__pyx_t_3, __pyx_n_s_float32, Py_NE)); if (unlikely((__pyx_t_9 < 0))) __PYX_ERR(0, 127, __pyx_L1_error)
+  if (__pyx_t_9) {
+  } else {
+    __pyx_t_8 = __pyx_t_9;
+    goto __pyx_L9_bool_binop_done;
+  }
+  __pyx_t_9 = (__Pyx_PyString_Equals(__pyx_t_3, __pyx_n_s_float64, Py_NE)); if (unlikely((__pyx_t_9 < 0))) __PYX_ERR(0, 127, __pyx_L1_error)
+  __pyx_t_8 = __pyx_t_9;
+  __pyx_L9_bool_binop_done:;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_9 = __pyx_t_8;
+  if (unlikely(__pyx_t_9)) {
 
-  /* "pymica/methods/inverse_distance.pyx":61
+    /* "pymica/methods/inverse_distance.pyx":128
+ *         raise ValueError("max_radius must be 0 or a positive distance")
+ *     if precision not in ('float32', 'float64'):
+ *         raise ValueError("precision must be 'float32' or 'float64'")             # <<<<<<<<<<<<<<
+ *     cdef bint single = precision == 'float32'
+ * 
+ */
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__15, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 128, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(0, 128, __pyx_L1_error)
+
+    /* "pymica/methods/inverse_distance.pyx":127
+ *     if max_radius < 0:
+ *         raise ValueError("max_radius must be 0 or a positive distance")
+ *     if precision not in ('float32', 'float64'):             # <<<<<<<<<<<<<<
+ *         raise ValueError("precision must be 'float32' or 'float64'")
+ *     cdef bint single = precision == 'float32'
+ */
+  }
+
+  /* "pymica/methods/inverse_distance.pyx":129
+ *     if precision not in ('float32', 'float64'):
+ *         raise ValueError("precision must be 'float32' or 'float64'")
+ *     cdef bint single = precision == 'float32'             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int xsize = size[1]
+ */
+  __pyx_t_3 = PyObject_RichCompare(__pyx_v_precision, __pyx_n_s_float32, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 129, __pyx_L1_error)
+  __pyx_t_9 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely((__pyx_t_9 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 129, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_v_single = __pyx_t_9;
+
+  /* "pymica/methods/inverse_distance.pyx":131
+ *     cdef bint single = precision == 'float32'
  * 
- *     cdef int i, j
  *     cdef int xsize = size[1]             # <<<<<<<<<<<<<<
  *     cdef int ysize = size[0]
- *     cdef double y
+ *     cdef IdwPower cpower = make_power(power)
  */
-  __pyx_t_4 = __Pyx_PyInt_As_int(PyList_GET_ITEM(__pyx_v_size, 1)); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 61, __pyx_L1_error)
-  __pyx_v_xsize = __pyx_t_4;
+  __pyx_t_10 = __Pyx_PyInt_As_int(PyList_GET_ITEM(__pyx_v_size, 1)); if (unlikely((__pyx_t_10 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 131, __pyx_L1_error)
+  __pyx_v_xsize = __pyx_t_10;
 
-  /* "pymica/methods/inverse_distance.pyx":62
- *     cdef int i, j
+  /* "pymica/methods/inverse_distance.pyx":132
+ * 
  *     cdef int xsize = size[1]
  *     cdef int ysize = size[0]             # <<<<<<<<<<<<<<
- *     cdef double y
- *     cdef double x
+ *     cdef IdwPower cpower = make_power(power)
+ *     cdef float csmoothing = smoothing
+ */
+  __pyx_t_10 = __Pyx_PyInt_As_int(PyList_GET_ITEM(__pyx_v_size, 0)); if (unlikely((__pyx_t_10 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 132, __pyx_L1_error)
+  __pyx_v_ysize = __pyx_t_10;
+
+  /* "pymica/methods/inverse_distance.pyx":133
+ *     cdef int xsize = size[1]
+ *     cdef int ysize = size[0]
+ *     cdef IdwPower cpower = make_power(power)             # <<<<<<<<<<<<<<
+ *     cdef float csmoothing = smoothing
+ * 
+ */
+  __pyx_v_cpower = __pyx_f_6pymica_7methods_9idw_power_make_power(__pyx_v_power);
+
+  /* "pymica/methods/inverse_distance.pyx":134
+ *     cdef int ysize = size[0]
+ *     cdef IdwPower cpower = make_power(power)
+ *     cdef float csmoothing = smoothing             # <<<<<<<<<<<<<<
+ * 
+ *     cdef array.array geotransform0 = array.array('d', geotransform)
+ */
+  __pyx_v_csmoothing = __pyx_v_smoothing;
+
+  /* "pymica/methods/inverse_distance.pyx":136
+ *     cdef float csmoothing = smoothing
+ * 
+ *     cdef array.array geotransform0 = array.array('d', geotransform)             # <<<<<<<<<<<<<<
+ *     cdef double[:] cgeotransform = geotransform0
+ * 
+ */
+  __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 136, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_INCREF(__pyx_n_s_d);
+  __Pyx_GIVEREF(__pyx_n_s_d);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_n_s_d)) __PYX_ERR(0, 136, __pyx_L1_error);
+  __Pyx_INCREF(__pyx_v_geotransform);
+  __Pyx_GIVEREF(__pyx_v_geotransform);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_v_geotransform)) __PYX_ERR(0, 136, __pyx_L1_error);
+  __pyx_t_4 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_7cpython_5array_array), __pyx_t_3, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 136, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_v_geotransform0 = ((arrayobject *)__pyx_t_4);
+  __pyx_t_4 = 0;
+
+  /* "pymica/methods/inverse_distance.pyx":137
+ * 
+ *     cdef array.array geotransform0 = array.array('d', geotransform)
+ *     cdef double[:] cgeotransform = geotransform0             # <<<<<<<<<<<<<<
+ * 
+ *     if out is None:
+ */
+  __pyx_t_11 = __Pyx_PyObject_to_MemoryviewSlice_ds_double(((PyObject *)__pyx_v_geotransform0), PyBUF_WRITABLE); if (unlikely(!__pyx_t_11.memview)) __PYX_ERR(0, 137, __pyx_L1_error)
+  __pyx_v_cgeotransform = __pyx_t_11;
+  __pyx_t_11.memview = NULL;
+  __pyx_t_11.data = NULL;
+
+  /* "pymica/methods/inverse_distance.pyx":139
+ *     cdef double[:] cgeotransform = geotransform0
+ * 
+ *     if out is None:             # <<<<<<<<<<<<<<
+ *         out = np.empty((ysize, xsize), dtype=DTYPE)
+ *     elif (not isinstance(out, np.ndarray) or out.shape != (ysize, xsize)
+ */
+  __pyx_t_9 = (__pyx_v_out == Py_None);
+  if (__pyx_t_9) {
+
+    /* "pymica/methods/inverse_distance.pyx":140
+ * 
+ *     if out is None:
+ *         out = np.empty((ysize, xsize), dtype=DTYPE)             # <<<<<<<<<<<<<<
+ *     elif (not isinstance(out, np.ndarray) or out.shape != (ysize, xsize)
+ *           or out.dtype not in (np.float32, np.float64)
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 140, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 140, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_ysize); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 140, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_xsize); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 140, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 140, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_4);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_4)) __PYX_ERR(0, 140, __pyx_L1_error);
+    __Pyx_GIVEREF(__pyx_t_2);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_2)) __PYX_ERR(0, 140, __pyx_L1_error);
+    __pyx_t_4 = 0;
+    __pyx_t_2 = 0;
+    __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 140, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_1);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1)) __PYX_ERR(0, 140, __pyx_L1_error);
+    __pyx_t_1 = 0;
+    __pyx_t_1 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 140, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_DTYPE); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 140, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_dtype, __pyx_t_4) < 0) __PYX_ERR(0, 140, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_2, __pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 140, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF_SET(__pyx_v_out, __pyx_t_4);
+    __pyx_t_4 = 0;
+
+    /* "pymica/methods/inverse_distance.pyx":139
+ *     cdef double[:] cgeotransform = geotransform0
+ * 
+ *     if out is None:             # <<<<<<<<<<<<<<
+ *         out = np.empty((ysize, xsize), dtype=DTYPE)
+ *     elif (not isinstance(out, np.ndarray) or out.shape != (ysize, xsize)
+ */
+    goto __pyx_L11;
+  }
+
+  /* "pymica/methods/inverse_distance.pyx":141
+ *     if out is None:
+ *         out = np.empty((ysize, xsize), dtype=DTYPE)
+ *     elif (not isinstance(out, np.ndarray) or out.shape != (ysize, xsize)             # <<<<<<<<<<<<<<
+ *           or out.dtype not in (np.float32, np.float64)
+ *           or not out.flags['C_CONTIGUOUS']):
+ */
+  __pyx_t_8 = __Pyx_TypeCheck(__pyx_v_out, __pyx_ptype_5numpy_ndarray); 
+  __pyx_t_12 = (!__pyx_t_8);
+  if (!__pyx_t_12) {
+  } else {
+    __pyx_t_9 = __pyx_t_12;
+    goto __pyx_L12_bool_binop_done;
+  }
+
+  /* "pymica/methods/inverse_distance.pyx":142
+ *         out = np.empty((ysize, xsize), dtype=DTYPE)
+ *     elif (not isinstance(out, np.ndarray) or out.shape != (ysize, xsize)
+ *           or out.dtype not in (np.float32, np.float64)             # <<<<<<<<<<<<<<
+ *           or not out.flags['C_CONTIGUOUS']):
+ *         raise ValueError("out must be a C-contiguous float32 or float64 array "
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_out, __pyx_n_s_shape); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 141, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+
+  /* "pymica/methods/inverse_distance.pyx":141
+ *     if out is None:
+ *         out = np.empty((ysize, xsize), dtype=DTYPE)
+ *     elif (not isinstance(out, np.ndarray) or out.shape != (ysize, xsize)             # <<<<<<<<<<<<<<
+ *           or out.dtype not in (np.float32, np.float64)
+ *           or not out.flags['C_CONTIGUOUS']):
+ */
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_ysize); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 141, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_xsize); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 141, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 141, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GIVEREF(__pyx_t_1);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1)) __PYX_ERR(0, 141, __pyx_L1_error);
+  __Pyx_GIVEREF(__pyx_t_2);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_2)) __PYX_ERR(0, 141, __pyx_L1_error);
+  __pyx_t_1 = 0;
+  __pyx_t_2 = 0;
+  __pyx_t_2 = PyObject_RichCompare(__pyx_t_4, __pyx_t_3, Py_NE); __Pyx_XGOTREF(__pyx_t_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 141, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_12 < 0))) __PYX_ERR(0, 141, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (!__pyx_t_12) {
+  } else {
+    __pyx_t_9 = __pyx_t_12;
+    goto __pyx_L12_bool_binop_done;
+  }
+
+  /* "pymica/methods/inverse_distance.pyx":142
+ *         out = np.empty((ysize, xsize), dtype=DTYPE)
+ *     elif (not isinstance(out, np.ndarray) or out.shape != (ysize, xsize)
+ *           or out.dtype not in (np.float32, np.float64)             # <<<<<<<<<<<<<<
+ *           or not out.flags['C_CONTIGUOUS']):
+ *         raise ValueError("out must be a C-contiguous float32 or float64 array "
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_out, __pyx_n_s_dtype); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 142, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 142, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_float32); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 142, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = PyObject_RichCompare(__pyx_t_2, __pyx_t_4, Py_NE); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 142, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_8 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely((__pyx_t_8 < 0))) __PYX_ERR(0, 142, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (__pyx_t_8) {
+  } else {
+    __pyx_t_12 = __pyx_t_8;
+    goto __pyx_L16_bool_binop_done;
+  }
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 142, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_float64); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 142, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = PyObject_RichCompare(__pyx_t_2, __pyx_t_4, Py_NE); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 142, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_8 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely((__pyx_t_8 < 0))) __PYX_ERR(0, 142, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_12 = __pyx_t_8;
+  __pyx_L16_bool_binop_done:;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_8 = __pyx_t_12;
+  if (!__pyx_t_8) {
+  } else {
+    __pyx_t_9 = __pyx_t_8;
+    goto __pyx_L12_bool_binop_done;
+  }
+
+  /* "pymica/methods/inverse_distance.pyx":143
+ *     elif (not isinstance(out, np.ndarray) or out.shape != (ysize, xsize)
+ *           or out.dtype not in (np.float32, np.float64)
+ *           or not out.flags['C_CONTIGUOUS']):             # <<<<<<<<<<<<<<
+ *         raise ValueError("out must be a C-contiguous float32 or float64 array "
+ *                          "with shape " + str((ysize, xsize)))
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_out, __pyx_n_s_flags); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 143, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_Dict_GetItem(__pyx_t_2, __pyx_n_s_C_CONTIGUOUS); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 143, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_8 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely((__pyx_t_8 < 0))) __PYX_ERR(0, 143, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_12 = (!__pyx_t_8);
+  __pyx_t_9 = __pyx_t_12;
+  __pyx_L12_bool_binop_done:;
+
+  /* "pymica/methods/inverse_distance.pyx":141
+ *     if out is None:
+ *         out = np.empty((ysize, xsize), dtype=DTYPE)
+ *     elif (not isinstance(out, np.ndarray) or out.shape != (ysize, xsize)             # <<<<<<<<<<<<<<
+ *           or out.dtype not in (np.float32, np.float64)
+ *           or not out.flags['C_CONTIGUOUS']):
+ */
+  if (unlikely(__pyx_t_9)) {
+
+    /* "pymica/methods/inverse_distance.pyx":145
+ *           or not out.flags['C_CONTIGUOUS']):
+ *         raise ValueError("out must be a C-contiguous float32 or float64 array "
+ *                          "with shape " + str((ysize, xsize)))             # <<<<<<<<<<<<<<
+ * 
+ *     cdef const unsigned char[:, ::1] cmask
+ */
+    __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_ysize); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 145, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_xsize); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 145, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 145, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_GIVEREF(__pyx_t_3);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3)) __PYX_ERR(0, 145, __pyx_L1_error);
+    __Pyx_GIVEREF(__pyx_t_2);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_2)) __PYX_ERR(0, 145, __pyx_L1_error);
+    __pyx_t_3 = 0;
+    __pyx_t_2 = 0;
+    __pyx_t_2 = __Pyx_PyObject_Str(__pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 145, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = PyNumber_Add(__pyx_kp_s_out_must_be_a_C_contiguous_float, __pyx_t_2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 145, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+    /* "pymica/methods/inverse_distance.pyx":144
+ *           or out.dtype not in (np.float32, np.float64)
+ *           or not out.flags['C_CONTIGUOUS']):
+ *         raise ValueError("out must be a C-contiguous float32 or float64 array "             # <<<<<<<<<<<<<<
+ *                          "with shape " + str((ysize, xsize)))
+ * 
+ */
+    __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_builtin_ValueError, __pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 144, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 144, __pyx_L1_error)
+
+    /* "pymica/methods/inverse_distance.pyx":141
+ *     if out is None:
+ *         out = np.empty((ysize, xsize), dtype=DTYPE)
+ *     elif (not isinstance(out, np.ndarray) or out.shape != (ysize, xsize)             # <<<<<<<<<<<<<<
+ *           or out.dtype not in (np.float32, np.float64)
+ *           or not out.flags['C_CONTIGUOUS']):
+ */
+  }
+  __pyx_L11:;
+
+  /* "pymica/methods/inverse_distance.pyx":148
+ * 
+ *     cdef const unsigned char[:, ::1] cmask
+ *     cdef const unsigned char *mask_ptr = NULL             # <<<<<<<<<<<<<<
+ *     if mask is not None:
+ *         mask = np.asarray(mask)
+ */
+  __pyx_v_mask_ptr = NULL;
+
+  /* "pymica/methods/inverse_distance.pyx":149
+ *     cdef const unsigned char[:, ::1] cmask
+ *     cdef const unsigned char *mask_ptr = NULL
+ *     if mask is not None:             # <<<<<<<<<<<<<<
+ *         mask = np.asarray(mask)
+ *         if mask.shape != (ysize, xsize):
+ */
+  __pyx_t_9 = (__pyx_v_mask != Py_None);
+  if (__pyx_t_9) {
+
+    /* "pymica/methods/inverse_distance.pyx":150
+ *     cdef const unsigned char *mask_ptr = NULL
+ *     if mask is not None:
+ *         mask = np.asarray(mask)             # <<<<<<<<<<<<<<
+ *         if mask.shape != (ysize, xsize):
+ *             raise ValueError("mask must have shape " + str((ysize, xsize)))
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 150, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_asarray); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 150, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = NULL;
+    __pyx_t_13 = 0;
+    #if CYTHON_UNPACK_METHODS
+    if (unlikely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+        __pyx_t_13 = 1;
+      }
+    }
+    #endif
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_v_mask};
+      __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_13, 1+__pyx_t_13);
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 150, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    }
+    __Pyx_DECREF_SET(__pyx_v_mask, __pyx_t_2);
+    __pyx_t_2 = 0;
+
+    /* "pymica/methods/inverse_distance.pyx":151
+ *     if mask is not None:
+ *         mask = np.asarray(mask)
+ *         if mask.shape != (ysize, xsize):             # <<<<<<<<<<<<<<
+ *             raise ValueError("mask must have shape " + str((ysize, xsize)))
+ *         cmask = np.ascontiguousarray(mask != 0).view(np.uint8)
+ */
+    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_mask, __pyx_n_s_shape); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 151, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_ysize); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 151, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_xsize); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 151, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 151, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_GIVEREF(__pyx_t_3);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_3)) __PYX_ERR(0, 151, __pyx_L1_error);
+    __Pyx_GIVEREF(__pyx_t_4);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_4)) __PYX_ERR(0, 151, __pyx_L1_error);
+    __pyx_t_3 = 0;
+    __pyx_t_4 = 0;
+    __pyx_t_4 = PyObject_RichCompare(__pyx_t_2, __pyx_t_1, Py_NE); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 151, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_9 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely((__pyx_t_9 < 0))) __PYX_ERR(0, 151, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(__pyx_t_9)) {
+
+      /* "pymica/methods/inverse_distance.pyx":152
+ *         mask = np.asarray(mask)
+ *         if mask.shape != (ysize, xsize):
+ *             raise ValueError("mask must have shape " + str((ysize, xsize)))             # <<<<<<<<<<<<<<
+ *         cmask = np.ascontiguousarray(mask != 0).view(np.uint8)
+ *         if ysize > 0 and xsize > 0:
+ */
+      __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_ysize); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 152, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_xsize); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 152, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 152, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_GIVEREF(__pyx_t_4);
+      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_4)) __PYX_ERR(0, 152, __pyx_L1_error);
+      __Pyx_GIVEREF(__pyx_t_1);
+      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_1)) __PYX_ERR(0, 152, __pyx_L1_error);
+      __pyx_t_4 = 0;
+      __pyx_t_1 = 0;
+      __pyx_t_1 = __Pyx_PyObject_Str(__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 152, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __pyx_t_2 = PyNumber_Add(__pyx_kp_s_mask_must_have_shape, __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 152, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_builtin_ValueError, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 152, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __PYX_ERR(0, 152, __pyx_L1_error)
+
+      /* "pymica/methods/inverse_distance.pyx":151
+ *     if mask is not None:
+ *         mask = np.asarray(mask)
+ *         if mask.shape != (ysize, xsize):             # <<<<<<<<<<<<<<
+ *             raise ValueError("mask must have shape " + str((ysize, xsize)))
+ *         cmask = np.ascontiguousarray(mask != 0).view(np.uint8)
+ */
+    }
+
+    /* "pymica/methods/inverse_distance.pyx":153
+ *         if mask.shape != (ysize, xsize):
+ *             raise ValueError("mask must have shape " + str((ysize, xsize)))
+ *         cmask = np.ascontiguousarray(mask != 0).view(np.uint8)             # <<<<<<<<<<<<<<
+ *         if ysize > 0 and xsize > 0:
+ *             mask_ptr = &cmask[0, 0]
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 153, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_ascontiguousarray); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 153, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = __Pyx_PyInt_NeObjC(__pyx_v_mask, __pyx_int_0, 0, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 153, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_14 = NULL;
+    __pyx_t_13 = 0;
+    #if CYTHON_UNPACK_METHODS
+    if (unlikely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_14 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_14)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_14);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+        __pyx_t_13 = 1;
+      }
+    }
+    #endif
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_14, __pyx_t_4};
+      __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_13, 1+__pyx_t_13);
+      __Pyx_XDECREF(__pyx_t_14); __pyx_t_14 = 0;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 153, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    }
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_view); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 153, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 153, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_uint8); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 153, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = NULL;
+    __pyx_t_13 = 0;
+    #if CYTHON_UNPACK_METHODS
+    if (likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_2)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_2);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+        __pyx_t_13 = 1;
+      }
+    }
+    #endif
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_2, __pyx_t_4};
+      __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_13, 1+__pyx_t_13);
+      __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 153, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    }
+    __pyx_t_15 = __Pyx_PyObject_to_MemoryviewSlice_d_dc_unsigned_char__const__(__pyx_t_1, 0); if (unlikely(!__pyx_t_15.memview)) __PYX_ERR(0, 153, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_v_cmask = __pyx_t_15;
+    __pyx_t_15.memview = NULL;
+    __pyx_t_15.data = NULL;
+
+    /* "pymica/methods/inverse_distance.pyx":154
+ *             raise ValueError("mask must have shape " + str((ysize, xsize)))
+ *         cmask = np.ascontiguousarray(mask != 0).view(np.uint8)
+ *         if ysize > 0 and xsize > 0:             # <<<<<<<<<<<<<<
+ *             mask_ptr = &cmask[0, 0]
+ * 
+ */
+    __pyx_t_12 = (__pyx_v_ysize > 0);
+    if (__pyx_t_12) {
+    } else {
+      __pyx_t_9 = __pyx_t_12;
+      goto __pyx_L21_bool_binop_done;
+    }
+    __pyx_t_12 = (__pyx_v_xsize > 0);
+    __pyx_t_9 = __pyx_t_12;
+    __pyx_L21_bool_binop_done:;
+    if (__pyx_t_9) {
+
+      /* "pymica/methods/inverse_distance.pyx":155
+ *         cmask = np.ascontiguousarray(mask != 0).view(np.uint8)
+ *         if ysize > 0 and xsize > 0:
+ *             mask_ptr = &cmask[0, 0]             # <<<<<<<<<<<<<<
+ * 
+ *     if num_threads <= 0:
+ */
+      __pyx_t_16 = 0;
+      __pyx_t_17 = 0;
+      __pyx_v_mask_ptr = (&(*((unsigned char const  *) ( /* dim=1 */ ((char *) (((unsigned char const  *) ( /* dim=0 */ (__pyx_v_cmask.data + __pyx_t_16 * __pyx_v_cmask.strides[0]) )) + __pyx_t_17)) ))));
+
+      /* "pymica/methods/inverse_distance.pyx":154
+ *             raise ValueError("mask must have shape " + str((ysize, xsize)))
+ *         cmask = np.ascontiguousarray(mask != 0).view(np.uint8)
+ *         if ysize > 0 and xsize > 0:             # <<<<<<<<<<<<<<
+ *             mask_ptr = &cmask[0, 0]
+ * 
+ */
+    }
+
+    /* "pymica/methods/inverse_distance.pyx":149
+ *     cdef const unsigned char[:, ::1] cmask
+ *     cdef const unsigned char *mask_ptr = NULL
+ *     if mask is not None:             # <<<<<<<<<<<<<<
+ *         mask = np.asarray(mask)
+ *         if mask.shape != (ysize, xsize):
+ */
+  }
+
+  /* "pymica/methods/inverse_distance.pyx":157
+ *             mask_ptr = &cmask[0, 0]
+ * 
+ *     if num_threads <= 0:             # <<<<<<<<<<<<<<
+ *         num_threads = os.cpu_count() or 1
+ * 
+ */
+  __pyx_t_9 = (__pyx_v_num_threads <= 0);
+  if (__pyx_t_9) {
+
+    /* "pymica/methods/inverse_distance.pyx":158
+ * 
+ *     if num_threads <= 0:
+ *         num_threads = os.cpu_count() or 1             # <<<<<<<<<<<<<<
+ * 
+ *     if k_nearest >= N and max_radius == 0:
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_os); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 158, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_cpu_count); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 158, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = NULL;
+    __pyx_t_13 = 0;
+    #if CYTHON_UNPACK_METHODS
+    if (unlikely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+        __pyx_t_13 = 1;
+      }
+    }
+    #endif
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_3, NULL};
+      __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_4, __pyx_callargs+1-__pyx_t_13, 0+__pyx_t_13);
+      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 158, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    }
+    __pyx_t_9 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely((__pyx_t_9 < 0))) __PYX_ERR(0, 158, __pyx_L1_error)
+    if (!__pyx_t_9) {
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    } else {
+      __pyx_t_18 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_18 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 158, __pyx_L1_error)
+      __pyx_t_10 = __pyx_t_18;
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      goto __pyx_L24_bool_binop_done;
+    }
+    __pyx_t_10 = 1;
+    __pyx_L24_bool_binop_done:;
+    __pyx_v_num_threads = __pyx_t_10;
+
+    /* "pymica/methods/inverse_distance.pyx":157
+ *             mask_ptr = &cmask[0, 0]
+ * 
+ *     if num_threads <= 0:             # <<<<<<<<<<<<<<
+ *         num_threads = os.cpu_count() or 1
+ * 
+ */
+  }
+
+  /* "pymica/methods/inverse_distance.pyx":160
+ *         num_threads = os.cpu_count() or 1
+ * 
+ *     if k_nearest >= N and max_radius == 0:             # <<<<<<<<<<<<<<
+ *         k_nearest = 0
+ * 
+ */
+  __pyx_t_12 = (__pyx_v_k_nearest >= __pyx_v_N);
+  if (__pyx_t_12) {
+  } else {
+    __pyx_t_9 = __pyx_t_12;
+    goto __pyx_L27_bool_binop_done;
+  }
+  __pyx_t_12 = (__pyx_v_max_radius == 0.0);
+  __pyx_t_9 = __pyx_t_12;
+  __pyx_L27_bool_binop_done:;
+  if (__pyx_t_9) {
+
+    /* "pymica/methods/inverse_distance.pyx":161
+ * 
+ *     if k_nearest >= N and max_radius == 0:
+ *         k_nearest = 0             # <<<<<<<<<<<<<<
+ * 
+ *     cdef float[:, ::1] out32
+ */
+    __pyx_v_k_nearest = 0;
+
+    /* "pymica/methods/inverse_distance.pyx":160
+ *         num_threads = os.cpu_count() or 1
+ * 
+ *     if k_nearest >= N and max_radius == 0:             # <<<<<<<<<<<<<<
+ *         k_nearest = 0
+ * 
+ */
+  }
+
+  /* "pymica/methods/inverse_distance.pyx":165
+ *     cdef float[:, ::1] out32
+ *     cdef double[:, ::1] out64
+ *     if out.dtype == np.float32:             # <<<<<<<<<<<<<<
+ *         out32 = out
+ *         fill_field(out32, cxpos, cypos, cvalues, cgeotransform, cpower,
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_out, __pyx_n_s_dtype); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 165, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 165, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_float32); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 165, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = PyObject_RichCompare(__pyx_t_1, __pyx_t_3, Py_EQ); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 165, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_9 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely((__pyx_t_9 < 0))) __PYX_ERR(0, 165, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (__pyx_t_9) {
+
+    /* "pymica/methods/inverse_distance.pyx":166
+ *     cdef double[:, ::1] out64
+ *     if out.dtype == np.float32:
+ *         out32 = out             # <<<<<<<<<<<<<<
+ *         fill_field(out32, cxpos, cypos, cvalues, cgeotransform, cpower,
+ *                    csmoothing, num_threads, k_nearest, max_radius, mask_ptr,
+ */
+    __pyx_t_19 = __Pyx_PyObject_to_MemoryviewSlice_d_dc_float(__pyx_v_out, PyBUF_WRITABLE); if (unlikely(!__pyx_t_19.memview)) __PYX_ERR(0, 166, __pyx_L1_error)
+    __pyx_v_out32 = __pyx_t_19;
+    __pyx_t_19.memview = NULL;
+    __pyx_t_19.data = NULL;
+
+    /* "pymica/methods/inverse_distance.pyx":167
+ *     if out.dtype == np.float32:
+ *         out32 = out
+ *         fill_field(out32, cxpos, cypos, cvalues, cgeotransform, cpower,             # <<<<<<<<<<<<<<
+ *                    csmoothing, num_threads, k_nearest, max_radius, mask_ptr,
+ *                    nodata, single)
+ */
+    __pyx_fuse_0__pyx_f_6pymica_7methods_16inverse_distance_fill_field(__pyx_v_out32, __pyx_v_cxpos, __pyx_v_cypos, __pyx_v_cvalues, __pyx_v_cgeotransform, __pyx_v_cpower, __pyx_v_csmoothing, __pyx_v_num_threads, __pyx_v_k_nearest, __pyx_v_max_radius, __pyx_v_mask_ptr, __pyx_v_nodata, __pyx_v_single); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 167, __pyx_L1_error)
+
+    /* "pymica/methods/inverse_distance.pyx":165
+ *     cdef float[:, ::1] out32
+ *     cdef double[:, ::1] out64
+ *     if out.dtype == np.float32:             # <<<<<<<<<<<<<<
+ *         out32 = out
+ *         fill_field(out32, cxpos, cypos, cvalues, cgeotransform, cpower,
+ */
+    goto __pyx_L29;
+  }
+
+  /* "pymica/methods/inverse_distance.pyx":171
+ *                    nodata, single)
+ *     else:
+ *         out64 = out             # <<<<<<<<<<<<<<
+ *         fill_field(out64, cxpos, cypos, cvalues, cgeotransform, cpower,
+ *                    csmoothing, num_threads, k_nearest, max_radius, mask_ptr,
+ */
+  /*else*/ {
+    __pyx_t_20 = __Pyx_PyObject_to_MemoryviewSlice_d_dc_double(__pyx_v_out, PyBUF_WRITABLE); if (unlikely(!__pyx_t_20.memview)) __PYX_ERR(0, 171, __pyx_L1_error)
+    __pyx_v_out64 = __pyx_t_20;
+    __pyx_t_20.memview = NULL;
+    __pyx_t_20.data = NULL;
+
+    /* "pymica/methods/inverse_distance.pyx":172
+ *     else:
+ *         out64 = out
+ *         fill_field(out64, cxpos, cypos, cvalues, cgeotransform, cpower,             # <<<<<<<<<<<<<<
+ *                    csmoothing, num_threads, k_nearest, max_radius, mask_ptr,
+ *                    nodata, single)
+ */
+    __pyx_fuse_1__pyx_f_6pymica_7methods_16inverse_distance_fill_field(__pyx_v_out64, __pyx_v_cxpos, __pyx_v_cypos, __pyx_v_cvalues, __pyx_v_cgeotransform, __pyx_v_cpower, __pyx_v_csmoothing, __pyx_v_num_threads, __pyx_v_k_nearest, __pyx_v_max_radius, __pyx_v_mask_ptr, __pyx_v_nodata, __pyx_v_single); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 172, __pyx_L1_error)
+  }
+  __pyx_L29:;
+
+  /* "pymica/methods/inverse_distance.pyx":176
+ *                    nodata, single)
+ * 
+ *     return out             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_out);
+  __pyx_r = __pyx_v_out;
+  goto __pyx_L0;
+
+  /* "pymica/methods/inverse_distance.pyx":83
+ * 
+ * 
+ * def inverse_distance_arrays(xpos, ypos, values,             # <<<<<<<<<<<<<<
+ *                             size: List[int], geotransform: List[int],
+ *                             power: float=2, smoothing: float=0.0,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_5, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_6, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_7, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_11, 1);
+  __Pyx_XDECREF(__pyx_t_14);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_15, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_19, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_20, 1);
+  __Pyx_AddTraceback("pymica.methods.inverse_distance.inverse_distance_arrays", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_cxpos, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_cypos, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_cvalues, 1);
+  __Pyx_XDECREF((PyObject *)__pyx_v_geotransform0);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_cgeotransform, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_cmask, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_out32, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_out64, 1);
+  __Pyx_XDECREF(__pyx_v_out);
+  __Pyx_XDECREF(__pyx_v_mask);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "pymica/methods/inverse_distance.pyx":179
+ * 
+ * 
+ * cdef void fill_field(floating[:, ::1] out, const double[::1] xpos,             # <<<<<<<<<<<<<<
+ *                      const double[::1] ypos, const double[::1] values,
+ *                      double[:] cgeotransform, IdwPower power, float smoothing,
+ */
+
+static void __pyx_fuse_0__pyx_f_6pymica_7methods_16inverse_distance_fill_field(__Pyx_memviewslice __pyx_v_out, __Pyx_memviewslice __pyx_v_xpos, __Pyx_memviewslice __pyx_v_ypos, __Pyx_memviewslice __pyx_v_values, __Pyx_memviewslice __pyx_v_cgeotransform, struct __pyx_t_6pymica_7methods_9idw_power_IdwPower __pyx_v_power, float __pyx_v_smoothing, int __pyx_v_num_threads, int __pyx_v_k_nearest, double __pyx_v_max_radius, unsigned char const *__pyx_v_mask, double __pyx_v_nodata, int __pyx_v_single) {
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+
+  /* "pymica/methods/inverse_distance.pyx":184
+ *                      int num_threads, int k_nearest, double max_radius,
+ *                      const unsigned char *mask, double nodata, bint single):
+ *     if values.shape[0] > 0 and (k_nearest > 0 or max_radius > 0):             # <<<<<<<<<<<<<<
+ *         neighbour_field(out, xpos, ypos, values, cgeotransform, power,
+ *                         smoothing, num_threads, k_nearest, max_radius, mask,
+ */
+  __pyx_t_2 = ((__pyx_v_values.shape[0]) > 0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_v_k_nearest > 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_v_max_radius > 0.0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "pymica/methods/inverse_distance.pyx":185
+ *                      const unsigned char *mask, double nodata, bint single):
+ *     if values.shape[0] > 0 and (k_nearest > 0 or max_radius > 0):
+ *         neighbour_field(out, xpos, ypos, values, cgeotransform, power,             # <<<<<<<<<<<<<<
+ *                         smoothing, num_threads, k_nearest, max_radius, mask,
+ *                         nodata)
+ */
+    __pyx_fuse_0__pyx_f_6pymica_7methods_16inverse_distance_neighbour_field(__pyx_v_out, __pyx_v_xpos, __pyx_v_ypos, __pyx_v_values, __pyx_v_cgeotransform, __pyx_v_power, __pyx_v_smoothing, __pyx_v_num_threads, __pyx_v_k_nearest, __pyx_v_max_radius, __pyx_v_mask, __pyx_v_nodata); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 185, __pyx_L1_error)
+
+    /* "pymica/methods/inverse_distance.pyx":184
+ *                      int num_threads, int k_nearest, double max_radius,
+ *                      const unsigned char *mask, double nodata, bint single):
+ *     if values.shape[0] > 0 and (k_nearest > 0 or max_radius > 0):             # <<<<<<<<<<<<<<
+ *         neighbour_field(out, xpos, ypos, values, cgeotransform, power,
+ *                         smoothing, num_threads, k_nearest, max_radius, mask,
+ */
+    goto __pyx_L3;
+  }
+
+  /* "pymica/methods/inverse_distance.pyx":188
+ *                         smoothing, num_threads, k_nearest, max_radius, mask,
+ *                         nodata)
+ *     elif single:             # <<<<<<<<<<<<<<
+ *         tiled_field32(out, xpos, ypos, values, cgeotransform, power, smoothing,
+ *                       num_threads, mask, nodata)
+ */
+  if (__pyx_v_single) {
+
+    /* "pymica/methods/inverse_distance.pyx":189
+ *                         nodata)
+ *     elif single:
+ *         tiled_field32(out, xpos, ypos, values, cgeotransform, power, smoothing,             # <<<<<<<<<<<<<<
+ *                       num_threads, mask, nodata)
+ *     else:
+ */
+    __pyx_fuse_0__pyx_f_6pymica_7methods_16inverse_distance_tiled_field32(__pyx_v_out, __pyx_v_xpos, __pyx_v_ypos, __pyx_v_values, __pyx_v_cgeotransform, __pyx_v_power, __pyx_v_smoothing, __pyx_v_num_threads, __pyx_v_mask, __pyx_v_nodata); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 189, __pyx_L1_error)
+
+    /* "pymica/methods/inverse_distance.pyx":188
+ *                         smoothing, num_threads, k_nearest, max_radius, mask,
+ *                         nodata)
+ *     elif single:             # <<<<<<<<<<<<<<
+ *         tiled_field32(out, xpos, ypos, values, cgeotransform, power, smoothing,
+ *                       num_threads, mask, nodata)
+ */
+    goto __pyx_L3;
+  }
+
+  /* "pymica/methods/inverse_distance.pyx":192
+ *                       num_threads, mask, nodata)
+ *     else:
+ *         tiled_field(out, xpos, ypos, values, cgeotransform, power, smoothing,             # <<<<<<<<<<<<<<
+ *                     num_threads, mask, nodata)
+ * 
+ */
+  /*else*/ {
+
+    /* "pymica/methods/inverse_distance.pyx":193
+ *     else:
+ *         tiled_field(out, xpos, ypos, values, cgeotransform, power, smoothing,
+ *                     num_threads, mask, nodata)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+    __pyx_fuse_0__pyx_f_6pymica_7methods_16inverse_distance_tiled_field(__pyx_v_out, __pyx_v_xpos, __pyx_v_ypos, __pyx_v_values, __pyx_v_cgeotransform, __pyx_v_power, __pyx_v_smoothing, __pyx_v_num_threads, __pyx_v_mask, __pyx_v_nodata); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 192, __pyx_L1_error)
+  }
+  __pyx_L3:;
+
+  /* "pymica/methods/inverse_distance.pyx":179
+ * 
+ * 
+ * cdef void fill_field(floating[:, ::1] out, const double[::1] xpos,             # <<<<<<<<<<<<<<
+ *                      const double[::1] ypos, const double[::1] values,
+ *                      double[:] cgeotransform, IdwPower power, float smoothing,
+ */
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("pymica.methods.inverse_distance.fill_field", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_L0:;
+}
+
+static void __pyx_fuse_1__pyx_f_6pymica_7methods_16inverse_distance_fill_field(__Pyx_memviewslice __pyx_v_out, __Pyx_memviewslice __pyx_v_xpos, __Pyx_memviewslice __pyx_v_ypos, __Pyx_memviewslice __pyx_v_values, __Pyx_memviewslice __pyx_v_cgeotransform, struct __pyx_t_6pymica_7methods_9idw_power_IdwPower __pyx_v_power, float __pyx_v_smoothing, int __pyx_v_num_threads, int __pyx_v_k_nearest, double __pyx_v_max_radius, unsigned char const *__pyx_v_mask, double __pyx_v_nodata, int __pyx_v_single) {
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+
+  /* "pymica/methods/inverse_distance.pyx":184
+ *                      int num_threads, int k_nearest, double max_radius,
+ *                      const unsigned char *mask, double nodata, bint single):
+ *     if values.shape[0] > 0 and (k_nearest > 0 or max_radius > 0):             # <<<<<<<<<<<<<<
+ *         neighbour_field(out, xpos, ypos, values, cgeotransform, power,
+ *                         smoothing, num_threads, k_nearest, max_radius, mask,
+ */
+  __pyx_t_2 = ((__pyx_v_values.shape[0]) > 0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_v_k_nearest > 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_v_max_radius > 0.0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "pymica/methods/inverse_distance.pyx":185
+ *                      const unsigned char *mask, double nodata, bint single):
+ *     if values.shape[0] > 0 and (k_nearest > 0 or max_radius > 0):
+ *         neighbour_field(out, xpos, ypos, values, cgeotransform, power,             # <<<<<<<<<<<<<<
+ *                         smoothing, num_threads, k_nearest, max_radius, mask,
+ *                         nodata)
+ */
+    __pyx_fuse_1__pyx_f_6pymica_7methods_16inverse_distance_neighbour_field(__pyx_v_out, __pyx_v_xpos, __pyx_v_ypos, __pyx_v_values, __pyx_v_cgeotransform, __pyx_v_power, __pyx_v_smoothing, __pyx_v_num_threads, __pyx_v_k_nearest, __pyx_v_max_radius, __pyx_v_mask, __pyx_v_nodata); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 185, __pyx_L1_error)
+
+    /* "pymica/methods/inverse_distance.pyx":184
+ *                      int num_threads, int k_nearest, double max_radius,
+ *                      const unsigned char *mask, double nodata, bint single):
+ *     if values.shape[0] > 0 and (k_nearest > 0 or max_radius > 0):             # <<<<<<<<<<<<<<
+ *         neighbour_field(out, xpos, ypos, values, cgeotransform, power,
+ *                         smoothing, num_threads, k_nearest, max_radius, mask,
+ */
+    goto __pyx_L3;
+  }
+
+  /* "pymica/methods/inverse_distance.pyx":188
+ *                         smoothing, num_threads, k_nearest, max_radius, mask,
+ *                         nodata)
+ *     elif single:             # <<<<<<<<<<<<<<
+ *         tiled_field32(out, xpos, ypos, values, cgeotransform, power, smoothing,
+ *                       num_threads, mask, nodata)
+ */
+  if (__pyx_v_single) {
+
+    /* "pymica/methods/inverse_distance.pyx":189
+ *                         nodata)
+ *     elif single:
+ *         tiled_field32(out, xpos, ypos, values, cgeotransform, power, smoothing,             # <<<<<<<<<<<<<<
+ *                       num_threads, mask, nodata)
+ *     else:
+ */
+    __pyx_fuse_1__pyx_f_6pymica_7methods_16inverse_distance_tiled_field32(__pyx_v_out, __pyx_v_xpos, __pyx_v_ypos, __pyx_v_values, __pyx_v_cgeotransform, __pyx_v_power, __pyx_v_smoothing, __pyx_v_num_threads, __pyx_v_mask, __pyx_v_nodata); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 189, __pyx_L1_error)
+
+    /* "pymica/methods/inverse_distance.pyx":188
+ *                         smoothing, num_threads, k_nearest, max_radius, mask,
+ *                         nodata)
+ *     elif single:             # <<<<<<<<<<<<<<
+ *         tiled_field32(out, xpos, ypos, values, cgeotransform, power, smoothing,
+ *                       num_threads, mask, nodata)
+ */
+    goto __pyx_L3;
+  }
+
+  /* "pymica/methods/inverse_distance.pyx":192
+ *                       num_threads, mask, nodata)
+ *     else:
+ *         tiled_field(out, xpos, ypos, values, cgeotransform, power, smoothing,             # <<<<<<<<<<<<<<
+ *                     num_threads, mask, nodata)
+ * 
+ */
+  /*else*/ {
+
+    /* "pymica/methods/inverse_distance.pyx":193
+ *     else:
+ *         tiled_field(out, xpos, ypos, values, cgeotransform, power, smoothing,
+ *                     num_threads, mask, nodata)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+    __pyx_fuse_1__pyx_f_6pymica_7methods_16inverse_distance_tiled_field(__pyx_v_out, __pyx_v_xpos, __pyx_v_ypos, __pyx_v_values, __pyx_v_cgeotransform, __pyx_v_power, __pyx_v_smoothing, __pyx_v_num_threads, __pyx_v_mask, __pyx_v_nodata); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 192, __pyx_L1_error)
+  }
+  __pyx_L3:;
+
+  /* "pymica/methods/inverse_distance.pyx":179
+ * 
+ * 
+ * cdef void fill_field(floating[:, ::1] out, const double[::1] xpos,             # <<<<<<<<<<<<<<
+ *                      const double[::1] ypos, const double[::1] values,
+ *                      double[:] cgeotransform, IdwPower power, float smoothing,
+ */
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("pymica.methods.inverse_distance.fill_field", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_L0:;
+}
+
+/* "pymica/methods/inverse_distance.pyx":209
+ * 
+ * 
+ * cdef void tiled_field(floating[:, ::1] out, const double[::1] xpos,             # <<<<<<<<<<<<<<
+ *                       const double[::1] ypos, const double[::1] values,
+ *                       double[:] cgeotransform, IdwPower power, float smoothing,
+ */
+
+static void __pyx_fuse_0__pyx_f_6pymica_7methods_16inverse_distance_tiled_field(__Pyx_memviewslice __pyx_v_out, __Pyx_memviewslice __pyx_v_xpos, __Pyx_memviewslice __pyx_v_ypos, __Pyx_memviewslice __pyx_v_values, __Pyx_memviewslice __pyx_v_cgeotransform, struct __pyx_t_6pymica_7methods_9idw_power_IdwPower __pyx_v_power, float __pyx_v_smoothing, int __pyx_v_num_threads, unsigned char const *__pyx_v_mask, double __pyx_v_nodata) {
+  int __pyx_v_tiles_x;
+  CYTHON_UNUSED int __pyx_v_tiles_y;
+  int __pyx_v_tile;
+  double *__pyx_v_numerator;
+  double *__pyx_v_denominator;
+  char *__pyx_v_hit;
+  double *__pyx_v_dx_sq;
+  double *__pyx_v_dy_sq;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+
+  /* "pymica/methods/inverse_distance.pyx":215
+ *                       double nodata):
+ *     """Fills out using all the stations for each pixel."""
+ *     cdef int tiles_x = (out.shape[1] + TILE_COLS - 1) // TILE_COLS             # <<<<<<<<<<<<<<
+ *     cdef int tiles_y = (out.shape[0] + TILE_ROWS - 1) // TILE_ROWS
+ *     cdef int tile
+ */
+  __pyx_v_tiles_x = ((((__pyx_v_out.shape[1]) + __pyx_e_6pymica_7methods_16inverse_distance_TILE_COLS) - 1) / __pyx_e_6pymica_7methods_16inverse_distance_TILE_COLS);
+
+  /* "pymica/methods/inverse_distance.pyx":216
+ *     """Fills out using all the stations for each pixel."""
+ *     cdef int tiles_x = (out.shape[1] + TILE_COLS - 1) // TILE_COLS
+ *     cdef int tiles_y = (out.shape[0] + TILE_ROWS - 1) // TILE_ROWS             # <<<<<<<<<<<<<<
+ *     cdef int tile
+ *     cdef double *numerator
+ */
+  __pyx_v_tiles_y = ((((__pyx_v_out.shape[0]) + __pyx_e_6pymica_7methods_16inverse_distance_TILE_ROWS) - 1) / __pyx_e_6pymica_7methods_16inverse_distance_TILE_ROWS);
+
+  /* "pymica/methods/inverse_distance.pyx":226
+ *     # Tiles are scheduled dynamically because pixels on top of a station
+ *     # stop early and make the cost of each tile uneven.
+ *     with nogil, parallel(num_threads=num_threads):             # <<<<<<<<<<<<<<
+ *         numerator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))
+ *         denominator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      _save = NULL;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+        {
+            #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+                #undef likely
+                #undef unlikely
+                #define likely(x)   (x)
+                #define unlikely(x) (x)
+            #endif
+            #ifdef _OPENMP
+            #pragma omp parallel private(__pyx_v_denominator, __pyx_v_dx_sq, __pyx_v_dy_sq, __pyx_v_hit, __pyx_v_numerator) private(__pyx_t_1, __pyx_t_2, __pyx_t_3) num_threads(__pyx_v_num_threads)
+            #endif /* _OPENMP */
+            {
+                /* Initialize private variables to invalid values */
+                __pyx_v_denominator = ((double *)1);
+                __pyx_v_dx_sq = ((double *)1);
+                __pyx_v_dy_sq = ((double *)1);
+                __pyx_v_hit = ((char *)1);
+                __pyx_v_numerator = ((double *)1);
+
+                /* "pymica/methods/inverse_distance.pyx":227
+ *     # stop early and make the cost of each tile uneven.
+ *     with nogil, parallel(num_threads=num_threads):
+ *         numerator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))             # <<<<<<<<<<<<<<
+ *         denominator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))
+ *         hit = <char *> malloc(TILE_ROWS * TILE_COLS * sizeof(char))
+ */
+                __pyx_v_numerator = ((double *)malloc(((__pyx_e_6pymica_7methods_16inverse_distance_TILE_ROWS * __pyx_e_6pymica_7methods_16inverse_distance_TILE_COLS) * (sizeof(double)))));
+
+                /* "pymica/methods/inverse_distance.pyx":228
+ *     with nogil, parallel(num_threads=num_threads):
+ *         numerator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))
+ *         denominator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))             # <<<<<<<<<<<<<<
+ *         hit = <char *> malloc(TILE_ROWS * TILE_COLS * sizeof(char))
+ *         dx_sq = <double *> malloc(TILE_COLS * STATION_BLOCK * sizeof(double))
+ */
+                __pyx_v_denominator = ((double *)malloc(((__pyx_e_6pymica_7methods_16inverse_distance_TILE_ROWS * __pyx_e_6pymica_7methods_16inverse_distance_TILE_COLS) * (sizeof(double)))));
+
+                /* "pymica/methods/inverse_distance.pyx":229
+ *         numerator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))
+ *         denominator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))
+ *         hit = <char *> malloc(TILE_ROWS * TILE_COLS * sizeof(char))             # <<<<<<<<<<<<<<
+ *         dx_sq = <double *> malloc(TILE_COLS * STATION_BLOCK * sizeof(double))
+ *         dy_sq = <double *> malloc(TILE_ROWS * STATION_BLOCK * sizeof(double))
+ */
+                __pyx_v_hit = ((char *)malloc(((__pyx_e_6pymica_7methods_16inverse_distance_TILE_ROWS * __pyx_e_6pymica_7methods_16inverse_distance_TILE_COLS) * (sizeof(char)))));
+
+                /* "pymica/methods/inverse_distance.pyx":230
+ *         denominator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))
+ *         hit = <char *> malloc(TILE_ROWS * TILE_COLS * sizeof(char))
+ *         dx_sq = <double *> malloc(TILE_COLS * STATION_BLOCK * sizeof(double))             # <<<<<<<<<<<<<<
+ *         dy_sq = <double *> malloc(TILE_ROWS * STATION_BLOCK * sizeof(double))
+ *         for tile in prange(tiles_x * tiles_y, schedule='dynamic'):
+ */
+                __pyx_v_dx_sq = ((double *)malloc(((__pyx_e_6pymica_7methods_16inverse_distance_TILE_COLS * __pyx_e_6pymica_7methods_16inverse_distance_STATION_BLOCK) * (sizeof(double)))));
+
+                /* "pymica/methods/inverse_distance.pyx":231
+ *         hit = <char *> malloc(TILE_ROWS * TILE_COLS * sizeof(char))
+ *         dx_sq = <double *> malloc(TILE_COLS * STATION_BLOCK * sizeof(double))
+ *         dy_sq = <double *> malloc(TILE_ROWS * STATION_BLOCK * sizeof(double))             # <<<<<<<<<<<<<<
+ *         for tile in prange(tiles_x * tiles_y, schedule='dynamic'):
+ *             fill_tile(out, (tile // tiles_x) * TILE_ROWS,
+ */
+                __pyx_v_dy_sq = ((double *)malloc(((__pyx_e_6pymica_7methods_16inverse_distance_TILE_ROWS * __pyx_e_6pymica_7methods_16inverse_distance_STATION_BLOCK) * (sizeof(double)))));
+
+                /* "pymica/methods/inverse_distance.pyx":232
+ *         dx_sq = <double *> malloc(TILE_COLS * STATION_BLOCK * sizeof(double))
+ *         dy_sq = <double *> malloc(TILE_ROWS * STATION_BLOCK * sizeof(double))
+ *         for tile in prange(tiles_x * tiles_y, schedule='dynamic'):             # <<<<<<<<<<<<<<
+ *             fill_tile(out, (tile // tiles_x) * TILE_ROWS,
+ *                       (tile % tiles_x) * TILE_COLS, xpos, ypos, values,
+ */
+                __pyx_t_1 = (__pyx_v_tiles_x * __pyx_v_tiles_y);
+                {
+                    __pyx_t_3 = (__pyx_t_1 - 0 + 1 - 1/abs(1)) / 1;
+                    if (__pyx_t_3 > 0)
+                    {
+                        #ifdef _OPENMP
+                        #pragma omp for firstprivate(__pyx_v_tile) lastprivate(__pyx_v_tile) schedule(dynamic)
+                        #endif /* _OPENMP */
+                        for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_3; __pyx_t_2++){
+                            {
+                                __pyx_v_tile = (int)(0 + 1 * __pyx_t_2);
+
+                                /* "pymica/methods/inverse_distance.pyx":233
+ *         dy_sq = <double *> malloc(TILE_ROWS * STATION_BLOCK * sizeof(double))
+ *         for tile in prange(tiles_x * tiles_y, schedule='dynamic'):
+ *             fill_tile(out, (tile // tiles_x) * TILE_ROWS,             # <<<<<<<<<<<<<<
+ *                       (tile % tiles_x) * TILE_COLS, xpos, ypos, values,
+ *                       cgeotransform, power, smoothing, mask, nodata,
+ */
+                                __pyx_fuse_0__pyx_f_6pymica_7methods_16inverse_distance_fill_tile(__pyx_v_out, ((__pyx_v_tile / __pyx_v_tiles_x) * __pyx_e_6pymica_7methods_16inverse_distance_TILE_ROWS), ((__pyx_v_tile % __pyx_v_tiles_x) * __pyx_e_6pymica_7methods_16inverse_distance_TILE_COLS), __pyx_v_xpos, __pyx_v_ypos, __pyx_v_values, __pyx_v_cgeotransform, __pyx_v_power, __pyx_v_smoothing, __pyx_v_mask, __pyx_v_nodata, __pyx_v_numerator, __pyx_v_denominator, __pyx_v_hit, __pyx_v_dx_sq, __pyx_v_dy_sq);
+                            }
+                        }
+                    }
+                }
+
+                /* "pymica/methods/inverse_distance.pyx":237
+ *                       cgeotransform, power, smoothing, mask, nodata,
+ *                       numerator, denominator, hit, dx_sq, dy_sq)
+ *         free(numerator)             # <<<<<<<<<<<<<<
+ *         free(denominator)
+ *         free(hit)
+ */
+                free(__pyx_v_numerator);
+
+                /* "pymica/methods/inverse_distance.pyx":238
+ *                       numerator, denominator, hit, dx_sq, dy_sq)
+ *         free(numerator)
+ *         free(denominator)             # <<<<<<<<<<<<<<
+ *         free(hit)
+ *         free(dx_sq)
+ */
+                free(__pyx_v_denominator);
+
+                /* "pymica/methods/inverse_distance.pyx":239
+ *         free(numerator)
+ *         free(denominator)
+ *         free(hit)             # <<<<<<<<<<<<<<
+ *         free(dx_sq)
+ *         free(dy_sq)
+ */
+                free(__pyx_v_hit);
+
+                /* "pymica/methods/inverse_distance.pyx":240
+ *         free(denominator)
+ *         free(hit)
+ *         free(dx_sq)             # <<<<<<<<<<<<<<
+ *         free(dy_sq)
+ * 
+ */
+                free(__pyx_v_dx_sq);
+
+                /* "pymica/methods/inverse_distance.pyx":241
+ *         free(hit)
+ *         free(dx_sq)
+ *         free(dy_sq)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+                free(__pyx_v_dy_sq);
+            }
+        }
+        #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+            #undef likely
+            #undef unlikely
+            #define likely(x)   __builtin_expect(!!(x), 1)
+            #define unlikely(x) __builtin_expect(!!(x), 0)
+        #endif
+      }
+
+      /* "pymica/methods/inverse_distance.pyx":226
+ *     # Tiles are scheduled dynamically because pixels on top of a station
+ *     # stop early and make the cost of each tile uneven.
+ *     with nogil, parallel(num_threads=num_threads):             # <<<<<<<<<<<<<<
+ *         numerator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))
+ *         denominator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "pymica/methods/inverse_distance.pyx":209
+ * 
+ * 
+ * cdef void tiled_field(floating[:, ::1] out, const double[::1] xpos,             # <<<<<<<<<<<<<<
+ *                       const double[::1] ypos, const double[::1] values,
+ *                       double[:] cgeotransform, IdwPower power, float smoothing,
+ */
+
+  /* function exit code */
+}
+
+static void __pyx_fuse_1__pyx_f_6pymica_7methods_16inverse_distance_tiled_field(__Pyx_memviewslice __pyx_v_out, __Pyx_memviewslice __pyx_v_xpos, __Pyx_memviewslice __pyx_v_ypos, __Pyx_memviewslice __pyx_v_values, __Pyx_memviewslice __pyx_v_cgeotransform, struct __pyx_t_6pymica_7methods_9idw_power_IdwPower __pyx_v_power, float __pyx_v_smoothing, int __pyx_v_num_threads, unsigned char const *__pyx_v_mask, double __pyx_v_nodata) {
+  int __pyx_v_tiles_x;
+  CYTHON_UNUSED int __pyx_v_tiles_y;
+  int __pyx_v_tile;
+  double *__pyx_v_numerator;
+  double *__pyx_v_denominator;
+  char *__pyx_v_hit;
+  double *__pyx_v_dx_sq;
+  double *__pyx_v_dy_sq;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+
+  /* "pymica/methods/inverse_distance.pyx":215
+ *                       double nodata):
+ *     """Fills out using all the stations for each pixel."""
+ *     cdef int tiles_x = (out.shape[1] + TILE_COLS - 1) // TILE_COLS             # <<<<<<<<<<<<<<
+ *     cdef int tiles_y = (out.shape[0] + TILE_ROWS - 1) // TILE_ROWS
+ *     cdef int tile
+ */
+  __pyx_v_tiles_x = ((((__pyx_v_out.shape[1]) + __pyx_e_6pymica_7methods_16inverse_distance_TILE_COLS) - 1) / __pyx_e_6pymica_7methods_16inverse_distance_TILE_COLS);
+
+  /* "pymica/methods/inverse_distance.pyx":216
+ *     """Fills out using all the stations for each pixel."""
+ *     cdef int tiles_x = (out.shape[1] + TILE_COLS - 1) // TILE_COLS
+ *     cdef int tiles_y = (out.shape[0] + TILE_ROWS - 1) // TILE_ROWS             # <<<<<<<<<<<<<<
+ *     cdef int tile
+ *     cdef double *numerator
+ */
+  __pyx_v_tiles_y = ((((__pyx_v_out.shape[0]) + __pyx_e_6pymica_7methods_16inverse_distance_TILE_ROWS) - 1) / __pyx_e_6pymica_7methods_16inverse_distance_TILE_ROWS);
+
+  /* "pymica/methods/inverse_distance.pyx":226
+ *     # Tiles are scheduled dynamically because pixels on top of a station
+ *     # stop early and make the cost of each tile uneven.
+ *     with nogil, parallel(num_threads=num_threads):             # <<<<<<<<<<<<<<
+ *         numerator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))
+ *         denominator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      _save = NULL;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+        {
+            #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+                #undef likely
+                #undef unlikely
+                #define likely(x)   (x)
+                #define unlikely(x) (x)
+            #endif
+            #ifdef _OPENMP
+            #pragma omp parallel private(__pyx_v_denominator, __pyx_v_dx_sq, __pyx_v_dy_sq, __pyx_v_hit, __pyx_v_numerator) private(__pyx_t_1, __pyx_t_2, __pyx_t_3) num_threads(__pyx_v_num_threads)
+            #endif /* _OPENMP */
+            {
+                /* Initialize private variables to invalid values */
+                __pyx_v_denominator = ((double *)1);
+                __pyx_v_dx_sq = ((double *)1);
+                __pyx_v_dy_sq = ((double *)1);
+                __pyx_v_hit = ((char *)1);
+                __pyx_v_numerator = ((double *)1);
+
+                /* "pymica/methods/inverse_distance.pyx":227
+ *     # stop early and make the cost of each tile uneven.
+ *     with nogil, parallel(num_threads=num_threads):
+ *         numerator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))             # <<<<<<<<<<<<<<
+ *         denominator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))
+ *         hit = <char *> malloc(TILE_ROWS * TILE_COLS * sizeof(char))
+ */
+                __pyx_v_numerator = ((double *)malloc(((__pyx_e_6pymica_7methods_16inverse_distance_TILE_ROWS * __pyx_e_6pymica_7methods_16inverse_distance_TILE_COLS) * (sizeof(double)))));
+
+                /* "pymica/methods/inverse_distance.pyx":228
+ *     with nogil, parallel(num_threads=num_threads):
+ *         numerator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))
+ *         denominator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))             # <<<<<<<<<<<<<<
+ *         hit = <char *> malloc(TILE_ROWS * TILE_COLS * sizeof(char))
+ *         dx_sq = <double *> malloc(TILE_COLS * STATION_BLOCK * sizeof(double))
+ */
+                __pyx_v_denominator = ((double *)malloc(((__pyx_e_6pymica_7methods_16inverse_distance_TILE_ROWS * __pyx_e_6pymica_7methods_16inverse_distance_TILE_COLS) * (sizeof(double)))));
+
+                /* "pymica/methods/inverse_distance.pyx":229
+ *         numerator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))
+ *         denominator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))
+ *         hit = <char *> malloc(TILE_ROWS * TILE_COLS * sizeof(char))             # <<<<<<<<<<<<<<
+ *         dx_sq = <double *> malloc(TILE_COLS * STATION_BLOCK * sizeof(double))
+ *         dy_sq = <double *> malloc(TILE_ROWS * STATION_BLOCK * sizeof(double))
+ */
+                __pyx_v_hit = ((char *)malloc(((__pyx_e_6pymica_7methods_16inverse_distance_TILE_ROWS * __pyx_e_6pymica_7methods_16inverse_distance_TILE_COLS) * (sizeof(char)))));
+
+                /* "pymica/methods/inverse_distance.pyx":230
+ *         denominator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))
+ *         hit = <char *> malloc(TILE_ROWS * TILE_COLS * sizeof(char))
+ *         dx_sq = <double *> malloc(TILE_COLS * STATION_BLOCK * sizeof(double))             # <<<<<<<<<<<<<<
+ *         dy_sq = <double *> malloc(TILE_ROWS * STATION_BLOCK * sizeof(double))
+ *         for tile in prange(tiles_x * tiles_y, schedule='dynamic'):
+ */
+                __pyx_v_dx_sq = ((double *)malloc(((__pyx_e_6pymica_7methods_16inverse_distance_TILE_COLS * __pyx_e_6pymica_7methods_16inverse_distance_STATION_BLOCK) * (sizeof(double)))));
+
+                /* "pymica/methods/inverse_distance.pyx":231
+ *         hit = <char *> malloc(TILE_ROWS * TILE_COLS * sizeof(char))
+ *         dx_sq = <double *> malloc(TILE_COLS * STATION_BLOCK * sizeof(double))
+ *         dy_sq = <double *> malloc(TILE_ROWS * STATION_BLOCK * sizeof(double))             # <<<<<<<<<<<<<<
+ *         for tile in prange(tiles_x * tiles_y, schedule='dynamic'):
+ *             fill_tile(out, (tile // tiles_x) * TILE_ROWS,
+ */
+                __pyx_v_dy_sq = ((double *)malloc(((__pyx_e_6pymica_7methods_16inverse_distance_TILE_ROWS * __pyx_e_6pymica_7methods_16inverse_distance_STATION_BLOCK) * (sizeof(double)))));
+
+                /* "pymica/methods/inverse_distance.pyx":232
+ *         dx_sq = <double *> malloc(TILE_COLS * STATION_BLOCK * sizeof(double))
+ *         dy_sq = <double *> malloc(TILE_ROWS * STATION_BLOCK * sizeof(double))
+ *         for tile in prange(tiles_x * tiles_y, schedule='dynamic'):             # <<<<<<<<<<<<<<
+ *             fill_tile(out, (tile // tiles_x) * TILE_ROWS,
+ *                       (tile % tiles_x) * TILE_COLS, xpos, ypos, values,
+ */
+                __pyx_t_1 = (__pyx_v_tiles_x * __pyx_v_tiles_y);
+                {
+                    __pyx_t_3 = (__pyx_t_1 - 0 + 1 - 1/abs(1)) / 1;
+                    if (__pyx_t_3 > 0)
+                    {
+                        #ifdef _OPENMP
+                        #pragma omp for firstprivate(__pyx_v_tile) lastprivate(__pyx_v_tile) schedule(dynamic)
+                        #endif /* _OPENMP */
+                        for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_3; __pyx_t_2++){
+                            {
+                                __pyx_v_tile = (int)(0 + 1 * __pyx_t_2);
+
+                                /* "pymica/methods/inverse_distance.pyx":233
+ *         dy_sq = <double *> malloc(TILE_ROWS * STATION_BLOCK * sizeof(double))
+ *         for tile in prange(tiles_x * tiles_y, schedule='dynamic'):
+ *             fill_tile(out, (tile // tiles_x) * TILE_ROWS,             # <<<<<<<<<<<<<<
+ *                       (tile % tiles_x) * TILE_COLS, xpos, ypos, values,
+ *                       cgeotransform, power, smoothing, mask, nodata,
+ */
+                                __pyx_fuse_1__pyx_f_6pymica_7methods_16inverse_distance_fill_tile(__pyx_v_out, ((__pyx_v_tile / __pyx_v_tiles_x) * __pyx_e_6pymica_7methods_16inverse_distance_TILE_ROWS), ((__pyx_v_tile % __pyx_v_tiles_x) * __pyx_e_6pymica_7methods_16inverse_distance_TILE_COLS), __pyx_v_xpos, __pyx_v_ypos, __pyx_v_values, __pyx_v_cgeotransform, __pyx_v_power, __pyx_v_smoothing, __pyx_v_mask, __pyx_v_nodata, __pyx_v_numerator, __pyx_v_denominator, __pyx_v_hit, __pyx_v_dx_sq, __pyx_v_dy_sq);
+                            }
+                        }
+                    }
+                }
+
+                /* "pymica/methods/inverse_distance.pyx":237
+ *                       cgeotransform, power, smoothing, mask, nodata,
+ *                       numerator, denominator, hit, dx_sq, dy_sq)
+ *         free(numerator)             # <<<<<<<<<<<<<<
+ *         free(denominator)
+ *         free(hit)
+ */
+                free(__pyx_v_numerator);
+
+                /* "pymica/methods/inverse_distance.pyx":238
+ *                       numerator, denominator, hit, dx_sq, dy_sq)
+ *         free(numerator)
+ *         free(denominator)             # <<<<<<<<<<<<<<
+ *         free(hit)
+ *         free(dx_sq)
+ */
+                free(__pyx_v_denominator);
+
+                /* "pymica/methods/inverse_distance.pyx":239
+ *         free(numerator)
+ *         free(denominator)
+ *         free(hit)             # <<<<<<<<<<<<<<
+ *         free(dx_sq)
+ *         free(dy_sq)
+ */
+                free(__pyx_v_hit);
+
+                /* "pymica/methods/inverse_distance.pyx":240
+ *         free(denominator)
+ *         free(hit)
+ *         free(dx_sq)             # <<<<<<<<<<<<<<
+ *         free(dy_sq)
+ * 
+ */
+                free(__pyx_v_dx_sq);
+
+                /* "pymica/methods/inverse_distance.pyx":241
+ *         free(hit)
+ *         free(dx_sq)
+ *         free(dy_sq)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+                free(__pyx_v_dy_sq);
+            }
+        }
+        #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+            #undef likely
+            #undef unlikely
+            #define likely(x)   __builtin_expect(!!(x), 1)
+            #define unlikely(x) __builtin_expect(!!(x), 0)
+        #endif
+      }
+
+      /* "pymica/methods/inverse_distance.pyx":226
+ *     # Tiles are scheduled dynamically because pixels on top of a station
+ *     # stop early and make the cost of each tile uneven.
+ *     with nogil, parallel(num_threads=num_threads):             # <<<<<<<<<<<<<<
+ *         numerator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))
+ *         denominator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "pymica/methods/inverse_distance.pyx":209
+ * 
+ * 
+ * cdef void tiled_field(floating[:, ::1] out, const double[::1] xpos,             # <<<<<<<<<<<<<<
+ *                       const double[::1] ypos, const double[::1] values,
+ *                       double[:] cgeotransform, IdwPower power, float smoothing,
+ */
+
+  /* function exit code */
+}
+
+/* "pymica/methods/inverse_distance.pyx":244
+ * 
+ * 
+ * cdef void fill_tile(floating[:, ::1] out, int row0, int col0,             # <<<<<<<<<<<<<<
+ *                     const double[::1] xpos, const double[::1] ypos,
+ *                     const double[::1] values, double[:] cgeotransform,
+ */
+
+static void __pyx_fuse_0__pyx_f_6pymica_7methods_16inverse_distance_fill_tile(__Pyx_memviewslice __pyx_v_out, int __pyx_v_row0, int __pyx_v_col0, __Pyx_memviewslice __pyx_v_xpos, __Pyx_memviewslice __pyx_v_ypos, __Pyx_memviewslice __pyx_v_values, __Pyx_memviewslice __pyx_v_cgeotransform, struct __pyx_t_6pymica_7methods_9idw_power_IdwPower __pyx_v_power, float __pyx_v_smoothing, unsigned char const *__pyx_v_mask, double __pyx_v_nodata, double *__pyx_v_numerator, double *__pyx_v_denominator, char *__pyx_v_hit, double *__pyx_v_dx_sq, double *__pyx_v_dy_sq) {
+  int __pyx_v_rows;
+  int __pyx_v_cols;
+  int __pyx_v_N;
+  float __pyx_v_smoothing_sq;
+  double __pyx_v_x;
+  double __pyx_v_y;
+  double __pyx_v_dx;
+  double __pyx_v_dy;
+  double __pyx_v_dist_sq;
+  double __pyx_v_weight;
+  double __pyx_v_num;
+  double __pyx_v_den;
+  double const *__pyx_v_row_dx_sq;
+  double const *__pyx_v_row_dy_sq;
+  int __pyx_v_block;
+  int __pyx_v_block_size;
+  int __pyx_v_r;
+  int __pyx_v_c;
+  int __pyx_v_p;
+  int __pyx_v_s;
+  int __pyx_v_valid;
+  double const *__pyx_v_px;
+  double const *__pyx_v_py;
+  double const *__pyx_v_pv;
+  Py_ssize_t __pyx_t_1;
+  int __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  int __pyx_t_4;
+  double const *__pyx_t_5;
+  Py_ssize_t __pyx_t_6;
+  double const *__pyx_t_7;
+  double const *__pyx_t_8;
+  int __pyx_t_9;
+  int __pyx_t_10;
+  int __pyx_t_11;
+  int __pyx_t_12;
+  int __pyx_t_13;
+  int __pyx_t_14;
+  int __pyx_t_15;
+  Py_ssize_t __pyx_t_16;
+  int __pyx_t_17;
+  int __pyx_t_18;
+  int __pyx_t_19;
+
+  /* "pymica/methods/inverse_distance.pyx":254
+ *     Masked pixels are flagged with hit = 2 and skipped like the pixels on top
+ *     of a station."""
+ *     cdef int rows = min(TILE_ROWS, out.shape[0] - row0)             # <<<<<<<<<<<<<<
+ *     cdef int cols = min(TILE_COLS, out.shape[1] - col0)
+ *     cdef int N = values.shape[0]
+ */
+  __pyx_t_1 = ((__pyx_v_out.shape[0]) - __pyx_v_row0);
+  __pyx_t_2 = __pyx_e_6pymica_7methods_16inverse_distance_TILE_ROWS;
+  __pyx_t_4 = (__pyx_t_1 < __pyx_t_2);
+  if (__pyx_t_4) {
+    __pyx_t_3 = __pyx_t_1;
+  } else {
+    __pyx_t_3 = __pyx_t_2;
+  }
+  __pyx_v_rows = __pyx_t_3;
+
+  /* "pymica/methods/inverse_distance.pyx":255
+ *     of a station."""
+ *     cdef int rows = min(TILE_ROWS, out.shape[0] - row0)
+ *     cdef int cols = min(TILE_COLS, out.shape[1] - col0)             # <<<<<<<<<<<<<<
+ *     cdef int N = values.shape[0]
+ *     cdef float smoothing_sq = smoothing * smoothing
+ */
+  __pyx_t_3 = ((__pyx_v_out.shape[1]) - __pyx_v_col0);
+  __pyx_t_2 = __pyx_e_6pymica_7methods_16inverse_distance_TILE_COLS;
+  __pyx_t_4 = (__pyx_t_3 < __pyx_t_2);
+  if (__pyx_t_4) {
+    __pyx_t_1 = __pyx_t_3;
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+  }
+  __pyx_v_cols = __pyx_t_1;
+
+  /* "pymica/methods/inverse_distance.pyx":256
+ *     cdef int rows = min(TILE_ROWS, out.shape[0] - row0)
+ *     cdef int cols = min(TILE_COLS, out.shape[1] - col0)
+ *     cdef int N = values.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef float smoothing_sq = smoothing * smoothing
+ *     cdef double x, y, dx, dy, dist_sq, weight, num, den
+ */
+  __pyx_v_N = (__pyx_v_values.shape[0]);
+
+  /* "pymica/methods/inverse_distance.pyx":257
+ *     cdef int cols = min(TILE_COLS, out.shape[1] - col0)
+ *     cdef int N = values.shape[0]
+ *     cdef float smoothing_sq = smoothing * smoothing             # <<<<<<<<<<<<<<
+ *     cdef double x, y, dx, dy, dist_sq, weight, num, den
+ *     cdef const double *row_dx_sq
+ */
+  __pyx_v_smoothing_sq = (__pyx_v_smoothing * __pyx_v_smoothing);
+
+  /* "pymica/methods/inverse_distance.pyx":262
+ *     cdef const double *row_dy_sq
+ *     cdef int block, block_size, r, c, p, s
+ *     cdef int valid = rows * cols             # <<<<<<<<<<<<<<
+ *     cdef const double *px = &xpos[0] if N > 0 else NULL
+ *     cdef const double *py = &ypos[0] if N > 0 else NULL
+ */
+  __pyx_v_valid = (__pyx_v_rows * __pyx_v_cols);
+
+  /* "pymica/methods/inverse_distance.pyx":263
+ *     cdef int block, block_size, r, c, p, s
+ *     cdef int valid = rows * cols
+ *     cdef const double *px = &xpos[0] if N > 0 else NULL             # <<<<<<<<<<<<<<
+ *     cdef const double *py = &ypos[0] if N > 0 else NULL
+ *     cdef const double *pv = &values[0] if N > 0 else NULL
+ */
+  __pyx_t_4 = (__pyx_v_N > 0);
+  if (__pyx_t_4) {
+    __pyx_t_6 = 0;
+    __pyx_t_5 = (&(*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_xpos.data) + __pyx_t_6)) ))));
+  } else {
+    __pyx_t_5 = NULL;
+  }
+  __pyx_v_px = __pyx_t_5;
+
+  /* "pymica/methods/inverse_distance.pyx":264
+ *     cdef int valid = rows * cols
+ *     cdef const double *px = &xpos[0] if N > 0 else NULL
+ *     cdef const double *py = &ypos[0] if N > 0 else NULL             # <<<<<<<<<<<<<<
+ *     cdef const double *pv = &values[0] if N > 0 else NULL
+ * 
+ */
+  __pyx_t_4 = (__pyx_v_N > 0);
+  if (__pyx_t_4) {
+    __pyx_t_6 = 0;
+    __pyx_t_7 = (&(*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_ypos.data) + __pyx_t_6)) ))));
+  } else {
+    __pyx_t_7 = NULL;
+  }
+  __pyx_v_py = __pyx_t_7;
+
+  /* "pymica/methods/inverse_distance.pyx":265
+ *     cdef const double *px = &xpos[0] if N > 0 else NULL
+ *     cdef const double *py = &ypos[0] if N > 0 else NULL
+ *     cdef const double *pv = &values[0] if N > 0 else NULL             # <<<<<<<<<<<<<<
+ * 
+ *     for r in range(rows):
+ */
+  __pyx_t_4 = (__pyx_v_N > 0);
+  if (__pyx_t_4) {
+    __pyx_t_6 = 0;
+    __pyx_t_8 = (&(*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_values.data) + __pyx_t_6)) ))));
+  } else {
+    __pyx_t_8 = NULL;
+  }
+  __pyx_v_pv = __pyx_t_8;
+
+  /* "pymica/methods/inverse_distance.pyx":267
+ *     cdef const double *pv = &values[0] if N > 0 else NULL
+ * 
+ *     for r in range(rows):             # <<<<<<<<<<<<<<
+ *         for c in range(cols):
+ *             p = r * cols + c
+ */
+  __pyx_t_9 = __pyx_v_rows;
+  __pyx_t_10 = __pyx_t_9;
+  for (__pyx_t_11 = 0; __pyx_t_11 < __pyx_t_10; __pyx_t_11+=1) {
+    __pyx_v_r = __pyx_t_11;
+
+    /* "pymica/methods/inverse_distance.pyx":268
+ * 
+ *     for r in range(rows):
+ *         for c in range(cols):             # <<<<<<<<<<<<<<
+ *             p = r * cols + c
+ *             numerator[p] = 0.0
+ */
+    __pyx_t_12 = __pyx_v_cols;
+    __pyx_t_13 = __pyx_t_12;
+    for (__pyx_t_14 = 0; __pyx_t_14 < __pyx_t_13; __pyx_t_14+=1) {
+      __pyx_v_c = __pyx_t_14;
+
+      /* "pymica/methods/inverse_distance.pyx":269
+ *     for r in range(rows):
+ *         for c in range(cols):
+ *             p = r * cols + c             # <<<<<<<<<<<<<<
+ *             numerator[p] = 0.0
+ *             denominator[p] = 0.0
+ */
+      __pyx_v_p = ((__pyx_v_r * __pyx_v_cols) + __pyx_v_c);
+
+      /* "pymica/methods/inverse_distance.pyx":270
+ *         for c in range(cols):
+ *             p = r * cols + c
+ *             numerator[p] = 0.0             # <<<<<<<<<<<<<<
+ *             denominator[p] = 0.0
+ *             hit[p] = 0
+ */
+      (__pyx_v_numerator[__pyx_v_p]) = 0.0;
+
+      /* "pymica/methods/inverse_distance.pyx":271
+ *             p = r * cols + c
+ *             numerator[p] = 0.0
+ *             denominator[p] = 0.0             # <<<<<<<<<<<<<<
+ *             hit[p] = 0
+ *             if mask != NULL and not mask[(row0 + r) * out.shape[1] + col0 + c]:
+ */
+      (__pyx_v_denominator[__pyx_v_p]) = 0.0;
+
+      /* "pymica/methods/inverse_distance.pyx":272
+ *             numerator[p] = 0.0
+ *             denominator[p] = 0.0
+ *             hit[p] = 0             # <<<<<<<<<<<<<<
+ *             if mask != NULL and not mask[(row0 + r) * out.shape[1] + col0 + c]:
+ *                 hit[p] = 2
+ */
+      (__pyx_v_hit[__pyx_v_p]) = 0;
+
+      /* "pymica/methods/inverse_distance.pyx":273
+ *             denominator[p] = 0.0
+ *             hit[p] = 0
+ *             if mask != NULL and not mask[(row0 + r) * out.shape[1] + col0 + c]:             # <<<<<<<<<<<<<<
+ *                 hit[p] = 2
+ *                 valid = valid - 1
+ */
+      __pyx_t_15 = (__pyx_v_mask != NULL);
+      if (__pyx_t_15) {
+      } else {
+        __pyx_t_4 = __pyx_t_15;
+        goto __pyx_L8_bool_binop_done;
+      }
+      __pyx_t_15 = (!((__pyx_v_mask[((((__pyx_v_row0 + __pyx_v_r) * (__pyx_v_out.shape[1])) + __pyx_v_col0) + __pyx_v_c)]) != 0));
+      __pyx_t_4 = __pyx_t_15;
+      __pyx_L8_bool_binop_done:;
+      if (__pyx_t_4) {
+
+        /* "pymica/methods/inverse_distance.pyx":274
+ *             hit[p] = 0
+ *             if mask != NULL and not mask[(row0 + r) * out.shape[1] + col0 + c]:
+ *                 hit[p] = 2             # <<<<<<<<<<<<<<
+ *                 valid = valid - 1
+ * 
+ */
+        (__pyx_v_hit[__pyx_v_p]) = 2;
+
+        /* "pymica/methods/inverse_distance.pyx":275
+ *             if mask != NULL and not mask[(row0 + r) * out.shape[1] + col0 + c]:
+ *                 hit[p] = 2
+ *                 valid = valid - 1             # <<<<<<<<<<<<<<
+ * 
+ *     # Tiles fully masked, like the sea in a land field, skip the stations
+ */
+        __pyx_v_valid = (__pyx_v_valid - 1);
+
+        /* "pymica/methods/inverse_distance.pyx":273
+ *             denominator[p] = 0.0
+ *             hit[p] = 0
+ *             if mask != NULL and not mask[(row0 + r) * out.shape[1] + col0 + c]:             # <<<<<<<<<<<<<<
+ *                 hit[p] = 2
+ *                 valid = valid - 1
+ */
+      }
+    }
+  }
+
+  /* "pymica/methods/inverse_distance.pyx":278
+ * 
+ *     # Tiles fully masked, like the sea in a land field, skip the stations
+ *     block = 0 if valid > 0 else N             # <<<<<<<<<<<<<<
+ *     while block < N:
+ *         block_size = min(STATION_BLOCK, N - block)
+ */
+  __pyx_t_4 = (__pyx_v_valid > 0);
+  if (__pyx_t_4) {
+    __pyx_t_9 = 0;
+  } else {
+    __pyx_t_9 = __pyx_v_N;
+  }
+  __pyx_v_block = __pyx_t_9;
+
+  /* "pymica/methods/inverse_distance.pyx":279
+ *     # Tiles fully masked, like the sea in a land field, skip the stations
+ *     block = 0 if valid > 0 else N
+ *     while block < N:             # <<<<<<<<<<<<<<
+ *         block_size = min(STATION_BLOCK, N - block)
+ * 
+ */
+  while (1) {
+    __pyx_t_4 = (__pyx_v_block < __pyx_v_N);
+    if (!__pyx_t_4) break;
+
+    /* "pymica/methods/inverse_distance.pyx":280
+ *     block = 0 if valid > 0 else N
+ *     while block < N:
+ *         block_size = min(STATION_BLOCK, N - block)             # <<<<<<<<<<<<<<
+ * 
+ *         for c in range(cols):
+ */
+    __pyx_t_9 = (__pyx_v_N - __pyx_v_block);
+    __pyx_t_2 = __pyx_e_6pymica_7methods_16inverse_distance_STATION_BLOCK;
+    __pyx_t_4 = (__pyx_t_9 < __pyx_t_2);
+    if (__pyx_t_4) {
+      __pyx_t_10 = __pyx_t_9;
+    } else {
+      __pyx_t_10 = __pyx_t_2;
+    }
+    __pyx_v_block_size = __pyx_t_10;
+
+    /* "pymica/methods/inverse_distance.pyx":282
+ *         block_size = min(STATION_BLOCK, N - block)
+ * 
+ *         for c in range(cols):             # <<<<<<<<<<<<<<
+ *             x = cgeotransform[0] + (col0 + c) * cgeotransform[1]
+ *             for s in range(block_size):
+ */
+    __pyx_t_10 = __pyx_v_cols;
+    __pyx_t_9 = __pyx_t_10;
+    for (__pyx_t_11 = 0; __pyx_t_11 < __pyx_t_9; __pyx_t_11+=1) {
+      __pyx_v_c = __pyx_t_11;
+
+      /* "pymica/methods/inverse_distance.pyx":283
+ * 
+ *         for c in range(cols):
+ *             x = cgeotransform[0] + (col0 + c) * cgeotransform[1]             # <<<<<<<<<<<<<<
+ *             for s in range(block_size):
+ *                 dx = x - px[block + s]
+ */
+      __pyx_t_6 = 0;
+      __pyx_t_16 = 1;
+      __pyx_v_x = ((*((double *) ( /* dim=0 */ (__pyx_v_cgeotransform.data + __pyx_t_6 * __pyx_v_cgeotransform.strides[0]) ))) + ((__pyx_v_col0 + __pyx_v_c) * (*((double *) ( /* dim=0 */ (__pyx_v_cgeotransform.data + __pyx_t_16 * __pyx_v_cgeotransform.strides[0]) )))));
+
+      /* "pymica/methods/inverse_distance.pyx":284
+ *         for c in range(cols):
+ *             x = cgeotransform[0] + (col0 + c) * cgeotransform[1]
+ *             for s in range(block_size):             # <<<<<<<<<<<<<<
+ *                 dx = x - px[block + s]
+ *                 dx_sq[c * STATION_BLOCK + s] = dx * dx
+ */
+      __pyx_t_12 = __pyx_v_block_size;
+      __pyx_t_13 = __pyx_t_12;
+      for (__pyx_t_14 = 0; __pyx_t_14 < __pyx_t_13; __pyx_t_14+=1) {
+        __pyx_v_s = __pyx_t_14;
+
+        /* "pymica/methods/inverse_distance.pyx":285
+ *             x = cgeotransform[0] + (col0 + c) * cgeotransform[1]
+ *             for s in range(block_size):
+ *                 dx = x - px[block + s]             # <<<<<<<<<<<<<<
+ *                 dx_sq[c * STATION_BLOCK + s] = dx * dx
+ *         for r in range(rows):
+ */
+        __pyx_v_dx = (__pyx_v_x - (__pyx_v_px[(__pyx_v_block + __pyx_v_s)]));
+
+        /* "pymica/methods/inverse_distance.pyx":286
+ *             for s in range(block_size):
+ *                 dx = x - px[block + s]
+ *                 dx_sq[c * STATION_BLOCK + s] = dx * dx             # <<<<<<<<<<<<<<
+ *         for r in range(rows):
+ *             y = cgeotransform[3] + (row0 + r) * cgeotransform[5]
+ */
+        (__pyx_v_dx_sq[((__pyx_v_c * __pyx_e_6pymica_7methods_16inverse_distance_STATION_BLOCK) + __pyx_v_s)]) = (__pyx_v_dx * __pyx_v_dx);
+      }
+    }
+
+    /* "pymica/methods/inverse_distance.pyx":287
+ *                 dx = x - px[block + s]
+ *                 dx_sq[c * STATION_BLOCK + s] = dx * dx
+ *         for r in range(rows):             # <<<<<<<<<<<<<<
+ *             y = cgeotransform[3] + (row0 + r) * cgeotransform[5]
+ *             for s in range(block_size):
+ */
+    __pyx_t_10 = __pyx_v_rows;
+    __pyx_t_9 = __pyx_t_10;
+    for (__pyx_t_11 = 0; __pyx_t_11 < __pyx_t_9; __pyx_t_11+=1) {
+      __pyx_v_r = __pyx_t_11;
+
+      /* "pymica/methods/inverse_distance.pyx":288
+ *                 dx_sq[c * STATION_BLOCK + s] = dx * dx
+ *         for r in range(rows):
+ *             y = cgeotransform[3] + (row0 + r) * cgeotransform[5]             # <<<<<<<<<<<<<<
+ *             for s in range(block_size):
+ *                 dy = y - py[block + s]
+ */
+      __pyx_t_16 = 3;
+      __pyx_t_6 = 5;
+      __pyx_v_y = ((*((double *) ( /* dim=0 */ (__pyx_v_cgeotransform.data + __pyx_t_16 * __pyx_v_cgeotransform.strides[0]) ))) + ((__pyx_v_row0 + __pyx_v_r) * (*((double *) ( /* dim=0 */ (__pyx_v_cgeotransform.data + __pyx_t_6 * __pyx_v_cgeotransform.strides[0]) )))));
+
+      /* "pymica/methods/inverse_distance.pyx":289
+ *         for r in range(rows):
+ *             y = cgeotransform[3] + (row0 + r) * cgeotransform[5]
+ *             for s in range(block_size):             # <<<<<<<<<<<<<<
+ *                 dy = y - py[block + s]
+ *                 dy_sq[r * STATION_BLOCK + s] = dy * dy
+ */
+      __pyx_t_12 = __pyx_v_block_size;
+      __pyx_t_13 = __pyx_t_12;
+      for (__pyx_t_14 = 0; __pyx_t_14 < __pyx_t_13; __pyx_t_14+=1) {
+        __pyx_v_s = __pyx_t_14;
+
+        /* "pymica/methods/inverse_distance.pyx":290
+ *             y = cgeotransform[3] + (row0 + r) * cgeotransform[5]
+ *             for s in range(block_size):
+ *                 dy = y - py[block + s]             # <<<<<<<<<<<<<<
+ *                 dy_sq[r * STATION_BLOCK + s] = dy * dy
+ * 
+ */
+        __pyx_v_dy = (__pyx_v_y - (__pyx_v_py[(__pyx_v_block + __pyx_v_s)]));
+
+        /* "pymica/methods/inverse_distance.pyx":291
+ *             for s in range(block_size):
+ *                 dy = y - py[block + s]
+ *                 dy_sq[r * STATION_BLOCK + s] = dy * dy             # <<<<<<<<<<<<<<
+ * 
+ *         for r in range(rows):
+ */
+        (__pyx_v_dy_sq[((__pyx_v_r * __pyx_e_6pymica_7methods_16inverse_distance_STATION_BLOCK) + __pyx_v_s)]) = (__pyx_v_dy * __pyx_v_dy);
+      }
+    }
+
+    /* "pymica/methods/inverse_distance.pyx":293
+ *                 dy_sq[r * STATION_BLOCK + s] = dy * dy
+ * 
+ *         for r in range(rows):             # <<<<<<<<<<<<<<
+ *             row_dy_sq = dy_sq + r * STATION_BLOCK
+ *             for c in range(cols):
+ */
+    __pyx_t_10 = __pyx_v_rows;
+    __pyx_t_9 = __pyx_t_10;
+    for (__pyx_t_11 = 0; __pyx_t_11 < __pyx_t_9; __pyx_t_11+=1) {
+      __pyx_v_r = __pyx_t_11;
+
+      /* "pymica/methods/inverse_distance.pyx":294
+ * 
+ *         for r in range(rows):
+ *             row_dy_sq = dy_sq + r * STATION_BLOCK             # <<<<<<<<<<<<<<
+ *             for c in range(cols):
+ *                 p = r * cols + c
+ */
+      __pyx_v_row_dy_sq = (__pyx_v_dy_sq + (__pyx_v_r * __pyx_e_6pymica_7methods_16inverse_distance_STATION_BLOCK));
+
+      /* "pymica/methods/inverse_distance.pyx":295
+ *         for r in range(rows):
+ *             row_dy_sq = dy_sq + r * STATION_BLOCK
+ *             for c in range(cols):             # <<<<<<<<<<<<<<
+ *                 p = r * cols + c
+ *                 if hit[p]:
+ */
+      __pyx_t_12 = __pyx_v_cols;
+      __pyx_t_13 = __pyx_t_12;
+      for (__pyx_t_14 = 0; __pyx_t_14 < __pyx_t_13; __pyx_t_14+=1) {
+        __pyx_v_c = __pyx_t_14;
+
+        /* "pymica/methods/inverse_distance.pyx":296
+ *             row_dy_sq = dy_sq + r * STATION_BLOCK
+ *             for c in range(cols):
+ *                 p = r * cols + c             # <<<<<<<<<<<<<<
+ *                 if hit[p]:
+ *                     continue
+ */
+        __pyx_v_p = ((__pyx_v_r * __pyx_v_cols) + __pyx_v_c);
+
+        /* "pymica/methods/inverse_distance.pyx":297
+ *             for c in range(cols):
+ *                 p = r * cols + c
+ *                 if hit[p]:             # <<<<<<<<<<<<<<
+ *                     continue
+ *                 row_dx_sq = dx_sq + c * STATION_BLOCK
+ */
+        __pyx_t_4 = ((__pyx_v_hit[__pyx_v_p]) != 0);
+        if (__pyx_t_4) {
+
+          /* "pymica/methods/inverse_distance.pyx":298
+ *                 p = r * cols + c
+ *                 if hit[p]:
+ *                     continue             # <<<<<<<<<<<<<<
+ *                 row_dx_sq = dx_sq + c * STATION_BLOCK
+ *                 num = numerator[p]
+ */
+          goto __pyx_L22_continue;
+
+          /* "pymica/methods/inverse_distance.pyx":297
+ *             for c in range(cols):
+ *                 p = r * cols + c
+ *                 if hit[p]:             # <<<<<<<<<<<<<<
+ *                     continue
+ *                 row_dx_sq = dx_sq + c * STATION_BLOCK
+ */
+        }
+
+        /* "pymica/methods/inverse_distance.pyx":299
+ *                 if hit[p]:
+ *                     continue
+ *                 row_dx_sq = dx_sq + c * STATION_BLOCK             # <<<<<<<<<<<<<<
+ *                 num = numerator[p]
+ *                 den = denominator[p]
+ */
+        __pyx_v_row_dx_sq = (__pyx_v_dx_sq + (__pyx_v_c * __pyx_e_6pymica_7methods_16inverse_distance_STATION_BLOCK));
+
+        /* "pymica/methods/inverse_distance.pyx":300
+ *                     continue
+ *                 row_dx_sq = dx_sq + c * STATION_BLOCK
+ *                 num = numerator[p]             # <<<<<<<<<<<<<<
+ *                 den = denominator[p]
+ *                 for s in range(block_size):
+ */
+        __pyx_v_num = (__pyx_v_numerator[__pyx_v_p]);
+
+        /* "pymica/methods/inverse_distance.pyx":301
+ *                 row_dx_sq = dx_sq + c * STATION_BLOCK
+ *                 num = numerator[p]
+ *                 den = denominator[p]             # <<<<<<<<<<<<<<
+ *                 for s in range(block_size):
+ *                     dist_sq = row_dx_sq[s] + row_dy_sq[s] + smoothing_sq
+ */
+        __pyx_v_den = (__pyx_v_denominator[__pyx_v_p]);
+
+        /* "pymica/methods/inverse_distance.pyx":302
+ *                 num = numerator[p]
+ *                 den = denominator[p]
+ *                 for s in range(block_size):             # <<<<<<<<<<<<<<
+ *                     dist_sq = row_dx_sq[s] + row_dy_sq[s] + smoothing_sq
+ * 
+ */
+        __pyx_t_17 = __pyx_v_block_size;
+        __pyx_t_18 = __pyx_t_17;
+        for (__pyx_t_19 = 0; __pyx_t_19 < __pyx_t_18; __pyx_t_19+=1) {
+          __pyx_v_s = __pyx_t_19;
+
+          /* "pymica/methods/inverse_distance.pyx":303
+ *                 den = denominator[p]
+ *                 for s in range(block_size):
+ *                     dist_sq = row_dx_sq[s] + row_dy_sq[s] + smoothing_sq             # <<<<<<<<<<<<<<
+ * 
+ *                     if dist_sq < 1e-11:
+ */
+          __pyx_v_dist_sq = (((__pyx_v_row_dx_sq[__pyx_v_s]) + (__pyx_v_row_dy_sq[__pyx_v_s])) + __pyx_v_smoothing_sq);
+
+          /* "pymica/methods/inverse_distance.pyx":305
+ *                     dist_sq = row_dx_sq[s] + row_dy_sq[s] + smoothing_sq
+ * 
+ *                     if dist_sq < 1e-11:             # <<<<<<<<<<<<<<
+ *                         hit[p] = 1
+ *                         num = pv[block + s]
+ */
+          __pyx_t_4 = (__pyx_v_dist_sq < 1e-11);
+          if (__pyx_t_4) {
+
+            /* "pymica/methods/inverse_distance.pyx":306
+ * 
+ *                     if dist_sq < 1e-11:
+ *                         hit[p] = 1             # <<<<<<<<<<<<<<
+ *                         num = pv[block + s]
+ *                         break
+ */
+            (__pyx_v_hit[__pyx_v_p]) = 1;
+
+            /* "pymica/methods/inverse_distance.pyx":307
+ *                     if dist_sq < 1e-11:
+ *                         hit[p] = 1
+ *                         num = pv[block + s]             # <<<<<<<<<<<<<<
+ *                         break
+ * 
+ */
+            __pyx_v_num = (__pyx_v_pv[(__pyx_v_block + __pyx_v_s)]);
+
+            /* "pymica/methods/inverse_distance.pyx":308
+ *                         hit[p] = 1
+ *                         num = pv[block + s]
+ *                         break             # <<<<<<<<<<<<<<
+ * 
+ *                     weight = station_weight(dist_sq, power)
+ */
+            goto __pyx_L26_break;
+
+            /* "pymica/methods/inverse_distance.pyx":305
+ *                     dist_sq = row_dx_sq[s] + row_dy_sq[s] + smoothing_sq
+ * 
+ *                     if dist_sq < 1e-11:             # <<<<<<<<<<<<<<
+ *                         hit[p] = 1
+ *                         num = pv[block + s]
+ */
+          }
+
+          /* "pymica/methods/inverse_distance.pyx":310
+ *                         break
+ * 
+ *                     weight = station_weight(dist_sq, power)             # <<<<<<<<<<<<<<
+ *                     num += pv[block + s] * weight
+ *                     den += weight
+ */
+          __pyx_v_weight = __pyx_f_6pymica_7methods_9idw_power_station_weight(__pyx_v_dist_sq, __pyx_v_power);
+
+          /* "pymica/methods/inverse_distance.pyx":311
+ * 
+ *                     weight = station_weight(dist_sq, power)
+ *                     num += pv[block + s] * weight             # <<<<<<<<<<<<<<
+ *                     den += weight
+ *                 numerator[p] = num
+ */
+          __pyx_v_num = (__pyx_v_num + ((__pyx_v_pv[(__pyx_v_block + __pyx_v_s)]) * __pyx_v_weight));
+
+          /* "pymica/methods/inverse_distance.pyx":312
+ *                     weight = station_weight(dist_sq, power)
+ *                     num += pv[block + s] * weight
+ *                     den += weight             # <<<<<<<<<<<<<<
+ *                 numerator[p] = num
+ *                 denominator[p] = den
+ */
+          __pyx_v_den = (__pyx_v_den + __pyx_v_weight);
+        }
+        __pyx_L26_break:;
+
+        /* "pymica/methods/inverse_distance.pyx":313
+ *                     num += pv[block + s] * weight
+ *                     den += weight
+ *                 numerator[p] = num             # <<<<<<<<<<<<<<
+ *                 denominator[p] = den
+ *         block = block + block_size
+ */
+        (__pyx_v_numerator[__pyx_v_p]) = __pyx_v_num;
+
+        /* "pymica/methods/inverse_distance.pyx":314
+ *                     den += weight
+ *                 numerator[p] = num
+ *                 denominator[p] = den             # <<<<<<<<<<<<<<
+ *         block = block + block_size
+ * 
+ */
+        (__pyx_v_denominator[__pyx_v_p]) = __pyx_v_den;
+        __pyx_L22_continue:;
+      }
+    }
+
+    /* "pymica/methods/inverse_distance.pyx":315
+ *                 numerator[p] = num
+ *                 denominator[p] = den
+ *         block = block + block_size             # <<<<<<<<<<<<<<
+ * 
+ *     for r in range(rows):
+ */
+    __pyx_v_block = (__pyx_v_block + __pyx_v_block_size);
+  }
+
+  /* "pymica/methods/inverse_distance.pyx":317
+ *         block = block + block_size
+ * 
+ *     for r in range(rows):             # <<<<<<<<<<<<<<
+ *         for c in range(cols):
+ *             p = r * cols + c
+ */
+  __pyx_t_10 = __pyx_v_rows;
+  __pyx_t_9 = __pyx_t_10;
+  for (__pyx_t_11 = 0; __pyx_t_11 < __pyx_t_9; __pyx_t_11+=1) {
+    __pyx_v_r = __pyx_t_11;
+
+    /* "pymica/methods/inverse_distance.pyx":318
+ * 
+ *     for r in range(rows):
+ *         for c in range(cols):             # <<<<<<<<<<<<<<
+ *             p = r * cols + c
+ *             if hit[p] == 2:
+ */
+    __pyx_t_12 = __pyx_v_cols;
+    __pyx_t_13 = __pyx_t_12;
+    for (__pyx_t_14 = 0; __pyx_t_14 < __pyx_t_13; __pyx_t_14+=1) {
+      __pyx_v_c = __pyx_t_14;
+
+      /* "pymica/methods/inverse_distance.pyx":319
+ *     for r in range(rows):
+ *         for c in range(cols):
+ *             p = r * cols + c             # <<<<<<<<<<<<<<
+ *             if hit[p] == 2:
+ *                 out[row0 + r, col0 + c] = <floating> nodata
+ */
+      __pyx_v_p = ((__pyx_v_r * __pyx_v_cols) + __pyx_v_c);
+
+      /* "pymica/methods/inverse_distance.pyx":320
+ *         for c in range(cols):
+ *             p = r * cols + c
+ *             if hit[p] == 2:             # <<<<<<<<<<<<<<
+ *                 out[row0 + r, col0 + c] = <floating> nodata
+ *             elif hit[p]:
+ */
+      __pyx_t_4 = ((__pyx_v_hit[__pyx_v_p]) == 2);
+      if (__pyx_t_4) {
+
+        /* "pymica/methods/inverse_distance.pyx":321
+ *             p = r * cols + c
+ *             if hit[p] == 2:
+ *                 out[row0 + r, col0 + c] = <floating> nodata             # <<<<<<<<<<<<<<
+ *             elif hit[p]:
+ *                 out[row0 + r, col0 + c] = <floating> numerator[p]
+ */
+        __pyx_t_6 = (__pyx_v_row0 + __pyx_v_r);
+        __pyx_t_16 = (__pyx_v_col0 + __pyx_v_c);
+        *((float *) ( /* dim=1 */ ((char *) (((float *) ( /* dim=0 */ (__pyx_v_out.data + __pyx_t_6 * __pyx_v_out.strides[0]) )) + __pyx_t_16)) )) = ((float)__pyx_v_nodata);
+
+        /* "pymica/methods/inverse_distance.pyx":320
+ *         for c in range(cols):
+ *             p = r * cols + c
+ *             if hit[p] == 2:             # <<<<<<<<<<<<<<
+ *                 out[row0 + r, col0 + c] = <floating> nodata
+ *             elif hit[p]:
+ */
+        goto __pyx_L32;
+      }
+
+      /* "pymica/methods/inverse_distance.pyx":322
+ *             if hit[p] == 2:
+ *                 out[row0 + r, col0 + c] = <floating> nodata
+ *             elif hit[p]:             # <<<<<<<<<<<<<<
+ *                 out[row0 + r, col0 + c] = <floating> numerator[p]
+ *             elif denominator[p] != 0.0:
+ */
+      __pyx_t_4 = ((__pyx_v_hit[__pyx_v_p]) != 0);
+      if (__pyx_t_4) {
+
+        /* "pymica/methods/inverse_distance.pyx":323
+ *                 out[row0 + r, col0 + c] = <floating> nodata
+ *             elif hit[p]:
+ *                 out[row0 + r, col0 + c] = <floating> numerator[p]             # <<<<<<<<<<<<<<
+ *             elif denominator[p] != 0.0:
+ *                 out[row0 + r, col0 + c] = <floating> (numerator[p] / denominator[p])
+ */
+        __pyx_t_16 = (__pyx_v_row0 + __pyx_v_r);
+        __pyx_t_6 = (__pyx_v_col0 + __pyx_v_c);
+        *((float *) ( /* dim=1 */ ((char *) (((float *) ( /* dim=0 */ (__pyx_v_out.data + __pyx_t_16 * __pyx_v_out.strides[0]) )) + __pyx_t_6)) )) = ((float)(__pyx_v_numerator[__pyx_v_p]));
+
+        /* "pymica/methods/inverse_distance.pyx":322
+ *             if hit[p] == 2:
+ *                 out[row0 + r, col0 + c] = <floating> nodata
+ *             elif hit[p]:             # <<<<<<<<<<<<<<
+ *                 out[row0 + r, col0 + c] = <floating> numerator[p]
+ *             elif denominator[p] != 0.0:
+ */
+        goto __pyx_L32;
+      }
+
+      /* "pymica/methods/inverse_distance.pyx":324
+ *             elif hit[p]:
+ *                 out[row0 + r, col0 + c] = <floating> numerator[p]
+ *             elif denominator[p] != 0.0:             # <<<<<<<<<<<<<<
+ *                 out[row0 + r, col0 + c] = <floating> (numerator[p] / denominator[p])
+ *             else:
+ */
+      __pyx_t_4 = ((__pyx_v_denominator[__pyx_v_p]) != 0.0);
+      if (__pyx_t_4) {
+
+        /* "pymica/methods/inverse_distance.pyx":325
+ *                 out[row0 + r, col0 + c] = <floating> numerator[p]
+ *             elif denominator[p] != 0.0:
+ *                 out[row0 + r, col0 + c] = <floating> (numerator[p] / denominator[p])             # <<<<<<<<<<<<<<
+ *             else:
+ *                 out[row0 + r, col0 + c] = 0.0
+ */
+        __pyx_t_6 = (__pyx_v_row0 + __pyx_v_r);
+        __pyx_t_16 = (__pyx_v_col0 + __pyx_v_c);
+        *((float *) ( /* dim=1 */ ((char *) (((float *) ( /* dim=0 */ (__pyx_v_out.data + __pyx_t_6 * __pyx_v_out.strides[0]) )) + __pyx_t_16)) )) = ((float)((__pyx_v_numerator[__pyx_v_p]) / (__pyx_v_denominator[__pyx_v_p])));
+
+        /* "pymica/methods/inverse_distance.pyx":324
+ *             elif hit[p]:
+ *                 out[row0 + r, col0 + c] = <floating> numerator[p]
+ *             elif denominator[p] != 0.0:             # <<<<<<<<<<<<<<
+ *                 out[row0 + r, col0 + c] = <floating> (numerator[p] / denominator[p])
+ *             else:
+ */
+        goto __pyx_L32;
+      }
+
+      /* "pymica/methods/inverse_distance.pyx":327
+ *                 out[row0 + r, col0 + c] = <floating> (numerator[p] / denominator[p])
+ *             else:
+ *                 out[row0 + r, col0 + c] = 0.0             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+      /*else*/ {
+        __pyx_t_16 = (__pyx_v_row0 + __pyx_v_r);
+        __pyx_t_6 = (__pyx_v_col0 + __pyx_v_c);
+        *((float *) ( /* dim=1 */ ((char *) (((float *) ( /* dim=0 */ (__pyx_v_out.data + __pyx_t_16 * __pyx_v_out.strides[0]) )) + __pyx_t_6)) )) = 0.0;
+      }
+      __pyx_L32:;
+    }
+  }
+
+  /* "pymica/methods/inverse_distance.pyx":244
+ * 
+ * 
+ * cdef void fill_tile(floating[:, ::1] out, int row0, int col0,             # <<<<<<<<<<<<<<
+ *                     const double[::1] xpos, const double[::1] ypos,
+ *                     const double[::1] values, double[:] cgeotransform,
+ */
+
+  /* function exit code */
+}
+
+static void __pyx_fuse_1__pyx_f_6pymica_7methods_16inverse_distance_fill_tile(__Pyx_memviewslice __pyx_v_out, int __pyx_v_row0, int __pyx_v_col0, __Pyx_memviewslice __pyx_v_xpos, __Pyx_memviewslice __pyx_v_ypos, __Pyx_memviewslice __pyx_v_values, __Pyx_memviewslice __pyx_v_cgeotransform, struct __pyx_t_6pymica_7methods_9idw_power_IdwPower __pyx_v_power, float __pyx_v_smoothing, unsigned char const *__pyx_v_mask, double __pyx_v_nodata, double *__pyx_v_numerator, double *__pyx_v_denominator, char *__pyx_v_hit, double *__pyx_v_dx_sq, double *__pyx_v_dy_sq) {
+  int __pyx_v_rows;
+  int __pyx_v_cols;
+  int __pyx_v_N;
+  float __pyx_v_smoothing_sq;
+  double __pyx_v_x;
+  double __pyx_v_y;
+  double __pyx_v_dx;
+  double __pyx_v_dy;
+  double __pyx_v_dist_sq;
+  double __pyx_v_weight;
+  double __pyx_v_num;
+  double __pyx_v_den;
+  double const *__pyx_v_row_dx_sq;
+  double const *__pyx_v_row_dy_sq;
+  int __pyx_v_block;
+  int __pyx_v_block_size;
+  int __pyx_v_r;
+  int __pyx_v_c;
+  int __pyx_v_p;
+  int __pyx_v_s;
+  int __pyx_v_valid;
+  double const *__pyx_v_px;
+  double const *__pyx_v_py;
+  double const *__pyx_v_pv;
+  Py_ssize_t __pyx_t_1;
+  int __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  int __pyx_t_4;
+  double const *__pyx_t_5;
+  Py_ssize_t __pyx_t_6;
+  double const *__pyx_t_7;
+  double const *__pyx_t_8;
+  int __pyx_t_9;
+  int __pyx_t_10;
+  int __pyx_t_11;
+  int __pyx_t_12;
+  int __pyx_t_13;
+  int __pyx_t_14;
+  int __pyx_t_15;
+  Py_ssize_t __pyx_t_16;
+  int __pyx_t_17;
+  int __pyx_t_18;
+  int __pyx_t_19;
+
+  /* "pymica/methods/inverse_distance.pyx":254
+ *     Masked pixels are flagged with hit = 2 and skipped like the pixels on top
+ *     of a station."""
+ *     cdef int rows = min(TILE_ROWS, out.shape[0] - row0)             # <<<<<<<<<<<<<<
+ *     cdef int cols = min(TILE_COLS, out.shape[1] - col0)
+ *     cdef int N = values.shape[0]
+ */
+  __pyx_t_1 = ((__pyx_v_out.shape[0]) - __pyx_v_row0);
+  __pyx_t_2 = __pyx_e_6pymica_7methods_16inverse_distance_TILE_ROWS;
+  __pyx_t_4 = (__pyx_t_1 < __pyx_t_2);
+  if (__pyx_t_4) {
+    __pyx_t_3 = __pyx_t_1;
+  } else {
+    __pyx_t_3 = __pyx_t_2;
+  }
+  __pyx_v_rows = __pyx_t_3;
+
+  /* "pymica/methods/inverse_distance.pyx":255
+ *     of a station."""
+ *     cdef int rows = min(TILE_ROWS, out.shape[0] - row0)
+ *     cdef int cols = min(TILE_COLS, out.shape[1] - col0)             # <<<<<<<<<<<<<<
+ *     cdef int N = values.shape[0]
+ *     cdef float smoothing_sq = smoothing * smoothing
+ */
+  __pyx_t_3 = ((__pyx_v_out.shape[1]) - __pyx_v_col0);
+  __pyx_t_2 = __pyx_e_6pymica_7methods_16inverse_distance_TILE_COLS;
+  __pyx_t_4 = (__pyx_t_3 < __pyx_t_2);
+  if (__pyx_t_4) {
+    __pyx_t_1 = __pyx_t_3;
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+  }
+  __pyx_v_cols = __pyx_t_1;
+
+  /* "pymica/methods/inverse_distance.pyx":256
+ *     cdef int rows = min(TILE_ROWS, out.shape[0] - row0)
+ *     cdef int cols = min(TILE_COLS, out.shape[1] - col0)
+ *     cdef int N = values.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef float smoothing_sq = smoothing * smoothing
+ *     cdef double x, y, dx, dy, dist_sq, weight, num, den
+ */
+  __pyx_v_N = (__pyx_v_values.shape[0]);
+
+  /* "pymica/methods/inverse_distance.pyx":257
+ *     cdef int cols = min(TILE_COLS, out.shape[1] - col0)
+ *     cdef int N = values.shape[0]
+ *     cdef float smoothing_sq = smoothing * smoothing             # <<<<<<<<<<<<<<
+ *     cdef double x, y, dx, dy, dist_sq, weight, num, den
+ *     cdef const double *row_dx_sq
+ */
+  __pyx_v_smoothing_sq = (__pyx_v_smoothing * __pyx_v_smoothing);
+
+  /* "pymica/methods/inverse_distance.pyx":262
+ *     cdef const double *row_dy_sq
+ *     cdef int block, block_size, r, c, p, s
+ *     cdef int valid = rows * cols             # <<<<<<<<<<<<<<
+ *     cdef const double *px = &xpos[0] if N > 0 else NULL
+ *     cdef const double *py = &ypos[0] if N > 0 else NULL
+ */
+  __pyx_v_valid = (__pyx_v_rows * __pyx_v_cols);
+
+  /* "pymica/methods/inverse_distance.pyx":263
+ *     cdef int block, block_size, r, c, p, s
+ *     cdef int valid = rows * cols
+ *     cdef const double *px = &xpos[0] if N > 0 else NULL             # <<<<<<<<<<<<<<
+ *     cdef const double *py = &ypos[0] if N > 0 else NULL
+ *     cdef const double *pv = &values[0] if N > 0 else NULL
+ */
+  __pyx_t_4 = (__pyx_v_N > 0);
+  if (__pyx_t_4) {
+    __pyx_t_6 = 0;
+    __pyx_t_5 = (&(*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_xpos.data) + __pyx_t_6)) ))));
+  } else {
+    __pyx_t_5 = NULL;
+  }
+  __pyx_v_px = __pyx_t_5;
+
+  /* "pymica/methods/inverse_distance.pyx":264
+ *     cdef int valid = rows * cols
+ *     cdef const double *px = &xpos[0] if N > 0 else NULL
+ *     cdef const double *py = &ypos[0] if N > 0 else NULL             # <<<<<<<<<<<<<<
+ *     cdef const double *pv = &values[0] if N > 0 else NULL
+ * 
+ */
+  __pyx_t_4 = (__pyx_v_N > 0);
+  if (__pyx_t_4) {
+    __pyx_t_6 = 0;
+    __pyx_t_7 = (&(*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_ypos.data) + __pyx_t_6)) ))));
+  } else {
+    __pyx_t_7 = NULL;
+  }
+  __pyx_v_py = __pyx_t_7;
+
+  /* "pymica/methods/inverse_distance.pyx":265
+ *     cdef const double *px = &xpos[0] if N > 0 else NULL
+ *     cdef const double *py = &ypos[0] if N > 0 else NULL
+ *     cdef const double *pv = &values[0] if N > 0 else NULL             # <<<<<<<<<<<<<<
+ * 
+ *     for r in range(rows):
+ */
+  __pyx_t_4 = (__pyx_v_N > 0);
+  if (__pyx_t_4) {
+    __pyx_t_6 = 0;
+    __pyx_t_8 = (&(*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_values.data) + __pyx_t_6)) ))));
+  } else {
+    __pyx_t_8 = NULL;
+  }
+  __pyx_v_pv = __pyx_t_8;
+
+  /* "pymica/methods/inverse_distance.pyx":267
+ *     cdef const double *pv = &values[0] if N > 0 else NULL
+ * 
+ *     for r in range(rows):             # <<<<<<<<<<<<<<
+ *         for c in range(cols):
+ *             p = r * cols + c
+ */
+  __pyx_t_9 = __pyx_v_rows;
+  __pyx_t_10 = __pyx_t_9;
+  for (__pyx_t_11 = 0; __pyx_t_11 < __pyx_t_10; __pyx_t_11+=1) {
+    __pyx_v_r = __pyx_t_11;
+
+    /* "pymica/methods/inverse_distance.pyx":268
+ * 
+ *     for r in range(rows):
+ *         for c in range(cols):             # <<<<<<<<<<<<<<
+ *             p = r * cols + c
+ *             numerator[p] = 0.0
+ */
+    __pyx_t_12 = __pyx_v_cols;
+    __pyx_t_13 = __pyx_t_12;
+    for (__pyx_t_14 = 0; __pyx_t_14 < __pyx_t_13; __pyx_t_14+=1) {
+      __pyx_v_c = __pyx_t_14;
+
+      /* "pymica/methods/inverse_distance.pyx":269
+ *     for r in range(rows):
+ *         for c in range(cols):
+ *             p = r * cols + c             # <<<<<<<<<<<<<<
+ *             numerator[p] = 0.0
+ *             denominator[p] = 0.0
+ */
+      __pyx_v_p = ((__pyx_v_r * __pyx_v_cols) + __pyx_v_c);
+
+      /* "pymica/methods/inverse_distance.pyx":270
+ *         for c in range(cols):
+ *             p = r * cols + c
+ *             numerator[p] = 0.0             # <<<<<<<<<<<<<<
+ *             denominator[p] = 0.0
+ *             hit[p] = 0
+ */
+      (__pyx_v_numerator[__pyx_v_p]) = 0.0;
+
+      /* "pymica/methods/inverse_distance.pyx":271
+ *             p = r * cols + c
+ *             numerator[p] = 0.0
+ *             denominator[p] = 0.0             # <<<<<<<<<<<<<<
+ *             hit[p] = 0
+ *             if mask != NULL and not mask[(row0 + r) * out.shape[1] + col0 + c]:
+ */
+      (__pyx_v_denominator[__pyx_v_p]) = 0.0;
+
+      /* "pymica/methods/inverse_distance.pyx":272
+ *             numerator[p] = 0.0
+ *             denominator[p] = 0.0
+ *             hit[p] = 0             # <<<<<<<<<<<<<<
+ *             if mask != NULL and not mask[(row0 + r) * out.shape[1] + col0 + c]:
+ *                 hit[p] = 2
+ */
+      (__pyx_v_hit[__pyx_v_p]) = 0;
+
+      /* "pymica/methods/inverse_distance.pyx":273
+ *             denominator[p] = 0.0
+ *             hit[p] = 0
+ *             if mask != NULL and not mask[(row0 + r) * out.shape[1] + col0 + c]:             # <<<<<<<<<<<<<<
+ *                 hit[p] = 2
+ *                 valid = valid - 1
+ */
+      __pyx_t_15 = (__pyx_v_mask != NULL);
+      if (__pyx_t_15) {
+      } else {
+        __pyx_t_4 = __pyx_t_15;
+        goto __pyx_L8_bool_binop_done;
+      }
+      __pyx_t_15 = (!((__pyx_v_mask[((((__pyx_v_row0 + __pyx_v_r) * (__pyx_v_out.shape[1])) + __pyx_v_col0) + __pyx_v_c)]) != 0));
+      __pyx_t_4 = __pyx_t_15;
+      __pyx_L8_bool_binop_done:;
+      if (__pyx_t_4) {
+
+        /* "pymica/methods/inverse_distance.pyx":274
+ *             hit[p] = 0
+ *             if mask != NULL and not mask[(row0 + r) * out.shape[1] + col0 + c]:
+ *                 hit[p] = 2             # <<<<<<<<<<<<<<
+ *                 valid = valid - 1
+ * 
+ */
+        (__pyx_v_hit[__pyx_v_p]) = 2;
+
+        /* "pymica/methods/inverse_distance.pyx":275
+ *             if mask != NULL and not mask[(row0 + r) * out.shape[1] + col0 + c]:
+ *                 hit[p] = 2
+ *                 valid = valid - 1             # <<<<<<<<<<<<<<
+ * 
+ *     # Tiles fully masked, like the sea in a land field, skip the stations
+ */
+        __pyx_v_valid = (__pyx_v_valid - 1);
+
+        /* "pymica/methods/inverse_distance.pyx":273
+ *             denominator[p] = 0.0
+ *             hit[p] = 0
+ *             if mask != NULL and not mask[(row0 + r) * out.shape[1] + col0 + c]:             # <<<<<<<<<<<<<<
+ *                 hit[p] = 2
+ *                 valid = valid - 1
+ */
+      }
+    }
+  }
+
+  /* "pymica/methods/inverse_distance.pyx":278
+ * 
+ *     # Tiles fully masked, like the sea in a land field, skip the stations
+ *     block = 0 if valid > 0 else N             # <<<<<<<<<<<<<<
+ *     while block < N:
+ *         block_size = min(STATION_BLOCK, N - block)
+ */
+  __pyx_t_4 = (__pyx_v_valid > 0);
+  if (__pyx_t_4) {
+    __pyx_t_9 = 0;
+  } else {
+    __pyx_t_9 = __pyx_v_N;
+  }
+  __pyx_v_block = __pyx_t_9;
+
+  /* "pymica/methods/inverse_distance.pyx":279
+ *     # Tiles fully masked, like the sea in a land field, skip the stations
+ *     block = 0 if valid > 0 else N
+ *     while block < N:             # <<<<<<<<<<<<<<
+ *         block_size = min(STATION_BLOCK, N - block)
+ * 
+ */
+  while (1) {
+    __pyx_t_4 = (__pyx_v_block < __pyx_v_N);
+    if (!__pyx_t_4) break;
+
+    /* "pymica/methods/inverse_distance.pyx":280
+ *     block = 0 if valid > 0 else N
+ *     while block < N:
+ *         block_size = min(STATION_BLOCK, N - block)             # <<<<<<<<<<<<<<
+ * 
+ *         for c in range(cols):
+ */
+    __pyx_t_9 = (__pyx_v_N - __pyx_v_block);
+    __pyx_t_2 = __pyx_e_6pymica_7methods_16inverse_distance_STATION_BLOCK;
+    __pyx_t_4 = (__pyx_t_9 < __pyx_t_2);
+    if (__pyx_t_4) {
+      __pyx_t_10 = __pyx_t_9;
+    } else {
+      __pyx_t_10 = __pyx_t_2;
+    }
+    __pyx_v_block_size = __pyx_t_10;
+
+    /* "pymica/methods/inverse_distance.pyx":282
+ *         block_size = min(STATION_BLOCK, N - block)
+ * 
+ *         for c in range(cols):             # <<<<<<<<<<<<<<
+ *             x = cgeotransform[0] + (col0 + c) * cgeotransform[1]
+ *             for s in range(block_size):
+ */
+    __pyx_t_10 = __pyx_v_cols;
+    __pyx_t_9 = __pyx_t_10;
+    for (__pyx_t_11 = 0; __pyx_t_11 < __pyx_t_9; __pyx_t_11+=1) {
+      __pyx_v_c = __pyx_t_11;
+
+      /* "pymica/methods/inverse_distance.pyx":283
+ * 
+ *         for c in range(cols):
+ *             x = cgeotransform[0] + (col0 + c) * cgeotransform[1]             # <<<<<<<<<<<<<<
+ *             for s in range(block_size):
+ *                 dx = x - px[block + s]
+ */
+      __pyx_t_6 = 0;
+      __pyx_t_16 = 1;
+      __pyx_v_x = ((*((double *) ( /* dim=0 */ (__pyx_v_cgeotransform.data + __pyx_t_6 * __pyx_v_cgeotransform.strides[0]) ))) + ((__pyx_v_col0 + __pyx_v_c) * (*((double *) ( /* dim=0 */ (__pyx_v_cgeotransform.data + __pyx_t_16 * __pyx_v_cgeotransform.strides[0]) )))));
+
+      /* "pymica/methods/inverse_distance.pyx":284
+ *         for c in range(cols):
+ *             x = cgeotransform[0] + (col0 + c) * cgeotransform[1]
+ *             for s in range(block_size):             # <<<<<<<<<<<<<<
+ *                 dx = x - px[block + s]
+ *                 dx_sq[c * STATION_BLOCK + s] = dx * dx
+ */
+      __pyx_t_12 = __pyx_v_block_size;
+      __pyx_t_13 = __pyx_t_12;
+      for (__pyx_t_14 = 0; __pyx_t_14 < __pyx_t_13; __pyx_t_14+=1) {
+        __pyx_v_s = __pyx_t_14;
+
+        /* "pymica/methods/inverse_distance.pyx":285
+ *             x = cgeotransform[0] + (col0 + c) * cgeotransform[1]
+ *             for s in range(block_size):
+ *                 dx = x - px[block + s]             # <<<<<<<<<<<<<<
+ *                 dx_sq[c * STATION_BLOCK + s] = dx * dx
+ *         for r in range(rows):
+ */
+        __pyx_v_dx = (__pyx_v_x - (__pyx_v_px[(__pyx_v_block + __pyx_v_s)]));
+
+        /* "pymica/methods/inverse_distance.pyx":286
+ *             for s in range(block_size):
+ *                 dx = x - px[block + s]
+ *                 dx_sq[c * STATION_BLOCK + s] = dx * dx             # <<<<<<<<<<<<<<
+ *         for r in range(rows):
+ *             y = cgeotransform[3] + (row0 + r) * cgeotransform[5]
+ */
+        (__pyx_v_dx_sq[((__pyx_v_c * __pyx_e_6pymica_7methods_16inverse_distance_STATION_BLOCK) + __pyx_v_s)]) = (__pyx_v_dx * __pyx_v_dx);
+      }
+    }
+
+    /* "pymica/methods/inverse_distance.pyx":287
+ *                 dx = x - px[block + s]
+ *                 dx_sq[c * STATION_BLOCK + s] = dx * dx
+ *         for r in range(rows):             # <<<<<<<<<<<<<<
+ *             y = cgeotransform[3] + (row0 + r) * cgeotransform[5]
+ *             for s in range(block_size):
+ */
+    __pyx_t_10 = __pyx_v_rows;
+    __pyx_t_9 = __pyx_t_10;
+    for (__pyx_t_11 = 0; __pyx_t_11 < __pyx_t_9; __pyx_t_11+=1) {
+      __pyx_v_r = __pyx_t_11;
+
+      /* "pymica/methods/inverse_distance.pyx":288
+ *                 dx_sq[c * STATION_BLOCK + s] = dx * dx
+ *         for r in range(rows):
+ *             y = cgeotransform[3] + (row0 + r) * cgeotransform[5]             # <<<<<<<<<<<<<<
+ *             for s in range(block_size):
+ *                 dy = y - py[block + s]
+ */
+      __pyx_t_16 = 3;
+      __pyx_t_6 = 5;
+      __pyx_v_y = ((*((double *) ( /* dim=0 */ (__pyx_v_cgeotransform.data + __pyx_t_16 * __pyx_v_cgeotransform.strides[0]) ))) + ((__pyx_v_row0 + __pyx_v_r) * (*((double *) ( /* dim=0 */ (__pyx_v_cgeotransform.data + __pyx_t_6 * __pyx_v_cgeotransform.strides[0]) )))));
+
+      /* "pymica/methods/inverse_distance.pyx":289
+ *         for r in range(rows):
+ *             y = cgeotransform[3] + (row0 + r) * cgeotransform[5]
+ *             for s in range(block_size):             # <<<<<<<<<<<<<<
+ *                 dy = y - py[block + s]
+ *                 dy_sq[r * STATION_BLOCK + s] = dy * dy
+ */
+      __pyx_t_12 = __pyx_v_block_size;
+      __pyx_t_13 = __pyx_t_12;
+      for (__pyx_t_14 = 0; __pyx_t_14 < __pyx_t_13; __pyx_t_14+=1) {
+        __pyx_v_s = __pyx_t_14;
+
+        /* "pymica/methods/inverse_distance.pyx":290
+ *             y = cgeotransform[3] + (row0 + r) * cgeotransform[5]
+ *             for s in range(block_size):
+ *                 dy = y - py[block + s]             # <<<<<<<<<<<<<<
+ *                 dy_sq[r * STATION_BLOCK + s] = dy * dy
+ * 
+ */
+        __pyx_v_dy = (__pyx_v_y - (__pyx_v_py[(__pyx_v_block + __pyx_v_s)]));
+
+        /* "pymica/methods/inverse_distance.pyx":291
+ *             for s in range(block_size):
+ *                 dy = y - py[block + s]
+ *                 dy_sq[r * STATION_BLOCK + s] = dy * dy             # <<<<<<<<<<<<<<
+ * 
+ *         for r in range(rows):
+ */
+        (__pyx_v_dy_sq[((__pyx_v_r * __pyx_e_6pymica_7methods_16inverse_distance_STATION_BLOCK) + __pyx_v_s)]) = (__pyx_v_dy * __pyx_v_dy);
+      }
+    }
+
+    /* "pymica/methods/inverse_distance.pyx":293
+ *                 dy_sq[r * STATION_BLOCK + s] = dy * dy
+ * 
+ *         for r in range(rows):             # <<<<<<<<<<<<<<
+ *             row_dy_sq = dy_sq + r * STATION_BLOCK
+ *             for c in range(cols):
+ */
+    __pyx_t_10 = __pyx_v_rows;
+    __pyx_t_9 = __pyx_t_10;
+    for (__pyx_t_11 = 0; __pyx_t_11 < __pyx_t_9; __pyx_t_11+=1) {
+      __pyx_v_r = __pyx_t_11;
+
+      /* "pymica/methods/inverse_distance.pyx":294
+ * 
+ *         for r in range(rows):
+ *             row_dy_sq = dy_sq + r * STATION_BLOCK             # <<<<<<<<<<<<<<
+ *             for c in range(cols):
+ *                 p = r * cols + c
+ */
+      __pyx_v_row_dy_sq = (__pyx_v_dy_sq + (__pyx_v_r * __pyx_e_6pymica_7methods_16inverse_distance_STATION_BLOCK));
+
+      /* "pymica/methods/inverse_distance.pyx":295
+ *         for r in range(rows):
+ *             row_dy_sq = dy_sq + r * STATION_BLOCK
+ *             for c in range(cols):             # <<<<<<<<<<<<<<
+ *                 p = r * cols + c
+ *                 if hit[p]:
+ */
+      __pyx_t_12 = __pyx_v_cols;
+      __pyx_t_13 = __pyx_t_12;
+      for (__pyx_t_14 = 0; __pyx_t_14 < __pyx_t_13; __pyx_t_14+=1) {
+        __pyx_v_c = __pyx_t_14;
+
+        /* "pymica/methods/inverse_distance.pyx":296
+ *             row_dy_sq = dy_sq + r * STATION_BLOCK
+ *             for c in range(cols):
+ *                 p = r * cols + c             # <<<<<<<<<<<<<<
+ *                 if hit[p]:
+ *                     continue
+ */
+        __pyx_v_p = ((__pyx_v_r * __pyx_v_cols) + __pyx_v_c);
+
+        /* "pymica/methods/inverse_distance.pyx":297
+ *             for c in range(cols):
+ *                 p = r * cols + c
+ *                 if hit[p]:             # <<<<<<<<<<<<<<
+ *                     continue
+ *                 row_dx_sq = dx_sq + c * STATION_BLOCK
+ */
+        __pyx_t_4 = ((__pyx_v_hit[__pyx_v_p]) != 0);
+        if (__pyx_t_4) {
+
+          /* "pymica/methods/inverse_distance.pyx":298
+ *                 p = r * cols + c
+ *                 if hit[p]:
+ *                     continue             # <<<<<<<<<<<<<<
+ *                 row_dx_sq = dx_sq + c * STATION_BLOCK
+ *                 num = numerator[p]
+ */
+          goto __pyx_L22_continue;
+
+          /* "pymica/methods/inverse_distance.pyx":297
+ *             for c in range(cols):
+ *                 p = r * cols + c
+ *                 if hit[p]:             # <<<<<<<<<<<<<<
+ *                     continue
+ *                 row_dx_sq = dx_sq + c * STATION_BLOCK
+ */
+        }
+
+        /* "pymica/methods/inverse_distance.pyx":299
+ *                 if hit[p]:
+ *                     continue
+ *                 row_dx_sq = dx_sq + c * STATION_BLOCK             # <<<<<<<<<<<<<<
+ *                 num = numerator[p]
+ *                 den = denominator[p]
+ */
+        __pyx_v_row_dx_sq = (__pyx_v_dx_sq + (__pyx_v_c * __pyx_e_6pymica_7methods_16inverse_distance_STATION_BLOCK));
+
+        /* "pymica/methods/inverse_distance.pyx":300
+ *                     continue
+ *                 row_dx_sq = dx_sq + c * STATION_BLOCK
+ *                 num = numerator[p]             # <<<<<<<<<<<<<<
+ *                 den = denominator[p]
+ *                 for s in range(block_size):
+ */
+        __pyx_v_num = (__pyx_v_numerator[__pyx_v_p]);
+
+        /* "pymica/methods/inverse_distance.pyx":301
+ *                 row_dx_sq = dx_sq + c * STATION_BLOCK
+ *                 num = numerator[p]
+ *                 den = denominator[p]             # <<<<<<<<<<<<<<
+ *                 for s in range(block_size):
+ *                     dist_sq = row_dx_sq[s] + row_dy_sq[s] + smoothing_sq
+ */
+        __pyx_v_den = (__pyx_v_denominator[__pyx_v_p]);
+
+        /* "pymica/methods/inverse_distance.pyx":302
+ *                 num = numerator[p]
+ *                 den = denominator[p]
+ *                 for s in range(block_size):             # <<<<<<<<<<<<<<
+ *                     dist_sq = row_dx_sq[s] + row_dy_sq[s] + smoothing_sq
+ * 
+ */
+        __pyx_t_17 = __pyx_v_block_size;
+        __pyx_t_18 = __pyx_t_17;
+        for (__pyx_t_19 = 0; __pyx_t_19 < __pyx_t_18; __pyx_t_19+=1) {
+          __pyx_v_s = __pyx_t_19;
+
+          /* "pymica/methods/inverse_distance.pyx":303
+ *                 den = denominator[p]
+ *                 for s in range(block_size):
+ *                     dist_sq = row_dx_sq[s] + row_dy_sq[s] + smoothing_sq             # <<<<<<<<<<<<<<
+ * 
+ *                     if dist_sq < 1e-11:
+ */
+          __pyx_v_dist_sq = (((__pyx_v_row_dx_sq[__pyx_v_s]) + (__pyx_v_row_dy_sq[__pyx_v_s])) + __pyx_v_smoothing_sq);
+
+          /* "pymica/methods/inverse_distance.pyx":305
+ *                     dist_sq = row_dx_sq[s] + row_dy_sq[s] + smoothing_sq
+ * 
+ *                     if dist_sq < 1e-11:             # <<<<<<<<<<<<<<
+ *                         hit[p] = 1
+ *                         num = pv[block + s]
+ */
+          __pyx_t_4 = (__pyx_v_dist_sq < 1e-11);
+          if (__pyx_t_4) {
+
+            /* "pymica/methods/inverse_distance.pyx":306
+ * 
+ *                     if dist_sq < 1e-11:
+ *                         hit[p] = 1             # <<<<<<<<<<<<<<
+ *                         num = pv[block + s]
+ *                         break
+ */
+            (__pyx_v_hit[__pyx_v_p]) = 1;
+
+            /* "pymica/methods/inverse_distance.pyx":307
+ *                     if dist_sq < 1e-11:
+ *                         hit[p] = 1
+ *                         num = pv[block + s]             # <<<<<<<<<<<<<<
+ *                         break
+ * 
+ */
+            __pyx_v_num = (__pyx_v_pv[(__pyx_v_block + __pyx_v_s)]);
+
+            /* "pymica/methods/inverse_distance.pyx":308
+ *                         hit[p] = 1
+ *                         num = pv[block + s]
+ *                         break             # <<<<<<<<<<<<<<
+ * 
+ *                     weight = station_weight(dist_sq, power)
+ */
+            goto __pyx_L26_break;
+
+            /* "pymica/methods/inverse_distance.pyx":305
+ *                     dist_sq = row_dx_sq[s] + row_dy_sq[s] + smoothing_sq
+ * 
+ *                     if dist_sq < 1e-11:             # <<<<<<<<<<<<<<
+ *                         hit[p] = 1
+ *                         num = pv[block + s]
+ */
+          }
+
+          /* "pymica/methods/inverse_distance.pyx":310
+ *                         break
+ * 
+ *                     weight = station_weight(dist_sq, power)             # <<<<<<<<<<<<<<
+ *                     num += pv[block + s] * weight
+ *                     den += weight
+ */
+          __pyx_v_weight = __pyx_f_6pymica_7methods_9idw_power_station_weight(__pyx_v_dist_sq, __pyx_v_power);
+
+          /* "pymica/methods/inverse_distance.pyx":311
+ * 
+ *                     weight = station_weight(dist_sq, power)
+ *                     num += pv[block + s] * weight             # <<<<<<<<<<<<<<
+ *                     den += weight
+ *                 numerator[p] = num
+ */
+          __pyx_v_num = (__pyx_v_num + ((__pyx_v_pv[(__pyx_v_block + __pyx_v_s)]) * __pyx_v_weight));
+
+          /* "pymica/methods/inverse_distance.pyx":312
+ *                     weight = station_weight(dist_sq, power)
+ *                     num += pv[block + s] * weight
+ *                     den += weight             # <<<<<<<<<<<<<<
+ *                 numerator[p] = num
+ *                 denominator[p] = den
+ */
+          __pyx_v_den = (__pyx_v_den + __pyx_v_weight);
+        }
+        __pyx_L26_break:;
+
+        /* "pymica/methods/inverse_distance.pyx":313
+ *                     num += pv[block + s] * weight
+ *                     den += weight
+ *                 numerator[p] = num             # <<<<<<<<<<<<<<
+ *                 denominator[p] = den
+ *         block = block + block_size
+ */
+        (__pyx_v_numerator[__pyx_v_p]) = __pyx_v_num;
+
+        /* "pymica/methods/inverse_distance.pyx":314
+ *                     den += weight
+ *                 numerator[p] = num
+ *                 denominator[p] = den             # <<<<<<<<<<<<<<
+ *         block = block + block_size
+ * 
+ */
+        (__pyx_v_denominator[__pyx_v_p]) = __pyx_v_den;
+        __pyx_L22_continue:;
+      }
+    }
+
+    /* "pymica/methods/inverse_distance.pyx":315
+ *                 numerator[p] = num
+ *                 denominator[p] = den
+ *         block = block + block_size             # <<<<<<<<<<<<<<
+ * 
+ *     for r in range(rows):
+ */
+    __pyx_v_block = (__pyx_v_block + __pyx_v_block_size);
+  }
+
+  /* "pymica/methods/inverse_distance.pyx":317
+ *         block = block + block_size
+ * 
+ *     for r in range(rows):             # <<<<<<<<<<<<<<
+ *         for c in range(cols):
+ *             p = r * cols + c
+ */
+  __pyx_t_10 = __pyx_v_rows;
+  __pyx_t_9 = __pyx_t_10;
+  for (__pyx_t_11 = 0; __pyx_t_11 < __pyx_t_9; __pyx_t_11+=1) {
+    __pyx_v_r = __pyx_t_11;
+
+    /* "pymica/methods/inverse_distance.pyx":318
+ * 
+ *     for r in range(rows):
+ *         for c in range(cols):             # <<<<<<<<<<<<<<
+ *             p = r * cols + c
+ *             if hit[p] == 2:
+ */
+    __pyx_t_12 = __pyx_v_cols;
+    __pyx_t_13 = __pyx_t_12;
+    for (__pyx_t_14 = 0; __pyx_t_14 < __pyx_t_13; __pyx_t_14+=1) {
+      __pyx_v_c = __pyx_t_14;
+
+      /* "pymica/methods/inverse_distance.pyx":319
+ *     for r in range(rows):
+ *         for c in range(cols):
+ *             p = r * cols + c             # <<<<<<<<<<<<<<
+ *             if hit[p] == 2:
+ *                 out[row0 + r, col0 + c] = <floating> nodata
+ */
+      __pyx_v_p = ((__pyx_v_r * __pyx_v_cols) + __pyx_v_c);
+
+      /* "pymica/methods/inverse_distance.pyx":320
+ *         for c in range(cols):
+ *             p = r * cols + c
+ *             if hit[p] == 2:             # <<<<<<<<<<<<<<
+ *                 out[row0 + r, col0 + c] = <floating> nodata
+ *             elif hit[p]:
+ */
+      __pyx_t_4 = ((__pyx_v_hit[__pyx_v_p]) == 2);
+      if (__pyx_t_4) {
+
+        /* "pymica/methods/inverse_distance.pyx":321
+ *             p = r * cols + c
+ *             if hit[p] == 2:
+ *                 out[row0 + r, col0 + c] = <floating> nodata             # <<<<<<<<<<<<<<
+ *             elif hit[p]:
+ *                 out[row0 + r, col0 + c] = <floating> numerator[p]
+ */
+        __pyx_t_6 = (__pyx_v_row0 + __pyx_v_r);
+        __pyx_t_16 = (__pyx_v_col0 + __pyx_v_c);
+        *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_out.data + __pyx_t_6 * __pyx_v_out.strides[0]) )) + __pyx_t_16)) )) = ((double)__pyx_v_nodata);
+
+        /* "pymica/methods/inverse_distance.pyx":320
+ *         for c in range(cols):
+ *             p = r * cols + c
+ *             if hit[p] == 2:             # <<<<<<<<<<<<<<
+ *                 out[row0 + r, col0 + c] = <floating> nodata
+ *             elif hit[p]:
+ */
+        goto __pyx_L32;
+      }
+
+      /* "pymica/methods/inverse_distance.pyx":322
+ *             if hit[p] == 2:
+ *                 out[row0 + r, col0 + c] = <floating> nodata
+ *             elif hit[p]:             # <<<<<<<<<<<<<<
+ *                 out[row0 + r, col0 + c] = <floating> numerator[p]
+ *             elif denominator[p] != 0.0:
+ */
+      __pyx_t_4 = ((__pyx_v_hit[__pyx_v_p]) != 0);
+      if (__pyx_t_4) {
+
+        /* "pymica/methods/inverse_distance.pyx":323
+ *                 out[row0 + r, col0 + c] = <floating> nodata
+ *             elif hit[p]:
+ *                 out[row0 + r, col0 + c] = <floating> numerator[p]             # <<<<<<<<<<<<<<
+ *             elif denominator[p] != 0.0:
+ *                 out[row0 + r, col0 + c] = <floating> (numerator[p] / denominator[p])
+ */
+        __pyx_t_16 = (__pyx_v_row0 + __pyx_v_r);
+        __pyx_t_6 = (__pyx_v_col0 + __pyx_v_c);
+        *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_out.data + __pyx_t_16 * __pyx_v_out.strides[0]) )) + __pyx_t_6)) )) = ((double)(__pyx_v_numerator[__pyx_v_p]));
+
+        /* "pymica/methods/inverse_distance.pyx":322
+ *             if hit[p] == 2:
+ *                 out[row0 + r, col0 + c] = <floating> nodata
+ *             elif hit[p]:             # <<<<<<<<<<<<<<
+ *                 out[row0 + r, col0 + c] = <floating> numerator[p]
+ *             elif denominator[p] != 0.0:
+ */
+        goto __pyx_L32;
+      }
+
+      /* "pymica/methods/inverse_distance.pyx":324
+ *             elif hit[p]:
+ *                 out[row0 + r, col0 + c] = <floating> numerator[p]
+ *             elif denominator[p] != 0.0:             # <<<<<<<<<<<<<<
+ *                 out[row0 + r, col0 + c] = <floating> (numerator[p] / denominator[p])
+ *             else:
+ */
+      __pyx_t_4 = ((__pyx_v_denominator[__pyx_v_p]) != 0.0);
+      if (__pyx_t_4) {
+
+        /* "pymica/methods/inverse_distance.pyx":325
+ *                 out[row0 + r, col0 + c] = <floating> numerator[p]
+ *             elif denominator[p] != 0.0:
+ *                 out[row0 + r, col0 + c] = <floating> (numerator[p] / denominator[p])             # <<<<<<<<<<<<<<
+ *             else:
+ *                 out[row0 + r, col0 + c] = 0.0
+ */
+        __pyx_t_6 = (__pyx_v_row0 + __pyx_v_r);
+        __pyx_t_16 = (__pyx_v_col0 + __pyx_v_c);
+        *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_out.data + __pyx_t_6 * __pyx_v_out.strides[0]) )) + __pyx_t_16)) )) = ((double)((__pyx_v_numerator[__pyx_v_p]) / (__pyx_v_denominator[__pyx_v_p])));
+
+        /* "pymica/methods/inverse_distance.pyx":324
+ *             elif hit[p]:
+ *                 out[row0 + r, col0 + c] = <floating> numerator[p]
+ *             elif denominator[p] != 0.0:             # <<<<<<<<<<<<<<
+ *                 out[row0 + r, col0 + c] = <floating> (numerator[p] / denominator[p])
+ *             else:
+ */
+        goto __pyx_L32;
+      }
+
+      /* "pymica/methods/inverse_distance.pyx":327
+ *                 out[row0 + r, col0 + c] = <floating> (numerator[p] / denominator[p])
+ *             else:
+ *                 out[row0 + r, col0 + c] = 0.0             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+      /*else*/ {
+        __pyx_t_16 = (__pyx_v_row0 + __pyx_v_r);
+        __pyx_t_6 = (__pyx_v_col0 + __pyx_v_c);
+        *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_out.data + __pyx_t_16 * __pyx_v_out.strides[0]) )) + __pyx_t_6)) )) = 0.0;
+      }
+      __pyx_L32:;
+    }
+  }
+
+  /* "pymica/methods/inverse_distance.pyx":244
+ * 
+ * 
+ * cdef void fill_tile(floating[:, ::1] out, int row0, int col0,             # <<<<<<<<<<<<<<
+ *                     const double[::1] xpos, const double[::1] ypos,
+ *                     const double[::1] values, double[:] cgeotransform,
+ */
+
+  /* function exit code */
+}
+
+/* "pymica/methods/inverse_distance.pyx":337
+ * # the coordinates do not cost any precision, and the float32 sums of each
+ * # station block are added to float64 accumulators.
+ * cdef void tiled_field32(floating[:, ::1] out, const double[::1] xpos,             # <<<<<<<<<<<<<<
+ *                         const double[::1] ypos, const double[::1] values,
+ *                         double[:] cgeotransform, IdwPower power,
+ */
+
+static void __pyx_fuse_0__pyx_f_6pymica_7methods_16inverse_distance_tiled_field32(__Pyx_memviewslice __pyx_v_out, __Pyx_memviewslice __pyx_v_xpos, __Pyx_memviewslice __pyx_v_ypos, __Pyx_memviewslice __pyx_v_values, __Pyx_memviewslice __pyx_v_cgeotransform, struct __pyx_t_6pymica_7methods_9idw_power_IdwPower __pyx_v_power, float __pyx_v_smoothing, int __pyx_v_num_threads, unsigned char const *__pyx_v_mask, double __pyx_v_nodata) {
+  int __pyx_v_tiles_x;
+  CYTHON_UNUSED int __pyx_v_tiles_y;
+  int __pyx_v_tile;
+  double *__pyx_v_numerator;
+  double *__pyx_v_denominator;
+  char *__pyx_v_hit;
+  float *__pyx_v_dx_sq;
+  float *__pyx_v_block_sums;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+
+  /* "pymica/methods/inverse_distance.pyx":343
+ *                         const unsigned char *mask, double nodata):
+ *     """Fills out using all the stations for each pixel in float32."""
+ *     cdef int tiles_x = (out.shape[1] + TILE_COLS - 1) // TILE_COLS             # <<<<<<<<<<<<<<
+ *     cdef int tiles_y = (out.shape[0] + TILE_ROWS - 1) // TILE_ROWS
+ *     cdef int tile
+ */
+  __pyx_v_tiles_x = ((((__pyx_v_out.shape[1]) + __pyx_e_6pymica_7methods_16inverse_distance_TILE_COLS) - 1) / __pyx_e_6pymica_7methods_16inverse_distance_TILE_COLS);
+
+  /* "pymica/methods/inverse_distance.pyx":344
+ *     """Fills out using all the stations for each pixel in float32."""
+ *     cdef int tiles_x = (out.shape[1] + TILE_COLS - 1) // TILE_COLS
+ *     cdef int tiles_y = (out.shape[0] + TILE_ROWS - 1) // TILE_ROWS             # <<<<<<<<<<<<<<
+ *     cdef int tile
+ *     cdef double *numerator
+ */
+  __pyx_v_tiles_y = ((((__pyx_v_out.shape[0]) + __pyx_e_6pymica_7methods_16inverse_distance_TILE_ROWS) - 1) / __pyx_e_6pymica_7methods_16inverse_distance_TILE_ROWS);
+
+  /* "pymica/methods/inverse_distance.pyx":352
+ *     cdef float *block_sums
+ * 
+ *     with nogil, parallel(num_threads=num_threads):             # <<<<<<<<<<<<<<
+ *         numerator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))
+ *         denominator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      _save = NULL;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+        {
+            #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+                #undef likely
+                #undef unlikely
+                #define likely(x)   (x)
+                #define unlikely(x) (x)
+            #endif
+            #ifdef _OPENMP
+            #pragma omp parallel private(__pyx_v_block_sums, __pyx_v_denominator, __pyx_v_dx_sq, __pyx_v_hit, __pyx_v_numerator) private(__pyx_t_1, __pyx_t_2, __pyx_t_3) num_threads(__pyx_v_num_threads)
+            #endif /* _OPENMP */
+            {
+                /* Initialize private variables to invalid values */
+                __pyx_v_block_sums = ((float *)1);
+                __pyx_v_denominator = ((double *)1);
+                __pyx_v_dx_sq = ((float *)1);
+                __pyx_v_hit = ((char *)1);
+                __pyx_v_numerator = ((double *)1);
+
+                /* "pymica/methods/inverse_distance.pyx":353
+ * 
+ *     with nogil, parallel(num_threads=num_threads):
+ *         numerator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))             # <<<<<<<<<<<<<<
+ *         denominator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))
+ *         hit = <char *> malloc(TILE_ROWS * TILE_COLS * sizeof(char))
+ */
+                __pyx_v_numerator = ((double *)malloc(((__pyx_e_6pymica_7methods_16inverse_distance_TILE_ROWS * __pyx_e_6pymica_7methods_16inverse_distance_TILE_COLS) * (sizeof(double)))));
+
+                /* "pymica/methods/inverse_distance.pyx":354
+ *     with nogil, parallel(num_threads=num_threads):
+ *         numerator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))
+ *         denominator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))             # <<<<<<<<<<<<<<
+ *         hit = <char *> malloc(TILE_ROWS * TILE_COLS * sizeof(char))
+ *         dx_sq = <float *> malloc(STATION_BLOCK * TILE_COLS * sizeof(float))
+ */
+                __pyx_v_denominator = ((double *)malloc(((__pyx_e_6pymica_7methods_16inverse_distance_TILE_ROWS * __pyx_e_6pymica_7methods_16inverse_distance_TILE_COLS) * (sizeof(double)))));
+
+                /* "pymica/methods/inverse_distance.pyx":355
+ *         numerator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))
+ *         denominator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))
+ *         hit = <char *> malloc(TILE_ROWS * TILE_COLS * sizeof(char))             # <<<<<<<<<<<<<<
+ *         dx_sq = <float *> malloc(STATION_BLOCK * TILE_COLS * sizeof(float))
+ *         block_sums = <float *> malloc(2 * TILE_COLS * sizeof(float))
+ */
+                __pyx_v_hit = ((char *)malloc(((__pyx_e_6pymica_7methods_16inverse_distance_TILE_ROWS * __pyx_e_6pymica_7methods_16inverse_distance_TILE_COLS) * (sizeof(char)))));
+
+                /* "pymica/methods/inverse_distance.pyx":356
+ *         denominator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))
+ *         hit = <char *> malloc(TILE_ROWS * TILE_COLS * sizeof(char))
+ *         dx_sq = <float *> malloc(STATION_BLOCK * TILE_COLS * sizeof(float))             # <<<<<<<<<<<<<<
+ *         block_sums = <float *> malloc(2 * TILE_COLS * sizeof(float))
+ *         for tile in prange(tiles_x * tiles_y, schedule='dynamic'):
+ */
+                __pyx_v_dx_sq = ((float *)malloc(((__pyx_e_6pymica_7methods_16inverse_distance_STATION_BLOCK * __pyx_e_6pymica_7methods_16inverse_distance_TILE_COLS) * (sizeof(float)))));
+
+                /* "pymica/methods/inverse_distance.pyx":357
+ *         hit = <char *> malloc(TILE_ROWS * TILE_COLS * sizeof(char))
+ *         dx_sq = <float *> malloc(STATION_BLOCK * TILE_COLS * sizeof(float))
+ *         block_sums = <float *> malloc(2 * TILE_COLS * sizeof(float))             # <<<<<<<<<<<<<<
+ *         for tile in prange(tiles_x * tiles_y, schedule='dynamic'):
+ *             fill_tile32(out, (tile // tiles_x) * TILE_ROWS,
+ */
+                __pyx_v_block_sums = ((float *)malloc(((2 * __pyx_e_6pymica_7methods_16inverse_distance_TILE_COLS) * (sizeof(float)))));
+
+                /* "pymica/methods/inverse_distance.pyx":358
+ *         dx_sq = <float *> malloc(STATION_BLOCK * TILE_COLS * sizeof(float))
+ *         block_sums = <float *> malloc(2 * TILE_COLS * sizeof(float))
+ *         for tile in prange(tiles_x * tiles_y, schedule='dynamic'):             # <<<<<<<<<<<<<<
+ *             fill_tile32(out, (tile // tiles_x) * TILE_ROWS,
+ *                         (tile % tiles_x) * TILE_COLS, xpos, ypos, values,
+ */
+                __pyx_t_1 = (__pyx_v_tiles_x * __pyx_v_tiles_y);
+                {
+                    __pyx_t_3 = (__pyx_t_1 - 0 + 1 - 1/abs(1)) / 1;
+                    if (__pyx_t_3 > 0)
+                    {
+                        #ifdef _OPENMP
+                        #pragma omp for firstprivate(__pyx_v_tile) lastprivate(__pyx_v_tile) schedule(dynamic)
+                        #endif /* _OPENMP */
+                        for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_3; __pyx_t_2++){
+                            {
+                                __pyx_v_tile = (int)(0 + 1 * __pyx_t_2);
+
+                                /* "pymica/methods/inverse_distance.pyx":359
+ *         block_sums = <float *> malloc(2 * TILE_COLS * sizeof(float))
+ *         for tile in prange(tiles_x * tiles_y, schedule='dynamic'):
+ *             fill_tile32(out, (tile // tiles_x) * TILE_ROWS,             # <<<<<<<<<<<<<<
+ *                         (tile % tiles_x) * TILE_COLS, xpos, ypos, values,
+ *                         cgeotransform, power, smoothing, mask, nodata,
+ */
+                                __pyx_fuse_0__pyx_f_6pymica_7methods_16inverse_distance_fill_tile32(__pyx_v_out, ((__pyx_v_tile / __pyx_v_tiles_x) * __pyx_e_6pymica_7methods_16inverse_distance_TILE_ROWS), ((__pyx_v_tile % __pyx_v_tiles_x) * __pyx_e_6pymica_7methods_16inverse_distance_TILE_COLS), __pyx_v_xpos, __pyx_v_ypos, __pyx_v_values, __pyx_v_cgeotransform, __pyx_v_power, __pyx_v_smoothing, __pyx_v_mask, __pyx_v_nodata, __pyx_v_numerator, __pyx_v_denominator, __pyx_v_hit, __pyx_v_dx_sq, __pyx_v_block_sums);
+                            }
+                        }
+                    }
+                }
+
+                /* "pymica/methods/inverse_distance.pyx":363
+ *                         cgeotransform, power, smoothing, mask, nodata,
+ *                         numerator, denominator, hit, dx_sq, block_sums)
+ *         free(numerator)             # <<<<<<<<<<<<<<
+ *         free(denominator)
+ *         free(hit)
+ */
+                free(__pyx_v_numerator);
+
+                /* "pymica/methods/inverse_distance.pyx":364
+ *                         numerator, denominator, hit, dx_sq, block_sums)
+ *         free(numerator)
+ *         free(denominator)             # <<<<<<<<<<<<<<
+ *         free(hit)
+ *         free(dx_sq)
+ */
+                free(__pyx_v_denominator);
+
+                /* "pymica/methods/inverse_distance.pyx":365
+ *         free(numerator)
+ *         free(denominator)
+ *         free(hit)             # <<<<<<<<<<<<<<
+ *         free(dx_sq)
+ *         free(block_sums)
+ */
+                free(__pyx_v_hit);
+
+                /* "pymica/methods/inverse_distance.pyx":366
+ *         free(denominator)
+ *         free(hit)
+ *         free(dx_sq)             # <<<<<<<<<<<<<<
+ *         free(block_sums)
+ * 
+ */
+                free(__pyx_v_dx_sq);
+
+                /* "pymica/methods/inverse_distance.pyx":367
+ *         free(hit)
+ *         free(dx_sq)
+ *         free(block_sums)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+                free(__pyx_v_block_sums);
+            }
+        }
+        #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+            #undef likely
+            #undef unlikely
+            #define likely(x)   __builtin_expect(!!(x), 1)
+            #define unlikely(x) __builtin_expect(!!(x), 0)
+        #endif
+      }
+
+      /* "pymica/methods/inverse_distance.pyx":352
+ *     cdef float *block_sums
+ * 
+ *     with nogil, parallel(num_threads=num_threads):             # <<<<<<<<<<<<<<
+ *         numerator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))
+ *         denominator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "pymica/methods/inverse_distance.pyx":337
+ * # the coordinates do not cost any precision, and the float32 sums of each
+ * # station block are added to float64 accumulators.
+ * cdef void tiled_field32(floating[:, ::1] out, const double[::1] xpos,             # <<<<<<<<<<<<<<
+ *                         const double[::1] ypos, const double[::1] values,
+ *                         double[:] cgeotransform, IdwPower power,
+ */
+
+  /* function exit code */
+}
+
+static void __pyx_fuse_1__pyx_f_6pymica_7methods_16inverse_distance_tiled_field32(__Pyx_memviewslice __pyx_v_out, __Pyx_memviewslice __pyx_v_xpos, __Pyx_memviewslice __pyx_v_ypos, __Pyx_memviewslice __pyx_v_values, __Pyx_memviewslice __pyx_v_cgeotransform, struct __pyx_t_6pymica_7methods_9idw_power_IdwPower __pyx_v_power, float __pyx_v_smoothing, int __pyx_v_num_threads, unsigned char const *__pyx_v_mask, double __pyx_v_nodata) {
+  int __pyx_v_tiles_x;
+  CYTHON_UNUSED int __pyx_v_tiles_y;
+  int __pyx_v_tile;
+  double *__pyx_v_numerator;
+  double *__pyx_v_denominator;
+  char *__pyx_v_hit;
+  float *__pyx_v_dx_sq;
+  float *__pyx_v_block_sums;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+
+  /* "pymica/methods/inverse_distance.pyx":343
+ *                         const unsigned char *mask, double nodata):
+ *     """Fills out using all the stations for each pixel in float32."""
+ *     cdef int tiles_x = (out.shape[1] + TILE_COLS - 1) // TILE_COLS             # <<<<<<<<<<<<<<
+ *     cdef int tiles_y = (out.shape[0] + TILE_ROWS - 1) // TILE_ROWS
+ *     cdef int tile
+ */
+  __pyx_v_tiles_x = ((((__pyx_v_out.shape[1]) + __pyx_e_6pymica_7methods_16inverse_distance_TILE_COLS) - 1) / __pyx_e_6pymica_7methods_16inverse_distance_TILE_COLS);
+
+  /* "pymica/methods/inverse_distance.pyx":344
+ *     """Fills out using all the stations for each pixel in float32."""
+ *     cdef int tiles_x = (out.shape[1] + TILE_COLS - 1) // TILE_COLS
+ *     cdef int tiles_y = (out.shape[0] + TILE_ROWS - 1) // TILE_ROWS             # <<<<<<<<<<<<<<
+ *     cdef int tile
+ *     cdef double *numerator
+ */
+  __pyx_v_tiles_y = ((((__pyx_v_out.shape[0]) + __pyx_e_6pymica_7methods_16inverse_distance_TILE_ROWS) - 1) / __pyx_e_6pymica_7methods_16inverse_distance_TILE_ROWS);
+
+  /* "pymica/methods/inverse_distance.pyx":352
+ *     cdef float *block_sums
+ * 
+ *     with nogil, parallel(num_threads=num_threads):             # <<<<<<<<<<<<<<
+ *         numerator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))
+ *         denominator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      _save = NULL;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+        {
+            #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+                #undef likely
+                #undef unlikely
+                #define likely(x)   (x)
+                #define unlikely(x) (x)
+            #endif
+            #ifdef _OPENMP
+            #pragma omp parallel private(__pyx_v_block_sums, __pyx_v_denominator, __pyx_v_dx_sq, __pyx_v_hit, __pyx_v_numerator) private(__pyx_t_1, __pyx_t_2, __pyx_t_3) num_threads(__pyx_v_num_threads)
+            #endif /* _OPENMP */
+            {
+                /* Initialize private variables to invalid values */
+                __pyx_v_block_sums = ((float *)1);
+                __pyx_v_denominator = ((double *)1);
+                __pyx_v_dx_sq = ((float *)1);
+                __pyx_v_hit = ((char *)1);
+                __pyx_v_numerator = ((double *)1);
+
+                /* "pymica/methods/inverse_distance.pyx":353
+ * 
+ *     with nogil, parallel(num_threads=num_threads):
+ *         numerator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))             # <<<<<<<<<<<<<<
+ *         denominator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))
+ *         hit = <char *> malloc(TILE_ROWS * TILE_COLS * sizeof(char))
+ */
+                __pyx_v_numerator = ((double *)malloc(((__pyx_e_6pymica_7methods_16inverse_distance_TILE_ROWS * __pyx_e_6pymica_7methods_16inverse_distance_TILE_COLS) * (sizeof(double)))));
+
+                /* "pymica/methods/inverse_distance.pyx":354
+ *     with nogil, parallel(num_threads=num_threads):
+ *         numerator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))
+ *         denominator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))             # <<<<<<<<<<<<<<
+ *         hit = <char *> malloc(TILE_ROWS * TILE_COLS * sizeof(char))
+ *         dx_sq = <float *> malloc(STATION_BLOCK * TILE_COLS * sizeof(float))
+ */
+                __pyx_v_denominator = ((double *)malloc(((__pyx_e_6pymica_7methods_16inverse_distance_TILE_ROWS * __pyx_e_6pymica_7methods_16inverse_distance_TILE_COLS) * (sizeof(double)))));
+
+                /* "pymica/methods/inverse_distance.pyx":355
+ *         numerator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))
+ *         denominator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))
+ *         hit = <char *> malloc(TILE_ROWS * TILE_COLS * sizeof(char))             # <<<<<<<<<<<<<<
+ *         dx_sq = <float *> malloc(STATION_BLOCK * TILE_COLS * sizeof(float))
+ *         block_sums = <float *> malloc(2 * TILE_COLS * sizeof(float))
+ */
+                __pyx_v_hit = ((char *)malloc(((__pyx_e_6pymica_7methods_16inverse_distance_TILE_ROWS * __pyx_e_6pymica_7methods_16inverse_distance_TILE_COLS) * (sizeof(char)))));
+
+                /* "pymica/methods/inverse_distance.pyx":356
+ *         denominator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))
+ *         hit = <char *> malloc(TILE_ROWS * TILE_COLS * sizeof(char))
+ *         dx_sq = <float *> malloc(STATION_BLOCK * TILE_COLS * sizeof(float))             # <<<<<<<<<<<<<<
+ *         block_sums = <float *> malloc(2 * TILE_COLS * sizeof(float))
+ *         for tile in prange(tiles_x * tiles_y, schedule='dynamic'):
+ */
+                __pyx_v_dx_sq = ((float *)malloc(((__pyx_e_6pymica_7methods_16inverse_distance_STATION_BLOCK * __pyx_e_6pymica_7methods_16inverse_distance_TILE_COLS) * (sizeof(float)))));
+
+                /* "pymica/methods/inverse_distance.pyx":357
+ *         hit = <char *> malloc(TILE_ROWS * TILE_COLS * sizeof(char))
+ *         dx_sq = <float *> malloc(STATION_BLOCK * TILE_COLS * sizeof(float))
+ *         block_sums = <float *> malloc(2 * TILE_COLS * sizeof(float))             # <<<<<<<<<<<<<<
+ *         for tile in prange(tiles_x * tiles_y, schedule='dynamic'):
+ *             fill_tile32(out, (tile // tiles_x) * TILE_ROWS,
+ */
+                __pyx_v_block_sums = ((float *)malloc(((2 * __pyx_e_6pymica_7methods_16inverse_distance_TILE_COLS) * (sizeof(float)))));
+
+                /* "pymica/methods/inverse_distance.pyx":358
+ *         dx_sq = <float *> malloc(STATION_BLOCK * TILE_COLS * sizeof(float))
+ *         block_sums = <float *> malloc(2 * TILE_COLS * sizeof(float))
+ *         for tile in prange(tiles_x * tiles_y, schedule='dynamic'):             # <<<<<<<<<<<<<<
+ *             fill_tile32(out, (tile // tiles_x) * TILE_ROWS,
+ *                         (tile % tiles_x) * TILE_COLS, xpos, ypos, values,
+ */
+                __pyx_t_1 = (__pyx_v_tiles_x * __pyx_v_tiles_y);
+                {
+                    __pyx_t_3 = (__pyx_t_1 - 0 + 1 - 1/abs(1)) / 1;
+                    if (__pyx_t_3 > 0)
+                    {
+                        #ifdef _OPENMP
+                        #pragma omp for firstprivate(__pyx_v_tile) lastprivate(__pyx_v_tile) schedule(dynamic)
+                        #endif /* _OPENMP */
+                        for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_3; __pyx_t_2++){
+                            {
+                                __pyx_v_tile = (int)(0 + 1 * __pyx_t_2);
+
+                                /* "pymica/methods/inverse_distance.pyx":359
+ *         block_sums = <float *> malloc(2 * TILE_COLS * sizeof(float))
+ *         for tile in prange(tiles_x * tiles_y, schedule='dynamic'):
+ *             fill_tile32(out, (tile // tiles_x) * TILE_ROWS,             # <<<<<<<<<<<<<<
+ *                         (tile % tiles_x) * TILE_COLS, xpos, ypos, values,
+ *                         cgeotransform, power, smoothing, mask, nodata,
+ */
+                                __pyx_fuse_1__pyx_f_6pymica_7methods_16inverse_distance_fill_tile32(__pyx_v_out, ((__pyx_v_tile / __pyx_v_tiles_x) * __pyx_e_6pymica_7methods_16inverse_distance_TILE_ROWS), ((__pyx_v_tile % __pyx_v_tiles_x) * __pyx_e_6pymica_7methods_16inverse_distance_TILE_COLS), __pyx_v_xpos, __pyx_v_ypos, __pyx_v_values, __pyx_v_cgeotransform, __pyx_v_power, __pyx_v_smoothing, __pyx_v_mask, __pyx_v_nodata, __pyx_v_numerator, __pyx_v_denominator, __pyx_v_hit, __pyx_v_dx_sq, __pyx_v_block_sums);
+                            }
+                        }
+                    }
+                }
+
+                /* "pymica/methods/inverse_distance.pyx":363
+ *                         cgeotransform, power, smoothing, mask, nodata,
+ *                         numerator, denominator, hit, dx_sq, block_sums)
+ *         free(numerator)             # <<<<<<<<<<<<<<
+ *         free(denominator)
+ *         free(hit)
+ */
+                free(__pyx_v_numerator);
+
+                /* "pymica/methods/inverse_distance.pyx":364
+ *                         numerator, denominator, hit, dx_sq, block_sums)
+ *         free(numerator)
+ *         free(denominator)             # <<<<<<<<<<<<<<
+ *         free(hit)
+ *         free(dx_sq)
+ */
+                free(__pyx_v_denominator);
+
+                /* "pymica/methods/inverse_distance.pyx":365
+ *         free(numerator)
+ *         free(denominator)
+ *         free(hit)             # <<<<<<<<<<<<<<
+ *         free(dx_sq)
+ *         free(block_sums)
+ */
+                free(__pyx_v_hit);
+
+                /* "pymica/methods/inverse_distance.pyx":366
+ *         free(denominator)
+ *         free(hit)
+ *         free(dx_sq)             # <<<<<<<<<<<<<<
+ *         free(block_sums)
+ * 
+ */
+                free(__pyx_v_dx_sq);
+
+                /* "pymica/methods/inverse_distance.pyx":367
+ *         free(hit)
+ *         free(dx_sq)
+ *         free(block_sums)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+                free(__pyx_v_block_sums);
+            }
+        }
+        #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+            #undef likely
+            #undef unlikely
+            #define likely(x)   __builtin_expect(!!(x), 1)
+            #define unlikely(x) __builtin_expect(!!(x), 0)
+        #endif
+      }
+
+      /* "pymica/methods/inverse_distance.pyx":352
+ *     cdef float *block_sums
+ * 
+ *     with nogil, parallel(num_threads=num_threads):             # <<<<<<<<<<<<<<
+ *         numerator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))
+ *         denominator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "pymica/methods/inverse_distance.pyx":337
+ * # the coordinates do not cost any precision, and the float32 sums of each
+ * # station block are added to float64 accumulators.
+ * cdef void tiled_field32(floating[:, ::1] out, const double[::1] xpos,             # <<<<<<<<<<<<<<
+ *                         const double[::1] ypos, const double[::1] values,
+ *                         double[:] cgeotransform, IdwPower power,
+ */
+
+  /* function exit code */
+}
+
+/* "pymica/methods/inverse_distance.pyx":370
+ * 
+ * 
+ * cdef void fill_tile32(floating[:, ::1] out, int row0, int col0,             # <<<<<<<<<<<<<<
+ *                       const double[::1] xpos, const double[::1] ypos,
+ *                       const double[::1] values, double[:] cgeotransform,
+ */
+
+static void __pyx_fuse_0__pyx_f_6pymica_7methods_16inverse_distance_fill_tile32(__Pyx_memviewslice __pyx_v_out, int __pyx_v_row0, int __pyx_v_col0, __Pyx_memviewslice __pyx_v_xpos, __Pyx_memviewslice __pyx_v_ypos, __Pyx_memviewslice __pyx_v_values, __Pyx_memviewslice __pyx_v_cgeotransform, struct __pyx_t_6pymica_7methods_9idw_power_IdwPower __pyx_v_power, float __pyx_v_smoothing, unsigned char const *__pyx_v_mask, double __pyx_v_nodata, double *__pyx_v_numerator, double *__pyx_v_denominator, char *__pyx_v_hit, float *__pyx_v_dx_sq, float *__pyx_v_block_sums) {
+  int __pyx_v_rows;
+  int __pyx_v_cols;
+  int __pyx_v_N;
+  float __pyx_v_smoothing_sq;
+  int __pyx_v_exact_hits;
+  int __pyx_v_inverse_square;
+  float __pyx_v_one;
+  float __pyx_v_dist_sq;
+  float __pyx_v_weight;
+  float __pyx_v_value;
+  float __pyx_v_row_dy_sq;
+  float *__pyx_v_num;
+  float *__pyx_v_den;
+  float const *__pyx_v_row_dx_sq;
+  double __pyx_v_x;
+  double __pyx_v_y;
+  double __pyx_v_dx;
+  double __pyx_v_dy;
+  int __pyx_v_block;
+  int __pyx_v_block_size;
+  int __pyx_v_r;
+  int __pyx_v_c;
+  int __pyx_v_p;
+  int __pyx_v_s;
+  int __pyx_v_r2;
+  int __pyx_v_valid;
+  double const *__pyx_v_px;
+  double const *__pyx_v_py;
+  double const *__pyx_v_pv;
+  Py_ssize_t __pyx_t_1;
+  int __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  double const *__pyx_t_6;
+  Py_ssize_t __pyx_t_7;
+  double const *__pyx_t_8;
+  double const *__pyx_t_9;
+  int __pyx_t_10;
+  int __pyx_t_11;
+  int __pyx_t_12;
+  int __pyx_t_13;
+  int __pyx_t_14;
+  int __pyx_t_15;
+  Py_ssize_t __pyx_t_16;
+  int __pyx_t_17;
+  int __pyx_t_18;
+  int __pyx_t_19;
+  int __pyx_t_20;
+
+  /* "pymica/methods/inverse_distance.pyx":380
+ *     in float64 before adding the block, with the same threshold as fill_tile,
+ *     and the first of those stations gives their value."""
+ *     cdef int rows = min(TILE_ROWS, out.shape[0] - row0)             # <<<<<<<<<<<<<<
+ *     cdef int cols = min(TILE_COLS, out.shape[1] - col0)
+ *     cdef int N = values.shape[0]
+ */
+  __pyx_t_1 = ((__pyx_v_out.shape[0]) - __pyx_v_row0);
+  __pyx_t_2 = __pyx_e_6pymica_7methods_16inverse_distance_TILE_ROWS;
+  __pyx_t_4 = (__pyx_t_1 < __pyx_t_2);
+  if (__pyx_t_4) {
+    __pyx_t_3 = __pyx_t_1;
+  } else {
+    __pyx_t_3 = __pyx_t_2;
+  }
+  __pyx_v_rows = __pyx_t_3;
+
+  /* "pymica/methods/inverse_distance.pyx":381
+ *     and the first of those stations gives their value."""
+ *     cdef int rows = min(TILE_ROWS, out.shape[0] - row0)
+ *     cdef int cols = min(TILE_COLS, out.shape[1] - col0)             # <<<<<<<<<<<<<<
+ *     cdef int N = values.shape[0]
+ *     cdef float smoothing_sq = smoothing * smoothing
+ */
+  __pyx_t_3 = ((__pyx_v_out.shape[1]) - __pyx_v_col0);
+  __pyx_t_2 = __pyx_e_6pymica_7methods_16inverse_distance_TILE_COLS;
+  __pyx_t_4 = (__pyx_t_3 < __pyx_t_2);
+  if (__pyx_t_4) {
+    __pyx_t_1 = __pyx_t_3;
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+  }
+  __pyx_v_cols = __pyx_t_1;
+
+  /* "pymica/methods/inverse_distance.pyx":382
+ *     cdef int rows = min(TILE_ROWS, out.shape[0] - row0)
+ *     cdef int cols = min(TILE_COLS, out.shape[1] - col0)
+ *     cdef int N = values.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef float smoothing_sq = smoothing * smoothing
+ *     cdef bint exact_hits = smoothing_sq < 1e-11
+ */
+  __pyx_v_N = (__pyx_v_values.shape[0]);
+
+  /* "pymica/methods/inverse_distance.pyx":383
+ *     cdef int cols = min(TILE_COLS, out.shape[1] - col0)
+ *     cdef int N = values.shape[0]
+ *     cdef float smoothing_sq = smoothing * smoothing             # <<<<<<<<<<<<<<
+ *     cdef bint exact_hits = smoothing_sq < 1e-11
+ *     cdef bint inverse_square = power.whole == 1 and power.quarters == 0
+ */
+  __pyx_v_smoothing_sq = (__pyx_v_smoothing * __pyx_v_smoothing);
+
+  /* "pymica/methods/inverse_distance.pyx":384
+ *     cdef int N = values.shape[0]
+ *     cdef float smoothing_sq = smoothing * smoothing
+ *     cdef bint exact_hits = smoothing_sq < 1e-11             # <<<<<<<<<<<<<<
+ *     cdef bint inverse_square = power.whole == 1 and power.quarters == 0
+ *     cdef float one = 1.0
+ */
+  __pyx_v_exact_hits = (__pyx_v_smoothing_sq < 1e-11);
+
+  /* "pymica/methods/inverse_distance.pyx":385
+ *     cdef float smoothing_sq = smoothing * smoothing
+ *     cdef bint exact_hits = smoothing_sq < 1e-11
+ *     cdef bint inverse_square = power.whole == 1 and power.quarters == 0             # <<<<<<<<<<<<<<
+ *     cdef float one = 1.0
+ *     cdef float dist_sq, weight, value, row_dy_sq
+ */
+  __pyx_t_5 = (__pyx_v_power.whole == 1);
+  if (__pyx_t_5) {
+  } else {
+    __pyx_t_4 = __pyx_t_5;
+    goto __pyx_L3_bool_binop_done;
+  }
+  __pyx_t_5 = (__pyx_v_power.quarters == 0);
+  __pyx_t_4 = __pyx_t_5;
+  __pyx_L3_bool_binop_done:;
+  __pyx_v_inverse_square = __pyx_t_4;
+
+  /* "pymica/methods/inverse_distance.pyx":386
+ *     cdef bint exact_hits = smoothing_sq < 1e-11
+ *     cdef bint inverse_square = power.whole == 1 and power.quarters == 0
+ *     cdef float one = 1.0             # <<<<<<<<<<<<<<
+ *     cdef float dist_sq, weight, value, row_dy_sq
+ *     cdef float *num = block_sums
+ */
+  __pyx_v_one = 1.0;
+
+  /* "pymica/methods/inverse_distance.pyx":388
+ *     cdef float one = 1.0
+ *     cdef float dist_sq, weight, value, row_dy_sq
+ *     cdef float *num = block_sums             # <<<<<<<<<<<<<<
+ *     cdef float *den = block_sums + TILE_COLS
+ *     cdef const float *row_dx_sq
+ */
+  __pyx_v_num = __pyx_v_block_sums;
+
+  /* "pymica/methods/inverse_distance.pyx":389
+ *     cdef float dist_sq, weight, value, row_dy_sq
+ *     cdef float *num = block_sums
+ *     cdef float *den = block_sums + TILE_COLS             # <<<<<<<<<<<<<<
+ *     cdef const float *row_dx_sq
+ *     cdef double x, y, dx, dy
+ */
+  __pyx_v_den = (__pyx_v_block_sums + __pyx_e_6pymica_7methods_16inverse_distance_TILE_COLS);
+
+  /* "pymica/methods/inverse_distance.pyx":393
+ *     cdef double x, y, dx, dy
+ *     cdef int block, block_size, r, c, p, s, r2
+ *     cdef int valid = rows * cols             # <<<<<<<<<<<<<<
+ *     cdef const double *px = &xpos[0] if N > 0 else NULL
+ *     cdef const double *py = &ypos[0] if N > 0 else NULL
+ */
+  __pyx_v_valid = (__pyx_v_rows * __pyx_v_cols);
+
+  /* "pymica/methods/inverse_distance.pyx":394
+ *     cdef int block, block_size, r, c, p, s, r2
+ *     cdef int valid = rows * cols
+ *     cdef const double *px = &xpos[0] if N > 0 else NULL             # <<<<<<<<<<<<<<
+ *     cdef const double *py = &ypos[0] if N > 0 else NULL
+ *     cdef const double *pv = &values[0] if N > 0 else NULL
+ */
+  __pyx_t_4 = (__pyx_v_N > 0);
+  if (__pyx_t_4) {
+    __pyx_t_7 = 0;
+    __pyx_t_6 = (&(*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_xpos.data) + __pyx_t_7)) ))));
+  } else {
+    __pyx_t_6 = NULL;
+  }
+  __pyx_v_px = __pyx_t_6;
+
+  /* "pymica/methods/inverse_distance.pyx":395
+ *     cdef int valid = rows * cols
+ *     cdef const double *px = &xpos[0] if N > 0 else NULL
+ *     cdef const double *py = &ypos[0] if N > 0 else NULL             # <<<<<<<<<<<<<<
+ *     cdef const double *pv = &values[0] if N > 0 else NULL
+ * 
+ */
+  __pyx_t_4 = (__pyx_v_N > 0);
+  if (__pyx_t_4) {
+    __pyx_t_7 = 0;
+    __pyx_t_8 = (&(*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_ypos.data) + __pyx_t_7)) ))));
+  } else {
+    __pyx_t_8 = NULL;
+  }
+  __pyx_v_py = __pyx_t_8;
+
+  /* "pymica/methods/inverse_distance.pyx":396
+ *     cdef const double *px = &xpos[0] if N > 0 else NULL
+ *     cdef const double *py = &ypos[0] if N > 0 else NULL
+ *     cdef const double *pv = &values[0] if N > 0 else NULL             # <<<<<<<<<<<<<<
+ * 
+ *     for r in range(rows):
+ */
+  __pyx_t_4 = (__pyx_v_N > 0);
+  if (__pyx_t_4) {
+    __pyx_t_7 = 0;
+    __pyx_t_9 = (&(*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_values.data) + __pyx_t_7)) ))));
+  } else {
+    __pyx_t_9 = NULL;
+  }
+  __pyx_v_pv = __pyx_t_9;
+
+  /* "pymica/methods/inverse_distance.pyx":398
+ *     cdef const double *pv = &values[0] if N > 0 else NULL
+ * 
+ *     for r in range(rows):             # <<<<<<<<<<<<<<
+ *         for c in range(cols):
+ *             p = r * cols + c
+ */
+  __pyx_t_10 = __pyx_v_rows;
+  __pyx_t_11 = __pyx_t_10;
+  for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_11; __pyx_t_12+=1) {
+    __pyx_v_r = __pyx_t_12;
+
+    /* "pymica/methods/inverse_distance.pyx":399
+ * 
+ *     for r in range(rows):
+ *         for c in range(cols):             # <<<<<<<<<<<<<<
+ *             p = r * cols + c
+ *             numerator[p] = 0.0
+ */
+    __pyx_t_13 = __pyx_v_cols;
+    __pyx_t_14 = __pyx_t_13;
+    for (__pyx_t_15 = 0; __pyx_t_15 < __pyx_t_14; __pyx_t_15+=1) {
+      __pyx_v_c = __pyx_t_15;
+
+      /* "pymica/methods/inverse_distance.pyx":400
+ *     for r in range(rows):
+ *         for c in range(cols):
+ *             p = r * cols + c             # <<<<<<<<<<<<<<
+ *             numerator[p] = 0.0
+ *             denominator[p] = 0.0
+ */
+      __pyx_v_p = ((__pyx_v_r * __pyx_v_cols) + __pyx_v_c);
+
+      /* "pymica/methods/inverse_distance.pyx":401
+ *         for c in range(cols):
+ *             p = r * cols + c
+ *             numerator[p] = 0.0             # <<<<<<<<<<<<<<
+ *             denominator[p] = 0.0
+ *             hit[p] = 0
+ */
+      (__pyx_v_numerator[__pyx_v_p]) = 0.0;
+
+      /* "pymica/methods/inverse_distance.pyx":402
+ *             p = r * cols + c
+ *             numerator[p] = 0.0
+ *             denominator[p] = 0.0             # <<<<<<<<<<<<<<
+ *             hit[p] = 0
+ *             if mask != NULL and not mask[(row0 + r) * out.shape[1] + col0 + c]:
+ */
+      (__pyx_v_denominator[__pyx_v_p]) = 0.0;
+
+      /* "pymica/methods/inverse_distance.pyx":403
+ *             numerator[p] = 0.0
+ *             denominator[p] = 0.0
+ *             hit[p] = 0             # <<<<<<<<<<<<<<
+ *             if mask != NULL and not mask[(row0 + r) * out.shape[1] + col0 + c]:
+ *                 hit[p] = 2
+ */
+      (__pyx_v_hit[__pyx_v_p]) = 0;
+
+      /* "pymica/methods/inverse_distance.pyx":404
+ *             denominator[p] = 0.0
+ *             hit[p] = 0
+ *             if mask != NULL and not mask[(row0 + r) * out.shape[1] + col0 + c]:             # <<<<<<<<<<<<<<
+ *                 hit[p] = 2
+ *                 valid = valid - 1
+ */
+      __pyx_t_5 = (__pyx_v_mask != NULL);
+      if (__pyx_t_5) {
+      } else {
+        __pyx_t_4 = __pyx_t_5;
+        goto __pyx_L10_bool_binop_done;
+      }
+      __pyx_t_5 = (!((__pyx_v_mask[((((__pyx_v_row0 + __pyx_v_r) * (__pyx_v_out.shape[1])) + __pyx_v_col0) + __pyx_v_c)]) != 0));
+      __pyx_t_4 = __pyx_t_5;
+      __pyx_L10_bool_binop_done:;
+      if (__pyx_t_4) {
+
+        /* "pymica/methods/inverse_distance.pyx":405
+ *             hit[p] = 0
+ *             if mask != NULL and not mask[(row0 + r) * out.shape[1] + col0 + c]:
+ *                 hit[p] = 2             # <<<<<<<<<<<<<<
+ *                 valid = valid - 1
+ * 
+ */
+        (__pyx_v_hit[__pyx_v_p]) = 2;
+
+        /* "pymica/methods/inverse_distance.pyx":406
+ *             if mask != NULL and not mask[(row0 + r) * out.shape[1] + col0 + c]:
+ *                 hit[p] = 2
+ *                 valid = valid - 1             # <<<<<<<<<<<<<<
+ * 
+ *     block = 0 if valid > 0 else N
+ */
+        __pyx_v_valid = (__pyx_v_valid - 1);
+
+        /* "pymica/methods/inverse_distance.pyx":404
+ *             denominator[p] = 0.0
+ *             hit[p] = 0
+ *             if mask != NULL and not mask[(row0 + r) * out.shape[1] + col0 + c]:             # <<<<<<<<<<<<<<
+ *                 hit[p] = 2
+ *                 valid = valid - 1
+ */
+      }
+    }
+  }
+
+  /* "pymica/methods/inverse_distance.pyx":408
+ *                 valid = valid - 1
+ * 
+ *     block = 0 if valid > 0 else N             # <<<<<<<<<<<<<<
+ *     while block < N:
+ *         block_size = min(STATION_BLOCK, N - block)
+ */
+  __pyx_t_4 = (__pyx_v_valid > 0);
+  if (__pyx_t_4) {
+    __pyx_t_10 = 0;
+  } else {
+    __pyx_t_10 = __pyx_v_N;
+  }
+  __pyx_v_block = __pyx_t_10;
+
+  /* "pymica/methods/inverse_distance.pyx":409
+ * 
+ *     block = 0 if valid > 0 else N
+ *     while block < N:             # <<<<<<<<<<<<<<
+ *         block_size = min(STATION_BLOCK, N - block)
+ * 
+ */
+  while (1) {
+    __pyx_t_4 = (__pyx_v_block < __pyx_v_N);
+    if (!__pyx_t_4) break;
+
+    /* "pymica/methods/inverse_distance.pyx":410
+ *     block = 0 if valid > 0 else N
+ *     while block < N:
+ *         block_size = min(STATION_BLOCK, N - block)             # <<<<<<<<<<<<<<
+ * 
+ *         for s in range(block_size):
+ */
+    __pyx_t_10 = (__pyx_v_N - __pyx_v_block);
+    __pyx_t_2 = __pyx_e_6pymica_7methods_16inverse_distance_STATION_BLOCK;
+    __pyx_t_4 = (__pyx_t_10 < __pyx_t_2);
+    if (__pyx_t_4) {
+      __pyx_t_11 = __pyx_t_10;
+    } else {
+      __pyx_t_11 = __pyx_t_2;
+    }
+    __pyx_v_block_size = __pyx_t_11;
+
+    /* "pymica/methods/inverse_distance.pyx":412
+ *         block_size = min(STATION_BLOCK, N - block)
+ * 
+ *         for s in range(block_size):             # <<<<<<<<<<<<<<
+ *             for c in range(cols):
+ *                 x = cgeotransform[0] + (col0 + c) * cgeotransform[1]
+ */
+    __pyx_t_11 = __pyx_v_block_size;
+    __pyx_t_10 = __pyx_t_11;
+    for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_10; __pyx_t_12+=1) {
+      __pyx_v_s = __pyx_t_12;
+
+      /* "pymica/methods/inverse_distance.pyx":413
+ * 
+ *         for s in range(block_size):
+ *             for c in range(cols):             # <<<<<<<<<<<<<<
+ *                 x = cgeotransform[0] + (col0 + c) * cgeotransform[1]
+ *                 dx = x - px[block + s]
+ */
+      __pyx_t_13 = __pyx_v_cols;
+      __pyx_t_14 = __pyx_t_13;
+      for (__pyx_t_15 = 0; __pyx_t_15 < __pyx_t_14; __pyx_t_15+=1) {
+        __pyx_v_c = __pyx_t_15;
+
+        /* "pymica/methods/inverse_distance.pyx":414
+ *         for s in range(block_size):
+ *             for c in range(cols):
+ *                 x = cgeotransform[0] + (col0 + c) * cgeotransform[1]             # <<<<<<<<<<<<<<
+ *                 dx = x - px[block + s]
+ *                 dx_sq[s * TILE_COLS + c] = <float> (dx * dx)
+ */
+        __pyx_t_7 = 0;
+        __pyx_t_16 = 1;
+        __pyx_v_x = ((*((double *) ( /* dim=0 */ (__pyx_v_cgeotransform.data + __pyx_t_7 * __pyx_v_cgeotransform.strides[0]) ))) + ((__pyx_v_col0 + __pyx_v_c) * (*((double *) ( /* dim=0 */ (__pyx_v_cgeotransform.data + __pyx_t_16 * __pyx_v_cgeotransform.strides[0]) )))));
+
+        /* "pymica/methods/inverse_distance.pyx":415
+ *             for c in range(cols):
+ *                 x = cgeotransform[0] + (col0 + c) * cgeotransform[1]
+ *                 dx = x - px[block + s]             # <<<<<<<<<<<<<<
+ *                 dx_sq[s * TILE_COLS + c] = <float> (dx * dx)
+ *                 if exact_hits and dx * dx + smoothing_sq < 1e-11:
+ */
+        __pyx_v_dx = (__pyx_v_x - (__pyx_v_px[(__pyx_v_block + __pyx_v_s)]));
+
+        /* "pymica/methods/inverse_distance.pyx":416
+ *                 x = cgeotransform[0] + (col0 + c) * cgeotransform[1]
+ *                 dx = x - px[block + s]
+ *                 dx_sq[s * TILE_COLS + c] = <float> (dx * dx)             # <<<<<<<<<<<<<<
+ *                 if exact_hits and dx * dx + smoothing_sq < 1e-11:
+ *                     for r2 in range(rows):
+ */
+        (__pyx_v_dx_sq[((__pyx_v_s * __pyx_e_6pymica_7methods_16inverse_distance_TILE_COLS) + __pyx_v_c)]) = ((float)(__pyx_v_dx * __pyx_v_dx));
+
+        /* "pymica/methods/inverse_distance.pyx":417
+ *                 dx = x - px[block + s]
+ *                 dx_sq[s * TILE_COLS + c] = <float> (dx * dx)
+ *                 if exact_hits and dx * dx + smoothing_sq < 1e-11:             # <<<<<<<<<<<<<<
+ *                     for r2 in range(rows):
+ *                         y = cgeotransform[3] + (row0 + r2) * cgeotransform[5]
+ */
+        if (__pyx_v_exact_hits) {
+        } else {
+          __pyx_t_4 = __pyx_v_exact_hits;
+          goto __pyx_L19_bool_binop_done;
+        }
+        __pyx_t_5 = (((__pyx_v_dx * __pyx_v_dx) + __pyx_v_smoothing_sq) < 1e-11);
+        __pyx_t_4 = __pyx_t_5;
+        __pyx_L19_bool_binop_done:;
+        if (__pyx_t_4) {
+
+          /* "pymica/methods/inverse_distance.pyx":418
+ *                 dx_sq[s * TILE_COLS + c] = <float> (dx * dx)
+ *                 if exact_hits and dx * dx + smoothing_sq < 1e-11:
+ *                     for r2 in range(rows):             # <<<<<<<<<<<<<<
+ *                         y = cgeotransform[3] + (row0 + r2) * cgeotransform[5]
+ *                         dy = y - py[block + s]
+ */
+          __pyx_t_17 = __pyx_v_rows;
+          __pyx_t_18 = __pyx_t_17;
+          for (__pyx_t_19 = 0; __pyx_t_19 < __pyx_t_18; __pyx_t_19+=1) {
+            __pyx_v_r2 = __pyx_t_19;
+
+            /* "pymica/methods/inverse_distance.pyx":419
+ *                 if exact_hits and dx * dx + smoothing_sq < 1e-11:
+ *                     for r2 in range(rows):
+ *                         y = cgeotransform[3] + (row0 + r2) * cgeotransform[5]             # <<<<<<<<<<<<<<
+ *                         dy = y - py[block + s]
+ *                         p = r2 * cols + c
+ */
+            __pyx_t_16 = 3;
+            __pyx_t_7 = 5;
+            __pyx_v_y = ((*((double *) ( /* dim=0 */ (__pyx_v_cgeotransform.data + __pyx_t_16 * __pyx_v_cgeotransform.strides[0]) ))) + ((__pyx_v_row0 + __pyx_v_r2) * (*((double *) ( /* dim=0 */ (__pyx_v_cgeotransform.data + __pyx_t_7 * __pyx_v_cgeotransform.strides[0]) )))));
+
+            /* "pymica/methods/inverse_distance.pyx":420
+ *                     for r2 in range(rows):
+ *                         y = cgeotransform[3] + (row0 + r2) * cgeotransform[5]
+ *                         dy = y - py[block + s]             # <<<<<<<<<<<<<<
+ *                         p = r2 * cols + c
+ *                         if (hit[p] == 0
+ */
+            __pyx_v_dy = (__pyx_v_y - (__pyx_v_py[(__pyx_v_block + __pyx_v_s)]));
+
+            /* "pymica/methods/inverse_distance.pyx":421
+ *                         y = cgeotransform[3] + (row0 + r2) * cgeotransform[5]
+ *                         dy = y - py[block + s]
+ *                         p = r2 * cols + c             # <<<<<<<<<<<<<<
+ *                         if (hit[p] == 0
+ *                                 and dx * dx + dy * dy + smoothing_sq < 1e-11):
+ */
+            __pyx_v_p = ((__pyx_v_r2 * __pyx_v_cols) + __pyx_v_c);
+
+            /* "pymica/methods/inverse_distance.pyx":422
+ *                         dy = y - py[block + s]
+ *                         p = r2 * cols + c
+ *                         if (hit[p] == 0             # <<<<<<<<<<<<<<
+ *                                 and dx * dx + dy * dy + smoothing_sq < 1e-11):
+ *                             hit[p] = 1
+ */
+            __pyx_t_5 = ((__pyx_v_hit[__pyx_v_p]) == 0);
+            if (__pyx_t_5) {
+            } else {
+              __pyx_t_4 = __pyx_t_5;
+              goto __pyx_L24_bool_binop_done;
+            }
+
+            /* "pymica/methods/inverse_distance.pyx":423
+ *                         p = r2 * cols + c
+ *                         if (hit[p] == 0
+ *                                 and dx * dx + dy * dy + smoothing_sq < 1e-11):             # <<<<<<<<<<<<<<
+ *                             hit[p] = 1
+ *                             numerator[p] = pv[block + s]
+ */
+            __pyx_t_5 = ((((__pyx_v_dx * __pyx_v_dx) + (__pyx_v_dy * __pyx_v_dy)) + __pyx_v_smoothing_sq) < 1e-11);
+            __pyx_t_4 = __pyx_t_5;
+            __pyx_L24_bool_binop_done:;
+
+            /* "pymica/methods/inverse_distance.pyx":422
+ *                         dy = y - py[block + s]
+ *                         p = r2 * cols + c
+ *                         if (hit[p] == 0             # <<<<<<<<<<<<<<
+ *                                 and dx * dx + dy * dy + smoothing_sq < 1e-11):
+ *                             hit[p] = 1
+ */
+            if (__pyx_t_4) {
+
+              /* "pymica/methods/inverse_distance.pyx":424
+ *                         if (hit[p] == 0
+ *                                 and dx * dx + dy * dy + smoothing_sq < 1e-11):
+ *                             hit[p] = 1             # <<<<<<<<<<<<<<
+ *                             numerator[p] = pv[block + s]
+ * 
+ */
+              (__pyx_v_hit[__pyx_v_p]) = 1;
+
+              /* "pymica/methods/inverse_distance.pyx":425
+ *                                 and dx * dx + dy * dy + smoothing_sq < 1e-11):
+ *                             hit[p] = 1
+ *                             numerator[p] = pv[block + s]             # <<<<<<<<<<<<<<
+ * 
+ *         for r in range(rows):
+ */
+              (__pyx_v_numerator[__pyx_v_p]) = (__pyx_v_pv[(__pyx_v_block + __pyx_v_s)]);
+
+              /* "pymica/methods/inverse_distance.pyx":422
+ *                         dy = y - py[block + s]
+ *                         p = r2 * cols + c
+ *                         if (hit[p] == 0             # <<<<<<<<<<<<<<
+ *                                 and dx * dx + dy * dy + smoothing_sq < 1e-11):
+ *                             hit[p] = 1
+ */
+            }
+          }
+
+          /* "pymica/methods/inverse_distance.pyx":417
+ *                 dx = x - px[block + s]
+ *                 dx_sq[s * TILE_COLS + c] = <float> (dx * dx)
+ *                 if exact_hits and dx * dx + smoothing_sq < 1e-11:             # <<<<<<<<<<<<<<
+ *                     for r2 in range(rows):
+ *                         y = cgeotransform[3] + (row0 + r2) * cgeotransform[5]
+ */
+        }
+      }
+    }
+
+    /* "pymica/methods/inverse_distance.pyx":427
+ *                             numerator[p] = pv[block + s]
+ * 
+ *         for r in range(rows):             # <<<<<<<<<<<<<<
+ *             y = cgeotransform[3] + (row0 + r) * cgeotransform[5]
+ *             for c in range(cols):
+ */
+    __pyx_t_11 = __pyx_v_rows;
+    __pyx_t_10 = __pyx_t_11;
+    for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_10; __pyx_t_12+=1) {
+      __pyx_v_r = __pyx_t_12;
+
+      /* "pymica/methods/inverse_distance.pyx":428
+ * 
+ *         for r in range(rows):
+ *             y = cgeotransform[3] + (row0 + r) * cgeotransform[5]             # <<<<<<<<<<<<<<
+ *             for c in range(cols):
+ *                 num[c] = 0.0
+ */
+      __pyx_t_7 = 3;
+      __pyx_t_16 = 5;
+      __pyx_v_y = ((*((double *) ( /* dim=0 */ (__pyx_v_cgeotransform.data + __pyx_t_7 * __pyx_v_cgeotransform.strides[0]) ))) + ((__pyx_v_row0 + __pyx_v_r) * (*((double *) ( /* dim=0 */ (__pyx_v_cgeotransform.data + __pyx_t_16 * __pyx_v_cgeotransform.strides[0]) )))));
+
+      /* "pymica/methods/inverse_distance.pyx":429
+ *         for r in range(rows):
+ *             y = cgeotransform[3] + (row0 + r) * cgeotransform[5]
+ *             for c in range(cols):             # <<<<<<<<<<<<<<
+ *                 num[c] = 0.0
+ *                 den[c] = 0.0
+ */
+      __pyx_t_13 = __pyx_v_cols;
+      __pyx_t_14 = __pyx_t_13;
+      for (__pyx_t_15 = 0; __pyx_t_15 < __pyx_t_14; __pyx_t_15+=1) {
+        __pyx_v_c = __pyx_t_15;
+
+        /* "pymica/methods/inverse_distance.pyx":430
+ *             y = cgeotransform[3] + (row0 + r) * cgeotransform[5]
+ *             for c in range(cols):
+ *                 num[c] = 0.0             # <<<<<<<<<<<<<<
+ *                 den[c] = 0.0
+ *             for s in range(block_size):
+ */
+        (__pyx_v_num[__pyx_v_c]) = 0.0;
+
+        /* "pymica/methods/inverse_distance.pyx":431
+ *             for c in range(cols):
+ *                 num[c] = 0.0
+ *                 den[c] = 0.0             # <<<<<<<<<<<<<<
+ *             for s in range(block_size):
+ *                 dy = y - py[block + s]
+ */
+        (__pyx_v_den[__pyx_v_c]) = 0.0;
+      }
+
+      /* "pymica/methods/inverse_distance.pyx":432
+ *                 num[c] = 0.0
+ *                 den[c] = 0.0
+ *             for s in range(block_size):             # <<<<<<<<<<<<<<
+ *                 dy = y - py[block + s]
+ *                 row_dy_sq = <float> (dy * dy) + smoothing_sq
+ */
+      __pyx_t_13 = __pyx_v_block_size;
+      __pyx_t_14 = __pyx_t_13;
+      for (__pyx_t_15 = 0; __pyx_t_15 < __pyx_t_14; __pyx_t_15+=1) {
+        __pyx_v_s = __pyx_t_15;
+
+        /* "pymica/methods/inverse_distance.pyx":433
+ *                 den[c] = 0.0
+ *             for s in range(block_size):
+ *                 dy = y - py[block + s]             # <<<<<<<<<<<<<<
+ *                 row_dy_sq = <float> (dy * dy) + smoothing_sq
+ *                 value = <float> pv[block + s]
+ */
+        __pyx_v_dy = (__pyx_v_y - (__pyx_v_py[(__pyx_v_block + __pyx_v_s)]));
+
+        /* "pymica/methods/inverse_distance.pyx":434
+ *             for s in range(block_size):
+ *                 dy = y - py[block + s]
+ *                 row_dy_sq = <float> (dy * dy) + smoothing_sq             # <<<<<<<<<<<<<<
+ *                 value = <float> pv[block + s]
+ *                 row_dx_sq = dx_sq + s * TILE_COLS
+ */
+        __pyx_v_row_dy_sq = (((float)(__pyx_v_dy * __pyx_v_dy)) + __pyx_v_smoothing_sq);
+
+        /* "pymica/methods/inverse_distance.pyx":435
+ *                 dy = y - py[block + s]
+ *                 row_dy_sq = <float> (dy * dy) + smoothing_sq
+ *                 value = <float> pv[block + s]             # <<<<<<<<<<<<<<
+ *                 row_dx_sq = dx_sq + s * TILE_COLS
+ *                 if inverse_square:
+ */
+        __pyx_v_value = ((float)(__pyx_v_pv[(__pyx_v_block + __pyx_v_s)]));
+
+        /* "pymica/methods/inverse_distance.pyx":436
+ *                 row_dy_sq = <float> (dy * dy) + smoothing_sq
+ *                 value = <float> pv[block + s]
+ *                 row_dx_sq = dx_sq + s * TILE_COLS             # <<<<<<<<<<<<<<
+ *                 if inverse_square:
+ *                     for c in range(cols):
+ */
+        __pyx_v_row_dx_sq = (__pyx_v_dx_sq + (__pyx_v_s * __pyx_e_6pymica_7methods_16inverse_distance_TILE_COLS));
+
+        /* "pymica/methods/inverse_distance.pyx":437
+ *                 value = <float> pv[block + s]
+ *                 row_dx_sq = dx_sq + s * TILE_COLS
+ *                 if inverse_square:             # <<<<<<<<<<<<<<
+ *                     for c in range(cols):
+ *                         weight = one / (row_dx_sq[c] + row_dy_sq)
+ */
+        if (__pyx_v_inverse_square) {
+
+          /* "pymica/methods/inverse_distance.pyx":438
+ *                 row_dx_sq = dx_sq + s * TILE_COLS
+ *                 if inverse_square:
+ *                     for c in range(cols):             # <<<<<<<<<<<<<<
+ *                         weight = one / (row_dx_sq[c] + row_dy_sq)
+ *                         num[c] += value * weight
+ */
+          __pyx_t_17 = __pyx_v_cols;
+          __pyx_t_18 = __pyx_t_17;
+          for (__pyx_t_19 = 0; __pyx_t_19 < __pyx_t_18; __pyx_t_19+=1) {
+            __pyx_v_c = __pyx_t_19;
+
+            /* "pymica/methods/inverse_distance.pyx":439
+ *                 if inverse_square:
+ *                     for c in range(cols):
+ *                         weight = one / (row_dx_sq[c] + row_dy_sq)             # <<<<<<<<<<<<<<
+ *                         num[c] += value * weight
+ *                         den[c] += weight
+ */
+            __pyx_v_weight = (__pyx_v_one / ((__pyx_v_row_dx_sq[__pyx_v_c]) + __pyx_v_row_dy_sq));
+
+            /* "pymica/methods/inverse_distance.pyx":440
+ *                     for c in range(cols):
+ *                         weight = one / (row_dx_sq[c] + row_dy_sq)
+ *                         num[c] += value * weight             # <<<<<<<<<<<<<<
+ *                         den[c] += weight
+ *                 elif power.whole == 1 and power.quarters == 1:
+ */
+            __pyx_t_20 = __pyx_v_c;
+            (__pyx_v_num[__pyx_t_20]) = ((__pyx_v_num[__pyx_t_20]) + (__pyx_v_value * __pyx_v_weight));
+
+            /* "pymica/methods/inverse_distance.pyx":441
+ *                         weight = one / (row_dx_sq[c] + row_dy_sq)
+ *                         num[c] += value * weight
+ *                         den[c] += weight             # <<<<<<<<<<<<<<
+ *                 elif power.whole == 1 and power.quarters == 1:
+ *                     for c in range(cols):
+ */
+            __pyx_t_20 = __pyx_v_c;
+            (__pyx_v_den[__pyx_t_20]) = ((__pyx_v_den[__pyx_t_20]) + __pyx_v_weight);
+          }
+
+          /* "pymica/methods/inverse_distance.pyx":437
+ *                 value = <float> pv[block + s]
+ *                 row_dx_sq = dx_sq + s * TILE_COLS
+ *                 if inverse_square:             # <<<<<<<<<<<<<<
+ *                     for c in range(cols):
+ *                         weight = one / (row_dx_sq[c] + row_dy_sq)
+ */
+          goto __pyx_L32;
+        }
+
+        /* "pymica/methods/inverse_distance.pyx":442
+ *                         num[c] += value * weight
+ *                         den[c] += weight
+ *                 elif power.whole == 1 and power.quarters == 1:             # <<<<<<<<<<<<<<
+ *                     for c in range(cols):
+ *                         dist_sq = row_dx_sq[c] + row_dy_sq
+ */
+        __pyx_t_5 = (__pyx_v_power.whole == 1);
+        if (__pyx_t_5) {
+        } else {
+          __pyx_t_4 = __pyx_t_5;
+          goto __pyx_L35_bool_binop_done;
+        }
+        __pyx_t_5 = (__pyx_v_power.quarters == 1);
+        __pyx_t_4 = __pyx_t_5;
+        __pyx_L35_bool_binop_done:;
+        if (__pyx_t_4) {
+
+          /* "pymica/methods/inverse_distance.pyx":443
+ *                         den[c] += weight
+ *                 elif power.whole == 1 and power.quarters == 1:
+ *                     for c in range(cols):             # <<<<<<<<<<<<<<
+ *                         dist_sq = row_dx_sq[c] + row_dy_sq
+ *                         weight = one / (dist_sq * sqrtf(sqrtf(dist_sq)))
+ */
+          __pyx_t_17 = __pyx_v_cols;
+          __pyx_t_18 = __pyx_t_17;
+          for (__pyx_t_19 = 0; __pyx_t_19 < __pyx_t_18; __pyx_t_19+=1) {
+            __pyx_v_c = __pyx_t_19;
+
+            /* "pymica/methods/inverse_distance.pyx":444
+ *                 elif power.whole == 1 and power.quarters == 1:
+ *                     for c in range(cols):
+ *                         dist_sq = row_dx_sq[c] + row_dy_sq             # <<<<<<<<<<<<<<
+ *                         weight = one / (dist_sq * sqrtf(sqrtf(dist_sq)))
+ *                         num[c] += value * weight
+ */
+            __pyx_v_dist_sq = ((__pyx_v_row_dx_sq[__pyx_v_c]) + __pyx_v_row_dy_sq);
+
+            /* "pymica/methods/inverse_distance.pyx":445
+ *                     for c in range(cols):
+ *                         dist_sq = row_dx_sq[c] + row_dy_sq
+ *                         weight = one / (dist_sq * sqrtf(sqrtf(dist_sq)))             # <<<<<<<<<<<<<<
+ *                         num[c] += value * weight
+ *                         den[c] += weight
+ */
+            __pyx_v_weight = (__pyx_v_one / (__pyx_v_dist_sq * sqrtf(sqrtf(__pyx_v_dist_sq))));
+
+            /* "pymica/methods/inverse_distance.pyx":446
+ *                         dist_sq = row_dx_sq[c] + row_dy_sq
+ *                         weight = one / (dist_sq * sqrtf(sqrtf(dist_sq)))
+ *                         num[c] += value * weight             # <<<<<<<<<<<<<<
+ *                         den[c] += weight
+ *                 elif power.whole == 1 and power.quarters == 2:
+ */
+            __pyx_t_20 = __pyx_v_c;
+            (__pyx_v_num[__pyx_t_20]) = ((__pyx_v_num[__pyx_t_20]) + (__pyx_v_value * __pyx_v_weight));
+
+            /* "pymica/methods/inverse_distance.pyx":447
+ *                         weight = one / (dist_sq * sqrtf(sqrtf(dist_sq)))
+ *                         num[c] += value * weight
+ *                         den[c] += weight             # <<<<<<<<<<<<<<
+ *                 elif power.whole == 1 and power.quarters == 2:
+ *                     for c in range(cols):
+ */
+            __pyx_t_20 = __pyx_v_c;
+            (__pyx_v_den[__pyx_t_20]) = ((__pyx_v_den[__pyx_t_20]) + __pyx_v_weight);
+          }
+
+          /* "pymica/methods/inverse_distance.pyx":442
+ *                         num[c] += value * weight
+ *                         den[c] += weight
+ *                 elif power.whole == 1 and power.quarters == 1:             # <<<<<<<<<<<<<<
+ *                     for c in range(cols):
+ *                         dist_sq = row_dx_sq[c] + row_dy_sq
+ */
+          goto __pyx_L32;
+        }
+
+        /* "pymica/methods/inverse_distance.pyx":448
+ *                         num[c] += value * weight
+ *                         den[c] += weight
+ *                 elif power.whole == 1 and power.quarters == 2:             # <<<<<<<<<<<<<<
+ *                     for c in range(cols):
+ *                         dist_sq = row_dx_sq[c] + row_dy_sq
+ */
+        __pyx_t_5 = (__pyx_v_power.whole == 1);
+        if (__pyx_t_5) {
+        } else {
+          __pyx_t_4 = __pyx_t_5;
+          goto __pyx_L39_bool_binop_done;
+        }
+        __pyx_t_5 = (__pyx_v_power.quarters == 2);
+        __pyx_t_4 = __pyx_t_5;
+        __pyx_L39_bool_binop_done:;
+        if (__pyx_t_4) {
+
+          /* "pymica/methods/inverse_distance.pyx":449
+ *                         den[c] += weight
+ *                 elif power.whole == 1 and power.quarters == 2:
+ *                     for c in range(cols):             # <<<<<<<<<<<<<<
+ *                         dist_sq = row_dx_sq[c] + row_dy_sq
+ *                         weight = one / (dist_sq * sqrtf(dist_sq))
+ */
+          __pyx_t_17 = __pyx_v_cols;
+          __pyx_t_18 = __pyx_t_17;
+          for (__pyx_t_19 = 0; __pyx_t_19 < __pyx_t_18; __pyx_t_19+=1) {
+            __pyx_v_c = __pyx_t_19;
+
+            /* "pymica/methods/inverse_distance.pyx":450
+ *                 elif power.whole == 1 and power.quarters == 2:
+ *                     for c in range(cols):
+ *                         dist_sq = row_dx_sq[c] + row_dy_sq             # <<<<<<<<<<<<<<
+ *                         weight = one / (dist_sq * sqrtf(dist_sq))
+ *                         num[c] += value * weight
+ */
+            __pyx_v_dist_sq = ((__pyx_v_row_dx_sq[__pyx_v_c]) + __pyx_v_row_dy_sq);
+
+            /* "pymica/methods/inverse_distance.pyx":451
+ *                     for c in range(cols):
+ *                         dist_sq = row_dx_sq[c] + row_dy_sq
+ *                         weight = one / (dist_sq * sqrtf(dist_sq))             # <<<<<<<<<<<<<<
+ *                         num[c] += value * weight
+ *                         den[c] += weight
+ */
+            __pyx_v_weight = (__pyx_v_one / (__pyx_v_dist_sq * sqrtf(__pyx_v_dist_sq)));
+
+            /* "pymica/methods/inverse_distance.pyx":452
+ *                         dist_sq = row_dx_sq[c] + row_dy_sq
+ *                         weight = one / (dist_sq * sqrtf(dist_sq))
+ *                         num[c] += value * weight             # <<<<<<<<<<<<<<
+ *                         den[c] += weight
+ *                 else:
+ */
+            __pyx_t_20 = __pyx_v_c;
+            (__pyx_v_num[__pyx_t_20]) = ((__pyx_v_num[__pyx_t_20]) + (__pyx_v_value * __pyx_v_weight));
+
+            /* "pymica/methods/inverse_distance.pyx":453
+ *                         weight = one / (dist_sq * sqrtf(dist_sq))
+ *                         num[c] += value * weight
+ *                         den[c] += weight             # <<<<<<<<<<<<<<
+ *                 else:
+ *                     for c in range(cols):
+ */
+            __pyx_t_20 = __pyx_v_c;
+            (__pyx_v_den[__pyx_t_20]) = ((__pyx_v_den[__pyx_t_20]) + __pyx_v_weight);
+          }
+
+          /* "pymica/methods/inverse_distance.pyx":448
+ *                         num[c] += value * weight
+ *                         den[c] += weight
+ *                 elif power.whole == 1 and power.quarters == 2:             # <<<<<<<<<<<<<<
+ *                     for c in range(cols):
+ *                         dist_sq = row_dx_sq[c] + row_dy_sq
+ */
+          goto __pyx_L32;
+        }
+
+        /* "pymica/methods/inverse_distance.pyx":455
+ *                         den[c] += weight
+ *                 else:
+ *                     for c in range(cols):             # <<<<<<<<<<<<<<
+ *                         weight = station_weight32(row_dx_sq[c] + row_dy_sq,
+ *                                                   power)
+ */
+        /*else*/ {
+          __pyx_t_17 = __pyx_v_cols;
+          __pyx_t_18 = __pyx_t_17;
+          for (__pyx_t_19 = 0; __pyx_t_19 < __pyx_t_18; __pyx_t_19+=1) {
+            __pyx_v_c = __pyx_t_19;
+
+            /* "pymica/methods/inverse_distance.pyx":456
+ *                 else:
+ *                     for c in range(cols):
+ *                         weight = station_weight32(row_dx_sq[c] + row_dy_sq,             # <<<<<<<<<<<<<<
+ *                                                   power)
+ *                         num[c] += value * weight
+ */
+            __pyx_v_weight = __pyx_f_6pymica_7methods_9idw_power_station_weight32(((__pyx_v_row_dx_sq[__pyx_v_c]) + __pyx_v_row_dy_sq), __pyx_v_power);
+
+            /* "pymica/methods/inverse_distance.pyx":458
+ *                         weight = station_weight32(row_dx_sq[c] + row_dy_sq,
+ *                                                   power)
+ *                         num[c] += value * weight             # <<<<<<<<<<<<<<
+ *                         den[c] += weight
+ *             for c in range(cols):
+ */
+            __pyx_t_20 = __pyx_v_c;
+            (__pyx_v_num[__pyx_t_20]) = ((__pyx_v_num[__pyx_t_20]) + (__pyx_v_value * __pyx_v_weight));
+
+            /* "pymica/methods/inverse_distance.pyx":459
+ *                                                   power)
+ *                         num[c] += value * weight
+ *                         den[c] += weight             # <<<<<<<<<<<<<<
+ *             for c in range(cols):
+ *                 p = r * cols + c
+ */
+            __pyx_t_20 = __pyx_v_c;
+            (__pyx_v_den[__pyx_t_20]) = ((__pyx_v_den[__pyx_t_20]) + __pyx_v_weight);
+          }
+        }
+        __pyx_L32:;
+      }
+
+      /* "pymica/methods/inverse_distance.pyx":460
+ *                         num[c] += value * weight
+ *                         den[c] += weight
+ *             for c in range(cols):             # <<<<<<<<<<<<<<
+ *                 p = r * cols + c
+ *                 if hit[p] == 0:
+ */
+      __pyx_t_13 = __pyx_v_cols;
+      __pyx_t_14 = __pyx_t_13;
+      for (__pyx_t_15 = 0; __pyx_t_15 < __pyx_t_14; __pyx_t_15+=1) {
+        __pyx_v_c = __pyx_t_15;
+
+        /* "pymica/methods/inverse_distance.pyx":461
+ *                         den[c] += weight
+ *             for c in range(cols):
+ *                 p = r * cols + c             # <<<<<<<<<<<<<<
+ *                 if hit[p] == 0:
+ *                     numerator[p] += num[c]
+ */
+        __pyx_v_p = ((__pyx_v_r * __pyx_v_cols) + __pyx_v_c);
+
+        /* "pymica/methods/inverse_distance.pyx":462
+ *             for c in range(cols):
+ *                 p = r * cols + c
+ *                 if hit[p] == 0:             # <<<<<<<<<<<<<<
+ *                     numerator[p] += num[c]
+ *                     denominator[p] += den[c]
+ */
+        __pyx_t_4 = ((__pyx_v_hit[__pyx_v_p]) == 0);
+        if (__pyx_t_4) {
+
+          /* "pymica/methods/inverse_distance.pyx":463
+ *                 p = r * cols + c
+ *                 if hit[p] == 0:
+ *                     numerator[p] += num[c]             # <<<<<<<<<<<<<<
+ *                     denominator[p] += den[c]
+ *         block = block + block_size
+ */
+          __pyx_t_17 = __pyx_v_p;
+          (__pyx_v_numerator[__pyx_t_17]) = ((__pyx_v_numerator[__pyx_t_17]) + (__pyx_v_num[__pyx_v_c]));
+
+          /* "pymica/methods/inverse_distance.pyx":464
+ *                 if hit[p] == 0:
+ *                     numerator[p] += num[c]
+ *                     denominator[p] += den[c]             # <<<<<<<<<<<<<<
+ *         block = block + block_size
+ * 
+ */
+          __pyx_t_17 = __pyx_v_p;
+          (__pyx_v_denominator[__pyx_t_17]) = ((__pyx_v_denominator[__pyx_t_17]) + (__pyx_v_den[__pyx_v_c]));
+
+          /* "pymica/methods/inverse_distance.pyx":462
+ *             for c in range(cols):
+ *                 p = r * cols + c
+ *                 if hit[p] == 0:             # <<<<<<<<<<<<<<
+ *                     numerator[p] += num[c]
+ *                     denominator[p] += den[c]
+ */
+        }
+      }
+    }
+
+    /* "pymica/methods/inverse_distance.pyx":465
+ *                     numerator[p] += num[c]
+ *                     denominator[p] += den[c]
+ *         block = block + block_size             # <<<<<<<<<<<<<<
+ * 
+ *     for r in range(rows):
+ */
+    __pyx_v_block = (__pyx_v_block + __pyx_v_block_size);
+  }
+
+  /* "pymica/methods/inverse_distance.pyx":467
+ *         block = block + block_size
+ * 
+ *     for r in range(rows):             # <<<<<<<<<<<<<<
+ *         for c in range(cols):
+ *             p = r * cols + c
+ */
+  __pyx_t_11 = __pyx_v_rows;
+  __pyx_t_10 = __pyx_t_11;
+  for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_10; __pyx_t_12+=1) {
+    __pyx_v_r = __pyx_t_12;
+
+    /* "pymica/methods/inverse_distance.pyx":468
+ * 
+ *     for r in range(rows):
+ *         for c in range(cols):             # <<<<<<<<<<<<<<
+ *             p = r * cols + c
+ *             if hit[p] == 2:
+ */
+    __pyx_t_13 = __pyx_v_cols;
+    __pyx_t_14 = __pyx_t_13;
+    for (__pyx_t_15 = 0; __pyx_t_15 < __pyx_t_14; __pyx_t_15+=1) {
+      __pyx_v_c = __pyx_t_15;
+
+      /* "pymica/methods/inverse_distance.pyx":469
+ *     for r in range(rows):
+ *         for c in range(cols):
+ *             p = r * cols + c             # <<<<<<<<<<<<<<
+ *             if hit[p] == 2:
+ *                 out[row0 + r, col0 + c] = <floating> nodata
+ */
+      __pyx_v_p = ((__pyx_v_r * __pyx_v_cols) + __pyx_v_c);
+
+      /* "pymica/methods/inverse_distance.pyx":470
+ *         for c in range(cols):
+ *             p = r * cols + c
+ *             if hit[p] == 2:             # <<<<<<<<<<<<<<
+ *                 out[row0 + r, col0 + c] = <floating> nodata
+ *             elif hit[p]:
+ */
+      __pyx_t_4 = ((__pyx_v_hit[__pyx_v_p]) == 2);
+      if (__pyx_t_4) {
+
+        /* "pymica/methods/inverse_distance.pyx":471
+ *             p = r * cols + c
+ *             if hit[p] == 2:
+ *                 out[row0 + r, col0 + c] = <floating> nodata             # <<<<<<<<<<<<<<
+ *             elif hit[p]:
+ *                 out[row0 + r, col0 + c] = <floating> numerator[p]
+ */
+        __pyx_t_16 = (__pyx_v_row0 + __pyx_v_r);
+        __pyx_t_7 = (__pyx_v_col0 + __pyx_v_c);
+        *((float *) ( /* dim=1 */ ((char *) (((float *) ( /* dim=0 */ (__pyx_v_out.data + __pyx_t_16 * __pyx_v_out.strides[0]) )) + __pyx_t_7)) )) = ((float)__pyx_v_nodata);
+
+        /* "pymica/methods/inverse_distance.pyx":470
+ *         for c in range(cols):
+ *             p = r * cols + c
+ *             if hit[p] == 2:             # <<<<<<<<<<<<<<
+ *                 out[row0 + r, col0 + c] = <floating> nodata
+ *             elif hit[p]:
+ */
+        goto __pyx_L52;
+      }
+
+      /* "pymica/methods/inverse_distance.pyx":472
+ *             if hit[p] == 2:
+ *                 out[row0 + r, col0 + c] = <floating> nodata
+ *             elif hit[p]:             # <<<<<<<<<<<<<<
+ *                 out[row0 + r, col0 + c] = <floating> numerator[p]
+ *             elif denominator[p] != 0.0:
+ */
+      __pyx_t_4 = ((__pyx_v_hit[__pyx_v_p]) != 0);
+      if (__pyx_t_4) {
+
+        /* "pymica/methods/inverse_distance.pyx":473
+ *                 out[row0 + r, col0 + c] = <floating> nodata
+ *             elif hit[p]:
+ *                 out[row0 + r, col0 + c] = <floating> numerator[p]             # <<<<<<<<<<<<<<
+ *             elif denominator[p] != 0.0:
+ *                 out[row0 + r, col0 + c] = <floating> (numerator[p] / denominator[p])
+ */
+        __pyx_t_7 = (__pyx_v_row0 + __pyx_v_r);
+        __pyx_t_16 = (__pyx_v_col0 + __pyx_v_c);
+        *((float *) ( /* dim=1 */ ((char *) (((float *) ( /* dim=0 */ (__pyx_v_out.data + __pyx_t_7 * __pyx_v_out.strides[0]) )) + __pyx_t_16)) )) = ((float)(__pyx_v_numerator[__pyx_v_p]));
+
+        /* "pymica/methods/inverse_distance.pyx":472
+ *             if hit[p] == 2:
+ *                 out[row0 + r, col0 + c] = <floating> nodata
+ *             elif hit[p]:             # <<<<<<<<<<<<<<
+ *                 out[row0 + r, col0 + c] = <floating> numerator[p]
+ *             elif denominator[p] != 0.0:
+ */
+        goto __pyx_L52;
+      }
+
+      /* "pymica/methods/inverse_distance.pyx":474
+ *             elif hit[p]:
+ *                 out[row0 + r, col0 + c] = <floating> numerator[p]
+ *             elif denominator[p] != 0.0:             # <<<<<<<<<<<<<<
+ *                 out[row0 + r, col0 + c] = <floating> (numerator[p] / denominator[p])
+ *             else:
+ */
+      __pyx_t_4 = ((__pyx_v_denominator[__pyx_v_p]) != 0.0);
+      if (__pyx_t_4) {
+
+        /* "pymica/methods/inverse_distance.pyx":475
+ *                 out[row0 + r, col0 + c] = <floating> numerator[p]
+ *             elif denominator[p] != 0.0:
+ *                 out[row0 + r, col0 + c] = <floating> (numerator[p] / denominator[p])             # <<<<<<<<<<<<<<
+ *             else:
+ *                 out[row0 + r, col0 + c] = 0.0
+ */
+        __pyx_t_16 = (__pyx_v_row0 + __pyx_v_r);
+        __pyx_t_7 = (__pyx_v_col0 + __pyx_v_c);
+        *((float *) ( /* dim=1 */ ((char *) (((float *) ( /* dim=0 */ (__pyx_v_out.data + __pyx_t_16 * __pyx_v_out.strides[0]) )) + __pyx_t_7)) )) = ((float)((__pyx_v_numerator[__pyx_v_p]) / (__pyx_v_denominator[__pyx_v_p])));
+
+        /* "pymica/methods/inverse_distance.pyx":474
+ *             elif hit[p]:
+ *                 out[row0 + r, col0 + c] = <floating> numerator[p]
+ *             elif denominator[p] != 0.0:             # <<<<<<<<<<<<<<
+ *                 out[row0 + r, col0 + c] = <floating> (numerator[p] / denominator[p])
+ *             else:
+ */
+        goto __pyx_L52;
+      }
+
+      /* "pymica/methods/inverse_distance.pyx":477
+ *                 out[row0 + r, col0 + c] = <floating> (numerator[p] / denominator[p])
+ *             else:
+ *                 out[row0 + r, col0 + c] = 0.0             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+      /*else*/ {
+        __pyx_t_7 = (__pyx_v_row0 + __pyx_v_r);
+        __pyx_t_16 = (__pyx_v_col0 + __pyx_v_c);
+        *((float *) ( /* dim=1 */ ((char *) (((float *) ( /* dim=0 */ (__pyx_v_out.data + __pyx_t_7 * __pyx_v_out.strides[0]) )) + __pyx_t_16)) )) = 0.0;
+      }
+      __pyx_L52:;
+    }
+  }
+
+  /* "pymica/methods/inverse_distance.pyx":370
+ * 
+ * 
+ * cdef void fill_tile32(floating[:, ::1] out, int row0, int col0,             # <<<<<<<<<<<<<<
+ *                       const double[::1] xpos, const double[::1] ypos,
+ *                       const double[::1] values, double[:] cgeotransform,
+ */
+
+  /* function exit code */
+}
+
+static void __pyx_fuse_1__pyx_f_6pymica_7methods_16inverse_distance_fill_tile32(__Pyx_memviewslice __pyx_v_out, int __pyx_v_row0, int __pyx_v_col0, __Pyx_memviewslice __pyx_v_xpos, __Pyx_memviewslice __pyx_v_ypos, __Pyx_memviewslice __pyx_v_values, __Pyx_memviewslice __pyx_v_cgeotransform, struct __pyx_t_6pymica_7methods_9idw_power_IdwPower __pyx_v_power, float __pyx_v_smoothing, unsigned char const *__pyx_v_mask, double __pyx_v_nodata, double *__pyx_v_numerator, double *__pyx_v_denominator, char *__pyx_v_hit, float *__pyx_v_dx_sq, float *__pyx_v_block_sums) {
+  int __pyx_v_rows;
+  int __pyx_v_cols;
+  int __pyx_v_N;
+  float __pyx_v_smoothing_sq;
+  int __pyx_v_exact_hits;
+  int __pyx_v_inverse_square;
+  float __pyx_v_one;
+  float __pyx_v_dist_sq;
+  float __pyx_v_weight;
+  float __pyx_v_value;
+  float __pyx_v_row_dy_sq;
+  float *__pyx_v_num;
+  float *__pyx_v_den;
+  float const *__pyx_v_row_dx_sq;
+  double __pyx_v_x;
+  double __pyx_v_y;
+  double __pyx_v_dx;
+  double __pyx_v_dy;
+  int __pyx_v_block;
+  int __pyx_v_block_size;
+  int __pyx_v_r;
+  int __pyx_v_c;
+  int __pyx_v_p;
+  int __pyx_v_s;
+  int __pyx_v_r2;
+  int __pyx_v_valid;
+  double const *__pyx_v_px;
+  double const *__pyx_v_py;
+  double const *__pyx_v_pv;
+  Py_ssize_t __pyx_t_1;
+  int __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  double const *__pyx_t_6;
+  Py_ssize_t __pyx_t_7;
+  double const *__pyx_t_8;
+  double const *__pyx_t_9;
+  int __pyx_t_10;
+  int __pyx_t_11;
+  int __pyx_t_12;
+  int __pyx_t_13;
+  int __pyx_t_14;
+  int __pyx_t_15;
+  Py_ssize_t __pyx_t_16;
+  int __pyx_t_17;
+  int __pyx_t_18;
+  int __pyx_t_19;
+  int __pyx_t_20;
+
+  /* "pymica/methods/inverse_distance.pyx":380
+ *     in float64 before adding the block, with the same threshold as fill_tile,
+ *     and the first of those stations gives their value."""
+ *     cdef int rows = min(TILE_ROWS, out.shape[0] - row0)             # <<<<<<<<<<<<<<
+ *     cdef int cols = min(TILE_COLS, out.shape[1] - col0)
+ *     cdef int N = values.shape[0]
+ */
+  __pyx_t_1 = ((__pyx_v_out.shape[0]) - __pyx_v_row0);
+  __pyx_t_2 = __pyx_e_6pymica_7methods_16inverse_distance_TILE_ROWS;
+  __pyx_t_4 = (__pyx_t_1 < __pyx_t_2);
+  if (__pyx_t_4) {
+    __pyx_t_3 = __pyx_t_1;
+  } else {
+    __pyx_t_3 = __pyx_t_2;
+  }
+  __pyx_v_rows = __pyx_t_3;
+
+  /* "pymica/methods/inverse_distance.pyx":381
+ *     and the first of those stations gives their value."""
+ *     cdef int rows = min(TILE_ROWS, out.shape[0] - row0)
+ *     cdef int cols = min(TILE_COLS, out.shape[1] - col0)             # <<<<<<<<<<<<<<
+ *     cdef int N = values.shape[0]
+ *     cdef float smoothing_sq = smoothing * smoothing
+ */
+  __pyx_t_3 = ((__pyx_v_out.shape[1]) - __pyx_v_col0);
+  __pyx_t_2 = __pyx_e_6pymica_7methods_16inverse_distance_TILE_COLS;
+  __pyx_t_4 = (__pyx_t_3 < __pyx_t_2);
+  if (__pyx_t_4) {
+    __pyx_t_1 = __pyx_t_3;
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+  }
+  __pyx_v_cols = __pyx_t_1;
+
+  /* "pymica/methods/inverse_distance.pyx":382
+ *     cdef int rows = min(TILE_ROWS, out.shape[0] - row0)
+ *     cdef int cols = min(TILE_COLS, out.shape[1] - col0)
+ *     cdef int N = values.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef float smoothing_sq = smoothing * smoothing
+ *     cdef bint exact_hits = smoothing_sq < 1e-11
+ */
+  __pyx_v_N = (__pyx_v_values.shape[0]);
+
+  /* "pymica/methods/inverse_distance.pyx":383
+ *     cdef int cols = min(TILE_COLS, out.shape[1] - col0)
+ *     cdef int N = values.shape[0]
+ *     cdef float smoothing_sq = smoothing * smoothing             # <<<<<<<<<<<<<<
+ *     cdef bint exact_hits = smoothing_sq < 1e-11
+ *     cdef bint inverse_square = power.whole == 1 and power.quarters == 0
+ */
+  __pyx_v_smoothing_sq = (__pyx_v_smoothing * __pyx_v_smoothing);
+
+  /* "pymica/methods/inverse_distance.pyx":384
+ *     cdef int N = values.shape[0]
+ *     cdef float smoothing_sq = smoothing * smoothing
+ *     cdef bint exact_hits = smoothing_sq < 1e-11             # <<<<<<<<<<<<<<
+ *     cdef bint inverse_square = power.whole == 1 and power.quarters == 0
+ *     cdef float one = 1.0
+ */
+  __pyx_v_exact_hits = (__pyx_v_smoothing_sq < 1e-11);
+
+  /* "pymica/methods/inverse_distance.pyx":385
+ *     cdef float smoothing_sq = smoothing * smoothing
+ *     cdef bint exact_hits = smoothing_sq < 1e-11
+ *     cdef bint inverse_square = power.whole == 1 and power.quarters == 0             # <<<<<<<<<<<<<<
+ *     cdef float one = 1.0
+ *     cdef float dist_sq, weight, value, row_dy_sq
+ */
+  __pyx_t_5 = (__pyx_v_power.whole == 1);
+  if (__pyx_t_5) {
+  } else {
+    __pyx_t_4 = __pyx_t_5;
+    goto __pyx_L3_bool_binop_done;
+  }
+  __pyx_t_5 = (__pyx_v_power.quarters == 0);
+  __pyx_t_4 = __pyx_t_5;
+  __pyx_L3_bool_binop_done:;
+  __pyx_v_inverse_square = __pyx_t_4;
+
+  /* "pymica/methods/inverse_distance.pyx":386
+ *     cdef bint exact_hits = smoothing_sq < 1e-11
+ *     cdef bint inverse_square = power.whole == 1 and power.quarters == 0
+ *     cdef float one = 1.0             # <<<<<<<<<<<<<<
+ *     cdef float dist_sq, weight, value, row_dy_sq
+ *     cdef float *num = block_sums
+ */
+  __pyx_v_one = 1.0;
+
+  /* "pymica/methods/inverse_distance.pyx":388
+ *     cdef float one = 1.0
+ *     cdef float dist_sq, weight, value, row_dy_sq
+ *     cdef float *num = block_sums             # <<<<<<<<<<<<<<
+ *     cdef float *den = block_sums + TILE_COLS
+ *     cdef const float *row_dx_sq
+ */
+  __pyx_v_num = __pyx_v_block_sums;
+
+  /* "pymica/methods/inverse_distance.pyx":389
+ *     cdef float dist_sq, weight, value, row_dy_sq
+ *     cdef float *num = block_sums
+ *     cdef float *den = block_sums + TILE_COLS             # <<<<<<<<<<<<<<
+ *     cdef const float *row_dx_sq
+ *     cdef double x, y, dx, dy
+ */
+  __pyx_v_den = (__pyx_v_block_sums + __pyx_e_6pymica_7methods_16inverse_distance_TILE_COLS);
+
+  /* "pymica/methods/inverse_distance.pyx":393
+ *     cdef double x, y, dx, dy
+ *     cdef int block, block_size, r, c, p, s, r2
+ *     cdef int valid = rows * cols             # <<<<<<<<<<<<<<
+ *     cdef const double *px = &xpos[0] if N > 0 else NULL
+ *     cdef const double *py = &ypos[0] if N > 0 else NULL
+ */
+  __pyx_v_valid = (__pyx_v_rows * __pyx_v_cols);
+
+  /* "pymica/methods/inverse_distance.pyx":394
+ *     cdef int block, block_size, r, c, p, s, r2
+ *     cdef int valid = rows * cols
+ *     cdef const double *px = &xpos[0] if N > 0 else NULL             # <<<<<<<<<<<<<<
+ *     cdef const double *py = &ypos[0] if N > 0 else NULL
+ *     cdef const double *pv = &values[0] if N > 0 else NULL
+ */
+  __pyx_t_4 = (__pyx_v_N > 0);
+  if (__pyx_t_4) {
+    __pyx_t_7 = 0;
+    __pyx_t_6 = (&(*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_xpos.data) + __pyx_t_7)) ))));
+  } else {
+    __pyx_t_6 = NULL;
+  }
+  __pyx_v_px = __pyx_t_6;
+
+  /* "pymica/methods/inverse_distance.pyx":395
+ *     cdef int valid = rows * cols
+ *     cdef const double *px = &xpos[0] if N > 0 else NULL
+ *     cdef const double *py = &ypos[0] if N > 0 else NULL             # <<<<<<<<<<<<<<
+ *     cdef const double *pv = &values[0] if N > 0 else NULL
+ * 
+ */
+  __pyx_t_4 = (__pyx_v_N > 0);
+  if (__pyx_t_4) {
+    __pyx_t_7 = 0;
+    __pyx_t_8 = (&(*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_ypos.data) + __pyx_t_7)) ))));
+  } else {
+    __pyx_t_8 = NULL;
+  }
+  __pyx_v_py = __pyx_t_8;
+
+  /* "pymica/methods/inverse_distance.pyx":396
+ *     cdef const double *px = &xpos[0] if N > 0 else NULL
+ *     cdef const double *py = &ypos[0] if N > 0 else NULL
+ *     cdef const double *pv = &values[0] if N > 0 else NULL             # <<<<<<<<<<<<<<
+ * 
+ *     for r in range(rows):
+ */
+  __pyx_t_4 = (__pyx_v_N > 0);
+  if (__pyx_t_4) {
+    __pyx_t_7 = 0;
+    __pyx_t_9 = (&(*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_values.data) + __pyx_t_7)) ))));
+  } else {
+    __pyx_t_9 = NULL;
+  }
+  __pyx_v_pv = __pyx_t_9;
+
+  /* "pymica/methods/inverse_distance.pyx":398
+ *     cdef const double *pv = &values[0] if N > 0 else NULL
+ * 
+ *     for r in range(rows):             # <<<<<<<<<<<<<<
+ *         for c in range(cols):
+ *             p = r * cols + c
+ */
+  __pyx_t_10 = __pyx_v_rows;
+  __pyx_t_11 = __pyx_t_10;
+  for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_11; __pyx_t_12+=1) {
+    __pyx_v_r = __pyx_t_12;
+
+    /* "pymica/methods/inverse_distance.pyx":399
+ * 
+ *     for r in range(rows):
+ *         for c in range(cols):             # <<<<<<<<<<<<<<
+ *             p = r * cols + c
+ *             numerator[p] = 0.0
+ */
+    __pyx_t_13 = __pyx_v_cols;
+    __pyx_t_14 = __pyx_t_13;
+    for (__pyx_t_15 = 0; __pyx_t_15 < __pyx_t_14; __pyx_t_15+=1) {
+      __pyx_v_c = __pyx_t_15;
+
+      /* "pymica/methods/inverse_distance.pyx":400
+ *     for r in range(rows):
+ *         for c in range(cols):
+ *             p = r * cols + c             # <<<<<<<<<<<<<<
+ *             numerator[p] = 0.0
+ *             denominator[p] = 0.0
+ */
+      __pyx_v_p = ((__pyx_v_r * __pyx_v_cols) + __pyx_v_c);
+
+      /* "pymica/methods/inverse_distance.pyx":401
+ *         for c in range(cols):
+ *             p = r * cols + c
+ *             numerator[p] = 0.0             # <<<<<<<<<<<<<<
+ *             denominator[p] = 0.0
+ *             hit[p] = 0
+ */
+      (__pyx_v_numerator[__pyx_v_p]) = 0.0;
+
+      /* "pymica/methods/inverse_distance.pyx":402
+ *             p = r * cols + c
+ *             numerator[p] = 0.0
+ *             denominator[p] = 0.0             # <<<<<<<<<<<<<<
+ *             hit[p] = 0
+ *             if mask != NULL and not mask[(row0 + r) * out.shape[1] + col0 + c]:
+ */
+      (__pyx_v_denominator[__pyx_v_p]) = 0.0;
+
+      /* "pymica/methods/inverse_distance.pyx":403
+ *             numerator[p] = 0.0
+ *             denominator[p] = 0.0
+ *             hit[p] = 0             # <<<<<<<<<<<<<<
+ *             if mask != NULL and not mask[(row0 + r) * out.shape[1] + col0 + c]:
+ *                 hit[p] = 2
+ */
+      (__pyx_v_hit[__pyx_v_p]) = 0;
+
+      /* "pymica/methods/inverse_distance.pyx":404
+ *             denominator[p] = 0.0
+ *             hit[p] = 0
+ *             if mask != NULL and not mask[(row0 + r) * out.shape[1] + col0 + c]:             # <<<<<<<<<<<<<<
+ *                 hit[p] = 2
+ *                 valid = valid - 1
+ */
+      __pyx_t_5 = (__pyx_v_mask != NULL);
+      if (__pyx_t_5) {
+      } else {
+        __pyx_t_4 = __pyx_t_5;
+        goto __pyx_L10_bool_binop_done;
+      }
+      __pyx_t_5 = (!((__pyx_v_mask[((((__pyx_v_row0 + __pyx_v_r) * (__pyx_v_out.shape[1])) + __pyx_v_col0) + __pyx_v_c)]) != 0));
+      __pyx_t_4 = __pyx_t_5;
+      __pyx_L10_bool_binop_done:;
+      if (__pyx_t_4) {
+
+        /* "pymica/methods/inverse_distance.pyx":405
+ *             hit[p] = 0
+ *             if mask != NULL and not mask[(row0 + r) * out.shape[1] + col0 + c]:
+ *                 hit[p] = 2             # <<<<<<<<<<<<<<
+ *                 valid = valid - 1
+ * 
+ */
+        (__pyx_v_hit[__pyx_v_p]) = 2;
+
+        /* "pymica/methods/inverse_distance.pyx":406
+ *             if mask != NULL and not mask[(row0 + r) * out.shape[1] + col0 + c]:
+ *                 hit[p] = 2
+ *                 valid = valid - 1             # <<<<<<<<<<<<<<
+ * 
+ *     block = 0 if valid > 0 else N
+ */
+        __pyx_v_valid = (__pyx_v_valid - 1);
+
+        /* "pymica/methods/inverse_distance.pyx":404
+ *             denominator[p] = 0.0
+ *             hit[p] = 0
+ *             if mask != NULL and not mask[(row0 + r) * out.shape[1] + col0 + c]:             # <<<<<<<<<<<<<<
+ *                 hit[p] = 2
+ *                 valid = valid - 1
+ */
+      }
+    }
+  }
+
+  /* "pymica/methods/inverse_distance.pyx":408
+ *                 valid = valid - 1
+ * 
+ *     block = 0 if valid > 0 else N             # <<<<<<<<<<<<<<
+ *     while block < N:
+ *         block_size = min(STATION_BLOCK, N - block)
+ */
+  __pyx_t_4 = (__pyx_v_valid > 0);
+  if (__pyx_t_4) {
+    __pyx_t_10 = 0;
+  } else {
+    __pyx_t_10 = __pyx_v_N;
+  }
+  __pyx_v_block = __pyx_t_10;
+
+  /* "pymica/methods/inverse_distance.pyx":409
+ * 
+ *     block = 0 if valid > 0 else N
+ *     while block < N:             # <<<<<<<<<<<<<<
+ *         block_size = min(STATION_BLOCK, N - block)
+ * 
+ */
+  while (1) {
+    __pyx_t_4 = (__pyx_v_block < __pyx_v_N);
+    if (!__pyx_t_4) break;
+
+    /* "pymica/methods/inverse_distance.pyx":410
+ *     block = 0 if valid > 0 else N
+ *     while block < N:
+ *         block_size = min(STATION_BLOCK, N - block)             # <<<<<<<<<<<<<<
+ * 
+ *         for s in range(block_size):
+ */
+    __pyx_t_10 = (__pyx_v_N - __pyx_v_block);
+    __pyx_t_2 = __pyx_e_6pymica_7methods_16inverse_distance_STATION_BLOCK;
+    __pyx_t_4 = (__pyx_t_10 < __pyx_t_2);
+    if (__pyx_t_4) {
+      __pyx_t_11 = __pyx_t_10;
+    } else {
+      __pyx_t_11 = __pyx_t_2;
+    }
+    __pyx_v_block_size = __pyx_t_11;
+
+    /* "pymica/methods/inverse_distance.pyx":412
+ *         block_size = min(STATION_BLOCK, N - block)
+ * 
+ *         for s in range(block_size):             # <<<<<<<<<<<<<<
+ *             for c in range(cols):
+ *                 x = cgeotransform[0] + (col0 + c) * cgeotransform[1]
+ */
+    __pyx_t_11 = __pyx_v_block_size;
+    __pyx_t_10 = __pyx_t_11;
+    for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_10; __pyx_t_12+=1) {
+      __pyx_v_s = __pyx_t_12;
+
+      /* "pymica/methods/inverse_distance.pyx":413
+ * 
+ *         for s in range(block_size):
+ *             for c in range(cols):             # <<<<<<<<<<<<<<
+ *                 x = cgeotransform[0] + (col0 + c) * cgeotransform[1]
+ *                 dx = x - px[block + s]
+ */
+      __pyx_t_13 = __pyx_v_cols;
+      __pyx_t_14 = __pyx_t_13;
+      for (__pyx_t_15 = 0; __pyx_t_15 < __pyx_t_14; __pyx_t_15+=1) {
+        __pyx_v_c = __pyx_t_15;
+
+        /* "pymica/methods/inverse_distance.pyx":414
+ *         for s in range(block_size):
+ *             for c in range(cols):
+ *                 x = cgeotransform[0] + (col0 + c) * cgeotransform[1]             # <<<<<<<<<<<<<<
+ *                 dx = x - px[block + s]
+ *                 dx_sq[s * TILE_COLS + c] = <float> (dx * dx)
+ */
+        __pyx_t_7 = 0;
+        __pyx_t_16 = 1;
+        __pyx_v_x = ((*((double *) ( /* dim=0 */ (__pyx_v_cgeotransform.data + __pyx_t_7 * __pyx_v_cgeotransform.strides[0]) ))) + ((__pyx_v_col0 + __pyx_v_c) * (*((double *) ( /* dim=0 */ (__pyx_v_cgeotransform.data + __pyx_t_16 * __pyx_v_cgeotransform.strides[0]) )))));
+
+        /* "pymica/methods/inverse_distance.pyx":415
+ *             for c in range(cols):
+ *                 x = cgeotransform[0] + (col0 + c) * cgeotransform[1]
+ *                 dx = x - px[block + s]             # <<<<<<<<<<<<<<
+ *                 dx_sq[s * TILE_COLS + c] = <float> (dx * dx)
+ *                 if exact_hits and dx * dx + smoothing_sq < 1e-11:
+ */
+        __pyx_v_dx = (__pyx_v_x - (__pyx_v_px[(__pyx_v_block + __pyx_v_s)]));
+
+        /* "pymica/methods/inverse_distance.pyx":416
+ *                 x = cgeotransform[0] + (col0 + c) * cgeotransform[1]
+ *                 dx = x - px[block + s]
+ *                 dx_sq[s * TILE_COLS + c] = <float> (dx * dx)             # <<<<<<<<<<<<<<
+ *                 if exact_hits and dx * dx + smoothing_sq < 1e-11:
+ *                     for r2 in range(rows):
+ */
+        (__pyx_v_dx_sq[((__pyx_v_s * __pyx_e_6pymica_7methods_16inverse_distance_TILE_COLS) + __pyx_v_c)]) = ((float)(__pyx_v_dx * __pyx_v_dx));
+
+        /* "pymica/methods/inverse_distance.pyx":417
+ *                 dx = x - px[block + s]
+ *                 dx_sq[s * TILE_COLS + c] = <float> (dx * dx)
+ *                 if exact_hits and dx * dx + smoothing_sq < 1e-11:             # <<<<<<<<<<<<<<
+ *                     for r2 in range(rows):
+ *                         y = cgeotransform[3] + (row0 + r2) * cgeotransform[5]
+ */
+        if (__pyx_v_exact_hits) {
+        } else {
+          __pyx_t_4 = __pyx_v_exact_hits;
+          goto __pyx_L19_bool_binop_done;
+        }
+        __pyx_t_5 = (((__pyx_v_dx * __pyx_v_dx) + __pyx_v_smoothing_sq) < 1e-11);
+        __pyx_t_4 = __pyx_t_5;
+        __pyx_L19_bool_binop_done:;
+        if (__pyx_t_4) {
+
+          /* "pymica/methods/inverse_distance.pyx":418
+ *                 dx_sq[s * TILE_COLS + c] = <float> (dx * dx)
+ *                 if exact_hits and dx * dx + smoothing_sq < 1e-11:
+ *                     for r2 in range(rows):             # <<<<<<<<<<<<<<
+ *                         y = cgeotransform[3] + (row0 + r2) * cgeotransform[5]
+ *                         dy = y - py[block + s]
+ */
+          __pyx_t_17 = __pyx_v_rows;
+          __pyx_t_18 = __pyx_t_17;
+          for (__pyx_t_19 = 0; __pyx_t_19 < __pyx_t_18; __pyx_t_19+=1) {
+            __pyx_v_r2 = __pyx_t_19;
+
+            /* "pymica/methods/inverse_distance.pyx":419
+ *                 if exact_hits and dx * dx + smoothing_sq < 1e-11:
+ *                     for r2 in range(rows):
+ *                         y = cgeotransform[3] + (row0 + r2) * cgeotransform[5]             # <<<<<<<<<<<<<<
+ *                         dy = y - py[block + s]
+ *                         p = r2 * cols + c
+ */
+            __pyx_t_16 = 3;
+            __pyx_t_7 = 5;
+            __pyx_v_y = ((*((double *) ( /* dim=0 */ (__pyx_v_cgeotransform.data + __pyx_t_16 * __pyx_v_cgeotransform.strides[0]) ))) + ((__pyx_v_row0 + __pyx_v_r2) * (*((double *) ( /* dim=0 */ (__pyx_v_cgeotransform.data + __pyx_t_7 * __pyx_v_cgeotransform.strides[0]) )))));
+
+            /* "pymica/methods/inverse_distance.pyx":420
+ *                     for r2 in range(rows):
+ *                         y = cgeotransform[3] + (row0 + r2) * cgeotransform[5]
+ *                         dy = y - py[block + s]             # <<<<<<<<<<<<<<
+ *                         p = r2 * cols + c
+ *                         if (hit[p] == 0
+ */
+            __pyx_v_dy = (__pyx_v_y - (__pyx_v_py[(__pyx_v_block + __pyx_v_s)]));
+
+            /* "pymica/methods/inverse_distance.pyx":421
+ *                         y = cgeotransform[3] + (row0 + r2) * cgeotransform[5]
+ *                         dy = y - py[block + s]
+ *                         p = r2 * cols + c             # <<<<<<<<<<<<<<
+ *                         if (hit[p] == 0
+ *                                 and dx * dx + dy * dy + smoothing_sq < 1e-11):
+ */
+            __pyx_v_p = ((__pyx_v_r2 * __pyx_v_cols) + __pyx_v_c);
+
+            /* "pymica/methods/inverse_distance.pyx":422
+ *                         dy = y - py[block + s]
+ *                         p = r2 * cols + c
+ *                         if (hit[p] == 0             # <<<<<<<<<<<<<<
+ *                                 and dx * dx + dy * dy + smoothing_sq < 1e-11):
+ *                             hit[p] = 1
+ */
+            __pyx_t_5 = ((__pyx_v_hit[__pyx_v_p]) == 0);
+            if (__pyx_t_5) {
+            } else {
+              __pyx_t_4 = __pyx_t_5;
+              goto __pyx_L24_bool_binop_done;
+            }
+
+            /* "pymica/methods/inverse_distance.pyx":423
+ *                         p = r2 * cols + c
+ *                         if (hit[p] == 0
+ *                                 and dx * dx + dy * dy + smoothing_sq < 1e-11):             # <<<<<<<<<<<<<<
+ *                             hit[p] = 1
+ *                             numerator[p] = pv[block + s]
+ */
+            __pyx_t_5 = ((((__pyx_v_dx * __pyx_v_dx) + (__pyx_v_dy * __pyx_v_dy)) + __pyx_v_smoothing_sq) < 1e-11);
+            __pyx_t_4 = __pyx_t_5;
+            __pyx_L24_bool_binop_done:;
+
+            /* "pymica/methods/inverse_distance.pyx":422
+ *                         dy = y - py[block + s]
+ *                         p = r2 * cols + c
+ *                         if (hit[p] == 0             # <<<<<<<<<<<<<<
+ *                                 and dx * dx + dy * dy + smoothing_sq < 1e-11):
+ *                             hit[p] = 1
+ */
+            if (__pyx_t_4) {
+
+              /* "pymica/methods/inverse_distance.pyx":424
+ *                         if (hit[p] == 0
+ *                                 and dx * dx + dy * dy + smoothing_sq < 1e-11):
+ *                             hit[p] = 1             # <<<<<<<<<<<<<<
+ *                             numerator[p] = pv[block + s]
+ * 
+ */
+              (__pyx_v_hit[__pyx_v_p]) = 1;
+
+              /* "pymica/methods/inverse_distance.pyx":425
+ *                                 and dx * dx + dy * dy + smoothing_sq < 1e-11):
+ *                             hit[p] = 1
+ *                             numerator[p] = pv[block + s]             # <<<<<<<<<<<<<<
+ * 
+ *         for r in range(rows):
+ */
+              (__pyx_v_numerator[__pyx_v_p]) = (__pyx_v_pv[(__pyx_v_block + __pyx_v_s)]);
+
+              /* "pymica/methods/inverse_distance.pyx":422
+ *                         dy = y - py[block + s]
+ *                         p = r2 * cols + c
+ *                         if (hit[p] == 0             # <<<<<<<<<<<<<<
+ *                                 and dx * dx + dy * dy + smoothing_sq < 1e-11):
+ *                             hit[p] = 1
+ */
+            }
+          }
+
+          /* "pymica/methods/inverse_distance.pyx":417
+ *                 dx = x - px[block + s]
+ *                 dx_sq[s * TILE_COLS + c] = <float> (dx * dx)
+ *                 if exact_hits and dx * dx + smoothing_sq < 1e-11:             # <<<<<<<<<<<<<<
+ *                     for r2 in range(rows):
+ *                         y = cgeotransform[3] + (row0 + r2) * cgeotransform[5]
+ */
+        }
+      }
+    }
+
+    /* "pymica/methods/inverse_distance.pyx":427
+ *                             numerator[p] = pv[block + s]
+ * 
+ *         for r in range(rows):             # <<<<<<<<<<<<<<
+ *             y = cgeotransform[3] + (row0 + r) * cgeotransform[5]
+ *             for c in range(cols):
+ */
+    __pyx_t_11 = __pyx_v_rows;
+    __pyx_t_10 = __pyx_t_11;
+    for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_10; __pyx_t_12+=1) {
+      __pyx_v_r = __pyx_t_12;
+
+      /* "pymica/methods/inverse_distance.pyx":428
+ * 
+ *         for r in range(rows):
+ *             y = cgeotransform[3] + (row0 + r) * cgeotransform[5]             # <<<<<<<<<<<<<<
+ *             for c in range(cols):
+ *                 num[c] = 0.0
+ */
+      __pyx_t_7 = 3;
+      __pyx_t_16 = 5;
+      __pyx_v_y = ((*((double *) ( /* dim=0 */ (__pyx_v_cgeotransform.data + __pyx_t_7 * __pyx_v_cgeotransform.strides[0]) ))) + ((__pyx_v_row0 + __pyx_v_r) * (*((double *) ( /* dim=0 */ (__pyx_v_cgeotransform.data + __pyx_t_16 * __pyx_v_cgeotransform.strides[0]) )))));
+
+      /* "pymica/methods/inverse_distance.pyx":429
+ *         for r in range(rows):
+ *             y = cgeotransform[3] + (row0 + r) * cgeotransform[5]
+ *             for c in range(cols):             # <<<<<<<<<<<<<<
+ *                 num[c] = 0.0
+ *                 den[c] = 0.0
+ */
+      __pyx_t_13 = __pyx_v_cols;
+      __pyx_t_14 = __pyx_t_13;
+      for (__pyx_t_15 = 0; __pyx_t_15 < __pyx_t_14; __pyx_t_15+=1) {
+        __pyx_v_c = __pyx_t_15;
+
+        /* "pymica/methods/inverse_distance.pyx":430
+ *             y = cgeotransform[3] + (row0 + r) * cgeotransform[5]
+ *             for c in range(cols):
+ *                 num[c] = 0.0             # <<<<<<<<<<<<<<
+ *                 den[c] = 0.0
+ *             for s in range(block_size):
+ */
+        (__pyx_v_num[__pyx_v_c]) = 0.0;
+
+        /* "pymica/methods/inverse_distance.pyx":431
+ *             for c in range(cols):
+ *                 num[c] = 0.0
+ *                 den[c] = 0.0             # <<<<<<<<<<<<<<
+ *             for s in range(block_size):
+ *                 dy = y - py[block + s]
+ */
+        (__pyx_v_den[__pyx_v_c]) = 0.0;
+      }
+
+      /* "pymica/methods/inverse_distance.pyx":432
+ *                 num[c] = 0.0
+ *                 den[c] = 0.0
+ *             for s in range(block_size):             # <<<<<<<<<<<<<<
+ *                 dy = y - py[block + s]
+ *                 row_dy_sq = <float> (dy * dy) + smoothing_sq
+ */
+      __pyx_t_13 = __pyx_v_block_size;
+      __pyx_t_14 = __pyx_t_13;
+      for (__pyx_t_15 = 0; __pyx_t_15 < __pyx_t_14; __pyx_t_15+=1) {
+        __pyx_v_s = __pyx_t_15;
+
+        /* "pymica/methods/inverse_distance.pyx":433
+ *                 den[c] = 0.0
+ *             for s in range(block_size):
+ *                 dy = y - py[block + s]             # <<<<<<<<<<<<<<
+ *                 row_dy_sq = <float> (dy * dy) + smoothing_sq
+ *                 value = <float> pv[block + s]
+ */
+        __pyx_v_dy = (__pyx_v_y - (__pyx_v_py[(__pyx_v_block + __pyx_v_s)]));
+
+        /* "pymica/methods/inverse_distance.pyx":434
+ *             for s in range(block_size):
+ *                 dy = y - py[block + s]
+ *                 row_dy_sq = <float> (dy * dy) + smoothing_sq             # <<<<<<<<<<<<<<
+ *                 value = <float> pv[block + s]
+ *                 row_dx_sq = dx_sq + s * TILE_COLS
+ */
+        __pyx_v_row_dy_sq = (((float)(__pyx_v_dy * __pyx_v_dy)) + __pyx_v_smoothing_sq);
+
+        /* "pymica/methods/inverse_distance.pyx":435
+ *                 dy = y - py[block + s]
+ *                 row_dy_sq = <float> (dy * dy) + smoothing_sq
+ *                 value = <float> pv[block + s]             # <<<<<<<<<<<<<<
+ *                 row_dx_sq = dx_sq + s * TILE_COLS
+ *                 if inverse_square:
+ */
+        __pyx_v_value = ((float)(__pyx_v_pv[(__pyx_v_block + __pyx_v_s)]));
+
+        /* "pymica/methods/inverse_distance.pyx":436
+ *                 row_dy_sq = <float> (dy * dy) + smoothing_sq
+ *                 value = <float> pv[block + s]
+ *                 row_dx_sq = dx_sq + s * TILE_COLS             # <<<<<<<<<<<<<<
+ *                 if inverse_square:
+ *                     for c in range(cols):
+ */
+        __pyx_v_row_dx_sq = (__pyx_v_dx_sq + (__pyx_v_s * __pyx_e_6pymica_7methods_16inverse_distance_TILE_COLS));
+
+        /* "pymica/methods/inverse_distance.pyx":437
+ *                 value = <float> pv[block + s]
+ *                 row_dx_sq = dx_sq + s * TILE_COLS
+ *                 if inverse_square:             # <<<<<<<<<<<<<<
+ *                     for c in range(cols):
+ *                         weight = one / (row_dx_sq[c] + row_dy_sq)
+ */
+        if (__pyx_v_inverse_square) {
+
+          /* "pymica/methods/inverse_distance.pyx":438
+ *                 row_dx_sq = dx_sq + s * TILE_COLS
+ *                 if inverse_square:
+ *                     for c in range(cols):             # <<<<<<<<<<<<<<
+ *                         weight = one / (row_dx_sq[c] + row_dy_sq)
+ *                         num[c] += value * weight
+ */
+          __pyx_t_17 = __pyx_v_cols;
+          __pyx_t_18 = __pyx_t_17;
+          for (__pyx_t_19 = 0; __pyx_t_19 < __pyx_t_18; __pyx_t_19+=1) {
+            __pyx_v_c = __pyx_t_19;
+
+            /* "pymica/methods/inverse_distance.pyx":439
+ *                 if inverse_square:
+ *                     for c in range(cols):
+ *                         weight = one / (row_dx_sq[c] + row_dy_sq)             # <<<<<<<<<<<<<<
+ *                         num[c] += value * weight
+ *                         den[c] += weight
+ */
+            __pyx_v_weight = (__pyx_v_one / ((__pyx_v_row_dx_sq[__pyx_v_c]) + __pyx_v_row_dy_sq));
+
+            /* "pymica/methods/inverse_distance.pyx":440
+ *                     for c in range(cols):
+ *                         weight = one / (row_dx_sq[c] + row_dy_sq)
+ *                         num[c] += value * weight             # <<<<<<<<<<<<<<
+ *                         den[c] += weight
+ *                 elif power.whole == 1 and power.quarters == 1:
+ */
+            __pyx_t_20 = __pyx_v_c;
+            (__pyx_v_num[__pyx_t_20]) = ((__pyx_v_num[__pyx_t_20]) + (__pyx_v_value * __pyx_v_weight));
+
+            /* "pymica/methods/inverse_distance.pyx":441
+ *                         weight = one / (row_dx_sq[c] + row_dy_sq)
+ *                         num[c] += value * weight
+ *                         den[c] += weight             # <<<<<<<<<<<<<<
+ *                 elif power.whole == 1 and power.quarters == 1:
+ *                     for c in range(cols):
+ */
+            __pyx_t_20 = __pyx_v_c;
+            (__pyx_v_den[__pyx_t_20]) = ((__pyx_v_den[__pyx_t_20]) + __pyx_v_weight);
+          }
+
+          /* "pymica/methods/inverse_distance.pyx":437
+ *                 value = <float> pv[block + s]
+ *                 row_dx_sq = dx_sq + s * TILE_COLS
+ *                 if inverse_square:             # <<<<<<<<<<<<<<
+ *                     for c in range(cols):
+ *                         weight = one / (row_dx_sq[c] + row_dy_sq)
+ */
+          goto __pyx_L32;
+        }
+
+        /* "pymica/methods/inverse_distance.pyx":442
+ *                         num[c] += value * weight
+ *                         den[c] += weight
+ *                 elif power.whole == 1 and power.quarters == 1:             # <<<<<<<<<<<<<<
+ *                     for c in range(cols):
+ *                         dist_sq = row_dx_sq[c] + row_dy_sq
+ */
+        __pyx_t_5 = (__pyx_v_power.whole == 1);
+        if (__pyx_t_5) {
+        } else {
+          __pyx_t_4 = __pyx_t_5;
+          goto __pyx_L35_bool_binop_done;
+        }
+        __pyx_t_5 = (__pyx_v_power.quarters == 1);
+        __pyx_t_4 = __pyx_t_5;
+        __pyx_L35_bool_binop_done:;
+        if (__pyx_t_4) {
+
+          /* "pymica/methods/inverse_distance.pyx":443
+ *                         den[c] += weight
+ *                 elif power.whole == 1 and power.quarters == 1:
+ *                     for c in range(cols):             # <<<<<<<<<<<<<<
+ *                         dist_sq = row_dx_sq[c] + row_dy_sq
+ *                         weight = one / (dist_sq * sqrtf(sqrtf(dist_sq)))
+ */
+          __pyx_t_17 = __pyx_v_cols;
+          __pyx_t_18 = __pyx_t_17;
+          for (__pyx_t_19 = 0; __pyx_t_19 < __pyx_t_18; __pyx_t_19+=1) {
+            __pyx_v_c = __pyx_t_19;
+
+            /* "pymica/methods/inverse_distance.pyx":444
+ *                 elif power.whole == 1 and power.quarters == 1:
+ *                     for c in range(cols):
+ *                         dist_sq = row_dx_sq[c] + row_dy_sq             # <<<<<<<<<<<<<<
+ *                         weight = one / (dist_sq * sqrtf(sqrtf(dist_sq)))
+ *                         num[c] += value * weight
+ */
+            __pyx_v_dist_sq = ((__pyx_v_row_dx_sq[__pyx_v_c]) + __pyx_v_row_dy_sq);
+
+            /* "pymica/methods/inverse_distance.pyx":445
+ *                     for c in range(cols):
+ *                         dist_sq = row_dx_sq[c] + row_dy_sq
+ *                         weight = one / (dist_sq * sqrtf(sqrtf(dist_sq)))             # <<<<<<<<<<<<<<
+ *                         num[c] += value * weight
+ *                         den[c] += weight
+ */
+            __pyx_v_weight = (__pyx_v_one / (__pyx_v_dist_sq * sqrtf(sqrtf(__pyx_v_dist_sq))));
+
+            /* "pymica/methods/inverse_distance.pyx":446
+ *                         dist_sq = row_dx_sq[c] + row_dy_sq
+ *                         weight = one / (dist_sq * sqrtf(sqrtf(dist_sq)))
+ *                         num[c] += value * weight             # <<<<<<<<<<<<<<
+ *                         den[c] += weight
+ *                 elif power.whole == 1 and power.quarters == 2:
+ */
+            __pyx_t_20 = __pyx_v_c;
+            (__pyx_v_num[__pyx_t_20]) = ((__pyx_v_num[__pyx_t_20]) + (__pyx_v_value * __pyx_v_weight));
+
+            /* "pymica/methods/inverse_distance.pyx":447
+ *                         weight = one / (dist_sq * sqrtf(sqrtf(dist_sq)))
+ *                         num[c] += value * weight
+ *                         den[c] += weight             # <<<<<<<<<<<<<<
+ *                 elif power.whole == 1 and power.quarters == 2:
+ *                     for c in range(cols):
+ */
+            __pyx_t_20 = __pyx_v_c;
+            (__pyx_v_den[__pyx_t_20]) = ((__pyx_v_den[__pyx_t_20]) + __pyx_v_weight);
+          }
+
+          /* "pymica/methods/inverse_distance.pyx":442
+ *                         num[c] += value * weight
+ *                         den[c] += weight
+ *                 elif power.whole == 1 and power.quarters == 1:             # <<<<<<<<<<<<<<
+ *                     for c in range(cols):
+ *                         dist_sq = row_dx_sq[c] + row_dy_sq
+ */
+          goto __pyx_L32;
+        }
+
+        /* "pymica/methods/inverse_distance.pyx":448
+ *                         num[c] += value * weight
+ *                         den[c] += weight
+ *                 elif power.whole == 1 and power.quarters == 2:             # <<<<<<<<<<<<<<
+ *                     for c in range(cols):
+ *                         dist_sq = row_dx_sq[c] + row_dy_sq
+ */
+        __pyx_t_5 = (__pyx_v_power.whole == 1);
+        if (__pyx_t_5) {
+        } else {
+          __pyx_t_4 = __pyx_t_5;
+          goto __pyx_L39_bool_binop_done;
+        }
+        __pyx_t_5 = (__pyx_v_power.quarters == 2);
+        __pyx_t_4 = __pyx_t_5;
+        __pyx_L39_bool_binop_done:;
+        if (__pyx_t_4) {
+
+          /* "pymica/methods/inverse_distance.pyx":449
+ *                         den[c] += weight
+ *                 elif power.whole == 1 and power.quarters == 2:
+ *                     for c in range(cols):             # <<<<<<<<<<<<<<
+ *                         dist_sq = row_dx_sq[c] + row_dy_sq
+ *                         weight = one / (dist_sq * sqrtf(dist_sq))
+ */
+          __pyx_t_17 = __pyx_v_cols;
+          __pyx_t_18 = __pyx_t_17;
+          for (__pyx_t_19 = 0; __pyx_t_19 < __pyx_t_18; __pyx_t_19+=1) {
+            __pyx_v_c = __pyx_t_19;
+
+            /* "pymica/methods/inverse_distance.pyx":450
+ *                 elif power.whole == 1 and power.quarters == 2:
+ *                     for c in range(cols):
+ *                         dist_sq = row_dx_sq[c] + row_dy_sq             # <<<<<<<<<<<<<<
+ *                         weight = one / (dist_sq * sqrtf(dist_sq))
+ *                         num[c] += value * weight
+ */
+            __pyx_v_dist_sq = ((__pyx_v_row_dx_sq[__pyx_v_c]) + __pyx_v_row_dy_sq);
+
+            /* "pymica/methods/inverse_distance.pyx":451
+ *                     for c in range(cols):
+ *                         dist_sq = row_dx_sq[c] + row_dy_sq
+ *                         weight = one / (dist_sq * sqrtf(dist_sq))             # <<<<<<<<<<<<<<
+ *                         num[c] += value * weight
+ *                         den[c] += weight
+ */
+            __pyx_v_weight = (__pyx_v_one / (__pyx_v_dist_sq * sqrtf(__pyx_v_dist_sq)));
+
+            /* "pymica/methods/inverse_distance.pyx":452
+ *                         dist_sq = row_dx_sq[c] + row_dy_sq
+ *                         weight = one / (dist_sq * sqrtf(dist_sq))
+ *                         num[c] += value * weight             # <<<<<<<<<<<<<<
+ *                         den[c] += weight
+ *                 else:
+ */
+            __pyx_t_20 = __pyx_v_c;
+            (__pyx_v_num[__pyx_t_20]) = ((__pyx_v_num[__pyx_t_20]) + (__pyx_v_value * __pyx_v_weight));
+
+            /* "pymica/methods/inverse_distance.pyx":453
+ *                         weight = one / (dist_sq * sqrtf(dist_sq))
+ *                         num[c] += value * weight
+ *                         den[c] += weight             # <<<<<<<<<<<<<<
+ *                 else:
+ *                     for c in range(cols):
+ */
+            __pyx_t_20 = __pyx_v_c;
+            (__pyx_v_den[__pyx_t_20]) = ((__pyx_v_den[__pyx_t_20]) + __pyx_v_weight);
+          }
+
+          /* "pymica/methods/inverse_distance.pyx":448
+ *                         num[c] += value * weight
+ *                         den[c] += weight
+ *                 elif power.whole == 1 and power.quarters == 2:             # <<<<<<<<<<<<<<
+ *                     for c in range(cols):
+ *                         dist_sq = row_dx_sq[c] + row_dy_sq
+ */
+          goto __pyx_L32;
+        }
+
+        /* "pymica/methods/inverse_distance.pyx":455
+ *                         den[c] += weight
+ *                 else:
+ *                     for c in range(cols):             # <<<<<<<<<<<<<<
+ *                         weight = station_weight32(row_dx_sq[c] + row_dy_sq,
+ *                                                   power)
+ */
+        /*else*/ {
+          __pyx_t_17 = __pyx_v_cols;
+          __pyx_t_18 = __pyx_t_17;
+          for (__pyx_t_19 = 0; __pyx_t_19 < __pyx_t_18; __pyx_t_19+=1) {
+            __pyx_v_c = __pyx_t_19;
+
+            /* "pymica/methods/inverse_distance.pyx":456
+ *                 else:
+ *                     for c in range(cols):
+ *                         weight = station_weight32(row_dx_sq[c] + row_dy_sq,             # <<<<<<<<<<<<<<
+ *                                                   power)
+ *                         num[c] += value * weight
+ */
+            __pyx_v_weight = __pyx_f_6pymica_7methods_9idw_power_station_weight32(((__pyx_v_row_dx_sq[__pyx_v_c]) + __pyx_v_row_dy_sq), __pyx_v_power);
+
+            /* "pymica/methods/inverse_distance.pyx":458
+ *                         weight = station_weight32(row_dx_sq[c] + row_dy_sq,
+ *                                                   power)
+ *                         num[c] += value * weight             # <<<<<<<<<<<<<<
+ *                         den[c] += weight
+ *             for c in range(cols):
+ */
+            __pyx_t_20 = __pyx_v_c;
+            (__pyx_v_num[__pyx_t_20]) = ((__pyx_v_num[__pyx_t_20]) + (__pyx_v_value * __pyx_v_weight));
+
+            /* "pymica/methods/inverse_distance.pyx":459
+ *                                                   power)
+ *                         num[c] += value * weight
+ *                         den[c] += weight             # <<<<<<<<<<<<<<
+ *             for c in range(cols):
+ *                 p = r * cols + c
+ */
+            __pyx_t_20 = __pyx_v_c;
+            (__pyx_v_den[__pyx_t_20]) = ((__pyx_v_den[__pyx_t_20]) + __pyx_v_weight);
+          }
+        }
+        __pyx_L32:;
+      }
+
+      /* "pymica/methods/inverse_distance.pyx":460
+ *                         num[c] += value * weight
+ *                         den[c] += weight
+ *             for c in range(cols):             # <<<<<<<<<<<<<<
+ *                 p = r * cols + c
+ *                 if hit[p] == 0:
+ */
+      __pyx_t_13 = __pyx_v_cols;
+      __pyx_t_14 = __pyx_t_13;
+      for (__pyx_t_15 = 0; __pyx_t_15 < __pyx_t_14; __pyx_t_15+=1) {
+        __pyx_v_c = __pyx_t_15;
+
+        /* "pymica/methods/inverse_distance.pyx":461
+ *                         den[c] += weight
+ *             for c in range(cols):
+ *                 p = r * cols + c             # <<<<<<<<<<<<<<
+ *                 if hit[p] == 0:
+ *                     numerator[p] += num[c]
+ */
+        __pyx_v_p = ((__pyx_v_r * __pyx_v_cols) + __pyx_v_c);
+
+        /* "pymica/methods/inverse_distance.pyx":462
+ *             for c in range(cols):
+ *                 p = r * cols + c
+ *                 if hit[p] == 0:             # <<<<<<<<<<<<<<
+ *                     numerator[p] += num[c]
+ *                     denominator[p] += den[c]
+ */
+        __pyx_t_4 = ((__pyx_v_hit[__pyx_v_p]) == 0);
+        if (__pyx_t_4) {
+
+          /* "pymica/methods/inverse_distance.pyx":463
+ *                 p = r * cols + c
+ *                 if hit[p] == 0:
+ *                     numerator[p] += num[c]             # <<<<<<<<<<<<<<
+ *                     denominator[p] += den[c]
+ *         block = block + block_size
+ */
+          __pyx_t_17 = __pyx_v_p;
+          (__pyx_v_numerator[__pyx_t_17]) = ((__pyx_v_numerator[__pyx_t_17]) + (__pyx_v_num[__pyx_v_c]));
+
+          /* "pymica/methods/inverse_distance.pyx":464
+ *                 if hit[p] == 0:
+ *                     numerator[p] += num[c]
+ *                     denominator[p] += den[c]             # <<<<<<<<<<<<<<
+ *         block = block + block_size
+ * 
+ */
+          __pyx_t_17 = __pyx_v_p;
+          (__pyx_v_denominator[__pyx_t_17]) = ((__pyx_v_denominator[__pyx_t_17]) + (__pyx_v_den[__pyx_v_c]));
+
+          /* "pymica/methods/inverse_distance.pyx":462
+ *             for c in range(cols):
+ *                 p = r * cols + c
+ *                 if hit[p] == 0:             # <<<<<<<<<<<<<<
+ *                     numerator[p] += num[c]
+ *                     denominator[p] += den[c]
+ */
+        }
+      }
+    }
+
+    /* "pymica/methods/inverse_distance.pyx":465
+ *                     numerator[p] += num[c]
+ *                     denominator[p] += den[c]
+ *         block = block + block_size             # <<<<<<<<<<<<<<
+ * 
+ *     for r in range(rows):
+ */
+    __pyx_v_block = (__pyx_v_block + __pyx_v_block_size);
+  }
+
+  /* "pymica/methods/inverse_distance.pyx":467
+ *         block = block + block_size
+ * 
+ *     for r in range(rows):             # <<<<<<<<<<<<<<
+ *         for c in range(cols):
+ *             p = r * cols + c
+ */
+  __pyx_t_11 = __pyx_v_rows;
+  __pyx_t_10 = __pyx_t_11;
+  for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_10; __pyx_t_12+=1) {
+    __pyx_v_r = __pyx_t_12;
+
+    /* "pymica/methods/inverse_distance.pyx":468
+ * 
+ *     for r in range(rows):
+ *         for c in range(cols):             # <<<<<<<<<<<<<<
+ *             p = r * cols + c
+ *             if hit[p] == 2:
+ */
+    __pyx_t_13 = __pyx_v_cols;
+    __pyx_t_14 = __pyx_t_13;
+    for (__pyx_t_15 = 0; __pyx_t_15 < __pyx_t_14; __pyx_t_15+=1) {
+      __pyx_v_c = __pyx_t_15;
+
+      /* "pymica/methods/inverse_distance.pyx":469
+ *     for r in range(rows):
+ *         for c in range(cols):
+ *             p = r * cols + c             # <<<<<<<<<<<<<<
+ *             if hit[p] == 2:
+ *                 out[row0 + r, col0 + c] = <floating> nodata
+ */
+      __pyx_v_p = ((__pyx_v_r * __pyx_v_cols) + __pyx_v_c);
+
+      /* "pymica/methods/inverse_distance.pyx":470
+ *         for c in range(cols):
+ *             p = r * cols + c
+ *             if hit[p] == 2:             # <<<<<<<<<<<<<<
+ *                 out[row0 + r, col0 + c] = <floating> nodata
+ *             elif hit[p]:
+ */
+      __pyx_t_4 = ((__pyx_v_hit[__pyx_v_p]) == 2);
+      if (__pyx_t_4) {
+
+        /* "pymica/methods/inverse_distance.pyx":471
+ *             p = r * cols + c
+ *             if hit[p] == 2:
+ *                 out[row0 + r, col0 + c] = <floating> nodata             # <<<<<<<<<<<<<<
+ *             elif hit[p]:
+ *                 out[row0 + r, col0 + c] = <floating> numerator[p]
+ */
+        __pyx_t_16 = (__pyx_v_row0 + __pyx_v_r);
+        __pyx_t_7 = (__pyx_v_col0 + __pyx_v_c);
+        *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_out.data + __pyx_t_16 * __pyx_v_out.strides[0]) )) + __pyx_t_7)) )) = ((double)__pyx_v_nodata);
+
+        /* "pymica/methods/inverse_distance.pyx":470
+ *         for c in range(cols):
+ *             p = r * cols + c
+ *             if hit[p] == 2:             # <<<<<<<<<<<<<<
+ *                 out[row0 + r, col0 + c] = <floating> nodata
+ *             elif hit[p]:
+ */
+        goto __pyx_L52;
+      }
+
+      /* "pymica/methods/inverse_distance.pyx":472
+ *             if hit[p] == 2:
+ *                 out[row0 + r, col0 + c] = <floating> nodata
+ *             elif hit[p]:             # <<<<<<<<<<<<<<
+ *                 out[row0 + r, col0 + c] = <floating> numerator[p]
+ *             elif denominator[p] != 0.0:
+ */
+      __pyx_t_4 = ((__pyx_v_hit[__pyx_v_p]) != 0);
+      if (__pyx_t_4) {
+
+        /* "pymica/methods/inverse_distance.pyx":473
+ *                 out[row0 + r, col0 + c] = <floating> nodata
+ *             elif hit[p]:
+ *                 out[row0 + r, col0 + c] = <floating> numerator[p]             # <<<<<<<<<<<<<<
+ *             elif denominator[p] != 0.0:
+ *                 out[row0 + r, col0 + c] = <floating> (numerator[p] / denominator[p])
+ */
+        __pyx_t_7 = (__pyx_v_row0 + __pyx_v_r);
+        __pyx_t_16 = (__pyx_v_col0 + __pyx_v_c);
+        *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_out.data + __pyx_t_7 * __pyx_v_out.strides[0]) )) + __pyx_t_16)) )) = ((double)(__pyx_v_numerator[__pyx_v_p]));
+
+        /* "pymica/methods/inverse_distance.pyx":472
+ *             if hit[p] == 2:
+ *                 out[row0 + r, col0 + c] = <floating> nodata
+ *             elif hit[p]:             # <<<<<<<<<<<<<<
+ *                 out[row0 + r, col0 + c] = <floating> numerator[p]
+ *             elif denominator[p] != 0.0:
+ */
+        goto __pyx_L52;
+      }
+
+      /* "pymica/methods/inverse_distance.pyx":474
+ *             elif hit[p]:
+ *                 out[row0 + r, col0 + c] = <floating> numerator[p]
+ *             elif denominator[p] != 0.0:             # <<<<<<<<<<<<<<
+ *                 out[row0 + r, col0 + c] = <floating> (numerator[p] / denominator[p])
+ *             else:
+ */
+      __pyx_t_4 = ((__pyx_v_denominator[__pyx_v_p]) != 0.0);
+      if (__pyx_t_4) {
+
+        /* "pymica/methods/inverse_distance.pyx":475
+ *                 out[row0 + r, col0 + c] = <floating> numerator[p]
+ *             elif denominator[p] != 0.0:
+ *                 out[row0 + r, col0 + c] = <floating> (numerator[p] / denominator[p])             # <<<<<<<<<<<<<<
+ *             else:
+ *                 out[row0 + r, col0 + c] = 0.0
+ */
+        __pyx_t_16 = (__pyx_v_row0 + __pyx_v_r);
+        __pyx_t_7 = (__pyx_v_col0 + __pyx_v_c);
+        *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_out.data + __pyx_t_16 * __pyx_v_out.strides[0]) )) + __pyx_t_7)) )) = ((double)((__pyx_v_numerator[__pyx_v_p]) / (__pyx_v_denominator[__pyx_v_p])));
+
+        /* "pymica/methods/inverse_distance.pyx":474
+ *             elif hit[p]:
+ *                 out[row0 + r, col0 + c] = <floating> numerator[p]
+ *             elif denominator[p] != 0.0:             # <<<<<<<<<<<<<<
+ *                 out[row0 + r, col0 + c] = <floating> (numerator[p] / denominator[p])
+ *             else:
+ */
+        goto __pyx_L52;
+      }
+
+      /* "pymica/methods/inverse_distance.pyx":477
+ *                 out[row0 + r, col0 + c] = <floating> (numerator[p] / denominator[p])
+ *             else:
+ *                 out[row0 + r, col0 + c] = 0.0             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+      /*else*/ {
+        __pyx_t_7 = (__pyx_v_row0 + __pyx_v_r);
+        __pyx_t_16 = (__pyx_v_col0 + __pyx_v_c);
+        *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_out.data + __pyx_t_7 * __pyx_v_out.strides[0]) )) + __pyx_t_16)) )) = 0.0;
+      }
+      __pyx_L52:;
+    }
+  }
+
+  /* "pymica/methods/inverse_distance.pyx":370
+ * 
+ * 
+ * cdef void fill_tile32(floating[:, ::1] out, int row0, int col0,             # <<<<<<<<<<<<<<
+ *                       const double[::1] xpos, const double[::1] ypos,
+ *                       const double[::1] values, double[:] cgeotransform,
+ */
+
+  /* function exit code */
+}
+
+/* "pymica/methods/inverse_distance.pyx":494
+ * 
+ * 
+ * def build_grid_index(xpos, ypos, values, int k_nearest=0):             # <<<<<<<<<<<<<<
+ *     """
+ *     build_grid_index(xpos, ypos, values)
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_6pymica_7methods_16inverse_distance_5build_grid_index(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_6pymica_7methods_16inverse_distance_4build_grid_index, "\n    build_grid_index(xpos, ypos, values)\n\n    Sorts the stations into square buckets covering their bounding box, so\n    the stations near a point can be found without visiting all of them.\n\n    Args:\n        xpos (np.array): The x coordinate of the stations\n        ypos (np.array): The y coordinate of the stations\n        values (np.array): The station values\n        k_nearest (int): Number of neighbours that will be queried. Buckets are\n                         sized to hold about that many stations.\n\n    Returns:\n        tuple: x, y and values sorted by bucket, the bucket start offsets, the\n               number of buckets in x and y, the origin and the bucket size.\n    ");
+static PyMethodDef __pyx_mdef_6pymica_7methods_16inverse_distance_5build_grid_index = {"build_grid_index", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_6pymica_7methods_16inverse_distance_5build_grid_index, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_6pymica_7methods_16inverse_distance_4build_grid_index};
+static PyObject *__pyx_pw_6pymica_7methods_16inverse_distance_5build_grid_index(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  PyObject *__pyx_v_xpos = 0;
+  PyObject *__pyx_v_ypos = 0;
+  PyObject *__pyx_v_values = 0;
+  int __pyx_v_k_nearest;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[4] = {0,0,0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("build_grid_index (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_xpos,&__pyx_n_s_ypos,&__pyx_n_s_values,&__pyx_n_s_k_nearest,0};
+    if (__pyx_kwds) {
+      Py_ssize_t kw_args;
+      switch (__pyx_nargs) {
+        case  4: values[3] = __Pyx_Arg_FASTCALL(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = __Pyx_Arg_FASTCALL(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
+      switch (__pyx_nargs) {
+        case  0:
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_xpos)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 494, __pyx_L3_error)
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_ypos)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 494, __pyx_L3_error)
+        else {
+          __Pyx_RaiseArgtupleInvalid("build_grid_index", 0, 3, 4, 1); __PYX_ERR(0, 494, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_values)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[2]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 494, __pyx_L3_error)
+        else {
+          __Pyx_RaiseArgtupleInvalid("build_grid_index", 0, 3, 4, 2); __PYX_ERR(0, 494, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_k_nearest);
+          if (value) { values[3] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 494, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        const Py_ssize_t kwd_pos_args = __pyx_nargs;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "build_grid_index") < 0)) __PYX_ERR(0, 494, __pyx_L3_error)
+      }
+    } else {
+      switch (__pyx_nargs) {
+        case  4: values[3] = __Pyx_Arg_FASTCALL(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = __Pyx_Arg_FASTCALL(__pyx_args, 2);
+        values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+        values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_xpos = values[0];
+    __pyx_v_ypos = values[1];
+    __pyx_v_values = values[2];
+    if (values[3]) {
+      __pyx_v_k_nearest = __Pyx_PyInt_As_int(values[3]); if (unlikely((__pyx_v_k_nearest == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 494, __pyx_L3_error)
+    } else {
+      __pyx_v_k_nearest = ((int)((int)0));
+    }
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("build_grid_index", 0, 3, 4, __pyx_nargs); __PYX_ERR(0, 494, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_AddTraceback("pymica.methods.inverse_distance.build_grid_index", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_6pymica_7methods_16inverse_distance_4build_grid_index(__pyx_self, __pyx_v_xpos, __pyx_v_ypos, __pyx_v_values, __pyx_v_k_nearest);
+
+  /* function exit code */
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_6pymica_7methods_16inverse_distance_4build_grid_index(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_xpos, PyObject *__pyx_v_ypos, PyObject *__pyx_v_values, int __pyx_v_k_nearest) {
+  PyObject *__pyx_v_n_stations = NULL;
+  PyObject *__pyx_v_x0 = NULL;
+  PyObject *__pyx_v_y0 = NULL;
+  PyObject *__pyx_v_width = NULL;
+  PyObject *__pyx_v_height = NULL;
+  PyObject *__pyx_v_per_bucket = NULL;
+  PyObject *__pyx_v_cell_size = NULL;
+  PyObject *__pyx_v_nx = NULL;
+  PyObject *__pyx_v_ny = NULL;
+  PyObject *__pyx_v_bucket_x = NULL;
+  PyObject *__pyx_v_bucket_y = NULL;
+  PyObject *__pyx_v_bucket = NULL;
+  PyObject *__pyx_v_order = NULL;
+  PyObject *__pyx_v_start = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  unsigned int __pyx_t_5;
+  long __pyx_t_6;
+  int __pyx_t_7;
+  long __pyx_t_8;
+  int __pyx_t_9;
+  long __pyx_t_10;
+  int __pyx_t_11;
+  PyObject *__pyx_t_12 = NULL;
+  PyObject *__pyx_t_13 = NULL;
+  PyObject *__pyx_t_14 = NULL;
+  PyObject *__pyx_t_15 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("build_grid_index", 0);
+  __Pyx_INCREF(__pyx_v_xpos);
+  __Pyx_INCREF(__pyx_v_ypos);
+
+  /* "pymica/methods/inverse_distance.pyx":512
+ *                number of buckets in x and y, the origin and the bucket size.
+ *     """
+ *     xpos = np.asarray(xpos, dtype=DTYPE)             # <<<<<<<<<<<<<<
+ *     ypos = np.asarray(ypos, dtype=DTYPE)
+ *     n_stations = xpos.shape[0]
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 512, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_asarray); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 512, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 512, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_v_xpos);
+  __Pyx_GIVEREF(__pyx_v_xpos);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_xpos)) __PYX_ERR(0, 512, __pyx_L1_error);
+  __pyx_t_3 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 512, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_DTYPE); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 512, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_dtype, __pyx_t_4) < 0) __PYX_ERR(0, 512, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_1, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 512, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF_SET(__pyx_v_xpos, __pyx_t_4);
+  __pyx_t_4 = 0;
+
+  /* "pymica/methods/inverse_distance.pyx":513
+ *     """
+ *     xpos = np.asarray(xpos, dtype=DTYPE)
+ *     ypos = np.asarray(ypos, dtype=DTYPE)             # <<<<<<<<<<<<<<
+ *     n_stations = xpos.shape[0]
+ * 
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 513, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_asarray); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 513, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 513, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_INCREF(__pyx_v_ypos);
+  __Pyx_GIVEREF(__pyx_v_ypos);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_ypos)) __PYX_ERR(0, 513, __pyx_L1_error);
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 513, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_DTYPE); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 513, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_dtype, __pyx_t_2) < 0) __PYX_ERR(0, 513, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_4, __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 513, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF_SET(__pyx_v_ypos, __pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "pymica/methods/inverse_distance.pyx":514
+ *     xpos = np.asarray(xpos, dtype=DTYPE)
+ *     ypos = np.asarray(ypos, dtype=DTYPE)
+ *     n_stations = xpos.shape[0]             # <<<<<<<<<<<<<<
+ * 
+ *     x0 = xpos.min()
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_xpos, __pyx_n_s_shape); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 514, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = __Pyx_GetItemInt(__pyx_t_2, 0, long, 1, __Pyx_PyInt_From_long, 0, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 514, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_n_stations = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "pymica/methods/inverse_distance.pyx":516
+ *     n_stations = xpos.shape[0]
+ * 
+ *     x0 = xpos.min()             # <<<<<<<<<<<<<<
+ *     y0 = ypos.min()
+ *     width = xpos.max() - x0
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_xpos, __pyx_n_s_min); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 516, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = NULL;
+  __pyx_t_5 = 0;
+  #if CYTHON_UNPACK_METHODS
+  if (likely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+      __pyx_t_5 = 1;
+    }
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_4, NULL};
+    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_5, 0+__pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 516, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  }
+  __pyx_v_x0 = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "pymica/methods/inverse_distance.pyx":517
+ * 
+ *     x0 = xpos.min()
+ *     y0 = ypos.min()             # <<<<<<<<<<<<<<
+ *     width = xpos.max() - x0
+ *     height = ypos.max() - y0
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_ypos, __pyx_n_s_min); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 517, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = NULL;
+  __pyx_t_5 = 0;
+  #if CYTHON_UNPACK_METHODS
+  if (likely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+      __pyx_t_5 = 1;
+    }
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_4, NULL};
+    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_5, 0+__pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 517, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  }
+  __pyx_v_y0 = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "pymica/methods/inverse_distance.pyx":518
+ *     x0 = xpos.min()
+ *     y0 = ypos.min()
+ *     width = xpos.max() - x0             # <<<<<<<<<<<<<<
+ *     height = ypos.max() - y0
+ * 
+ */
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_xpos, __pyx_n_s_max); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 518, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = NULL;
+  __pyx_t_5 = 0;
+  #if CYTHON_UNPACK_METHODS
+  if (likely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+      __pyx_t_5 = 1;
+    }
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_4, NULL};
+    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_5, 0+__pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 518, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  }
+  __pyx_t_2 = PyNumber_Subtract(__pyx_t_1, __pyx_v_x0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 518, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_width = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "pymica/methods/inverse_distance.pyx":519
+ *     y0 = ypos.min()
+ *     width = xpos.max() - x0
+ *     height = ypos.max() - y0             # <<<<<<<<<<<<<<
+ * 
+ *     per_bucket = max(2, min(k_nearest, 16))
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_ypos, __pyx_n_s_max); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 519, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_4 = NULL;
+  __pyx_t_5 = 0;
+  #if CYTHON_UNPACK_METHODS
+  if (likely(PyMethod_Check(__pyx_t_1))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_1);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_1, function);
+      __pyx_t_5 = 1;
+    }
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_4, NULL};
+    __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_1, __pyx_callargs+1-__pyx_t_5, 0+__pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 519, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  }
+  __pyx_t_1 = PyNumber_Subtract(__pyx_t_2, __pyx_v_y0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 519, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_height = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "pymica/methods/inverse_distance.pyx":521
+ *     height = ypos.max() - y0
+ * 
+ *     per_bucket = max(2, min(k_nearest, 16))             # <<<<<<<<<<<<<<
+ *     if width > 0 and height > 0:
+ *         cell_size = np.sqrt(width * height * per_bucket / n_stations)
+ */
+  __pyx_t_6 = 16;
+  __pyx_t_7 = __pyx_v_k_nearest;
+  __pyx_t_9 = (__pyx_t_6 < __pyx_t_7);
+  if (__pyx_t_9) {
+    __pyx_t_8 = __pyx_t_6;
+  } else {
+    __pyx_t_8 = __pyx_t_7;
+  }
+  __pyx_t_6 = __pyx_t_8;
+  __pyx_t_8 = 2;
+  __pyx_t_9 = (__pyx_t_6 > __pyx_t_8);
+  if (__pyx_t_9) {
+    __pyx_t_10 = __pyx_t_6;
+  } else {
+    __pyx_t_10 = __pyx_t_8;
+  }
+  __pyx_t_1 = __Pyx_PyInt_From_long(__pyx_t_10); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 521, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_per_bucket = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "pymica/methods/inverse_distance.pyx":522
+ * 
+ *     per_bucket = max(2, min(k_nearest, 16))
+ *     if width > 0 and height > 0:             # <<<<<<<<<<<<<<
+ *         cell_size = np.sqrt(width * height * per_bucket / n_stations)
+ *     else:
+ */
+  __pyx_t_1 = PyObject_RichCompare(__pyx_v_width, __pyx_int_0, Py_GT); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 522, __pyx_L1_error)
+  __pyx_t_11 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely((__pyx_t_11 < 0))) __PYX_ERR(0, 522, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (__pyx_t_11) {
+  } else {
+    __pyx_t_9 = __pyx_t_11;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_1 = PyObject_RichCompare(__pyx_v_height, __pyx_int_0, Py_GT); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 522, __pyx_L1_error)
+  __pyx_t_11 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely((__pyx_t_11 < 0))) __PYX_ERR(0, 522, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_9 = __pyx_t_11;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_9) {
+
+    /* "pymica/methods/inverse_distance.pyx":523
+ *     per_bucket = max(2, min(k_nearest, 16))
+ *     if width > 0 and height > 0:
+ *         cell_size = np.sqrt(width * height * per_bucket / n_stations)             # <<<<<<<<<<<<<<
+ *     else:
+ *         cell_size = max(width, height) * per_bucket / n_stations
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 523, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_sqrt); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 523, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = PyNumber_Multiply(__pyx_v_width, __pyx_v_height); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 523, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = PyNumber_Multiply(__pyx_t_2, __pyx_v_per_bucket); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 523, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = __Pyx_PyNumber_Divide(__pyx_t_3, __pyx_v_n_stations); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 523, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_t_3 = NULL;
+    __pyx_t_5 = 0;
+    #if CYTHON_UNPACK_METHODS
+    if (unlikely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+        __pyx_t_5 = 1;
+      }
+    }
+    #endif
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_t_2};
+      __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_4, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
+      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 523, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    }
+    __pyx_v_cell_size = __pyx_t_1;
+    __pyx_t_1 = 0;
+
+    /* "pymica/methods/inverse_distance.pyx":522
+ * 
+ *     per_bucket = max(2, min(k_nearest, 16))
+ *     if width > 0 and height > 0:             # <<<<<<<<<<<<<<
+ *         cell_size = np.sqrt(width * height * per_bucket / n_stations)
+ *     else:
+ */
+    goto __pyx_L3;
+  }
+
+  /* "pymica/methods/inverse_distance.pyx":525
+ *         cell_size = np.sqrt(width * height * per_bucket / n_stations)
+ *     else:
+ *         cell_size = max(width, height) * per_bucket / n_stations             # <<<<<<<<<<<<<<
+ *     if cell_size <= 0:
+ *         cell_size = 1.0
+ */
+  /*else*/ {
+    __Pyx_INCREF(__pyx_v_height);
+    __pyx_t_1 = __pyx_v_height;
+    __Pyx_INCREF(__pyx_v_width);
+    __pyx_t_4 = __pyx_v_width;
+    __pyx_t_3 = PyObject_RichCompare(__pyx_t_1, __pyx_t_4, Py_GT); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 525, __pyx_L1_error)
+    __pyx_t_9 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely((__pyx_t_9 < 0))) __PYX_ERR(0, 525, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (__pyx_t_9) {
+      __Pyx_INCREF(__pyx_t_1);
+      __pyx_t_2 = __pyx_t_1;
+    } else {
+      __Pyx_INCREF(__pyx_t_4);
+      __pyx_t_2 = __pyx_t_4;
+    }
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = PyNumber_Multiply(__pyx_t_2, __pyx_v_per_bucket); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 525, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = __Pyx_PyNumber_Divide(__pyx_t_1, __pyx_v_n_stations); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 525, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_v_cell_size = __pyx_t_2;
+    __pyx_t_2 = 0;
+  }
+  __pyx_L3:;
+
+  /* "pymica/methods/inverse_distance.pyx":526
+ *     else:
+ *         cell_size = max(width, height) * per_bucket / n_stations
+ *     if cell_size <= 0:             # <<<<<<<<<<<<<<
+ *         cell_size = 1.0
+ *     # Avoid a huge, mostly empty, bucket grid for very elongated networks
+ */
+  __pyx_t_2 = PyObject_RichCompare(__pyx_v_cell_size, __pyx_int_0, Py_LE); __Pyx_XGOTREF(__pyx_t_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 526, __pyx_L1_error)
+  __pyx_t_9 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_9 < 0))) __PYX_ERR(0, 526, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (__pyx_t_9) {
+
+    /* "pymica/methods/inverse_distance.pyx":527
+ *         cell_size = max(width, height) * per_bucket / n_stations
+ *     if cell_size <= 0:
+ *         cell_size = 1.0             # <<<<<<<<<<<<<<
+ *     # Avoid a huge, mostly empty, bucket grid for very elongated networks
+ *     while (int(width / cell_size) + 1) * (int(height / cell_size) + 1) > \
+ */
+    __Pyx_INCREF(__pyx_float_1_0);
+    __Pyx_DECREF_SET(__pyx_v_cell_size, __pyx_float_1_0);
+
+    /* "pymica/methods/inverse_distance.pyx":526
+ *     else:
+ *         cell_size = max(width, height) * per_bucket / n_stations
+ *     if cell_size <= 0:             # <<<<<<<<<<<<<<
+ *         cell_size = 1.0
+ *     # Avoid a huge, mostly empty, bucket grid for very elongated networks
+ */
+  }
+
+  /* "pymica/methods/inverse_distance.pyx":529
+ *         cell_size = 1.0
+ *     # Avoid a huge, mostly empty, bucket grid for very elongated networks
+ *     while (int(width / cell_size) + 1) * (int(height / cell_size) + 1) > \             # <<<<<<<<<<<<<<
+ *             4 * n_stations + 16:
+ *         cell_size *= 2
+ */
+  while (1) {
+    __pyx_t_2 = __Pyx_PyNumber_Divide(__pyx_v_width, __pyx_v_cell_size); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 529, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_1 = __Pyx_PyNumber_Int(__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 529, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = __Pyx_PyInt_AddObjC(__pyx_t_1, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 529, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = __Pyx_PyNumber_Divide(__pyx_v_height, __pyx_v_cell_size); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 529, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_4 = __Pyx_PyNumber_Int(__pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 529, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = __Pyx_PyInt_AddObjC(__pyx_t_4, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 529, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_4 = PyNumber_Multiply(__pyx_t_2, __pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 529, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "pymica/methods/inverse_distance.pyx":530
+ *     # Avoid a huge, mostly empty, bucket grid for very elongated networks
+ *     while (int(width / cell_size) + 1) * (int(height / cell_size) + 1) > \
+ *             4 * n_stations + 16:             # <<<<<<<<<<<<<<
+ *         cell_size *= 2
+ * 
+ */
+    __pyx_t_1 = __Pyx_PyInt_MultiplyCObj(__pyx_int_4, __pyx_v_n_stations, 4, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 530, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = __Pyx_PyInt_AddObjC(__pyx_t_1, __pyx_int_16, 16, 0, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 530, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = PyObject_RichCompare(__pyx_t_4, __pyx_t_2, Py_GT); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 529, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+    /* "pymica/methods/inverse_distance.pyx":529
+ *         cell_size = 1.0
+ *     # Avoid a huge, mostly empty, bucket grid for very elongated networks
+ *     while (int(width / cell_size) + 1) * (int(height / cell_size) + 1) > \             # <<<<<<<<<<<<<<
+ *             4 * n_stations + 16:
+ *         cell_size *= 2
+ */
+    __pyx_t_9 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely((__pyx_t_9 < 0))) __PYX_ERR(0, 529, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    if (!__pyx_t_9) break;
+
+    /* "pymica/methods/inverse_distance.pyx":531
+ *     while (int(width / cell_size) + 1) * (int(height / cell_size) + 1) > \
+ *             4 * n_stations + 16:
+ *         cell_size *= 2             # <<<<<<<<<<<<<<
+ * 
+ *     nx = int(width / cell_size) + 1
+ */
+    __pyx_t_1 = __Pyx_PyInt_MultiplyObjC(__pyx_v_cell_size, __pyx_int_2, 2, 1, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 531, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF_SET(__pyx_v_cell_size, __pyx_t_1);
+    __pyx_t_1 = 0;
+  }
+
+  /* "pymica/methods/inverse_distance.pyx":533
+ *         cell_size *= 2
+ * 
+ *     nx = int(width / cell_size) + 1             # <<<<<<<<<<<<<<
+ *     ny = int(height / cell_size) + 1
+ * 
+ */
+  __pyx_t_1 = __Pyx_PyNumber_Divide(__pyx_v_width, __pyx_v_cell_size); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 533, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyNumber_Int(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 533, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyInt_AddObjC(__pyx_t_2, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 533, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_nx = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "pymica/methods/inverse_distance.pyx":534
+ * 
+ *     nx = int(width / cell_size) + 1
+ *     ny = int(height / cell_size) + 1             # <<<<<<<<<<<<<<
+ * 
+ *     bucket_x = np.minimum(((xpos - x0) / cell_size).astype(np.intc), nx - 1)
+ */
+  __pyx_t_1 = __Pyx_PyNumber_Divide(__pyx_v_height, __pyx_v_cell_size); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 534, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyNumber_Int(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 534, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyInt_AddObjC(__pyx_t_2, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 534, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_ny = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "pymica/methods/inverse_distance.pyx":536
+ *     ny = int(height / cell_size) + 1
+ * 
+ *     bucket_x = np.minimum(((xpos - x0) / cell_size).astype(np.intc), nx - 1)             # <<<<<<<<<<<<<<
+ *     bucket_y = np.minimum(((ypos - y0) / cell_size).astype(np.intc), ny - 1)
+ *     bucket = bucket_y * nx + bucket_x
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 536, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_minimum); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 536, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_3 = PyNumber_Subtract(__pyx_v_xpos, __pyx_v_x0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 536, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_12 = __Pyx_PyNumber_Divide(__pyx_t_3, __pyx_v_cell_size); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 536, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_12);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_12, __pyx_n_s_astype); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 536, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+  __Pyx_GetModuleGlobalName(__pyx_t_12, __pyx_n_s_np); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 536, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_12);
+  __pyx_t_13 = __Pyx_PyObject_GetAttrStr(__pyx_t_12, __pyx_n_s_intc); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 536, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_13);
+  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+  __pyx_t_12 = NULL;
+  __pyx_t_5 = 0;
+  #if CYTHON_UNPACK_METHODS
+  if (likely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_12 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_12)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_12);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+      __pyx_t_5 = 1;
+    }
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_12, __pyx_t_13};
+    __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_12); __pyx_t_12 = 0;
+    __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 536, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  }
+  __pyx_t_3 = __Pyx_PyInt_SubtractObjC(__pyx_v_nx, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 536, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_13 = NULL;
+  __pyx_t_5 = 0;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_13 = PyMethod_GET_SELF(__pyx_t_4);
+    if (likely(__pyx_t_13)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_13);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_4, function);
+      __pyx_t_5 = 1;
+    }
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[3] = {__pyx_t_13, __pyx_t_2, __pyx_t_3};
+    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_4, __pyx_callargs+1-__pyx_t_5, 2+__pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_13); __pyx_t_13 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 536, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  }
+  __pyx_v_bucket_x = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "pymica/methods/inverse_distance.pyx":537
+ * 
+ *     bucket_x = np.minimum(((xpos - x0) / cell_size).astype(np.intc), nx - 1)
+ *     bucket_y = np.minimum(((ypos - y0) / cell_size).astype(np.intc), ny - 1)             # <<<<<<<<<<<<<<
+ *     bucket = bucket_y * nx + bucket_x
+ *     order = np.argsort(bucket, kind='stable')
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 537, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_minimum); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 537, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_2 = PyNumber_Subtract(__pyx_v_ypos, __pyx_v_y0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 537, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_13 = __Pyx_PyNumber_Divide(__pyx_t_2, __pyx_v_cell_size); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 537, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_13);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_13, __pyx_n_s_astype); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 537, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+  __Pyx_GetModuleGlobalName(__pyx_t_13, __pyx_n_s_np); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 537, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_13);
+  __pyx_t_12 = __Pyx_PyObject_GetAttrStr(__pyx_t_13, __pyx_n_s_intc); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 537, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_12);
+  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+  __pyx_t_13 = NULL;
+  __pyx_t_5 = 0;
+  #if CYTHON_UNPACK_METHODS
+  if (likely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_13 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_13)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_13);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+      __pyx_t_5 = 1;
+    }
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_13, __pyx_t_12};
+    __pyx_t_4 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_13); __pyx_t_13 = 0;
+    __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+    if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 537, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  }
+  __pyx_t_2 = __Pyx_PyInt_SubtractObjC(__pyx_v_ny, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 537, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_12 = NULL;
+  __pyx_t_5 = 0;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_12 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_12)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_12);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+      __pyx_t_5 = 1;
+    }
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[3] = {__pyx_t_12, __pyx_t_4, __pyx_t_2};
+    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 2+__pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_12); __pyx_t_12 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 537, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  }
+  __pyx_v_bucket_y = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "pymica/methods/inverse_distance.pyx":538
+ *     bucket_x = np.minimum(((xpos - x0) / cell_size).astype(np.intc), nx - 1)
+ *     bucket_y = np.minimum(((ypos - y0) / cell_size).astype(np.intc), ny - 1)
+ *     bucket = bucket_y * nx + bucket_x             # <<<<<<<<<<<<<<
+ *     order = np.argsort(bucket, kind='stable')
+ * 
+ */
+  __pyx_t_1 = PyNumber_Multiply(__pyx_v_bucket_y, __pyx_v_nx); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 538, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = PyNumber_Add(__pyx_t_1, __pyx_v_bucket_x); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 538, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_bucket = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "pymica/methods/inverse_distance.pyx":539
+ *     bucket_y = np.minimum(((ypos - y0) / cell_size).astype(np.intc), ny - 1)
+ *     bucket = bucket_y * nx + bucket_x
+ *     order = np.argsort(bucket, kind='stable')             # <<<<<<<<<<<<<<
+ * 
+ *     start = np.zeros(nx * ny + 1, dtype=np.intc)
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 539, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_argsort); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 539, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 539, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_INCREF(__pyx_v_bucket);
+  __Pyx_GIVEREF(__pyx_v_bucket);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_v_bucket)) __PYX_ERR(0, 539, __pyx_L1_error);
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 539, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_kind, __pyx_n_s_stable) < 0) __PYX_ERR(0, 539, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_3, __pyx_t_2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 539, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_order = __pyx_t_4;
+  __pyx_t_4 = 0;
+
+  /* "pymica/methods/inverse_distance.pyx":541
+ *     order = np.argsort(bucket, kind='stable')
+ * 
+ *     start = np.zeros(nx * ny + 1, dtype=np.intc)             # <<<<<<<<<<<<<<
+ *     np.cumsum(np.bincount(bucket, minlength=nx * ny), out=start[1:])
+ * 
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 541, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_zeros); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 541, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = PyNumber_Multiply(__pyx_v_nx, __pyx_v_ny); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 541, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = __Pyx_PyInt_AddObjC(__pyx_t_4, __pyx_int_1, 1, 0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 541, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 541, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_3);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3)) __PYX_ERR(0, 541, __pyx_L1_error);
+  __pyx_t_3 = 0;
+  __pyx_t_3 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 541, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 541, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_12 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_intc); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 541, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_12);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_dtype, __pyx_t_12) < 0) __PYX_ERR(0, 541, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+  __pyx_t_12 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_4, __pyx_t_3); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 541, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_12);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_v_start = __pyx_t_12;
+  __pyx_t_12 = 0;
+
+  /* "pymica/methods/inverse_distance.pyx":542
+ * 
+ *     start = np.zeros(nx * ny + 1, dtype=np.intc)
+ *     np.cumsum(np.bincount(bucket, minlength=nx * ny), out=start[1:])             # <<<<<<<<<<<<<<
+ * 
+ *     return (np.ascontiguousarray(xpos[order]),
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_12, __pyx_n_s_np); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 542, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_12);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_12, __pyx_n_s_cumsum); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 542, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+  __Pyx_GetModuleGlobalName(__pyx_t_12, __pyx_n_s_np); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 542, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_12);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_12, __pyx_n_s_bincount); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 542, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+  __pyx_t_12 = PyTuple_New(1); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 542, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_12);
+  __Pyx_INCREF(__pyx_v_bucket);
+  __Pyx_GIVEREF(__pyx_v_bucket);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_12, 0, __pyx_v_bucket)) __PYX_ERR(0, 542, __pyx_L1_error);
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 542, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = PyNumber_Multiply(__pyx_v_nx, __pyx_v_ny); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 542, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_minlength, __pyx_t_1) < 0) __PYX_ERR(0, 542, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_12, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 542, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 542, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_1);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1)) __PYX_ERR(0, 542, __pyx_L1_error);
+  __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 542, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_12 = __Pyx_PyObject_GetSlice(__pyx_v_start, 1, 0, NULL, NULL, &__pyx_slice__16, 1, 0, 0); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 542, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_12);
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_out, __pyx_t_12) < 0) __PYX_ERR(0, 542, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+  __pyx_t_12 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_2, __pyx_t_1); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 542, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_12);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+
+  /* "pymica/methods/inverse_distance.pyx":544
+ *     np.cumsum(np.bincount(bucket, minlength=nx * ny), out=start[1:])
+ * 
+ *     return (np.ascontiguousarray(xpos[order]),             # <<<<<<<<<<<<<<
+ *             np.ascontiguousarray(ypos[order]),
+ *             np.ascontiguousarray(np.asarray(values, dtype=DTYPE)[order]),
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 544, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_ascontiguousarray); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 544, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyObject_GetItem(__pyx_v_xpos, __pyx_v_order); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 544, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = NULL;
+  __pyx_t_5 = 0;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+      __pyx_t_5 = 1;
+    }
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_t_1};
+    __pyx_t_12 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 544, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_12);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  }
+
+  /* "pymica/methods/inverse_distance.pyx":545
+ * 
+ *     return (np.ascontiguousarray(xpos[order]),
+ *             np.ascontiguousarray(ypos[order]),             # <<<<<<<<<<<<<<
+ *             np.ascontiguousarray(np.asarray(values, dtype=DTYPE)[order]),
+ *             start, nx, ny, x0, y0, cell_size)
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 545, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_ascontiguousarray); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 545, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyObject_GetItem(__pyx_v_ypos, __pyx_v_order); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 545, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_4 = NULL;
+  __pyx_t_5 = 0;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+      __pyx_t_5 = 1;
+    }
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_t_1};
+    __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 545, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  }
+
+  /* "pymica/methods/inverse_distance.pyx":546
+ *     return (np.ascontiguousarray(xpos[order]),
+ *             np.ascontiguousarray(ypos[order]),
+ *             np.ascontiguousarray(np.asarray(values, dtype=DTYPE)[order]),             # <<<<<<<<<<<<<<
+ *             start, nx, ny, x0, y0, cell_size)
+ * 
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 546, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_ascontiguousarray); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 546, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 546, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_13 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_asarray); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 546, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_13);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 546, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_v_values);
+  __Pyx_GIVEREF(__pyx_v_values);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_v_values)) __PYX_ERR(0, 546, __pyx_L1_error);
+  __pyx_t_14 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 546, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_14);
+  __Pyx_GetModuleGlobalName(__pyx_t_15, __pyx_n_s_DTYPE); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 546, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_15);
+  if (PyDict_SetItem(__pyx_t_14, __pyx_n_s_dtype, __pyx_t_15) < 0) __PYX_ERR(0, 546, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+  __pyx_t_15 = __Pyx_PyObject_Call(__pyx_t_13, __pyx_t_1, __pyx_t_14); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 546, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_15);
+  __Pyx_DECREF(__pyx_t_13); __pyx_t_13 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+  __pyx_t_14 = __Pyx_PyObject_GetItem(__pyx_t_15, __pyx_v_order); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 546, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_14);
+  __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+  __pyx_t_15 = NULL;
+  __pyx_t_5 = 0;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_15 = PyMethod_GET_SELF(__pyx_t_4);
+    if (likely(__pyx_t_15)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_15);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_4, function);
+      __pyx_t_5 = 1;
+    }
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_15, __pyx_t_14};
+    __pyx_t_3 = __Pyx_PyObject_FastCall(__pyx_t_4, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_15); __pyx_t_15 = 0;
+    __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 546, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  }
+
+  /* "pymica/methods/inverse_distance.pyx":544
+ *     np.cumsum(np.bincount(bucket, minlength=nx * ny), out=start[1:])
+ * 
+ *     return (np.ascontiguousarray(xpos[order]),             # <<<<<<<<<<<<<<
+ *             np.ascontiguousarray(ypos[order]),
+ *             np.ascontiguousarray(np.asarray(values, dtype=DTYPE)[order]),
+ */
+  __pyx_t_4 = PyTuple_New(9); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 544, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_GIVEREF(__pyx_t_12);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_12)) __PYX_ERR(0, 544, __pyx_L1_error);
+  __Pyx_GIVEREF(__pyx_t_2);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_2)) __PYX_ERR(0, 544, __pyx_L1_error);
+  __Pyx_GIVEREF(__pyx_t_3);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 2, __pyx_t_3)) __PYX_ERR(0, 544, __pyx_L1_error);
+  __Pyx_INCREF(__pyx_v_start);
+  __Pyx_GIVEREF(__pyx_v_start);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 3, __pyx_v_start)) __PYX_ERR(0, 544, __pyx_L1_error);
+  __Pyx_INCREF(__pyx_v_nx);
+  __Pyx_GIVEREF(__pyx_v_nx);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 4, __pyx_v_nx)) __PYX_ERR(0, 544, __pyx_L1_error);
+  __Pyx_INCREF(__pyx_v_ny);
+  __Pyx_GIVEREF(__pyx_v_ny);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 5, __pyx_v_ny)) __PYX_ERR(0, 544, __pyx_L1_error);
+  __Pyx_INCREF(__pyx_v_x0);
+  __Pyx_GIVEREF(__pyx_v_x0);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 6, __pyx_v_x0)) __PYX_ERR(0, 544, __pyx_L1_error);
+  __Pyx_INCREF(__pyx_v_y0);
+  __Pyx_GIVEREF(__pyx_v_y0);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 7, __pyx_v_y0)) __PYX_ERR(0, 544, __pyx_L1_error);
+  __Pyx_INCREF(__pyx_v_cell_size);
+  __Pyx_GIVEREF(__pyx_v_cell_size);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 8, __pyx_v_cell_size)) __PYX_ERR(0, 544, __pyx_L1_error);
+  __pyx_t_12 = 0;
+  __pyx_t_2 = 0;
+  __pyx_t_3 = 0;
+  __pyx_r = __pyx_t_4;
+  __pyx_t_4 = 0;
+  goto __pyx_L0;
+
+  /* "pymica/methods/inverse_distance.pyx":494
+ * 
+ * 
+ * def build_grid_index(xpos, ypos, values, int k_nearest=0):             # <<<<<<<<<<<<<<
+ *     """
+ *     build_grid_index(xpos, ypos, values)
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_12);
+  __Pyx_XDECREF(__pyx_t_13);
+  __Pyx_XDECREF(__pyx_t_14);
+  __Pyx_XDECREF(__pyx_t_15);
+  __Pyx_AddTraceback("pymica.methods.inverse_distance.build_grid_index", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_n_stations);
+  __Pyx_XDECREF(__pyx_v_x0);
+  __Pyx_XDECREF(__pyx_v_y0);
+  __Pyx_XDECREF(__pyx_v_width);
+  __Pyx_XDECREF(__pyx_v_height);
+  __Pyx_XDECREF(__pyx_v_per_bucket);
+  __Pyx_XDECREF(__pyx_v_cell_size);
+  __Pyx_XDECREF(__pyx_v_nx);
+  __Pyx_XDECREF(__pyx_v_ny);
+  __Pyx_XDECREF(__pyx_v_bucket_x);
+  __Pyx_XDECREF(__pyx_v_bucket_y);
+  __Pyx_XDECREF(__pyx_v_bucket);
+  __Pyx_XDECREF(__pyx_v_order);
+  __Pyx_XDECREF(__pyx_v_start);
+  __Pyx_XDECREF(__pyx_v_xpos);
+  __Pyx_XDECREF(__pyx_v_ypos);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "pymica/methods/inverse_distance.pyx":550
+ * 
+ * 
+ * cdef void neighbour_field(floating[:, ::1] out, const double[::1] xpos,             # <<<<<<<<<<<<<<
+ *                           const double[::1] ypos, const double[::1] values,
+ *                           double[:] cgeotransform, IdwPower power, float smoothing,
+ */
+
+static void __pyx_fuse_0__pyx_f_6pymica_7methods_16inverse_distance_neighbour_field(__Pyx_memviewslice __pyx_v_out, __Pyx_memviewslice __pyx_v_xpos, __Pyx_memviewslice __pyx_v_ypos, __Pyx_memviewslice __pyx_v_values, __Pyx_memviewslice __pyx_v_cgeotransform, struct __pyx_t_6pymica_7methods_9idw_power_IdwPower __pyx_v_power, float __pyx_v_smoothing, int __pyx_v_num_threads, int __pyx_v_k_nearest, double __pyx_v_max_radius, unsigned char const *__pyx_v_mask, double __pyx_v_nodata) {
+  PyObject *__pyx_v_sorted_x = NULL;
+  PyObject *__pyx_v_sorted_y = NULL;
+  PyObject *__pyx_v_sorted_values = NULL;
+  PyObject *__pyx_v_start = NULL;
+  PyObject *__pyx_v_nx = NULL;
+  PyObject *__pyx_v_ny = NULL;
+  PyObject *__pyx_v_x0 = NULL;
+  PyObject *__pyx_v_y0 = NULL;
+  PyObject *__pyx_v_cell_size = NULL;
+  __Pyx_memviewslice __pyx_v_csorted_x = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_csorted_y = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_csorted_values = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_cstart = { 0, 0, { 0 }, { 0 }, { 0 } };
+  struct __pyx_t_6pymica_7methods_16inverse_distance_GridIndex __pyx_v_index;
+  double __pyx_v_radius_sq;
+  int __pyx_v_buffer_size;
+  int *__pyx_v_idx_buffer;
+  double *__pyx_v_dist_buffer;
+  int __pyx_v_xsize;
+  CYTHON_UNUSED int __pyx_v_ysize;
+  int __pyx_v_i;
+  int __pyx_v_j;
+  double __pyx_v_x;
+  double __pyx_v_y;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  unsigned int __pyx_t_8;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  PyObject *__pyx_t_12 = NULL;
+  PyObject *(*__pyx_t_13)(PyObject *);
+  __Pyx_memviewslice __pyx_t_14 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_t_15 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_t_16 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_t_17 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  Py_ssize_t __pyx_t_18;
+  int __pyx_t_19;
+  double __pyx_t_20;
+  int __pyx_t_21;
+  int __pyx_t_22;
+  int __pyx_t_23;
+  Py_ssize_t __pyx_t_24;
+  int __pyx_t_25;
+  int __pyx_t_26;
+  int __pyx_t_27;
+  int __pyx_t_28;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_fuse_0neighbour_field", 1);
+
+  /* "pymica/methods/inverse_distance.pyx":557
+ *     """Fills out using only the neighbour stations of each pixel."""
+ *     sorted_x, sorted_y, sorted_values, start, nx, ny, x0, y0, cell_size = \
+ *         build_grid_index(xpos, ypos, values, k_nearest)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef const double[::1] csorted_x = sorted_x
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_build_grid_index); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 557, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __pyx_memoryview_fromslice(__pyx_v_xpos, 1, (PyObject *(*)(char *)) __pyx_memview_get_double__const__, (int (*)(char *, PyObject *)) NULL, 0);; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 557, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __pyx_memoryview_fromslice(__pyx_v_ypos, 1, (PyObject *(*)(char *)) __pyx_memview_get_double__const__, (int (*)(char *, PyObject *)) NULL, 0);; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 557, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = __pyx_memoryview_fromslice(__pyx_v_values, 1, (PyObject *(*)(char *)) __pyx_memview_get_double__const__, (int (*)(char *, PyObject *)) NULL, 0);; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 557, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = __Pyx_PyInt_From_int(__pyx_v_k_nearest); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 557, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_7 = NULL;
+  __pyx_t_8 = 0;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_7)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_7);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+      __pyx_t_8 = 1;
+    }
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[5] = {__pyx_t_7, __pyx_t_3, __pyx_t_4, __pyx_t_5, __pyx_t_6};
+    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_8, 4+__pyx_t_8);
+    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 557, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  }
+  if ((likely(PyTuple_CheckExact(__pyx_t_1))) || (PyList_CheckExact(__pyx_t_1))) {
+    PyObject* sequence = __pyx_t_1;
+    Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
+    if (unlikely(size != 9)) {
+      if (size > 9) __Pyx_RaiseTooManyValuesError(9);
+      else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+      __PYX_ERR(0, 556, __pyx_L1_error)
+    }
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    if (likely(PyTuple_CheckExact(sequence))) {
+      __pyx_t_2 = PyTuple_GET_ITEM(sequence, 0); 
+      __pyx_t_6 = PyTuple_GET_ITEM(sequence, 1); 
+      __pyx_t_5 = PyTuple_GET_ITEM(sequence, 2); 
+      __pyx_t_4 = PyTuple_GET_ITEM(sequence, 3); 
+      __pyx_t_3 = PyTuple_GET_ITEM(sequence, 4); 
+      __pyx_t_7 = PyTuple_GET_ITEM(sequence, 5); 
+      __pyx_t_9 = PyTuple_GET_ITEM(sequence, 6); 
+      __pyx_t_10 = PyTuple_GET_ITEM(sequence, 7); 
+      __pyx_t_11 = PyTuple_GET_ITEM(sequence, 8); 
+    } else {
+      __pyx_t_2 = PyList_GET_ITEM(sequence, 0); 
+      __pyx_t_6 = PyList_GET_ITEM(sequence, 1); 
+      __pyx_t_5 = PyList_GET_ITEM(sequence, 2); 
+      __pyx_t_4 = PyList_GET_ITEM(sequence, 3); 
+      __pyx_t_3 = PyList_GET_ITEM(sequence, 4); 
+      __pyx_t_7 = PyList_GET_ITEM(sequence, 5); 
+      __pyx_t_9 = PyList_GET_ITEM(sequence, 6); 
+      __pyx_t_10 = PyList_GET_ITEM(sequence, 7); 
+      __pyx_t_11 = PyList_GET_ITEM(sequence, 8); 
+    }
+    __Pyx_INCREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx_t_6);
+    __Pyx_INCREF(__pyx_t_5);
+    __Pyx_INCREF(__pyx_t_4);
+    __Pyx_INCREF(__pyx_t_3);
+    __Pyx_INCREF(__pyx_t_7);
+    __Pyx_INCREF(__pyx_t_9);
+    __Pyx_INCREF(__pyx_t_10);
+    __Pyx_INCREF(__pyx_t_11);
+    #else
+    {
+      Py_ssize_t i;
+      PyObject** temps[9] = {&__pyx_t_2,&__pyx_t_6,&__pyx_t_5,&__pyx_t_4,&__pyx_t_3,&__pyx_t_7,&__pyx_t_9,&__pyx_t_10,&__pyx_t_11};
+      for (i=0; i < 9; i++) {
+        PyObject* item = PySequence_ITEM(sequence, i); if (unlikely(!item)) __PYX_ERR(0, 556, __pyx_L1_error)
+        __Pyx_GOTREF(item);
+        *(temps[i]) = item;
+      }
+    }
+    #endif
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  } else {
+    Py_ssize_t index = -1;
+    PyObject** temps[9] = {&__pyx_t_2,&__pyx_t_6,&__pyx_t_5,&__pyx_t_4,&__pyx_t_3,&__pyx_t_7,&__pyx_t_9,&__pyx_t_10,&__pyx_t_11};
+    __pyx_t_12 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 556, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_12);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_13 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_12);
+    for (index=0; index < 9; index++) {
+      PyObject* item = __pyx_t_13(__pyx_t_12); if (unlikely(!item)) goto __pyx_L3_unpacking_failed;
+      __Pyx_GOTREF(item);
+      *(temps[index]) = item;
+    }
+    if (__Pyx_IternextUnpackEndCheck(__pyx_t_13(__pyx_t_12), 9) < 0) __PYX_ERR(0, 556, __pyx_L1_error)
+    __pyx_t_13 = NULL;
+    __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+    goto __pyx_L4_unpacking_done;
+    __pyx_L3_unpacking_failed:;
+    __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+    __pyx_t_13 = NULL;
+    if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+    __PYX_ERR(0, 556, __pyx_L1_error)
+    __pyx_L4_unpacking_done:;
+  }
+
+  /* "pymica/methods/inverse_distance.pyx":556
+ *                           const unsigned char *mask, double nodata):
+ *     """Fills out using only the neighbour stations of each pixel."""
+ *     sorted_x, sorted_y, sorted_values, start, nx, ny, x0, y0, cell_size = \             # <<<<<<<<<<<<<<
+ *         build_grid_index(xpos, ypos, values, k_nearest)
+ * 
+ */
+  __pyx_v_sorted_x = __pyx_t_2;
+  __pyx_t_2 = 0;
+  __pyx_v_sorted_y = __pyx_t_6;
+  __pyx_t_6 = 0;
+  __pyx_v_sorted_values = __pyx_t_5;
+  __pyx_t_5 = 0;
+  __pyx_v_start = __pyx_t_4;
+  __pyx_t_4 = 0;
+  __pyx_v_nx = __pyx_t_3;
+  __pyx_t_3 = 0;
+  __pyx_v_ny = __pyx_t_7;
+  __pyx_t_7 = 0;
+  __pyx_v_x0 = __pyx_t_9;
+  __pyx_t_9 = 0;
+  __pyx_v_y0 = __pyx_t_10;
+  __pyx_t_10 = 0;
+  __pyx_v_cell_size = __pyx_t_11;
+  __pyx_t_11 = 0;
+
+  /* "pymica/methods/inverse_distance.pyx":559
+ *         build_grid_index(xpos, ypos, values, k_nearest)
+ * 
+ *     cdef const double[::1] csorted_x = sorted_x             # <<<<<<<<<<<<<<
+ *     cdef const double[::1] csorted_y = sorted_y
+ *     cdef const double[::1] csorted_values = sorted_values
+ */
+  __pyx_t_14 = __Pyx_PyObject_to_MemoryviewSlice_dc_double__const__(__pyx_v_sorted_x, 0); if (unlikely(!__pyx_t_14.memview)) __PYX_ERR(0, 559, __pyx_L1_error)
+  __pyx_v_csorted_x = __pyx_t_14;
+  __pyx_t_14.memview = NULL;
+  __pyx_t_14.data = NULL;
+
+  /* "pymica/methods/inverse_distance.pyx":560
+ * 
+ *     cdef const double[::1] csorted_x = sorted_x
+ *     cdef const double[::1] csorted_y = sorted_y             # <<<<<<<<<<<<<<
+ *     cdef const double[::1] csorted_values = sorted_values
+ *     cdef const int[::1] cstart = start
+ */
+  __pyx_t_15 = __Pyx_PyObject_to_MemoryviewSlice_dc_double__const__(__pyx_v_sorted_y, 0); if (unlikely(!__pyx_t_15.memview)) __PYX_ERR(0, 560, __pyx_L1_error)
+  __pyx_v_csorted_y = __pyx_t_15;
+  __pyx_t_15.memview = NULL;
+  __pyx_t_15.data = NULL;
+
+  /* "pymica/methods/inverse_distance.pyx":561
+ *     cdef const double[::1] csorted_x = sorted_x
+ *     cdef const double[::1] csorted_y = sorted_y
+ *     cdef const double[::1] csorted_values = sorted_values             # <<<<<<<<<<<<<<
+ *     cdef const int[::1] cstart = start
+ * 
+ */
+  __pyx_t_16 = __Pyx_PyObject_to_MemoryviewSlice_dc_double__const__(__pyx_v_sorted_values, 0); if (unlikely(!__pyx_t_16.memview)) __PYX_ERR(0, 561, __pyx_L1_error)
+  __pyx_v_csorted_values = __pyx_t_16;
+  __pyx_t_16.memview = NULL;
+  __pyx_t_16.data = NULL;
+
+  /* "pymica/methods/inverse_distance.pyx":562
+ *     cdef const double[::1] csorted_y = sorted_y
+ *     cdef const double[::1] csorted_values = sorted_values
+ *     cdef const int[::1] cstart = start             # <<<<<<<<<<<<<<
+ * 
+ *     cdef GridIndex index
+ */
+  __pyx_t_17 = __Pyx_PyObject_to_MemoryviewSlice_dc_int__const__(__pyx_v_start, 0); if (unlikely(!__pyx_t_17.memview)) __PYX_ERR(0, 562, __pyx_L1_error)
+  __pyx_v_cstart = __pyx_t_17;
+  __pyx_t_17.memview = NULL;
+  __pyx_t_17.data = NULL;
+
+  /* "pymica/methods/inverse_distance.pyx":565
+ * 
+ *     cdef GridIndex index
+ *     index.xpos = &csorted_x[0]             # <<<<<<<<<<<<<<
+ *     index.ypos = &csorted_y[0]
+ *     index.values = &csorted_values[0]
+ */
+  __pyx_t_18 = 0;
+  __pyx_v_index.xpos = (&(*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_csorted_x.data) + __pyx_t_18)) ))));
+
+  /* "pymica/methods/inverse_distance.pyx":566
+ *     cdef GridIndex index
+ *     index.xpos = &csorted_x[0]
+ *     index.ypos = &csorted_y[0]             # <<<<<<<<<<<<<<
+ *     index.values = &csorted_values[0]
+ *     index.start = &cstart[0]
+ */
+  __pyx_t_18 = 0;
+  __pyx_v_index.ypos = (&(*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_csorted_y.data) + __pyx_t_18)) ))));
+
+  /* "pymica/methods/inverse_distance.pyx":567
+ *     index.xpos = &csorted_x[0]
+ *     index.ypos = &csorted_y[0]
+ *     index.values = &csorted_values[0]             # <<<<<<<<<<<<<<
+ *     index.start = &cstart[0]
+ *     index.nx = nx
+ */
+  __pyx_t_18 = 0;
+  __pyx_v_index.values = (&(*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_csorted_values.data) + __pyx_t_18)) ))));
+
+  /* "pymica/methods/inverse_distance.pyx":568
+ *     index.ypos = &csorted_y[0]
+ *     index.values = &csorted_values[0]
+ *     index.start = &cstart[0]             # <<<<<<<<<<<<<<
+ *     index.nx = nx
+ *     index.ny = ny
+ */
+  __pyx_t_18 = 0;
+  __pyx_v_index.start = (&(*((int const  *) ( /* dim=0 */ ((char *) (((int const  *) __pyx_v_cstart.data) + __pyx_t_18)) ))));
+
+  /* "pymica/methods/inverse_distance.pyx":569
+ *     index.values = &csorted_values[0]
+ *     index.start = &cstart[0]
+ *     index.nx = nx             # <<<<<<<<<<<<<<
+ *     index.ny = ny
+ *     index.x0 = x0
+ */
+  __pyx_t_19 = __Pyx_PyInt_As_int(__pyx_v_nx); if (unlikely((__pyx_t_19 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 569, __pyx_L1_error)
+  __pyx_v_index.nx = __pyx_t_19;
+
+  /* "pymica/methods/inverse_distance.pyx":570
+ *     index.start = &cstart[0]
+ *     index.nx = nx
+ *     index.ny = ny             # <<<<<<<<<<<<<<
+ *     index.x0 = x0
+ *     index.y0 = y0
+ */
+  __pyx_t_19 = __Pyx_PyInt_As_int(__pyx_v_ny); if (unlikely((__pyx_t_19 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 570, __pyx_L1_error)
+  __pyx_v_index.ny = __pyx_t_19;
+
+  /* "pymica/methods/inverse_distance.pyx":571
+ *     index.nx = nx
+ *     index.ny = ny
+ *     index.x0 = x0             # <<<<<<<<<<<<<<
+ *     index.y0 = y0
+ *     index.cell_size = cell_size
+ */
+  __pyx_t_20 = __pyx_PyFloat_AsDouble(__pyx_v_x0); if (unlikely((__pyx_t_20 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 571, __pyx_L1_error)
+  __pyx_v_index.x0 = __pyx_t_20;
+
+  /* "pymica/methods/inverse_distance.pyx":572
+ *     index.ny = ny
+ *     index.x0 = x0
+ *     index.y0 = y0             # <<<<<<<<<<<<<<
+ *     index.cell_size = cell_size
+ * 
+ */
+  __pyx_t_20 = __pyx_PyFloat_AsDouble(__pyx_v_y0); if (unlikely((__pyx_t_20 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 572, __pyx_L1_error)
+  __pyx_v_index.y0 = __pyx_t_20;
+
+  /* "pymica/methods/inverse_distance.pyx":573
+ *     index.x0 = x0
+ *     index.y0 = y0
+ *     index.cell_size = cell_size             # <<<<<<<<<<<<<<
+ * 
+ *     cdef double radius_sq = max_radius * max_radius if max_radius > 0 else -1.0
+ */
+  __pyx_t_20 = __pyx_PyFloat_AsDouble(__pyx_v_cell_size); if (unlikely((__pyx_t_20 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 573, __pyx_L1_error)
+  __pyx_v_index.cell_size = __pyx_t_20;
+
+  /* "pymica/methods/inverse_distance.pyx":575
+ *     index.cell_size = cell_size
+ * 
+ *     cdef double radius_sq = max_radius * max_radius if max_radius > 0 else -1.0             # <<<<<<<<<<<<<<
+ *     cdef int buffer_size = k_nearest if k_nearest > 0 else 1
+ *     cdef int *idx_buffer
+ */
+  __pyx_t_21 = (__pyx_v_max_radius > 0.0);
+  if (__pyx_t_21) {
+    __pyx_t_20 = (__pyx_v_max_radius * __pyx_v_max_radius);
+  } else {
+    __pyx_t_20 = -1.0;
+  }
+  __pyx_v_radius_sq = __pyx_t_20;
+
+  /* "pymica/methods/inverse_distance.pyx":576
+ * 
+ *     cdef double radius_sq = max_radius * max_radius if max_radius > 0 else -1.0
+ *     cdef int buffer_size = k_nearest if k_nearest > 0 else 1             # <<<<<<<<<<<<<<
+ *     cdef int *idx_buffer
+ *     cdef double *dist_buffer
+ */
+  __pyx_t_21 = (__pyx_v_k_nearest > 0);
+  if (__pyx_t_21) {
+    __pyx_t_19 = __pyx_v_k_nearest;
+  } else {
+    __pyx_t_19 = 1;
+  }
+  __pyx_v_buffer_size = __pyx_t_19;
+
+  /* "pymica/methods/inverse_distance.pyx":579
+ *     cdef int *idx_buffer
+ *     cdef double *dist_buffer
+ *     cdef int xsize = out.shape[1]             # <<<<<<<<<<<<<<
+ *     cdef int ysize = out.shape[0]
+ *     cdef int i, j
+ */
+  __pyx_v_xsize = (__pyx_v_out.shape[1]);
+
+  /* "pymica/methods/inverse_distance.pyx":580
+ *     cdef double *dist_buffer
+ *     cdef int xsize = out.shape[1]
+ *     cdef int ysize = out.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef int i, j
+ *     cdef double x, y
+ */
+  __pyx_v_ysize = (__pyx_v_out.shape[0]);
+
+  /* "pymica/methods/inverse_distance.pyx":584
+ *     cdef double x, y
+ * 
+ *     with nogil, parallel(num_threads=num_threads):             # <<<<<<<<<<<<<<
+ *         idx_buffer = <int *> malloc(buffer_size * sizeof(int))
+ *         dist_buffer = <double *> malloc(buffer_size * sizeof(double))
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      _save = NULL;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+        {
+            #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+                #undef likely
+                #undef unlikely
+                #define likely(x)   (x)
+                #define unlikely(x) (x)
+            #endif
+            #ifdef _OPENMP
+            #pragma omp parallel private(__pyx_v_dist_buffer, __pyx_v_idx_buffer) private(__pyx_t_18, __pyx_t_19, __pyx_t_21, __pyx_t_22, __pyx_t_23, __pyx_t_24, __pyx_t_25, __pyx_t_26, __pyx_t_27, __pyx_t_28) num_threads(__pyx_v_num_threads)
+            #endif /* _OPENMP */
+            {
+                /* Initialize private variables to invalid values */
+                __pyx_v_dist_buffer = ((double *)1);
+                __pyx_v_idx_buffer = ((int *)1);
+
+                /* "pymica/methods/inverse_distance.pyx":585
+ * 
+ *     with nogil, parallel(num_threads=num_threads):
+ *         idx_buffer = <int *> malloc(buffer_size * sizeof(int))             # <<<<<<<<<<<<<<
+ *         dist_buffer = <double *> malloc(buffer_size * sizeof(double))
+ *         for j in prange(ysize, schedule='dynamic'):
+ */
+                __pyx_v_idx_buffer = ((int *)malloc((__pyx_v_buffer_size * (sizeof(int)))));
+
+                /* "pymica/methods/inverse_distance.pyx":586
+ *     with nogil, parallel(num_threads=num_threads):
+ *         idx_buffer = <int *> malloc(buffer_size * sizeof(int))
+ *         dist_buffer = <double *> malloc(buffer_size * sizeof(double))             # <<<<<<<<<<<<<<
+ *         for j in prange(ysize, schedule='dynamic'):
+ *             y = cgeotransform[3] + j * cgeotransform[5]
+ */
+                __pyx_v_dist_buffer = ((double *)malloc((__pyx_v_buffer_size * (sizeof(double)))));
+
+                /* "pymica/methods/inverse_distance.pyx":587
+ *         idx_buffer = <int *> malloc(buffer_size * sizeof(int))
+ *         dist_buffer = <double *> malloc(buffer_size * sizeof(double))
+ *         for j in prange(ysize, schedule='dynamic'):             # <<<<<<<<<<<<<<
+ *             y = cgeotransform[3] + j * cgeotransform[5]
+ *             for i in range(xsize):
+ */
+                __pyx_t_19 = __pyx_v_ysize;
+                {
+                    __pyx_t_23 = (__pyx_t_19 - 0 + 1 - 1/abs(1)) / 1;
+                    if (__pyx_t_23 > 0)
+                    {
+                        #ifdef _OPENMP
+                        #pragma omp for lastprivate(__pyx_v_i) firstprivate(__pyx_v_j) lastprivate(__pyx_v_j) lastprivate(__pyx_v_x) lastprivate(__pyx_v_y) schedule(dynamic)
+                        #endif /* _OPENMP */
+                        for (__pyx_t_22 = 0; __pyx_t_22 < __pyx_t_23; __pyx_t_22++){
+                            {
+                                __pyx_v_j = (int)(0 + 1 * __pyx_t_22);
+                                /* Initialize private variables to invalid values */
+                                __pyx_v_i = ((int)0xbad0bad0);
+                                __pyx_v_x = ((double)__PYX_NAN());
+                                __pyx_v_y = ((double)__PYX_NAN());
+
+                                /* "pymica/methods/inverse_distance.pyx":588
+ *         dist_buffer = <double *> malloc(buffer_size * sizeof(double))
+ *         for j in prange(ysize, schedule='dynamic'):
+ *             y = cgeotransform[3] + j * cgeotransform[5]             # <<<<<<<<<<<<<<
+ *             for i in range(xsize):
+ *                 if mask != NULL and not mask[j * xsize + i]:
+ */
+                                __pyx_t_18 = 3;
+                                __pyx_t_24 = 5;
+                                __pyx_v_y = ((*((double *) ( /* dim=0 */ (__pyx_v_cgeotransform.data + __pyx_t_18 * __pyx_v_cgeotransform.strides[0]) ))) + (__pyx_v_j * (*((double *) ( /* dim=0 */ (__pyx_v_cgeotransform.data + __pyx_t_24 * __pyx_v_cgeotransform.strides[0]) )))));
+
+                                /* "pymica/methods/inverse_distance.pyx":589
+ *         for j in prange(ysize, schedule='dynamic'):
+ *             y = cgeotransform[3] + j * cgeotransform[5]
+ *             for i in range(xsize):             # <<<<<<<<<<<<<<
+ *                 if mask != NULL and not mask[j * xsize + i]:
+ *                     out[j, i] = <floating> nodata
+ */
+                                __pyx_t_25 = __pyx_v_xsize;
+                                __pyx_t_26 = __pyx_t_25;
+                                for (__pyx_t_27 = 0; __pyx_t_27 < __pyx_t_26; __pyx_t_27+=1) {
+                                  __pyx_v_i = __pyx_t_27;
+
+                                  /* "pymica/methods/inverse_distance.pyx":590
+ *             y = cgeotransform[3] + j * cgeotransform[5]
+ *             for i in range(xsize):
+ *                 if mask != NULL and not mask[j * xsize + i]:             # <<<<<<<<<<<<<<
+ *                     out[j, i] = <floating> nodata
+ *                     continue
+ */
+                                  __pyx_t_28 = (__pyx_v_mask != NULL);
+                                  if (__pyx_t_28) {
+                                  } else {
+                                    __pyx_t_21 = __pyx_t_28;
+                                    goto __pyx_L19_bool_binop_done;
+                                  }
+                                  __pyx_t_28 = (!((__pyx_v_mask[((__pyx_v_j * __pyx_v_xsize) + __pyx_v_i)]) != 0));
+                                  __pyx_t_21 = __pyx_t_28;
+                                  __pyx_L19_bool_binop_done:;
+                                  if (__pyx_t_21) {
+
+                                    /* "pymica/methods/inverse_distance.pyx":591
+ *             for i in range(xsize):
+ *                 if mask != NULL and not mask[j * xsize + i]:
+ *                     out[j, i] = <floating> nodata             # <<<<<<<<<<<<<<
+ *                     continue
+ *                 x = cgeotransform[0] + i * cgeotransform[1]
+ */
+                                    __pyx_t_24 = __pyx_v_j;
+                                    __pyx_t_18 = __pyx_v_i;
+                                    *((float *) ( /* dim=1 */ ((char *) (((float *) ( /* dim=0 */ (__pyx_v_out.data + __pyx_t_24 * __pyx_v_out.strides[0]) )) + __pyx_t_18)) )) = ((float)__pyx_v_nodata);
+
+                                    /* "pymica/methods/inverse_distance.pyx":592
+ *                 if mask != NULL and not mask[j * xsize + i]:
+ *                     out[j, i] = <floating> nodata
+ *                     continue             # <<<<<<<<<<<<<<
+ *                 x = cgeotransform[0] + i * cgeotransform[1]
+ *                 if k_nearest > 0:
+ */
+                                    goto __pyx_L16_continue;
+
+                                    /* "pymica/methods/inverse_distance.pyx":590
+ *             y = cgeotransform[3] + j * cgeotransform[5]
+ *             for i in range(xsize):
+ *                 if mask != NULL and not mask[j * xsize + i]:             # <<<<<<<<<<<<<<
+ *                     out[j, i] = <floating> nodata
+ *                     continue
+ */
+                                  }
+
+                                  /* "pymica/methods/inverse_distance.pyx":593
+ *                     out[j, i] = <floating> nodata
+ *                     continue
+ *                 x = cgeotransform[0] + i * cgeotransform[1]             # <<<<<<<<<<<<<<
+ *                 if k_nearest > 0:
+ *                     out[j, i] = <floating> nearest_residue(
+ */
+                                  __pyx_t_18 = 0;
+                                  __pyx_t_24 = 1;
+                                  __pyx_v_x = ((*((double *) ( /* dim=0 */ (__pyx_v_cgeotransform.data + __pyx_t_18 * __pyx_v_cgeotransform.strides[0]) ))) + (__pyx_v_i * (*((double *) ( /* dim=0 */ (__pyx_v_cgeotransform.data + __pyx_t_24 * __pyx_v_cgeotransform.strides[0]) )))));
+
+                                  /* "pymica/methods/inverse_distance.pyx":594
+ *                     continue
+ *                 x = cgeotransform[0] + i * cgeotransform[1]
+ *                 if k_nearest > 0:             # <<<<<<<<<<<<<<
+ *                     out[j, i] = <floating> nearest_residue(
+ *                         x, y, &index, k_nearest, radius_sq, idx_buffer,
+ */
+                                  __pyx_t_21 = (__pyx_v_k_nearest > 0);
+                                  if (__pyx_t_21) {
+
+                                    /* "pymica/methods/inverse_distance.pyx":595
+ *                 x = cgeotransform[0] + i * cgeotransform[1]
+ *                 if k_nearest > 0:
+ *                     out[j, i] = <floating> nearest_residue(             # <<<<<<<<<<<<<<
+ *                         x, y, &index, k_nearest, radius_sq, idx_buffer,
+ *                         dist_buffer, power, smoothing)
+ */
+                                    __pyx_t_24 = __pyx_v_j;
+                                    __pyx_t_18 = __pyx_v_i;
+                                    *((float *) ( /* dim=1 */ ((char *) (((float *) ( /* dim=0 */ (__pyx_v_out.data + __pyx_t_24 * __pyx_v_out.strides[0]) )) + __pyx_t_18)) )) = ((float)__pyx_f_6pymica_7methods_16inverse_distance_nearest_residue(__pyx_v_x, __pyx_v_y, (&__pyx_v_index), __pyx_v_k_nearest, __pyx_v_radius_sq, __pyx_v_idx_buffer, __pyx_v_dist_buffer, __pyx_v_power, __pyx_v_smoothing));
+
+                                    /* "pymica/methods/inverse_distance.pyx":594
+ *                     continue
+ *                 x = cgeotransform[0] + i * cgeotransform[1]
+ *                 if k_nearest > 0:             # <<<<<<<<<<<<<<
+ *                     out[j, i] = <floating> nearest_residue(
+ *                         x, y, &index, k_nearest, radius_sq, idx_buffer,
+ */
+                                    goto __pyx_L21;
+                                  }
+
+                                  /* "pymica/methods/inverse_distance.pyx":599
+ *                         dist_buffer, power, smoothing)
+ *                 else:
+ *                     out[j, i] = <floating> radius_residue(             # <<<<<<<<<<<<<<
+ *                         x, y, &index, radius_sq, power, smoothing)
+ *         free(idx_buffer)
+ */
+                                  /*else*/ {
+
+                                    /* "pymica/methods/inverse_distance.pyx":600
+ *                 else:
+ *                     out[j, i] = <floating> radius_residue(
+ *                         x, y, &index, radius_sq, power, smoothing)             # <<<<<<<<<<<<<<
+ *         free(idx_buffer)
+ *         free(dist_buffer)
+ */
+                                    __pyx_t_18 = __pyx_v_j;
+                                    __pyx_t_24 = __pyx_v_i;
+                                    *((float *) ( /* dim=1 */ ((char *) (((float *) ( /* dim=0 */ (__pyx_v_out.data + __pyx_t_18 * __pyx_v_out.strides[0]) )) + __pyx_t_24)) )) = ((float)__pyx_f_6pymica_7methods_16inverse_distance_radius_residue(__pyx_v_x, __pyx_v_y, (&__pyx_v_index), __pyx_v_radius_sq, __pyx_v_power, __pyx_v_smoothing));
+                                  }
+                                  __pyx_L21:;
+                                  __pyx_L16_continue:;
+                                }
+                            }
+                        }
+                    }
+                }
+
+                /* "pymica/methods/inverse_distance.pyx":601
+ *                     out[j, i] = <floating> radius_residue(
+ *                         x, y, &index, radius_sq, power, smoothing)
+ *         free(idx_buffer)             # <<<<<<<<<<<<<<
+ *         free(dist_buffer)
+ * 
+ */
+                free(__pyx_v_idx_buffer);
+
+                /* "pymica/methods/inverse_distance.pyx":602
+ *                         x, y, &index, radius_sq, power, smoothing)
+ *         free(idx_buffer)
+ *         free(dist_buffer)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+                free(__pyx_v_dist_buffer);
+            }
+        }
+        #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+            #undef likely
+            #undef unlikely
+            #define likely(x)   __builtin_expect(!!(x), 1)
+            #define unlikely(x) __builtin_expect(!!(x), 0)
+        #endif
+      }
+
+      /* "pymica/methods/inverse_distance.pyx":584
+ *     cdef double x, y
+ * 
+ *     with nogil, parallel(num_threads=num_threads):             # <<<<<<<<<<<<<<
+ *         idx_buffer = <int *> malloc(buffer_size * sizeof(int))
+ *         dist_buffer = <double *> malloc(buffer_size * sizeof(double))
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L7;
+        }
+        __pyx_L7:;
+      }
+  }
+
+  /* "pymica/methods/inverse_distance.pyx":550
+ * 
+ * 
+ * cdef void neighbour_field(floating[:, ::1] out, const double[::1] xpos,             # <<<<<<<<<<<<<<
+ *                           const double[::1] ypos, const double[::1] values,
+ *                           double[:] cgeotransform, IdwPower power, float smoothing,
+ */
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_XDECREF(__pyx_t_12);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_14, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_15, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_16, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_17, 1);
+  __Pyx_AddTraceback("pymica.methods.inverse_distance.neighbour_field", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_sorted_x);
+  __Pyx_XDECREF(__pyx_v_sorted_y);
+  __Pyx_XDECREF(__pyx_v_sorted_values);
+  __Pyx_XDECREF(__pyx_v_start);
+  __Pyx_XDECREF(__pyx_v_nx);
+  __Pyx_XDECREF(__pyx_v_ny);
+  __Pyx_XDECREF(__pyx_v_x0);
+  __Pyx_XDECREF(__pyx_v_y0);
+  __Pyx_XDECREF(__pyx_v_cell_size);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_csorted_x, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_csorted_y, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_csorted_values, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_cstart, 1);
+  __Pyx_RefNannyFinishContext();
+}
+
+static void __pyx_fuse_1__pyx_f_6pymica_7methods_16inverse_distance_neighbour_field(__Pyx_memviewslice __pyx_v_out, __Pyx_memviewslice __pyx_v_xpos, __Pyx_memviewslice __pyx_v_ypos, __Pyx_memviewslice __pyx_v_values, __Pyx_memviewslice __pyx_v_cgeotransform, struct __pyx_t_6pymica_7methods_9idw_power_IdwPower __pyx_v_power, float __pyx_v_smoothing, int __pyx_v_num_threads, int __pyx_v_k_nearest, double __pyx_v_max_radius, unsigned char const *__pyx_v_mask, double __pyx_v_nodata) {
+  PyObject *__pyx_v_sorted_x = NULL;
+  PyObject *__pyx_v_sorted_y = NULL;
+  PyObject *__pyx_v_sorted_values = NULL;
+  PyObject *__pyx_v_start = NULL;
+  PyObject *__pyx_v_nx = NULL;
+  PyObject *__pyx_v_ny = NULL;
+  PyObject *__pyx_v_x0 = NULL;
+  PyObject *__pyx_v_y0 = NULL;
+  PyObject *__pyx_v_cell_size = NULL;
+  __Pyx_memviewslice __pyx_v_csorted_x = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_csorted_y = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_csorted_values = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_cstart = { 0, 0, { 0 }, { 0 }, { 0 } };
+  struct __pyx_t_6pymica_7methods_16inverse_distance_GridIndex __pyx_v_index;
+  double __pyx_v_radius_sq;
+  int __pyx_v_buffer_size;
+  int *__pyx_v_idx_buffer;
+  double *__pyx_v_dist_buffer;
+  int __pyx_v_xsize;
+  CYTHON_UNUSED int __pyx_v_ysize;
+  int __pyx_v_i;
+  int __pyx_v_j;
+  double __pyx_v_x;
+  double __pyx_v_y;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  unsigned int __pyx_t_8;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  PyObject *__pyx_t_12 = NULL;
+  PyObject *(*__pyx_t_13)(PyObject *);
+  __Pyx_memviewslice __pyx_t_14 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_t_15 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_t_16 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_t_17 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  Py_ssize_t __pyx_t_18;
+  int __pyx_t_19;
+  double __pyx_t_20;
+  int __pyx_t_21;
+  int __pyx_t_22;
+  int __pyx_t_23;
+  Py_ssize_t __pyx_t_24;
+  int __pyx_t_25;
+  int __pyx_t_26;
+  int __pyx_t_27;
+  int __pyx_t_28;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_fuse_1neighbour_field", 1);
+
+  /* "pymica/methods/inverse_distance.pyx":557
+ *     """Fills out using only the neighbour stations of each pixel."""
+ *     sorted_x, sorted_y, sorted_values, start, nx, ny, x0, y0, cell_size = \
+ *         build_grid_index(xpos, ypos, values, k_nearest)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef const double[::1] csorted_x = sorted_x
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_build_grid_index); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 557, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __pyx_memoryview_fromslice(__pyx_v_xpos, 1, (PyObject *(*)(char *)) __pyx_memview_get_double__const__, (int (*)(char *, PyObject *)) NULL, 0);; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 557, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __pyx_memoryview_fromslice(__pyx_v_ypos, 1, (PyObject *(*)(char *)) __pyx_memview_get_double__const__, (int (*)(char *, PyObject *)) NULL, 0);; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 557, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = __pyx_memoryview_fromslice(__pyx_v_values, 1, (PyObject *(*)(char *)) __pyx_memview_get_double__const__, (int (*)(char *, PyObject *)) NULL, 0);; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 557, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = __Pyx_PyInt_From_int(__pyx_v_k_nearest); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 557, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_7 = NULL;
+  __pyx_t_8 = 0;
+  #if CYTHON_UNPACK_METHODS
+  if (unlikely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_7)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_7);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+      __pyx_t_8 = 1;
+    }
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[5] = {__pyx_t_7, __pyx_t_3, __pyx_t_4, __pyx_t_5, __pyx_t_6};
+    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_8, 4+__pyx_t_8);
+    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 557, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  }
+  if ((likely(PyTuple_CheckExact(__pyx_t_1))) || (PyList_CheckExact(__pyx_t_1))) {
+    PyObject* sequence = __pyx_t_1;
+    Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
+    if (unlikely(size != 9)) {
+      if (size > 9) __Pyx_RaiseTooManyValuesError(9);
+      else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+      __PYX_ERR(0, 556, __pyx_L1_error)
+    }
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    if (likely(PyTuple_CheckExact(sequence))) {
+      __pyx_t_2 = PyTuple_GET_ITEM(sequence, 0); 
+      __pyx_t_6 = PyTuple_GET_ITEM(sequence, 1); 
+      __pyx_t_5 = PyTuple_GET_ITEM(sequence, 2); 
+      __pyx_t_4 = PyTuple_GET_ITEM(sequence, 3); 
+      __pyx_t_3 = PyTuple_GET_ITEM(sequence, 4); 
+      __pyx_t_7 = PyTuple_GET_ITEM(sequence, 5); 
+      __pyx_t_9 = PyTuple_GET_ITEM(sequence, 6); 
+      __pyx_t_10 = PyTuple_GET_ITEM(sequence, 7); 
+      __pyx_t_11 = PyTuple_GET_ITEM(sequence, 8); 
+    } else {
+      __pyx_t_2 = PyList_GET_ITEM(sequence, 0); 
+      __pyx_t_6 = PyList_GET_ITEM(sequence, 1); 
+      __pyx_t_5 = PyList_GET_ITEM(sequence, 2); 
+      __pyx_t_4 = PyList_GET_ITEM(sequence, 3); 
+      __pyx_t_3 = PyList_GET_ITEM(sequence, 4); 
+      __pyx_t_7 = PyList_GET_ITEM(sequence, 5); 
+      __pyx_t_9 = PyList_GET_ITEM(sequence, 6); 
+      __pyx_t_10 = PyList_GET_ITEM(sequence, 7); 
+      __pyx_t_11 = PyList_GET_ITEM(sequence, 8); 
+    }
+    __Pyx_INCREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx_t_6);
+    __Pyx_INCREF(__pyx_t_5);
+    __Pyx_INCREF(__pyx_t_4);
+    __Pyx_INCREF(__pyx_t_3);
+    __Pyx_INCREF(__pyx_t_7);
+    __Pyx_INCREF(__pyx_t_9);
+    __Pyx_INCREF(__pyx_t_10);
+    __Pyx_INCREF(__pyx_t_11);
+    #else
+    {
+      Py_ssize_t i;
+      PyObject** temps[9] = {&__pyx_t_2,&__pyx_t_6,&__pyx_t_5,&__pyx_t_4,&__pyx_t_3,&__pyx_t_7,&__pyx_t_9,&__pyx_t_10,&__pyx_t_11};
+      for (i=0; i < 9; i++) {
+        PyObject* item = PySequence_ITEM(sequence, i); if (unlikely(!item)) __PYX_ERR(0, 556, __pyx_L1_error)
+        __Pyx_GOTREF(item);
+        *(temps[i]) = item;
+      }
+    }
+    #endif
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  } else {
+    Py_ssize_t index = -1;
+    PyObject** temps[9] = {&__pyx_t_2,&__pyx_t_6,&__pyx_t_5,&__pyx_t_4,&__pyx_t_3,&__pyx_t_7,&__pyx_t_9,&__pyx_t_10,&__pyx_t_11};
+    __pyx_t_12 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 556, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_12);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_13 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_12);
+    for (index=0; index < 9; index++) {
+      PyObject* item = __pyx_t_13(__pyx_t_12); if (unlikely(!item)) goto __pyx_L3_unpacking_failed;
+      __Pyx_GOTREF(item);
+      *(temps[index]) = item;
+    }
+    if (__Pyx_IternextUnpackEndCheck(__pyx_t_13(__pyx_t_12), 9) < 0) __PYX_ERR(0, 556, __pyx_L1_error)
+    __pyx_t_13 = NULL;
+    __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+    goto __pyx_L4_unpacking_done;
+    __pyx_L3_unpacking_failed:;
+    __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+    __pyx_t_13 = NULL;
+    if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+    __PYX_ERR(0, 556, __pyx_L1_error)
+    __pyx_L4_unpacking_done:;
+  }
+
+  /* "pymica/methods/inverse_distance.pyx":556
+ *                           const unsigned char *mask, double nodata):
+ *     """Fills out using only the neighbour stations of each pixel."""
+ *     sorted_x, sorted_y, sorted_values, start, nx, ny, x0, y0, cell_size = \             # <<<<<<<<<<<<<<
+ *         build_grid_index(xpos, ypos, values, k_nearest)
+ * 
+ */
+  __pyx_v_sorted_x = __pyx_t_2;
+  __pyx_t_2 = 0;
+  __pyx_v_sorted_y = __pyx_t_6;
+  __pyx_t_6 = 0;
+  __pyx_v_sorted_values = __pyx_t_5;
+  __pyx_t_5 = 0;
+  __pyx_v_start = __pyx_t_4;
+  __pyx_t_4 = 0;
+  __pyx_v_nx = __pyx_t_3;
+  __pyx_t_3 = 0;
+  __pyx_v_ny = __pyx_t_7;
+  __pyx_t_7 = 0;
+  __pyx_v_x0 = __pyx_t_9;
+  __pyx_t_9 = 0;
+  __pyx_v_y0 = __pyx_t_10;
+  __pyx_t_10 = 0;
+  __pyx_v_cell_size = __pyx_t_11;
+  __pyx_t_11 = 0;
+
+  /* "pymica/methods/inverse_distance.pyx":559
+ *         build_grid_index(xpos, ypos, values, k_nearest)
+ * 
+ *     cdef const double[::1] csorted_x = sorted_x             # <<<<<<<<<<<<<<
+ *     cdef const double[::1] csorted_y = sorted_y
+ *     cdef const double[::1] csorted_values = sorted_values
+ */
+  __pyx_t_14 = __Pyx_PyObject_to_MemoryviewSlice_dc_double__const__(__pyx_v_sorted_x, 0); if (unlikely(!__pyx_t_14.memview)) __PYX_ERR(0, 559, __pyx_L1_error)
+  __pyx_v_csorted_x = __pyx_t_14;
+  __pyx_t_14.memview = NULL;
+  __pyx_t_14.data = NULL;
+
+  /* "pymica/methods/inverse_distance.pyx":560
+ * 
+ *     cdef const double[::1] csorted_x = sorted_x
+ *     cdef const double[::1] csorted_y = sorted_y             # <<<<<<<<<<<<<<
+ *     cdef const double[::1] csorted_values = sorted_values
+ *     cdef const int[::1] cstart = start
+ */
+  __pyx_t_15 = __Pyx_PyObject_to_MemoryviewSlice_dc_double__const__(__pyx_v_sorted_y, 0); if (unlikely(!__pyx_t_15.memview)) __PYX_ERR(0, 560, __pyx_L1_error)
+  __pyx_v_csorted_y = __pyx_t_15;
+  __pyx_t_15.memview = NULL;
+  __pyx_t_15.data = NULL;
+
+  /* "pymica/methods/inverse_distance.pyx":561
+ *     cdef const double[::1] csorted_x = sorted_x
+ *     cdef const double[::1] csorted_y = sorted_y
+ *     cdef const double[::1] csorted_values = sorted_values             # <<<<<<<<<<<<<<
+ *     cdef const int[::1] cstart = start
+ * 
+ */
+  __pyx_t_16 = __Pyx_PyObject_to_MemoryviewSlice_dc_double__const__(__pyx_v_sorted_values, 0); if (unlikely(!__pyx_t_16.memview)) __PYX_ERR(0, 561, __pyx_L1_error)
+  __pyx_v_csorted_values = __pyx_t_16;
+  __pyx_t_16.memview = NULL;
+  __pyx_t_16.data = NULL;
+
+  /* "pymica/methods/inverse_distance.pyx":562
+ *     cdef const double[::1] csorted_y = sorted_y
+ *     cdef const double[::1] csorted_values = sorted_values
+ *     cdef const int[::1] cstart = start             # <<<<<<<<<<<<<<
+ * 
+ *     cdef GridIndex index
+ */
+  __pyx_t_17 = __Pyx_PyObject_to_MemoryviewSlice_dc_int__const__(__pyx_v_start, 0); if (unlikely(!__pyx_t_17.memview)) __PYX_ERR(0, 562, __pyx_L1_error)
+  __pyx_v_cstart = __pyx_t_17;
+  __pyx_t_17.memview = NULL;
+  __pyx_t_17.data = NULL;
+
+  /* "pymica/methods/inverse_distance.pyx":565
+ * 
+ *     cdef GridIndex index
+ *     index.xpos = &csorted_x[0]             # <<<<<<<<<<<<<<
+ *     index.ypos = &csorted_y[0]
+ *     index.values = &csorted_values[0]
+ */
+  __pyx_t_18 = 0;
+  __pyx_v_index.xpos = (&(*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_csorted_x.data) + __pyx_t_18)) ))));
+
+  /* "pymica/methods/inverse_distance.pyx":566
+ *     cdef GridIndex index
+ *     index.xpos = &csorted_x[0]
+ *     index.ypos = &csorted_y[0]             # <<<<<<<<<<<<<<
+ *     index.values = &csorted_values[0]
+ *     index.start = &cstart[0]
+ */
+  __pyx_t_18 = 0;
+  __pyx_v_index.ypos = (&(*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_csorted_y.data) + __pyx_t_18)) ))));
+
+  /* "pymica/methods/inverse_distance.pyx":567
+ *     index.xpos = &csorted_x[0]
+ *     index.ypos = &csorted_y[0]
+ *     index.values = &csorted_values[0]             # <<<<<<<<<<<<<<
+ *     index.start = &cstart[0]
+ *     index.nx = nx
+ */
+  __pyx_t_18 = 0;
+  __pyx_v_index.values = (&(*((double const  *) ( /* dim=0 */ ((char *) (((double const  *) __pyx_v_csorted_values.data) + __pyx_t_18)) ))));
+
+  /* "pymica/methods/inverse_distance.pyx":568
+ *     index.ypos = &csorted_y[0]
+ *     index.values = &csorted_values[0]
+ *     index.start = &cstart[0]             # <<<<<<<<<<<<<<
+ *     index.nx = nx
+ *     index.ny = ny
+ */
+  __pyx_t_18 = 0;
+  __pyx_v_index.start = (&(*((int const  *) ( /* dim=0 */ ((char *) (((int const  *) __pyx_v_cstart.data) + __pyx_t_18)) ))));
+
+  /* "pymica/methods/inverse_distance.pyx":569
+ *     index.values = &csorted_values[0]
+ *     index.start = &cstart[0]
+ *     index.nx = nx             # <<<<<<<<<<<<<<
+ *     index.ny = ny
+ *     index.x0 = x0
+ */
+  __pyx_t_19 = __Pyx_PyInt_As_int(__pyx_v_nx); if (unlikely((__pyx_t_19 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 569, __pyx_L1_error)
+  __pyx_v_index.nx = __pyx_t_19;
+
+  /* "pymica/methods/inverse_distance.pyx":570
+ *     index.start = &cstart[0]
+ *     index.nx = nx
+ *     index.ny = ny             # <<<<<<<<<<<<<<
+ *     index.x0 = x0
+ *     index.y0 = y0
+ */
+  __pyx_t_19 = __Pyx_PyInt_As_int(__pyx_v_ny); if (unlikely((__pyx_t_19 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 570, __pyx_L1_error)
+  __pyx_v_index.ny = __pyx_t_19;
+
+  /* "pymica/methods/inverse_distance.pyx":571
+ *     index.nx = nx
+ *     index.ny = ny
+ *     index.x0 = x0             # <<<<<<<<<<<<<<
+ *     index.y0 = y0
+ *     index.cell_size = cell_size
+ */
+  __pyx_t_20 = __pyx_PyFloat_AsDouble(__pyx_v_x0); if (unlikely((__pyx_t_20 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 571, __pyx_L1_error)
+  __pyx_v_index.x0 = __pyx_t_20;
+
+  /* "pymica/methods/inverse_distance.pyx":572
+ *     index.ny = ny
+ *     index.x0 = x0
+ *     index.y0 = y0             # <<<<<<<<<<<<<<
+ *     index.cell_size = cell_size
+ * 
+ */
+  __pyx_t_20 = __pyx_PyFloat_AsDouble(__pyx_v_y0); if (unlikely((__pyx_t_20 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 572, __pyx_L1_error)
+  __pyx_v_index.y0 = __pyx_t_20;
+
+  /* "pymica/methods/inverse_distance.pyx":573
+ *     index.x0 = x0
+ *     index.y0 = y0
+ *     index.cell_size = cell_size             # <<<<<<<<<<<<<<
+ * 
+ *     cdef double radius_sq = max_radius * max_radius if max_radius > 0 else -1.0
+ */
+  __pyx_t_20 = __pyx_PyFloat_AsDouble(__pyx_v_cell_size); if (unlikely((__pyx_t_20 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 573, __pyx_L1_error)
+  __pyx_v_index.cell_size = __pyx_t_20;
+
+  /* "pymica/methods/inverse_distance.pyx":575
+ *     index.cell_size = cell_size
+ * 
+ *     cdef double radius_sq = max_radius * max_radius if max_radius > 0 else -1.0             # <<<<<<<<<<<<<<
+ *     cdef int buffer_size = k_nearest if k_nearest > 0 else 1
+ *     cdef int *idx_buffer
+ */
+  __pyx_t_21 = (__pyx_v_max_radius > 0.0);
+  if (__pyx_t_21) {
+    __pyx_t_20 = (__pyx_v_max_radius * __pyx_v_max_radius);
+  } else {
+    __pyx_t_20 = -1.0;
+  }
+  __pyx_v_radius_sq = __pyx_t_20;
+
+  /* "pymica/methods/inverse_distance.pyx":576
+ * 
+ *     cdef double radius_sq = max_radius * max_radius if max_radius > 0 else -1.0
+ *     cdef int buffer_size = k_nearest if k_nearest > 0 else 1             # <<<<<<<<<<<<<<
+ *     cdef int *idx_buffer
+ *     cdef double *dist_buffer
+ */
+  __pyx_t_21 = (__pyx_v_k_nearest > 0);
+  if (__pyx_t_21) {
+    __pyx_t_19 = __pyx_v_k_nearest;
+  } else {
+    __pyx_t_19 = 1;
+  }
+  __pyx_v_buffer_size = __pyx_t_19;
+
+  /* "pymica/methods/inverse_distance.pyx":579
+ *     cdef int *idx_buffer
+ *     cdef double *dist_buffer
+ *     cdef int xsize = out.shape[1]             # <<<<<<<<<<<<<<
+ *     cdef int ysize = out.shape[0]
+ *     cdef int i, j
+ */
+  __pyx_v_xsize = (__pyx_v_out.shape[1]);
+
+  /* "pymica/methods/inverse_distance.pyx":580
+ *     cdef double *dist_buffer
+ *     cdef int xsize = out.shape[1]
+ *     cdef int ysize = out.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef int i, j
+ *     cdef double x, y
+ */
+  __pyx_v_ysize = (__pyx_v_out.shape[0]);
+
+  /* "pymica/methods/inverse_distance.pyx":584
+ *     cdef double x, y
+ * 
+ *     with nogil, parallel(num_threads=num_threads):             # <<<<<<<<<<<<<<
+ *         idx_buffer = <int *> malloc(buffer_size * sizeof(int))
+ *         dist_buffer = <double *> malloc(buffer_size * sizeof(double))
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      _save = NULL;
+      Py_UNBLOCK_THREADS
+      __Pyx_FastGIL_Remember();
+      #endif
+      /*try:*/ {
+        {
+            #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+                #undef likely
+                #undef unlikely
+                #define likely(x)   (x)
+                #define unlikely(x) (x)
+            #endif
+            #ifdef _OPENMP
+            #pragma omp parallel private(__pyx_v_dist_buffer, __pyx_v_idx_buffer) private(__pyx_t_18, __pyx_t_19, __pyx_t_21, __pyx_t_22, __pyx_t_23, __pyx_t_24, __pyx_t_25, __pyx_t_26, __pyx_t_27, __pyx_t_28) num_threads(__pyx_v_num_threads)
+            #endif /* _OPENMP */
+            {
+                /* Initialize private variables to invalid values */
+                __pyx_v_dist_buffer = ((double *)1);
+                __pyx_v_idx_buffer = ((int *)1);
+
+                /* "pymica/methods/inverse_distance.pyx":585
+ * 
+ *     with nogil, parallel(num_threads=num_threads):
+ *         idx_buffer = <int *> malloc(buffer_size * sizeof(int))             # <<<<<<<<<<<<<<
+ *         dist_buffer = <double *> malloc(buffer_size * sizeof(double))
+ *         for j in prange(ysize, schedule='dynamic'):
+ */
+                __pyx_v_idx_buffer = ((int *)malloc((__pyx_v_buffer_size * (sizeof(int)))));
+
+                /* "pymica/methods/inverse_distance.pyx":586
+ *     with nogil, parallel(num_threads=num_threads):
+ *         idx_buffer = <int *> malloc(buffer_size * sizeof(int))
+ *         dist_buffer = <double *> malloc(buffer_size * sizeof(double))             # <<<<<<<<<<<<<<
+ *         for j in prange(ysize, schedule='dynamic'):
+ *             y = cgeotransform[3] + j * cgeotransform[5]
+ */
+                __pyx_v_dist_buffer = ((double *)malloc((__pyx_v_buffer_size * (sizeof(double)))));
+
+                /* "pymica/methods/inverse_distance.pyx":587
+ *         idx_buffer = <int *> malloc(buffer_size * sizeof(int))
+ *         dist_buffer = <double *> malloc(buffer_size * sizeof(double))
+ *         for j in prange(ysize, schedule='dynamic'):             # <<<<<<<<<<<<<<
+ *             y = cgeotransform[3] + j * cgeotransform[5]
+ *             for i in range(xsize):
+ */
+                __pyx_t_19 = __pyx_v_ysize;
+                {
+                    __pyx_t_23 = (__pyx_t_19 - 0 + 1 - 1/abs(1)) / 1;
+                    if (__pyx_t_23 > 0)
+                    {
+                        #ifdef _OPENMP
+                        #pragma omp for lastprivate(__pyx_v_i) firstprivate(__pyx_v_j) lastprivate(__pyx_v_j) lastprivate(__pyx_v_x) lastprivate(__pyx_v_y) schedule(dynamic)
+                        #endif /* _OPENMP */
+                        for (__pyx_t_22 = 0; __pyx_t_22 < __pyx_t_23; __pyx_t_22++){
+                            {
+                                __pyx_v_j = (int)(0 + 1 * __pyx_t_22);
+                                /* Initialize private variables to invalid values */
+                                __pyx_v_i = ((int)0xbad0bad0);
+                                __pyx_v_x = ((double)__PYX_NAN());
+                                __pyx_v_y = ((double)__PYX_NAN());
+
+                                /* "pymica/methods/inverse_distance.pyx":588
+ *         dist_buffer = <double *> malloc(buffer_size * sizeof(double))
+ *         for j in prange(ysize, schedule='dynamic'):
+ *             y = cgeotransform[3] + j * cgeotransform[5]             # <<<<<<<<<<<<<<
+ *             for i in range(xsize):
+ *                 if mask != NULL and not mask[j * xsize + i]:
+ */
+                                __pyx_t_18 = 3;
+                                __pyx_t_24 = 5;
+                                __pyx_v_y = ((*((double *) ( /* dim=0 */ (__pyx_v_cgeotransform.data + __pyx_t_18 * __pyx_v_cgeotransform.strides[0]) ))) + (__pyx_v_j * (*((double *) ( /* dim=0 */ (__pyx_v_cgeotransform.data + __pyx_t_24 * __pyx_v_cgeotransform.strides[0]) )))));
+
+                                /* "pymica/methods/inverse_distance.pyx":589
+ *         for j in prange(ysize, schedule='dynamic'):
+ *             y = cgeotransform[3] + j * cgeotransform[5]
+ *             for i in range(xsize):             # <<<<<<<<<<<<<<
+ *                 if mask != NULL and not mask[j * xsize + i]:
+ *                     out[j, i] = <floating> nodata
+ */
+                                __pyx_t_25 = __pyx_v_xsize;
+                                __pyx_t_26 = __pyx_t_25;
+                                for (__pyx_t_27 = 0; __pyx_t_27 < __pyx_t_26; __pyx_t_27+=1) {
+                                  __pyx_v_i = __pyx_t_27;
+
+                                  /* "pymica/methods/inverse_distance.pyx":590
+ *             y = cgeotransform[3] + j * cgeotransform[5]
+ *             for i in range(xsize):
+ *                 if mask != NULL and not mask[j * xsize + i]:             # <<<<<<<<<<<<<<
+ *                     out[j, i] = <floating> nodata
+ *                     continue
+ */
+                                  __pyx_t_28 = (__pyx_v_mask != NULL);
+                                  if (__pyx_t_28) {
+                                  } else {
+                                    __pyx_t_21 = __pyx_t_28;
+                                    goto __pyx_L19_bool_binop_done;
+                                  }
+                                  __pyx_t_28 = (!((__pyx_v_mask[((__pyx_v_j * __pyx_v_xsize) + __pyx_v_i)]) != 0));
+                                  __pyx_t_21 = __pyx_t_28;
+                                  __pyx_L19_bool_binop_done:;
+                                  if (__pyx_t_21) {
+
+                                    /* "pymica/methods/inverse_distance.pyx":591
+ *             for i in range(xsize):
+ *                 if mask != NULL and not mask[j * xsize + i]:
+ *                     out[j, i] = <floating> nodata             # <<<<<<<<<<<<<<
+ *                     continue
+ *                 x = cgeotransform[0] + i * cgeotransform[1]
+ */
+                                    __pyx_t_24 = __pyx_v_j;
+                                    __pyx_t_18 = __pyx_v_i;
+                                    *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_out.data + __pyx_t_24 * __pyx_v_out.strides[0]) )) + __pyx_t_18)) )) = ((double)__pyx_v_nodata);
+
+                                    /* "pymica/methods/inverse_distance.pyx":592
+ *                 if mask != NULL and not mask[j * xsize + i]:
+ *                     out[j, i] = <floating> nodata
+ *                     continue             # <<<<<<<<<<<<<<
+ *                 x = cgeotransform[0] + i * cgeotransform[1]
+ *                 if k_nearest > 0:
+ */
+                                    goto __pyx_L16_continue;
+
+                                    /* "pymica/methods/inverse_distance.pyx":590
+ *             y = cgeotransform[3] + j * cgeotransform[5]
+ *             for i in range(xsize):
+ *                 if mask != NULL and not mask[j * xsize + i]:             # <<<<<<<<<<<<<<
+ *                     out[j, i] = <floating> nodata
+ *                     continue
+ */
+                                  }
+
+                                  /* "pymica/methods/inverse_distance.pyx":593
+ *                     out[j, i] = <floating> nodata
+ *                     continue
+ *                 x = cgeotransform[0] + i * cgeotransform[1]             # <<<<<<<<<<<<<<
+ *                 if k_nearest > 0:
+ *                     out[j, i] = <floating> nearest_residue(
+ */
+                                  __pyx_t_18 = 0;
+                                  __pyx_t_24 = 1;
+                                  __pyx_v_x = ((*((double *) ( /* dim=0 */ (__pyx_v_cgeotransform.data + __pyx_t_18 * __pyx_v_cgeotransform.strides[0]) ))) + (__pyx_v_i * (*((double *) ( /* dim=0 */ (__pyx_v_cgeotransform.data + __pyx_t_24 * __pyx_v_cgeotransform.strides[0]) )))));
+
+                                  /* "pymica/methods/inverse_distance.pyx":594
+ *                     continue
+ *                 x = cgeotransform[0] + i * cgeotransform[1]
+ *                 if k_nearest > 0:             # <<<<<<<<<<<<<<
+ *                     out[j, i] = <floating> nearest_residue(
+ *                         x, y, &index, k_nearest, radius_sq, idx_buffer,
+ */
+                                  __pyx_t_21 = (__pyx_v_k_nearest > 0);
+                                  if (__pyx_t_21) {
+
+                                    /* "pymica/methods/inverse_distance.pyx":595
+ *                 x = cgeotransform[0] + i * cgeotransform[1]
+ *                 if k_nearest > 0:
+ *                     out[j, i] = <floating> nearest_residue(             # <<<<<<<<<<<<<<
+ *                         x, y, &index, k_nearest, radius_sq, idx_buffer,
+ *                         dist_buffer, power, smoothing)
+ */
+                                    __pyx_t_24 = __pyx_v_j;
+                                    __pyx_t_18 = __pyx_v_i;
+                                    *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_out.data + __pyx_t_24 * __pyx_v_out.strides[0]) )) + __pyx_t_18)) )) = ((double)__pyx_f_6pymica_7methods_16inverse_distance_nearest_residue(__pyx_v_x, __pyx_v_y, (&__pyx_v_index), __pyx_v_k_nearest, __pyx_v_radius_sq, __pyx_v_idx_buffer, __pyx_v_dist_buffer, __pyx_v_power, __pyx_v_smoothing));
+
+                                    /* "pymica/methods/inverse_distance.pyx":594
+ *                     continue
+ *                 x = cgeotransform[0] + i * cgeotransform[1]
+ *                 if k_nearest > 0:             # <<<<<<<<<<<<<<
+ *                     out[j, i] = <floating> nearest_residue(
+ *                         x, y, &index, k_nearest, radius_sq, idx_buffer,
+ */
+                                    goto __pyx_L21;
+                                  }
+
+                                  /* "pymica/methods/inverse_distance.pyx":599
+ *                         dist_buffer, power, smoothing)
+ *                 else:
+ *                     out[j, i] = <floating> radius_residue(             # <<<<<<<<<<<<<<
+ *                         x, y, &index, radius_sq, power, smoothing)
+ *         free(idx_buffer)
+ */
+                                  /*else*/ {
+
+                                    /* "pymica/methods/inverse_distance.pyx":600
+ *                 else:
+ *                     out[j, i] = <floating> radius_residue(
+ *                         x, y, &index, radius_sq, power, smoothing)             # <<<<<<<<<<<<<<
+ *         free(idx_buffer)
+ *         free(dist_buffer)
+ */
+                                    __pyx_t_18 = __pyx_v_j;
+                                    __pyx_t_24 = __pyx_v_i;
+                                    *((double *) ( /* dim=1 */ ((char *) (((double *) ( /* dim=0 */ (__pyx_v_out.data + __pyx_t_18 * __pyx_v_out.strides[0]) )) + __pyx_t_24)) )) = ((double)__pyx_f_6pymica_7methods_16inverse_distance_radius_residue(__pyx_v_x, __pyx_v_y, (&__pyx_v_index), __pyx_v_radius_sq, __pyx_v_power, __pyx_v_smoothing));
+                                  }
+                                  __pyx_L21:;
+                                  __pyx_L16_continue:;
+                                }
+                            }
+                        }
+                    }
+                }
+
+                /* "pymica/methods/inverse_distance.pyx":601
+ *                     out[j, i] = <floating> radius_residue(
+ *                         x, y, &index, radius_sq, power, smoothing)
+ *         free(idx_buffer)             # <<<<<<<<<<<<<<
+ *         free(dist_buffer)
+ * 
+ */
+                free(__pyx_v_idx_buffer);
+
+                /* "pymica/methods/inverse_distance.pyx":602
+ *                         x, y, &index, radius_sq, power, smoothing)
+ *         free(idx_buffer)
+ *         free(dist_buffer)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+                free(__pyx_v_dist_buffer);
+            }
+        }
+        #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+            #undef likely
+            #undef unlikely
+            #define likely(x)   __builtin_expect(!!(x), 1)
+            #define unlikely(x) __builtin_expect(!!(x), 0)
+        #endif
+      }
+
+      /* "pymica/methods/inverse_distance.pyx":584
+ *     cdef double x, y
+ * 
+ *     with nogil, parallel(num_threads=num_threads):             # <<<<<<<<<<<<<<
+ *         idx_buffer = <int *> malloc(buffer_size * sizeof(int))
+ *         dist_buffer = <double *> malloc(buffer_size * sizeof(double))
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          __Pyx_FastGIL_Forget();
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L7;
+        }
+        __pyx_L7:;
+      }
+  }
+
+  /* "pymica/methods/inverse_distance.pyx":550
+ * 
+ * 
+ * cdef void neighbour_field(floating[:, ::1] out, const double[::1] xpos,             # <<<<<<<<<<<<<<
+ *                           const double[::1] ypos, const double[::1] values,
+ *                           double[:] cgeotransform, IdwPower power, float smoothing,
+ */
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_XDECREF(__pyx_t_12);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_14, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_15, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_16, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_t_17, 1);
+  __Pyx_AddTraceback("pymica.methods.inverse_distance.neighbour_field", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_sorted_x);
+  __Pyx_XDECREF(__pyx_v_sorted_y);
+  __Pyx_XDECREF(__pyx_v_sorted_values);
+  __Pyx_XDECREF(__pyx_v_start);
+  __Pyx_XDECREF(__pyx_v_nx);
+  __Pyx_XDECREF(__pyx_v_ny);
+  __Pyx_XDECREF(__pyx_v_x0);
+  __Pyx_XDECREF(__pyx_v_y0);
+  __Pyx_XDECREF(__pyx_v_cell_size);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_csorted_x, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_csorted_y, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_csorted_values, 1);
+  __PYX_XCLEAR_MEMVIEW(&__pyx_v_cstart, 1);
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "pymica/methods/inverse_distance.pyx":605
+ * 
+ * 
+ * cdef double nearest_residue(double x, double y, const GridIndex *index,             # <<<<<<<<<<<<<<
+ *                             int k, double radius_sq, int *idx_buffer,
+ *                             double *dist_buffer, IdwPower power,
+ */
+
+static double __pyx_f_6pymica_7methods_16inverse_distance_nearest_residue(double __pyx_v_x, double __pyx_v_y, struct __pyx_t_6pymica_7methods_16inverse_distance_GridIndex const *__pyx_v_index, int __pyx_v_k, double __pyx_v_radius_sq, int *__pyx_v_idx_buffer, double *__pyx_v_dist_buffer, struct __pyx_t_6pymica_7methods_9idw_power_IdwPower __pyx_v_power, float __pyx_v_smoothing) {
+  long __pyx_v_cx;
+  long __pyx_v_cy;
+  long __pyx_v_nx;
+  long __pyx_v_ny;
+  long __pyx_v_ring;
+  long __pyx_v_ring_min;
+  long __pyx_v_ring_max;
+  long __pyx_v_bx;
+  long __pyx_v_by;
+  double __pyx_v_bound;
+  int __pyx_v_count;
+  double __pyx_v_numerator;
+  double __pyx_v_denominator;
+  double __pyx_v_dist_sq;
+  double __pyx_v_weight;
+  float __pyx_v_smoothing_sq;
+  int __pyx_v_n;
+  double __pyx_r;
+  int __pyx_t_1;
+  long __pyx_t_2;
+  long __pyx_t_3;
+  long __pyx_t_4;
+  int __pyx_t_5;
+  long __pyx_t_6;
+  int __pyx_t_7;
+  long __pyx_t_8;
+  long __pyx_t_9;
+  int __pyx_t_10;
+  int __pyx_t_11;
+
+  /* "pymica/methods/inverse_distance.pyx":611
+ *     """Residue at (x, y) from its k nearest stations, searching the buckets
+ *     in growing square rings until no closer station can be found."""
+ *     cdef long cx = <long> floor((x - index.x0) / index.cell_size)             # <<<<<<<<<<<<<<
+ *     cdef long cy = <long> floor((y - index.y0) / index.cell_size)
+ *     cdef long nx = index.nx
+ */
+  __pyx_v_cx = ((long)floor(((__pyx_v_x - __pyx_v_index->x0) / ((double)__pyx_v_index->cell_size))));
+
+  /* "pymica/methods/inverse_distance.pyx":612
+ *     in growing square rings until no closer station can be found."""
+ *     cdef long cx = <long> floor((x - index.x0) / index.cell_size)
+ *     cdef long cy = <long> floor((y - index.y0) / index.cell_size)             # <<<<<<<<<<<<<<
+ *     cdef long nx = index.nx
+ *     cdef long ny = index.ny
+ */
+  __pyx_v_cy = ((long)floor(((__pyx_v_y - __pyx_v_index->y0) / ((double)__pyx_v_index->cell_size))));
+
+  /* "pymica/methods/inverse_distance.pyx":613
+ *     cdef long cx = <long> floor((x - index.x0) / index.cell_size)
+ *     cdef long cy = <long> floor((y - index.y0) / index.cell_size)
+ *     cdef long nx = index.nx             # <<<<<<<<<<<<<<
+ *     cdef long ny = index.ny
+ *     cdef long ring, ring_min, ring_max, bx, by
+ */
+  __pyx_t_1 = __pyx_v_index->nx;
+  __pyx_v_nx = __pyx_t_1;
+
+  /* "pymica/methods/inverse_distance.pyx":614
+ *     cdef long cy = <long> floor((y - index.y0) / index.cell_size)
+ *     cdef long nx = index.nx
+ *     cdef long ny = index.ny             # <<<<<<<<<<<<<<
+ *     cdef long ring, ring_min, ring_max, bx, by
+ *     cdef double bound
+ */
+  __pyx_t_1 = __pyx_v_index->ny;
+  __pyx_v_ny = __pyx_t_1;
+
+  /* "pymica/methods/inverse_distance.pyx":617
+ *     cdef long ring, ring_min, ring_max, bx, by
+ *     cdef double bound
+ *     cdef int count = 0             # <<<<<<<<<<<<<<
+ * 
+ *     # First ring touching the bucket grid and last ring needed to cover it
+ */
+  __pyx_v_count = 0;
+
+  /* "pymica/methods/inverse_distance.pyx":620
+ * 
+ *     # First ring touching the bucket grid and last ring needed to cover it
+ *     ring_min = max(max(-cx, cx - (nx - 1)), max(-cy, cy - (ny - 1)))             # <<<<<<<<<<<<<<
+ *     if ring_min < 0:
+ *         ring_min = 0
+ */
+  __pyx_t_2 = (__pyx_v_cy - (__pyx_v_ny - 1));
+  __pyx_t_3 = (-__pyx_v_cy);
+  __pyx_t_5 = (__pyx_t_2 > __pyx_t_3);
+  if (__pyx_t_5) {
+    __pyx_t_4 = __pyx_t_2;
+  } else {
+    __pyx_t_4 = __pyx_t_3;
+  }
+  __pyx_t_2 = __pyx_t_4;
+  __pyx_t_4 = (__pyx_v_cx - (__pyx_v_nx - 1));
+  __pyx_t_3 = (-__pyx_v_cx);
+  __pyx_t_5 = (__pyx_t_4 > __pyx_t_3);
+  if (__pyx_t_5) {
+    __pyx_t_6 = __pyx_t_4;
+  } else {
+    __pyx_t_6 = __pyx_t_3;
+  }
+  __pyx_t_4 = __pyx_t_6;
+  __pyx_t_5 = (__pyx_t_2 > __pyx_t_4);
+  if (__pyx_t_5) {
+    __pyx_t_6 = __pyx_t_2;
+  } else {
+    __pyx_t_6 = __pyx_t_4;
+  }
+  __pyx_v_ring_min = __pyx_t_6;
+
+  /* "pymica/methods/inverse_distance.pyx":621
+ *     # First ring touching the bucket grid and last ring needed to cover it
+ *     ring_min = max(max(-cx, cx - (nx - 1)), max(-cy, cy - (ny - 1)))
+ *     if ring_min < 0:             # <<<<<<<<<<<<<<
+ *         ring_min = 0
+ *     ring_max = max(max(cx, nx - 1 - cx), max(cy, ny - 1 - cy))
+ */
+  __pyx_t_5 = (__pyx_v_ring_min < 0);
+  if (__pyx_t_5) {
+
+    /* "pymica/methods/inverse_distance.pyx":622
+ *     ring_min = max(max(-cx, cx - (nx - 1)), max(-cy, cy - (ny - 1)))
+ *     if ring_min < 0:
+ *         ring_min = 0             # <<<<<<<<<<<<<<
+ *     ring_max = max(max(cx, nx - 1 - cx), max(cy, ny - 1 - cy))
+ * 
+ */
+    __pyx_v_ring_min = 0;
+
+    /* "pymica/methods/inverse_distance.pyx":621
+ *     # First ring touching the bucket grid and last ring needed to cover it
+ *     ring_min = max(max(-cx, cx - (nx - 1)), max(-cy, cy - (ny - 1)))
+ *     if ring_min < 0:             # <<<<<<<<<<<<<<
+ *         ring_min = 0
+ *     ring_max = max(max(cx, nx - 1 - cx), max(cy, ny - 1 - cy))
+ */
+  }
+
+  /* "pymica/methods/inverse_distance.pyx":623
+ *     if ring_min < 0:
+ *         ring_min = 0
+ *     ring_max = max(max(cx, nx - 1 - cx), max(cy, ny - 1 - cy))             # <<<<<<<<<<<<<<
+ * 
+ *     for ring in range(ring_min, ring_max + 1):
+ */
+  __pyx_t_6 = ((__pyx_v_ny - 1) - __pyx_v_cy);
+  __pyx_t_2 = __pyx_v_cy;
+  __pyx_t_5 = (__pyx_t_6 > __pyx_t_2);
+  if (__pyx_t_5) {
+    __pyx_t_4 = __pyx_t_6;
+  } else {
+    __pyx_t_4 = __pyx_t_2;
+  }
+  __pyx_t_6 = __pyx_t_4;
+  __pyx_t_4 = ((__pyx_v_nx - 1) - __pyx_v_cx);
+  __pyx_t_2 = __pyx_v_cx;
+  __pyx_t_5 = (__pyx_t_4 > __pyx_t_2);
+  if (__pyx_t_5) {
+    __pyx_t_3 = __pyx_t_4;
+  } else {
+    __pyx_t_3 = __pyx_t_2;
+  }
+  __pyx_t_4 = __pyx_t_3;
+  __pyx_t_5 = (__pyx_t_6 > __pyx_t_4);
+  if (__pyx_t_5) {
+    __pyx_t_3 = __pyx_t_6;
+  } else {
+    __pyx_t_3 = __pyx_t_4;
+  }
+  __pyx_v_ring_max = __pyx_t_3;
+
+  /* "pymica/methods/inverse_distance.pyx":625
+ *     ring_max = max(max(cx, nx - 1 - cx), max(cy, ny - 1 - cy))
+ * 
+ *     for ring in range(ring_min, ring_max + 1):             # <<<<<<<<<<<<<<
+ *         if ring > 0:
+ *             # No station in this ring is closer than the bound
+ */
+  __pyx_t_3 = (__pyx_v_ring_max + 1);
+  __pyx_t_6 = __pyx_t_3;
+  for (__pyx_t_4 = __pyx_v_ring_min; __pyx_t_4 < __pyx_t_6; __pyx_t_4+=1) {
+    __pyx_v_ring = __pyx_t_4;
+
+    /* "pymica/methods/inverse_distance.pyx":626
+ * 
+ *     for ring in range(ring_min, ring_max + 1):
+ *         if ring > 0:             # <<<<<<<<<<<<<<
+ *             # No station in this ring is closer than the bound
+ *             bound = (ring - 1) * index.cell_size
+ */
+    __pyx_t_5 = (__pyx_v_ring > 0);
+    if (__pyx_t_5) {
+
+      /* "pymica/methods/inverse_distance.pyx":628
+ *         if ring > 0:
+ *             # No station in this ring is closer than the bound
+ *             bound = (ring - 1) * index.cell_size             # <<<<<<<<<<<<<<
+ *             bound = bound * bound
+ *             if count == k and bound >= dist_buffer[k - 1]:
+ */
+      __pyx_v_bound = ((__pyx_v_ring - 1) * __pyx_v_index->cell_size);
+
+      /* "pymica/methods/inverse_distance.pyx":629
+ *             # No station in this ring is closer than the bound
+ *             bound = (ring - 1) * index.cell_size
+ *             bound = bound * bound             # <<<<<<<<<<<<<<
+ *             if count == k and bound >= dist_buffer[k - 1]:
+ *                 break
+ */
+      __pyx_v_bound = (__pyx_v_bound * __pyx_v_bound);
+
+      /* "pymica/methods/inverse_distance.pyx":630
+ *             bound = (ring - 1) * index.cell_size
+ *             bound = bound * bound
+ *             if count == k and bound >= dist_buffer[k - 1]:             # <<<<<<<<<<<<<<
+ *                 break
+ *             if radius_sq >= 0 and bound > radius_sq:
+ */
+      __pyx_t_7 = (__pyx_v_count == __pyx_v_k);
+      if (__pyx_t_7) {
+      } else {
+        __pyx_t_5 = __pyx_t_7;
+        goto __pyx_L8_bool_binop_done;
+      }
+      __pyx_t_7 = (__pyx_v_bound >= (__pyx_v_dist_buffer[(__pyx_v_k - 1)]));
+      __pyx_t_5 = __pyx_t_7;
+      __pyx_L8_bool_binop_done:;
+      if (__pyx_t_5) {
+
+        /* "pymica/methods/inverse_distance.pyx":631
+ *             bound = bound * bound
+ *             if count == k and bound >= dist_buffer[k - 1]:
+ *                 break             # <<<<<<<<<<<<<<
+ *             if radius_sq >= 0 and bound > radius_sq:
+ *                 break
+ */
+        goto __pyx_L5_break;
+
+        /* "pymica/methods/inverse_distance.pyx":630
+ *             bound = (ring - 1) * index.cell_size
+ *             bound = bound * bound
+ *             if count == k and bound >= dist_buffer[k - 1]:             # <<<<<<<<<<<<<<
+ *                 break
+ *             if radius_sq >= 0 and bound > radius_sq:
+ */
+      }
+
+      /* "pymica/methods/inverse_distance.pyx":632
+ *             if count == k and bound >= dist_buffer[k - 1]:
+ *                 break
+ *             if radius_sq >= 0 and bound > radius_sq:             # <<<<<<<<<<<<<<
+ *                 break
+ * 
+ */
+      __pyx_t_7 = (__pyx_v_radius_sq >= 0.0);
+      if (__pyx_t_7) {
+      } else {
+        __pyx_t_5 = __pyx_t_7;
+        goto __pyx_L11_bool_binop_done;
+      }
+      __pyx_t_7 = (__pyx_v_bound > __pyx_v_radius_sq);
+      __pyx_t_5 = __pyx_t_7;
+      __pyx_L11_bool_binop_done:;
+      if (__pyx_t_5) {
+
+        /* "pymica/methods/inverse_distance.pyx":633
+ *                 break
+ *             if radius_sq >= 0 and bound > radius_sq:
+ *                 break             # <<<<<<<<<<<<<<
+ * 
+ *         if ring == 0:
+ */
+        goto __pyx_L5_break;
+
+        /* "pymica/methods/inverse_distance.pyx":632
+ *             if count == k and bound >= dist_buffer[k - 1]:
+ *                 break
+ *             if radius_sq >= 0 and bound > radius_sq:             # <<<<<<<<<<<<<<
+ *                 break
+ * 
+ */
+      }
+
+      /* "pymica/methods/inverse_distance.pyx":626
+ * 
+ *     for ring in range(ring_min, ring_max + 1):
+ *         if ring > 0:             # <<<<<<<<<<<<<<
+ *             # No station in this ring is closer than the bound
+ *             bound = (ring - 1) * index.cell_size
+ */
+    }
+
+    /* "pymica/methods/inverse_distance.pyx":635
+ *                 break
+ * 
+ *         if ring == 0:             # <<<<<<<<<<<<<<
+ *             count = scan_bucket(x, y, index, cx, cy, k, radius_sq,
+ *                                 idx_buffer, dist_buffer, count)
+ */
+    __pyx_t_5 = (__pyx_v_ring == 0);
+    if (__pyx_t_5) {
+
+      /* "pymica/methods/inverse_distance.pyx":636
+ * 
+ *         if ring == 0:
+ *             count = scan_bucket(x, y, index, cx, cy, k, radius_sq,             # <<<<<<<<<<<<<<
+ *                                 idx_buffer, dist_buffer, count)
+ *             continue
+ */
+      __pyx_v_count = __pyx_f_6pymica_7methods_16inverse_distance_scan_bucket(__pyx_v_x, __pyx_v_y, __pyx_v_index, __pyx_v_cx, __pyx_v_cy, __pyx_v_k, __pyx_v_radius_sq, __pyx_v_idx_buffer, __pyx_v_dist_buffer, __pyx_v_count);
+
+      /* "pymica/methods/inverse_distance.pyx":638
+ *             count = scan_bucket(x, y, index, cx, cy, k, radius_sq,
+ *                                 idx_buffer, dist_buffer, count)
+ *             continue             # <<<<<<<<<<<<<<
+ * 
+ *         for bx in range(cx - ring, cx + ring + 1):
+ */
+      goto __pyx_L4_continue;
+
+      /* "pymica/methods/inverse_distance.pyx":635
+ *                 break
+ * 
+ *         if ring == 0:             # <<<<<<<<<<<<<<
+ *             count = scan_bucket(x, y, index, cx, cy, k, radius_sq,
+ *                                 idx_buffer, dist_buffer, count)
+ */
+    }
+
+    /* "pymica/methods/inverse_distance.pyx":640
+ *             continue
+ * 
+ *         for bx in range(cx - ring, cx + ring + 1):             # <<<<<<<<<<<<<<
+ *             count = scan_bucket(x, y, index, bx, cy - ring, k, radius_sq,
+ *                                 idx_buffer, dist_buffer, count)
+ */
+    __pyx_t_2 = ((__pyx_v_cx + __pyx_v_ring) + 1);
+    __pyx_t_8 = __pyx_t_2;
+    for (__pyx_t_9 = (__pyx_v_cx - __pyx_v_ring); __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
+      __pyx_v_bx = __pyx_t_9;
+
+      /* "pymica/methods/inverse_distance.pyx":641
+ * 
+ *         for bx in range(cx - ring, cx + ring + 1):
+ *             count = scan_bucket(x, y, index, bx, cy - ring, k, radius_sq,             # <<<<<<<<<<<<<<
+ *                                 idx_buffer, dist_buffer, count)
+ *             count = scan_bucket(x, y, index, bx, cy + ring, k, radius_sq,
+ */
+      __pyx_v_count = __pyx_f_6pymica_7methods_16inverse_distance_scan_bucket(__pyx_v_x, __pyx_v_y, __pyx_v_index, __pyx_v_bx, (__pyx_v_cy - __pyx_v_ring), __pyx_v_k, __pyx_v_radius_sq, __pyx_v_idx_buffer, __pyx_v_dist_buffer, __pyx_v_count);
+
+      /* "pymica/methods/inverse_distance.pyx":643
+ *             count = scan_bucket(x, y, index, bx, cy - ring, k, radius_sq,
+ *                                 idx_buffer, dist_buffer, count)
+ *             count = scan_bucket(x, y, index, bx, cy + ring, k, radius_sq,             # <<<<<<<<<<<<<<
+ *                                 idx_buffer, dist_buffer, count)
+ *         for by in range(cy - ring + 1, cy + ring):
+ */
+      __pyx_v_count = __pyx_f_6pymica_7methods_16inverse_distance_scan_bucket(__pyx_v_x, __pyx_v_y, __pyx_v_index, __pyx_v_bx, (__pyx_v_cy + __pyx_v_ring), __pyx_v_k, __pyx_v_radius_sq, __pyx_v_idx_buffer, __pyx_v_dist_buffer, __pyx_v_count);
+    }
+
+    /* "pymica/methods/inverse_distance.pyx":645
+ *             count = scan_bucket(x, y, index, bx, cy + ring, k, radius_sq,
+ *                                 idx_buffer, dist_buffer, count)
+ *         for by in range(cy - ring + 1, cy + ring):             # <<<<<<<<<<<<<<
+ *             count = scan_bucket(x, y, index, cx - ring, by, k, radius_sq,
+ *                                 idx_buffer, dist_buffer, count)
+ */
+    __pyx_t_2 = (__pyx_v_cy + __pyx_v_ring);
+    __pyx_t_8 = __pyx_t_2;
+    for (__pyx_t_9 = ((__pyx_v_cy - __pyx_v_ring) + 1); __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
+      __pyx_v_by = __pyx_t_9;
+
+      /* "pymica/methods/inverse_distance.pyx":646
+ *                                 idx_buffer, dist_buffer, count)
+ *         for by in range(cy - ring + 1, cy + ring):
+ *             count = scan_bucket(x, y, index, cx - ring, by, k, radius_sq,             # <<<<<<<<<<<<<<
+ *                                 idx_buffer, dist_buffer, count)
+ *             count = scan_bucket(x, y, index, cx + ring, by, k, radius_sq,
+ */
+      __pyx_v_count = __pyx_f_6pymica_7methods_16inverse_distance_scan_bucket(__pyx_v_x, __pyx_v_y, __pyx_v_index, (__pyx_v_cx - __pyx_v_ring), __pyx_v_by, __pyx_v_k, __pyx_v_radius_sq, __pyx_v_idx_buffer, __pyx_v_dist_buffer, __pyx_v_count);
+
+      /* "pymica/methods/inverse_distance.pyx":648
+ *             count = scan_bucket(x, y, index, cx - ring, by, k, radius_sq,
+ *                                 idx_buffer, dist_buffer, count)
+ *             count = scan_bucket(x, y, index, cx + ring, by, k, radius_sq,             # <<<<<<<<<<<<<<
+ *                                 idx_buffer, dist_buffer, count)
+ * 
+ */
+      __pyx_v_count = __pyx_f_6pymica_7methods_16inverse_distance_scan_bucket(__pyx_v_x, __pyx_v_y, __pyx_v_index, (__pyx_v_cx + __pyx_v_ring), __pyx_v_by, __pyx_v_k, __pyx_v_radius_sq, __pyx_v_idx_buffer, __pyx_v_dist_buffer, __pyx_v_count);
+    }
+    __pyx_L4_continue:;
+  }
+  __pyx_L5_break:;
+
+  /* "pymica/methods/inverse_distance.pyx":651
+ *                                 idx_buffer, dist_buffer, count)
+ * 
+ *     if count == 0:             # <<<<<<<<<<<<<<
+ *         return 0.0
+ * 
  */
-  __pyx_t_4 = __Pyx_PyInt_As_int(PyList_GET_ITEM(__pyx_v_size, 0)); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 62, __pyx_L1_error)
-  __pyx_v_ysize = __pyx_t_4;
+  __pyx_t_5 = (__pyx_v_count == 0);
+  if (__pyx_t_5) {
 
-  /* "pymica/methods/inverse_distance.pyx":66
- *     cdef double x
+    /* "pymica/methods/inverse_distance.pyx":652
  * 
- *     cdef array.array geotransform0 = array.array('d', geotransform)             # <<<<<<<<<<<<<<
- *     cdef double[:] cgeotransform = geotransform0
+ *     if count == 0:
+ *         return 0.0             # <<<<<<<<<<<<<<
  * 
+ *     cdef double numerator = 0.0
  */
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 66, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_INCREF(__pyx_n_s_d);
-  __Pyx_GIVEREF(__pyx_n_s_d);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_n_s_d)) __PYX_ERR(0, 66, __pyx_L1_error);
-  __Pyx_INCREF(__pyx_v_geotransform);
-  __Pyx_GIVEREF(__pyx_v_geotransform);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_v_geotransform)) __PYX_ERR(0, 66, __pyx_L1_error);
-  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_7cpython_5array_array), __pyx_t_2, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 66, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_v_geotransform0 = ((arrayobject *)__pyx_t_1);
-  __pyx_t_1 = 0;
+    __pyx_r = 0.0;
+    goto __pyx_L0;
 
-  /* "pymica/methods/inverse_distance.pyx":67
+    /* "pymica/methods/inverse_distance.pyx":651
+ *                                 idx_buffer, dist_buffer, count)
  * 
- *     cdef array.array geotransform0 = array.array('d', geotransform)
- *     cdef double[:] cgeotransform = geotransform0             # <<<<<<<<<<<<<<
+ *     if count == 0:             # <<<<<<<<<<<<<<
+ *         return 0.0
  * 
- *     for j in range(ysize):
  */
-  __pyx_t_5 = __Pyx_PyObject_to_MemoryviewSlice_ds_double(((PyObject *)__pyx_v_geotransform0), PyBUF_WRITABLE); if (unlikely(!__pyx_t_5.memview)) __PYX_ERR(0, 67, __pyx_L1_error)
-  __pyx_v_cgeotransform = __pyx_t_5;
-  __pyx_t_5.memview = NULL;
-  __pyx_t_5.data = NULL;
+  }
 
-  /* "pymica/methods/inverse_distance.pyx":69
- *     cdef double[:] cgeotransform = geotransform0
+  /* "pymica/methods/inverse_distance.pyx":654
+ *         return 0.0
  * 
- *     for j in range(ysize):             # <<<<<<<<<<<<<<
- *         y = cgeotransform[3] + j * cgeotransform[5]
- *         for i in range(xsize):
+ *     cdef double numerator = 0.0             # <<<<<<<<<<<<<<
+ *     cdef double denominator = 0.0
+ *     cdef double dist_sq, weight
  */
-  __pyx_t_4 = __pyx_v_ysize;
-  __pyx_t_7 = __pyx_t_4;
-  for (__pyx_t_8 = 0; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
-    __pyx_v_j = __pyx_t_8;
+  __pyx_v_numerator = 0.0;
 
-    /* "pymica/methods/inverse_distance.pyx":70
+  /* "pymica/methods/inverse_distance.pyx":655
  * 
- *     for j in range(ysize):
- *         y = cgeotransform[3] + j * cgeotransform[5]             # <<<<<<<<<<<<<<
- *         for i in range(xsize):
- *             x = cgeotransform[0] + i * cgeotransform[1]
+ *     cdef double numerator = 0.0
+ *     cdef double denominator = 0.0             # <<<<<<<<<<<<<<
+ *     cdef double dist_sq, weight
+ *     cdef float smoothing_sq = smoothing * smoothing
  */
-    __pyx_t_9 = 3;
-    __pyx_t_10 = 5;
-    __pyx_v_y = ((*((double *) ( /* dim=0 */ (__pyx_v_cgeotransform.data + __pyx_t_9 * __pyx_v_cgeotransform.strides[0]) ))) + (__pyx_v_j * (*((double *) ( /* dim=0 */ (__pyx_v_cgeotransform.data + __pyx_t_10 * __pyx_v_cgeotransform.strides[0]) )))));
+  __pyx_v_denominator = 0.0;
 
-    /* "pymica/methods/inverse_distance.pyx":71
- *     for j in range(ysize):
- *         y = cgeotransform[3] + j * cgeotransform[5]
- *         for i in range(xsize):             # <<<<<<<<<<<<<<
- *             x = cgeotransform[0] + i * cgeotransform[1]
- *             cda[i + j * xsize] = point_residue(x, y, cxpos, cypos, cvalues, N, power, smoothing)
+  /* "pymica/methods/inverse_distance.pyx":657
+ *     cdef double denominator = 0.0
+ *     cdef double dist_sq, weight
+ *     cdef float smoothing_sq = smoothing * smoothing             # <<<<<<<<<<<<<<
+ *     cdef int n
+ * 
  */
-    __pyx_t_11 = __pyx_v_xsize;
-    __pyx_t_12 = __pyx_t_11;
-    for (__pyx_t_13 = 0; __pyx_t_13 < __pyx_t_12; __pyx_t_13+=1) {
-      __pyx_v_i = __pyx_t_13;
+  __pyx_v_smoothing_sq = (__pyx_v_smoothing * __pyx_v_smoothing);
 
-      /* "pymica/methods/inverse_distance.pyx":72
- *         y = cgeotransform[3] + j * cgeotransform[5]
- *         for i in range(xsize):
- *             x = cgeotransform[0] + i * cgeotransform[1]             # <<<<<<<<<<<<<<
- *             cda[i + j * xsize] = point_residue(x, y, cxpos, cypos, cvalues, N, power, smoothing)
+  /* "pymica/methods/inverse_distance.pyx":660
+ *     cdef int n
  * 
+ *     for n in range(count):             # <<<<<<<<<<<<<<
+ *         dist_sq = dist_buffer[n] + smoothing_sq
+ *         if dist_sq < 1e-11:
  */
-      __pyx_t_10 = 0;
-      __pyx_t_9 = 1;
-      __pyx_v_x = ((*((double *) ( /* dim=0 */ (__pyx_v_cgeotransform.data + __pyx_t_10 * __pyx_v_cgeotransform.strides[0]) ))) + (__pyx_v_i * (*((double *) ( /* dim=0 */ (__pyx_v_cgeotransform.data + __pyx_t_9 * __pyx_v_cgeotransform.strides[0]) )))));
+  __pyx_t_1 = __pyx_v_count;
+  __pyx_t_10 = __pyx_t_1;
+  for (__pyx_t_11 = 0; __pyx_t_11 < __pyx_t_10; __pyx_t_11+=1) {
+    __pyx_v_n = __pyx_t_11;
 
-      /* "pymica/methods/inverse_distance.pyx":73
- *         for i in range(xsize):
- *             x = cgeotransform[0] + i * cgeotransform[1]
- *             cda[i + j * xsize] = point_residue(x, y, cxpos, cypos, cvalues, N, power, smoothing)             # <<<<<<<<<<<<<<
+    /* "pymica/methods/inverse_distance.pyx":661
  * 
- *     data_array = np.array(cda)
+ *     for n in range(count):
+ *         dist_sq = dist_buffer[n] + smoothing_sq             # <<<<<<<<<<<<<<
+ *         if dist_sq < 1e-11:
+ *             return index.values[idx_buffer[n]]
+ */
+    __pyx_v_dist_sq = ((__pyx_v_dist_buffer[__pyx_v_n]) + __pyx_v_smoothing_sq);
+
+    /* "pymica/methods/inverse_distance.pyx":662
+ *     for n in range(count):
+ *         dist_sq = dist_buffer[n] + smoothing_sq
+ *         if dist_sq < 1e-11:             # <<<<<<<<<<<<<<
+ *             return index.values[idx_buffer[n]]
+ *         weight = station_weight(dist_sq, power)
+ */
+    __pyx_t_5 = (__pyx_v_dist_sq < 1e-11);
+    if (__pyx_t_5) {
+
+      /* "pymica/methods/inverse_distance.pyx":663
+ *         dist_sq = dist_buffer[n] + smoothing_sq
+ *         if dist_sq < 1e-11:
+ *             return index.values[idx_buffer[n]]             # <<<<<<<<<<<<<<
+ *         weight = station_weight(dist_sq, power)
+ *         numerator += index.values[idx_buffer[n]] * weight
+ */
+      __pyx_r = (__pyx_v_index->values[(__pyx_v_idx_buffer[__pyx_v_n])]);
+      goto __pyx_L0;
+
+      /* "pymica/methods/inverse_distance.pyx":662
+ *     for n in range(count):
+ *         dist_sq = dist_buffer[n] + smoothing_sq
+ *         if dist_sq < 1e-11:             # <<<<<<<<<<<<<<
+ *             return index.values[idx_buffer[n]]
+ *         weight = station_weight(dist_sq, power)
  */
-      __pyx_t_14 = __Pyx_PyInt_As_int(__pyx_v_power); if (unlikely((__pyx_t_14 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 73, __pyx_L1_error)
-      __pyx_t_15 = __pyx_f_6pymica_7methods_16inverse_distance_point_residue(__pyx_v_x, __pyx_v_y, __pyx_v_cxpos, __pyx_v_cypos, __pyx_v_cvalues, __pyx_v_N, __pyx_t_14, __pyx_v_smoothing); if (unlikely(__pyx_t_15 == ((float)-1) && PyErr_Occurred())) __PYX_ERR(0, 73, __pyx_L1_error)
-      __pyx_t_9 = (__pyx_v_i + (__pyx_v_j * __pyx_v_xsize));
-      *((double *) ( /* dim=0 */ (__pyx_v_cda.data + __pyx_t_9 * __pyx_v_cda.strides[0]) )) = __pyx_t_15;
     }
-  }
 
-  /* "pymica/methods/inverse_distance.pyx":75
- *             cda[i + j * xsize] = point_residue(x, y, cxpos, cypos, cvalues, N, power, smoothing)
+    /* "pymica/methods/inverse_distance.pyx":664
+ *         if dist_sq < 1e-11:
+ *             return index.values[idx_buffer[n]]
+ *         weight = station_weight(dist_sq, power)             # <<<<<<<<<<<<<<
+ *         numerator += index.values[idx_buffer[n]] * weight
+ *         denominator += weight
+ */
+    __pyx_v_weight = __pyx_f_6pymica_7methods_9idw_power_station_weight(__pyx_v_dist_sq, __pyx_v_power);
+
+    /* "pymica/methods/inverse_distance.pyx":665
+ *             return index.values[idx_buffer[n]]
+ *         weight = station_weight(dist_sq, power)
+ *         numerator += index.values[idx_buffer[n]] * weight             # <<<<<<<<<<<<<<
+ *         denominator += weight
  * 
- *     data_array = np.array(cda)             # <<<<<<<<<<<<<<
- *     return data_array.reshape(size)
+ */
+    __pyx_v_numerator = (__pyx_v_numerator + ((__pyx_v_index->values[(__pyx_v_idx_buffer[__pyx_v_n])]) * __pyx_v_weight));
+
+    /* "pymica/methods/inverse_distance.pyx":666
+ *         weight = station_weight(dist_sq, power)
+ *         numerator += index.values[idx_buffer[n]] * weight
+ *         denominator += weight             # <<<<<<<<<<<<<<
  * 
+ *     return numerator / denominator
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 75, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_16 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_array); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 75, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_16);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __pyx_memoryview_fromslice(__pyx_v_cda, 1, (PyObject *(*)(char *)) __pyx_memview_get_double, (int (*)(char *, PyObject *)) __pyx_memview_set_double, 0);; if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 75, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_17 = NULL;
-  __pyx_t_18 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_16))) {
-    __pyx_t_17 = PyMethod_GET_SELF(__pyx_t_16);
-    if (likely(__pyx_t_17)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_16);
-      __Pyx_INCREF(__pyx_t_17);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_16, function);
-      __pyx_t_18 = 1;
-    }
-  }
-  #endif
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_17, __pyx_t_2};
-    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_16, __pyx_callargs+1-__pyx_t_18, 1+__pyx_t_18);
-    __Pyx_XDECREF(__pyx_t_17); __pyx_t_17 = 0;
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 75, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
+    __pyx_v_denominator = (__pyx_v_denominator + __pyx_v_weight);
   }
-  __pyx_v_data_array = __pyx_t_1;
-  __pyx_t_1 = 0;
 
-  /* "pymica/methods/inverse_distance.pyx":76
+  /* "pymica/methods/inverse_distance.pyx":668
+ *         denominator += weight
  * 
- *     data_array = np.array(cda)
- *     return data_array.reshape(size)             # <<<<<<<<<<<<<<
+ *     return numerator / denominator             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_16 = __Pyx_PyObject_GetAttrStr(__pyx_v_data_array, __pyx_n_s_reshape); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 76, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_16);
-  __pyx_t_2 = NULL;
-  __pyx_t_18 = 0;
-  #if CYTHON_UNPACK_METHODS
-  if (likely(PyMethod_Check(__pyx_t_16))) {
-    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_16);
-    if (likely(__pyx_t_2)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_16);
-      __Pyx_INCREF(__pyx_t_2);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_16, function);
-      __pyx_t_18 = 1;
-    }
-  }
-  #endif
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_2, __pyx_v_size};
-    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_16, __pyx_callargs+1-__pyx_t_18, 1+__pyx_t_18);
-    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 76, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
-  }
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
+  __pyx_r = (__pyx_v_numerator / __pyx_v_denominator);
   goto __pyx_L0;
 
-  /* "pymica/methods/inverse_distance.pyx":18
- * ctypedef np.float64_t DTYPE_t
+  /* "pymica/methods/inverse_distance.pyx":605
  * 
- * def inverse_distance(data: List[Dict[str, float]],             # <<<<<<<<<<<<<<
- *                      size: List[int], geotransform: List[int],
- *                      power: int=2, smoothing: float=0.0):
+ * 
+ * cdef double nearest_residue(double x, double y, const GridIndex *index,             # <<<<<<<<<<<<<<
+ *                             int k, double radius_sq, int *idx_buffer,
+ *                             double *dist_buffer, IdwPower power,
  */
 
   /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __PYX_XCLEAR_MEMVIEW(&__pyx_t_5, 1);
-  __Pyx_XDECREF(__pyx_t_16);
-  __Pyx_XDECREF(__pyx_t_17);
-  __Pyx_AddTraceback("pymica.methods.inverse_distance.inverse_distance", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
   __pyx_L0:;
-  __Pyx_XDECREF((PyObject *)__pyx_v_da);
-  __PYX_XCLEAR_MEMVIEW(&__pyx_v_cda, 1);
-  __Pyx_XDECREF(__pyx_v_xpos0);
-  __Pyx_XDECREF(__pyx_v_ypos0);
-  __Pyx_XDECREF(__pyx_v_values0);
-  __Pyx_XDECREF(__pyx_v_d);
-  __Pyx_XDECREF((PyObject *)__pyx_v_xpos);
-  __PYX_XCLEAR_MEMVIEW(&__pyx_v_cxpos, 1);
-  __Pyx_XDECREF((PyObject *)__pyx_v_ypos);
-  __PYX_XCLEAR_MEMVIEW(&__pyx_v_cypos, 1);
-  __Pyx_XDECREF((PyObject *)__pyx_v_values);
-  __PYX_XCLEAR_MEMVIEW(&__pyx_v_cvalues, 1);
-  __Pyx_XDECREF((PyObject *)__pyx_v_geotransform0);
-  __PYX_XCLEAR_MEMVIEW(&__pyx_v_cgeotransform, 1);
-  __Pyx_XDECREF(__pyx_v_data_array);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "pymica/methods/inverse_distance.pyx":79
+/* "pymica/methods/inverse_distance.pyx":671
  * 
  * 
- * cdef inline float point_residue(double x, double y,             # <<<<<<<<<<<<<<
- *                                 double[:] xpos, double[:] ypos,
- *                                 double[:] values, int N,
+ * cdef inline int scan_bucket(double x, double y, const GridIndex *index,             # <<<<<<<<<<<<<<
+ *                             long bx, long by, int k, double radius_sq,
+ *                             int *idx_buffer, double *dist_buffer,
  */
 
-static CYTHON_INLINE float __pyx_f_6pymica_7methods_16inverse_distance_point_residue(double __pyx_v_x, double __pyx_v_y, __Pyx_memviewslice __pyx_v_xpos, __Pyx_memviewslice __pyx_v_ypos, __Pyx_memviewslice __pyx_v_values, int __pyx_v_N, int __pyx_v_power, float __pyx_v_smoothing) {
-  double __pyx_v_numerator;
-  double __pyx_v_denominator;
+static CYTHON_INLINE int __pyx_f_6pymica_7methods_16inverse_distance_scan_bucket(double __pyx_v_x, double __pyx_v_y, struct __pyx_t_6pymica_7methods_16inverse_distance_GridIndex const *__pyx_v_index, long __pyx_v_bx, long __pyx_v_by, int __pyx_v_k, double __pyx_v_radius_sq, int *__pyx_v_idx_buffer, double *__pyx_v_dist_buffer, int __pyx_v_count) {
+  int __pyx_v_s;
+  int __pyx_v_n;
+  int __pyx_v_bucket;
   double __pyx_v_dx;
   double __pyx_v_dy;
   double __pyx_v_dist_sq;
-  double __pyx_v_weight;
-  int __pyx_v_i;
-  float __pyx_r;
+  int __pyx_r;
   int __pyx_t_1;
   int __pyx_t_2;
   int __pyx_t_3;
-  Py_ssize_t __pyx_t_4;
+  int __pyx_t_4;
   int __pyx_t_5;
-  double __pyx_t_6;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  #ifdef WITH_THREAD
-  PyGILState_STATE __pyx_gilstate_save;
-  #endif
 
-  /* "pymica/methods/inverse_distance.pyx":83
- *                                 double[:] values, int N,
- *                                 int power, float smoothing) nogil:
- *     cdef double numerator = 0.0             # <<<<<<<<<<<<<<
- *     cdef double denominator = 0.0
- *     cdef double dx, dy, dist_sq, weight
+  /* "pymica/methods/inverse_distance.pyx":680
+ *     cdef double dx, dy, dist_sq
+ * 
+ *     if bx < 0 or by < 0 or bx >= index.nx or by >= index.ny:             # <<<<<<<<<<<<<<
+ *         return count
+ * 
  */
-  __pyx_v_numerator = 0.0;
+  __pyx_t_2 = (__pyx_v_bx < 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_v_by < 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_v_bx >= __pyx_v_index->nx);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_v_by >= __pyx_v_index->ny);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
 
-  /* "pymica/methods/inverse_distance.pyx":84
- *                                 int power, float smoothing) nogil:
- *     cdef double numerator = 0.0
- *     cdef double denominator = 0.0             # <<<<<<<<<<<<<<
- *     cdef double dx, dy, dist_sq, weight
- *     cdef int i
+    /* "pymica/methods/inverse_distance.pyx":681
+ * 
+ *     if bx < 0 or by < 0 or bx >= index.nx or by >= index.ny:
+ *         return count             # <<<<<<<<<<<<<<
+ * 
+ *     bucket = by * index.nx + bx
  */
-  __pyx_v_denominator = 0.0;
+    __pyx_r = __pyx_v_count;
+    goto __pyx_L0;
 
-  /* "pymica/methods/inverse_distance.pyx":88
- *     cdef int i
+    /* "pymica/methods/inverse_distance.pyx":680
+ *     cdef double dx, dy, dist_sq
  * 
- *     smoothing = smoothing * smoothing  # square once             # <<<<<<<<<<<<<<
+ *     if bx < 0 or by < 0 or bx >= index.nx or by >= index.ny:             # <<<<<<<<<<<<<<
+ *         return count
  * 
- *     for i in range(N):
  */
-  __pyx_v_smoothing = (__pyx_v_smoothing * __pyx_v_smoothing);
+  }
 
-  /* "pymica/methods/inverse_distance.pyx":90
- *     smoothing = smoothing * smoothing  # square once
+  /* "pymica/methods/inverse_distance.pyx":683
+ *         return count
  * 
- *     for i in range(N):             # <<<<<<<<<<<<<<
- *         dx = x - xpos[i]
- *         dy = y - ypos[i]
+ *     bucket = by * index.nx + bx             # <<<<<<<<<<<<<<
+ *     for s in range(index.start[bucket], index.start[bucket + 1]):
+ *         dx = x - index.xpos[s]
  */
-  __pyx_t_1 = __pyx_v_N;
-  __pyx_t_2 = __pyx_t_1;
-  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
-    __pyx_v_i = __pyx_t_3;
+  __pyx_v_bucket = ((__pyx_v_by * __pyx_v_index->nx) + __pyx_v_bx);
 
-    /* "pymica/methods/inverse_distance.pyx":91
+  /* "pymica/methods/inverse_distance.pyx":684
  * 
- *     for i in range(N):
- *         dx = x - xpos[i]             # <<<<<<<<<<<<<<
- *         dy = y - ypos[i]
- *         dist_sq = dx * dx + dy * dy + smoothing
+ *     bucket = by * index.nx + bx
+ *     for s in range(index.start[bucket], index.start[bucket + 1]):             # <<<<<<<<<<<<<<
+ *         dx = x - index.xpos[s]
+ *         dy = y - index.ypos[s]
  */
-    __pyx_t_4 = __pyx_v_i;
-    __pyx_v_dx = (__pyx_v_x - (*((double *) ( /* dim=0 */ (__pyx_v_xpos.data + __pyx_t_4 * __pyx_v_xpos.strides[0]) ))));
+  __pyx_t_3 = (__pyx_v_index->start[(__pyx_v_bucket + 1)]);
+  __pyx_t_4 = __pyx_t_3;
+  for (__pyx_t_5 = (__pyx_v_index->start[__pyx_v_bucket]); __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+    __pyx_v_s = __pyx_t_5;
+
+    /* "pymica/methods/inverse_distance.pyx":685
+ *     bucket = by * index.nx + bx
+ *     for s in range(index.start[bucket], index.start[bucket + 1]):
+ *         dx = x - index.xpos[s]             # <<<<<<<<<<<<<<
+ *         dy = y - index.ypos[s]
+ *         dist_sq = dx * dx + dy * dy
+ */
+    __pyx_v_dx = (__pyx_v_x - (__pyx_v_index->xpos[__pyx_v_s]));
+
+    /* "pymica/methods/inverse_distance.pyx":686
+ *     for s in range(index.start[bucket], index.start[bucket + 1]):
+ *         dx = x - index.xpos[s]
+ *         dy = y - index.ypos[s]             # <<<<<<<<<<<<<<
+ *         dist_sq = dx * dx + dy * dy
+ *         if radius_sq >= 0 and dist_sq > radius_sq:
+ */
+    __pyx_v_dy = (__pyx_v_y - (__pyx_v_index->ypos[__pyx_v_s]));
+
+    /* "pymica/methods/inverse_distance.pyx":687
+ *         dx = x - index.xpos[s]
+ *         dy = y - index.ypos[s]
+ *         dist_sq = dx * dx + dy * dy             # <<<<<<<<<<<<<<
+ *         if radius_sq >= 0 and dist_sq > radius_sq:
+ *             continue
+ */
+    __pyx_v_dist_sq = ((__pyx_v_dx * __pyx_v_dx) + (__pyx_v_dy * __pyx_v_dy));
+
+    /* "pymica/methods/inverse_distance.pyx":688
+ *         dy = y - index.ypos[s]
+ *         dist_sq = dx * dx + dy * dy
+ *         if radius_sq >= 0 and dist_sq > radius_sq:             # <<<<<<<<<<<<<<
+ *             continue
+ *         if count == k and dist_sq >= dist_buffer[k - 1]:
+ */
+    __pyx_t_2 = (__pyx_v_radius_sq >= 0.0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L11_bool_binop_done;
+    }
+    __pyx_t_2 = (__pyx_v_dist_sq > __pyx_v_radius_sq);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L11_bool_binop_done:;
+    if (__pyx_t_1) {
 
-    /* "pymica/methods/inverse_distance.pyx":92
- *     for i in range(N):
- *         dx = x - xpos[i]
- *         dy = y - ypos[i]             # <<<<<<<<<<<<<<
- *         dist_sq = dx * dx + dy * dy + smoothing
- * 
+      /* "pymica/methods/inverse_distance.pyx":689
+ *         dist_sq = dx * dx + dy * dy
+ *         if radius_sq >= 0 and dist_sq > radius_sq:
+ *             continue             # <<<<<<<<<<<<<<
+ *         if count == k and dist_sq >= dist_buffer[k - 1]:
+ *             continue
  */
-    __pyx_t_4 = __pyx_v_i;
-    __pyx_v_dy = (__pyx_v_y - (*((double *) ( /* dim=0 */ (__pyx_v_ypos.data + __pyx_t_4 * __pyx_v_ypos.strides[0]) ))));
+      goto __pyx_L8_continue;
 
-    /* "pymica/methods/inverse_distance.pyx":93
- *         dx = x - xpos[i]
- *         dy = y - ypos[i]
- *         dist_sq = dx * dx + dy * dy + smoothing             # <<<<<<<<<<<<<<
- * 
- *         if dist_sq < 1e-11:
+      /* "pymica/methods/inverse_distance.pyx":688
+ *         dy = y - index.ypos[s]
+ *         dist_sq = dx * dx + dy * dy
+ *         if radius_sq >= 0 and dist_sq > radius_sq:             # <<<<<<<<<<<<<<
+ *             continue
+ *         if count == k and dist_sq >= dist_buffer[k - 1]:
  */
-    __pyx_v_dist_sq = (((__pyx_v_dx * __pyx_v_dx) + (__pyx_v_dy * __pyx_v_dy)) + __pyx_v_smoothing);
+    }
 
-    /* "pymica/methods/inverse_distance.pyx":95
- *         dist_sq = dx * dx + dy * dy + smoothing
- * 
- *         if dist_sq < 1e-11:             # <<<<<<<<<<<<<<
- *             return values[i]
+    /* "pymica/methods/inverse_distance.pyx":690
+ *         if radius_sq >= 0 and dist_sq > radius_sq:
+ *             continue
+ *         if count == k and dist_sq >= dist_buffer[k - 1]:             # <<<<<<<<<<<<<<
+ *             continue
  * 
  */
-    __pyx_t_5 = (__pyx_v_dist_sq < 1e-11);
-    if (__pyx_t_5) {
+    __pyx_t_2 = (__pyx_v_count == __pyx_v_k);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L14_bool_binop_done;
+    }
+    __pyx_t_2 = (__pyx_v_dist_sq >= (__pyx_v_dist_buffer[(__pyx_v_k - 1)]));
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L14_bool_binop_done:;
+    if (__pyx_t_1) {
 
-      /* "pymica/methods/inverse_distance.pyx":96
+      /* "pymica/methods/inverse_distance.pyx":691
+ *             continue
+ *         if count == k and dist_sq >= dist_buffer[k - 1]:
+ *             continue             # <<<<<<<<<<<<<<
  * 
- *         if dist_sq < 1e-11:
- *             return values[i]             # <<<<<<<<<<<<<<
- * 
- *         if power == 2:
+ *         if count < k:
  */
-      __pyx_t_4 = __pyx_v_i;
-      __pyx_r = (*((double *) ( /* dim=0 */ (__pyx_v_values.data + __pyx_t_4 * __pyx_v_values.strides[0]) )));
-      goto __pyx_L0;
+      goto __pyx_L8_continue;
 
-      /* "pymica/methods/inverse_distance.pyx":95
- *         dist_sq = dx * dx + dy * dy + smoothing
- * 
- *         if dist_sq < 1e-11:             # <<<<<<<<<<<<<<
- *             return values[i]
+      /* "pymica/methods/inverse_distance.pyx":690
+ *         if radius_sq >= 0 and dist_sq > radius_sq:
+ *             continue
+ *         if count == k and dist_sq >= dist_buffer[k - 1]:             # <<<<<<<<<<<<<<
+ *             continue
  * 
  */
     }
 
-    /* "pymica/methods/inverse_distance.pyx":98
- *             return values[i]
+    /* "pymica/methods/inverse_distance.pyx":693
+ *             continue
  * 
- *         if power == 2:             # <<<<<<<<<<<<<<
- *             weight = 1.0 / dist_sq
- *         else:
+ *         if count < k:             # <<<<<<<<<<<<<<
+ *             count = count + 1
+ *         n = count - 1
  */
-    __pyx_t_5 = (__pyx_v_power == 2);
-    if (__pyx_t_5) {
+    __pyx_t_1 = (__pyx_v_count < __pyx_v_k);
+    if (__pyx_t_1) {
 
-      /* "pymica/methods/inverse_distance.pyx":99
+      /* "pymica/methods/inverse_distance.pyx":694
  * 
- *         if power == 2:
- *             weight = 1.0 / dist_sq             # <<<<<<<<<<<<<<
- *         else:
- *             weight = 1.0 / fast_pow(dist_sq, power // 2)
+ *         if count < k:
+ *             count = count + 1             # <<<<<<<<<<<<<<
+ *         n = count - 1
+ *         while n > 0 and dist_buffer[n - 1] > dist_sq:
  */
-      __pyx_v_weight = (1.0 / __pyx_v_dist_sq);
+      __pyx_v_count = (__pyx_v_count + 1);
 
-      /* "pymica/methods/inverse_distance.pyx":98
- *             return values[i]
+      /* "pymica/methods/inverse_distance.pyx":693
+ *             continue
  * 
- *         if power == 2:             # <<<<<<<<<<<<<<
- *             weight = 1.0 / dist_sq
- *         else:
+ *         if count < k:             # <<<<<<<<<<<<<<
+ *             count = count + 1
+ *         n = count - 1
  */
-      goto __pyx_L6;
     }
 
-    /* "pymica/methods/inverse_distance.pyx":101
- *             weight = 1.0 / dist_sq
- *         else:
- *             weight = 1.0 / fast_pow(dist_sq, power // 2)             # <<<<<<<<<<<<<<
- * 
- *         numerator += values[i] * weight
+    /* "pymica/methods/inverse_distance.pyx":695
+ *         if count < k:
+ *             count = count + 1
+ *         n = count - 1             # <<<<<<<<<<<<<<
+ *         while n > 0 and dist_buffer[n - 1] > dist_sq:
+ *             dist_buffer[n] = dist_buffer[n - 1]
  */
-    /*else*/ {
-      __pyx_t_6 = __pyx_f_6pymica_7methods_16inverse_distance_fast_pow(__pyx_v_dist_sq, (__pyx_v_power / 2)); if (unlikely(__pyx_t_6 == ((double)-1) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 101, __pyx_L1_error)
-      __pyx_v_weight = (1.0 / __pyx_t_6);
-    }
-    __pyx_L6:;
+    __pyx_v_n = (__pyx_v_count - 1);
 
-    /* "pymica/methods/inverse_distance.pyx":103
- *             weight = 1.0 / fast_pow(dist_sq, power // 2)
- * 
- *         numerator += values[i] * weight             # <<<<<<<<<<<<<<
- *         denominator += weight
- * 
+    /* "pymica/methods/inverse_distance.pyx":696
+ *             count = count + 1
+ *         n = count - 1
+ *         while n > 0 and dist_buffer[n - 1] > dist_sq:             # <<<<<<<<<<<<<<
+ *             dist_buffer[n] = dist_buffer[n - 1]
+ *             idx_buffer[n] = idx_buffer[n - 1]
  */
-    __pyx_t_4 = __pyx_v_i;
-    __pyx_v_numerator = (__pyx_v_numerator + ((*((double *) ( /* dim=0 */ (__pyx_v_values.data + __pyx_t_4 * __pyx_v_values.strides[0]) ))) * __pyx_v_weight));
+    while (1) {
+      __pyx_t_2 = (__pyx_v_n > 0);
+      if (__pyx_t_2) {
+      } else {
+        __pyx_t_1 = __pyx_t_2;
+        goto __pyx_L19_bool_binop_done;
+      }
+      __pyx_t_2 = ((__pyx_v_dist_buffer[(__pyx_v_n - 1)]) > __pyx_v_dist_sq);
+      __pyx_t_1 = __pyx_t_2;
+      __pyx_L19_bool_binop_done:;
+      if (!__pyx_t_1) break;
 
-    /* "pymica/methods/inverse_distance.pyx":104
- * 
- *         numerator += values[i] * weight
- *         denominator += weight             # <<<<<<<<<<<<<<
- * 
- *     if denominator != 0.0:
+      /* "pymica/methods/inverse_distance.pyx":697
+ *         n = count - 1
+ *         while n > 0 and dist_buffer[n - 1] > dist_sq:
+ *             dist_buffer[n] = dist_buffer[n - 1]             # <<<<<<<<<<<<<<
+ *             idx_buffer[n] = idx_buffer[n - 1]
+ *             n = n - 1
  */
-    __pyx_v_denominator = (__pyx_v_denominator + __pyx_v_weight);
-  }
+      (__pyx_v_dist_buffer[__pyx_v_n]) = (__pyx_v_dist_buffer[(__pyx_v_n - 1)]);
 
-  /* "pymica/methods/inverse_distance.pyx":106
- *         denominator += weight
- * 
- *     if denominator != 0.0:             # <<<<<<<<<<<<<<
- *         return numerator / denominator
- *     return 0.0
+      /* "pymica/methods/inverse_distance.pyx":698
+ *         while n > 0 and dist_buffer[n - 1] > dist_sq:
+ *             dist_buffer[n] = dist_buffer[n - 1]
+ *             idx_buffer[n] = idx_buffer[n - 1]             # <<<<<<<<<<<<<<
+ *             n = n - 1
+ *         dist_buffer[n] = dist_sq
  */
-  __pyx_t_5 = (__pyx_v_denominator != 0.0);
-  if (__pyx_t_5) {
+      (__pyx_v_idx_buffer[__pyx_v_n]) = (__pyx_v_idx_buffer[(__pyx_v_n - 1)]);
 
-    /* "pymica/methods/inverse_distance.pyx":107
- * 
- *     if denominator != 0.0:
- *         return numerator / denominator             # <<<<<<<<<<<<<<
- *     return 0.0
+      /* "pymica/methods/inverse_distance.pyx":699
+ *             dist_buffer[n] = dist_buffer[n - 1]
+ *             idx_buffer[n] = idx_buffer[n - 1]
+ *             n = n - 1             # <<<<<<<<<<<<<<
+ *         dist_buffer[n] = dist_sq
+ *         idx_buffer[n] = s
+ */
+      __pyx_v_n = (__pyx_v_n - 1);
+    }
+
+    /* "pymica/methods/inverse_distance.pyx":700
+ *             idx_buffer[n] = idx_buffer[n - 1]
+ *             n = n - 1
+ *         dist_buffer[n] = dist_sq             # <<<<<<<<<<<<<<
+ *         idx_buffer[n] = s
  * 
  */
-    __pyx_r = (__pyx_v_numerator / __pyx_v_denominator);
-    goto __pyx_L0;
+    (__pyx_v_dist_buffer[__pyx_v_n]) = __pyx_v_dist_sq;
 
-    /* "pymica/methods/inverse_distance.pyx":106
- *         denominator += weight
+    /* "pymica/methods/inverse_distance.pyx":701
+ *             n = n - 1
+ *         dist_buffer[n] = dist_sq
+ *         idx_buffer[n] = s             # <<<<<<<<<<<<<<
  * 
- *     if denominator != 0.0:             # <<<<<<<<<<<<<<
- *         return numerator / denominator
- *     return 0.0
+ *     return count
  */
+    (__pyx_v_idx_buffer[__pyx_v_n]) = __pyx_v_s;
+    __pyx_L8_continue:;
   }
 
-  /* "pymica/methods/inverse_distance.pyx":108
- *     if denominator != 0.0:
- *         return numerator / denominator
- *     return 0.0             # <<<<<<<<<<<<<<
+  /* "pymica/methods/inverse_distance.pyx":703
+ *         idx_buffer[n] = s
+ * 
+ *     return count             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  __pyx_r = 0.0;
+  __pyx_r = __pyx_v_count;
   goto __pyx_L0;
 
-  /* "pymica/methods/inverse_distance.pyx":79
+  /* "pymica/methods/inverse_distance.pyx":671
  * 
  * 
- * cdef inline float point_residue(double x, double y,             # <<<<<<<<<<<<<<
- *                                 double[:] xpos, double[:] ypos,
- *                                 double[:] values, int N,
+ * cdef inline int scan_bucket(double x, double y, const GridIndex *index,             # <<<<<<<<<<<<<<
+ *                             long bx, long by, int k, double radius_sq,
+ *                             int *idx_buffer, double *dist_buffer,
  */
 
   /* function exit code */
-  __pyx_L1_error:;
-  #ifdef WITH_THREAD
-  __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-  #endif
-  __Pyx_AddTraceback("pymica.methods.inverse_distance.point_residue", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = -1;
-  #ifdef WITH_THREAD
-  __Pyx_PyGILState_Release(__pyx_gilstate_save);
-  #endif
   __pyx_L0:;
   return __pyx_r;
 }
 
-/* "pymica/methods/inverse_distance.pyx":111
+/* "pymica/methods/inverse_distance.pyx":706
  * 
  * 
- * cdef inline double fast_pow(double base, int exp) nogil:             # <<<<<<<<<<<<<<
- *     cdef double result = 1.0
- *     while exp > 0:
+ * cdef double radius_residue(double x, double y, const GridIndex *index,             # <<<<<<<<<<<<<<
+ *                            double radius_sq, IdwPower power,
+ *                            float smoothing) noexcept nogil:
  */
 
-static CYTHON_INLINE double __pyx_f_6pymica_7methods_16inverse_distance_fast_pow(double __pyx_v_base, int __pyx_v_exp) {
-  double __pyx_v_result;
+static double __pyx_f_6pymica_7methods_16inverse_distance_radius_residue(double __pyx_v_x, double __pyx_v_y, struct __pyx_t_6pymica_7methods_16inverse_distance_GridIndex const *__pyx_v_index, double __pyx_v_radius_sq, struct __pyx_t_6pymica_7methods_9idw_power_IdwPower __pyx_v_power, float __pyx_v_smoothing) {
+  double __pyx_v_radius;
+  long __pyx_v_bx_min;
+  long __pyx_v_bx_max;
+  long __pyx_v_by_min;
+  long __pyx_v_by_max;
+  double __pyx_v_numerator;
+  double __pyx_v_denominator;
+  double __pyx_v_dx;
+  double __pyx_v_dy;
+  double __pyx_v_dist_sq;
+  double __pyx_v_weight;
+  float __pyx_v_smoothing_sq;
+  long __pyx_v_bx;
+  long __pyx_v_by;
+  int __pyx_v_s;
+  int __pyx_v_bucket;
   double __pyx_r;
-  int __pyx_t_1;
+  long __pyx_t_1;
+  long __pyx_t_2;
+  long __pyx_t_3;
+  int __pyx_t_4;
+  long __pyx_t_5;
+  long __pyx_t_6;
+  long __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_t_9;
+  int __pyx_t_10;
 
-  /* "pymica/methods/inverse_distance.pyx":112
- * 
- * cdef inline double fast_pow(double base, int exp) nogil:
- *     cdef double result = 1.0             # <<<<<<<<<<<<<<
- *     while exp > 0:
- *         if exp & 1:
+  /* "pymica/methods/inverse_distance.pyx":710
+ *                            float smoothing) noexcept nogil:
+ *     """Residue at (x, y) from all the stations closer than the radius."""
+ *     cdef double radius = sqrt(radius_sq)             # <<<<<<<<<<<<<<
+ *     cdef long bx_min = max(<long> floor((x - radius - index.x0) / index.cell_size), 0)
+ *     cdef long bx_max = min(<long> floor((x + radius - index.x0) / index.cell_size),
  */
-  __pyx_v_result = 1.0;
+  __pyx_v_radius = sqrt(__pyx_v_radius_sq);
 
-  /* "pymica/methods/inverse_distance.pyx":113
- * cdef inline double fast_pow(double base, int exp) nogil:
- *     cdef double result = 1.0
- *     while exp > 0:             # <<<<<<<<<<<<<<
- *         if exp & 1:
- *             result *= base
+  /* "pymica/methods/inverse_distance.pyx":711
+ *     """Residue at (x, y) from all the stations closer than the radius."""
+ *     cdef double radius = sqrt(radius_sq)
+ *     cdef long bx_min = max(<long> floor((x - radius - index.x0) / index.cell_size), 0)             # <<<<<<<<<<<<<<
+ *     cdef long bx_max = min(<long> floor((x + radius - index.x0) / index.cell_size),
+ *                            index.nx - 1)
  */
-  while (1) {
-    __pyx_t_1 = (__pyx_v_exp > 0);
-    if (!__pyx_t_1) break;
+  __pyx_t_1 = 0;
+  __pyx_t_2 = ((long)floor((((__pyx_v_x - __pyx_v_radius) - __pyx_v_index->x0) / ((double)__pyx_v_index->cell_size))));
+  __pyx_t_4 = (__pyx_t_1 > __pyx_t_2);
+  if (__pyx_t_4) {
+    __pyx_t_3 = __pyx_t_1;
+  } else {
+    __pyx_t_3 = __pyx_t_2;
+  }
+  __pyx_v_bx_min = __pyx_t_3;
 
-    /* "pymica/methods/inverse_distance.pyx":114
- *     cdef double result = 1.0
- *     while exp > 0:
- *         if exp & 1:             # <<<<<<<<<<<<<<
- *             result *= base
- *         base *= base
+  /* "pymica/methods/inverse_distance.pyx":713
+ *     cdef long bx_min = max(<long> floor((x - radius - index.x0) / index.cell_size), 0)
+ *     cdef long bx_max = min(<long> floor((x + radius - index.x0) / index.cell_size),
+ *                            index.nx - 1)             # <<<<<<<<<<<<<<
+ *     cdef long by_min = max(<long> floor((y - radius - index.y0) / index.cell_size), 0)
+ *     cdef long by_max = min(<long> floor((y + radius - index.y0) / index.cell_size),
  */
-    __pyx_t_1 = ((__pyx_v_exp & 1) != 0);
-    if (__pyx_t_1) {
+  __pyx_t_3 = (__pyx_v_index->nx - 1);
 
-      /* "pymica/methods/inverse_distance.pyx":115
- *     while exp > 0:
- *         if exp & 1:
- *             result *= base             # <<<<<<<<<<<<<<
- *         base *= base
- *         exp >>= 1
+  /* "pymica/methods/inverse_distance.pyx":712
+ *     cdef double radius = sqrt(radius_sq)
+ *     cdef long bx_min = max(<long> floor((x - radius - index.x0) / index.cell_size), 0)
+ *     cdef long bx_max = min(<long> floor((x + radius - index.x0) / index.cell_size),             # <<<<<<<<<<<<<<
+ *                            index.nx - 1)
+ *     cdef long by_min = max(<long> floor((y - radius - index.y0) / index.cell_size), 0)
  */
-      __pyx_v_result = (__pyx_v_result * __pyx_v_base);
+  __pyx_t_1 = ((long)floor((((__pyx_v_x + __pyx_v_radius) - __pyx_v_index->x0) / ((double)__pyx_v_index->cell_size))));
 
-      /* "pymica/methods/inverse_distance.pyx":114
- *     cdef double result = 1.0
- *     while exp > 0:
- *         if exp & 1:             # <<<<<<<<<<<<<<
- *             result *= base
- *         base *= base
+  /* "pymica/methods/inverse_distance.pyx":713
+ *     cdef long bx_min = max(<long> floor((x - radius - index.x0) / index.cell_size), 0)
+ *     cdef long bx_max = min(<long> floor((x + radius - index.x0) / index.cell_size),
+ *                            index.nx - 1)             # <<<<<<<<<<<<<<
+ *     cdef long by_min = max(<long> floor((y - radius - index.y0) / index.cell_size), 0)
+ *     cdef long by_max = min(<long> floor((y + radius - index.y0) / index.cell_size),
+ */
+  __pyx_t_4 = (__pyx_t_3 < __pyx_t_1);
+  if (__pyx_t_4) {
+    __pyx_t_2 = __pyx_t_3;
+  } else {
+    __pyx_t_2 = __pyx_t_1;
+  }
+  __pyx_v_bx_max = __pyx_t_2;
+
+  /* "pymica/methods/inverse_distance.pyx":714
+ *     cdef long bx_max = min(<long> floor((x + radius - index.x0) / index.cell_size),
+ *                            index.nx - 1)
+ *     cdef long by_min = max(<long> floor((y - radius - index.y0) / index.cell_size), 0)             # <<<<<<<<<<<<<<
+ *     cdef long by_max = min(<long> floor((y + radius - index.y0) / index.cell_size),
+ *                            index.ny - 1)
+ */
+  __pyx_t_2 = 0;
+  __pyx_t_3 = ((long)floor((((__pyx_v_y - __pyx_v_radius) - __pyx_v_index->y0) / ((double)__pyx_v_index->cell_size))));
+  __pyx_t_4 = (__pyx_t_2 > __pyx_t_3);
+  if (__pyx_t_4) {
+    __pyx_t_1 = __pyx_t_2;
+  } else {
+    __pyx_t_1 = __pyx_t_3;
+  }
+  __pyx_v_by_min = __pyx_t_1;
+
+  /* "pymica/methods/inverse_distance.pyx":716
+ *     cdef long by_min = max(<long> floor((y - radius - index.y0) / index.cell_size), 0)
+ *     cdef long by_max = min(<long> floor((y + radius - index.y0) / index.cell_size),
+ *                            index.ny - 1)             # <<<<<<<<<<<<<<
+ *     cdef double numerator = 0.0
+ *     cdef double denominator = 0.0
+ */
+  __pyx_t_1 = (__pyx_v_index->ny - 1);
+
+  /* "pymica/methods/inverse_distance.pyx":715
+ *                            index.nx - 1)
+ *     cdef long by_min = max(<long> floor((y - radius - index.y0) / index.cell_size), 0)
+ *     cdef long by_max = min(<long> floor((y + radius - index.y0) / index.cell_size),             # <<<<<<<<<<<<<<
+ *                            index.ny - 1)
+ *     cdef double numerator = 0.0
+ */
+  __pyx_t_2 = ((long)floor((((__pyx_v_y + __pyx_v_radius) - __pyx_v_index->y0) / ((double)__pyx_v_index->cell_size))));
+
+  /* "pymica/methods/inverse_distance.pyx":716
+ *     cdef long by_min = max(<long> floor((y - radius - index.y0) / index.cell_size), 0)
+ *     cdef long by_max = min(<long> floor((y + radius - index.y0) / index.cell_size),
+ *                            index.ny - 1)             # <<<<<<<<<<<<<<
+ *     cdef double numerator = 0.0
+ *     cdef double denominator = 0.0
+ */
+  __pyx_t_4 = (__pyx_t_1 < __pyx_t_2);
+  if (__pyx_t_4) {
+    __pyx_t_3 = __pyx_t_1;
+  } else {
+    __pyx_t_3 = __pyx_t_2;
+  }
+  __pyx_v_by_max = __pyx_t_3;
+
+  /* "pymica/methods/inverse_distance.pyx":717
+ *     cdef long by_max = min(<long> floor((y + radius - index.y0) / index.cell_size),
+ *                            index.ny - 1)
+ *     cdef double numerator = 0.0             # <<<<<<<<<<<<<<
+ *     cdef double denominator = 0.0
+ *     cdef double dx, dy, dist_sq, weight
  */
+  __pyx_v_numerator = 0.0;
+
+  /* "pymica/methods/inverse_distance.pyx":718
+ *                            index.ny - 1)
+ *     cdef double numerator = 0.0
+ *     cdef double denominator = 0.0             # <<<<<<<<<<<<<<
+ *     cdef double dx, dy, dist_sq, weight
+ *     cdef float smoothing_sq = smoothing * smoothing
+ */
+  __pyx_v_denominator = 0.0;
+
+  /* "pymica/methods/inverse_distance.pyx":720
+ *     cdef double denominator = 0.0
+ *     cdef double dx, dy, dist_sq, weight
+ *     cdef float smoothing_sq = smoothing * smoothing             # <<<<<<<<<<<<<<
+ *     cdef long bx, by
+ *     cdef int s, bucket
+ */
+  __pyx_v_smoothing_sq = (__pyx_v_smoothing * __pyx_v_smoothing);
+
+  /* "pymica/methods/inverse_distance.pyx":724
+ *     cdef int s, bucket
+ * 
+ *     for by in range(by_min, by_max + 1):             # <<<<<<<<<<<<<<
+ *         for bx in range(bx_min, bx_max + 1):
+ *             bucket = by * index.nx + bx
+ */
+  __pyx_t_3 = (__pyx_v_by_max + 1);
+  __pyx_t_1 = __pyx_t_3;
+  for (__pyx_t_2 = __pyx_v_by_min; __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
+    __pyx_v_by = __pyx_t_2;
+
+    /* "pymica/methods/inverse_distance.pyx":725
+ * 
+ *     for by in range(by_min, by_max + 1):
+ *         for bx in range(bx_min, bx_max + 1):             # <<<<<<<<<<<<<<
+ *             bucket = by * index.nx + bx
+ *             for s in range(index.start[bucket], index.start[bucket + 1]):
+ */
+    __pyx_t_5 = (__pyx_v_bx_max + 1);
+    __pyx_t_6 = __pyx_t_5;
+    for (__pyx_t_7 = __pyx_v_bx_min; __pyx_t_7 < __pyx_t_6; __pyx_t_7+=1) {
+      __pyx_v_bx = __pyx_t_7;
+
+      /* "pymica/methods/inverse_distance.pyx":726
+ *     for by in range(by_min, by_max + 1):
+ *         for bx in range(bx_min, bx_max + 1):
+ *             bucket = by * index.nx + bx             # <<<<<<<<<<<<<<
+ *             for s in range(index.start[bucket], index.start[bucket + 1]):
+ *                 dx = x - index.xpos[s]
+ */
+      __pyx_v_bucket = ((__pyx_v_by * __pyx_v_index->nx) + __pyx_v_bx);
+
+      /* "pymica/methods/inverse_distance.pyx":727
+ *         for bx in range(bx_min, bx_max + 1):
+ *             bucket = by * index.nx + bx
+ *             for s in range(index.start[bucket], index.start[bucket + 1]):             # <<<<<<<<<<<<<<
+ *                 dx = x - index.xpos[s]
+ *                 dy = y - index.ypos[s]
+ */
+      __pyx_t_8 = (__pyx_v_index->start[(__pyx_v_bucket + 1)]);
+      __pyx_t_9 = __pyx_t_8;
+      for (__pyx_t_10 = (__pyx_v_index->start[__pyx_v_bucket]); __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+        __pyx_v_s = __pyx_t_10;
+
+        /* "pymica/methods/inverse_distance.pyx":728
+ *             bucket = by * index.nx + bx
+ *             for s in range(index.start[bucket], index.start[bucket + 1]):
+ *                 dx = x - index.xpos[s]             # <<<<<<<<<<<<<<
+ *                 dy = y - index.ypos[s]
+ *                 dist_sq = dx * dx + dy * dy
+ */
+        __pyx_v_dx = (__pyx_v_x - (__pyx_v_index->xpos[__pyx_v_s]));
+
+        /* "pymica/methods/inverse_distance.pyx":729
+ *             for s in range(index.start[bucket], index.start[bucket + 1]):
+ *                 dx = x - index.xpos[s]
+ *                 dy = y - index.ypos[s]             # <<<<<<<<<<<<<<
+ *                 dist_sq = dx * dx + dy * dy
+ *                 if dist_sq > radius_sq:
+ */
+        __pyx_v_dy = (__pyx_v_y - (__pyx_v_index->ypos[__pyx_v_s]));
+
+        /* "pymica/methods/inverse_distance.pyx":730
+ *                 dx = x - index.xpos[s]
+ *                 dy = y - index.ypos[s]
+ *                 dist_sq = dx * dx + dy * dy             # <<<<<<<<<<<<<<
+ *                 if dist_sq > radius_sq:
+ *                     continue
+ */
+        __pyx_v_dist_sq = ((__pyx_v_dx * __pyx_v_dx) + (__pyx_v_dy * __pyx_v_dy));
+
+        /* "pymica/methods/inverse_distance.pyx":731
+ *                 dy = y - index.ypos[s]
+ *                 dist_sq = dx * dx + dy * dy
+ *                 if dist_sq > radius_sq:             # <<<<<<<<<<<<<<
+ *                     continue
+ *                 dist_sq = dist_sq + smoothing_sq
+ */
+        __pyx_t_4 = (__pyx_v_dist_sq > __pyx_v_radius_sq);
+        if (__pyx_t_4) {
+
+          /* "pymica/methods/inverse_distance.pyx":732
+ *                 dist_sq = dx * dx + dy * dy
+ *                 if dist_sq > radius_sq:
+ *                     continue             # <<<<<<<<<<<<<<
+ *                 dist_sq = dist_sq + smoothing_sq
+ *                 if dist_sq < 1e-11:
+ */
+          goto __pyx_L7_continue;
+
+          /* "pymica/methods/inverse_distance.pyx":731
+ *                 dy = y - index.ypos[s]
+ *                 dist_sq = dx * dx + dy * dy
+ *                 if dist_sq > radius_sq:             # <<<<<<<<<<<<<<
+ *                     continue
+ *                 dist_sq = dist_sq + smoothing_sq
+ */
+        }
+
+        /* "pymica/methods/inverse_distance.pyx":733
+ *                 if dist_sq > radius_sq:
+ *                     continue
+ *                 dist_sq = dist_sq + smoothing_sq             # <<<<<<<<<<<<<<
+ *                 if dist_sq < 1e-11:
+ *                     return index.values[s]
+ */
+        __pyx_v_dist_sq = (__pyx_v_dist_sq + __pyx_v_smoothing_sq);
+
+        /* "pymica/methods/inverse_distance.pyx":734
+ *                     continue
+ *                 dist_sq = dist_sq + smoothing_sq
+ *                 if dist_sq < 1e-11:             # <<<<<<<<<<<<<<
+ *                     return index.values[s]
+ *                 weight = station_weight(dist_sq, power)
+ */
+        __pyx_t_4 = (__pyx_v_dist_sq < 1e-11);
+        if (__pyx_t_4) {
+
+          /* "pymica/methods/inverse_distance.pyx":735
+ *                 dist_sq = dist_sq + smoothing_sq
+ *                 if dist_sq < 1e-11:
+ *                     return index.values[s]             # <<<<<<<<<<<<<<
+ *                 weight = station_weight(dist_sq, power)
+ *                 numerator += index.values[s] * weight
+ */
+          __pyx_r = (__pyx_v_index->values[__pyx_v_s]);
+          goto __pyx_L0;
+
+          /* "pymica/methods/inverse_distance.pyx":734
+ *                     continue
+ *                 dist_sq = dist_sq + smoothing_sq
+ *                 if dist_sq < 1e-11:             # <<<<<<<<<<<<<<
+ *                     return index.values[s]
+ *                 weight = station_weight(dist_sq, power)
+ */
+        }
+
+        /* "pymica/methods/inverse_distance.pyx":736
+ *                 if dist_sq < 1e-11:
+ *                     return index.values[s]
+ *                 weight = station_weight(dist_sq, power)             # <<<<<<<<<<<<<<
+ *                 numerator += index.values[s] * weight
+ *                 denominator += weight
+ */
+        __pyx_v_weight = __pyx_f_6pymica_7methods_9idw_power_station_weight(__pyx_v_dist_sq, __pyx_v_power);
+
+        /* "pymica/methods/inverse_distance.pyx":737
+ *                     return index.values[s]
+ *                 weight = station_weight(dist_sq, power)
+ *                 numerator += index.values[s] * weight             # <<<<<<<<<<<<<<
+ *                 denominator += weight
+ * 
+ */
+        __pyx_v_numerator = (__pyx_v_numerator + ((__pyx_v_index->values[__pyx_v_s]) * __pyx_v_weight));
+
+        /* "pymica/methods/inverse_distance.pyx":738
+ *                 weight = station_weight(dist_sq, power)
+ *                 numerator += index.values[s] * weight
+ *                 denominator += weight             # <<<<<<<<<<<<<<
+ * 
+ *     if denominator != 0.0:
+ */
+        __pyx_v_denominator = (__pyx_v_denominator + __pyx_v_weight);
+        __pyx_L7_continue:;
+      }
     }
+  }
 
-    /* "pymica/methods/inverse_distance.pyx":116
- *         if exp & 1:
- *             result *= base
- *         base *= base             # <<<<<<<<<<<<<<
- *         exp >>= 1
- *     return result
+  /* "pymica/methods/inverse_distance.pyx":740
+ *                 denominator += weight
+ * 
+ *     if denominator != 0.0:             # <<<<<<<<<<<<<<
+ *         return numerator / denominator
+ *     return 0.0
  */
-    __pyx_v_base = (__pyx_v_base * __pyx_v_base);
+  __pyx_t_4 = (__pyx_v_denominator != 0.0);
+  if (__pyx_t_4) {
 
-    /* "pymica/methods/inverse_distance.pyx":117
- *             result *= base
- *         base *= base
- *         exp >>= 1             # <<<<<<<<<<<<<<
- *     return result
+    /* "pymica/methods/inverse_distance.pyx":741
+ * 
+ *     if denominator != 0.0:
+ *         return numerator / denominator             # <<<<<<<<<<<<<<
+ *     return 0.0
+ */
+    __pyx_r = (__pyx_v_numerator / __pyx_v_denominator);
+    goto __pyx_L0;
+
+    /* "pymica/methods/inverse_distance.pyx":740
+ *                 denominator += weight
+ * 
+ *     if denominator != 0.0:             # <<<<<<<<<<<<<<
+ *         return numerator / denominator
+ *     return 0.0
  */
-    __pyx_v_exp = (__pyx_v_exp >> 1);
   }
 
-  /* "pymica/methods/inverse_distance.pyx":118
- *         base *= base
- *         exp >>= 1
- *     return result             # <<<<<<<<<<<<<<
+  /* "pymica/methods/inverse_distance.pyx":742
+ *     if denominator != 0.0:
+ *         return numerator / denominator
+ *     return 0.0             # <<<<<<<<<<<<<<
  */
-  __pyx_r = __pyx_v_result;
+  __pyx_r = 0.0;
   goto __pyx_L0;
 
-  /* "pymica/methods/inverse_distance.pyx":111
+  /* "pymica/methods/inverse_distance.pyx":706
  * 
  * 
- * cdef inline double fast_pow(double base, int exp) nogil:             # <<<<<<<<<<<<<<
- *     cdef double result = 1.0
- *     while exp > 0:
+ * cdef double radius_residue(double x, double y, const GridIndex *index,             # <<<<<<<<<<<<<<
+ *                            double radius_sq, IdwPower power,
+ *                            float smoothing) noexcept nogil:
  */
 
   /* function exit code */
@@ -23277,6 +34335,7 @@ static int __Pyx_CreateStringTabAndInitStrings(void) {
     {&__pyx_kp_s_All_dimensions_preceding_dimensi, __pyx_k_All_dimensions_preceding_dimensi, sizeof(__pyx_k_All_dimensions_preceding_dimensi), 0, 0, 1, 0},
     {&__pyx_n_s_AssertionError, __pyx_k_AssertionError, sizeof(__pyx_k_AssertionError), 0, 0, 1, 1},
     {&__pyx_kp_s_Buffer_view_does_not_expose_stri, __pyx_k_Buffer_view_does_not_expose_stri, sizeof(__pyx_k_Buffer_view_does_not_expose_stri), 0, 0, 1, 0},
+    {&__pyx_n_s_C_CONTIGUOUS, __pyx_k_C_CONTIGUOUS, sizeof(__pyx_k_C_CONTIGUOUS), 0, 0, 1, 1},
     {&__pyx_kp_s_Can_only_create_a_buffer_that_is, __pyx_k_Can_only_create_a_buffer_that_is, sizeof(__pyx_k_Can_only_create_a_buffer_that_is), 0, 0, 1, 0},
     {&__pyx_kp_s_Cannot_assign_to_read_only_memor, __pyx_k_Cannot_assign_to_read_only_memor, sizeof(__pyx_k_Cannot_assign_to_read_only_memor), 0, 0, 1, 0},
     {&__pyx_kp_s_Cannot_create_writable_memory_vi, __pyx_k_Cannot_create_writable_memory_vi, sizeof(__pyx_k_Cannot_create_writable_memory_vi), 0, 0, 1, 0},
@@ -23295,7 +34354,6 @@ static int __Pyx_CreateStringTabAndInitStrings(void) {
     {&__pyx_kp_u_Invalid_mode_expected_c_or_fortr, __pyx_k_Invalid_mode_expected_c_or_fortr, sizeof(__pyx_k_Invalid_mode_expected_c_or_fortr), 0, 1, 0, 0},
     {&__pyx_kp_u_Invalid_shape_in_axis, __pyx_k_Invalid_shape_in_axis, sizeof(__pyx_k_Invalid_shape_in_axis), 0, 1, 0, 0},
     {&__pyx_n_s_List, __pyx_k_List, sizeof(__pyx_k_List), 0, 0, 1, 1},
-    {&__pyx_kp_s_List_Dict_str_float, __pyx_k_List_Dict_str_float, sizeof(__pyx_k_List_Dict_str_float), 0, 0, 1, 0},
     {&__pyx_kp_s_List_int, __pyx_k_List_int, sizeof(__pyx_k_List_int), 0, 0, 1, 0},
     {&__pyx_n_s_MemoryError, __pyx_k_MemoryError, sizeof(__pyx_k_MemoryError), 0, 0, 1, 1},
     {&__pyx_kp_s_MemoryView_of_r_at_0x_x, __pyx_k_MemoryView_of_r_at_0x_x, sizeof(__pyx_k_MemoryView_of_r_at_0x_x), 0, 0, 1, 0},
@@ -23308,47 +34366,64 @@ static int __Pyx_CreateStringTabAndInitStrings(void) {
     {&__pyx_kp_s_Step_may_not_be_zero_axis_d, __pyx_k_Step_may_not_be_zero_axis_d, sizeof(__pyx_k_Step_may_not_be_zero_axis_d), 0, 0, 1, 0},
     {&__pyx_n_s_TypeError, __pyx_k_TypeError, sizeof(__pyx_k_TypeError), 0, 0, 1, 1},
     {&__pyx_kp_s_Unable_to_convert_item_to_object, __pyx_k_Unable_to_convert_item_to_object, sizeof(__pyx_k_Unable_to_convert_item_to_object), 0, 0, 1, 0},
+    {&__pyx_n_s_Union, __pyx_k_Union, sizeof(__pyx_k_Union), 0, 0, 1, 1},
+    {&__pyx_kp_s_Union_List_Dict_str_float_np_nda, __pyx_k_Union_List_Dict_str_float_np_nda, sizeof(__pyx_k_Union_List_Dict_str_float_np_nda), 0, 0, 1, 0},
     {&__pyx_n_s_ValueError, __pyx_k_ValueError, sizeof(__pyx_k_ValueError), 0, 0, 1, 1},
     {&__pyx_n_s_View_MemoryView, __pyx_k_View_MemoryView, sizeof(__pyx_k_View_MemoryView), 0, 0, 1, 1},
     {&__pyx_kp_u__2, __pyx_k__2, sizeof(__pyx_k__2), 0, 1, 0, 0},
-    {&__pyx_n_s__24, __pyx_k__24, sizeof(__pyx_k__24), 0, 0, 1, 1},
     {&__pyx_n_s__3, __pyx_k__3, sizeof(__pyx_k__3), 0, 0, 1, 1},
+    {&__pyx_n_s__34, __pyx_k__34, sizeof(__pyx_k__34), 0, 0, 1, 1},
     {&__pyx_kp_u__6, __pyx_k__6, sizeof(__pyx_k__6), 0, 1, 0, 0},
     {&__pyx_kp_u__7, __pyx_k__7, sizeof(__pyx_k__7), 0, 1, 0, 0},
     {&__pyx_n_s_abc, __pyx_k_abc, sizeof(__pyx_k_abc), 0, 0, 1, 1},
     {&__pyx_n_s_allocate_buffer, __pyx_k_allocate_buffer, sizeof(__pyx_k_allocate_buffer), 0, 0, 1, 1},
     {&__pyx_kp_u_and, __pyx_k_and, sizeof(__pyx_k_and), 0, 1, 0, 0},
+    {&__pyx_n_s_argsort, __pyx_k_argsort, sizeof(__pyx_k_argsort), 0, 0, 1, 1},
     {&__pyx_n_s_array, __pyx_k_array, sizeof(__pyx_k_array), 0, 0, 1, 1},
+    {&__pyx_n_s_asarray, __pyx_k_asarray, sizeof(__pyx_k_asarray), 0, 0, 1, 1},
+    {&__pyx_n_s_ascontiguousarray, __pyx_k_ascontiguousarray, sizeof(__pyx_k_ascontiguousarray), 0, 0, 1, 1},
+    {&__pyx_n_s_astype, __pyx_k_astype, sizeof(__pyx_k_astype), 0, 0, 1, 1},
     {&__pyx_n_s_asyncio_coroutines, __pyx_k_asyncio_coroutines, sizeof(__pyx_k_asyncio_coroutines), 0, 0, 1, 1},
     {&__pyx_n_s_base, __pyx_k_base, sizeof(__pyx_k_base), 0, 0, 1, 1},
+    {&__pyx_n_s_bincount, __pyx_k_bincount, sizeof(__pyx_k_bincount), 0, 0, 1, 1},
+    {&__pyx_n_s_bucket, __pyx_k_bucket, sizeof(__pyx_k_bucket), 0, 0, 1, 1},
+    {&__pyx_n_s_bucket_x, __pyx_k_bucket_x, sizeof(__pyx_k_bucket_x), 0, 0, 1, 1},
+    {&__pyx_n_s_bucket_y, __pyx_k_bucket_y, sizeof(__pyx_k_bucket_y), 0, 0, 1, 1},
+    {&__pyx_n_s_build_grid_index, __pyx_k_build_grid_index, sizeof(__pyx_k_build_grid_index), 0, 0, 1, 1},
     {&__pyx_n_s_c, __pyx_k_c, sizeof(__pyx_k_c), 0, 0, 1, 1},
     {&__pyx_n_u_c, __pyx_k_c, sizeof(__pyx_k_c), 0, 1, 0, 1},
-    {&__pyx_n_s_cda, __pyx_k_cda, sizeof(__pyx_k_cda), 0, 0, 1, 1},
+    {&__pyx_n_s_cell_size, __pyx_k_cell_size, sizeof(__pyx_k_cell_size), 0, 0, 1, 1},
     {&__pyx_n_s_cgeotransform, __pyx_k_cgeotransform, sizeof(__pyx_k_cgeotransform), 0, 0, 1, 1},
     {&__pyx_n_s_class, __pyx_k_class, sizeof(__pyx_k_class), 0, 0, 1, 1},
     {&__pyx_n_s_class_getitem, __pyx_k_class_getitem, sizeof(__pyx_k_class_getitem), 0, 0, 1, 1},
     {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
+    {&__pyx_n_s_cmask, __pyx_k_cmask, sizeof(__pyx_k_cmask), 0, 0, 1, 1},
     {&__pyx_n_s_collections, __pyx_k_collections, sizeof(__pyx_k_collections), 0, 0, 1, 1},
     {&__pyx_kp_s_collections_abc, __pyx_k_collections_abc, sizeof(__pyx_k_collections_abc), 0, 0, 1, 0},
     {&__pyx_kp_s_contiguous_and_direct, __pyx_k_contiguous_and_direct, sizeof(__pyx_k_contiguous_and_direct), 0, 0, 1, 0},
     {&__pyx_kp_s_contiguous_and_indirect, __pyx_k_contiguous_and_indirect, sizeof(__pyx_k_contiguous_and_indirect), 0, 0, 1, 0},
     {&__pyx_n_s_count, __pyx_k_count, sizeof(__pyx_k_count), 0, 0, 1, 1},
+    {&__pyx_n_s_cpower, __pyx_k_cpower, sizeof(__pyx_k_cpower), 0, 0, 1, 1},
+    {&__pyx_n_s_cpu_count, __pyx_k_cpu_count, sizeof(__pyx_k_cpu_count), 0, 0, 1, 1},
+    {&__pyx_n_s_csmoothing, __pyx_k_csmoothing, sizeof(__pyx_k_csmoothing), 0, 0, 1, 1},
+    {&__pyx_n_s_cumsum, __pyx_k_cumsum, sizeof(__pyx_k_cumsum), 0, 0, 1, 1},
     {&__pyx_n_s_cvalues, __pyx_k_cvalues, sizeof(__pyx_k_cvalues), 0, 0, 1, 1},
     {&__pyx_n_s_cxpos, __pyx_k_cxpos, sizeof(__pyx_k_cxpos), 0, 0, 1, 1},
     {&__pyx_n_s_cypos, __pyx_k_cypos, sizeof(__pyx_k_cypos), 0, 0, 1, 1},
     {&__pyx_n_s_d, __pyx_k_d, sizeof(__pyx_k_d), 0, 0, 1, 1},
-    {&__pyx_n_s_da, __pyx_k_da, sizeof(__pyx_k_da), 0, 0, 1, 1},
     {&__pyx_n_s_data, __pyx_k_data, sizeof(__pyx_k_data), 0, 0, 1, 1},
-    {&__pyx_n_s_data_array, __pyx_k_data_array, sizeof(__pyx_k_data_array), 0, 0, 1, 1},
     {&__pyx_n_s_dict, __pyx_k_dict, sizeof(__pyx_k_dict), 0, 0, 1, 1},
     {&__pyx_kp_u_disable, __pyx_k_disable, sizeof(__pyx_k_disable), 0, 1, 0, 0},
+    {&__pyx_n_s_dtype, __pyx_k_dtype, sizeof(__pyx_k_dtype), 0, 0, 1, 1},
     {&__pyx_n_s_dtype_is_object, __pyx_k_dtype_is_object, sizeof(__pyx_k_dtype_is_object), 0, 0, 1, 1},
+    {&__pyx_n_s_empty, __pyx_k_empty, sizeof(__pyx_k_empty), 0, 0, 1, 1},
     {&__pyx_kp_u_enable, __pyx_k_enable, sizeof(__pyx_k_enable), 0, 1, 0, 0},
     {&__pyx_n_s_encode, __pyx_k_encode, sizeof(__pyx_k_encode), 0, 0, 1, 1},
     {&__pyx_n_s_enumerate, __pyx_k_enumerate, sizeof(__pyx_k_enumerate), 0, 0, 1, 1},
     {&__pyx_n_s_error, __pyx_k_error, sizeof(__pyx_k_error), 0, 0, 1, 1},
     {&__pyx_n_s_flags, __pyx_k_flags, sizeof(__pyx_k_flags), 0, 0, 1, 1},
     {&__pyx_n_s_float, __pyx_k_float, sizeof(__pyx_k_float), 0, 0, 1, 1},
+    {&__pyx_n_s_float32, __pyx_k_float32, sizeof(__pyx_k_float32), 0, 0, 1, 1},
     {&__pyx_n_s_float64, __pyx_k_float64, sizeof(__pyx_k_float64), 0, 0, 1, 1},
     {&__pyx_n_s_format, __pyx_k_format, sizeof(__pyx_k_format), 0, 0, 1, 1},
     {&__pyx_n_s_fortran, __pyx_k_fortran, sizeof(__pyx_k_fortran), 0, 0, 1, 1},
@@ -23359,36 +34434,64 @@ static int __Pyx_CreateStringTabAndInitStrings(void) {
     {&__pyx_n_s_getstate, __pyx_k_getstate, sizeof(__pyx_k_getstate), 0, 0, 1, 1},
     {&__pyx_kp_u_got, __pyx_k_got, sizeof(__pyx_k_got), 0, 1, 0, 0},
     {&__pyx_kp_u_got_differing_extents_in_dimensi, __pyx_k_got_differing_extents_in_dimensi, sizeof(__pyx_k_got_differing_extents_in_dimensi), 0, 1, 0, 0},
-    {&__pyx_n_s_i, __pyx_k_i, sizeof(__pyx_k_i), 0, 0, 1, 1},
+    {&__pyx_n_s_height, __pyx_k_height, sizeof(__pyx_k_height), 0, 0, 1, 1},
     {&__pyx_n_s_id, __pyx_k_id, sizeof(__pyx_k_id), 0, 0, 1, 1},
     {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
     {&__pyx_n_s_index, __pyx_k_index, sizeof(__pyx_k_index), 0, 0, 1, 1},
     {&__pyx_n_s_initializing, __pyx_k_initializing, sizeof(__pyx_k_initializing), 0, 0, 1, 1},
-    {&__pyx_n_s_int, __pyx_k_int, sizeof(__pyx_k_int), 0, 0, 1, 1},
+    {&__pyx_n_s_intc, __pyx_k_intc, sizeof(__pyx_k_intc), 0, 0, 1, 1},
     {&__pyx_n_s_inverse_distance, __pyx_k_inverse_distance, sizeof(__pyx_k_inverse_distance), 0, 0, 1, 1},
+    {&__pyx_n_s_inverse_distance_arrays, __pyx_k_inverse_distance_arrays, sizeof(__pyx_k_inverse_distance_arrays), 0, 0, 1, 1},
     {&__pyx_n_s_is_coroutine, __pyx_k_is_coroutine, sizeof(__pyx_k_is_coroutine), 0, 0, 1, 1},
     {&__pyx_kp_u_isenabled, __pyx_k_isenabled, sizeof(__pyx_k_isenabled), 0, 1, 0, 0},
     {&__pyx_n_s_itemsize, __pyx_k_itemsize, sizeof(__pyx_k_itemsize), 0, 0, 1, 1},
     {&__pyx_kp_s_itemsize_0_for_cython_array, __pyx_k_itemsize_0_for_cython_array, sizeof(__pyx_k_itemsize_0_for_cython_array), 0, 0, 1, 0},
-    {&__pyx_n_s_j, __pyx_k_j, sizeof(__pyx_k_j), 0, 0, 1, 1},
+    {&__pyx_n_s_k_nearest, __pyx_k_k_nearest, sizeof(__pyx_k_k_nearest), 0, 0, 1, 1},
+    {&__pyx_kp_s_k_nearest_must_be_0_or_a_positiv, __pyx_k_k_nearest_must_be_0_or_a_positiv, sizeof(__pyx_k_k_nearest_must_be_0_or_a_positiv), 0, 0, 1, 0},
+    {&__pyx_n_s_kind, __pyx_k_kind, sizeof(__pyx_k_kind), 0, 0, 1, 1},
     {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
+    {&__pyx_n_s_mask, __pyx_k_mask, sizeof(__pyx_k_mask), 0, 0, 1, 1},
+    {&__pyx_kp_s_mask_must_have_shape, __pyx_k_mask_must_have_shape, sizeof(__pyx_k_mask_must_have_shape), 0, 0, 1, 0},
+    {&__pyx_n_s_mask_ptr, __pyx_k_mask_ptr, sizeof(__pyx_k_mask_ptr), 0, 0, 1, 1},
+    {&__pyx_n_s_max, __pyx_k_max, sizeof(__pyx_k_max), 0, 0, 1, 1},
+    {&__pyx_n_s_max_radius, __pyx_k_max_radius, sizeof(__pyx_k_max_radius), 0, 0, 1, 1},
+    {&__pyx_kp_s_max_radius_must_be_0_or_a_positi, __pyx_k_max_radius_must_be_0_or_a_positi, sizeof(__pyx_k_max_radius_must_be_0_or_a_positi), 0, 0, 1, 0},
     {&__pyx_n_s_memview, __pyx_k_memview, sizeof(__pyx_k_memview), 0, 0, 1, 1},
+    {&__pyx_n_s_min, __pyx_k_min, sizeof(__pyx_k_min), 0, 0, 1, 1},
+    {&__pyx_n_s_minimum, __pyx_k_minimum, sizeof(__pyx_k_minimum), 0, 0, 1, 1},
+    {&__pyx_n_s_minlength, __pyx_k_minlength, sizeof(__pyx_k_minlength), 0, 0, 1, 1},
     {&__pyx_n_s_mode, __pyx_k_mode, sizeof(__pyx_k_mode), 0, 0, 1, 1},
+    {&__pyx_n_s_n_stations, __pyx_k_n_stations, sizeof(__pyx_k_n_stations), 0, 0, 1, 1},
     {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
     {&__pyx_n_s_name_2, __pyx_k_name_2, sizeof(__pyx_k_name_2), 0, 0, 1, 1},
+    {&__pyx_n_s_nan, __pyx_k_nan, sizeof(__pyx_k_nan), 0, 0, 1, 1},
     {&__pyx_n_s_ndim, __pyx_k_ndim, sizeof(__pyx_k_ndim), 0, 0, 1, 1},
     {&__pyx_n_s_new, __pyx_k_new, sizeof(__pyx_k_new), 0, 0, 1, 1},
     {&__pyx_kp_s_no_default___reduce___due_to_non, __pyx_k_no_default___reduce___due_to_non, sizeof(__pyx_k_no_default___reduce___due_to_non), 0, 0, 1, 0},
+    {&__pyx_n_s_nodata, __pyx_k_nodata, sizeof(__pyx_k_nodata), 0, 0, 1, 1},
     {&__pyx_n_s_np, __pyx_k_np, sizeof(__pyx_k_np), 0, 0, 1, 1},
+    {&__pyx_n_s_num_threads, __pyx_k_num_threads, sizeof(__pyx_k_num_threads), 0, 0, 1, 1},
     {&__pyx_n_s_numpy, __pyx_k_numpy, sizeof(__pyx_k_numpy), 0, 0, 1, 1},
     {&__pyx_kp_s_numpy__core_multiarray_failed_to, __pyx_k_numpy__core_multiarray_failed_to, sizeof(__pyx_k_numpy__core_multiarray_failed_to), 0, 0, 1, 0},
     {&__pyx_kp_s_numpy__core_umath_failed_to_impo, __pyx_k_numpy__core_umath_failed_to_impo, sizeof(__pyx_k_numpy__core_umath_failed_to_impo), 0, 0, 1, 0},
+    {&__pyx_n_s_nx, __pyx_k_nx, sizeof(__pyx_k_nx), 0, 0, 1, 1},
+    {&__pyx_n_s_ny, __pyx_k_ny, sizeof(__pyx_k_ny), 0, 0, 1, 1},
     {&__pyx_n_s_obj, __pyx_k_obj, sizeof(__pyx_k_obj), 0, 0, 1, 1},
+    {&__pyx_n_s_order, __pyx_k_order, sizeof(__pyx_k_order), 0, 0, 1, 1},
+    {&__pyx_n_s_os, __pyx_k_os, sizeof(__pyx_k_os), 0, 0, 1, 1},
+    {&__pyx_n_s_out, __pyx_k_out, sizeof(__pyx_k_out), 0, 0, 1, 1},
+    {&__pyx_n_s_out32, __pyx_k_out32, sizeof(__pyx_k_out32), 0, 0, 1, 1},
+    {&__pyx_n_s_out64, __pyx_k_out64, sizeof(__pyx_k_out64), 0, 0, 1, 1},
+    {&__pyx_kp_s_out_must_be_a_C_contiguous_float, __pyx_k_out_must_be_a_C_contiguous_float, sizeof(__pyx_k_out_must_be_a_C_contiguous_float), 0, 0, 1, 0},
     {&__pyx_n_s_pack, __pyx_k_pack, sizeof(__pyx_k_pack), 0, 0, 1, 1},
+    {&__pyx_n_s_per_bucket, __pyx_k_per_bucket, sizeof(__pyx_k_per_bucket), 0, 0, 1, 1},
     {&__pyx_n_s_pickle, __pyx_k_pickle, sizeof(__pyx_k_pickle), 0, 0, 1, 1},
     {&__pyx_n_s_power, __pyx_k_power, sizeof(__pyx_k_power), 0, 0, 1, 1},
+    {&__pyx_n_s_precision, __pyx_k_precision, sizeof(__pyx_k_precision), 0, 0, 1, 1},
+    {&__pyx_kp_s_precision_must_be_float32_or_flo, __pyx_k_precision_must_be_float32_or_flo, sizeof(__pyx_k_precision_must_be_float32_or_flo), 0, 0, 1, 0},
     {&__pyx_kp_s_pymica_methods_inverse_distance, __pyx_k_pymica_methods_inverse_distance, sizeof(__pyx_k_pymica_methods_inverse_distance), 0, 0, 1, 0},
     {&__pyx_n_s_pymica_methods_inverse_distance_2, __pyx_k_pymica_methods_inverse_distance_2, sizeof(__pyx_k_pymica_methods_inverse_distance_2), 0, 0, 1, 1},
+    {&__pyx_n_s_pymica_methods_station_arrays, __pyx_k_pymica_methods_station_arrays, sizeof(__pyx_k_pymica_methods_station_arrays), 0, 0, 1, 1},
     {&__pyx_n_s_pyx_PickleError, __pyx_k_pyx_PickleError, sizeof(__pyx_k_pyx_PickleError), 0, 0, 1, 1},
     {&__pyx_n_s_pyx_checksum, __pyx_k_pyx_checksum, sizeof(__pyx_k_pyx_checksum), 0, 0, 1, 1},
     {&__pyx_n_s_pyx_result, __pyx_k_pyx_result, sizeof(__pyx_k_pyx_result), 0, 0, 1, 1},
@@ -23401,14 +34504,17 @@ static int __Pyx_CreateStringTabAndInitStrings(void) {
     {&__pyx_n_s_reduce_cython, __pyx_k_reduce_cython, sizeof(__pyx_k_reduce_cython), 0, 0, 1, 1},
     {&__pyx_n_s_reduce_ex, __pyx_k_reduce_ex, sizeof(__pyx_k_reduce_ex), 0, 0, 1, 1},
     {&__pyx_n_s_register, __pyx_k_register, sizeof(__pyx_k_register), 0, 0, 1, 1},
-    {&__pyx_n_s_reshape, __pyx_k_reshape, sizeof(__pyx_k_reshape), 0, 0, 1, 1},
     {&__pyx_n_s_setstate, __pyx_k_setstate, sizeof(__pyx_k_setstate), 0, 0, 1, 1},
     {&__pyx_n_s_setstate_cython, __pyx_k_setstate_cython, sizeof(__pyx_k_setstate_cython), 0, 0, 1, 1},
     {&__pyx_n_s_shape, __pyx_k_shape, sizeof(__pyx_k_shape), 0, 0, 1, 1},
+    {&__pyx_n_s_single, __pyx_k_single, sizeof(__pyx_k_single), 0, 0, 1, 1},
     {&__pyx_n_s_size, __pyx_k_size, sizeof(__pyx_k_size), 0, 0, 1, 1},
     {&__pyx_n_s_smoothing, __pyx_k_smoothing, sizeof(__pyx_k_smoothing), 0, 0, 1, 1},
     {&__pyx_n_s_spec, __pyx_k_spec, sizeof(__pyx_k_spec), 0, 0, 1, 1},
+    {&__pyx_n_s_sqrt, __pyx_k_sqrt, sizeof(__pyx_k_sqrt), 0, 0, 1, 1},
+    {&__pyx_n_s_stable, __pyx_k_stable, sizeof(__pyx_k_stable), 0, 0, 1, 1},
     {&__pyx_n_s_start, __pyx_k_start, sizeof(__pyx_k_start), 0, 0, 1, 1},
+    {&__pyx_n_s_station_arrays, __pyx_k_station_arrays, sizeof(__pyx_k_station_arrays), 0, 0, 1, 1},
     {&__pyx_n_s_step, __pyx_k_step, sizeof(__pyx_k_step), 0, 0, 1, 1},
     {&__pyx_n_s_stop, __pyx_k_stop, sizeof(__pyx_k_stop), 0, 0, 1, 1},
     {&__pyx_kp_s_strided_and_direct, __pyx_k_strided_and_direct, sizeof(__pyx_k_strided_and_direct), 0, 0, 1, 0},
@@ -23419,31 +34525,35 @@ static int __Pyx_CreateStringTabAndInitStrings(void) {
     {&__pyx_n_s_sys, __pyx_k_sys, sizeof(__pyx_k_sys), 0, 0, 1, 1},
     {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
     {&__pyx_n_s_typing, __pyx_k_typing, sizeof(__pyx_k_typing), 0, 0, 1, 1},
+    {&__pyx_n_s_uint8, __pyx_k_uint8, sizeof(__pyx_k_uint8), 0, 0, 1, 1},
     {&__pyx_kp_s_unable_to_allocate_array_data, __pyx_k_unable_to_allocate_array_data, sizeof(__pyx_k_unable_to_allocate_array_data), 0, 0, 1, 0},
     {&__pyx_kp_s_unable_to_allocate_shape_and_str, __pyx_k_unable_to_allocate_shape_and_str, sizeof(__pyx_k_unable_to_allocate_shape_and_str), 0, 0, 1, 0},
     {&__pyx_n_s_unpack, __pyx_k_unpack, sizeof(__pyx_k_unpack), 0, 0, 1, 1},
     {&__pyx_n_s_update, __pyx_k_update, sizeof(__pyx_k_update), 0, 0, 1, 1},
     {&__pyx_n_s_value, __pyx_k_value, sizeof(__pyx_k_value), 0, 0, 1, 1},
     {&__pyx_n_s_values, __pyx_k_values, sizeof(__pyx_k_values), 0, 0, 1, 1},
-    {&__pyx_n_s_values0, __pyx_k_values0, sizeof(__pyx_k_values0), 0, 0, 1, 1},
     {&__pyx_n_s_version_info, __pyx_k_version_info, sizeof(__pyx_k_version_info), 0, 0, 1, 1},
+    {&__pyx_n_s_view, __pyx_k_view, sizeof(__pyx_k_view), 0, 0, 1, 1},
+    {&__pyx_n_s_width, __pyx_k_width, sizeof(__pyx_k_width), 0, 0, 1, 1},
     {&__pyx_n_s_x, __pyx_k_x, sizeof(__pyx_k_x), 0, 0, 1, 1},
+    {&__pyx_n_s_x0, __pyx_k_x0, sizeof(__pyx_k_x0), 0, 0, 1, 1},
     {&__pyx_n_s_xpos, __pyx_k_xpos, sizeof(__pyx_k_xpos), 0, 0, 1, 1},
-    {&__pyx_n_s_xpos0, __pyx_k_xpos0, sizeof(__pyx_k_xpos0), 0, 0, 1, 1},
+    {&__pyx_kp_s_xpos_ypos_and_values_must_have_t, __pyx_k_xpos_ypos_and_values_must_have_t, sizeof(__pyx_k_xpos_ypos_and_values_must_have_t), 0, 0, 1, 0},
     {&__pyx_n_s_xsize, __pyx_k_xsize, sizeof(__pyx_k_xsize), 0, 0, 1, 1},
     {&__pyx_n_s_y, __pyx_k_y, sizeof(__pyx_k_y), 0, 0, 1, 1},
+    {&__pyx_n_s_y0, __pyx_k_y0, sizeof(__pyx_k_y0), 0, 0, 1, 1},
     {&__pyx_n_s_ypos, __pyx_k_ypos, sizeof(__pyx_k_ypos), 0, 0, 1, 1},
-    {&__pyx_n_s_ypos0, __pyx_k_ypos0, sizeof(__pyx_k_ypos0), 0, 0, 1, 1},
     {&__pyx_n_s_ysize, __pyx_k_ysize, sizeof(__pyx_k_ysize), 0, 0, 1, 1},
+    {&__pyx_n_s_zeros, __pyx_k_zeros, sizeof(__pyx_k_zeros), 0, 0, 1, 1},
     {0, 0, 0, 0, 0, 0, 0}
   };
   return __Pyx_InitStrings(__pyx_string_tab);
 }
 /* #### Code section: cached_builtins ### */
 static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 69, __pyx_L1_error)
+  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 122, __pyx_L1_error)
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 267, __pyx_L1_error)
   __pyx_builtin___import__ = __Pyx_GetBuiltinName(__pyx_n_s_import); if (!__pyx_builtin___import__) __PYX_ERR(1, 100, __pyx_L1_error)
-  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(1, 141, __pyx_L1_error)
   __pyx_builtin_MemoryError = __Pyx_GetBuiltinName(__pyx_n_s_MemoryError); if (!__pyx_builtin_MemoryError) __PYX_ERR(1, 156, __pyx_L1_error)
   __pyx_builtin_enumerate = __Pyx_GetBuiltinName(__pyx_n_s_enumerate); if (!__pyx_builtin_enumerate) __PYX_ERR(1, 159, __pyx_L1_error)
   __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_n_s_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(1, 2, __pyx_L1_error)
@@ -23451,7 +34561,7 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
   __pyx_builtin_Ellipsis = __Pyx_GetBuiltinName(__pyx_n_s_Ellipsis); if (!__pyx_builtin_Ellipsis) __PYX_ERR(1, 408, __pyx_L1_error)
   __pyx_builtin_id = __Pyx_GetBuiltinName(__pyx_n_s_id); if (!__pyx_builtin_id) __PYX_ERR(1, 618, __pyx_L1_error)
   __pyx_builtin_IndexError = __Pyx_GetBuiltinName(__pyx_n_s_IndexError); if (!__pyx_builtin_IndexError) __PYX_ERR(1, 914, __pyx_L1_error)
-  __pyx_builtin_ImportError = __Pyx_GetBuiltinName(__pyx_n_s_ImportError); if (!__pyx_builtin_ImportError) __PYX_ERR(2, 1043, __pyx_L1_error)
+  __pyx_builtin_ImportError = __Pyx_GetBuiltinName(__pyx_n_s_ImportError); if (!__pyx_builtin_ImportError) __PYX_ERR(2, 1011, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
   return -1;
@@ -23498,28 +34608,94 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
   __Pyx_GOTREF(__pyx_tuple__8);
   __Pyx_GIVEREF(__pyx_tuple__8);
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1043
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1011
  *         __pyx_import_array()
  *     except Exception:
  *         raise ImportError("numpy._core.multiarray failed to import")             # <<<<<<<<<<<<<<
  * 
  * cdef inline int import_umath() except -1:
  */
-  __pyx_tuple__9 = PyTuple_Pack(1, __pyx_kp_s_numpy__core_multiarray_failed_to); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(2, 1043, __pyx_L1_error)
+  __pyx_tuple__9 = PyTuple_Pack(1, __pyx_kp_s_numpy__core_multiarray_failed_to); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(2, 1011, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__9);
   __Pyx_GIVEREF(__pyx_tuple__9);
 
-  /* "../../../../miniconda3/envs/pymica-nou/lib/python3.13/site-packages/numpy/__init__.cython-30.pxd":1049
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.cython-30.pxd":1017
  *         _import_umath()
  *     except Exception:
  *         raise ImportError("numpy._core.umath failed to import")             # <<<<<<<<<<<<<<
  * 
  * cdef inline int import_ufunc() except -1:
  */
-  __pyx_tuple__10 = PyTuple_Pack(1, __pyx_kp_s_numpy__core_umath_failed_to_impo); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(2, 1049, __pyx_L1_error)
+  __pyx_tuple__10 = PyTuple_Pack(1, __pyx_kp_s_numpy__core_umath_failed_to_impo); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(2, 1017, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__10);
   __Pyx_GIVEREF(__pyx_tuple__10);
 
+  /* "pymica/methods/inverse_distance.pyx":76
+ *         np.array: The interpolated data, `out` if it was provided
+ *     """
+ *     xpos, ypos, values = station_arrays(data, ('x', 'y', 'value'))             # <<<<<<<<<<<<<<
+ * 
+ *     return inverse_distance_arrays(xpos, ypos, values, size, geotransform,
+ */
+  __pyx_tuple__11 = PyTuple_Pack(3, __pyx_n_s_x, __pyx_n_s_y, __pyx_n_s_value); if (unlikely(!__pyx_tuple__11)) __PYX_ERR(0, 76, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__11);
+  __Pyx_GIVEREF(__pyx_tuple__11);
+
+  /* "pymica/methods/inverse_distance.pyx":122
+ *     N = cvalues.shape[0]
+ *     if cxpos.shape[0] != N or cypos.shape[0] != N:
+ *         raise ValueError("xpos, ypos and values must have the same length")             # <<<<<<<<<<<<<<
+ *     if k_nearest < 0:
+ *         raise ValueError("k_nearest must be 0 or a positive number of stations")
+ */
+  __pyx_tuple__12 = PyTuple_Pack(1, __pyx_kp_s_xpos_ypos_and_values_must_have_t); if (unlikely(!__pyx_tuple__12)) __PYX_ERR(0, 122, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__12);
+  __Pyx_GIVEREF(__pyx_tuple__12);
+
+  /* "pymica/methods/inverse_distance.pyx":124
+ *         raise ValueError("xpos, ypos and values must have the same length")
+ *     if k_nearest < 0:
+ *         raise ValueError("k_nearest must be 0 or a positive number of stations")             # <<<<<<<<<<<<<<
+ *     if max_radius < 0:
+ *         raise ValueError("max_radius must be 0 or a positive distance")
+ */
+  __pyx_tuple__13 = PyTuple_Pack(1, __pyx_kp_s_k_nearest_must_be_0_or_a_positiv); if (unlikely(!__pyx_tuple__13)) __PYX_ERR(0, 124, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__13);
+  __Pyx_GIVEREF(__pyx_tuple__13);
+
+  /* "pymica/methods/inverse_distance.pyx":126
+ *         raise ValueError("k_nearest must be 0 or a positive number of stations")
+ *     if max_radius < 0:
+ *         raise ValueError("max_radius must be 0 or a positive distance")             # <<<<<<<<<<<<<<
+ *     if precision not in ('float32', 'float64'):
+ *         raise ValueError("precision must be 'float32' or 'float64'")
+ */
+  __pyx_tuple__14 = PyTuple_Pack(1, __pyx_kp_s_max_radius_must_be_0_or_a_positi); if (unlikely(!__pyx_tuple__14)) __PYX_ERR(0, 126, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__14);
+  __Pyx_GIVEREF(__pyx_tuple__14);
+
+  /* "pymica/methods/inverse_distance.pyx":128
+ *         raise ValueError("max_radius must be 0 or a positive distance")
+ *     if precision not in ('float32', 'float64'):
+ *         raise ValueError("precision must be 'float32' or 'float64'")             # <<<<<<<<<<<<<<
+ *     cdef bint single = precision == 'float32'
+ * 
+ */
+  __pyx_tuple__15 = PyTuple_Pack(1, __pyx_kp_s_precision_must_be_float32_or_flo); if (unlikely(!__pyx_tuple__15)) __PYX_ERR(0, 128, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__15);
+  __Pyx_GIVEREF(__pyx_tuple__15);
+
+  /* "pymica/methods/inverse_distance.pyx":542
+ * 
+ *     start = np.zeros(nx * ny + 1, dtype=np.intc)
+ *     np.cumsum(np.bincount(bucket, minlength=nx * ny), out=start[1:])             # <<<<<<<<<<<<<<
+ * 
+ *     return (np.ascontiguousarray(xpos[order]),
+ */
+  __pyx_slice__16 = PySlice_New(__pyx_int_1, Py_None, Py_None); if (unlikely(!__pyx_slice__16)) __PYX_ERR(0, 542, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_slice__16);
+  __Pyx_GIVEREF(__pyx_slice__16);
+
   /* "View.MemoryView":100
  * cdef object __pyx_collections_abc_Sequence "__pyx_collections_abc_Sequence"
  * try:
@@ -23527,12 +34703,12 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  *         __pyx_collections_abc_Sequence = __import__("collections.abc").abc.Sequence
  *     else:
  */
-  __pyx_tuple__11 = PyTuple_Pack(1, __pyx_n_s_sys); if (unlikely(!__pyx_tuple__11)) __PYX_ERR(1, 100, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__11);
-  __Pyx_GIVEREF(__pyx_tuple__11);
-  __pyx_tuple__12 = PyTuple_Pack(2, __pyx_int_3, __pyx_int_3); if (unlikely(!__pyx_tuple__12)) __PYX_ERR(1, 100, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__12);
-  __Pyx_GIVEREF(__pyx_tuple__12);
+  __pyx_tuple__17 = PyTuple_Pack(1, __pyx_n_s_sys); if (unlikely(!__pyx_tuple__17)) __PYX_ERR(1, 100, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__17);
+  __Pyx_GIVEREF(__pyx_tuple__17);
+  __pyx_tuple__18 = PyTuple_Pack(2, __pyx_int_3, __pyx_int_3); if (unlikely(!__pyx_tuple__18)) __PYX_ERR(1, 100, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__18);
+  __Pyx_GIVEREF(__pyx_tuple__18);
 
   /* "View.MemoryView":101
  * try:
@@ -23541,9 +34717,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  *     else:
  *         __pyx_collections_abc_Sequence = __import__("collections").Sequence
  */
-  __pyx_tuple__13 = PyTuple_Pack(1, __pyx_kp_s_collections_abc); if (unlikely(!__pyx_tuple__13)) __PYX_ERR(1, 101, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__13);
-  __Pyx_GIVEREF(__pyx_tuple__13);
+  __pyx_tuple__19 = PyTuple_Pack(1, __pyx_kp_s_collections_abc); if (unlikely(!__pyx_tuple__19)) __PYX_ERR(1, 101, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__19);
+  __Pyx_GIVEREF(__pyx_tuple__19);
 
   /* "View.MemoryView":103
  *         __pyx_collections_abc_Sequence = __import__("collections.abc").abc.Sequence
@@ -23552,9 +34728,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * except:
  * 
  */
-  __pyx_tuple__14 = PyTuple_Pack(1, __pyx_n_s_collections); if (unlikely(!__pyx_tuple__14)) __PYX_ERR(1, 103, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__14);
-  __Pyx_GIVEREF(__pyx_tuple__14);
+  __pyx_tuple__20 = PyTuple_Pack(1, __pyx_n_s_collections); if (unlikely(!__pyx_tuple__20)) __PYX_ERR(1, 103, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__20);
+  __Pyx_GIVEREF(__pyx_tuple__20);
 
   /* "View.MemoryView":309
  *         return self.name
@@ -23563,9 +34739,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * cdef strided = Enum("<strided and direct>") # default
  * cdef indirect = Enum("<strided and indirect>")
  */
-  __pyx_tuple__15 = PyTuple_Pack(1, __pyx_kp_s_strided_and_direct_or_indirect); if (unlikely(!__pyx_tuple__15)) __PYX_ERR(1, 309, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__15);
-  __Pyx_GIVEREF(__pyx_tuple__15);
+  __pyx_tuple__21 = PyTuple_Pack(1, __pyx_kp_s_strided_and_direct_or_indirect); if (unlikely(!__pyx_tuple__21)) __PYX_ERR(1, 309, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__21);
+  __Pyx_GIVEREF(__pyx_tuple__21);
 
   /* "View.MemoryView":310
  * 
@@ -23574,9 +34750,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * cdef indirect = Enum("<strided and indirect>")
  * 
  */
-  __pyx_tuple__16 = PyTuple_Pack(1, __pyx_kp_s_strided_and_direct); if (unlikely(!__pyx_tuple__16)) __PYX_ERR(1, 310, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__16);
-  __Pyx_GIVEREF(__pyx_tuple__16);
+  __pyx_tuple__22 = PyTuple_Pack(1, __pyx_kp_s_strided_and_direct); if (unlikely(!__pyx_tuple__22)) __PYX_ERR(1, 310, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__22);
+  __Pyx_GIVEREF(__pyx_tuple__22);
 
   /* "View.MemoryView":311
  * cdef generic = Enum("<strided and direct or indirect>")
@@ -23585,9 +34761,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * 
  * 
  */
-  __pyx_tuple__17 = PyTuple_Pack(1, __pyx_kp_s_strided_and_indirect); if (unlikely(!__pyx_tuple__17)) __PYX_ERR(1, 311, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__17);
-  __Pyx_GIVEREF(__pyx_tuple__17);
+  __pyx_tuple__23 = PyTuple_Pack(1, __pyx_kp_s_strided_and_indirect); if (unlikely(!__pyx_tuple__23)) __PYX_ERR(1, 311, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__23);
+  __Pyx_GIVEREF(__pyx_tuple__23);
 
   /* "View.MemoryView":314
  * 
@@ -23596,9 +34772,9 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * cdef indirect_contiguous = Enum("<contiguous and indirect>")
  * 
  */
-  __pyx_tuple__18 = PyTuple_Pack(1, __pyx_kp_s_contiguous_and_direct); if (unlikely(!__pyx_tuple__18)) __PYX_ERR(1, 314, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__18);
-  __Pyx_GIVEREF(__pyx_tuple__18);
+  __pyx_tuple__24 = PyTuple_Pack(1, __pyx_kp_s_contiguous_and_direct); if (unlikely(!__pyx_tuple__24)) __PYX_ERR(1, 314, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__24);
+  __Pyx_GIVEREF(__pyx_tuple__24);
 
   /* "View.MemoryView":315
  * 
@@ -23607,31 +34783,55 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * 
  * 
  */
-  __pyx_tuple__19 = PyTuple_Pack(1, __pyx_kp_s_contiguous_and_indirect); if (unlikely(!__pyx_tuple__19)) __PYX_ERR(1, 315, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__19);
-  __Pyx_GIVEREF(__pyx_tuple__19);
+  __pyx_tuple__25 = PyTuple_Pack(1, __pyx_kp_s_contiguous_and_indirect); if (unlikely(!__pyx_tuple__25)) __PYX_ERR(1, 315, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__25);
+  __Pyx_GIVEREF(__pyx_tuple__25);
 
   /* "(tree fragment)":1
  * def __pyx_unpickle_Enum(__pyx_type, long __pyx_checksum, __pyx_state):             # <<<<<<<<<<<<<<
  *     cdef object __pyx_PickleError
  *     cdef object __pyx_result
  */
-  __pyx_tuple__20 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__20)) __PYX_ERR(1, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__20);
-  __Pyx_GIVEREF(__pyx_tuple__20);
-  __pyx_codeobj__21 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__20, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_Enum, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__21)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __pyx_tuple__26 = PyTuple_Pack(5, __pyx_n_s_pyx_type, __pyx_n_s_pyx_checksum, __pyx_n_s_pyx_state, __pyx_n_s_pyx_PickleError, __pyx_n_s_pyx_result); if (unlikely(!__pyx_tuple__26)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__26);
+  __Pyx_GIVEREF(__pyx_tuple__26);
+  __pyx_codeobj__27 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__26, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_pyx_unpickle_Enum, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__27)) __PYX_ERR(1, 1, __pyx_L1_error)
 
-  /* "pymica/methods/inverse_distance.pyx":18
+  /* "pymica/methods/inverse_distance.pyx":28
  * ctypedef np.float64_t DTYPE_t
  * 
- * def inverse_distance(data: List[Dict[str, float]],             # <<<<<<<<<<<<<<
+ * def inverse_distance(data: Union[List[Dict[str, float]], np.ndarray],             # <<<<<<<<<<<<<<
  *                      size: List[int], geotransform: List[int],
- *                      power: int=2, smoothing: float=0.0):
+ *                      power: float=2, smoothing: float=0.0, int num_threads=1,
  */
-  __pyx_tuple__22 = PyTuple_Pack(27, __pyx_n_s_data, __pyx_n_s_size, __pyx_n_s_geotransform, __pyx_n_s_power, __pyx_n_s_smoothing, __pyx_n_s_da, __pyx_n_s_cda, __pyx_n_s_xpos0, __pyx_n_s_ypos0, __pyx_n_s_values0, __pyx_n_s_d, __pyx_n_s_N, __pyx_n_s_xpos, __pyx_n_s_cxpos, __pyx_n_s_ypos, __pyx_n_s_cypos, __pyx_n_s_values, __pyx_n_s_cvalues, __pyx_n_s_i, __pyx_n_s_j, __pyx_n_s_xsize, __pyx_n_s_ysize, __pyx_n_s_y, __pyx_n_s_x, __pyx_n_s_geotransform0, __pyx_n_s_cgeotransform, __pyx_n_s_data_array); if (unlikely(!__pyx_tuple__22)) __PYX_ERR(0, 18, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__22);
-  __Pyx_GIVEREF(__pyx_tuple__22);
-  __pyx_codeobj__23 = (PyObject*)__Pyx_PyCode_New(5, 0, 0, 27, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__22, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_pymica_methods_inverse_distance, __pyx_n_s_inverse_distance, 18, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__23)) __PYX_ERR(0, 18, __pyx_L1_error)
+  __pyx_tuple__28 = PyTuple_Pack(15, __pyx_n_s_data, __pyx_n_s_size, __pyx_n_s_geotransform, __pyx_n_s_power, __pyx_n_s_smoothing, __pyx_n_s_num_threads, __pyx_n_s_k_nearest, __pyx_n_s_max_radius, __pyx_n_s_out, __pyx_n_s_mask, __pyx_n_s_nodata, __pyx_n_s_precision, __pyx_n_s_xpos, __pyx_n_s_ypos, __pyx_n_s_values); if (unlikely(!__pyx_tuple__28)) __PYX_ERR(0, 28, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__28);
+  __Pyx_GIVEREF(__pyx_tuple__28);
+  __pyx_codeobj__29 = (PyObject*)__Pyx_PyCode_New(12, 0, 0, 15, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__28, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_pymica_methods_inverse_distance, __pyx_n_s_inverse_distance, 28, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__29)) __PYX_ERR(0, 28, __pyx_L1_error)
+
+  /* "pymica/methods/inverse_distance.pyx":83
+ * 
+ * 
+ * def inverse_distance_arrays(xpos, ypos, values,             # <<<<<<<<<<<<<<
+ *                             size: List[int], geotransform: List[int],
+ *                             power: float=2, smoothing: float=0.0,
+ */
+  __pyx_tuple__30 = PyTuple_Pack(29, __pyx_n_s_xpos, __pyx_n_s_ypos, __pyx_n_s_values, __pyx_n_s_size, __pyx_n_s_geotransform, __pyx_n_s_power, __pyx_n_s_smoothing, __pyx_n_s_num_threads, __pyx_n_s_k_nearest, __pyx_n_s_max_radius, __pyx_n_s_out, __pyx_n_s_mask, __pyx_n_s_nodata, __pyx_n_s_precision, __pyx_n_s_cxpos, __pyx_n_s_cypos, __pyx_n_s_cvalues, __pyx_n_s_N, __pyx_n_s_single, __pyx_n_s_xsize, __pyx_n_s_ysize, __pyx_n_s_cpower, __pyx_n_s_csmoothing, __pyx_n_s_geotransform0, __pyx_n_s_cgeotransform, __pyx_n_s_cmask, __pyx_n_s_mask_ptr, __pyx_n_s_out32, __pyx_n_s_out64); if (unlikely(!__pyx_tuple__30)) __PYX_ERR(0, 83, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__30);
+  __Pyx_GIVEREF(__pyx_tuple__30);
+  __pyx_codeobj__31 = (PyObject*)__Pyx_PyCode_New(14, 0, 0, 29, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__30, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_pymica_methods_inverse_distance, __pyx_n_s_inverse_distance_arrays, 83, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__31)) __PYX_ERR(0, 83, __pyx_L1_error)
+
+  /* "pymica/methods/inverse_distance.pyx":494
+ * 
+ * 
+ * def build_grid_index(xpos, ypos, values, int k_nearest=0):             # <<<<<<<<<<<<<<
+ *     """
+ *     build_grid_index(xpos, ypos, values)
+ */
+  __pyx_tuple__32 = PyTuple_Pack(18, __pyx_n_s_xpos, __pyx_n_s_ypos, __pyx_n_s_values, __pyx_n_s_k_nearest, __pyx_n_s_n_stations, __pyx_n_s_x0, __pyx_n_s_y0, __pyx_n_s_width, __pyx_n_s_height, __pyx_n_s_per_bucket, __pyx_n_s_cell_size, __pyx_n_s_nx, __pyx_n_s_ny, __pyx_n_s_bucket_x, __pyx_n_s_bucket_y, __pyx_n_s_bucket, __pyx_n_s_order, __pyx_n_s_start); if (unlikely(!__pyx_tuple__32)) __PYX_ERR(0, 494, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__32);
+  __Pyx_GIVEREF(__pyx_tuple__32);
+  __pyx_codeobj__33 = (PyObject*)__Pyx_PyCode_New(4, 0, 0, 18, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__32, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_pymica_methods_inverse_distance, __pyx_n_s_build_grid_index, 494, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__33)) __PYX_ERR(0, 494, __pyx_L1_error)
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -23642,10 +34842,13 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
 
 static CYTHON_SMALL_CODE int __Pyx_InitConstants(void) {
   if (__Pyx_CreateStringTabAndInitStrings() < 0) __PYX_ERR(0, 1, __pyx_L1_error);
+  __pyx_float_1_0 = PyFloat_FromDouble(1.0); if (unlikely(!__pyx_float_1_0)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_1 = PyInt_FromLong(1); if (unlikely(!__pyx_int_1)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_2 = PyInt_FromLong(2); if (unlikely(!__pyx_int_2)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_3 = PyInt_FromLong(3); if (unlikely(!__pyx_int_3)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_4 = PyInt_FromLong(4); if (unlikely(!__pyx_int_4)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_16 = PyInt_FromLong(16); if (unlikely(!__pyx_int_16)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_112105877 = PyInt_FromLong(112105877L); if (unlikely(!__pyx_int_112105877)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_136983863 = PyInt_FromLong(136983863L); if (unlikely(!__pyx_int_136983863)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_184977713 = PyInt_FromLong(184977713L); if (unlikely(!__pyx_int_184977713)) __PYX_ERR(0, 1, __pyx_L1_error)
@@ -23679,6 +34882,13 @@ if (unlikely(_import_array() == -1)) {
 #endif
 #endif
 
+if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 1, __pyx_L1_error)
+
+  /* InitThreads.init */
+  #if defined(WITH_THREAD) && PY_VERSION_HEX < 0x030700F0
+PyEval_InitThreads();
+#endif
+
 if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 1, __pyx_L1_error)
 
   return 0;
@@ -23889,7 +35099,7 @@ static int __Pyx_modinit_type_import_code(void) {
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__Pyx_modinit_type_import_code", 0);
   /*--- Type import code ---*/
-  __pyx_t_1 = PyImport_ImportModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_t_1)) __PYX_ERR(5, 9, __pyx_L1_error)
+  __pyx_t_1 = PyImport_ImportModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_t_1)) __PYX_ERR(6, 9, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_ptype_7cpython_4type_type = __Pyx_ImportType_3_0_12(__pyx_t_1, __Pyx_BUILTIN_MODULE_NAME, "type", 
   #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
@@ -23899,33 +35109,33 @@ static int __Pyx_modinit_type_import_code(void) {
   #else
   sizeof(PyHeapTypeObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_12(PyHeapTypeObject),
   #endif
-  __Pyx_ImportType_CheckSize_Warn_3_0_12); if (!__pyx_ptype_7cpython_4type_type) __PYX_ERR(5, 9, __pyx_L1_error)
+  __Pyx_ImportType_CheckSize_Warn_3_0_12); if (!__pyx_ptype_7cpython_4type_type) __PYX_ERR(6, 9, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyImport_ImportModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_t_1)) __PYX_ERR(6, 8, __pyx_L1_error)
+  __pyx_t_1 = PyImport_ImportModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_t_1)) __PYX_ERR(7, 8, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_ptype_7cpython_4bool_bool = __Pyx_ImportType_3_0_12(__pyx_t_1, __Pyx_BUILTIN_MODULE_NAME, "bool", sizeof(PyBoolObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_12(PyBoolObject),__Pyx_ImportType_CheckSize_Warn_3_0_12); if (!__pyx_ptype_7cpython_4bool_bool) __PYX_ERR(6, 8, __pyx_L1_error)
+  __pyx_ptype_7cpython_4bool_bool = __Pyx_ImportType_3_0_12(__pyx_t_1, __Pyx_BUILTIN_MODULE_NAME, "bool", sizeof(PyBoolObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_12(PyBoolObject),__Pyx_ImportType_CheckSize_Warn_3_0_12); if (!__pyx_ptype_7cpython_4bool_bool) __PYX_ERR(7, 8, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyImport_ImportModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_t_1)) __PYX_ERR(7, 15, __pyx_L1_error)
+  __pyx_t_1 = PyImport_ImportModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_t_1)) __PYX_ERR(8, 15, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_ptype_7cpython_7complex_complex = __Pyx_ImportType_3_0_12(__pyx_t_1, __Pyx_BUILTIN_MODULE_NAME, "complex", sizeof(PyComplexObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_12(PyComplexObject),__Pyx_ImportType_CheckSize_Warn_3_0_12); if (!__pyx_ptype_7cpython_7complex_complex) __PYX_ERR(7, 15, __pyx_L1_error)
+  __pyx_ptype_7cpython_7complex_complex = __Pyx_ImportType_3_0_12(__pyx_t_1, __Pyx_BUILTIN_MODULE_NAME, "complex", sizeof(PyComplexObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_12(PyComplexObject),__Pyx_ImportType_CheckSize_Warn_3_0_12); if (!__pyx_ptype_7cpython_7complex_complex) __PYX_ERR(8, 15, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyImport_ImportModule("numpy"); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 272, __pyx_L1_error)
+  __pyx_t_1 = PyImport_ImportModule("numpy"); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 229, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_ptype_5numpy_dtype = __Pyx_ImportType_3_0_12(__pyx_t_1, "numpy", "dtype", sizeof(PyArray_Descr), __PYX_GET_STRUCT_ALIGNMENT_3_0_12(PyArray_Descr),__Pyx_ImportType_CheckSize_Ignore_3_0_12); if (!__pyx_ptype_5numpy_dtype) __PYX_ERR(2, 272, __pyx_L1_error)
-  __pyx_ptype_5numpy_flatiter = __Pyx_ImportType_3_0_12(__pyx_t_1, "numpy", "flatiter", sizeof(PyArrayIterObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_12(PyArrayIterObject),__Pyx_ImportType_CheckSize_Ignore_3_0_12); if (!__pyx_ptype_5numpy_flatiter) __PYX_ERR(2, 317, __pyx_L1_error)
-  __pyx_ptype_5numpy_broadcast = __Pyx_ImportType_3_0_12(__pyx_t_1, "numpy", "broadcast", sizeof(PyArrayMultiIterObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_12(PyArrayMultiIterObject),__Pyx_ImportType_CheckSize_Ignore_3_0_12); if (!__pyx_ptype_5numpy_broadcast) __PYX_ERR(2, 321, __pyx_L1_error)
-  __pyx_ptype_5numpy_ndarray = __Pyx_ImportType_3_0_12(__pyx_t_1, "numpy", "ndarray", sizeof(PyArrayObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_12(PyArrayObject),__Pyx_ImportType_CheckSize_Ignore_3_0_12); if (!__pyx_ptype_5numpy_ndarray) __PYX_ERR(2, 360, __pyx_L1_error)
-  __pyx_ptype_5numpy_generic = __Pyx_ImportType_3_0_12(__pyx_t_1, "numpy", "generic", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_12(PyObject),__Pyx_ImportType_CheckSize_Warn_3_0_12); if (!__pyx_ptype_5numpy_generic) __PYX_ERR(2, 865, __pyx_L1_error)
-  __pyx_ptype_5numpy_number = __Pyx_ImportType_3_0_12(__pyx_t_1, "numpy", "number", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_12(PyObject),__Pyx_ImportType_CheckSize_Warn_3_0_12); if (!__pyx_ptype_5numpy_number) __PYX_ERR(2, 867, __pyx_L1_error)
-  __pyx_ptype_5numpy_integer = __Pyx_ImportType_3_0_12(__pyx_t_1, "numpy", "integer", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_12(PyObject),__Pyx_ImportType_CheckSize_Warn_3_0_12); if (!__pyx_ptype_5numpy_integer) __PYX_ERR(2, 869, __pyx_L1_error)
-  __pyx_ptype_5numpy_signedinteger = __Pyx_ImportType_3_0_12(__pyx_t_1, "numpy", "signedinteger", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_12(PyObject),__Pyx_ImportType_CheckSize_Warn_3_0_12); if (!__pyx_ptype_5numpy_signedinteger) __PYX_ERR(2, 871, __pyx_L1_error)
-  __pyx_ptype_5numpy_unsignedinteger = __Pyx_ImportType_3_0_12(__pyx_t_1, "numpy", "unsignedinteger", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_12(PyObject),__Pyx_ImportType_CheckSize_Warn_3_0_12); if (!__pyx_ptype_5numpy_unsignedinteger) __PYX_ERR(2, 873, __pyx_L1_error)
-  __pyx_ptype_5numpy_inexact = __Pyx_ImportType_3_0_12(__pyx_t_1, "numpy", "inexact", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_12(PyObject),__Pyx_ImportType_CheckSize_Warn_3_0_12); if (!__pyx_ptype_5numpy_inexact) __PYX_ERR(2, 875, __pyx_L1_error)
-  __pyx_ptype_5numpy_floating = __Pyx_ImportType_3_0_12(__pyx_t_1, "numpy", "floating", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_12(PyObject),__Pyx_ImportType_CheckSize_Warn_3_0_12); if (!__pyx_ptype_5numpy_floating) __PYX_ERR(2, 877, __pyx_L1_error)
-  __pyx_ptype_5numpy_complexfloating = __Pyx_ImportType_3_0_12(__pyx_t_1, "numpy", "complexfloating", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_12(PyObject),__Pyx_ImportType_CheckSize_Warn_3_0_12); if (!__pyx_ptype_5numpy_complexfloating) __PYX_ERR(2, 879, __pyx_L1_error)
-  __pyx_ptype_5numpy_flexible = __Pyx_ImportType_3_0_12(__pyx_t_1, "numpy", "flexible", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_12(PyObject),__Pyx_ImportType_CheckSize_Warn_3_0_12); if (!__pyx_ptype_5numpy_flexible) __PYX_ERR(2, 881, __pyx_L1_error)
-  __pyx_ptype_5numpy_character = __Pyx_ImportType_3_0_12(__pyx_t_1, "numpy", "character", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_12(PyObject),__Pyx_ImportType_CheckSize_Warn_3_0_12); if (!__pyx_ptype_5numpy_character) __PYX_ERR(2, 883, __pyx_L1_error)
-  __pyx_ptype_5numpy_ufunc = __Pyx_ImportType_3_0_12(__pyx_t_1, "numpy", "ufunc", sizeof(PyUFuncObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_12(PyUFuncObject),__Pyx_ImportType_CheckSize_Ignore_3_0_12); if (!__pyx_ptype_5numpy_ufunc) __PYX_ERR(2, 947, __pyx_L1_error)
+  __pyx_ptype_5numpy_dtype = __Pyx_ImportType_3_0_12(__pyx_t_1, "numpy", "dtype", sizeof(PyArray_Descr), __PYX_GET_STRUCT_ALIGNMENT_3_0_12(PyArray_Descr),__Pyx_ImportType_CheckSize_Ignore_3_0_12); if (!__pyx_ptype_5numpy_dtype) __PYX_ERR(2, 229, __pyx_L1_error)
+  __pyx_ptype_5numpy_flatiter = __Pyx_ImportType_3_0_12(__pyx_t_1, "numpy", "flatiter", sizeof(PyArrayIterObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_12(PyArrayIterObject),__Pyx_ImportType_CheckSize_Ignore_3_0_12); if (!__pyx_ptype_5numpy_flatiter) __PYX_ERR(2, 274, __pyx_L1_error)
+  __pyx_ptype_5numpy_broadcast = __Pyx_ImportType_3_0_12(__pyx_t_1, "numpy", "broadcast", sizeof(PyArrayMultiIterObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_12(PyArrayMultiIterObject),__Pyx_ImportType_CheckSize_Ignore_3_0_12); if (!__pyx_ptype_5numpy_broadcast) __PYX_ERR(2, 278, __pyx_L1_error)
+  __pyx_ptype_5numpy_ndarray = __Pyx_ImportType_3_0_12(__pyx_t_1, "numpy", "ndarray", sizeof(PyArrayObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_12(PyArrayObject),__Pyx_ImportType_CheckSize_Ignore_3_0_12); if (!__pyx_ptype_5numpy_ndarray) __PYX_ERR(2, 317, __pyx_L1_error)
+  __pyx_ptype_5numpy_generic = __Pyx_ImportType_3_0_12(__pyx_t_1, "numpy", "generic", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_12(PyObject),__Pyx_ImportType_CheckSize_Warn_3_0_12); if (!__pyx_ptype_5numpy_generic) __PYX_ERR(2, 826, __pyx_L1_error)
+  __pyx_ptype_5numpy_number = __Pyx_ImportType_3_0_12(__pyx_t_1, "numpy", "number", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_12(PyObject),__Pyx_ImportType_CheckSize_Warn_3_0_12); if (!__pyx_ptype_5numpy_number) __PYX_ERR(2, 828, __pyx_L1_error)
+  __pyx_ptype_5numpy_integer = __Pyx_ImportType_3_0_12(__pyx_t_1, "numpy", "integer", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_12(PyObject),__Pyx_ImportType_CheckSize_Warn_3_0_12); if (!__pyx_ptype_5numpy_integer) __PYX_ERR(2, 830, __pyx_L1_error)
+  __pyx_ptype_5numpy_signedinteger = __Pyx_ImportType_3_0_12(__pyx_t_1, "numpy", "signedinteger", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_12(PyObject),__Pyx_ImportType_CheckSize_Warn_3_0_12); if (!__pyx_ptype_5numpy_signedinteger) __PYX_ERR(2, 832, __pyx_L1_error)
+  __pyx_ptype_5numpy_unsignedinteger = __Pyx_ImportType_3_0_12(__pyx_t_1, "numpy", "unsignedinteger", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_12(PyObject),__Pyx_ImportType_CheckSize_Warn_3_0_12); if (!__pyx_ptype_5numpy_unsignedinteger) __PYX_ERR(2, 834, __pyx_L1_error)
+  __pyx_ptype_5numpy_inexact = __Pyx_ImportType_3_0_12(__pyx_t_1, "numpy", "inexact", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_12(PyObject),__Pyx_ImportType_CheckSize_Warn_3_0_12); if (!__pyx_ptype_5numpy_inexact) __PYX_ERR(2, 836, __pyx_L1_error)
+  __pyx_ptype_5numpy_floating = __Pyx_ImportType_3_0_12(__pyx_t_1, "numpy", "floating", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_12(PyObject),__Pyx_ImportType_CheckSize_Warn_3_0_12); if (!__pyx_ptype_5numpy_floating) __PYX_ERR(2, 838, __pyx_L1_error)
+  __pyx_ptype_5numpy_complexfloating = __Pyx_ImportType_3_0_12(__pyx_t_1, "numpy", "complexfloating", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_12(PyObject),__Pyx_ImportType_CheckSize_Warn_3_0_12); if (!__pyx_ptype_5numpy_complexfloating) __PYX_ERR(2, 840, __pyx_L1_error)
+  __pyx_ptype_5numpy_flexible = __Pyx_ImportType_3_0_12(__pyx_t_1, "numpy", "flexible", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_12(PyObject),__Pyx_ImportType_CheckSize_Warn_3_0_12); if (!__pyx_ptype_5numpy_flexible) __PYX_ERR(2, 842, __pyx_L1_error)
+  __pyx_ptype_5numpy_character = __Pyx_ImportType_3_0_12(__pyx_t_1, "numpy", "character", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_12(PyObject),__Pyx_ImportType_CheckSize_Warn_3_0_12); if (!__pyx_ptype_5numpy_character) __PYX_ERR(2, 844, __pyx_L1_error)
+  __pyx_ptype_5numpy_ufunc = __Pyx_ImportType_3_0_12(__pyx_t_1, "numpy", "ufunc", sizeof(PyUFuncObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_12(PyUFuncObject),__Pyx_ImportType_CheckSize_Ignore_3_0_12); if (!__pyx_ptype_5numpy_ufunc) __PYX_ERR(2, 908, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_t_1 = PyImport_ImportModule("array"); if (unlikely(!__pyx_t_1)) __PYX_ERR(4, 69, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
@@ -24124,6 +35334,8 @@ static CYTHON_SMALL_CODE int __pyx_pymod_exec_inverse_distance(PyObject *__pyx_p
   int __pyx_t_6;
   PyObject *__pyx_t_7 = NULL;
   static PyThread_type_lock __pyx_t_8[8];
+  PyObject *__pyx_t_9 = NULL;
+  double __pyx_t_10;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -24262,12 +35474,12 @@ if (!__Pyx_RefNanny) {
  *         __pyx_collections_abc_Sequence = __import__("collections.abc").abc.Sequence
  *     else:
  */
-      __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin___import__, __pyx_tuple__11, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 100, __pyx_L2_error)
+      __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin___import__, __pyx_tuple__17, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 100, __pyx_L2_error)
       __Pyx_GOTREF(__pyx_t_4);
       __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_version_info); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 100, __pyx_L2_error)
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __pyx_t_4 = PyObject_RichCompare(__pyx_t_5, __pyx_tuple__12, Py_GE); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 100, __pyx_L2_error)
+      __pyx_t_4 = PyObject_RichCompare(__pyx_t_5, __pyx_tuple__18, Py_GE); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 100, __pyx_L2_error)
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
       __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely((__pyx_t_6 < 0))) __PYX_ERR(1, 100, __pyx_L2_error)
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
@@ -24280,7 +35492,7 @@ if (!__Pyx_RefNanny) {
  *     else:
  *         __pyx_collections_abc_Sequence = __import__("collections").Sequence
  */
-        __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin___import__, __pyx_tuple__13, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 101, __pyx_L2_error)
+        __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin___import__, __pyx_tuple__19, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 101, __pyx_L2_error)
         __Pyx_GOTREF(__pyx_t_4);
         __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_abc); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 101, __pyx_L2_error)
         __Pyx_GOTREF(__pyx_t_5);
@@ -24311,7 +35523,7 @@ if (!__Pyx_RefNanny) {
  * 
  */
       /*else*/ {
-        __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin___import__, __pyx_tuple__14, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 103, __pyx_L2_error)
+        __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin___import__, __pyx_tuple__20, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 103, __pyx_L2_error)
         __Pyx_GOTREF(__pyx_t_4);
         __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_Sequence); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 103, __pyx_L2_error)
         __Pyx_GOTREF(__pyx_t_5);
@@ -24476,7 +35688,7 @@ if (!__Pyx_RefNanny) {
  * cdef strided = Enum("<strided and direct>") # default
  * cdef indirect = Enum("<strided and indirect>")
  */
-  __pyx_t_7 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__15, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 309, __pyx_L1_error)
+  __pyx_t_7 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__21, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 309, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
   __Pyx_XGOTREF(generic);
   __Pyx_DECREF_SET(generic, __pyx_t_7);
@@ -24490,7 +35702,7 @@ if (!__Pyx_RefNanny) {
  * cdef indirect = Enum("<strided and indirect>")
  * 
  */
-  __pyx_t_7 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__16, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 310, __pyx_L1_error)
+  __pyx_t_7 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__22, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 310, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
   __Pyx_XGOTREF(strided);
   __Pyx_DECREF_SET(strided, __pyx_t_7);
@@ -24504,7 +35716,7 @@ if (!__Pyx_RefNanny) {
  * 
  * 
  */
-  __pyx_t_7 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__17, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 311, __pyx_L1_error)
+  __pyx_t_7 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__23, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 311, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
   __Pyx_XGOTREF(indirect);
   __Pyx_DECREF_SET(indirect, __pyx_t_7);
@@ -24518,7 +35730,7 @@ if (!__Pyx_RefNanny) {
  * cdef indirect_contiguous = Enum("<contiguous and indirect>")
  * 
  */
-  __pyx_t_7 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__18, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 314, __pyx_L1_error)
+  __pyx_t_7 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__24, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 314, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
   __Pyx_XGOTREF(contiguous);
   __Pyx_DECREF_SET(contiguous, __pyx_t_7);
@@ -24532,7 +35744,7 @@ if (!__Pyx_RefNanny) {
  * 
  * 
  */
-  __pyx_t_7 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__19, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 315, __pyx_L1_error)
+  __pyx_t_7 = __Pyx_PyObject_Call(((PyObject *)__pyx_MemviewEnum_type), __pyx_tuple__25, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 315, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
   __Pyx_XGOTREF(indirect_contiguous);
   __Pyx_DECREF_SET(indirect_contiguous, __pyx_t_7);
@@ -24764,94 +35976,197 @@ if (!__Pyx_RefNanny) {
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_np, __pyx_t_7) < 0) __PYX_ERR(0, 7, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
 
-  /* "pymica/methods/inverse_distance.pyx":12
- * from libc.math cimport pow
- * from cpython cimport array
+  /* "pymica/methods/inverse_distance.pyx":17
+ * from cython cimport floating
+ * from cython.parallel cimport parallel, prange
  * import array             # <<<<<<<<<<<<<<
- * from typing import Dict, List
+ * import os
+ * from typing import Dict, List, Union
+ */
+  __pyx_t_7 = __Pyx_ImportDottedModule(__pyx_n_s_array, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 17, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_array, __pyx_t_7) < 0) __PYX_ERR(0, 17, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+
+  /* "pymica/methods/inverse_distance.pyx":18
+ * from cython.parallel cimport parallel, prange
+ * import array
+ * import os             # <<<<<<<<<<<<<<
+ * from typing import Dict, List, Union
  * 
  */
-  __pyx_t_7 = __Pyx_ImportDottedModule(__pyx_n_s_array, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 12, __pyx_L1_error)
+  __pyx_t_7 = __Pyx_ImportDottedModule(__pyx_n_s_os, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 18, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_array, __pyx_t_7) < 0) __PYX_ERR(0, 12, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_os, __pyx_t_7) < 0) __PYX_ERR(0, 18, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
 
-  /* "pymica/methods/inverse_distance.pyx":13
- * from cpython cimport array
+  /* "pymica/methods/inverse_distance.pyx":19
  * import array
- * from typing import Dict, List             # <<<<<<<<<<<<<<
+ * import os
+ * from typing import Dict, List, Union             # <<<<<<<<<<<<<<
  * 
- * DTYPE = np.float64
+ * from pymica.methods.idw_power cimport (IdwPower, make_power, station_weight,
  */
-  __pyx_t_7 = PyList_New(2); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 13, __pyx_L1_error)
+  __pyx_t_7 = PyList_New(3); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 19, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
   __Pyx_INCREF(__pyx_n_s_Dict);
   __Pyx_GIVEREF(__pyx_n_s_Dict);
-  if (__Pyx_PyList_SET_ITEM(__pyx_t_7, 0, __pyx_n_s_Dict)) __PYX_ERR(0, 13, __pyx_L1_error);
+  if (__Pyx_PyList_SET_ITEM(__pyx_t_7, 0, __pyx_n_s_Dict)) __PYX_ERR(0, 19, __pyx_L1_error);
   __Pyx_INCREF(__pyx_n_s_List);
   __Pyx_GIVEREF(__pyx_n_s_List);
-  if (__Pyx_PyList_SET_ITEM(__pyx_t_7, 1, __pyx_n_s_List)) __PYX_ERR(0, 13, __pyx_L1_error);
-  __pyx_t_4 = __Pyx_Import(__pyx_n_s_typing, __pyx_t_7, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 13, __pyx_L1_error)
+  if (__Pyx_PyList_SET_ITEM(__pyx_t_7, 1, __pyx_n_s_List)) __PYX_ERR(0, 19, __pyx_L1_error);
+  __Pyx_INCREF(__pyx_n_s_Union);
+  __Pyx_GIVEREF(__pyx_n_s_Union);
+  if (__Pyx_PyList_SET_ITEM(__pyx_t_7, 2, __pyx_n_s_Union)) __PYX_ERR(0, 19, __pyx_L1_error);
+  __pyx_t_4 = __Pyx_Import(__pyx_n_s_typing, __pyx_t_7, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 19, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-  __pyx_t_7 = __Pyx_ImportFrom(__pyx_t_4, __pyx_n_s_Dict); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 13, __pyx_L1_error)
+  __pyx_t_7 = __Pyx_ImportFrom(__pyx_t_4, __pyx_n_s_Dict); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 19, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Dict, __pyx_t_7) < 0) __PYX_ERR(0, 19, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_ImportFrom(__pyx_t_4, __pyx_n_s_List); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 19, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Dict, __pyx_t_7) < 0) __PYX_ERR(0, 13, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_List, __pyx_t_7) < 0) __PYX_ERR(0, 19, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-  __pyx_t_7 = __Pyx_ImportFrom(__pyx_t_4, __pyx_n_s_List); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 13, __pyx_L1_error)
+  __pyx_t_7 = __Pyx_ImportFrom(__pyx_t_4, __pyx_n_s_Union); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 19, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_List, __pyx_t_7) < 0) __PYX_ERR(0, 13, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Union, __pyx_t_7) < 0) __PYX_ERR(0, 19, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-  /* "pymica/methods/inverse_distance.pyx":15
- * from typing import Dict, List
- * 
- * DTYPE = np.float64             # <<<<<<<<<<<<<<
- * ctypedef np.float64_t DTYPE_t
+  /* "pymica/methods/inverse_distance.pyx":23
+ * from pymica.methods.idw_power cimport (IdwPower, make_power, station_weight,
+ *                                         station_weight32)
+ * from pymica.methods.station_arrays import station_arrays             # <<<<<<<<<<<<<<
  * 
+ * DTYPE = np.float64
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 15, __pyx_L1_error)
+  __pyx_t_4 = PyList_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 23, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_float64); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 15, __pyx_L1_error)
+  __Pyx_INCREF(__pyx_n_s_station_arrays);
+  __Pyx_GIVEREF(__pyx_n_s_station_arrays);
+  if (__Pyx_PyList_SET_ITEM(__pyx_t_4, 0, __pyx_n_s_station_arrays)) __PYX_ERR(0, 23, __pyx_L1_error);
+  __pyx_t_7 = __Pyx_Import(__pyx_n_s_pymica_methods_station_arrays, __pyx_t_4, 0); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 23, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_DTYPE, __pyx_t_7) < 0) __PYX_ERR(0, 15, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_ImportFrom(__pyx_t_7, __pyx_n_s_station_arrays); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 23, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_station_arrays, __pyx_t_4) < 0) __PYX_ERR(0, 23, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
 
-  /* "pymica/methods/inverse_distance.pyx":18
+  /* "pymica/methods/inverse_distance.pyx":25
+ * from pymica.methods.station_arrays import station_arrays
+ * 
+ * DTYPE = np.float64             # <<<<<<<<<<<<<<
  * ctypedef np.float64_t DTYPE_t
  * 
- * def inverse_distance(data: List[Dict[str, float]],             # <<<<<<<<<<<<<<
- *                      size: List[int], geotransform: List[int],
- *                      power: int=2, smoothing: float=0.0):
  */
-  __pyx_t_7 = __Pyx_PyDict_NewPresized(5); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 18, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_7, __pyx_n_s_np); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 25, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
-  if (PyDict_SetItem(__pyx_t_7, __pyx_n_s_data, __pyx_kp_s_List_Dict_str_float) < 0) __PYX_ERR(0, 18, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_7, __pyx_n_s_size, __pyx_kp_s_List_int) < 0) __PYX_ERR(0, 18, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_7, __pyx_n_s_geotransform, __pyx_kp_s_List_int) < 0) __PYX_ERR(0, 18, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_7, __pyx_n_s_power, __pyx_n_s_int) < 0) __PYX_ERR(0, 18, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_7, __pyx_n_s_smoothing, __pyx_n_s_float) < 0) __PYX_ERR(0, 18, __pyx_L1_error)
-  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_6pymica_7methods_16inverse_distance_1inverse_distance, 0, __pyx_n_s_inverse_distance, NULL, __pyx_n_s_pymica_methods_inverse_distance_2, __pyx_d, ((PyObject *)__pyx_codeobj__23)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 18, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_7, __pyx_n_s_float64); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 25, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  if (!__Pyx_CyFunction_InitDefaults(__pyx_t_4, sizeof(__pyx_defaults), 1)) __PYX_ERR(0, 18, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_DTYPE, __pyx_t_4) < 0) __PYX_ERR(0, 25, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-  /* "pymica/methods/inverse_distance.pyx":20
- * def inverse_distance(data: List[Dict[str, float]],
+  /* "pymica/methods/inverse_distance.pyx":28
+ * ctypedef np.float64_t DTYPE_t
+ * 
+ * def inverse_distance(data: Union[List[Dict[str, float]], np.ndarray],             # <<<<<<<<<<<<<<
  *                      size: List[int], geotransform: List[int],
- *                      power: int=2, smoothing: float=0.0):             # <<<<<<<<<<<<<<
+ *                      power: float=2, smoothing: float=0.0, int num_threads=1,
+ */
+  __pyx_t_4 = __Pyx_PyDict_NewPresized(5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 28, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_data, __pyx_kp_s_Union_List_Dict_str_float_np_nda) < 0) __PYX_ERR(0, 28, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_size, __pyx_kp_s_List_int) < 0) __PYX_ERR(0, 28, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_geotransform, __pyx_kp_s_List_int) < 0) __PYX_ERR(0, 28, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_power, __pyx_n_s_float) < 0) __PYX_ERR(0, 28, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_smoothing, __pyx_n_s_float) < 0) __PYX_ERR(0, 28, __pyx_L1_error)
+  __pyx_t_7 = __Pyx_CyFunction_New(&__pyx_mdef_6pymica_7methods_16inverse_distance_1inverse_distance, 0, __pyx_n_s_inverse_distance, NULL, __pyx_n_s_pymica_methods_inverse_distance_2, __pyx_d, ((PyObject *)__pyx_codeobj__29)); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 28, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  if (!__Pyx_CyFunction_InitDefaults(__pyx_t_7, sizeof(__pyx_defaults), 0)) __PYX_ERR(0, 28, __pyx_L1_error)
+
+  /* "pymica/methods/inverse_distance.pyx":32
+ *                      power: float=2, smoothing: float=0.0, int num_threads=1,
+ *                      int k_nearest=0, double max_radius=0.0, out=None,
+ *                      mask=None, double nodata=np.nan, precision='float64'):             # <<<<<<<<<<<<<<
  *     """
  *     inverse_distance(data, size, geotransform)
  */
-  if (!(likely(__Pyx_Py3Int_CheckExact(__pyx_int_2)) || __Pyx_RaiseUnexpectedTypeError("int", __pyx_int_2))) __PYX_ERR(0, 20, __pyx_L1_error)
-  __Pyx_INCREF(__pyx_int_2);
-  __Pyx_CyFunction_Defaults(__pyx_defaults, __pyx_t_4)->__pyx_arg_power = ((PyObject*)__pyx_int_2);
-  __Pyx_GIVEREF(__pyx_int_2);
-  __Pyx_CyFunction_SetDefaultsGetter(__pyx_t_4, __pyx_pf_6pymica_7methods_16inverse_distance_2__defaults__);
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 32, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_nan); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 32, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_10 = __pyx_PyFloat_AsDouble(__pyx_t_9); if (unlikely((__pyx_t_10 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 32, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __Pyx_CyFunction_Defaults(__pyx_defaults, __pyx_t_7)->__pyx_arg_nodata = __pyx_t_10;
+  __Pyx_CyFunction_SetDefaultsGetter(__pyx_t_7, __pyx_pf_6pymica_7methods_16inverse_distance_6__defaults__);
+  __Pyx_CyFunction_SetAnnotationsDict(__pyx_t_7, __pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_inverse_distance, __pyx_t_7) < 0) __PYX_ERR(0, 28, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+
+  /* "pymica/methods/inverse_distance.pyx":83
+ * 
+ * 
+ * def inverse_distance_arrays(xpos, ypos, values,             # <<<<<<<<<<<<<<
+ *                             size: List[int], geotransform: List[int],
+ *                             power: float=2, smoothing: float=0.0,
+ */
+  __pyx_t_7 = __Pyx_PyDict_NewPresized(4); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 83, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  if (PyDict_SetItem(__pyx_t_7, __pyx_n_s_size, __pyx_kp_s_List_int) < 0) __PYX_ERR(0, 83, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_7, __pyx_n_s_geotransform, __pyx_kp_s_List_int) < 0) __PYX_ERR(0, 83, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_7, __pyx_n_s_power, __pyx_n_s_float) < 0) __PYX_ERR(0, 83, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_7, __pyx_n_s_smoothing, __pyx_n_s_float) < 0) __PYX_ERR(0, 83, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_6pymica_7methods_16inverse_distance_3inverse_distance_arrays, 0, __pyx_n_s_inverse_distance_arrays, NULL, __pyx_n_s_pymica_methods_inverse_distance_2, __pyx_d, ((PyObject *)__pyx_codeobj__31)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 83, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  if (!__Pyx_CyFunction_InitDefaults(__pyx_t_4, sizeof(__pyx_defaults1), 0)) __PYX_ERR(0, 83, __pyx_L1_error)
+
+  /* "pymica/methods/inverse_distance.pyx":88
+ *                             int num_threads=1, int k_nearest=0,
+ *                             double max_radius=0.0, out=None, mask=None,
+ *                             double nodata=np.nan, precision='float64'):             # <<<<<<<<<<<<<<
+ *     """
+ *     inverse_distance_arrays(xpos, ypos, values, size, geotransform)
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_9, __pyx_n_s_np); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 88, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_9, __pyx_n_s_nan); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 88, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __pyx_t_10 = __pyx_PyFloat_AsDouble(__pyx_t_5); if (unlikely((__pyx_t_10 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 88, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __Pyx_CyFunction_Defaults(__pyx_defaults1, __pyx_t_4)->__pyx_arg_nodata = __pyx_t_10;
+  __Pyx_CyFunction_SetDefaultsGetter(__pyx_t_4, __pyx_pf_6pymica_7methods_16inverse_distance_8__defaults__);
   __Pyx_CyFunction_SetAnnotationsDict(__pyx_t_4, __pyx_t_7);
   __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_inverse_distance, __pyx_t_4) < 0) __PYX_ERR(0, 18, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_inverse_distance_arrays, __pyx_t_4) < 0) __PYX_ERR(0, 83, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "pymica/methods/inverse_distance.pyx":494
+ * 
+ * 
+ * def build_grid_index(xpos, ypos, values, int k_nearest=0):             # <<<<<<<<<<<<<<
+ *     """
+ *     build_grid_index(xpos, ypos, values)
+ */
+  __pyx_t_4 = __Pyx_PyInt_From_int(((int)0)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 494, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_7 = PyTuple_New(1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 494, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_GIVEREF(__pyx_t_4);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_4)) __PYX_ERR(0, 494, __pyx_L1_error);
+  __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_6pymica_7methods_16inverse_distance_5build_grid_index, 0, __pyx_n_s_build_grid_index, NULL, __pyx_n_s_pymica_methods_inverse_distance_2, __pyx_d, ((PyObject *)__pyx_codeobj__33)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 494, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_4, __pyx_t_7);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_build_grid_index, __pyx_t_4) < 0) __PYX_ERR(0, 494, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
   /* "pymica/methods/inverse_distance.pyx":1
@@ -24871,6 +36186,7 @@ if (!__Pyx_RefNanny) {
   __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
   __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_9);
   if (__pyx_m) {
     if (__pyx_d && stringtab_initialized) {
       __Pyx_AddTraceback("init pymica.methods.inverse_distance", __pyx_clineno, __pyx_lineno, __pyx_filename);
@@ -27348,6 +38664,82 @@ static CYTHON_INLINE int __Pyx_HasAttr(PyObject *o, PyObject *n) {
     }
 }
 
+/* ModInt[long] */
+static CYTHON_INLINE long __Pyx_mod_long(long a, long b) {
+    long r = a % b;
+    r += ((r != 0) & ((r ^ b) < 0)) * b;
+    return r;
+}
+
+/* WriteUnraisableException */
+static void __Pyx_WriteUnraisable(const char *name, int clineno,
+                                  int lineno, const char *filename,
+                                  int full_traceback, int nogil) {
+    PyObject *old_exc, *old_val, *old_tb;
+    PyObject *ctx;
+    __Pyx_PyThreadState_declare
+#ifdef WITH_THREAD
+    PyGILState_STATE state;
+    if (nogil)
+        state = PyGILState_Ensure();
+    else state = (PyGILState_STATE)0;
+#endif
+    CYTHON_UNUSED_VAR(clineno);
+    CYTHON_UNUSED_VAR(lineno);
+    CYTHON_UNUSED_VAR(filename);
+    CYTHON_MAYBE_UNUSED_VAR(nogil);
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&old_exc, &old_val, &old_tb);
+    if (full_traceback) {
+        Py_XINCREF(old_exc);
+        Py_XINCREF(old_val);
+        Py_XINCREF(old_tb);
+        __Pyx_ErrRestore(old_exc, old_val, old_tb);
+        PyErr_PrintEx(0);
+    }
+    #if PY_MAJOR_VERSION < 3
+    ctx = PyString_FromString(name);
+    #else
+    ctx = PyUnicode_FromString(name);
+    #endif
+    __Pyx_ErrRestore(old_exc, old_val, old_tb);
+    if (!ctx) {
+        PyErr_WriteUnraisable(Py_None);
+    } else {
+        PyErr_WriteUnraisable(ctx);
+        Py_DECREF(ctx);
+    }
+#ifdef WITH_THREAD
+    if (nogil)
+        PyGILState_Release(state);
+#endif
+}
+
+/* IterFinish */
+static CYTHON_INLINE int __Pyx_IterFinish(void) {
+    PyObject* exc_type;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    exc_type = __Pyx_PyErr_CurrentExceptionType();
+    if (unlikely(exc_type)) {
+        if (unlikely(!__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration)))
+            return -1;
+        __Pyx_PyErr_Clear();
+        return 0;
+    }
+    return 0;
+}
+
+/* UnpackItemEndCheck */
+static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected) {
+    if (unlikely(retval)) {
+        Py_DECREF(retval);
+        __Pyx_RaiseTooManyValuesError(expected);
+        return -1;
+    }
+    return __Pyx_IterFinish();
+}
+
 /* DictGetItem */
 #if PY_MAJOR_VERSION >= 3 && !CYTHON_COMPILING_IN_PYPY
 static PyObject *__Pyx_PyDict_GetItem(PyObject *d, PyObject* key) {
@@ -27372,17 +38764,740 @@ static PyObject *__Pyx_PyDict_GetItem(PyObject *d, PyObject* key) {
 }
 #endif
 
-/* ErrOccurredWithGIL */
-static CYTHON_INLINE int __Pyx_ErrOccurredWithGIL(void) {
-  int err;
-  #ifdef WITH_THREAD
-  PyGILState_STATE _save = PyGILState_Ensure();
-  #endif
-  err = !!PyErr_Occurred();
-  #ifdef WITH_THREAD
-  PyGILState_Release(_save);
-  #endif
-  return err;
+/* PyIntCompare */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_NeObjC(PyObject *op1, PyObject *op2, long intval, long inplace) {
+    CYTHON_MAYBE_UNUSED_VAR(intval);
+    CYTHON_UNUSED_VAR(inplace);
+    if (op1 == op2) {
+        Py_RETURN_FALSE;
+    }
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_CheckExact(op1))) {
+        const long b = intval;
+        long a = PyInt_AS_LONG(op1);
+        if (a != b) Py_RETURN_TRUE; else Py_RETURN_FALSE;
+    }
+    #endif
+    #if CYTHON_USE_PYLONG_INTERNALS
+    if (likely(PyLong_CheckExact(op1))) {
+        int unequal;
+        unsigned long uintval;
+        Py_ssize_t size = __Pyx_PyLong_DigitCount(op1);
+        const digit* digits = __Pyx_PyLong_Digits(op1);
+        if (intval == 0) {
+            if (__Pyx_PyLong_IsZero(op1) != 1) Py_RETURN_TRUE; else Py_RETURN_FALSE;
+        } else if (intval < 0) {
+            if (__Pyx_PyLong_IsNonNeg(op1))
+                Py_RETURN_TRUE;
+            intval = -intval;
+        } else {
+            if (__Pyx_PyLong_IsNeg(op1))
+                Py_RETURN_TRUE;
+        }
+        uintval = (unsigned long) intval;
+#if PyLong_SHIFT * 4 < SIZEOF_LONG*8
+        if (uintval >> (PyLong_SHIFT * 4)) {
+            unequal = (size != 5) || (digits[0] != (uintval & (unsigned long) PyLong_MASK))
+                 | (digits[1] != ((uintval >> (1 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK)) | (digits[2] != ((uintval >> (2 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK)) | (digits[3] != ((uintval >> (3 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK)) | (digits[4] != ((uintval >> (4 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK));
+        } else
+#endif
+#if PyLong_SHIFT * 3 < SIZEOF_LONG*8
+        if (uintval >> (PyLong_SHIFT * 3)) {
+            unequal = (size != 4) || (digits[0] != (uintval & (unsigned long) PyLong_MASK))
+                 | (digits[1] != ((uintval >> (1 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK)) | (digits[2] != ((uintval >> (2 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK)) | (digits[3] != ((uintval >> (3 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK));
+        } else
+#endif
+#if PyLong_SHIFT * 2 < SIZEOF_LONG*8
+        if (uintval >> (PyLong_SHIFT * 2)) {
+            unequal = (size != 3) || (digits[0] != (uintval & (unsigned long) PyLong_MASK))
+                 | (digits[1] != ((uintval >> (1 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK)) | (digits[2] != ((uintval >> (2 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK));
+        } else
+#endif
+#if PyLong_SHIFT * 1 < SIZEOF_LONG*8
+        if (uintval >> (PyLong_SHIFT * 1)) {
+            unequal = (size != 2) || (digits[0] != (uintval & (unsigned long) PyLong_MASK))
+                 | (digits[1] != ((uintval >> (1 * PyLong_SHIFT)) & (unsigned long) PyLong_MASK));
+        } else
+#endif
+            unequal = (size != 1) || (((unsigned long) digits[0]) != (uintval & (unsigned long) PyLong_MASK));
+        if (unequal != 0) Py_RETURN_TRUE; else Py_RETURN_FALSE;
+    }
+    #endif
+    if (PyFloat_CheckExact(op1)) {
+        const long b = intval;
+#if CYTHON_COMPILING_IN_LIMITED_API
+        double a = __pyx_PyFloat_AsDouble(op1);
+#else
+        double a = PyFloat_AS_DOUBLE(op1);
+#endif
+        if ((double)a != (double)b) Py_RETURN_TRUE; else Py_RETURN_FALSE;
+    }
+    return (
+        PyObject_RichCompare(op1, op2, Py_NE));
+}
+
+/* PyIntBinop */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyInt_AddObjC(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check) {
+    CYTHON_MAYBE_UNUSED_VAR(intval);
+    CYTHON_MAYBE_UNUSED_VAR(inplace);
+    CYTHON_UNUSED_VAR(zerodivision_check);
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_CheckExact(op1))) {
+        const long b = intval;
+        long x;
+        long a = PyInt_AS_LONG(op1);
+        
+            x = (long)((unsigned long)a + (unsigned long)b);
+            if (likely((x^a) >= 0 || (x^b) >= 0))
+                return PyInt_FromLong(x);
+            return PyLong_Type.tp_as_number->nb_add(op1, op2);
+    }
+    #endif
+    #if CYTHON_USE_PYLONG_INTERNALS
+    if (likely(PyLong_CheckExact(op1))) {
+        const long b = intval;
+        long a, x;
+#ifdef HAVE_LONG_LONG
+        const PY_LONG_LONG llb = intval;
+        PY_LONG_LONG lla, llx;
+#endif
+        if (unlikely(__Pyx_PyLong_IsZero(op1))) {
+            return __Pyx_NewRef(op2);
+        }
+        if (likely(__Pyx_PyLong_IsCompact(op1))) {
+            a = __Pyx_PyLong_CompactValue(op1);
+        } else {
+            const digit* digits = __Pyx_PyLong_Digits(op1);
+            const Py_ssize_t size = __Pyx_PyLong_SignedDigitCount(op1);
+            switch (size) {
+                case -2:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        a = -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+                    #ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+                    #endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 2:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        a = (long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+                    #ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+                    #endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case -3:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        a = -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+                    #ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+                    #endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 3:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        a = (long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+                    #ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+                    #endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case -4:
+                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                        a = -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+                    #ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+                    #endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 4:
+                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                        a = (long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+                    #ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+                    #endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                default: return PyLong_Type.tp_as_number->nb_add(op1, op2);
+            }
+        }
+                x = a + b;
+            return PyLong_FromLong(x);
+#ifdef HAVE_LONG_LONG
+        long_long:
+                llx = lla + llb;
+            return PyLong_FromLongLong(llx);
+#endif
+        
+        
+    }
+    #endif
+    if (PyFloat_CheckExact(op1)) {
+        const long b = intval;
+#if CYTHON_COMPILING_IN_LIMITED_API
+        double a = __pyx_PyFloat_AsDouble(op1);
+#else
+        double a = PyFloat_AS_DOUBLE(op1);
+#endif
+            double result;
+            
+            PyFPE_START_PROTECT("add", return NULL)
+            result = ((double)a) + (double)b;
+            PyFPE_END_PROTECT(result)
+            return PyFloat_FromDouble(result);
+    }
+    return (inplace ? PyNumber_InPlaceAdd : PyNumber_Add)(op1, op2);
+}
+#endif
+
+/* PyIntBinop */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyInt_MultiplyCObj(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check) {
+    CYTHON_MAYBE_UNUSED_VAR(intval);
+    CYTHON_MAYBE_UNUSED_VAR(inplace);
+    CYTHON_UNUSED_VAR(zerodivision_check);
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_CheckExact(op2))) {
+        const long a = intval;
+        long b = PyInt_AS_LONG(op2);
+        
+#ifdef HAVE_LONG_LONG
+            if (sizeof(PY_LONG_LONG) > sizeof(long)) {
+                PY_LONG_LONG result = (PY_LONG_LONG)a * (PY_LONG_LONG)b;
+                return (result >= LONG_MIN && result <= LONG_MAX) ?
+                    PyInt_FromLong((long)result) : PyLong_FromLongLong(result);
+            }
+#endif
+#if CYTHON_USE_TYPE_SLOTS
+            return PyInt_Type.tp_as_number->nb_multiply(op1, op2);
+#else
+            return PyNumber_Multiply(op1, op2);
+#endif
+    }
+    #endif
+    #if CYTHON_USE_PYLONG_INTERNALS
+    if (likely(PyLong_CheckExact(op2))) {
+        const long a = intval;
+        long b, x;
+#ifdef HAVE_LONG_LONG
+        const PY_LONG_LONG lla = intval;
+        PY_LONG_LONG llb, llx;
+#endif
+        if (unlikely(__Pyx_PyLong_IsZero(op2))) {
+            return __Pyx_NewRef(op2);
+        }
+        if (likely(__Pyx_PyLong_IsCompact(op2))) {
+            b = __Pyx_PyLong_CompactValue(op2);
+        } else {
+            const digit* digits = __Pyx_PyLong_Digits(op2);
+            const Py_ssize_t size = __Pyx_PyLong_SignedDigitCount(op2);
+            switch (size) {
+                case -2:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT+30) {
+                        b = -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+                    #ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT+30) {
+                        llb = -(PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+                    #endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 2:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT+30) {
+                        b = (long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+                    #ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT+30) {
+                        llb = (PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+                    #endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case -3:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT+30) {
+                        b = -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+                    #ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT+30) {
+                        llb = -(PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+                    #endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 3:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT+30) {
+                        b = (long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+                    #ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT+30) {
+                        llb = (PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+                    #endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case -4:
+                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT+30) {
+                        b = -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+                    #ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT+30) {
+                        llb = -(PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+                    #endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 4:
+                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT+30) {
+                        b = (long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+                    #ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT+30) {
+                        llb = (PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+                    #endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                default: return PyLong_Type.tp_as_number->nb_multiply(op1, op2);
+            }
+        }
+                CYTHON_UNUSED_VAR(a);
+                CYTHON_UNUSED_VAR(b);
+                #ifdef HAVE_LONG_LONG
+                llb = b;
+                goto long_long;
+                #else
+                return PyLong_Type.tp_as_number->nb_multiply(op1, op2);
+                #endif
+            return PyLong_FromLong(x);
+#ifdef HAVE_LONG_LONG
+        long_long:
+                llx = lla * llb;
+            return PyLong_FromLongLong(llx);
+#endif
+        
+        
+    }
+    #endif
+    if (PyFloat_CheckExact(op2)) {
+        const long a = intval;
+#if CYTHON_COMPILING_IN_LIMITED_API
+        double b = __pyx_PyFloat_AsDouble(op2);
+#else
+        double b = PyFloat_AS_DOUBLE(op2);
+#endif
+            double result;
+            
+            PyFPE_START_PROTECT("multiply", return NULL)
+            result = ((double)a) * (double)b;
+            PyFPE_END_PROTECT(result)
+            return PyFloat_FromDouble(result);
+    }
+    return (inplace ? PyNumber_InPlaceMultiply : PyNumber_Multiply)(op1, op2);
+}
+#endif
+
+/* PyIntBinop */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyInt_MultiplyObjC(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check) {
+    CYTHON_MAYBE_UNUSED_VAR(intval);
+    CYTHON_MAYBE_UNUSED_VAR(inplace);
+    CYTHON_UNUSED_VAR(zerodivision_check);
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_CheckExact(op1))) {
+        const long b = intval;
+        long a = PyInt_AS_LONG(op1);
+        
+#ifdef HAVE_LONG_LONG
+            if (sizeof(PY_LONG_LONG) > sizeof(long)) {
+                PY_LONG_LONG result = (PY_LONG_LONG)a * (PY_LONG_LONG)b;
+                return (result >= LONG_MIN && result <= LONG_MAX) ?
+                    PyInt_FromLong((long)result) : PyLong_FromLongLong(result);
+            }
+#endif
+#if CYTHON_USE_TYPE_SLOTS
+            return PyInt_Type.tp_as_number->nb_multiply(op1, op2);
+#else
+            return PyNumber_Multiply(op1, op2);
+#endif
+    }
+    #endif
+    #if CYTHON_USE_PYLONG_INTERNALS
+    if (likely(PyLong_CheckExact(op1))) {
+        const long b = intval;
+        long a, x;
+#ifdef HAVE_LONG_LONG
+        const PY_LONG_LONG llb = intval;
+        PY_LONG_LONG lla, llx;
+#endif
+        if (unlikely(__Pyx_PyLong_IsZero(op1))) {
+            return __Pyx_NewRef(op1);
+        }
+        if (likely(__Pyx_PyLong_IsCompact(op1))) {
+            a = __Pyx_PyLong_CompactValue(op1);
+        } else {
+            const digit* digits = __Pyx_PyLong_Digits(op1);
+            const Py_ssize_t size = __Pyx_PyLong_SignedDigitCount(op1);
+            switch (size) {
+                case -2:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT+30) {
+                        a = -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+                    #ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT+30) {
+                        lla = -(PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+                    #endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 2:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT+30) {
+                        a = (long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+                    #ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT+30) {
+                        lla = (PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+                    #endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case -3:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT+30) {
+                        a = -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+                    #ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT+30) {
+                        lla = -(PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+                    #endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 3:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT+30) {
+                        a = (long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+                    #ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT+30) {
+                        lla = (PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+                    #endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case -4:
+                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT+30) {
+                        a = -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+                    #ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT+30) {
+                        lla = -(PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+                    #endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 4:
+                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT+30) {
+                        a = (long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+                    #ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT+30) {
+                        lla = (PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+                    #endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                default: return PyLong_Type.tp_as_number->nb_multiply(op1, op2);
+            }
+        }
+                CYTHON_UNUSED_VAR(a);
+                CYTHON_UNUSED_VAR(b);
+                #ifdef HAVE_LONG_LONG
+                lla = a;
+                goto long_long;
+                #else
+                return PyLong_Type.tp_as_number->nb_multiply(op1, op2);
+                #endif
+            return PyLong_FromLong(x);
+#ifdef HAVE_LONG_LONG
+        long_long:
+                llx = lla * llb;
+            return PyLong_FromLongLong(llx);
+#endif
+        
+        
+    }
+    #endif
+    if (PyFloat_CheckExact(op1)) {
+        const long b = intval;
+#if CYTHON_COMPILING_IN_LIMITED_API
+        double a = __pyx_PyFloat_AsDouble(op1);
+#else
+        double a = PyFloat_AS_DOUBLE(op1);
+#endif
+            double result;
+            
+            PyFPE_START_PROTECT("multiply", return NULL)
+            result = ((double)a) * (double)b;
+            PyFPE_END_PROTECT(result)
+            return PyFloat_FromDouble(result);
+    }
+    return (inplace ? PyNumber_InPlaceMultiply : PyNumber_Multiply)(op1, op2);
+}
+#endif
+
+/* PyIntBinop */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyInt_SubtractObjC(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check) {
+    CYTHON_MAYBE_UNUSED_VAR(intval);
+    CYTHON_MAYBE_UNUSED_VAR(inplace);
+    CYTHON_UNUSED_VAR(zerodivision_check);
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_CheckExact(op1))) {
+        const long b = intval;
+        long x;
+        long a = PyInt_AS_LONG(op1);
+        
+            x = (long)((unsigned long)a - (unsigned long)b);
+            if (likely((x^a) >= 0 || (x^~b) >= 0))
+                return PyInt_FromLong(x);
+            return PyLong_Type.tp_as_number->nb_subtract(op1, op2);
+    }
+    #endif
+    #if CYTHON_USE_PYLONG_INTERNALS
+    if (likely(PyLong_CheckExact(op1))) {
+        const long b = intval;
+        long a, x;
+#ifdef HAVE_LONG_LONG
+        const PY_LONG_LONG llb = intval;
+        PY_LONG_LONG lla, llx;
+#endif
+        if (unlikely(__Pyx_PyLong_IsZero(op1))) {
+            return PyLong_FromLong(-intval);
+        }
+        if (likely(__Pyx_PyLong_IsCompact(op1))) {
+            a = __Pyx_PyLong_CompactValue(op1);
+        } else {
+            const digit* digits = __Pyx_PyLong_Digits(op1);
+            const Py_ssize_t size = __Pyx_PyLong_SignedDigitCount(op1);
+            switch (size) {
+                case -2:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        a = -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+                    #ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+                    #endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 2:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        a = (long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+                    #ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+                    #endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case -3:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        a = -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+                    #ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+                    #endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 3:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        a = (long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+                    #ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+                    #endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case -4:
+                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                        a = -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+                    #ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+                    #endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 4:
+                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                        a = (long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+                    #ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+                    #endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                default: return PyLong_Type.tp_as_number->nb_subtract(op1, op2);
+            }
+        }
+                x = a - b;
+            return PyLong_FromLong(x);
+#ifdef HAVE_LONG_LONG
+        long_long:
+                llx = lla - llb;
+            return PyLong_FromLongLong(llx);
+#endif
+        
+        
+    }
+    #endif
+    if (PyFloat_CheckExact(op1)) {
+        const long b = intval;
+#if CYTHON_COMPILING_IN_LIMITED_API
+        double a = __pyx_PyFloat_AsDouble(op1);
+#else
+        double a = PyFloat_AS_DOUBLE(op1);
+#endif
+            double result;
+            
+            PyFPE_START_PROTECT("subtract", return NULL)
+            result = ((double)a) - (double)b;
+            PyFPE_END_PROTECT(result)
+            return PyFloat_FromDouble(result);
+    }
+    return (inplace ? PyNumber_InPlaceSubtract : PyNumber_Subtract)(op1, op2);
+}
+#endif
+
+/* SliceObject */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetSlice(PyObject* obj,
+        Py_ssize_t cstart, Py_ssize_t cstop,
+        PyObject** _py_start, PyObject** _py_stop, PyObject** _py_slice,
+        int has_cstart, int has_cstop, int wraparound) {
+    __Pyx_TypeName obj_type_name;
+#if CYTHON_USE_TYPE_SLOTS
+    PyMappingMethods* mp;
+#if PY_MAJOR_VERSION < 3
+    PySequenceMethods* ms = Py_TYPE(obj)->tp_as_sequence;
+    if (likely(ms && ms->sq_slice)) {
+        if (!has_cstart) {
+            if (_py_start && (*_py_start != Py_None)) {
+                cstart = __Pyx_PyIndex_AsSsize_t(*_py_start);
+                if ((cstart == (Py_ssize_t)-1) && PyErr_Occurred()) goto bad;
+            } else
+                cstart = 0;
+        }
+        if (!has_cstop) {
+            if (_py_stop && (*_py_stop != Py_None)) {
+                cstop = __Pyx_PyIndex_AsSsize_t(*_py_stop);
+                if ((cstop == (Py_ssize_t)-1) && PyErr_Occurred()) goto bad;
+            } else
+                cstop = PY_SSIZE_T_MAX;
+        }
+        if (wraparound && unlikely((cstart < 0) | (cstop < 0)) && likely(ms->sq_length)) {
+            Py_ssize_t l = ms->sq_length(obj);
+            if (likely(l >= 0)) {
+                if (cstop < 0) {
+                    cstop += l;
+                    if (cstop < 0) cstop = 0;
+                }
+                if (cstart < 0) {
+                    cstart += l;
+                    if (cstart < 0) cstart = 0;
+                }
+            } else {
+                if (!PyErr_ExceptionMatches(PyExc_OverflowError))
+                    goto bad;
+                PyErr_Clear();
+            }
+        }
+        return ms->sq_slice(obj, cstart, cstop);
+    }
+#else
+    CYTHON_UNUSED_VAR(wraparound);
+#endif
+    mp = Py_TYPE(obj)->tp_as_mapping;
+    if (likely(mp && mp->mp_subscript))
+#else
+    CYTHON_UNUSED_VAR(wraparound);
+#endif
+    {
+        PyObject* result;
+        PyObject *py_slice, *py_start, *py_stop;
+        if (_py_slice) {
+            py_slice = *_py_slice;
+        } else {
+            PyObject* owned_start = NULL;
+            PyObject* owned_stop = NULL;
+            if (_py_start) {
+                py_start = *_py_start;
+            } else {
+                if (has_cstart) {
+                    owned_start = py_start = PyInt_FromSsize_t(cstart);
+                    if (unlikely(!py_start)) goto bad;
+                } else
+                    py_start = Py_None;
+            }
+            if (_py_stop) {
+                py_stop = *_py_stop;
+            } else {
+                if (has_cstop) {
+                    owned_stop = py_stop = PyInt_FromSsize_t(cstop);
+                    if (unlikely(!py_stop)) {
+                        Py_XDECREF(owned_start);
+                        goto bad;
+                    }
+                } else
+                    py_stop = Py_None;
+            }
+            py_slice = PySlice_New(py_start, py_stop, Py_None);
+            Py_XDECREF(owned_start);
+            Py_XDECREF(owned_stop);
+            if (unlikely(!py_slice)) goto bad;
+        }
+#if CYTHON_USE_TYPE_SLOTS
+        result = mp->mp_subscript(obj, py_slice);
+#else
+        result = PyObject_GetItem(obj, py_slice);
+#endif
+        if (!_py_slice) {
+            Py_DECREF(py_slice);
+        }
+        return result;
+    }
+    obj_type_name = __Pyx_PyType_GetName(Py_TYPE(obj));
+    PyErr_Format(PyExc_TypeError,
+        "'" __Pyx_FMT_TYPENAME "' object is unsliceable", obj_type_name);
+    __Pyx_DECREF_TypeName(obj_type_name);
+bad:
+    return NULL;
 }
 
 /* PyObject_GenericGetAttrNoDict */
@@ -29666,6 +41781,28 @@ __pyx_slices_overlap(__Pyx_memviewslice *slice1,
     return (start1 < end2) && (start2 < end1);
 }
 
+/* CIntFromPyVerify */
+#define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
+#define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
+#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
+    {\
+        func_type value = func_value;\
+        if (sizeof(target_type) < sizeof(func_type)) {\
+            if (unlikely(value != (func_type) (target_type) value)) {\
+                func_type zero = 0;\
+                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
+                    return (target_type) -1;\
+                if (is_unsigned && unlikely(value < zero))\
+                    goto raise_neg_overflow;\
+                else\
+                    goto raise_overflow;\
+            }\
+        }\
+        return (target_type) value;\
+    }
+
 /* IsLittleEndian */
 static CYTHON_INLINE int __Pyx_Is_Little_Endian(void)
 {
@@ -30410,6 +42547,29 @@ no_fail:
     return retval;
 }
 
+/* ObjectToMemviewSlice */
+  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_double__const__(PyObject *obj, int writable_flag) {
+    __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
+    __Pyx_BufFmt_StackElem stack[1];
+    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
+    int retcode;
+    if (obj == Py_None) {
+        result.memview = (struct __pyx_memoryview_obj *) Py_None;
+        return result;
+    }
+    retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, __Pyx_IS_C_CONTIG,
+                                                 (PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) | writable_flag, 1,
+                                                 &__Pyx_TypeInfo_double__const__, stack,
+                                                 &result, obj);
+    if (unlikely(retcode == -1))
+        goto __pyx_fail;
+    return result;
+__pyx_fail:
+    result.memview = NULL;
+    result.data = NULL;
+    return result;
+}
+
 /* ObjectToMemviewSlice */
   static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_ds_double(PyObject *obj, int writable_flag) {
     __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
@@ -30433,38 +42593,101 @@ __pyx_fail:
     return result;
 }
 
-/* CIntFromPyVerify */
-  #define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
-    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
-#define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
-    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
-#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
-    {\
-        func_type value = func_value;\
-        if (sizeof(target_type) < sizeof(func_type)) {\
-            if (unlikely(value != (func_type) (target_type) value)) {\
-                func_type zero = 0;\
-                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
-                    return (target_type) -1;\
-                if (is_unsigned && unlikely(value < zero))\
-                    goto raise_neg_overflow;\
-                else\
-                    goto raise_overflow;\
-            }\
-        }\
-        return (target_type) value;\
+/* ObjectToMemviewSlice */
+  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_dc_unsigned_char__const__(PyObject *obj, int writable_flag) {
+    __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
+    __Pyx_BufFmt_StackElem stack[1];
+    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_FOLLOW), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
+    int retcode;
+    if (obj == Py_None) {
+        result.memview = (struct __pyx_memoryview_obj *) Py_None;
+        return result;
+    }
+    retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, __Pyx_IS_C_CONTIG,
+                                                 (PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) | writable_flag, 2,
+                                                 &__Pyx_TypeInfo_unsigned_char__const__, stack,
+                                                 &result, obj);
+    if (unlikely(retcode == -1))
+        goto __pyx_fail;
+    return result;
+__pyx_fail:
+    result.memview = NULL;
+    result.data = NULL;
+    return result;
+}
+
+/* ObjectToMemviewSlice */
+  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_dc_float(PyObject *obj, int writable_flag) {
+    __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
+    __Pyx_BufFmt_StackElem stack[1];
+    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_FOLLOW), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
+    int retcode;
+    if (obj == Py_None) {
+        result.memview = (struct __pyx_memoryview_obj *) Py_None;
+        return result;
+    }
+    retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, __Pyx_IS_C_CONTIG,
+                                                 (PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) | writable_flag, 2,
+                                                 &__Pyx_TypeInfo_float, stack,
+                                                 &result, obj);
+    if (unlikely(retcode == -1))
+        goto __pyx_fail;
+    return result;
+__pyx_fail:
+    result.memview = NULL;
+    result.data = NULL;
+    return result;
+}
+
+/* ObjectToMemviewSlice */
+  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_dc_double(PyObject *obj, int writable_flag) {
+    __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
+    __Pyx_BufFmt_StackElem stack[1];
+    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_FOLLOW), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
+    int retcode;
+    if (obj == Py_None) {
+        result.memview = (struct __pyx_memoryview_obj *) Py_None;
+        return result;
     }
+    retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, __Pyx_IS_C_CONTIG,
+                                                 (PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) | writable_flag, 2,
+                                                 &__Pyx_TypeInfo_double, stack,
+                                                 &result, obj);
+    if (unlikely(retcode == -1))
+        goto __pyx_fail;
+    return result;
+__pyx_fail:
+    result.memview = NULL;
+    result.data = NULL;
+    return result;
+}
 
 /* MemviewDtypeToObject */
-  static CYTHON_INLINE PyObject *__pyx_memview_get_double(const char *itemp) {
-    return (PyObject *) PyFloat_FromDouble(*(double *) itemp);
+  static CYTHON_INLINE PyObject *__pyx_memview_get_double__const__(const char *itemp) {
+    return (PyObject *) PyFloat_FromDouble(*(double const  *) itemp);
 }
-static CYTHON_INLINE int __pyx_memview_set_double(const char *itemp, PyObject *obj) {
-    double value = __pyx_PyFloat_AsDouble(obj);
-    if (unlikely((value == (double)-1) && PyErr_Occurred()))
-        return 0;
-    *(double *) itemp = value;
-    return 1;
+
+/* ObjectToMemviewSlice */
+  static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_int__const__(PyObject *obj, int writable_flag) {
+    __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
+    __Pyx_BufFmt_StackElem stack[1];
+    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
+    int retcode;
+    if (obj == Py_None) {
+        result.memview = (struct __pyx_memoryview_obj *) Py_None;
+        return result;
+    }
+    retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, __Pyx_IS_C_CONTIG,
+                                                 (PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) | writable_flag, 1,
+                                                 &__Pyx_TypeInfo_int__const__, stack,
+                                                 &result, obj);
+    if (unlikely(retcode == -1))
+        goto __pyx_fail;
+    return result;
+__pyx_fail:
+    result.memview = NULL;
+    result.data = NULL;
+    return result;
 }
 
 /* Declarations */
@@ -31131,77 +43354,6 @@ static CYTHON_INLINE void __Pyx_XCLEAR_MEMVIEW(__Pyx_memviewslice *memslice,
     }
 }
 
-/* CIntToPy */
-  static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
-#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
-#pragma GCC diagnostic push
-#pragma GCC diagnostic ignored "-Wconversion"
-#endif
-    const long neg_one = (long) -1, const_zero = (long) 0;
-#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
-#pragma GCC diagnostic pop
-#endif
-    const int is_unsigned = neg_one > const_zero;
-    if (is_unsigned) {
-        if (sizeof(long) < sizeof(long)) {
-            return PyInt_FromLong((long) value);
-        } else if (sizeof(long) <= sizeof(unsigned long)) {
-            return PyLong_FromUnsignedLong((unsigned long) value);
-#ifdef HAVE_LONG_LONG
-        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
-            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
-#endif
-        }
-    } else {
-        if (sizeof(long) <= sizeof(long)) {
-            return PyInt_FromLong((long) value);
-#ifdef HAVE_LONG_LONG
-        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
-            return PyLong_FromLongLong((PY_LONG_LONG) value);
-#endif
-        }
-    }
-    {
-        unsigned char *bytes = (unsigned char *)&value;
-#if !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d00A4
-        if (is_unsigned) {
-            return PyLong_FromUnsignedNativeBytes(bytes, sizeof(value), -1);
-        } else {
-            return PyLong_FromNativeBytes(bytes, sizeof(value), -1);
-        }
-#elif !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030d0000
-        int one = 1; int little = (int)*(unsigned char *)&one;
-        return _PyLong_FromByteArray(bytes, sizeof(long),
-                                     little, !is_unsigned);
-#else
-        int one = 1; int little = (int)*(unsigned char *)&one;
-        PyObject *from_bytes, *result = NULL;
-        PyObject *py_bytes = NULL, *arg_tuple = NULL, *kwds = NULL, *order_str = NULL;
-        from_bytes = PyObject_GetAttrString((PyObject*)&PyLong_Type, "from_bytes");
-        if (!from_bytes) return NULL;
-        py_bytes = PyBytes_FromStringAndSize((char*)bytes, sizeof(long));
-        if (!py_bytes) goto limited_bad;
-        order_str = PyUnicode_FromString(little ? "little" : "big");
-        if (!order_str) goto limited_bad;
-        arg_tuple = PyTuple_Pack(2, py_bytes, order_str);
-        if (!arg_tuple) goto limited_bad;
-        if (!is_unsigned) {
-            kwds = PyDict_New();
-            if (!kwds) goto limited_bad;
-            if (PyDict_SetItemString(kwds, "signed", __Pyx_NewRef(Py_True))) goto limited_bad;
-        }
-        result = PyObject_Call(from_bytes, arg_tuple, kwds);
-        limited_bad:
-        Py_XDECREF(kwds);
-        Py_XDECREF(arg_tuple);
-        Py_XDECREF(order_str);
-        Py_XDECREF(py_bytes);
-        Py_XDECREF(from_bytes);
-        return result;
-#endif
-    }
-}
-
 /* CIntFromPy */
   static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
 #ifdef __Pyx_HAS_GCC_DIAGNOSTIC
@@ -31540,6 +43692,77 @@ raise_neg_overflow:
     }
 }
 
+/* CIntToPy */
+  static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(long) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(long) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(long) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        unsigned char *bytes = (unsigned char *)&value;
+#if !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d00A4
+        if (is_unsigned) {
+            return PyLong_FromUnsignedNativeBytes(bytes, sizeof(value), -1);
+        } else {
+            return PyLong_FromNativeBytes(bytes, sizeof(value), -1);
+        }
+#elif !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030d0000
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        return _PyLong_FromByteArray(bytes, sizeof(long),
+                                     little, !is_unsigned);
+#else
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        PyObject *from_bytes, *result = NULL;
+        PyObject *py_bytes = NULL, *arg_tuple = NULL, *kwds = NULL, *order_str = NULL;
+        from_bytes = PyObject_GetAttrString((PyObject*)&PyLong_Type, "from_bytes");
+        if (!from_bytes) return NULL;
+        py_bytes = PyBytes_FromStringAndSize((char*)bytes, sizeof(long));
+        if (!py_bytes) goto limited_bad;
+        order_str = PyUnicode_FromString(little ? "little" : "big");
+        if (!order_str) goto limited_bad;
+        arg_tuple = PyTuple_Pack(2, py_bytes, order_str);
+        if (!arg_tuple) goto limited_bad;
+        if (!is_unsigned) {
+            kwds = PyDict_New();
+            if (!kwds) goto limited_bad;
+            if (PyDict_SetItemString(kwds, "signed", __Pyx_NewRef(Py_True))) goto limited_bad;
+        }
+        result = PyObject_Call(from_bytes, arg_tuple, kwds);
+        limited_bad:
+        Py_XDECREF(kwds);
+        Py_XDECREF(arg_tuple);
+        Py_XDECREF(order_str);
+        Py_XDECREF(py_bytes);
+        Py_XDECREF(from_bytes);
+        return result;
+#endif
+    }
+}
+
 /* CIntFromPy */
   static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
 #ifdef __Pyx_HAS_GCC_DIAGNOSTIC
@@ -32084,7 +44307,7 @@ __Pyx_PyType_GetName(PyTypeObject* tp)
     if (unlikely(name == NULL) || unlikely(!PyUnicode_Check(name))) {
         PyErr_Clear();
         Py_XDECREF(name);
-        name = __Pyx_NewRef(__pyx_n_s__24);
+        name = __Pyx_NewRef(__pyx_n_s__34);
     }
     return name;
 }
@@ -8,111 +8,735 @@ import numpy as np
 cimport numpy as np
 from libc.math cimport sqrt
 from libc.math cimport pow
+from libc.math cimport floor
+from libc.math cimport sqrtf
+from libc.stdlib cimport malloc, free
 from cpython cimport array
+from cython cimport floating
+from cython.parallel cimport parallel, prange
 import array
-from typing import Dict, List
+import os
+from typing import Dict, List, Union
+
+from pymica.methods.idw_power cimport (IdwPower, make_power, station_weight,
+                                        station_weight32)
+from pymica.methods.station_arrays import station_arrays
 
 DTYPE = np.float64
 ctypedef np.float64_t DTYPE_t
 
-def inverse_distance(data: List[Dict[str, float]],
+def inverse_distance(data: Union[List[Dict[str, float]], np.ndarray],
                      size: List[int], geotransform: List[int],
-                     power: int=2, smoothing: float=0.0):
+                     power: float=2, smoothing: float=0.0, int num_threads=1,
+                     int k_nearest=0, double max_radius=0.0, out=None,
+                     mask=None, double nodata=np.nan, precision='float64'):
     """
     inverse_distance(data, size, geotransform)
 
     Interpolates the data field using the inverse of the distance method
     
     Args:
-        data (dict): The data dict
+        data (dict): The data dict. A structured array with the x, y and value
+                     fields is also accepted.
         size (list): x X y
         geotransform (list): The geotransform to apply to relate the data coordinates
                              and the position in the matrix.
                              See https://www.gdal.org/gdal_datamodel.html for more information
+        power (float): The power of the distance in the weights. Any real
+                       value is accepted, multiples of 0.5 are the fastest.
+                       Defaults to 2.
+        smoothing (float): Smoothing distance added to the distances.
+                           Defaults to 0.
+        num_threads (int): Number of OpenMP threads used to compute the rows of
+                           the field. 1 runs serially, 0 or less uses all the
+                           available cores. The result does not depend on it.
+        k_nearest (int): If greater than 0, only the k nearest stations to each
+                         point are used. Defaults to 0, all the stations.
+        max_radius (float): If greater than 0, only the stations closer than
+                            max_radius to each point are used. Points without
+                            any station in the radius are set to 0.
+                            Defaults to 0, no limit.
+        out (np.array): Optional C-contiguous float32 or float64 array with
+                        shape `size` where the field is written. Defaults to
+                        None, a new float64 array.
+        mask (np.array): Optional 2-D array with shape `size`. Only the pixels
+                         where it is not 0 are interpolated. Defaults to None,
+                         all the pixels.
+        nodata (float): Value of the masked pixels. Defaults to NaN.
+        precision (str): 'float64' or 'float32', the precision of the weights
+                         when all the stations are used. The float32 kernel
+                         computes twice as many weights per vector
+                         instruction, with a relative error around 1e-6. The
+                         neighbour search with k_nearest or max_radius always
+                         works in float64. Defaults to 'float64'.
 
     Returns:
-        list: The interpolated data
+        np.array: The interpolated data, `out` if it was provided
     """
+    xpos, ypos, values = station_arrays(data, ('x', 'y', 'value'))
+
+    return inverse_distance_arrays(xpos, ypos, values, size, geotransform,
+                                   power, smoothing, num_threads, k_nearest,
+                                   max_radius, out, mask, nodata, precision)
+
 
-    cdef array.array da = array.array('d', [])
-    array.resize(da, size[0] * size[1])
-    cdef double[:] cda = da
+def inverse_distance_arrays(xpos, ypos, values,
+                            size: List[int], geotransform: List[int],
+                            power: float=2, smoothing: float=0.0,
+                            int num_threads=1, int k_nearest=0,
+                            double max_radius=0.0, out=None, mask=None,
+                            double nodata=np.nan, precision='float64'):
+    """
+    inverse_distance_arrays(xpos, ypos, values, size, geotransform)
 
-    xpos0 = []
-    ypos0 = []
-    values0 = []
+    Same as inverse_distance, but taking the station coordinates and values
+    as 1-D arrays. Contiguous float64 arrays are used without any copy.
 
-    for d in data:
-        xpos0.append(d['x'])
-        ypos0.append(d['y'])
-        values0.append(d['value'])
+    Args:
+        xpos (np.array): The x coordinate of the stations
+        ypos (np.array): The y coordinate of the stations
+        values (np.array): The station values
+        size (list): x X y
+        geotransform (list): The geotransform to apply to relate the data coordinates
+                             and the position in the matrix.
+        power (float): Power of the distance, as in inverse_distance.
+        smoothing (float): Smoothing distance, as in inverse_distance.
+        num_threads (int): Number of OpenMP threads, as in inverse_distance.
+        k_nearest (int): Number of nearest stations, as in inverse_distance.
+        max_radius (float): Search radius, as in inverse_distance.
+        out (np.array): Output array, as in inverse_distance.
+        mask (np.array): Valid pixels, as in inverse_distance.
+        nodata (float): Value of the masked pixels, as in inverse_distance.
+        precision (str): Precision of the weights, as in inverse_distance.
+
+    Returns:
+        np.array: The interpolated data, `out` if it was provided
+    """
+    cdef const double[::1] cxpos = np.ascontiguousarray(xpos, dtype=DTYPE)
+    cdef const double[::1] cypos = np.ascontiguousarray(ypos, dtype=DTYPE)
+    cdef const double[::1] cvalues = np.ascontiguousarray(values, dtype=DTYPE)
 
     cdef int N
-    N = len(xpos0)
-    #http://cython.readthedocs.io/en/latest/src/tutorial/array.html
-    cdef array.array xpos = array.array('d', xpos0)
-    cdef double[:] cxpos = xpos
-    cdef array.array ypos = array.array('d', ypos0)
-    cdef double[:] cypos = ypos
-    cdef array.array values = array.array('d', values0)
-    cdef double[:] cvalues = values
+    N = cvalues.shape[0]
+    if cxpos.shape[0] != N or cypos.shape[0] != N:
+        raise ValueError("xpos, ypos and values must have the same length")
+    if k_nearest < 0:
+        raise ValueError("k_nearest must be 0 or a positive number of stations")
+    if max_radius < 0:
+        raise ValueError("max_radius must be 0 or a positive distance")
+    if precision not in ('float32', 'float64'):
+        raise ValueError("precision must be 'float32' or 'float64'")
+    cdef bint single = precision == 'float32'
 
-    cdef int i, j
     cdef int xsize = size[1]
     cdef int ysize = size[0]
-    cdef double y
-    cdef double x
+    cdef IdwPower cpower = make_power(power)
+    cdef float csmoothing = smoothing
 
     cdef array.array geotransform0 = array.array('d', geotransform)
     cdef double[:] cgeotransform = geotransform0
 
-    for j in range(ysize):
-        y = cgeotransform[3] + j * cgeotransform[5]
-        for i in range(xsize):
-            x = cgeotransform[0] + i * cgeotransform[1]
-            cda[i + j * xsize] = point_residue(x, y, cxpos, cypos, cvalues, N, power, smoothing)
+    if out is None:
+        out = np.empty((ysize, xsize), dtype=DTYPE)
+    elif (not isinstance(out, np.ndarray) or out.shape != (ysize, xsize)
+          or out.dtype not in (np.float32, np.float64)
+          or not out.flags['C_CONTIGUOUS']):
+        raise ValueError("out must be a C-contiguous float32 or float64 array "
+                         "with shape " + str((ysize, xsize)))
+
+    cdef const unsigned char[:, ::1] cmask
+    cdef const unsigned char *mask_ptr = NULL
+    if mask is not None:
+        mask = np.asarray(mask)
+        if mask.shape != (ysize, xsize):
+            raise ValueError("mask must have shape " + str((ysize, xsize)))
+        cmask = np.ascontiguousarray(mask != 0).view(np.uint8)
+        if ysize > 0 and xsize > 0:
+            mask_ptr = &cmask[0, 0]
+
+    if num_threads <= 0:
+        num_threads = os.cpu_count() or 1
+
+    if k_nearest >= N and max_radius == 0:
+        k_nearest = 0
+
+    cdef float[:, ::1] out32
+    cdef double[:, ::1] out64
+    if out.dtype == np.float32:
+        out32 = out
+        fill_field(out32, cxpos, cypos, cvalues, cgeotransform, cpower,
+                   csmoothing, num_threads, k_nearest, max_radius, mask_ptr,
+                   nodata, single)
+    else:
+        out64 = out
+        fill_field(out64, cxpos, cypos, cvalues, cgeotransform, cpower,
+                   csmoothing, num_threads, k_nearest, max_radius, mask_ptr,
+                   nodata, single)
+
+    return out
+
+
+cdef void fill_field(floating[:, ::1] out, const double[::1] xpos,
+                     const double[::1] ypos, const double[::1] values,
+                     double[:] cgeotransform, IdwPower power, float smoothing,
+                     int num_threads, int k_nearest, double max_radius,
+                     const unsigned char *mask, double nodata, bint single):
+    if values.shape[0] > 0 and (k_nearest > 0 or max_radius > 0):
+        neighbour_field(out, xpos, ypos, values, cgeotransform, power,
+                        smoothing, num_threads, k_nearest, max_radius, mask,
+                        nodata)
+    elif single:
+        tiled_field32(out, xpos, ypos, values, cgeotransform, power, smoothing,
+                      num_threads, mask, nodata)
+    else:
+        tiled_field(out, xpos, ypos, values, cgeotransform, power, smoothing,
+                    num_threads, mask, nodata)
+
+
+# Pixels are computed in tiles of TILE_ROWS x TILE_COLS, visiting the stations
+# in blocks of STATION_BLOCK, so both the tile accumulators and the station
+# block stay in cache while they are used.
+# The grid is regular and axis-aligned, so for each station the squared x
+# distance only depends on the column and the squared y distance on the row.
+# Both are tabulated for the tile and the station block, leaving two additions
+# per pixel and station instead of recomputing the differences.
+cdef enum:
+    TILE_ROWS = 32
+    TILE_COLS = 32
+    STATION_BLOCK = 128
+
+
+cdef void tiled_field(floating[:, ::1] out, const double[::1] xpos,
+                      const double[::1] ypos, const double[::1] values,
+                      double[:] cgeotransform, IdwPower power, float smoothing,
+                      int num_threads, const unsigned char *mask,
+                      double nodata):
+    """Fills out using all the stations for each pixel."""
+    cdef int tiles_x = (out.shape[1] + TILE_COLS - 1) // TILE_COLS
+    cdef int tiles_y = (out.shape[0] + TILE_ROWS - 1) // TILE_ROWS
+    cdef int tile
+    cdef double *numerator
+    cdef double *denominator
+    cdef char *hit
+    cdef double *dx_sq
+    cdef double *dy_sq
+
+    # Tiles are scheduled dynamically because pixels on top of a station
+    # stop early and make the cost of each tile uneven.
+    with nogil, parallel(num_threads=num_threads):
+        numerator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))
+        denominator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))
+        hit = <char *> malloc(TILE_ROWS * TILE_COLS * sizeof(char))
+        dx_sq = <double *> malloc(TILE_COLS * STATION_BLOCK * sizeof(double))
+        dy_sq = <double *> malloc(TILE_ROWS * STATION_BLOCK * sizeof(double))
+        for tile in prange(tiles_x * tiles_y, schedule='dynamic'):
+            fill_tile(out, (tile // tiles_x) * TILE_ROWS,
+                      (tile % tiles_x) * TILE_COLS, xpos, ypos, values,
+                      cgeotransform, power, smoothing, mask, nodata,
+                      numerator, denominator, hit, dx_sq, dy_sq)
+        free(numerator)
+        free(denominator)
+        free(hit)
+        free(dx_sq)
+        free(dy_sq)
+
+
+cdef void fill_tile(floating[:, ::1] out, int row0, int col0,
+                    const double[::1] xpos, const double[::1] ypos,
+                    const double[::1] values, double[:] cgeotransform,
+                    IdwPower power, float smoothing, const unsigned char *mask,
+                    double nodata, double *numerator, double *denominator,
+                    char *hit, double *dx_sq, double *dy_sq) noexcept nogil:
+    """Computes one tile. Each pixel still adds the station weights in the
+    station order, so the result does not depend on the tiling.
+    Masked pixels are flagged with hit = 2 and skipped like the pixels on top
+    of a station."""
+    cdef int rows = min(TILE_ROWS, out.shape[0] - row0)
+    cdef int cols = min(TILE_COLS, out.shape[1] - col0)
+    cdef int N = values.shape[0]
+    cdef float smoothing_sq = smoothing * smoothing
+    cdef double x, y, dx, dy, dist_sq, weight, num, den
+    cdef const double *row_dx_sq
+    cdef const double *row_dy_sq
+    cdef int block, block_size, r, c, p, s
+    cdef int valid = rows * cols
+    cdef const double *px = &xpos[0] if N > 0 else NULL
+    cdef const double *py = &ypos[0] if N > 0 else NULL
+    cdef const double *pv = &values[0] if N > 0 else NULL
+
+    for r in range(rows):
+        for c in range(cols):
+            p = r * cols + c
+            numerator[p] = 0.0
+            denominator[p] = 0.0
+            hit[p] = 0
+            if mask != NULL and not mask[(row0 + r) * out.shape[1] + col0 + c]:
+                hit[p] = 2
+                valid = valid - 1
+
+    # Tiles fully masked, like the sea in a land field, skip the stations
+    block = 0 if valid > 0 else N
+    while block < N:
+        block_size = min(STATION_BLOCK, N - block)
+
+        for c in range(cols):
+            x = cgeotransform[0] + (col0 + c) * cgeotransform[1]
+            for s in range(block_size):
+                dx = x - px[block + s]
+                dx_sq[c * STATION_BLOCK + s] = dx * dx
+        for r in range(rows):
+            y = cgeotransform[3] + (row0 + r) * cgeotransform[5]
+            for s in range(block_size):
+                dy = y - py[block + s]
+                dy_sq[r * STATION_BLOCK + s] = dy * dy
+
+        for r in range(rows):
+            row_dy_sq = dy_sq + r * STATION_BLOCK
+            for c in range(cols):
+                p = r * cols + c
+                if hit[p]:
+                    continue
+                row_dx_sq = dx_sq + c * STATION_BLOCK
+                num = numerator[p]
+                den = denominator[p]
+                for s in range(block_size):
+                    dist_sq = row_dx_sq[s] + row_dy_sq[s] + smoothing_sq
+
+                    if dist_sq < 1e-11:
+                        hit[p] = 1
+                        num = pv[block + s]
+                        break
+
+                    weight = station_weight(dist_sq, power)
+                    num += pv[block + s] * weight
+                    den += weight
+                numerator[p] = num
+                denominator[p] = den
+        block = block + block_size
+
+    for r in range(rows):
+        for c in range(cols):
+            p = r * cols + c
+            if hit[p] == 2:
+                out[row0 + r, col0 + c] = <floating> nodata
+            elif hit[p]:
+                out[row0 + r, col0 + c] = <floating> numerator[p]
+            elif denominator[p] != 0.0:
+                out[row0 + r, col0 + c] = <floating> (numerator[p] / denominator[p])
+            else:
+                out[row0 + r, col0 + c] = 0.0
+
+
+# The float32 kernel keeps the tiles, but loops over the stations outside and
+# over the columns of a tile row inside. Each pixel still adds the stations in
+# order, and the inner loop has no branch nor reduction, so the compiler can
+# vectorise it without reordering any sum. The coordinate differences are
+# taken in float64 before being squared and rounded, so the UTM magnitudes of
+# the coordinates do not cost any precision, and the float32 sums of each
+# station block are added to float64 accumulators.
+cdef void tiled_field32(floating[:, ::1] out, const double[::1] xpos,
+                        const double[::1] ypos, const double[::1] values,
+                        double[:] cgeotransform, IdwPower power,
+                        float smoothing, int num_threads,
+                        const unsigned char *mask, double nodata):
+    """Fills out using all the stations for each pixel in float32."""
+    cdef int tiles_x = (out.shape[1] + TILE_COLS - 1) // TILE_COLS
+    cdef int tiles_y = (out.shape[0] + TILE_ROWS - 1) // TILE_ROWS
+    cdef int tile
+    cdef double *numerator
+    cdef double *denominator
+    cdef char *hit
+    cdef float *dx_sq
+    cdef float *block_sums
+
+    with nogil, parallel(num_threads=num_threads):
+        numerator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))
+        denominator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))
+        hit = <char *> malloc(TILE_ROWS * TILE_COLS * sizeof(char))
+        dx_sq = <float *> malloc(STATION_BLOCK * TILE_COLS * sizeof(float))
+        block_sums = <float *> malloc(2 * TILE_COLS * sizeof(float))
+        for tile in prange(tiles_x * tiles_y, schedule='dynamic'):
+            fill_tile32(out, (tile // tiles_x) * TILE_ROWS,
+                        (tile % tiles_x) * TILE_COLS, xpos, ypos, values,
+                        cgeotransform, power, smoothing, mask, nodata,
+                        numerator, denominator, hit, dx_sq, block_sums)
+        free(numerator)
+        free(denominator)
+        free(hit)
+        free(dx_sq)
+        free(block_sums)
+
+
+cdef void fill_tile32(floating[:, ::1] out, int row0, int col0,
+                      const double[::1] xpos, const double[::1] ypos,
+                      const double[::1] values, double[:] cgeotransform,
+                      IdwPower power, float smoothing,
+                      const unsigned char *mask, double nodata,
+                      double *numerator, double *denominator, char *hit,
+                      float *dx_sq, float *block_sums) noexcept nogil:
+    """Computes one tile in float32. The pixels on top of a station are found
+    in float64 before adding the block, with the same threshold as fill_tile,
+    and the first of those stations gives their value."""
+    cdef int rows = min(TILE_ROWS, out.shape[0] - row0)
+    cdef int cols = min(TILE_COLS, out.shape[1] - col0)
+    cdef int N = values.shape[0]
+    cdef float smoothing_sq = smoothing * smoothing
+    cdef bint exact_hits = smoothing_sq < 1e-11
+    cdef bint inverse_square = power.whole == 1 and power.quarters == 0
+    cdef float one = 1.0
+    cdef float dist_sq, weight, value, row_dy_sq
+    cdef float *num = block_sums
+    cdef float *den = block_sums + TILE_COLS
+    cdef const float *row_dx_sq
+    cdef double x, y, dx, dy
+    cdef int block, block_size, r, c, p, s, r2
+    cdef int valid = rows * cols
+    cdef const double *px = &xpos[0] if N > 0 else NULL
+    cdef const double *py = &ypos[0] if N > 0 else NULL
+    cdef const double *pv = &values[0] if N > 0 else NULL
+
+    for r in range(rows):
+        for c in range(cols):
+            p = r * cols + c
+            numerator[p] = 0.0
+            denominator[p] = 0.0
+            hit[p] = 0
+            if mask != NULL and not mask[(row0 + r) * out.shape[1] + col0 + c]:
+                hit[p] = 2
+                valid = valid - 1
+
+    block = 0 if valid > 0 else N
+    while block < N:
+        block_size = min(STATION_BLOCK, N - block)
+
+        for s in range(block_size):
+            for c in range(cols):
+                x = cgeotransform[0] + (col0 + c) * cgeotransform[1]
+                dx = x - px[block + s]
+                dx_sq[s * TILE_COLS + c] = <float> (dx * dx)
+                if exact_hits and dx * dx + smoothing_sq < 1e-11:
+                    for r2 in range(rows):
+                        y = cgeotransform[3] + (row0 + r2) * cgeotransform[5]
+                        dy = y - py[block + s]
+                        p = r2 * cols + c
+                        if (hit[p] == 0
+                                and dx * dx + dy * dy + smoothing_sq < 1e-11):
+                            hit[p] = 1
+                            numerator[p] = pv[block + s]
+
+        for r in range(rows):
+            y = cgeotransform[3] + (row0 + r) * cgeotransform[5]
+            for c in range(cols):
+                num[c] = 0.0
+                den[c] = 0.0
+            for s in range(block_size):
+                dy = y - py[block + s]
+                row_dy_sq = <float> (dy * dy) + smoothing_sq
+                value = <float> pv[block + s]
+                row_dx_sq = dx_sq + s * TILE_COLS
+                if inverse_square:
+                    for c in range(cols):
+                        weight = one / (row_dx_sq[c] + row_dy_sq)
+                        num[c] += value * weight
+                        den[c] += weight
+                elif power.whole == 1 and power.quarters == 1:
+                    for c in range(cols):
+                        dist_sq = row_dx_sq[c] + row_dy_sq
+                        weight = one / (dist_sq * sqrtf(sqrtf(dist_sq)))
+                        num[c] += value * weight
+                        den[c] += weight
+                elif power.whole == 1 and power.quarters == 2:
+                    for c in range(cols):
+                        dist_sq = row_dx_sq[c] + row_dy_sq
+                        weight = one / (dist_sq * sqrtf(dist_sq))
+                        num[c] += value * weight
+                        den[c] += weight
+                else:
+                    for c in range(cols):
+                        weight = station_weight32(row_dx_sq[c] + row_dy_sq,
+                                                  power)
+                        num[c] += value * weight
+                        den[c] += weight
+            for c in range(cols):
+                p = r * cols + c
+                if hit[p] == 0:
+                    numerator[p] += num[c]
+                    denominator[p] += den[c]
+        block = block + block_size
+
+    for r in range(rows):
+        for c in range(cols):
+            p = r * cols + c
+            if hit[p] == 2:
+                out[row0 + r, col0 + c] = <floating> nodata
+            elif hit[p]:
+                out[row0 + r, col0 + c] = <floating> numerator[p]
+            elif denominator[p] != 0.0:
+                out[row0 + r, col0 + c] = <floating> (numerator[p] / denominator[p])
+            else:
+                out[row0 + r, col0 + c] = 0.0
+
 
-    data_array = np.array(cda)
-    return data_array.reshape(size)
+cdef struct GridIndex:
+    # Stations sorted by bucket, so the stations of a bucket are contiguous.
+    const double *xpos
+    const double *ypos
+    const double *values
+    # Stations of bucket b are in [start[b], start[b + 1]).
+    const int *start
+    int nx
+    int ny
+    double x0
+    double y0
+    double cell_size
 
 
-cdef inline float point_residue(double x, double y,
-                                double[:] xpos, double[:] ypos,
-                                double[:] values, int N,
-                                int power, float smoothing) nogil:
+def build_grid_index(xpos, ypos, values, int k_nearest=0):
+    """
+    build_grid_index(xpos, ypos, values)
+
+    Sorts the stations into square buckets covering their bounding box, so
+    the stations near a point can be found without visiting all of them.
+
+    Args:
+        xpos (np.array): The x coordinate of the stations
+        ypos (np.array): The y coordinate of the stations
+        values (np.array): The station values
+        k_nearest (int): Number of neighbours that will be queried. Buckets are
+                         sized to hold about that many stations.
+
+    Returns:
+        tuple: x, y and values sorted by bucket, the bucket start offsets, the
+               number of buckets in x and y, the origin and the bucket size.
+    """
+    xpos = np.asarray(xpos, dtype=DTYPE)
+    ypos = np.asarray(ypos, dtype=DTYPE)
+    n_stations = xpos.shape[0]
+
+    x0 = xpos.min()
+    y0 = ypos.min()
+    width = xpos.max() - x0
+    height = ypos.max() - y0
+
+    per_bucket = max(2, min(k_nearest, 16))
+    if width > 0 and height > 0:
+        cell_size = np.sqrt(width * height * per_bucket / n_stations)
+    else:
+        cell_size = max(width, height) * per_bucket / n_stations
+    if cell_size <= 0:
+        cell_size = 1.0
+    # Avoid a huge, mostly empty, bucket grid for very elongated networks
+    while (int(width / cell_size) + 1) * (int(height / cell_size) + 1) > \
+            4 * n_stations + 16:
+        cell_size *= 2
+
+    nx = int(width / cell_size) + 1
+    ny = int(height / cell_size) + 1
+
+    bucket_x = np.minimum(((xpos - x0) / cell_size).astype(np.intc), nx - 1)
+    bucket_y = np.minimum(((ypos - y0) / cell_size).astype(np.intc), ny - 1)
+    bucket = bucket_y * nx + bucket_x
+    order = np.argsort(bucket, kind='stable')
+
+    start = np.zeros(nx * ny + 1, dtype=np.intc)
+    np.cumsum(np.bincount(bucket, minlength=nx * ny), out=start[1:])
+
+    return (np.ascontiguousarray(xpos[order]),
+            np.ascontiguousarray(ypos[order]),
+            np.ascontiguousarray(np.asarray(values, dtype=DTYPE)[order]),
+            start, nx, ny, x0, y0, cell_size)
+
+
+cdef void neighbour_field(floating[:, ::1] out, const double[::1] xpos,
+                          const double[::1] ypos, const double[::1] values,
+                          double[:] cgeotransform, IdwPower power, float smoothing,
+                          int num_threads, int k_nearest, double max_radius,
+                          const unsigned char *mask, double nodata):
+    """Fills out using only the neighbour stations of each pixel."""
+    sorted_x, sorted_y, sorted_values, start, nx, ny, x0, y0, cell_size = \
+        build_grid_index(xpos, ypos, values, k_nearest)
+
+    cdef const double[::1] csorted_x = sorted_x
+    cdef const double[::1] csorted_y = sorted_y
+    cdef const double[::1] csorted_values = sorted_values
+    cdef const int[::1] cstart = start
+
+    cdef GridIndex index
+    index.xpos = &csorted_x[0]
+    index.ypos = &csorted_y[0]
+    index.values = &csorted_values[0]
+    index.start = &cstart[0]
+    index.nx = nx
+    index.ny = ny
+    index.x0 = x0
+    index.y0 = y0
+    index.cell_size = cell_size
+
+    cdef double radius_sq = max_radius * max_radius if max_radius > 0 else -1.0
+    cdef int buffer_size = k_nearest if k_nearest > 0 else 1
+    cdef int *idx_buffer
+    cdef double *dist_buffer
+    cdef int xsize = out.shape[1]
+    cdef int ysize = out.shape[0]
+    cdef int i, j
+    cdef double x, y
+
+    with nogil, parallel(num_threads=num_threads):
+        idx_buffer = <int *> malloc(buffer_size * sizeof(int))
+        dist_buffer = <double *> malloc(buffer_size * sizeof(double))
+        for j in prange(ysize, schedule='dynamic'):
+            y = cgeotransform[3] + j * cgeotransform[5]
+            for i in range(xsize):
+                if mask != NULL and not mask[j * xsize + i]:
+                    out[j, i] = <floating> nodata
+                    continue
+                x = cgeotransform[0] + i * cgeotransform[1]
+                if k_nearest > 0:
+                    out[j, i] = <floating> nearest_residue(
+                        x, y, &index, k_nearest, radius_sq, idx_buffer,
+                        dist_buffer, power, smoothing)
+                else:
+                    out[j, i] = <floating> radius_residue(
+                        x, y, &index, radius_sq, power, smoothing)
+        free(idx_buffer)
+        free(dist_buffer)
+
+
+cdef double nearest_residue(double x, double y, const GridIndex *index,
+                            int k, double radius_sq, int *idx_buffer,
+                            double *dist_buffer, IdwPower power,
+                            float smoothing) noexcept nogil:
+    """Residue at (x, y) from its k nearest stations, searching the buckets
+    in growing square rings until no closer station can be found."""
+    cdef long cx = <long> floor((x - index.x0) / index.cell_size)
+    cdef long cy = <long> floor((y - index.y0) / index.cell_size)
+    cdef long nx = index.nx
+    cdef long ny = index.ny
+    cdef long ring, ring_min, ring_max, bx, by
+    cdef double bound
+    cdef int count = 0
+
+    # First ring touching the bucket grid and last ring needed to cover it
+    ring_min = max(max(-cx, cx - (nx - 1)), max(-cy, cy - (ny - 1)))
+    if ring_min < 0:
+        ring_min = 0
+    ring_max = max(max(cx, nx - 1 - cx), max(cy, ny - 1 - cy))
+
+    for ring in range(ring_min, ring_max + 1):
+        if ring > 0:
+            # No station in this ring is closer than the bound
+            bound = (ring - 1) * index.cell_size
+            bound = bound * bound
+            if count == k and bound >= dist_buffer[k - 1]:
+                break
+            if radius_sq >= 0 and bound > radius_sq:
+                break
+
+        if ring == 0:
+            count = scan_bucket(x, y, index, cx, cy, k, radius_sq,
+                                idx_buffer, dist_buffer, count)
+            continue
+
+        for bx in range(cx - ring, cx + ring + 1):
+            count = scan_bucket(x, y, index, bx, cy - ring, k, radius_sq,
+                                idx_buffer, dist_buffer, count)
+            count = scan_bucket(x, y, index, bx, cy + ring, k, radius_sq,
+                                idx_buffer, dist_buffer, count)
+        for by in range(cy - ring + 1, cy + ring):
+            count = scan_bucket(x, y, index, cx - ring, by, k, radius_sq,
+                                idx_buffer, dist_buffer, count)
+            count = scan_bucket(x, y, index, cx + ring, by, k, radius_sq,
+                                idx_buffer, dist_buffer, count)
+
+    if count == 0:
+        return 0.0
+
     cdef double numerator = 0.0
     cdef double denominator = 0.0
-    cdef double dx, dy, dist_sq, weight
-    cdef int i
+    cdef double dist_sq, weight
+    cdef float smoothing_sq = smoothing * smoothing
+    cdef int n
 
-    smoothing = smoothing * smoothing  # square once
+    for n in range(count):
+        dist_sq = dist_buffer[n] + smoothing_sq
+        if dist_sq < 1e-11:
+            return index.values[idx_buffer[n]]
+        weight = station_weight(dist_sq, power)
+        numerator += index.values[idx_buffer[n]] * weight
+        denominator += weight
 
-    for i in range(N):
-        dx = x - xpos[i]
-        dy = y - ypos[i]
-        dist_sq = dx * dx + dy * dy + smoothing
+    return numerator / denominator
 
-        if dist_sq < 1e-11:
-            return values[i]
 
-        if power == 2:
-            weight = 1.0 / dist_sq
-        else:
-            weight = 1.0 / fast_pow(dist_sq, power // 2)
+cdef inline int scan_bucket(double x, double y, const GridIndex *index,
+                            long bx, long by, int k, double radius_sq,
+                            int *idx_buffer, double *dist_buffer,
+                            int count) noexcept nogil:
+    """Inserts the stations of bucket (bx, by) into the sorted list of the k
+    nearest stations found so far and returns its new length."""
+    cdef int s, n, bucket
+    cdef double dx, dy, dist_sq
 
-        numerator += values[i] * weight
-        denominator += weight
+    if bx < 0 or by < 0 or bx >= index.nx or by >= index.ny:
+        return count
+
+    bucket = by * index.nx + bx
+    for s in range(index.start[bucket], index.start[bucket + 1]):
+        dx = x - index.xpos[s]
+        dy = y - index.ypos[s]
+        dist_sq = dx * dx + dy * dy
+        if radius_sq >= 0 and dist_sq > radius_sq:
+            continue
+        if count == k and dist_sq >= dist_buffer[k - 1]:
+            continue
+
+        if count < k:
+            count = count + 1
+        n = count - 1
+        while n > 0 and dist_buffer[n - 1] > dist_sq:
+            dist_buffer[n] = dist_buffer[n - 1]
+            idx_buffer[n] = idx_buffer[n - 1]
+            n = n - 1
+        dist_buffer[n] = dist_sq
+        idx_buffer[n] = s
+
+    return count
+
+
+cdef double radius_residue(double x, double y, const GridIndex *index,
+                           double radius_sq, IdwPower power,
+                           float smoothing) noexcept nogil:
+    """Residue at (x, y) from all the stations closer than the radius."""
+    cdef double radius = sqrt(radius_sq)
+    cdef long bx_min = max(<long> floor((x - radius - index.x0) / index.cell_size), 0)
+    cdef long bx_max = min(<long> floor((x + radius - index.x0) / index.cell_size),
+                           index.nx - 1)
+    cdef long by_min = max(<long> floor((y - radius - index.y0) / index.cell_size), 0)
+    cdef long by_max = min(<long> floor((y + radius - index.y0) / index.cell_size),
+                           index.ny - 1)
+    cdef double numerator = 0.0
+    cdef double denominator = 0.0
+    cdef double dx, dy, dist_sq, weight
+    cdef float smoothing_sq = smoothing * smoothing
+    cdef long bx, by
+    cdef int s, bucket
+
+    for by in range(by_min, by_max + 1):
+        for bx in range(bx_min, bx_max + 1):
+            bucket = by * index.nx + bx
+            for s in range(index.start[bucket], index.start[bucket + 1]):
+                dx = x - index.xpos[s]
+                dy = y - index.ypos[s]
+                dist_sq = dx * dx + dy * dy
+                if dist_sq > radius_sq:
+                    continue
+                dist_sq = dist_sq + smoothing_sq
+                if dist_sq < 1e-11:
+                    return index.values[s]
+                weight = station_weight(dist_sq, power)
+                numerator += index.values[s] * weight
+                denominator += weight
 
     if denominator != 0.0:
         return numerator / denominator
     return 0.0
-
-
-cdef inline double fast_pow(double base, int exp) nogil:
-    cdef double result = 1.0
-    while exp > 0:
-        if exp & 1:
-            result *= base
-        base *= base
-        exp >>= 1
-    return result
\ No newline at end of file
@@ -8,107 +8,431 @@ import numpy as np
 cimport numpy as np
 from libc.math cimport sqrt
 from libc.math cimport pow
+from libc.math cimport sqrtf
+from libc.stdlib cimport malloc, free
 from cpython cimport array
+from cython cimport floating
+from cython.parallel cimport parallel, prange
 import array
+import os
 from typing import Dict, List, Union
 
+from pymica.methods.idw_power cimport (IdwPower, make_power, station_weight,
+                                        station_weight32)
+from pymica.methods.station_arrays import station_arrays
+
 DTYPE = np.float64
 ctypedef np.float64_t DTYPE_t
 
-def inverse_distance_3d(data: List[Dict[str, float]],
+# DEM dtypes read without conversion, as int16 and float32 GeoTIFFs are read
+# by GDAL. Any other dtype is converted to float64.
+ctypedef fused dem_t:
+    short
+    float
+    double
+
+def inverse_distance_3d(data: Union[List[Dict[str, float]], np.ndarray],
                         size: List[int], geotransform: List[int], dem,
-                        int power=2, int smoothing=0,
-                        int penalization=30):
+                        double power=2, double smoothing=0,
+                        double penalization=30, out=None, mask=None,
+                        double nodata=np.nan, precision='float64',
+                        int num_threads=1):
     """
     inverse_distance_3d(residues, size, geotransform, dem)
 
     Interpolates the residues field using the inverse of the distance method
     
     Args:
-        residues (dict): The residues dict
+        residues (dict): The residues dict. A structured array with the x, y,
+                         altitude and value fields is also accepted.
         size (list): x X y
         geotransform (list): The geotransform to apply to relate the residues coordinates
                              and the position in the matrix.
                              See https://www.gdal.org/gdal_datamodel.html for more information
         dem(np.array): 2-D array of altitudes with the same geotransform
+        power (float): The power of the distance in the weights. Any real
+                       value is accepted, multiples of 0.5 are the fastest.
+                       Defaults to 2.
+        smoothing (float): Smoothing distance. Defaults to 0.
+        penalization (float): Altitude penalization. Defaults to 30.
+        out (np.array): Optional C-contiguous float32 or float64 array with
+                        shape `size` where the field is written. Defaults to
+                        None, a new float64 array.
+        mask (np.array): Optional 2-D array with shape `size`. Only the pixels
+                         where it is not 0 are interpolated. Defaults to None,
+                         all the pixels.
+        nodata (float): Value of the masked pixels. Defaults to NaN.
+        precision (str): 'float64' or 'float32', the precision of the weights.
+                         The float32 kernel computes twice as many weights
+                         per vector instruction, with a relative error
+                         around 1e-6. Defaults to 'float64'.
+        num_threads (int): Number of OpenMP threads used to compute the field.
+                           1 runs serially, 0 or less uses all the available
+                           cores. The result does not depend on it.
+                           Defaults to 1.
     
     Returns:
-        list: The interpolated residues
+        np.array: The interpolated residues, `out` if it was provided
     """
+    xpos, ypos, zpos, values = station_arrays(data,
+                                              ('x', 'y', 'altitude', 'value'))
+
+    return inverse_distance_3d_arrays(xpos, ypos, zpos, values, size,
+                                      geotransform, dem, power, smoothing,
+                                      penalization, out, mask, nodata,
+                                      precision, num_threads)
 
-    cdef array.array da = array.array('d', [])
-    array.resize(da, size[0] * size[1])
-    cdef double[:] cda = da
 
-    xpos0 = []
-    ypos0 = []
-    zpos0 = []
-    values0 = []
+def inverse_distance_3d_arrays(xpos, ypos, zpos, values,
+                               size: List[int], geotransform: List[int], dem,
+                               double power=2, double smoothing=0,
+                               double penalization=30, out=None, mask=None,
+                               double nodata=np.nan, precision='float64',
+                               int num_threads=1):
+    """
+    inverse_distance_3d_arrays(xpos, ypos, zpos, values, size, geotransform, dem)
+
+    Same as inverse_distance_3d, but taking the station coordinates, altitudes
+    and values as 1-D arrays. Contiguous float64 arrays are used without any copy,
+    and so are contiguous int16, float32 and float64 DEMs.
 
-    for d in data:
-        xpos0.append(d['x'])
-        ypos0.append(d['y'])
-        zpos0.append(d['altitude'])
-        values0.append(d['value'])
+    Args:
+        xpos (np.array): The x coordinate of the stations
+        ypos (np.array): The y coordinate of the stations
+        zpos (np.array): The altitude of the stations
+        values (np.array): The station values
+        size (list): x X y
+        geotransform (list): The geotransform to apply to relate the residues coordinates
+                             and the position in the matrix.
+        dem(np.array): 2-D array of altitudes with the same geotransform
+        power (float): Power of the distance, as in inverse_distance_3d.
+        smoothing (float): Smoothing distance, as in inverse_distance_3d.
+        penalization (float): Altitude penalization, as in inverse_distance_3d.
+        out (np.array): Output array, as in inverse_distance_3d.
+        mask (np.array): Valid pixels, as in inverse_distance_3d.
+        nodata (float): Value of the masked pixels, as in inverse_distance_3d.
+        precision (str): Precision of the weights, as in inverse_distance_3d.
+        num_threads (int): Number of OpenMP threads, as in inverse_distance_3d.
+
+    Returns:
+        np.array: The interpolated residues, `out` if it was provided
+    """
+
+    cdef const double[::1] cxpos = np.ascontiguousarray(xpos, dtype=DTYPE)
+    cdef const double[::1] cypos = np.ascontiguousarray(ypos, dtype=DTYPE)
+    cdef const double[::1] czpos = np.ascontiguousarray(zpos, dtype=DTYPE)
+    cdef const double[::1] cvalues = np.ascontiguousarray(values, dtype=DTYPE)
 
     cdef int N
-    N = len(xpos0)
-    #http://cython.readthedocs.io/en/latest/src/tutorial/array.html
-    cdef array.array xpos = array.array('d', xpos0)
-    cdef double[:] cxpos = xpos
-    cdef array.array ypos = array.array('d', ypos0)
-    cdef double[:] cypos = ypos
-    cdef array.array zpos = array.array('d', zpos0)
-    cdef double[:] czpos = zpos
-    cdef array.array values = array.array('d', values0)
-    cdef double[:] cvalues = values
+    N = cvalues.shape[0]
+    if cxpos.shape[0] != N or cypos.shape[0] != N or czpos.shape[0] != N:
+        raise ValueError("xpos, ypos, zpos and values must have the same length")
+    if precision not in ('float32', 'float64'):
+        raise ValueError("precision must be 'float32' or 'float64'")
 
-    cdef int i, j
     cdef int xsize = size[1]
     cdef int ysize = size[0]
-    cdef double y
-    cdef double x
-    cdef double z
 
     cdef array.array geotransform0 = array.array('d', geotransform)
     cdef double[:] cgeotransform = geotransform0
 
-    for j in range(ysize):
-        y = cgeotransform[3] + j * cgeotransform[5]
-        for i in range(xsize):
-            x = cgeotransform[0] + i * cgeotransform[1]
-            z = dem[j, i]
-            cda[i + j * xsize] = point_residue(x, y, z, cxpos, cypos, czpos,
-                                               cvalues, N, power, smoothing,
-                                               penalization)
-
-    data_array = np.array(cda)
-    return data_array.reshape(size)
-
-cdef float point_residue(double x, double y, double z,
-                               double[:] xpos, double[:] ypos,
-                               double[:] zpos, double[:] values, int N,
-                               int power, int smoothing, int penalization):
+    if out is None:
+        out = np.empty((ysize, xsize), dtype=DTYPE)
+    elif (not isinstance(out, np.ndarray) or out.shape != (ysize, xsize)
+          or out.dtype not in (np.float32, np.float64)
+          or not out.flags['C_CONTIGUOUS']):
+        raise ValueError("out must be a C-contiguous float32 or float64 array "
+                         "with shape " + str((ysize, xsize)))
+
+    cdef const unsigned char[:, ::1] cmask
+    cdef const unsigned char *mask_ptr = NULL
+    if mask is not None:
+        mask = np.asarray(mask)
+        if mask.shape != (ysize, xsize):
+            raise ValueError("mask must have shape " + str((ysize, xsize)))
+        cmask = np.ascontiguousarray(mask != 0).view(np.uint8)
+        if ysize > 0 and xsize > 0:
+            mask_ptr = &cmask[0, 0]
+
+    if num_threads <= 0:
+        num_threads = os.cpu_count() or 1
+
+    dem = np.asarray(dem)
+    if dem.shape != (ysize, xsize):
+        raise ValueError("dem must have shape " + str((ysize, xsize)))
+
+    cdef IdwPower cpower = make_power(power)
+    cdef bint single = precision == 'float32'
+    cdef const short[:, ::1] dem16
+    cdef const float[:, ::1] dem32
+    cdef const double[:, ::1] dem64
+    if dem.dtype == np.int16:
+        dem16 = np.ascontiguousarray(dem)
+        fill_out(out, cxpos, cypos, czpos, cvalues, cgeotransform, dem16,
+                 cpower, smoothing, penalization, num_threads, mask_ptr,
+                 nodata, single)
+    elif dem.dtype == np.float32:
+        dem32 = np.ascontiguousarray(dem)
+        fill_out(out, cxpos, cypos, czpos, cvalues, cgeotransform, dem32,
+                 cpower, smoothing, penalization, num_threads, mask_ptr,
+                 nodata, single)
+    else:
+        dem64 = np.ascontiguousarray(dem, dtype=DTYPE)
+        fill_out(out, cxpos, cypos, czpos, cvalues, cgeotransform, dem64,
+                 cpower, smoothing, penalization, num_threads, mask_ptr,
+                 nodata, single)
+
+    return out
+
+
+cdef fill_out(out, const double[::1] xpos, const double[::1] ypos,
+              const double[::1] zpos, const double[::1] values,
+              double[:] cgeotransform, const dem_t[:, ::1] dem,
+              IdwPower power, double smoothing, double penalization,
+              int num_threads, const unsigned char *mask, double nodata,
+              bint single):
+    """Fills out with the float32 or float64 kernel, for the dtype of out."""
+    cdef float[:, ::1] out32
+    cdef double[:, ::1] out64
+    if out.dtype == np.float32:
+        out32 = out
+        if single:
+            fill_field32(out32, xpos, ypos, zpos, values, cgeotransform, dem,
+                         power, smoothing, penalization, num_threads, mask,
+                         nodata)
+        else:
+            fill_field(out32, xpos, ypos, zpos, values, cgeotransform, dem,
+                       power, smoothing, penalization, num_threads, mask,
+                       nodata)
+    else:
+        out64 = out
+        if single:
+            fill_field32(out64, xpos, ypos, zpos, values, cgeotransform, dem,
+                         power, smoothing, penalization, num_threads, mask,
+                         nodata)
+        else:
+            fill_field(out64, xpos, ypos, zpos, values, cgeotransform, dem,
+                       power, smoothing, penalization, num_threads, mask,
+                       nodata)
+
+
+cdef void fill_field(floating[:, ::1] out, const double[::1] xpos,
+                     const double[::1] ypos, const double[::1] zpos,
+                     const double[::1] values, double[:] cgeotransform,
+                     const dem_t[:, ::1] dem, IdwPower power,
+                     double smoothing, double penalization, int num_threads,
+                     const unsigned char *mask, double nodata):
+    """Fills out using all the stations for each pixel. Rows are scheduled
+    dynamically because pixels on top of a station stop early."""
+    cdef int N = values.shape[0]
+    cdef int xsize = out.shape[1]
+    cdef int i, j
+    cdef double x, y
+    cdef const double *px = &xpos[0] if N > 0 else NULL
+    cdef const double *py = &ypos[0] if N > 0 else NULL
+    cdef const double *pz = &zpos[0] if N > 0 else NULL
+    cdef const double *pv = &values[0] if N > 0 else NULL
+
+    with nogil:
+        for j in prange(out.shape[0], num_threads=num_threads,
+                        schedule='dynamic'):
+            y = cgeotransform[3] + j * cgeotransform[5]
+            for i in range(xsize):
+                if mask != NULL and not mask[j * xsize + i]:
+                    out[j, i] = <floating> nodata
+                    continue
+                x = cgeotransform[0] + i * cgeotransform[1]
+                out[j, i] = <floating> point_residue(
+                    x, y, dem[j, i], px, py, pz, pv, N, power, smoothing,
+                    penalization)
+
+
+# The float32 kernel computes the field in tiles of TILE_ROWS x TILE_COLS,
+# visiting the stations in blocks of STATION_BLOCK, with the station loop
+# outside and the loop over the columns of a tile row inside. Each pixel still
+# adds the stations in order, and the inner loop has no branch nor reduction,
+# so the compiler can vectorise it. The squared x distances only depend on the
+# column, so they are tabulated once per tile and station block. The
+# horizontal differences are taken in float64 before being squared and
+# rounded, so the UTM magnitudes of the coordinates do not cost any precision.
+cdef enum:
+    TILE_ROWS = 32
+    TILE_COLS = 32
+    STATION_BLOCK = 128
+
+
+cdef void fill_field32(floating[:, ::1] out, const double[::1] xpos,
+                       const double[::1] ypos, const double[::1] zpos,
+                       const double[::1] values, double[:] cgeotransform,
+                       const dem_t[:, ::1] dem, IdwPower power,
+                       double smoothing, double penalization, int num_threads,
+                       const unsigned char *mask, double nodata):
+    cdef int tiles_x = (out.shape[1] + TILE_COLS - 1) // TILE_COLS
+    cdef int tiles_y = (out.shape[0] + TILE_ROWS - 1) // TILE_ROWS
+    cdef int tile
+    cdef double *numerator
+    cdef double *denominator
+    cdef char *hit
+    cdef float *z_pen
+    cdef float *block_sums
+    cdef float *dx_sq
+
+    with nogil, parallel(num_threads=num_threads):
+        numerator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))
+        denominator = <double *> malloc(TILE_ROWS * TILE_COLS * sizeof(double))
+        hit = <char *> malloc(TILE_ROWS * TILE_COLS * sizeof(char))
+        z_pen = <float *> malloc(TILE_ROWS * TILE_COLS * sizeof(float))
+        block_sums = <float *> malloc(2 * TILE_COLS * sizeof(float))
+        dx_sq = <float *> malloc(STATION_BLOCK * TILE_COLS * sizeof(float))
+        for tile in prange(tiles_x * tiles_y, schedule='dynamic'):
+            fill_tile32(out, (tile // tiles_x) * TILE_ROWS,
+                        (tile % tiles_x) * TILE_COLS, xpos, ypos, zpos, values,
+                        cgeotransform, dem, power, smoothing, penalization,
+                        mask, nodata, numerator, denominator, hit, z_pen,
+                        block_sums, dx_sq)
+        free(numerator)
+        free(denominator)
+        free(hit)
+        free(z_pen)
+        free(block_sums)
+        free(dx_sq)
+
+
+cdef void fill_tile32(floating[:, ::1] out, int row0, int col0,
+                      const double[::1] xpos, const double[::1] ypos,
+                      const double[::1] zpos, const double[::1] values,
+                      double[:] cgeotransform, const dem_t[:, ::1] dem,
+                      IdwPower power, double smoothing, double penalization,
+                      const unsigned char *mask, double nodata,
+                      double *numerator, double *denominator, char *hit,
+                      float *z_pen, float *block_sums,
+                      float *dx_sq) noexcept nogil:
+    """Computes one tile in float32. The pixels on top of a station are found
+    in float64, with the same threshold as point_residue, and the first of
+    those stations gives their value. Masked pixels are flagged with hit = 2."""
+    cdef int rows = min(TILE_ROWS, out.shape[0] - row0)
+    cdef int cols = min(TILE_COLS, out.shape[1] - col0)
+    cdef int N = values.shape[0]
+    cdef float smoothing_sq = smoothing * smoothing
+    cdef float one = 1.0
+    cdef float dist_sq, weight, value, row_dy_sq, z_station, dz
+    cdef float *num = block_sums
+    cdef float *den = block_sums + TILE_COLS
+    cdef const float *row_dx_sq
+    cdef const float *row_z_pen
+    cdef double x, y, dx, dy
+    cdef int block, block_size, r, c, p, s, r2
+    cdef int valid = rows * cols
+
+    for r in range(rows):
+        for c in range(cols):
+            p = r * cols + c
+            numerator[p] = 0.0
+            denominator[p] = 0.0
+            hit[p] = 0
+            z_pen[p] = <float> (penalization * dem[row0 + r, col0 + c])
+            if mask != NULL and not mask[(row0 + r) * out.shape[1] + col0 + c]:
+                hit[p] = 2
+                valid = valid - 1
+
+    block = 0 if valid > 0 else N
+    while block < N:
+        block_size = min(STATION_BLOCK, N - block)
+
+        for s in range(block_size):
+            for c in range(cols):
+                x = cgeotransform[0] + (col0 + c) * cgeotransform[1]
+                dx = x - xpos[block + s]
+                dx_sq[s * TILE_COLS + c] = <float> (dx * dx)
+                if dx * dx < 1e-22:
+                    for r2 in range(rows):
+                        y = cgeotransform[3] + (row0 + r2) * cgeotransform[5]
+                        dy = y - ypos[block + s]
+                        p = r2 * cols + c
+                        if hit[p] == 0 and dx * dx + dy * dy < 1e-22:
+                            hit[p] = 1
+                            numerator[p] = values[block + s]
+
+        for r in range(rows):
+            y = cgeotransform[3] + (row0 + r) * cgeotransform[5]
+            row_z_pen = z_pen + r * cols
+            for c in range(cols):
+                num[c] = 0.0
+                den[c] = 0.0
+            for s in range(block_size):
+                dy = y - ypos[block + s]
+                row_dy_sq = <float> (dy * dy) + smoothing_sq
+                z_station = <float> (penalization * zpos[block + s])
+                value = <float> values[block + s]
+                row_dx_sq = dx_sq + s * TILE_COLS
+                if power.whole == 1 and power.quarters == 0:
+                    for c in range(cols):
+                        dz = row_z_pen[c] - z_station
+                        weight = one / (row_dx_sq[c] + row_dy_sq + dz * dz)
+                        num[c] += value * weight
+                        den[c] += weight
+                elif power.whole == 1 and power.quarters == 1:
+                    for c in range(cols):
+                        dz = row_z_pen[c] - z_station
+                        dist_sq = row_dx_sq[c] + row_dy_sq + dz * dz
+                        weight = one / (dist_sq * sqrtf(sqrtf(dist_sq)))
+                        num[c] += value * weight
+                        den[c] += weight
+                elif power.whole == 1 and power.quarters == 2:
+                    for c in range(cols):
+                        dz = row_z_pen[c] - z_station
+                        dist_sq = row_dx_sq[c] + row_dy_sq + dz * dz
+                        weight = one / (dist_sq * sqrtf(dist_sq))
+                        num[c] += value * weight
+                        den[c] += weight
+                else:
+                    for c in range(cols):
+                        dz = row_z_pen[c] - z_station
+                        weight = station_weight32(
+                            row_dx_sq[c] + row_dy_sq + dz * dz, power)
+                        num[c] += value * weight
+                        den[c] += weight
+            for c in range(cols):
+                p = r * cols + c
+                if hit[p] == 0:
+                    numerator[p] += num[c]
+                    denominator[p] += den[c]
+        block = block + block_size
+
+    for r in range(rows):
+        for c in range(cols):
+            p = r * cols + c
+            if hit[p] == 2:
+                out[row0 + r, col0 + c] = <floating> nodata
+            elif hit[p]:
+                out[row0 + r, col0 + c] = <floating> numerator[p]
+            elif denominator[p] != 0.0:
+                out[row0 + r, col0 + c] = <floating> (numerator[p] / denominator[p])
+            else:
+                out[row0 + r, col0 + c] = 0.0
+
+
+cdef inline double point_residue(double x, double y, double z,
+                                const double *xpos, const double *ypos,
+                                const double *zpos, const double *values,
+                                int N, IdwPower power, double smoothing,
+                                double penalization) noexcept nogil:
     cdef double numerator = 0
     cdef double denominator = 0
-    cdef double dist, dist_3d, dist3d_sq, weight
+    cdef double dist_sq, dz, weight
+    cdef double smoothing_sq = smoothing * smoothing
     cdef int i
 
     for i in range(N):
-        dist = sqrt((x - xpos[i]) * (x - xpos[i]) +
-                    (y - ypos[i]) * (y - ypos[i]))
+        dist_sq = ((x - xpos[i]) * (x - xpos[i]) +
+                   (y - ypos[i]) * (y - ypos[i]))
 
-        if dist < 1e-11:
+        # Same as a horizontal distance below 1e-11
+        if dist_sq < 1e-22:
             return values[i]
 
-        dist3d_sq = dist * dist + (penalization * (z - zpos[i])) ** 2 + smoothing * smoothing
-
-        if power == 2:
-            weight = 1.0 / dist3d_sq
-        elif power == 3:
-            weight = 1.0 / (dist3d_sq * sqrt(dist3d_sq))  # faster than full pow
-        else:
-            weight = 1.0 / fast_pow(dist3d_sq, power // 2)
+        dz = penalization * (z - zpos[i])
+        weight = station_weight(dist_sq + dz * dz + smoothing_sq, power)
 
         numerator += values[i] * weight
         denominator += weight
@@ -116,13 +440,3 @@ cdef float point_residue(double x, double y, double z,
     if denominator != 0:
         return numerator / denominator
     return 0
-
-
-cdef inline double fast_pow(double base, int exp) nogil:
-    cdef double result = 1.0
-    while exp > 0:
-        if exp % 2 == 1:
-            result *= base
-        base *= base
-        exp //= 2
-    return result
\ No newline at end of file
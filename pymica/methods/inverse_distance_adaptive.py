@@ -0,0 +1,256 @@
+"""Coarse to fine inverse of the distance. The field is computed exactly on a
+coarse lattice and filled in bilinearly, and only the cells where the field is
+not smooth, or that contain a station, are computed again exactly at full
+resolution. Far from the stations, residual fields are smooth enough to skip
+most of the pixels.
+"""
+
+import numpy as np
+
+from pymica.methods.station_arrays import station_arrays
+
+try:
+    from pymica.methods.inverse_distance import inverse_distance_arrays
+except ImportError:
+    from pymica.methods.inverse_distance_numpy import inverse_distance_arrays
+
+
+def inverse_distance_adaptive(
+    data,
+    size: list,
+    geotransform: list,
+    power: float = 2,
+    smoothing: float = 0.0,
+    factor: int = 8,
+    tolerance: float = 0.1,
+    num_threads: int = 1,
+    k_nearest: int = 0,
+    max_radius: float = 0.0,
+    out: np.ndarray = None,
+    mask: np.ndarray = None,
+    nodata: float = np.nan,
+    precision: str = "float64",
+) -> np.ndarray:
+    """Approximate :meth:`pymica.methods.inverse_distance.inverse_distance`
+    computing it exactly on a lattice of one of every `factor` rows and
+    columns, and bilinearly in between.
+
+    A cell of the lattice is computed exactly at full resolution if the values
+    at its four corners differ by more than `tolerance` or if it contains a
+    station, so the pixels on top of the stations keep their values. The
+    tolerance bounds the variation of the field across a cell, not the error,
+    which is usually much smaller than the tolerance.
+
+    Args:
+        data (list or np.ndarray): Station data as a list of dictionaries or a
+            structured array with, at least, 'x', 'y' and 'value' keys.
+        size (list): Field size as [rows, cols].
+        geotransform (list): The geotransform of the field.
+        power (float, optional): Inverse of the distance power. Defaults to 2.
+        smoothing (float, optional): Smoothing distance. Defaults to 0.0.
+        factor (int, optional): Rows and columns of each coarse cell. 1
+            computes all the pixels exactly. Defaults to 8.
+        tolerance (float, optional): Largest difference between the corners of
+            a cell filled in bilinearly, in the units of the values.
+            Defaults to 0.1.
+        num_threads (int, optional): Number of threads of the exact kernel.
+            Defaults to 1.
+        k_nearest (int, optional): Nearest stations, as in the exact kernel.
+            Defaults to 0.
+        max_radius (float, optional): Search radius, as in the exact kernel.
+            Defaults to 0.
+        out (np.ndarray, optional): C-contiguous float32 or float64 array with
+            shape `size` where the field is written. Defaults to None, a new
+            float64 array.
+        mask (np.ndarray, optional): 2-D array with the valid pixels different
+            than 0. Defaults to None, all the pixels.
+        nodata (float, optional): Value of the masked pixels. Defaults to NaN.
+        precision (str, optional): Precision of the exact kernel.
+            Defaults to 'float64'.
+
+    Returns:
+        np.ndarray: The interpolated field, `out` if it was provided.
+    """
+    x_pos, y_pos, values = station_arrays(data, ("x", "y", "value"))
+
+    return inverse_distance_adaptive_arrays(
+        x_pos,
+        y_pos,
+        values,
+        size,
+        geotransform,
+        power,
+        smoothing,
+        factor,
+        tolerance,
+        num_threads,
+        k_nearest,
+        max_radius,
+        out,
+        mask,
+        nodata,
+        precision,
+    )
+
+
+def inverse_distance_adaptive_arrays(
+    x_pos,
+    y_pos,
+    values,
+    size: list,
+    geotransform: list,
+    power: float = 2,
+    smoothing: float = 0.0,
+    factor: int = 8,
+    tolerance: float = 0.1,
+    num_threads: int = 1,
+    k_nearest: int = 0,
+    max_radius: float = 0.0,
+    out: np.ndarray = None,
+    mask: np.ndarray = None,
+    nodata: float = np.nan,
+    precision: str = "float64",
+) -> np.ndarray:
+    """Same as :meth:`inverse_distance_adaptive`, but taking the station
+    coordinates and values as 1-D arrays.
+
+    Raises:
+        ValueError: If `factor` is lower than 1, `tolerance` is negative or
+            `out` or `mask` do not have the field size.
+
+    Returns:
+        np.ndarray: The interpolated field, `out` if it was provided.
+    """
+    if factor < 1:
+        raise ValueError("factor must be 1 or greater")
+    if tolerance < 0:
+        raise ValueError("tolerance must be 0 or positive")
+
+    def exact(field_size, field_geotransform, field_out=None, field_mask=None):
+        return inverse_distance_arrays(
+            x_pos,
+            y_pos,
+            values,
+            field_size,
+            field_geotransform,
+            power,
+            smoothing,
+            num_threads,
+            k_nearest,
+            max_radius,
+            out=field_out,
+            mask=field_mask,
+            nodata=nodata,
+            precision=precision,
+        )
+
+    rows, cols = int(size[0]), int(size[1])
+    coarse_rows = -(-(rows - 1) // factor) + 1
+    coarse_cols = -(-(cols - 1) // factor) + 1
+    if factor == 1 or coarse_rows < 2 or coarse_cols < 2:
+        return exact(size, geotransform, out, mask)
+
+    if out is None:
+        out = np.empty((rows, cols), dtype=np.float64)
+    elif (
+        not isinstance(out, np.ndarray)
+        or out.shape != (rows, cols)
+        or out.dtype not in (np.float32, np.float64)
+        or not out.flags["C_CONTIGUOUS"]
+    ):
+        raise ValueError(
+            "out must be a C-contiguous float32 or float64 array with shape "
+            + str((rows, cols))
+        )
+    if mask is not None and np.shape(mask) != (rows, cols):
+        raise ValueError("mask must have shape " + str((rows, cols)))
+
+    # The lattice covers the whole field, its last row and column can be
+    # beyond the field edge.
+    coarse_geotransform = list(geotransform)
+    coarse_geotransform[1] *= factor
+    coarse_geotransform[5] *= factor
+    coarse = exact([coarse_rows, coarse_cols], coarse_geotransform)
+
+    # Cell and bilinear weight of each row and column. The pixels on the last
+    # lattice row or column belong to the previous cell.
+    row_cells = np.minimum(np.arange(rows) // factor, coarse_rows - 2)
+    col_cells = np.minimum(np.arange(cols) // factor, coarse_cols - 2)
+    row_weights = np.arange(rows) / factor - row_cells
+    col_weights = np.arange(cols) / factor - col_cells
+
+    field_rows = (
+        coarse[row_cells] * (1 - row_weights[:, None])
+        + coarse[row_cells + 1] * row_weights[:, None]
+    )
+    out[...] = (
+        field_rows[:, col_cells] * (1 - col_weights)
+        + field_rows[:, col_cells + 1] * col_weights
+    )
+
+    corners = np.stack(
+        (coarse[:-1, :-1], coarse[1:, :-1], coarse[:-1, 1:], coarse[1:, 1:])
+    )
+    refine = corners.max(axis=0) - corners.min(axis=0) > tolerance
+
+    station_rows = np.floor(
+        (np.asarray(y_pos) - geotransform[3]) / geotransform[5] / factor
+    )
+    station_cols = np.floor(
+        (np.asarray(x_pos) - geotransform[0]) / geotransform[1] / factor
+    )
+    inside = (
+        (station_rows >= 0)
+        & (station_rows < coarse_rows - 1)
+        & (station_cols >= 0)
+        & (station_cols < coarse_cols - 1)
+    )
+    refine[
+        station_rows[inside].astype(np.intp), station_cols[inside].astype(np.intp)
+    ] = True
+
+    refine = refine[row_cells][:, col_cells]
+    if mask is not None:
+        valid = np.asarray(mask) != 0
+        out[~valid] = nodata
+        refine &= valid
+    fill_pixels(exact, out, refine, geotransform)
+
+    return out
+
+
+def fill_pixels(
+    kernel, out: np.ndarray, pixels: np.ndarray, geotransform: list, strip_rows=256
+):
+    """Computes again the `pixels` of `out` with an exact kernel, leaving
+    the rest of `out` untouched.
+
+    The kernel is run over strips of rows, only on the columns with pixels,
+    so the extra memory is bounded by a strip and not by the field.
+
+    Args:
+        kernel (callable): Exact kernel taking the strip size, geotransform,
+            output array and mask.
+        out (np.ndarray): Field where the pixels are written.
+        pixels (np.ndarray): 2-D boolean array with the pixels to compute.
+        geotransform (list): The geotransform of the field.
+        strip_rows (int, optional): Rows of each strip. Defaults to 256.
+    """
+    for row0 in range(0, out.shape[0], strip_rows):
+        strip = pixels[row0 : row0 + strip_rows]
+        cols = np.flatnonzero(strip.any(axis=0))
+        if cols.shape[0] == 0:
+            continue
+        col0, col1 = cols[0], cols[-1] + 1
+        window = strip[:, col0:col1]
+
+        strip_geotransform = list(geotransform)
+        strip_geotransform[0] += col0 * geotransform[1] + row0 * geotransform[2]
+        strip_geotransform[3] += col0 * geotransform[4] + row0 * geotransform[5]
+        fine = kernel(
+            list(window.shape),
+            strip_geotransform,
+            np.empty(window.shape, dtype=out.dtype),
+            window,
+        )
+        out[row0 : row0 + strip_rows, col0:col1][window] = fine[window]
@@ -0,0 +1,370 @@
+"""Approximate inverse of the distance computed as two FFT convolutions, for
+dense station networks. The station values and unit weights are splatted onto
+the grid and both are convolved with the inverse of the distance kernel, so the
+cost depends on the number of pixels and not on the number of stations.
+"""
+
+import numpy as np
+from scipy.signal import fftconvolve
+
+from pymica.methods.inverse_distance_adaptive import fill_pixels
+from pymica.methods.station_arrays import station_arrays
+
+try:
+    from pymica.methods.inverse_distance import inverse_distance_arrays
+except ImportError:
+    from pymica.methods.inverse_distance_numpy import inverse_distance_arrays
+
+
+def inverse_distance_fft(
+    data,
+    size: list,
+    geotransform: list,
+    power: float = 2,
+    smoothing: float = 0.0,
+    max_radius: float = 0.0,
+    out: np.ndarray = None,
+    mask: np.ndarray = None,
+    nodata: float = np.nan,
+) -> np.ndarray:
+    """Approximate :meth:`pymica.methods.inverse_distance.inverse_distance` with
+    FFT convolutions.
+
+    Each station is splatted bilinearly onto the four pixels around it, so it is
+    moved less than a pixel, and distances shorter than half a pixel are taken
+    as half a pixel. Use :meth:`inverse_distance_fft_error` to measure the error
+    for a given network and grid.
+
+    The splatted grid covers the stations, so its size, and the one of the
+    FFT, only depend on the field size and on `max_radius`, never on the
+    number of stations. Without `max_radius`, the stations must be within
+    half the field size around it. For fields much smaller than the station
+    network, set a `max_radius`: the stations farther than it from the field
+    are ignored and the kernel is truncated.
+
+    The pixels where the sum of the weights is under the FFT round-off noise
+    are computed again with the exact kernel. At the usual powers there are
+    none, but at high powers, above 4 or so, most of the field can be far
+    enough from the stations, and the exact kernel is then the faster choice.
+
+    Args:
+        data (list or np.ndarray): Station data as a list of dictionaries or a
+            structured array with, at least, 'x', 'y' and 'value' keys.
+        size (list): Field size as [rows, cols].
+        geotransform (list): The geotransform of the field.
+        power (float, optional): Inverse of the distance power. Defaults to 2.
+        smoothing (float, optional): Smoothing distance. Defaults to 0.0.
+        max_radius (float, optional): If greater than 0, the kernel is truncated
+            at this distance, as the `max_radius` of the exact method. Pixels
+            without any station in the radius are set to 0. It also makes the
+            convolutions smaller. Defaults to 0, no limit.
+        out (np.ndarray, optional): C-contiguous float32 or float64 array with
+            shape `size` where the field is written. Defaults to None, a new
+            float64 array.
+        mask (np.ndarray, optional): 2-D array with the valid pixels different
+            than 0. Defaults to None, all the pixels.
+        nodata (float, optional): Value of the masked pixels. Defaults to NaN.
+
+    Returns:
+        np.ndarray: The interpolated field, `out` if it was provided.
+    """
+    x_pos, y_pos, values = station_arrays(data, ("x", "y", "value"))
+
+    return inverse_distance_fft_arrays(
+        x_pos,
+        y_pos,
+        values,
+        size,
+        geotransform,
+        power,
+        smoothing,
+        max_radius,
+        out,
+        mask,
+        nodata,
+    )
+
+
+def inverse_distance_fft_arrays(
+    x_pos,
+    y_pos,
+    values,
+    size: list,
+    geotransform: list,
+    power: float = 2,
+    smoothing: float = 0.0,
+    max_radius: float = 0.0,
+    out: np.ndarray = None,
+    mask: np.ndarray = None,
+    nodata: float = np.nan,
+) -> np.ndarray:
+    """Same as :meth:`inverse_distance_fft`, but taking the station coordinates
+    and values as 1-D arrays.
+
+    Raises:
+        ValueError: If the arrays do not have the same length, `max_radius` is
+            negative, `out` or `mask` do not have the field size or, without
+            `max_radius`, any station is farther than half the field size from
+            the field.
+
+    Returns:
+        np.ndarray: The interpolated field, `out` if it was provided.
+    """
+    x_pos = np.asarray(x_pos, dtype=np.float64)
+    y_pos = np.asarray(y_pos, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    if x_pos.shape != values.shape or y_pos.shape != values.shape:
+        raise ValueError("x_pos, y_pos and values must have the same length")
+    if max_radius < 0:
+        raise ValueError("max_radius must be 0 or a positive distance")
+
+    rows, cols = int(size[0]), int(size[1])
+    if out is None:
+        out = np.empty((rows, cols), dtype=np.float64)
+    elif (
+        not isinstance(out, np.ndarray)
+        or out.shape != (rows, cols)
+        or out.dtype not in (np.float32, np.float64)
+        or not out.flags["C_CONTIGUOUS"]
+    ):
+        raise ValueError(
+            "out must be a C-contiguous float32 or float64 array with shape "
+            + str((rows, cols))
+        )
+    if mask is not None and np.shape(mask) != (rows, cols):
+        raise ValueError("mask must have shape " + str((rows, cols)))
+
+    pixel_x = abs(geotransform[1])
+    pixel_y = abs(geotransform[5])
+
+    # Station positions in pixels of the field
+    col_pos = (x_pos - geotransform[0]) / geotransform[1]
+    row_pos = (y_pos - geotransform[3]) / geotransform[5]
+
+    # Kernel half sizes in pixels. Without a radius, any station can weigh on
+    # any pixel, so the splatted grid covers all the stations, as long as they
+    # are within the padding around the field.
+    if max_radius <= 0:
+        pad_rows = rows // 2 + 1
+        pad_cols = cols // 2 + 1
+        far = (
+            (row_pos <= -pad_rows)
+            | (row_pos >= rows - 1 + pad_rows)
+            | (col_pos <= -pad_cols)
+            | (col_pos >= cols - 1 + pad_cols)
+        )
+        if far.any():
+            raise ValueError(
+                str(int(far.sum()))
+                + " stations are farther than half the field size from the "
+                "field. Use a max_radius to ignore them."
+            )
+        # Set to cover the splatted grid
+        half_rows = half_cols = 0
+        near_values = values
+    else:
+        half_rows = int(np.ceil(max_radius / pixel_y)) + 1
+        half_cols = int(np.ceil(max_radius / pixel_x)) + 1
+        near = (
+            (row_pos > -half_rows)
+            & (row_pos < rows - 1 + half_rows)
+            & (col_pos > -half_cols)
+            & (col_pos < cols - 1 + half_cols)
+        )
+        col_pos, row_pos, near_values = col_pos[near], row_pos[near], values[near]
+
+    numerator = np.zeros((rows, cols))
+    denominator = np.zeros((rows, cols))
+    reached = np.zeros((rows, cols), dtype=bool)
+    noise = 0.0
+    if row_pos.shape[0] > 0:
+        noise = _splat_convolve(
+            numerator,
+            denominator,
+            reached,
+            row_pos,
+            col_pos,
+            near_values,
+            pixel_x,
+            pixel_y,
+            power,
+            smoothing,
+            max_radius,
+            half_rows,
+            half_cols,
+        )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out[...] = np.where(reached & (denominator > 0), numerator / denominator, 0.0)
+
+    # At high powers the weights far from the stations are below the FFT
+    # round-off noise, so these pixels are computed with the exact kernel
+    refine = reached & (denominator <= noise)
+    if mask is not None:
+        refine &= np.asarray(mask) != 0
+
+    def exact(field_size, field_geotransform, field_out, field_mask):
+        return inverse_distance_arrays(
+            x_pos,
+            y_pos,
+            values,
+            field_size,
+            field_geotransform,
+            power,
+            smoothing,
+            max_radius=max_radius,
+            out=field_out,
+            mask=field_mask,
+        )
+
+    fill_pixels(exact, out, refine, geotransform)
+
+    if mask is not None:
+        out[np.asarray(mask) == 0] = nodata
+
+    return out
+
+
+def _splat_convolve(
+    numerator,
+    denominator,
+    reached,
+    row_pos,
+    col_pos,
+    values,
+    pixel_x,
+    pixel_y,
+    power,
+    smoothing,
+    max_radius,
+    half_rows,
+    half_cols,
+):
+    """Adds to `numerator` and `denominator` the convolutions of the splatted
+    values and unit weights of the stations, at `row_pos` and `col_pos` in
+    pixels of the field, with the kernel, and sets the pixels of `reached`
+    with any station in the kernel. Without `max_radius` the kernel half
+    sizes cover the distances between the splatted grid and the field.
+
+    Returns the FFT round-off noise level of `denominator`."""
+    rows, cols = numerator.shape
+    row0 = min(0, int(np.floor(row_pos.min())))
+    col0 = min(0, int(np.floor(col_pos.min())))
+    grid_rows = max(rows, int(np.floor(row_pos.max())) + 2) - row0
+    grid_cols = max(cols, int(np.floor(col_pos.max())) + 2) - col0
+    if max_radius <= 0:
+        half_rows = max(rows - row0, grid_rows + row0)
+        half_cols = max(cols - col0, grid_cols + col0)
+
+    # Bilinear splatting of the values and of the unit weights
+    rows_floor = np.floor(row_pos)
+    cols_floor = np.floor(col_pos)
+    row_frac = row_pos - rows_floor
+    col_frac = col_pos - cols_floor
+    rows_floor = rows_floor.astype(np.intp) - row0
+    cols_floor = cols_floor.astype(np.intp) - col0
+
+    value_grid = np.zeros(grid_rows * grid_cols)
+    weight_grid = np.zeros(grid_rows * grid_cols)
+    for d_row, d_col, share in (
+        (0, 0, (1 - row_frac) * (1 - col_frac)),
+        (0, 1, (1 - row_frac) * col_frac),
+        (1, 0, row_frac * (1 - col_frac)),
+        (1, 1, row_frac * col_frac),
+    ):
+        pixels = (rows_floor + d_row) * grid_cols + cols_floor + d_col
+        value_grid += np.bincount(
+            pixels, weights=share * values, minlength=grid_rows * grid_cols
+        )
+        weight_grid += np.bincount(
+            pixels, weights=share, minlength=grid_rows * grid_cols
+        )
+    value_grid = value_grid.reshape(grid_rows, grid_cols)
+    weight_grid = weight_grid.reshape(grid_rows, grid_cols)
+
+    # Truncated inverse of the distance kernel
+    d_y = np.arange(-half_rows, half_rows + 1) * pixel_y
+    d_x = np.arange(-half_cols, half_cols + 1) * pixel_x
+    dist_sq = d_y[:, None] ** 2 + d_x[None, :] ** 2
+    dist_sq = np.maximum(dist_sq, 0.25 * min(pixel_x, pixel_y) ** 2)
+    kernel = 1.0 / (dist_sq + smoothing * smoothing) ** (power / 2.0)
+    if max_radius > 0:
+        kernel[d_y[:, None] ** 2 + d_x[None, :] ** 2 > max_radius * max_radius] = 0.0
+
+    field_rows = slice(half_rows - row0, half_rows - row0 + rows)
+    field_cols = slice(half_cols - col0, half_cols - col0 + cols)
+    numerator += fftconvolve(value_grid, kernel)[field_rows, field_cols]
+    denominator += fftconvolve(weight_grid, kernel)[field_rows, field_cols]
+
+    # Without a radius, every pixel is reached. With it, the pixels reached
+    # are counted with a 0/1 convolution, robust to the FFT round-off noise
+    # of the weights far from the stations.
+    if max_radius <= 0:
+        reached[...] = True
+    else:
+        support = (kernel > 0).astype(np.float64)
+        occupied = (weight_grid > 0).astype(np.float64)
+        reached |= fftconvolve(occupied, support)[field_rows, field_cols] > 0.5
+
+    return 1e-11 * kernel.max() * weight_grid.sum()
+
+
+def inverse_distance_fft_error(
+    x_pos,
+    y_pos,
+    values,
+    size: list,
+    geotransform: list,
+    power: float = 2,
+    smoothing: float = 0.0,
+    max_radius: float = 0.0,
+    step: int = 8,
+    field: np.ndarray = None,
+) -> dict:
+    """Measure the error of :meth:`inverse_distance_fft_arrays` against the exact
+    :meth:`pymica.methods.inverse_distance.inverse_distance_arrays` on one of
+    every `step` rows and columns.
+
+    Args:
+        x_pos (np.ndarray): The x coordinate of the stations.
+        y_pos (np.ndarray): The y coordinate of the stations.
+        values (np.ndarray): The station values.
+        size (list): Field size as [rows, cols].
+        geotransform (list): The geotransform of the field.
+        power (float, optional): Inverse of the distance power. Defaults to 2.
+        smoothing (float, optional): Smoothing distance. Defaults to 0.0.
+        max_radius (float, optional): Kernel truncation radius. Defaults to 0.
+        step (int, optional): Sampling step in rows and columns. Defaults to 8.
+        field (np.ndarray, optional): The approximate field, if it was already
+            computed. Defaults to None, computed here.
+
+    Returns:
+        dict: The 'max', 'mean' (absolute) and 'rmse' errors of the sampled
+        pixels.
+    """
+    if field is None:
+        field = inverse_distance_fft_arrays(
+            x_pos, y_pos, values, size, geotransform, power, smoothing, max_radius
+        )
+    sampled = field[::step, ::step]
+
+    sampled_geotransform = list(geotransform)
+    sampled_geotransform[1] *= step
+    sampled_geotransform[5] *= step
+    exact = inverse_distance_arrays(
+        x_pos,
+        y_pos,
+        values,
+        list(sampled.shape),
+        sampled_geotransform,
+        power,
+        smoothing,
+        max_radius=max_radius,
+    )
+
+    errors = np.abs(sampled - exact)
+    return {
+        "max": float(errors.max()),
+        "mean": float(errors.mean()),
+        "rmse": float(np.sqrt(np.mean(errors * errors))),
+    }
@@ -0,0 +1,342 @@
+"""Inverse of the distance 2D and 3D from the k nearest stations of each pixel.
+
+The stations are indexed with the same k-d tree as
+:class:`pymica.methods.idw.Tree`, so each pixel costs O(k log N) instead of
+O(N). The 3D distance is the Euclidean distance in the
+(x, y, penalization * z) space, so in 3D the stations are indexed in that space
+and each pixel is queried with its DEM altitude.
+"""
+
+import numpy as np
+
+from pymica.methods.idw import Tree
+from pymica.methods.station_arrays import station_arrays
+
+
+def inverse_distance_knn(
+    data,
+    size: list,
+    geotransform: list,
+    k_nearest: int = 8,
+    power: float = 2,
+    smoothing: float = 0.0,
+    num_threads: int = 1,
+    out: np.ndarray = None,
+    mask: np.ndarray = None,
+    nodata: float = np.nan,
+    chunk_size: int = 65536,
+) -> np.ndarray:
+    """Interpolates the data with the inverse of the distance of
+    :meth:`pymica.methods.inverse_distance.inverse_distance`, using only the
+    `k_nearest` stations of each pixel.
+
+    Without smoothing, a pixel on top of a station takes the value of that
+    station, as in the exact kernel.
+
+    Args:
+        data (list or np.ndarray): Station data as a list of dictionaries or a
+            structured array with, at least, 'x', 'y' and 'value' keys.
+        size (list): Field size as [rows, cols].
+        geotransform (list): The geotransform of the field.
+        k_nearest (int, optional): Number of nearest stations used for each
+            pixel. Defaults to 8.
+        power (float, optional): Inverse of the distance power. Defaults to 2.
+        smoothing (float, optional): Smoothing distance. Defaults to 0.0.
+        num_threads (int, optional): Number of threads of the k-d tree
+            queries. 0 or less uses all the available cores. Defaults to 1.
+        out (np.ndarray, optional): C-contiguous float32 or float64 array with
+            shape `size` where the field is written. Defaults to None, a new
+            float64 array.
+        mask (np.ndarray, optional): 2-D array with the valid pixels different
+            than 0. Defaults to None, all the pixels.
+        nodata (float, optional): Value of the masked pixels. Defaults to NaN.
+        chunk_size (int, optional): Number of pixels queried at once.
+            Defaults to 65536.
+
+    Returns:
+        np.ndarray: The interpolated field, `out` if it was provided.
+    """
+    x_pos, y_pos, values = station_arrays(data, ("x", "y", "value"))
+
+    return inverse_distance_knn_arrays(
+        x_pos,
+        y_pos,
+        values,
+        size,
+        geotransform,
+        k_nearest,
+        power,
+        smoothing,
+        num_threads,
+        out,
+        mask,
+        nodata,
+        chunk_size,
+    )
+
+
+def inverse_distance_knn_arrays(
+    x_pos,
+    y_pos,
+    values,
+    size: list,
+    geotransform: list,
+    k_nearest: int = 8,
+    power: float = 2,
+    smoothing: float = 0.0,
+    num_threads: int = 1,
+    out: np.ndarray = None,
+    mask: np.ndarray = None,
+    nodata: float = np.nan,
+    chunk_size: int = 65536,
+) -> np.ndarray:
+    """Same as :meth:`inverse_distance_knn`, but taking the station
+    coordinates and values as 1-D arrays.
+
+    Raises:
+        ValueError: If the arrays do not have the same length, `k_nearest` is
+            not positive or `out` or `mask` do not have the field size.
+
+    Returns:
+        np.ndarray: The interpolated field, `out` if it was provided.
+    """
+    x_pos = np.asarray(x_pos, dtype=np.float64)
+    y_pos = np.asarray(y_pos, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    if x_pos.shape != values.shape or y_pos.shape != values.shape:
+        raise ValueError("x_pos, y_pos and values must have the same length")
+
+    return _knn_field(
+        np.column_stack((x_pos, y_pos)),
+        values,
+        size,
+        geotransform,
+        None,
+        0.0,
+        k_nearest,
+        power,
+        smoothing,
+        num_threads,
+        out,
+        mask,
+        nodata,
+        chunk_size,
+    )
+
+
+def inverse_distance_3d_knn(
+    data,
+    size: list,
+    geotransform: list,
+    dem: np.ndarray,
+    k_nearest: int = 8,
+    power: float = 2,
+    smoothing: float = 0.0,
+    penalization: float = 30.0,
+    num_threads: int = 1,
+    out: np.ndarray = None,
+    mask: np.ndarray = None,
+    nodata: float = np.nan,
+    chunk_size: int = 65536,
+) -> np.ndarray:
+    """Interpolates the data with the inverse of the distance 3D of
+    :meth:`pymica.methods.inverse_distance_3d.inverse_distance_3d`, using only
+    the `k_nearest` stations of each pixel in the 3D distance.
+
+    A pixel whose horizontal position is one of its k nearest stations takes
+    the value of that station, as in the exact kernel.
+
+    Args:
+        data (list or np.ndarray): Station data as a list of dictionaries or a
+            structured array with, at least, 'x', 'y', 'altitude' and 'value'
+            keys.
+        size (list): Field size as [rows, cols].
+        geotransform (list): The geotransform of the field.
+        dem (np.ndarray): 2-D array of altitudes with the field size.
+        k_nearest (int, optional): Number of nearest stations used for each
+            pixel. Defaults to 8.
+        power (float, optional): Inverse of the distance power. Defaults to 2.
+        smoothing (float, optional): Smoothing distance. Defaults to 0.0.
+        penalization (float, optional): Altitude penalization. Defaults to 30.0.
+        num_threads (int, optional): Number of threads of the k-d tree
+            queries. 0 or less uses all the available cores. Defaults to 1.
+        out (np.ndarray, optional): C-contiguous float32 or float64 array with
+            shape `size` where the field is written. Defaults to None, a new
+            float64 array.
+        mask (np.ndarray, optional): 2-D array with the valid pixels different
+            than 0. Defaults to None, all the pixels.
+        nodata (float, optional): Value of the masked pixels. Defaults to NaN.
+        chunk_size (int, optional): Number of pixels queried at once.
+            Defaults to 65536.
+
+    Returns:
+        np.ndarray: The interpolated field, `out` if it was provided.
+    """
+    x_pos, y_pos, z_pos, values = station_arrays(data, ("x", "y", "altitude", "value"))
+
+    return inverse_distance_3d_knn_arrays(
+        x_pos,
+        y_pos,
+        z_pos,
+        values,
+        size,
+        geotransform,
+        dem,
+        k_nearest,
+        power,
+        smoothing,
+        penalization,
+        num_threads,
+        out,
+        mask,
+        nodata,
+        chunk_size,
+    )
+
+
+def inverse_distance_3d_knn_arrays(
+    x_pos,
+    y_pos,
+    z_pos,
+    values,
+    size: list,
+    geotransform: list,
+    dem: np.ndarray,
+    k_nearest: int = 8,
+    power: float = 2,
+    smoothing: float = 0.0,
+    penalization: float = 30.0,
+    num_threads: int = 1,
+    out: np.ndarray = None,
+    mask: np.ndarray = None,
+    nodata: float = np.nan,
+    chunk_size: int = 65536,
+) -> np.ndarray:
+    """Same as :meth:`inverse_distance_3d_knn`, but taking the station
+    coordinates, altitudes and values as 1-D arrays.
+
+    Raises:
+        ValueError: If the arrays do not have the same length, `k_nearest` is
+            not positive or `out`, `mask` or `dem` do not have the field size.
+
+    Returns:
+        np.ndarray: The interpolated field, `out` if it was provided.
+    """
+    x_pos = np.asarray(x_pos, dtype=np.float64)
+    y_pos = np.asarray(y_pos, dtype=np.float64)
+    z_pos = np.asarray(z_pos, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    if (
+        x_pos.shape != values.shape
+        or y_pos.shape != values.shape
+        or z_pos.shape != values.shape
+    ):
+        raise ValueError("x_pos, y_pos, z_pos and values must have the same length")
+    if np.shape(dem) != (int(size[0]), int(size[1])):
+        raise ValueError("dem must have shape " + str((int(size[0]), int(size[1]))))
+
+    return _knn_field(
+        np.column_stack((x_pos, y_pos, penalization * z_pos)),
+        values,
+        size,
+        geotransform,
+        np.asarray(dem).ravel(),
+        penalization,
+        k_nearest,
+        power,
+        smoothing,
+        num_threads,
+        out,
+        mask,
+        nodata,
+        chunk_size,
+    )
+
+
+def _knn_field(
+    stations,
+    values,
+    size,
+    geotransform,
+    dem,
+    penalization,
+    k_nearest,
+    power,
+    smoothing,
+    num_threads,
+    out,
+    mask,
+    nodata,
+    chunk_size,
+):
+    """Fills the field from the k nearest `stations`, an (N, 2) array with
+    their coordinates, or (N, 3) with their penalized altitudes if `dem`, the
+    raveled altitudes of the pixels in their native dtype, is not None."""
+    if k_nearest < 1:
+        raise ValueError("k_nearest must be a positive number of stations")
+
+    rows, cols = int(size[0]), int(size[1])
+    if out is None:
+        out = np.empty((rows, cols), dtype=np.float64)
+    elif (
+        not isinstance(out, np.ndarray)
+        or out.shape != (rows, cols)
+        or out.dtype not in (np.float32, np.float64)
+        or not out.flags["C_CONTIGUOUS"]
+    ):
+        raise ValueError(
+            "out must be a C-contiguous float32 or float64 array with shape "
+            + str((rows, cols))
+        )
+    if mask is None:
+        pixels = np.arange(rows * cols)
+    else:
+        if np.shape(mask) != (rows, cols):
+            raise ValueError("mask must have shape " + str((rows, cols)))
+        valid = np.asarray(mask).ravel() != 0
+        out.reshape(-1)[~valid] = nodata
+        pixels = np.nonzero(valid)[0]
+
+    if values.shape[0] == 0:
+        out.reshape(-1)[pixels] = 0.0
+        return out
+
+    k_nearest = min(k_nearest, values.shape[0])
+    workers = num_threads if num_threads > 0 else -1
+    index = Tree(stations, values)
+
+    for start in range(0, pixels.shape[0], chunk_size):
+        chunk = pixels[start : start + chunk_size]
+        x_pix = geotransform[0] + (chunk % cols) * geotransform[1]
+        y_pix = geotransform[3] + (chunk // cols) * geotransform[5]
+        if dem is None:
+            query = np.column_stack((x_pix, y_pix))
+        else:
+            # In double precision, whatever the DEM dtype: an int16 DEM would
+            # overflow and a float32 one round the penalized altitudes
+            z_pix = np.multiply(dem[chunk], penalization, dtype=np.float64)
+            query = np.column_stack((x_pix, y_pix, z_pix))
+        dist, idx = index.neighbours(query, k_nearest, eps=0, workers=workers)
+        dist_sq = dist * dist + smoothing * smoothing
+
+        # The same pixels on top of a station as the exact kernels: in 3D any
+        # pixel at the station position, in 2D only without smoothing.
+        if dem is None:
+            coincident = dist_sq < 1e-11
+        else:
+            d_x = x_pix[:, None] - stations[idx, 0]
+            d_y = y_pix[:, None] - stations[idx, 1]
+            coincident = d_x * d_x + d_y * d_y < 1e-22
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            weights = dist_sq ** (-0.5 * power)
+            weights[coincident] = 0.0
+            neighbour_values = index.scores[idx]
+            result = (weights * neighbour_values).sum(axis=1) / weights.sum(axis=1)
+
+        # The nearest coincident station wins
+        hit = coincident.any(axis=1)
+        result[hit] = neighbour_values[hit, coincident[hit].argmax(axis=1)]
+        out.reshape(-1)[chunk] = result
+
+    return out
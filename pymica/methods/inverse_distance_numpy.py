@@ -0,0 +1,455 @@
+"""Pure NumPy versions of the compiled inverse of the distance kernels, used
+when the Cython extensions could not be built. The field is computed in chunks
+of pixels, so the arrays of distances between the pixels and the stations stay
+within a memory budget. If the stations of a single pixel do not fit in it,
+each pixel is computed with its stations split in blocks.
+"""
+
+import numpy as np
+
+from pymica.methods.station_arrays import station_arrays
+
+# Bytes of the temporary (pixels, stations) arrays of a chunk of pixels
+MEMORY_BUDGET = 64 * 2**20
+
+# Number of (pixels, stations) float64 arrays alive at the same time
+_TEMPORARIES = 6
+
+
+def inverse_distance(
+    data,
+    size: list,
+    geotransform: list,
+    power: float = 2,
+    smoothing: float = 0.0,
+    num_threads: int = 1,
+    k_nearest: int = 0,
+    max_radius: float = 0.0,
+    out: np.ndarray = None,
+    mask: np.ndarray = None,
+    nodata: float = np.nan,
+    precision: str = "float64",
+    memory_budget: int = MEMORY_BUDGET,
+) -> np.ndarray:
+    """NumPy version of :meth:`pymica.methods.inverse_distance.inverse_distance`,
+    with the same arguments and results.
+
+    Args:
+        data (list or np.ndarray): Station data as a list of dictionaries or a
+            structured array with, at least, 'x', 'y' and 'value' keys.
+        size (list): Field size as [rows, cols].
+        geotransform (list): The geotransform of the field.
+        power (float, optional): Inverse of the distance power. Defaults to 2.
+        smoothing (float, optional): Smoothing distance. Defaults to 0.0.
+        num_threads (int, optional): Not used, kept for compatibility with the
+            compiled kernel. Defaults to 1.
+        k_nearest (int, optional): If greater than 0, only the k nearest
+            stations to each pixel are used. If the stations of a pixel are
+            split to fit in `memory_budget`, all the stations as close as the
+            k-th one are used. Defaults to 0.
+        max_radius (float, optional): If greater than 0, only the stations
+            closer than this distance are used. Pixels without any station in
+            the radius are set to 0. Defaults to 0.
+        out (np.ndarray, optional): C-contiguous float32 or float64 array with
+            shape `size` where the field is written. Defaults to None, a new
+            float64 array.
+        mask (np.ndarray, optional): 2-D array with the valid pixels different
+            than 0. Defaults to None, all the pixels.
+        nodata (float, optional): Value of the masked pixels. Defaults to NaN.
+        precision (str, optional): 'float64' or 'float32', the precision of the
+            weights. Defaults to 'float64'.
+        memory_budget (int, optional): Bytes of the temporary arrays of each
+            chunk of pixels. Defaults to 64 MiB.
+
+    Returns:
+        np.ndarray: The interpolated field, `out` if it was provided.
+    """
+    x_pos, y_pos, values = station_arrays(data, ("x", "y", "value"))
+
+    return inverse_distance_arrays(
+        x_pos,
+        y_pos,
+        values,
+        size,
+        geotransform,
+        power,
+        smoothing,
+        num_threads,
+        k_nearest,
+        max_radius,
+        out,
+        mask,
+        nodata,
+        precision,
+        memory_budget,
+    )
+
+
+def inverse_distance_arrays(
+    x_pos,
+    y_pos,
+    values,
+    size: list,
+    geotransform: list,
+    power: float = 2,
+    smoothing: float = 0.0,
+    num_threads: int = 1,
+    k_nearest: int = 0,
+    max_radius: float = 0.0,
+    out: np.ndarray = None,
+    mask: np.ndarray = None,
+    nodata: float = np.nan,
+    precision: str = "float64",
+    memory_budget: int = MEMORY_BUDGET,
+) -> np.ndarray:
+    """Same as :meth:`inverse_distance`, but taking the station coordinates and
+    values as 1-D arrays.
+
+    Raises:
+        ValueError: If the arrays do not have the same length, `k_nearest` or
+            `max_radius` are negative, `precision` is not valid or `out` or
+            `mask` do not have the field size.
+
+    Returns:
+        np.ndarray: The interpolated field, `out` if it was provided.
+    """
+    x_pos = np.asarray(x_pos, dtype=np.float64)
+    y_pos = np.asarray(y_pos, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    if x_pos.shape != values.shape or y_pos.shape != values.shape:
+        raise ValueError("xpos, ypos and values must have the same length")
+    if k_nearest < 0:
+        raise ValueError("k_nearest must be 0 or a positive number of stations")
+    if max_radius < 0:
+        raise ValueError("max_radius must be 0 or a positive distance")
+    if precision not in ("float32", "float64"):
+        raise ValueError("precision must be 'float32' or 'float64'")
+
+    rows, cols = int(size[0]), int(size[1])
+    out, valid = _check_output(out, mask, nodata, rows, cols)
+
+    num_stations = values.shape[0]
+    if k_nearest >= num_stations and max_radius == 0:
+        k_nearest = 0
+    radius_sq = max_radius * max_radius if max_radius > 0 else -1.0
+    # The compiled kernel keeps the smoothing in single precision
+    smoothing_sq = float(np.float32(smoothing) * np.float32(smoothing))
+
+    def distances(pixels, first, last):
+        d_x = _pixel_x(pixels, cols, geotransform)[:, None] - x_pos[first:last]
+        d_y = _pixel_y(pixels, cols, geotransform)[:, None] - y_pos[first:last]
+        horizontal_sq = d_x * d_x + d_y * d_y
+        dist_sq = horizontal_sq + smoothing_sq
+        return dist_sq, dist_sq < 1e-11, horizontal_sq
+
+    for pixels in _pixel_chunks(valid, num_stations, memory_budget):
+        out.reshape(-1)[pixels] = _field_chunk(
+            distances,
+            pixels,
+            values,
+            power,
+            precision,
+            k_nearest,
+            radius_sq,
+            memory_budget,
+        )
+
+    return out
+
+
+def inverse_distance_3d(
+    data,
+    size: list,
+    geotransform: list,
+    dem,
+    power: float = 2,
+    smoothing: float = 0,
+    penalization: float = 30,
+    out: np.ndarray = None,
+    mask: np.ndarray = None,
+    nodata: float = np.nan,
+    precision: str = "float64",
+    num_threads: int = 1,
+    memory_budget: int = MEMORY_BUDGET,
+) -> np.ndarray:
+    """NumPy version of
+    :meth:`pymica.methods.inverse_distance_3d.inverse_distance_3d`, with the
+    same arguments and results.
+
+    Args:
+        data (list or np.ndarray): Station data as a list of dictionaries or a
+            structured array with, at least, 'x', 'y', 'altitude' and 'value'
+            keys.
+        size (list): Field size as [rows, cols].
+        geotransform (list): The geotransform of the field.
+        dem (np.ndarray): 2-D array of altitudes with the field size.
+        power (float, optional): Inverse of the distance power. Defaults to 2.
+        smoothing (float, optional): Smoothing distance. Defaults to 0.
+        penalization (float, optional): Altitude penalization. Defaults to 30.
+        out (np.ndarray, optional): Output array, as in :meth:`inverse_distance`.
+        mask (np.ndarray, optional): Valid pixels, as in :meth:`inverse_distance`.
+        nodata (float, optional): Value of the masked pixels. Defaults to NaN.
+        precision (str, optional): 'float64' or 'float32', the precision of the
+            weights. Defaults to 'float64'.
+        num_threads (int, optional): Not used, kept for compatibility with the
+            compiled kernel. Defaults to 1.
+        memory_budget (int, optional): Bytes of the temporary arrays of each
+            chunk of pixels. Defaults to 64 MiB.
+
+    Returns:
+        np.ndarray: The interpolated field, `out` if it was provided.
+    """
+    x_pos, y_pos, z_pos, values = station_arrays(data, ("x", "y", "altitude", "value"))
+
+    return inverse_distance_3d_arrays(
+        x_pos,
+        y_pos,
+        z_pos,
+        values,
+        size,
+        geotransform,
+        dem,
+        power,
+        smoothing,
+        penalization,
+        out,
+        mask,
+        nodata,
+        precision,
+        num_threads,
+        memory_budget,
+    )
+
+
+def inverse_distance_3d_arrays(
+    x_pos,
+    y_pos,
+    z_pos,
+    values,
+    size: list,
+    geotransform: list,
+    dem,
+    power: float = 2,
+    smoothing: float = 0,
+    penalization: float = 30,
+    out: np.ndarray = None,
+    mask: np.ndarray = None,
+    nodata: float = np.nan,
+    precision: str = "float64",
+    num_threads: int = 1,
+    memory_budget: int = MEMORY_BUDGET,
+) -> np.ndarray:
+    """Same as :meth:`inverse_distance_3d`, but taking the station coordinates,
+    altitudes and values as 1-D arrays.
+
+    Raises:
+        ValueError: If the arrays do not have the same length, `precision` is
+            not valid or `out`, `mask` or `dem` do not have the field size.
+
+    Returns:
+        np.ndarray: The interpolated field, `out` if it was provided.
+    """
+    x_pos = np.asarray(x_pos, dtype=np.float64)
+    y_pos = np.asarray(y_pos, dtype=np.float64)
+    z_pos = np.asarray(z_pos, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    if (
+        x_pos.shape != values.shape
+        or y_pos.shape != values.shape
+        or z_pos.shape != values.shape
+    ):
+        raise ValueError("xpos, ypos, zpos and values must have the same length")
+    if precision not in ("float32", "float64"):
+        raise ValueError("precision must be 'float32' or 'float64'")
+
+    rows, cols = int(size[0]), int(size[1])
+    out, valid = _check_output(out, mask, nodata, rows, cols)
+    dem = np.asarray(dem)
+    if dem.shape != (rows, cols):
+        raise ValueError("dem must have shape " + str((rows, cols)))
+
+    dem = dem.ravel()
+    smoothing_sq = smoothing * smoothing
+
+    def distances(pixels, first, last):
+        d_x = _pixel_x(pixels, cols, geotransform)[:, None] - x_pos[first:last]
+        d_y = _pixel_y(pixels, cols, geotransform)[:, None] - y_pos[first:last]
+        d_z = penalization * (dem[pixels][:, None] - z_pos[first:last])
+        horizontal_sq = d_x * d_x + d_y * d_y
+        dist_sq = horizontal_sq + d_z * d_z + smoothing_sq
+        return dist_sq, horizontal_sq < 1e-22, horizontal_sq
+
+    for pixels in _pixel_chunks(valid, values.shape[0], memory_budget):
+        out.reshape(-1)[pixels] = _field_chunk(
+            distances, pixels, values, power, precision, 0, -1.0, memory_budget
+        )
+
+    return out
+
+
+def _check_output(out, mask, nodata: float, rows: int, cols: int):
+    """Validates or creates `out`, sets the masked pixels to `nodata` and
+    returns it with the boolean array of the pixels to compute."""
+    if out is None:
+        out = np.empty((rows, cols), dtype=np.float64)
+    elif (
+        not isinstance(out, np.ndarray)
+        or out.shape != (rows, cols)
+        or out.dtype not in (np.float32, np.float64)
+        or not out.flags["C_CONTIGUOUS"]
+    ):
+        raise ValueError(
+            "out must be a C-contiguous float32 or float64 array with shape "
+            + str((rows, cols))
+        )
+
+    if mask is None:
+        return out, np.ones((rows, cols), dtype=bool)
+
+    mask = np.asarray(mask)
+    if mask.shape != (rows, cols):
+        raise ValueError("mask must have shape " + str((rows, cols)))
+    valid = mask != 0
+    out[~valid] = nodata
+    return out, valid
+
+
+def _pixel_x(pixels, cols: int, geotransform: list):
+    """x coordinate of the raveled `pixels`."""
+    return geotransform[0] + (pixels % cols) * geotransform[1]
+
+
+def _pixel_y(pixels, cols: int, geotransform: list):
+    """y coordinate of the raveled `pixels`."""
+    return geotransform[3] + (pixels // cols) * geotransform[5]
+
+
+def _station_block(memory_budget: int) -> int:
+    """Number of stations whose temporaries of a single pixel fit in the
+    budget."""
+    return max(1, int(memory_budget // (8 * _TEMPORARIES)))
+
+
+def _pixel_chunks(valid, num_stations: int, memory_budget: int):
+    """Yields the raveled valid pixels of each chunk, as many pixels as fit
+    in the budget with all the stations, or one by one if not even one
+    does."""
+    chunk = max(1, _station_block(memory_budget) // max(num_stations, 1))
+    valid = valid.ravel()
+    for start in range(0, valid.shape[0], chunk):
+        pixels = start + np.nonzero(valid[start : start + chunk])[0]
+        if pixels.shape[0] > 0:
+            yield pixels
+
+
+def _field_chunk(
+    distances,
+    pixels,
+    values,
+    power,
+    precision,
+    k_nearest: int,
+    radius_sq: float,
+    memory_budget: int,
+):
+    """Field of a chunk of pixels. `distances(pixels, first, last)` returns
+    the squared distances from the pixels to the stations in [first, last),
+    the pixels on top of them and their horizontal squared distances. The
+    stations are split in blocks that fit in the budget, if needed."""
+    num_stations = values.shape[0]
+    block = _station_block(memory_budget)
+    if pixels.shape[0] * num_stations <= block:
+        dist_sq, coincident, horizontal_sq = distances(pixels, 0, num_stations)
+        used = None
+        if k_nearest > 0 or radius_sq >= 0:
+            used = _used_stations(horizontal_sq, k_nearest, radius_sq)
+        return _weighted_mean(
+            *_weighted_sums(dist_sq, coincident, values, power, precision, used),
+            values,
+        )
+
+    kth_sq = None
+    if 0 < k_nearest < num_stations:
+        kth_sq = _kth_nearest(distances, pixels, num_stations, k_nearest, block)
+    numerator = np.zeros(pixels.shape[0])
+    denominator = np.zeros(pixels.shape[0])
+    first_hit = np.full(pixels.shape[0], -1)
+    for first in range(0, num_stations, block):
+        last = min(first + block, num_stations)
+        dist_sq, coincident, horizontal_sq = distances(pixels, first, last)
+        used = None
+        if kth_sq is not None or radius_sq >= 0:
+            used = np.ones(horizontal_sq.shape, dtype=bool)
+            if radius_sq >= 0:
+                used &= horizontal_sq <= radius_sq
+            if kth_sq is not None:
+                used &= horizontal_sq <= kth_sq[:, None]
+        block_numerator, block_denominator, block_hit = _weighted_sums(
+            dist_sq, coincident, values[first:last], power, precision, used
+        )
+        numerator += block_numerator
+        denominator += block_denominator
+        new_hit = (first_hit < 0) & (block_hit >= 0)
+        first_hit[new_hit] = first + block_hit[new_hit]
+
+    return _weighted_mean(numerator, denominator, first_hit, values)
+
+
+def _kth_nearest(distances, pixels, num_stations: int, k_nearest: int, block: int):
+    """Horizontal squared distance from each pixel to its k-th nearest
+    station, going through the stations in blocks."""
+    nearest = np.full((pixels.shape[0], k_nearest), np.inf)
+    for first in range(0, num_stations, block):
+        last = min(first + block, num_stations)
+        candidates = np.concatenate(
+            (nearest, distances(pixels, first, last)[2]), axis=1
+        )
+        nearest = np.partition(candidates, k_nearest - 1, axis=1)[:, :k_nearest]
+    return nearest.max(axis=1)
+
+
+def _used_stations(horizontal_sq, k_nearest: int, radius_sq: float):
+    """Boolean (pixels, stations) array of the k nearest stations of each
+    pixel closer than the radius."""
+    used = np.ones(horizontal_sq.shape, dtype=bool)
+    if radius_sq >= 0:
+        used &= horizontal_sq <= radius_sq
+    if 0 < k_nearest < horizontal_sq.shape[1]:
+        nearest = np.argpartition(horizontal_sq, k_nearest - 1, axis=1)
+        in_nearest = np.zeros(horizontal_sq.shape, dtype=bool)
+        np.put_along_axis(in_nearest, nearest[:, :k_nearest], True, axis=1)
+        used &= in_nearest
+    return used
+
+
+def _weighted_sums(dist_sq, coincident, values, power, precision, used=None):
+    """Inverse of the distance weighted sum of the values and sum of the
+    weights for each row of `dist_sq`, and the first coincident station of
+    each row, or -1 if there is none."""
+    if used is not None:
+        coincident &= used
+    dist_sq = dist_sq.astype(precision, copy=False)
+    with np.errstate(divide="ignore", over="ignore"):
+        weights = dist_sq ** dist_sq.dtype.type(-0.5 * power)
+    weights[coincident] = 0.0
+    if used is not None:
+        weights[~used] = 0.0
+
+    numerator = (weights @ values.astype(precision)).astype(np.float64)
+    denominator = weights.sum(axis=1, dtype=np.float64)
+    first_hit = np.full(dist_sq.shape[0], -1)
+    hit = coincident.any(axis=1)
+    first_hit[hit] = coincident[hit].argmax(axis=1)
+    return numerator, denominator, first_hit
+
+
+def _weighted_mean(numerator, denominator, first_hit, values):
+    """Inverse of the distance mean from the weighted sums. Rows with a
+    coincident station take the value of the first one, and rows without any
+    station get 0, as in the compiled kernels."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = np.where(denominator != 0.0, numerator / denominator, 0.0)
+
+    hit = first_hit >= 0
+    result[hit] = values[first_hit[hit]]
+    return result
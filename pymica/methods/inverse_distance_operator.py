@@ -0,0 +1,182 @@
+"""Inverse of the distance weights precomputed for a fixed station network,
+so the same stations can be interpolated over the same grid for many timesteps
+with a single matrix product.
+"""
+
+import numpy as np
+from scipy import sparse
+
+from pymica.methods.station_arrays import station_arrays
+
+
+class InverseDistanceOperator:
+    """Inverse of the distance weights between the pixels of a grid and a fixed
+    set of stations. Gives the same fields as
+    :meth:`pymica.methods.inverse_distance.inverse_distance` (or
+    :meth:`pymica.methods.inverse_distance_3d.inverse_distance_3d` if a DEM is
+    provided) for any number of timesteps.
+    """
+
+    def __init__(
+        self,
+        stations,
+        size: list,
+        geotransform: list,
+        power: float = 2,
+        smoothing: float = 0.0,
+        dem: np.ndarray = None,
+        penalization: float = 30,
+        num_nearest: int = None,
+        chunk_size: int = 65536,
+    ) -> None:
+        """Build the weights matrix.
+
+        Args:
+            stations (list or np.ndarray): Station locations as a list of
+                dictionaries or a structured array with, at least, 'x' and 'y'
+                keys, and 'altitude' if `dem` is provided. The order of the
+                stations is the order of the values passed to :meth:`apply`.
+            size (list): Field size as [rows, cols].
+            geotransform (list): The geotransform of the field.
+            power (float, optional): Inverse of the distance power. Defaults to 2.
+            smoothing (float, optional): Smoothing distance. Defaults to 0.0.
+            dem (np.ndarray, optional): 2-D array of altitudes with the field size.
+                If provided, the weights are the ones from the 3D inverse of the
+                distance. Defaults to None.
+            penalization (float, optional): Altitude penalization used with `dem`.
+                Defaults to 30.
+            num_nearest (int, optional): If provided, only the weights of the
+                `num_nearest` nearest stations to each pixel are kept and stored
+                as a sparse matrix. Defaults to None, all the stations.
+            chunk_size (int, optional): Number of pixels whose weights are
+                computed at once. Defaults to 65536.
+
+        Raises:
+            ValueError: If `dem` does not have the field size or `num_nearest`
+                is not positive.
+        """
+        if num_nearest is not None and num_nearest < 1:
+            raise ValueError("num_nearest must be a positive number of stations")
+        self.size = (int(size[0]), int(size[1]))
+        self.geotransform = list(geotransform)
+        self.power = power
+        self.smoothing = smoothing
+        self.penalization = penalization
+        self.num_nearest = num_nearest
+
+        if dem is None:
+            x_pos, y_pos = station_arrays(stations, ("x", "y"))
+            z_pos = None
+        else:
+            if np.shape(dem) != self.size:
+                raise ValueError("dem must have the same size as the field")
+            x_pos, y_pos, z_pos = station_arrays(stations, ("x", "y", "altitude"))
+        self.num_stations = x_pos.shape[0]
+
+        if num_nearest is not None:
+            num_nearest = min(int(num_nearest), self.num_stations)
+
+        num_pixels = self.size[0] * self.size[1]
+        x_coords = geotransform[0] + np.arange(self.size[1]) * geotransform[1]
+        y_coords = geotransform[3] + np.arange(self.size[0]) * geotransform[5]
+        dem_flat = None if dem is None else np.asarray(dem, dtype=np.float64).ravel()
+
+        dense_chunks = []
+        sparse_rows, sparse_cols, sparse_weights = [], [], []
+        coincident_pixels, coincident_stations = [], []
+
+        for start in range(0, num_pixels, chunk_size):
+            pixels = np.arange(start, min(start + chunk_size, num_pixels))
+            d_x = x_coords[pixels % self.size[1]][:, None] - x_pos[None, :]
+            d_y = y_coords[pixels // self.size[1]][:, None] - y_pos[None, :]
+            dist_sq = d_x * d_x + d_y * d_y
+
+            if dem_flat is None:
+                dist_sq += smoothing * smoothing
+                coincident = dist_sq < 1e-11
+            else:
+                coincident = np.sqrt(dist_sq) < 1e-11
+                d_z = penalization * (dem_flat[pixels][:, None] - z_pos[None, :])
+                dist_sq += d_z * d_z + smoothing * smoothing
+
+            # Coincident stations are applied apart, so the other stations
+            # can take over when they are missing.
+            pixel_idx, station_idx = np.nonzero(coincident)
+            coincident_pixels.append(pixels[pixel_idx])
+            coincident_stations.append(station_idx)
+
+            with np.errstate(divide="ignore"):
+                weights = 1.0 / dist_sq ** (power / 2.0)
+            weights[coincident] = 0.0
+
+            if num_nearest is None:
+                dense_chunks.append(weights)
+            else:
+                nearest = np.argpartition(dist_sq, num_nearest - 1, axis=1)
+                nearest = nearest[:, :num_nearest]
+                sparse_rows.append(np.repeat(pixels, num_nearest))
+                sparse_cols.append(nearest.ravel())
+                sparse_weights.append(
+                    np.take_along_axis(weights, nearest, axis=1).ravel()
+                )
+
+        if num_nearest is None:
+            self.weights = np.concatenate(dense_chunks, axis=0)
+        else:
+            self.weights = sparse.csr_matrix(
+                (
+                    np.concatenate(sparse_weights),
+                    (np.concatenate(sparse_rows), np.concatenate(sparse_cols)),
+                ),
+                shape=(num_pixels, self.num_stations),
+            )
+
+        self.coincident_pixels = np.concatenate(coincident_pixels)
+        self.coincident_stations = np.concatenate(coincident_stations)
+
+    def apply(self, values) -> np.ndarray:
+        """Interpolate the station values of one or many timesteps.
+
+        Args:
+            values (np.ndarray): Station values as a (N,) array for one timestep
+                or a (T, N) array for T timesteps, in the order of the stations
+                given when building the operator. Stations missing in a timestep
+                must be NaN, the weights of the other stations are renormalised.
+
+        Raises:
+            ValueError: If the number of values is not the number of stations.
+
+        Returns:
+            np.ndarray: The (rows, cols) field, or the (T, rows, cols) fields.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        single = values.ndim == 1
+        values = np.atleast_2d(values)
+        if values.shape[1] != self.num_stations:
+            raise ValueError(
+                "values must have one column for each of the "
+                + str(self.num_stations)
+                + " stations"
+            )
+
+        available = np.isfinite(values)
+        masked_values = np.where(available, values, 0.0)
+
+        numerator = self.weights @ masked_values.T
+        denominator = self.weights @ available.T.astype(np.float64)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            fields = np.where(denominator != 0.0, numerator / denominator, 0.0)
+
+        # The first coincident station of a pixel wins, as in the kernels
+        for pixel, station in zip(
+            self.coincident_pixels[::-1], self.coincident_stations[::-1]
+        ):
+            fields[pixel] = np.where(
+                available[:, station], values[:, station], fields[pixel]
+            )
+
+        fields = fields.T.reshape((values.shape[0],) + self.size)
+        if single:
+            return fields[0]
+        return fields
@@ -0,0 +1,540 @@
+#cython: boundscheck=False, wraparound=False, nonecheck=False, cdivision=True
+"""
+Approximate inverse of the distance, in 2D or 3D, that groups the stations in
+a KD-tree and takes each group far enough from a point as a single station,
+as in the Barnes-Hut method. The cost per pixel grows with log(N) instead of N.
+
+A group is taken as a whole when its radius r, around its centroid, and the
+distance d from the point to the centroid meet r < theta * d. Then every
+station of the group is between (1 - theta) * d and (1 + theta) * d from the
+point, so all of them get the weight of the centroid with an error factor
+below kappa = ((1 + theta) / (1 - theta)) ** power. The interpolated value
+then differs from the exact one less than
+
+    (max(values) - min(values)) * (sqrt(kappa) - 1) / (sqrt(kappa) + 1)
+
+given by error_bound, which is theta itself for a power of 2. This is the
+worst case, with all the stations of every group placed against the point;
+usual networks stay one order of magnitude below it. opening_angle gives the
+theta that guarantees a given bound.
+"""
+
+import numpy as np
+cimport numpy as np
+from libc.math cimport sqrt
+from libc.stdlib cimport malloc, free
+from cpython cimport array
+from cython cimport floating
+from cython.parallel cimport parallel, prange
+import array
+import os
+from typing import Dict, List, Union
+
+from pymica.methods.idw_power cimport IdwPower, make_power, station_weight
+from pymica.methods.station_arrays import station_arrays
+
+DTYPE = np.float64
+
+# DEM dtypes read without conversion, as in inverse_distance_3d
+ctypedef fused dem_t:
+    short
+    float
+    double
+
+cdef struct Tree:
+    # Stations sorted so the stations of a node are contiguous
+    const double *xpos
+    const double *ypos
+    const double *zpos
+    const double *values
+    # Stations of node n are in [start[n], end[n]). Leaves have left = -1.
+    const int *start
+    const int *end
+    const int *left
+    const int *right
+    # Centroid and radius around it of each node
+    const double *center
+    const double *radius_sq
+    # Horizontal bounding box of each node, as x_min, y_min, x_max, y_max
+    const double *bbox
+    const double *value_sum
+    int depth
+
+
+# Stations per leaf. Leaves are always computed exactly.
+cdef enum:
+    LEAF_SIZE = 8
+
+
+def opening_angle(double tolerance, double power):
+    """
+    opening_angle(tolerance, power)
+
+    Opening angle theta that keeps the error below `tolerance`, as a fraction
+    of the station values range.
+
+    Args:
+        tolerance (float): Maximum error, between 0 and 1.
+        power (float): The power of the distance.
+
+    Returns:
+        float: theta, between 0 and 1
+    """
+    if not 0 < tolerance < 1:
+        raise ValueError("tolerance must be between 0 and 1")
+    if power <= 0:
+        return 1.0
+    sqrt_kappa = (1 + tolerance) / (1 - tolerance)
+    ratio = sqrt_kappa ** (2.0 / power)
+    return (ratio - 1) / (ratio + 1)
+
+
+def error_bound(double theta, double power):
+    """
+    error_bound(theta, power)
+
+    Maximum error, as a fraction of the station values range, for an opening
+    angle theta.
+
+    Args:
+        theta (float): Opening angle, between 0 and 1.
+        power (float): The power of the distance.
+
+    Returns:
+        float: The maximum error
+    """
+    sqrt_kappa = ((1 + theta) / (1 - theta)) ** (power / 2.0)
+    return (sqrt_kappa - 1) / (sqrt_kappa + 1)
+
+
+def build_tree(xpos, ypos, zpos, values):
+    """
+    build_tree(xpos, ypos, zpos, values)
+
+    Builds the KD-tree, splitting each node at the median of its widest axis.
+    The nodes are built breadth first, without recursion, in O(N log N).
+
+    Args:
+        xpos (np.array): The x coordinate of the stations
+        ypos (np.array): The y coordinate of the stations
+        zpos (np.array): The z coordinate of the stations, already scaled
+        values (np.array): The station values
+
+    Returns:
+        dict: Station arrays sorted by node and the node arrays
+    """
+    points = np.ascontiguousarray(np.column_stack((xpos, ypos, zpos)),
+                                  dtype=DTYPE)
+    values = np.ascontiguousarray(values, dtype=DTYPE)
+    cdef int num_points = points.shape[0]
+    # A binary tree with at least one station per leaf
+    cdef int max_nodes = max(2 * num_points - 1, 0)
+
+    order = np.arange(num_points, dtype=np.intc)
+    tree = {'start': np.empty(max_nodes, dtype=np.intc),
+            'end': np.empty(max_nodes, dtype=np.intc),
+            'left': np.empty(max_nodes, dtype=np.intc),
+            'right': np.empty(max_nodes, dtype=np.intc),
+            'center': np.empty(3 * max_nodes, dtype=DTYPE),
+            'radius_sq': np.empty(max_nodes, dtype=DTYPE),
+            'bbox': np.empty(4 * max_nodes, dtype=DTYPE),
+            'value_sum': np.empty(max_nodes, dtype=DTYPE)}
+    node_depth = np.empty(max_nodes, dtype=np.intc)
+
+    cdef int num_nodes = 0
+    if num_points > 0:
+        num_nodes = build_nodes(points, values, order, tree['start'],
+                                tree['end'], tree['left'], tree['right'],
+                                tree['center'], tree['radius_sq'],
+                                tree['bbox'], tree['value_sum'], node_depth)
+
+    for key in ('start', 'end', 'left', 'right', 'radius_sq', 'value_sum'):
+        tree[key] = tree[key][:num_nodes].copy()
+    tree['center'] = tree['center'][:3 * num_nodes].copy()
+    tree['bbox'] = tree['bbox'][:4 * num_nodes].copy()
+    tree['depth'] = int(node_depth[:num_nodes].max()) if num_nodes > 0 else 0
+    tree['xpos'] = np.ascontiguousarray(points[order, 0])
+    tree['ypos'] = np.ascontiguousarray(points[order, 1])
+    tree['zpos'] = np.ascontiguousarray(points[order, 2])
+    tree['values'] = np.ascontiguousarray(values[order])
+    return tree
+
+
+cdef int build_nodes(const double[:, ::1] points, const double[::1] values,
+                     int[::1] order, int[::1] start, int[::1] end,
+                     int[::1] left, int[::1] right, double[::1] center,
+                     double[::1] radius_sq, double[::1] bbox,
+                     double[::1] value_sum, int[::1] depth) noexcept nogil:
+    """Fills the node arrays breadth first, the children of each node are
+    appended after the nodes already built, and returns the number of nodes.
+    """
+    cdef int num_nodes = 1
+    cdef int node = 0
+    cdef int i, k, axis, middle
+    cdef double low[3]
+    cdef double high[3]
+    cdef double dist_sq, diff, total
+    start[0] = 0
+    end[0] = points.shape[0]
+    depth[0] = 1
+
+    while node < num_nodes:
+        for k in range(3):
+            center[3 * node + k] = 0.0
+            low[k] = points[order[start[node]], k]
+            high[k] = low[k]
+        total = 0.0
+        for i in range(start[node], end[node]):
+            total += values[order[i]]
+            for k in range(3):
+                center[3 * node + k] += points[order[i], k]
+                low[k] = min(low[k], points[order[i], k])
+                high[k] = max(high[k], points[order[i], k])
+        value_sum[node] = total
+        for k in range(3):
+            center[3 * node + k] /= end[node] - start[node]
+
+        radius_sq[node] = 0.0
+        for i in range(start[node], end[node]):
+            dist_sq = 0.0
+            for k in range(3):
+                diff = points[order[i], k] - center[3 * node + k]
+                dist_sq += diff * diff
+            radius_sq[node] = max(radius_sq[node], dist_sq)
+        bbox[4 * node] = low[0]
+        bbox[4 * node + 1] = low[1]
+        bbox[4 * node + 2] = high[0]
+        bbox[4 * node + 3] = high[1]
+
+        left[node] = -1
+        right[node] = -1
+        if end[node] - start[node] > LEAF_SIZE:
+            axis = 0
+            for k in range(1, 3):
+                if high[k] - low[k] > high[axis] - low[axis]:
+                    axis = k
+            middle = (start[node] + end[node]) // 2
+            select_median(points, order, axis, start[node], end[node], middle)
+
+            left[node] = num_nodes
+            right[node] = num_nodes + 1
+            start[num_nodes] = start[node]
+            end[num_nodes] = middle
+            start[num_nodes + 1] = middle
+            end[num_nodes + 1] = end[node]
+            depth[num_nodes] = depth[node] + 1
+            depth[num_nodes + 1] = depth[node] + 1
+            num_nodes += 2
+        node += 1
+
+    return num_nodes
+
+
+cdef void select_median(const double[:, ::1] points, int[::1] order,
+                        int axis, int lo, int hi, int k) noexcept nogil:
+    """Reorders order[lo:hi] so the station k is the one that would be there
+    if sorted along `axis`, with no station after it lower, nor before it
+    greater (Hoare's quickselect).
+    """
+    cdef int i, j, swap
+    cdef double pivot
+    while hi - lo > 1:
+        pivot = points[order[(lo + hi) // 2], axis]
+        i = lo
+        j = hi - 1
+        while i <= j:
+            while points[order[i], axis] < pivot:
+                i += 1
+            while points[order[j], axis] > pivot:
+                j -= 1
+            if i <= j:
+                swap = order[i]
+                order[i] = order[j]
+                order[j] = swap
+                i += 1
+                j -= 1
+        if k <= j:
+            hi = j + 1
+        elif k >= i:
+            lo = i
+        else:
+            return
+
+
+def inverse_distance_tree(data: Union[List[Dict[str, float]], np.ndarray],
+                          size: List[int], geotransform: List[int],
+                          power: float=2, smoothing: float=0.0,
+                          double theta=0.3, dem=None,
+                          double penalization=30, int num_threads=1,
+                          out=None, mask=None, double nodata=np.nan):
+    """
+    inverse_distance_tree(data, size, geotransform)
+
+    Interpolates the data field approximating the inverse of the distance
+    method, 2D as inverse_distance or 3D as inverse_distance_3d if `dem` is
+    provided, with an error below error_bound(theta, power) times the range
+    of the station values.
+
+    Args:
+        data (dict): The data dict, or a structured array, with the x, y and
+                     value fields, and altitude if `dem` is provided.
+        size (list): x X y
+        geotransform (list): The geotransform to apply to relate the data
+                             coordinates and the position in the matrix.
+        power (float): The power of the distance. Defaults to 2.
+        smoothing (float): Smoothing distance. Defaults to 0.
+        theta (float): Opening angle, between 0 and 1. Groups of stations
+                       whose radius is below theta times their distance are
+                       taken as a single station. 0 gives the exact method.
+                       Defaults to 0.3.
+        dem (np.array): 2-D array of altitudes with the same geotransform. If
+                        provided, the 3D inverse of the distance is used.
+                        Defaults to None.
+        penalization (float): Altitude penalization used with `dem`.
+                              Defaults to 30.
+        num_threads (int): Number of OpenMP threads, as in inverse_distance.
+        out (np.array): Output array, as in inverse_distance.
+        mask (np.array): Valid pixels, as in inverse_distance.
+        nodata (float): Value of the masked pixels, as in inverse_distance.
+
+    Returns:
+        np.array: The interpolated data, `out` if it was provided
+    """
+    if dem is None:
+        xpos, ypos, values = station_arrays(data, ('x', 'y', 'value'))
+        zpos = None
+    else:
+        xpos, ypos, zpos, values = station_arrays(
+            data, ('x', 'y', 'altitude', 'value'))
+
+    return inverse_distance_tree_arrays(xpos, ypos, values, size, geotransform,
+                                        power, smoothing, theta, zpos, dem,
+                                        penalization, num_threads, out, mask,
+                                        nodata)
+
+
+def inverse_distance_tree_arrays(xpos, ypos, values,
+                                 size: List[int], geotransform: List[int],
+                                 power: float=2, smoothing: float=0.0,
+                                 double theta=0.3, zpos=None, dem=None,
+                                 double penalization=30, int num_threads=1,
+                                 out=None, mask=None, double nodata=np.nan):
+    """
+    inverse_distance_tree_arrays(xpos, ypos, values, size, geotransform)
+
+    Same as inverse_distance_tree, but taking the station coordinates and
+    values as 1-D arrays, and the altitudes as `zpos` if `dem` is provided.
+
+    Returns:
+        np.array: The interpolated data, `out` if it was provided
+    """
+    cdef int xsize = size[1]
+    cdef int ysize = size[0]
+
+    xpos = np.asarray(xpos, dtype=DTYPE)
+    ypos = np.asarray(ypos, dtype=DTYPE)
+    values = np.asarray(values, dtype=DTYPE)
+    if xpos.shape != values.shape or ypos.shape != values.shape:
+        raise ValueError("xpos, ypos and values must have the same length")
+
+    if dem is None:
+        zpos = np.zeros_like(values)
+        penalization = 0.0
+    else:
+        if zpos is None:
+            raise ValueError("zpos must be provided with a dem")
+        zpos = np.asarray(zpos, dtype=DTYPE)
+        if zpos.shape != values.shape:
+            raise ValueError("zpos and values must have the same length")
+        dem = np.asarray(dem)
+        if dem.shape != (ysize, xsize):
+            raise ValueError("dem must have shape " + str((ysize, xsize)))
+
+    if not 0 <= theta < 1:
+        raise ValueError("theta must be between 0 and 1")
+
+    if out is None:
+        out = np.empty((ysize, xsize), dtype=DTYPE)
+    elif (not isinstance(out, np.ndarray) or out.shape != (ysize, xsize)
+          or out.dtype not in (np.float32, np.float64)
+          or not out.flags['C_CONTIGUOUS']):
+        raise ValueError("out must be a C-contiguous float32 or float64 array "
+                         "with shape " + str((ysize, xsize)))
+
+    cdef const unsigned char[:, ::1] cmask
+    cdef const unsigned char *mask_ptr = NULL
+    if mask is not None:
+        mask = np.asarray(mask)
+        if mask.shape != (ysize, xsize):
+            raise ValueError("mask must have shape " + str((ysize, xsize)))
+        cmask = np.ascontiguousarray(mask != 0).view(np.uint8)
+        if ysize > 0 and xsize > 0:
+            mask_ptr = &cmask[0, 0]
+
+    if values.shape[0] == 0:
+        out[...] = 0.0
+        if mask is not None:
+            out[~(mask != 0)] = nodata
+        return out
+
+    if num_threads <= 0:
+        num_threads = os.cpu_count() or 1
+
+    nodes = build_tree(xpos, ypos, penalization * zpos, values)
+
+    cdef const double[::1] txpos = nodes['xpos']
+    cdef const double[::1] typos = nodes['ypos']
+    cdef const double[::1] tzpos = nodes['zpos']
+    cdef const double[::1] tvalues = nodes['values']
+    cdef const int[::1] tstart = nodes['start']
+    cdef const int[::1] tend = nodes['end']
+    cdef const int[::1] tleft = nodes['left']
+    cdef const int[::1] tright = nodes['right']
+    cdef const double[::1] tcenter = nodes['center']
+    cdef const double[::1] tradius_sq = nodes['radius_sq']
+    cdef const double[::1] tbbox = nodes['bbox']
+    cdef const double[::1] tvalue_sum = nodes['value_sum']
+
+    cdef Tree tree
+    tree.xpos = &txpos[0]
+    tree.ypos = &typos[0]
+    tree.zpos = &tzpos[0]
+    tree.values = &tvalues[0]
+    tree.start = &tstart[0]
+    tree.end = &tend[0]
+    tree.left = &tleft[0]
+    tree.right = &tright[0]
+    tree.center = &tcenter[0]
+    tree.radius_sq = &tradius_sq[0]
+    tree.bbox = &tbbox[0]
+    tree.value_sum = &tvalue_sum[0]
+    tree.depth = nodes['depth']
+
+    cdef array.array geotransform0 = array.array('d', geotransform)
+    cdef double[:] cgeotransform = geotransform0
+    cdef IdwPower cpower = make_power(power)
+    cdef double csmoothing = smoothing
+    cdef double theta_sq = theta * theta
+
+    cdef const short[:, ::1] dem16
+    cdef const float[:, ::1] dem32
+    cdef const double[:, ::1] dem64 = None
+    if dem is not None and dem.dtype == np.int16:
+        dem16 = np.ascontiguousarray(dem)
+        fill_out(out, &tree, cgeotransform, dem16, penalization, cpower,
+                 csmoothing, theta_sq, num_threads, mask_ptr, nodata)
+    elif dem is not None and dem.dtype == np.float32:
+        dem32 = np.ascontiguousarray(dem)
+        fill_out(out, &tree, cgeotransform, dem32, penalization, cpower,
+                 csmoothing, theta_sq, num_threads, mask_ptr, nodata)
+    else:
+        if dem is not None:
+            dem64 = np.ascontiguousarray(dem, dtype=DTYPE)
+        fill_out(out, &tree, cgeotransform, dem64, penalization, cpower,
+                 csmoothing, theta_sq, num_threads, mask_ptr, nodata)
+
+    return out
+
+
+cdef fill_out(out, const Tree *tree, double[:] cgeotransform,
+              const dem_t[:, ::1] dem, double penalization, IdwPower power,
+              double smoothing, double theta_sq, int num_threads,
+              const unsigned char *mask, double nodata):
+    """Fills out with the kernel for the dtype of out."""
+    cdef float[:, ::1] out32
+    cdef double[:, ::1] out64
+    if out.dtype == np.float32:
+        out32 = out
+        fill_field(out32, tree, cgeotransform, dem, penalization, power,
+                   smoothing, theta_sq, num_threads, mask, nodata)
+    else:
+        out64 = out
+        fill_field(out64, tree, cgeotransform, dem, penalization, power,
+                   smoothing, theta_sq, num_threads, mask, nodata)
+
+
+cdef void fill_field(floating[:, ::1] out, const Tree *tree,
+                     double[:] cgeotransform, const dem_t[:, ::1] dem,
+                     double penalization, IdwPower power, double smoothing,
+                     double theta_sq, int num_threads,
+                     const unsigned char *mask, double nodata):
+    cdef int xsize = out.shape[1]
+    cdef int ysize = out.shape[0]
+    cdef bint is_3d = dem is not None
+    cdef int i, j
+    cdef double x, y, z
+    cdef int *stack
+
+    with nogil, parallel(num_threads=num_threads):
+        # Depth first traversal pushes at most one sibling per level
+        stack = <int *> malloc((tree.depth + 2) * sizeof(int))
+        for j in prange(ysize, schedule='dynamic'):
+            y = cgeotransform[3] + j * cgeotransform[5]
+            for i in range(xsize):
+                if mask != NULL and not mask[j * xsize + i]:
+                    out[j, i] = <floating> nodata
+                    continue
+                x = cgeotransform[0] + i * cgeotransform[1]
+                z = penalization * dem[j, i] if is_3d else 0.0
+                out[j, i] = <floating> point_value(x, y, z, tree, is_3d,
+                                                   power, smoothing,
+                                                   theta_sq, stack)
+        free(stack)
+
+
+cdef double point_value(double x, double y, double z, const Tree *tree,
+                        bint is_3d, IdwPower power, double smoothing,
+                        double theta_sq, int *stack) noexcept nogil:
+    """Value at (x, y, z), taking the far nodes as single stations."""
+    cdef double smoothing_sq = smoothing * smoothing
+    cdef double numerator = 0.0
+    cdef double denominator = 0.0
+    cdef double dx, dy, dz, dist_sq, horizontal_sq, weight
+    cdef const double *center
+    cdef const double *bbox
+    cdef int top = 0
+    cdef int node, s
+
+    stack[0] = 0
+    while top >= 0:
+        node = stack[top]
+        top = top - 1
+
+        center = tree.center + 3 * node
+        bbox = tree.bbox + 4 * node
+        dx = x - center[0]
+        dy = y - center[1]
+        dz = z - center[2]
+        dist_sq = dx * dx + dy * dy + dz * dz
+
+        # Nodes over the point are always opened, so stations on top of it
+        # are found as in the exact methods
+        if (tree.radius_sq[node] < theta_sq * dist_sq
+                and not (bbox[0] <= x <= bbox[2] and bbox[1] <= y <= bbox[3])):
+            weight = station_weight(dist_sq + smoothing_sq, power)
+            numerator += tree.value_sum[node] * weight
+            denominator += (tree.end[node] - tree.start[node]) * weight
+        elif tree.left[node] < 0:
+            for s in range(tree.start[node], tree.end[node]):
+                dx = x - tree.xpos[s]
+                dy = y - tree.ypos[s]
+                dz = z - tree.zpos[s]
+                horizontal_sq = dx * dx + dy * dy
+                if is_3d:
+                    if horizontal_sq < 1e-22:
+                        return tree.values[s]
+                elif horizontal_sq + smoothing_sq < 1e-11:
+                    return tree.values[s]
+                weight = station_weight(horizontal_sq + dz * dz + smoothing_sq,
+                                        power)
+                numerator += tree.values[s] * weight
+                denominator += weight
+        else:
+            top = top + 1
+            stack[top] = tree.right[node]
+            top = top + 1
+            stack[top] = tree.left[node]
+
+    if denominator != 0:
+        return numerator / denominator
+    return 0.0
@@ -0,0 +1,134 @@
+"""Leave-one-out cross-validation of the inverse of the distance, estimating
+each station from all the others at its own location instead of
+interpolating a whole field for every withheld station.
+"""
+
+import numpy as np
+
+from pymica.methods.station_arrays import station_arrays
+
+
+class LeaveOneOut:
+    """Leave-one-out errors of the inverse of the distance. Each station is
+    estimated with the same weights as
+    :meth:`pymica.methods.inverse_distance.inverse_distance`, or
+    :meth:`pymica.methods.inverse_distance_3d.inverse_distance_3d` if a
+    penalization is provided, from all the other stations.
+    """
+
+    def __init__(
+        self,
+        data,
+        power: float = 2,
+        smoothing: float = 0.0,
+        penalization: float = None,
+        chunk_size: int = 1024,
+    ) -> None:
+        """Compute the leave-one-out estimates of all the stations.
+
+        Args:
+            data (list or np.ndarray): Station data as a list of dictionaries or a
+                structured array with, at least, 'x', 'y' and 'value' keys, and
+                'altitude' if `penalization` is provided. The 'id' key, if present,
+                is used as the key of the results.
+            power (float, optional): Inverse of the distance power. Defaults to 2.
+            smoothing (float, optional): Smoothing distance. Defaults to 0.0.
+            penalization (float, optional): Altitude penalization. If provided, the
+                3D inverse of the distance is used. Defaults to None, 2D.
+            chunk_size (int, optional): Number of stations estimated at once, which
+                bounds the memory to `chunk_size` times the number of stations.
+                Defaults to 1024.
+        """
+        self.power = power
+        self.smoothing = smoothing
+        self.penalization = penalization
+
+        if penalization is None:
+            x_pos, y_pos, values = station_arrays(data, ("x", "y", "value"))
+            z_pos = None
+        else:
+            x_pos, y_pos, z_pos, values = station_arrays(
+                data, ("x", "y", "altitude", "value")
+            )
+        self.values = values
+
+        if isinstance(data, np.ndarray):
+            has_ids = data.dtype.names is not None and "id" in data.dtype.names
+            self.keys = list(data["id"]) if has_ids else list(range(len(data)))
+        else:
+            self.keys = [point.get("id", i) for i, point in enumerate(data)]
+
+        num_stations = values.shape[0]
+        self.estimates = np.zeros(num_stations)
+
+        for start in range(0, num_stations, chunk_size):
+            stations = np.arange(start, min(start + chunk_size, num_stations))
+            own = (np.arange(stations.shape[0]), stations)
+
+            d_x = x_pos[stations][:, None] - x_pos[None, :]
+            d_y = y_pos[stations][:, None] - y_pos[None, :]
+            dist_sq = d_x * d_x + d_y * d_y
+
+            if z_pos is None:
+                dist_sq += smoothing * smoothing
+                coincident = dist_sq < 1e-11
+            else:
+                coincident = np.sqrt(dist_sq) < 1e-11
+                d_z = penalization * (z_pos[stations][:, None] - z_pos[None, :])
+                dist_sq += d_z * d_z + smoothing * smoothing
+            coincident[own] = False
+
+            with np.errstate(divide="ignore"):
+                weights = 1.0 / dist_sq ** (power / 2.0)
+            weights[coincident] = 0.0
+            weights[own] = 0.0
+
+            numerator = weights @ values
+            denominator = weights.sum(axis=1)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                estimates = np.where(denominator != 0.0, numerator / denominator, 0.0)
+
+            # Another station at the same location gives its value, the first
+            # one as in the kernels
+            on_station = coincident.any(axis=1)
+            first = coincident.argmax(axis=1)
+            estimates[on_station] = values[first[on_station]]
+
+            self.estimates[stations] = estimates
+
+        self.errors = self.estimates - self.values
+
+    def get_estimates(self) -> dict:
+        """Leave-one-out estimate of each station.
+
+        Returns:
+            dict: A dictionary where keys are the id of the stations and values the
+            estimate from all the other stations.
+        """
+        return dict(zip(self.keys, self.estimates))
+
+    def get_errors(self) -> dict:
+        """Leave-one-out errors (estimated value minus the actual value) for each
+        station.
+
+        Returns:
+            dict: A dictionary where keys are the id of the stations and values the
+            error.
+        """
+        return dict(zip(self.keys, self.errors))
+
+    def get_mae(self) -> float:
+        """Leave-one-out Mean Absolute Error.
+
+        Returns:
+            float: The MAE value.
+        """
+        return float(np.mean(np.abs(self.errors)))
+
+    def get_rmse(self) -> float:
+        """Leave-one-out Root Mean Squared Error.
+
+        Returns:
+            float: The RMSE value.
+        """
+        return float(np.sqrt(np.mean(self.errors * self.errors)))
@@ -3,7 +3,7 @@ until the score is under a threshold
 """
 
 import numpy as np
-from numpy import array, std, ones
+from numpy import std
 from sklearn.linear_model import LinearRegression
 from sklearn.metrics import mean_absolute_error, mean_squared_error
 
@@ -32,7 +32,21 @@ class MultiRegression:
         self._init_multiregression()
 
     def _init_multiregression(self):
-        """Init module for multiregression class.
+        """Init module for multiregression class. The data is stored once as
+        arrays: `x_array` with the predictor variables of each station, in the
+        `x_vars` order, `y_data` with their values and `keys` with their ids.
+
+        Raises:
+            ValueError: If none of the predictor variables fits to the predictand
+            variable.
+        """
+        self.x_array, self.y_data, self.keys = self._data_arrays(self.data)
+        self._fit_regression()
+
+    def _fit_regression(self):
+        """Selects the used variables and fits the regression to the `x_array`
+        and `y_data` arrays. `x_data` is a dictionary of views of the `x_array`
+        columns.
 
         Raises:
             ValueError: If none of the predictor variables fits to the predictand
@@ -40,63 +54,65 @@ class MultiRegression:
         """
         self.regr = LinearRegression()
         self.used_vars = []
-        self.x_data = {}
-
-        for x_var in self.x_vars:
-            self.x_data[x_var] = []
-        self.y_data = []
-        self.keys = []
-        for value in self.data:
-            for x_var in self.x_vars:
-                self.x_data[x_var].append(value[x_var])
-            self.y_data.append(value["value"])
-            self.keys.append(value["id"])
-
-        left_vars = self.x_vars[:]
-        final_score = 0
-
-        while left_vars:
-            max_score = 0
-            chosen_var = None
-            for x_var in left_vars:
-                x_data = self._prepare_x_data(x_var)
-                self.regr.fit(x_data, self.y_data)
-
-                score = self.regr.score(x_data, self.y_data)
-                if score > max_score:
-                    max_score = score
-                    chosen_var = x_var
-            if chosen_var is None:
-                break
-            else:
-                left_vars.remove(chosen_var)
+        self.x_data = {x_var: self.x_array[:, i] for i, x_var in enumerate(self.x_vars)}
 
-                if max_score - final_score > self.score_threshold:
-                    final_score = max_score
-                    self.used_vars.append(chosen_var)
+        for i in _forward_selection(self.x_array, self.y_data, self.score_threshold):
+            self.used_vars.append(self.x_vars[i])
 
         if len(self.used_vars) == 0:
             raise ValueError("No variable fits properly")
 
         self.x_final_data = self._prepare_x_data(None)
         self.regr.fit(self.x_final_data, self.y_data)
-        self.score = self.regr.score(self.x_final_data, self.y_data)
+        residuals = self._predict(self.x_final_data) - self.y_data
+        centered = self.y_data - self.y_data.mean()
+        self.score = float(_r2_score(residuals @ residuals, centered @ centered))
 
-    def _prepare_x_data(self, x_var) -> list:
+    def _data_arrays(self, data: list) -> tuple:
+        """Predictor variables, values and ids of a list of stations.
+
+        Args:
+            data (list): Input data as a list of dicts with, at least, the
+                `x_vars`, 'id' and 'value' keys.
+
+        Returns:
+            tuple: The (stations, variables) float array with the `x_vars`, the
+            values array and the list of ids.
+        """
+        x_array = np.array(
+            [[point[x_var] for x_var in self.x_vars] for point in data],
+            dtype=np.float64,
+        ).reshape(len(data), len(self.x_vars))
+        y_data = np.array([point["value"] for point in data], dtype=np.float64)
+        keys = [point["id"] for point in data]
+        return x_array, y_data, keys
+
+    def _prepare_x_data(self, x_var) -> np.array:
         """Prepare x data for MLR calculations.
 
         Args:
             x_var (str): Predictor variable name.
 
         Returns:
-            list: `x_var` predictor data.
+            np.array: (stations, variables) array with the used variables, and
+            `x_var` if it is not None.
         """
-        data = []
-        for var in self.used_vars:
-            data.append(self.x_data[var])
+        columns = [self.x_vars.index(var) for var in self.used_vars]
         if x_var is not None:
-            data.append(self.x_data[x_var])
-        return list(zip(*data))
+            columns.append(self.x_vars.index(x_var))
+        return np.ascontiguousarray(self.x_array[:, columns])
+
+    def _predict(self, x_array: np.array) -> np.array:
+        """Predicted values of a (points, used variables) array, without the
+        input checks of :meth:`LinearRegression.predict`.
+
+        Args:
+            x_array (np.array): The used variables of each point.
+
+        Returns:
+            np.array: The predicted values.
+        """
+        return x_array @ self.regr.coef_ + self.regr.intercept_
 
     def get_coefs(self):
         """Regression coefficients and the independent term.
@@ -134,6 +150,15 @@ class MultiRegression:
 
         return mean_squared_error(self.y_data, predict)
 
+    def get_residuals_array(self) -> np.array:
+        """Regression residuals (predicted value minus the actual value) in the
+        order of `keys`.
+
+        Returns:
+            np.array: The residual of each data point.
+        """
+        return self._predict(self.x_final_data) - self.y_data
+
     def get_residuals(self) -> dict:
         """Regression residuals (predicted value minus the actual value) for each id
         location.
@@ -142,14 +167,7 @@ class MultiRegression:
             dict: A dictionary where keys are the id of the data point and values the
             residual value.
         """
-        predict = self.regr.predict(self.x_final_data)
-        residuals_array = predict - self.y_data
-
-        residuals = {}
-        for i, key in enumerate(self.keys):
-            residuals[key] = residuals_array[i]
-
-        return residuals
+        return dict(zip(self.keys, self.get_residuals_array()))
 
     def predict_point(self, x_data: dict) -> float:
         """Predicted value by the regression given the predictor variables.
@@ -168,7 +186,7 @@ class MultiRegression:
 
         return predict[0]
 
-    def predict_points(self, x_data: list) -> list:
+    def predict_points(self, x_data: list) -> np.array:
         """Predicted values for multiple points given the predictor variables for each.
 
         Args:
@@ -176,27 +194,34 @@ class MultiRegression:
                 include, at least, {'id', 'lon', 'lat', 'value'} as keys.
 
         Returns:
-            list: The predicted values.
+            np.array: The predicted values.
         """
-        data = []
-        for point_data in x_data:
-            point_vars = []
-            for var in self.used_vars:
-                point_vars.append(point_data[var])
-            data.append(point_vars)
-        predict = self.regr.predict(data)
-
-        return predict
-
-    def apply_regression(self, raster_data: np.array, raster_fields: list) -> np.array:
+        data = np.array(
+            [[point_data[var] for var in self.used_vars] for point_data in x_data],
+            dtype=np.float64,
+        ).reshape(len(x_data), len(self.used_vars))
+        return self.regr.predict(data)
+
+    def apply_regression(
+        self,
+        raster_data: np.array,
+        raster_fields: list,
+        mask: np.array = None,
+        nodata: float = np.nan,
+    ) -> np.array:
         """Apply the regression coefficients to an array of predictor variables data.
         The interpolated result is obtained.
 
         Args:
-            raster_data (np.array): A 3-D array with the predictor variables data.
+            raster_data (np.array): A 3-D array with the predictor variables data,
+                of any numeric dtype.
             raster_fields (list): Predictor variable names in the order they are
                 provided in `raster_data` to use the predictor fields in the correct
                 order.
+            mask (np.array, optional): 2-D array with the valid pixels different
+                than 0. Only these pixels are computed. Defaults to None, all the
+                pixels.
+            nodata (float, optional): Value of the masked pixels. Defaults to NaN.
 
         Raises:
             ValueError: `raster_data` is not a 3-D array.
@@ -207,13 +232,28 @@ class MultiRegression:
         if not type(raster_data) == np.ndarray or len(raster_data.shape) != 3:
             raise ValueError("`raster_data` must be a 3 dimensional array")
         coefs = self.get_coefs()
-        out_data = coefs[1] * ones((raster_data[0].shape[0], raster_data[0].shape[1]))
-
+        valid = None
+        if mask is not None:
+            valid = np.asarray(mask) != 0
+            out_data = np.full(np.count_nonzero(valid), coefs[1], dtype=np.float64)
+        else:
+            out_data = np.full(raster_data.shape[1:], coefs[1], dtype=np.float64)
+        # int16 and float32 predictors are promoted by the ufunc loops, with no
+        # float64 copy of the predictor fields. With a mask, only the valid pixels
+        # of the layers with a coefficient are read, one layer at a time.
+        term = np.empty_like(out_data)
         for i, coef in enumerate(coefs[0]):
-            field_pos = raster_fields.index(self.used_vars[i])
-            out_data += coef * raster_data[field_pos]
+            field = raster_data[raster_fields.index(self.used_vars[i])]
+            if valid is not None:
+                field = field[valid]
+            np.multiply(field, coef, out=term, dtype=np.float64)
+            out_data += term
 
-        return out_data
+        if valid is None:
+            return out_data
+        field = np.full(valid.shape, nodata, dtype=np.float64)
+        field[valid] = out_data
+        return field
 
 
 class MultiRegressionSigma(MultiRegression):
@@ -221,9 +261,10 @@ class MultiRegressionSigma(MultiRegression):
     and eliminates the points where the data error is bigger than a
     threshold before re-calculating the regression again.
     The idea is geting a better fitting function.
+    The `inliers` attribute is the boolean mask of the kept points.
     """
 
-    def __init__(self, *args, sigma_limit=1.5, **kwargs):
+    def __init__(self, *args, sigma_limit=1.5, max_iterations=1, **kwargs):
         """The class inherits all the parameters and methods from
         :meth:`MultiRegression`, but adds:
 
@@ -233,20 +274,81 @@ class MultiRegressionSigma(MultiRegression):
                     in multiples of the sigma value.
                     The error that is above this is erased before
                     re-calculating the regression
+            max_iterations (int, optional): Defaults to 1.
+                    Maximum number of times the points are eliminated and
+                    the regression re-calculated. The iterations stop before
+                    if the eliminated points do not change. The sigma value
+                    is the one of the points kept by the previous iteration.
+
+        Raises:
+            ValueError: If `max_iterations` is lower than 1.
         """
-        limit = 0.1
+        if max_iterations < 1:
+            raise ValueError("max_iterations must be 1 or greater.")
         super().__init__(*args, **kwargs)
-        residues = super().get_residuals()
-        sigma = std(array(list(residues.values())))
-        new_data = []
-        i = 0
-        for key in residues:
-            if abs(residues[key]) < sigma * sigma_limit or abs(residues[key]) < limit:
-                new_data.append(self.data[i])
-            i += 1
-        self.original_data = self.data.copy()
-        self.data = new_data
-        self._init_multiregression()
+        self._original_data = self.data
+        self._original_arrays = (self.x_array, self.y_data, self.keys)
+        self.inliers = np.ones(len(self.y_data), dtype=bool)
+
+        for _ in range(max_iterations):
+            inliers = self._sigma_inliers(sigma_limit)
+            if np.array_equal(inliers, self.inliers):
+                break
+            self.inliers = inliers
+            self._fit_inliers()
+
+    def _sigma_inliers(self, sigma_limit: float) -> np.array:
+        """Points of `original_data` whose residual is under `sigma_limit` times
+        the sigma of the residuals of the current `inliers`, or under 0.1.
+
+        Args:
+            sigma_limit (float): The maximum error, in multiples of sigma.
+
+        Returns:
+            np.array: Boolean mask of the kept points.
+        """
+        limit = 0.1
+        residuals = self.get_residuals_array()
+        sigma = std(residuals[self.inliers])
+        return (abs(residuals) < sigma * sigma_limit) | (abs(residuals) < limit)
+
+    def _fit_inliers(self):
+        """Re-calculates the regression with the `inliers` points of the
+        original data, selecting the rows of its arrays instead of reading the
+        data again.
+        """
+        x_array, y_data, keys = self._original_arrays
+        self.data = [
+            point for point, inlier in zip(self._original_data, self.inliers) if inlier
+        ]
+        self.x_array = x_array[self.inliers]
+        self.y_data = y_data[self.inliers]
+        self.keys = [key for key, inlier in zip(keys, self.inliers) if inlier]
+        self._fit_regression()
+
+    @property
+    def original_data(self) -> list:
+        """All the data points, including the ones eliminated because of the
+        sigma value. Setting it also sets the arrays used by `get_residuals`,
+        while `inliers` keeps the mask of the data the regression was
+        calculated with."""
+        return self._original_data
+
+    @original_data.setter
+    def original_data(self, data: list) -> None:
+        self._original_data = data
+        self._original_arrays = self._data_arrays(data)
+
+    def get_residuals_array(self) -> np.array:
+        """Regression residuals (predicted value minus the actual value) of all
+        the `original_data` points, in their order.
+
+        Returns:
+            np.array: The residual of each data point.
+        """
+        x_array, y_data, _ = self._original_arrays
+        columns = [self.x_vars.index(var) for var in self.used_vars]
+        return self._predict(np.ascontiguousarray(x_array[:, columns])) - y_data
 
     def get_residuals(self):
         """Regression residuals (predicted value minus the actual value) for each id
@@ -256,22 +358,73 @@ class MultiRegressionSigma(MultiRegression):
             dict: A dictionary where keys are the id of the data point and values the
             residual value.
         """
-        y_data = []
-        keys = []
-        for point in self.original_data:
-            point_values = []
-            for var in self.x_data:
-                point_values.append(point[var])
-            y_data.append(point["value"])
-            keys.append(point["id"])
-
-        predict = self.predict_points(self.original_data)
-
-        residuals_array = predict - y_data
-        residuals = {}
-
-        i = 0
-        for key in keys:
-            residuals[key] = residuals_array[i]
-            i += 1
-        return residuals
+        return dict(zip(self._original_arrays[2], self.get_residuals_array()))
+
+
+def _forward_selection(x_matrix, y_data, score_threshold):
+    """Forward stepwise selection of the columns of `x_matrix`.
+
+    At each step, the column whose regression with the used ones has the best
+    R^2 score is removed from the candidates, and used if it improves the score
+    by more than `score_threshold`. The used columns are kept as an orthonormal
+    basis of the centered data, so the R^2 score of every candidate comes from
+    its projection onto the residuals, a rank-one update of the used columns
+    fit, and only the final regression has to be fitted.
+
+    Args:
+        x_matrix (np.array): (n, m) array with the predictor variables.
+        y_data (np.array): (n,) array with the predictand variable.
+        score_threshold (float): Minimum score improvement to use a column.
+
+    Returns:
+        list: Indices of the used columns, in the order they were chosen.
+    """
+    x_centered = x_matrix - x_matrix.mean(axis=0)
+    residuals = y_data - y_data.mean()
+    total_ss = residuals @ residuals
+    residual_ss = total_ss
+    basis = np.empty((x_matrix.shape[0], 0))
+    used = []
+    left = list(range(x_matrix.shape[1]))
+    final_score = 0
+
+    while left:
+        candidates = x_centered[:, left]
+        candidates = candidates - basis @ (basis.T @ candidates)
+        norms_sq = np.sum(candidates * candidates, axis=0)
+        # Columns in the span of the used ones do not improve the fit
+        independent = norms_sq > 1e-20 * np.sum(x_centered[:, left] ** 2, axis=0)
+        gains = np.zeros(len(left))
+        gains[independent] = (candidates[:, independent].T @ residuals) ** 2 / (
+            norms_sq[independent]
+        )
+        scores = _r2_score(residual_ss - gains, total_ss)
+
+        # The first of the best candidates, if any has a positive score
+        best = int(np.argmax(scores))
+        if not scores[best] > 0:
+            break
+        chosen = left.pop(best)
+
+        if scores[best] - final_score > score_threshold:
+            final_score = scores[best]
+            used.append(chosen)
+            if independent[best]:
+                column = candidates[:, best]
+                # Orthogonalised twice to keep the basis orthonormal
+                column = column - basis @ (basis.T @ column)
+                column /= np.sqrt(column @ column)
+                basis = np.column_stack((basis, column))
+                residuals = residuals - column * (column @ residuals)
+                residual_ss = residuals @ residuals
+
+    return used
+
+
+def _r2_score(residual_ss, total_ss):
+    """R^2 score from the residual and total sums of squares, with the same
+    values as scikit-learn for a constant predictand."""
+    residual_ss = np.maximum(residual_ss, 0.0)
+    if total_ss == 0:
+        return np.where(residual_ss == 0, 1.0, 0.0)
+    return 1 - residual_ss / total_ss
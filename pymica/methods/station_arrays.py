@@ -0,0 +1,28 @@
+"""Converts station data into the contiguous arrays used by the interpolation
+kernels.
+"""
+
+import numpy as np
+
+
+def station_arrays(data, fields=("x", "y", "value")) -> tuple:
+    """Extract station fields as contiguous float64 arrays.
+
+    Args:
+        data (list or np.ndarray): Station data as a list of dictionaries or as a
+            structured array. Both must include, at least, the `fields` keys.
+        fields (tuple, optional): Names of the fields to extract. Defaults to
+            ('x', 'y', 'value').
+
+    Returns:
+        tuple: One 1-D float64 array for each field, in the `fields` order.
+    """
+    if isinstance(data, np.ndarray):
+        return tuple(
+            np.ascontiguousarray(data[field], dtype=np.float64) for field in fields
+        )
+
+    return tuple(
+        np.fromiter((point[field] for point in data), dtype=np.float64, count=len(data))
+        for field in fields
+    )
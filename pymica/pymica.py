@@ -6,9 +6,37 @@ import json
 
 import numpy as np
 from genericpath import exists
-from osgeo import gdal, osr, ogr
-from pymica.methods.inverse_distance import inverse_distance
-from pymica.methods.inverse_distance_3d import inverse_distance_3d
+from osgeo import gdal, gdal_array, osr, ogr
+from pymica.methods.inverse_distance_adaptive import (
+    inverse_distance_adaptive_arrays,
+)
+from pymica.methods.inverse_distance_fft import (
+    inverse_distance_fft_arrays,
+    inverse_distance_fft_error,
+)
+from pymica.methods.inverse_distance_knn import (
+    inverse_distance_3d_knn_arrays,
+    inverse_distance_knn_arrays,
+)
+from pymica.methods.station_arrays import station_arrays
+
+# Without the compiled extensions, the NumPy kernels are used instead and the
+# tree engine is not available.
+try:
+    from pymica.methods.inverse_distance import inverse_distance_arrays
+except ImportError:
+    from pymica.methods.inverse_distance_numpy import inverse_distance_arrays
+try:
+    from pymica.methods.inverse_distance_3d import inverse_distance_3d_arrays
+except ImportError:
+    from pymica.methods.inverse_distance_numpy import inverse_distance_3d_arrays
+try:
+    from pymica.methods.inverse_distance_tree import (
+        inverse_distance_tree_arrays,
+        opening_angle,
+    )
+except ImportError:
+    inverse_distance_tree_arrays = None
 
 from pymica.methods.clustered_regression import (
     ClusteredRegression,
@@ -25,17 +53,26 @@ class PyMica:
         """Implements different checks to config depending on the chosen methodology.
 
         Args:
-            methodology (str): Interpolation method among 'id2d', 'id3d', 'mlr',
-                'mlr+id2d' and 'mlr+id3d'.
+            methodology (str): Interpolation method among 'id2d', 'id3d', 'knn2d',
+                'mlr', 'mlr+id2d', 'mlr+id3d' and 'mlr+knn2d'.
             config (dict): Configuration dictionary.
 
         Raises:
-            ValueError: If `methodology` not in 'id2d', 'id3d', 'mlr', 'mlr+id2d'
-                and 'mlr+id3d'.
+            ValueError: If `methodology` not in 'id2d', 'id3d', 'knn2d', 'mlr',
+                'mlr+id2d', 'mlr+id3d' and 'mlr+knn2d'.
         """
-        if methodology not in ["id2d", "mlr+id2d", "id3d", "mlr+id3d", "mlr"]:
+        if methodology not in [
+            "id2d",
+            "mlr+id2d",
+            "id3d",
+            "mlr+id3d",
+            "knn2d",
+            "mlr+knn2d",
+            "mlr",
+        ]:
             raise ValueError(
-                'Methodology must be "id2d", "id3d", "mlr+id2d", "mlr+id3d" or "mlr"'
+                'Methodology must be "id2d", "id3d", "knn2d", "mlr+id2d", '
+                '"mlr+id3d", "mlr+knn2d" or "mlr"'
             )
 
         self.methodology = methodology
@@ -45,10 +82,12 @@ class PyMica:
 
         self.__get_geographical_parameters__()
 
-        if methodology in ["mlr", "id3d", "mlr+id2d", "mlr+id3d"]:
+        if methodology in ["mlr", "id3d", "mlr+id2d", "mlr+id3d", "mlr+knn2d"]:
             self.__check_variables__()
             self.__read_variables_files__()
 
+        self.__get_mask__()
+
         self.field = None
 
     def __read_config__(self, config_file: str) -> dict:
@@ -80,7 +119,14 @@ class PyMica:
         if methodology not in self.config.keys():
             raise KeyError(methodology + " not defined in the configuration file.")
 
-        if methodology in ["id2d", "id3d", "mlr+id2d", "mlr+id3d"]:
+        if methodology in [
+            "id2d",
+            "id3d",
+            "mlr+id2d",
+            "mlr+id3d",
+            "knn2d",
+            "mlr+knn2d",
+        ]:
             if "id_power" not in self.config[methodology].keys():
                 print(
                     "id_power not in the configuration dictionary. "
@@ -95,6 +141,82 @@ class PyMica:
                 )
             self.smoothing = self.config[methodology].get("id_smoothing", 0.0)
 
+            self.num_threads = self.config[methodology].get("num_threads", 1)
+            if not isinstance(self.num_threads, int):
+                raise TypeError("num_threads must have a valid int value.")
+
+        if methodology in ["id2d", "id3d", "mlr+id2d", "mlr+id3d"]:
+            self.id_engine = self.config[methodology].get("id_engine", "exact")
+            if methodology in ["id2d", "mlr+id2d"]:
+                if self.id_engine not in ["exact", "fft", "tree"]:
+                    raise ValueError('id_engine must be "exact", "fft" or "tree".')
+            elif self.id_engine not in ["exact", "tree"]:
+                raise ValueError('id_engine must be "exact" or "tree".')
+            if self.id_engine == "tree" and inverse_distance_tree_arrays is None:
+                raise ImportError(
+                    "The tree id_engine needs the compiled "
+                    "pymica.methods.inverse_distance_tree module."
+                )
+
+            self.tree_tolerance = self.config[methodology].get(
+                "id_tree_tolerance", 1e-3
+            )
+            if isinstance(self.tree_tolerance, str):
+                raise TypeError("id_tree_tolerance must have a valid value.")
+            if not 0 <= self.tree_tolerance < 1:
+                raise ValueError("id_tree_tolerance must be between 0 and 1.")
+            self.tree_theta = 0.0
+            if self.id_engine == "tree" and self.tree_tolerance > 0:
+                self.tree_theta = opening_angle(self.tree_tolerance, self.power)
+
+            self.precision = self.config[methodology].get("precision", "float64")
+            if self.precision not in ["float32", "float64"]:
+                raise ValueError('precision must be "float32" or "float64".')
+
+        if methodology in ["id2d", "mlr+id2d"]:
+            self.k_nearest = self.config[methodology].get("id_k_nearest", 0)
+            if not isinstance(self.k_nearest, int):
+                raise TypeError("id_k_nearest must have a valid int value.")
+
+            self.max_radius = self.config[methodology].get("id_max_radius", 0.0)
+            if isinstance(self.max_radius, str):
+                raise TypeError("id_max_radius must have a valid value in meters.")
+
+            if self.id_engine == "fft" and self.k_nearest > 0:
+                raise ValueError(
+                    "id_k_nearest is not available with the fft id_engine."
+                )
+            if self.id_engine == "tree" and (self.k_nearest > 0 or self.max_radius > 0):
+                raise ValueError(
+                    "id_k_nearest and id_max_radius are not available with the "
+                    "tree id_engine."
+                )
+
+            self.adaptive_factor = self.config[methodology].get("id_adaptive_factor", 1)
+            if not isinstance(self.adaptive_factor, int):
+                raise TypeError("id_adaptive_factor must have a valid int value.")
+            self.adaptive_tolerance = self.config[methodology].get(
+                "id_adaptive_tolerance", 0.1
+            )
+            if isinstance(self.adaptive_tolerance, str):
+                raise TypeError("id_adaptive_tolerance must have a valid value.")
+            if self.id_engine != "exact" and self.adaptive_factor > 1:
+                raise ValueError(
+                    "id_adaptive_factor is only available with the exact id_engine."
+                )
+
+            self.fft_error_step = self.config[methodology].get("id_fft_error_step", 0)
+            if not isinstance(self.fft_error_step, int):
+                raise TypeError("id_fft_error_step must have a valid int value.")
+            self.fft_error = None
+
+        if methodology in ["knn2d", "mlr+knn2d"]:
+            self.num_nearest = self.config[methodology].get("num_nearest", 6)
+            if not isinstance(self.num_nearest, int):
+                raise TypeError("num_nearest must have a valid int value.")
+            if self.num_nearest < 1:
+                raise ValueError("num_nearest must be 1 or greater.")
+
         if methodology in ["id3d", "mlr+id3d"]:
             if "id_penalization" not in self.config[methodology].keys():
                 print(
@@ -103,6 +225,14 @@ class PyMica:
                 )
             self.penalization = self.config[methodology].get("id_penalization", 30.0)
 
+            self.k_nearest = self.config[methodology].get("id_k_nearest", 0)
+            if not isinstance(self.k_nearest, int):
+                raise TypeError("id_k_nearest must have a valid int value.")
+            if self.id_engine == "tree" and self.k_nearest > 0:
+                raise ValueError(
+                    "id_k_nearest is not available with the tree id_engine."
+                )
+
         self.interpolation_bounds = self.config[methodology].get(
             "interpolation_bounds", None
         )
@@ -127,13 +257,19 @@ class PyMica:
         if isinstance(self.resolution, str):
             raise TypeError("resolution must have a valid value in meters.")
 
+        self.mask_file = self.config[methodology].get("mask_file", None)
+
+        self.nodata = self.config[methodology].get("nodata", None)
+        if self.nodata is not None and not isinstance(self.nodata, (int, float)):
+            raise TypeError("nodata must have a valid numeric value.")
+
         self.EPSG = self.config[methodology].get("EPSG", None)
         if self.EPSG is None:
             raise KeyError("EPSG must be defined in the configuration dictionary.")
         if not isinstance(self.EPSG, int):
             raise TypeError("EPSG must have a valid int value.")
 
-        if methodology in ["mlr+id2d", "mlr+id3d", "mlr", "id3d"]:
+        if methodology in ["mlr+id2d", "mlr+id3d", "mlr+knn2d", "mlr", "id3d"]:
             if "variables_files" not in self.config[methodology].keys():
                 raise KeyError(
                     "variables_files must be included in the configuration file if "
@@ -155,6 +291,22 @@ class PyMica:
             ValueError: If properties of variable fields are not the same with
                         each other.
         """
+        for var in list(self.config[self.methodology]["variables_files"].keys()):
+            self.__check_raster_file__(
+                self.config[self.methodology]["variables_files"][var]
+            )
+
+    def __check_raster_file__(self, file_name: str) -> None:
+        """Check if a raster file has the GeoTransform, projection and size of the
+        interpolated field.
+
+        Args:
+            file_name (str): Path to the raster file.
+
+        Raises:
+            FileNotFoundError: If `file_name` not found.
+            ValueError: If the properties of `file_name` are not the same.
+        """
         geo_param = np.array(
             [
                 self.field_geotransform,
@@ -165,32 +317,29 @@ class PyMica:
             dtype="object",
         )
 
-        for var in list(self.config[self.methodology]["variables_files"].keys()):
-            if not exists(self.config[self.methodology]["variables_files"][var]):
-                raise FileNotFoundError(
-                    "No such file or directory: "
-                    + self.config[self.methodology]["variables_files"][var]
-                )
-            var_ds = gdal.Open(self.config[self.methodology]["variables_files"][var])
-
-            check_equal = np.array_equal(
-                np.array(
-                    [
-                        var_ds.GetGeoTransform(),
-                        var_ds.GetProjectionRef(),
-                        var_ds.RasterXSize,
-                        var_ds.RasterYSize,
-                    ],
-                    dtype="object",
-                ),
-                geo_param,
-            )
+        if not exists(file_name):
+            raise FileNotFoundError("No such file or directory: " + file_name)
+        var_ds = gdal.Open(file_name)
+
+        check_equal = np.array_equal(
+            np.array(
+                [
+                    var_ds.GetGeoTransform(),
+                    var_ds.GetProjectionRef(),
+                    var_ds.RasterXSize,
+                    var_ds.RasterYSize,
+                ],
+                dtype="object",
+            ),
+            geo_param,
+        )
+        var_ds = None
 
-            if check_equal is False:
-                raise ValueError(
-                    "Variables properties are not the same. Variables fields must have"
-                    " the same GeoTransform, Projection, XSize and YSize."
-                )
+        if check_equal is False:
+            raise ValueError(
+                "Variables properties are not the same. Variables fields must have"
+                " the same GeoTransform, Projection, XSize and YSize."
+            )
 
     def __input_data__(self, input_data: list) -> None:
         """Check and transform input data depending on the selected interpolation
@@ -221,7 +370,7 @@ class PyMica:
                 if "altitude" not in elements.keys():
                     raise KeyError("altitude must be included in the data file")
 
-        if self.methodology in ["mlr", "mlr+id2d", "mlr+id3d"]:
+        if self.methodology in ["mlr", "mlr+id2d", "mlr+id3d", "mlr+knn2d"]:
             for elements in input_data:
                 if not set(
                     list(self.config[self.methodology]["variables_files"].keys())
@@ -246,18 +395,65 @@ class PyMica:
         return input_data
 
     def __read_variables_files__(self):
-        for i, var in enumerate(
-            list(self.config[self.methodology]["variables_files"].keys())
-        ):
-            var_ds = gdal.Open(self.config[self.methodology]["variables_files"][var])
-            if i == 0:
-                self.variables = np.array([var_ds.ReadAsArray()])
-            else:
-                self.variables = np.concatenate(
-                    (self.variables, np.array([var_ds.ReadAsArray()])), axis=0
-                )
+        """Read the predictor fields into `variables`, a 3-D array with the
+        narrowest dtype that holds all of them, so an int16 DEM alone stays
+        int16 and with float32 fields becomes float32. Each field is read
+        directly into its layer.
+        """
+        variables_files = self.config[self.methodology]["variables_files"]
+        bands = []
+        for var in variables_files:
+            var_ds = gdal.Open(variables_files[var])
+            bands.append((var_ds, var_ds.GetRasterBand(1)))
+
+        self.variables_nodata = [band.GetNoDataValue() for _, band in bands]
+        dtype = np.result_type(
+            *[
+                gdal_array.GDALTypeCodeToNumericTypeCode(band.DataType)
+                for _, band in bands
+            ]
+        )
+        self.variables = np.empty(
+            (len(bands), bands[0][1].YSize, bands[0][1].XSize), dtype=dtype
+        )
+        for layer, (_, band) in zip(self.variables, bands):
+            band.ReadAsArray(buf_obj=layer)
 
-        var_ds = None
+        bands = None
+
+    def __get_mask__(self) -> None:
+        """Set the valid pixels mask from `mask_file` (pixels different than 0)
+        and from the nodata value of the predictor fields, if any. The nodata value
+        of the result is the configured `nodata`, or the nodata value of the first
+        predictor field that has one, or -9999.
+
+        Raises:
+            FileNotFoundError: If `mask_file` not found.
+            ValueError: If `mask_file` properties are not the same as the field ones.
+        """
+        self.mask = None
+        variables_nodata = None
+
+        if self.mask_file is not None:
+            self.__check_raster_file__(self.mask_file)
+            d_s = gdal.Open(self.mask_file)
+            self.mask = d_s.ReadAsArray() != 0
+            d_s = None
+
+        if self.methodology in ["mlr", "id3d", "mlr+id2d", "mlr+id3d", "mlr+knn2d"]:
+            for var_nodata, var_data in zip(self.variables_nodata, self.variables):
+                if var_nodata is None:
+                    continue
+                if np.isnan(var_nodata):
+                    valid = ~np.isnan(var_data)
+                else:
+                    valid = var_data != var_nodata
+                self.mask = valid if self.mask is None else self.mask & valid
+                if variables_nodata is None:
+                    variables_nodata = var_nodata
+
+        if self.nodata is None:
+            self.nodata = variables_nodata if variables_nodata is not None else -9999.0
 
     def __get_geographical_parameters__(self):
         int_bounds = self.config[self.methodology]["interpolation_bounds"]
@@ -279,7 +475,7 @@ class PyMica:
             int((int_bounds[2] - int_bounds[0]) / res),
         ]
 
-    def __get_regression_results__(self, clusters, data):
+    def __get_regression__(self, clusters, data):
         if isinstance(clusters, dict):
             cl_reg = ClusteredRegression(
                 data,
@@ -291,21 +487,34 @@ class PyMica:
             )
 
             d_s = gdal.Open(clusters["mask_files"][cluster_file_index])
-            mask = d_s.ReadAsArray()
+            clusters_mask = d_s.ReadAsArray()
             d_s = None
-
-            out_data = cl_reg.apply_clustered_regression(
-                self.variables, list(self.variables_files.keys()), mask
-            )
         else:
             cl_reg = MultiRegressionSigma(
                 data, x_vars=list(self.variables_files.keys())
             )
-            out_data = cl_reg.apply_regression(
-                self.variables, list(self.variables_files.keys())
-            )
+            clusters_mask = None
+
+        return cl_reg, clusters_mask
 
-        return cl_reg, out_data
+    def __apply_regression__(self, regression, rows: slice) -> np.array:
+        cl_reg, clusters_mask = regression
+        mask = None if self.mask is None else self.mask[rows]
+
+        if clusters_mask is not None:
+            return cl_reg.apply_clustered_regression(
+                self.variables[:, rows],
+                list(self.variables_files.keys()),
+                clusters_mask[:, rows],
+                valid_mask=mask,
+                nodata=self.nodata,
+            )
+        return cl_reg.apply_regression(
+            self.variables[:, rows],
+            list(self.variables_files.keys()),
+            mask=mask,
+            nodata=self.nodata,
+        )
 
     def interpolate(self, input_data: list) -> np.array:
         """Apply the interpolation methodology to input data.
@@ -319,69 +528,325 @@ class PyMica:
         """
         data = self.__input_data__(input_data)
 
+        regression = None
+        if self.methodology in ["mlr", "mlr+id2d", "mlr+id3d", "mlr+knn2d"]:
+            regression = self.__get_regression__(
+                self.config[self.methodology]["clusters"], data
+            )
+
+        field = self.__interpolate_rows__(data, regression, 0, self.field_size[0])
+
+        self.field = field
+
+        return field
+
+    def interpolate_to_file(
+        self, input_data: list, file_name: str, strip_rows: int = 256
+    ) -> None:
+        """Apply the interpolation methodology to input data and write the result
+        into a raster file strip by strip, as each strip of rows is computed. Only
+        a strip of the field is held in memory, so `field` is not set.
+
+        The fft `id_engine` convolves the whole grid at once, so with it the field
+        is computed once, as in :meth:`interpolate`, and then written by strips.
+
+        Args:
+            input_data (list): Input data as list of dictionaries with keys including
+                at least {'id', 'lat', 'lon', 'value'}.
+            file_name (str): Output file path.
+            strip_rows (int, optional): Rows computed at once, rounded down to a
+                multiple of the file block height. Defaults to 256.
+        """
+        data = self.__input_data__(input_data)
+
+        regression = None
+        if self.methodology in ["mlr", "mlr+id2d", "mlr+id3d", "mlr+knn2d"]:
+            regression = self.__get_regression__(
+                self.config[self.methodology]["clusters"], data
+            )
+
+        d_s = self.__create_file__(file_name)
+        band = d_s.GetRasterBand(1)
+
+        block_rows = band.GetBlockSize()[1]
+        strip_rows = max(block_rows, strip_rows // block_rows * block_rows)
+        strip = np.empty((strip_rows, self.field_size[1]), dtype=np.float32)
+
+        full_field = None
+        if self.methodology in ["id2d", "mlr+id2d"] and self.id_engine == "fft":
+            full_field = self.__interpolate_rows__(
+                data, regression, 0, self.field_size[0]
+            )
+
+        for row0 in range(0, self.field_size[0], strip_rows):
+            rows = min(strip_rows, self.field_size[0] - row0)
+            if full_field is None:
+                field = self.__interpolate_rows__(
+                    data, regression, row0, rows, out=strip[:rows]
+                )
+            else:
+                field = full_field[row0 : row0 + rows]
+            band.WriteArray(field, 0, row0)
+
+        band = None
+        d_s = None
+
+    def __interpolate_rows__(
+        self, data: list, regression, row0: int, rows: int, out: np.array = None
+    ) -> np.array:
+        """Interpolate the rows [row0, row0 + rows) of the field.
+
+        Args:
+            data (list): Input data as returned by __input_data__.
+            regression (tuple): The regression and the clusters mask as returned by
+                __get_regression__, None if no regression is used.
+            row0 (int): First row.
+            rows (int): Number of rows.
+            out (np.array, optional): C-contiguous float32 or float64 array with
+                shape (rows, cols) where the field is written. Defaults to None.
+
+        Returns:
+            np.array: The interpolated rows, `out` if it was provided.
+        """
+        size = [rows, self.field_size[1]]
+        geotransform = list(self.field_geotransform)
+        geotransform[3] += row0 * geotransform[5]
+        rows_slice = slice(row0, row0 + rows)
+        mask = None if self.mask is None else self.mask[rows_slice]
+
+        if self.methodology in ["id3d", "mlr+id3d"]:
+            dem = self.variables[list(self.variables_files.keys()).index("altitude")]
+            dem = dem[rows_slice]
+
         if self.methodology == "id2d":
-            field = inverse_distance(
-                data,
-                self.field_size,
-                list(self.field_geotransform),
-                self.power,
-                self.smoothing,
+            x_pos, y_pos, values = station_arrays(data, ("x", "y", "value"))
+            return self.__id2d_field__(
+                x_pos, y_pos, values, size, geotransform, mask, out
             )
-        elif self.methodology == "id3d":
-            field = inverse_distance_3d(
-                data,
-                list(self.field_size),
-                list(self.field_geotransform),
-                self.variables[list(self.variables_files.keys()).index("altitude")],
-                self.power,
-                self.smoothing,
-                self.penalization,
+        if self.methodology == "knn2d":
+            x_pos, y_pos, values = station_arrays(data, ("x", "y", "value"))
+            return self.__knn2d_field__(
+                x_pos, y_pos, values, size, geotransform, mask, out
             )
-        elif self.methodology in ["mlr", "mlr+id2d", "mlr+id3d"]:
-            regression, field = self.__get_regression_results__(
-                self.config[self.methodology]["clusters"], data
+        if self.methodology == "id3d":
+            x_pos, y_pos, z_pos, values = station_arrays(
+                data, ("x", "y", "altitude", "value")
             )
+            return self.__id3d_field__(
+                x_pos, y_pos, z_pos, values, size, geotransform, dem, mask, out
+            )
+
+        field = self.__apply_regression__(regression, rows_slice)
 
-        if self.methodology in ["mlr+id2d", "mlr+id3d"]:
-            residues = regression.get_residuals()
-
-            res_interp = []
-            for stat in data:
-                if stat["id"] in residues.keys():
-                    res = {
-                        "id": stat["id"],
-                        "x": stat["x"],
-                        "y": stat["y"],
-                        "value": residues[stat["id"]],
-                    }
-                    if self.methodology == "mlr+id3d":
-                        res["altitude"] = stat["altitude"]
-                    res_interp.append(res)
+        if self.methodology in ["mlr+id2d", "mlr+id3d", "mlr+knn2d"]:
+            residues = regression[0].get_residuals()
+
+            stations = [stat for stat in data if stat["id"] in residues]
+            res_values = np.array([residues[stat["id"]] for stat in stations])
+            res_field = np.empty(size)
 
             if self.methodology == "mlr+id2d":
-                res_field = inverse_distance(
-                    res_interp,
-                    list(self.field_size),
-                    list(self.field_geotransform),
-                    self.power,
-                    self.smoothing,
+                x_pos, y_pos = station_arrays(stations, ("x", "y"))
+                res_field = self.__id2d_field__(
+                    x_pos, y_pos, res_values, size, geotransform, mask, res_field
+                )
+            elif self.methodology == "mlr+knn2d":
+                x_pos, y_pos = station_arrays(stations, ("x", "y"))
+                res_field = self.__knn2d_field__(
+                    x_pos, y_pos, res_values, size, geotransform, mask, res_field
                 )
             elif self.methodology == "mlr+id3d":
-                res_field = inverse_distance_3d(
-                    res_interp,
-                    list(self.field_size),
-                    list(self.field_geotransform),
-                    self.variables[list(self.variables_files.keys()).index("altitude")],
-                    self.power,
-                    self.smoothing,
-                    self.penalization,
+                x_pos, y_pos, z_pos = station_arrays(stations, ("x", "y", "altitude"))
+                res_field = self.__id3d_field__(
+                    x_pos,
+                    y_pos,
+                    z_pos,
+                    res_values,
+                    size,
+                    geotransform,
+                    dem,
+                    mask,
+                    res_field,
                 )
 
-            field = field - res_field
+            if mask is None:
+                field -= res_field
+            else:
+                np.subtract(field, res_field, out=field, where=mask)
+
+        if out is None:
+            return field
+        out[...] = field
+        return out
+
+    def __id2d_field__(
+        self, x_pos, y_pos, values, size, geotransform, mask, out
+    ) -> np.array:
+        """Inverse of the distance 2D field with the configured `id_engine`. With
+        the fft engine and `id_fft_error_step` greater than 0, its error against
+        the exact method is measured and kept in `fft_error`."""
+        if self.id_engine == "tree":
+            return inverse_distance_tree_arrays(
+                x_pos,
+                y_pos,
+                values,
+                size,
+                geotransform,
+                self.power,
+                self.smoothing,
+                self.tree_theta,
+                num_threads=self.num_threads,
+                out=out,
+                mask=mask,
+                nodata=self.nodata,
+            )
+        if self.id_engine == "exact" and self.adaptive_factor > 1:
+            return inverse_distance_adaptive_arrays(
+                x_pos,
+                y_pos,
+                values,
+                size,
+                geotransform,
+                self.power,
+                self.smoothing,
+                self.adaptive_factor,
+                self.adaptive_tolerance,
+                self.num_threads,
+                self.k_nearest,
+                self.max_radius,
+                out=out,
+                mask=mask,
+                nodata=self.nodata,
+                precision=self.precision,
+            )
+        if self.id_engine == "exact":
+            return inverse_distance_arrays(
+                x_pos,
+                y_pos,
+                values,
+                size,
+                geotransform,
+                self.power,
+                self.smoothing,
+                self.num_threads,
+                self.k_nearest,
+                self.max_radius,
+                out=out,
+                mask=mask,
+                nodata=self.nodata,
+                precision=self.precision,
+            )
+
+        field = inverse_distance_fft_arrays(
+            x_pos,
+            y_pos,
+            values,
+            size,
+            geotransform,
+            self.power,
+            self.smoothing,
+            self.max_radius,
+        )
+        if self.fft_error_step > 0:
+            self.fft_error = inverse_distance_fft_error(
+                x_pos,
+                y_pos,
+                values,
+                size,
+                geotransform,
+                self.power,
+                self.smoothing,
+                self.max_radius,
+                step=self.fft_error_step,
+                field=field,
+            )
 
-        self.field = field
+        if mask is not None:
+            field[~mask] = self.nodata
+        if out is None:
+            return field
+        out[...] = field
+        return out
+
+    def __knn2d_field__(
+        self, x_pos, y_pos, values, size, geotransform, mask, out
+    ) -> np.array:
+        """Inverse of the distance 2D field from the `num_nearest` stations of
+        each pixel, searched in a k-d tree."""
+        return inverse_distance_knn_arrays(
+            x_pos,
+            y_pos,
+            values,
+            size,
+            geotransform,
+            self.num_nearest,
+            self.power,
+            self.smoothing,
+            self.num_threads,
+            out=out,
+            mask=mask,
+            nodata=self.nodata,
+        )
 
-        return field
+    def __id3d_field__(
+        self, x_pos, y_pos, z_pos, values, size, geotransform, dem, mask, out
+    ) -> np.array:
+        """Inverse of the distance 3D field with the configured `id_engine`. With
+        `id_k_nearest`, the exact engine uses the k-d tree nearest stations.
+        """
+        if self.id_engine == "tree":
+            return inverse_distance_tree_arrays(
+                x_pos,
+                y_pos,
+                values,
+                size,
+                geotransform,
+                self.power,
+                self.smoothing,
+                self.tree_theta,
+                zpos=z_pos,
+                dem=dem,
+                penalization=self.penalization,
+                num_threads=self.num_threads,
+                out=out,
+                mask=mask,
+                nodata=self.nodata,
+            )
+        if self.k_nearest > 0:
+            return inverse_distance_3d_knn_arrays(
+                x_pos,
+                y_pos,
+                z_pos,
+                values,
+                size,
+                geotransform,
+                dem,
+                self.k_nearest,
+                self.power,
+                self.smoothing,
+                self.penalization,
+                self.num_threads,
+                out=out,
+                mask=mask,
+                nodata=self.nodata,
+            )
+        return inverse_distance_3d_arrays(
+            x_pos,
+            y_pos,
+            z_pos,
+            values,
+            size,
+            geotransform,
+            dem,
+            self.power,
+            self.smoothing,
+            self.penalization,
+            out=out,
+            mask=mask,
+            nodata=self.nodata,
+            precision=self.precision,
+            num_threads=self.num_threads,
+        )
 
     def save_file(self, file_name: str) -> None:
         """Save the interpolated field into a raster file.
@@ -389,6 +854,21 @@ class PyMica:
         Args:
             file_name (str): Output file path.
         """
+        d_s = self.__create_file__(file_name)
+
+        d_s.GetRasterBand(1).WriteArray(self.field)
+
+        d_s = None
+
+    def __create_file__(self, file_name: str):
+        """Create a float32 raster file with the properties of the field.
+
+        Args:
+            file_name (str): Output file path.
+
+        Returns:
+            gdal.Dataset: The new dataset.
+        """
         driver = gdal.GetDriverByName("GTiff")
         d_s = driver.Create(
             file_name, self.field_size[1], self.field_size[0], 1, gdal.GDT_Float32
@@ -396,6 +876,7 @@ class PyMica:
         d_s.SetGeoTransform(self.field_geotransform)
         d_s.SetProjection(self.field_proj.ExportToWkt())
 
-        d_s.GetRasterBand(1).WriteArray(self.field)
+        if self.mask is not None:
+            d_s.GetRasterBand(1).SetNoDataValue(self.nodata)
 
-        d_s = None
+        return d_s
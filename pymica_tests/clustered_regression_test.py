@@ -103,3 +103,11 @@ class TestClusteredRegression(unittest.TestCase):
 
         result = inst.apply_clustered_regression(in_data, ["altitude", "dist"], mask)
         self.assertEqual(list(result.shape), size)
+
+        valid_mask = np.zeros(size, dtype=bool)
+        valid_mask[100:900, 200:300] = True
+        masked = inst.apply_clustered_regression(
+            in_data, ["altitude", "dist"], mask, valid_mask=valid_mask, nodata=-9999
+        )
+        self.assertTrue(np.allclose(masked[valid_mask], result[valid_mask]))
+        self.assertTrue((masked[~valid_mask] == -9999).all())
@@ -1,11 +1,13 @@
 """Tests for inverse distance weighting method."""
 
+import os
+import tempfile
 import unittest
 from datetime import datetime
 
-from numpy import array
+from numpy import array, array_equal, empty, memmap
 
-from pymica.methods.idw import idw
+from pymica.methods.idw import _read_cache, idw
 
 
 class TestInverseDistanceWeighting(unittest.TestCase):
@@ -43,3 +45,72 @@ class TestInverseDistanceWeighting(unittest.TestCase):
         self.assertAlmostEqual(result[0][size[1] - 1], 2, places=2)
         self.assertAlmostEqual(result[size[0] - 1][0], 0, places=2)
         self.assertAlmostEqual(result[500][500], 1, places=2)
+
+    def test_inverse_distance_weighting_chunks(self):
+        """Test inverse distance weighting by chunks and into an output array"""
+        residues = {
+            str(i): {"value": i % 7, "y": (i * 0.37) % 2, "x": (i * 0.61) % 2}
+            for i in range(40)
+        }
+        geotransform = [0, 0.05, 0, 2, 0, -0.05]
+        size = [41, 37]
+        expected = idw(residues, size, geotransform, 4)
+
+        out = empty(size)
+        result = idw(
+            residues, size, geotransform, 4, workers=2, chunk_size=100, out=out
+        )
+        self.assertIs(result, out)
+        self.assertTrue(array_equal(result, expected))
+
+        result = idw(residues, size, geotransform, 1, chunk_size=1)
+        self.assertEqual(result.shape, (41, 37))
+
+        with self.assertRaises(ValueError):
+            idw(residues, size, geotransform, out=empty((41, 36)))
+
+    def test_inverse_distance_weighting_cache(self):
+        """Test inverse distance weighting with the neighbours cache"""
+        residues = {
+            str(i): {"value": i % 7, "y": (i * 0.37) % 2, "x": (i * 0.61) % 2}
+            for i in range(40)
+        }
+        geotransform = [0, 0.05, 0, 2, 0, -0.05]
+        size = [41, 37]
+        expected = idw(residues, size, geotransform, 4)
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            # The first call writes the cache, the second one reads it
+            for _ in range(2):
+                result = idw(
+                    residues, size, geotransform, 4, chunk_size=100, cache_dir=cache_dir
+                )
+                self.assertTrue(array_equal(result, expected))
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+            # Read by chunks from a memory map
+            cache_file = os.path.join(cache_dir, os.listdir(cache_dir)[0])
+            neighbours = _read_cache(cache_file, 41 * 37, 4)
+            self.assertIsInstance(neighbours, memmap)
+            self.assertIsNone(_read_cache(cache_file, 41 * 37, 5))
+            del neighbours
+
+            # The same network with new values uses the cache
+            for residue in residues.values():
+                residue["value"] *= 2
+            result = idw(residues, size, geotransform, 4, cache_dir=cache_dir)
+            self.assertTrue(array_equal(result, 2 * expected))
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+            # A new network does not
+            residues["0"]["x"] = 1.5
+            expected = idw(residues, size, geotransform, 4)
+            result = idw(residues, size, geotransform, 4, cache_dir=cache_dir)
+            self.assertTrue(array_equal(result, expected))
+            self.assertEqual(len(os.listdir(cache_dir)), 2)
+
+            # A broken cache file is written again
+            for file_name in os.listdir(cache_dir):
+                with open(os.path.join(cache_dir, file_name), "wb") as f_p:
+                    f_p.write(b"broken")
+            result = idw(residues, size, geotransform, 4, cache_dir=cache_dir)
+            self.assertTrue(array_equal(result, expected))
@@ -0,0 +1,133 @@
+"""Tests for the incremental inverse of the distance field."""
+
+import unittest
+
+import numpy as np
+
+# pylint: disable=E0611
+from pymica.methods.incremental_inverse_distance import IncrementalInverseDistance
+from pymica.methods.inverse_distance import inverse_distance
+from pymica.methods.inverse_distance_3d import inverse_distance_3d
+
+
+class TestIncrementalInverseDistance(unittest.TestCase):
+    """Test the incremental inverse of the distance field"""
+
+    residues = [
+        {"id": "AA", "value": 0, "altitude": 1, "y": 0, "x": 0},
+        {"id": "BB", "value": 1, "altitude": 0, "y": 1, "x": 1},
+        {"id": "CC", "value": 2, "altitude": 0, "y": 2, "x": 2},
+        {"id": "DD", "value": 5, "altitude": 2, "y": 0.3, "x": 1.7},
+    ]
+    geotransform = [0, 0.5, 0, 2, 0, -0.5]
+    size = [5, 5]
+
+    def test_incremental(self):
+        """Test adding, correcting and removing stations"""
+        state = IncrementalInverseDistance(self.size, self.geotransform, power=4)
+        state.add_stations(self.residues[:3])
+        np.testing.assert_allclose(
+            state.field,
+            inverse_distance(self.residues[:3], self.size, self.geotransform, 4),
+            rtol=1e-12,
+        )
+
+        state.add_station("DD", 1.7, 0.3, 5)
+        state.update_station("BB", 3)
+        residues = [dict(point) for point in self.residues]
+        residues[1]["value"] = 3
+        np.testing.assert_allclose(
+            state.field,
+            inverse_distance(residues, self.size, self.geotransform, 4),
+            rtol=1e-12,
+        )
+        self.assertEqual(state.field[2][2], 3)
+
+        state.remove_station("BB")
+        np.testing.assert_allclose(
+            state.field,
+            inverse_distance(
+                [residues[0]] + residues[2:], self.size, self.geotransform, 4
+            ),
+            rtol=1e-12,
+        )
+        self.assertNotIn((2, 2), state.coincident)
+
+        state.rebuild()
+        np.testing.assert_allclose(
+            state.field,
+            inverse_distance(
+                [residues[0]] + residues[2:], self.size, self.geotransform, 4
+            ),
+            rtol=1e-12,
+        )
+
+        with self.assertRaises(KeyError):
+            state.add_station("AA", 0, 0, 0)
+        with self.assertRaises(KeyError):
+            state.remove_station("BB")
+
+    def test_remove_all(self):
+        """Test removing all the stations leaves an empty field"""
+        rng = np.random.default_rng(7)
+        for num_stations in [2, 31]:
+            state = IncrementalInverseDistance(self.size, self.geotransform)
+            for i in range(num_stations):
+                state.add_station(
+                    i, rng.uniform(-1, 3), rng.uniform(-1, 3), rng.uniform(0, 100)
+                )
+            for i in range(num_stations):
+                state.remove_station(i)
+            self.assertTrue((state.denominator == 0).all())
+            self.assertTrue((state.field == 0).all())
+            self.assertEqual(state.coincident, {})
+
+    def test_remove_near_station(self):
+        """Test removing a station very close to a pixel"""
+        residues = [dict(point) for point in self.residues]
+        residues.append({"id": "EE", "value": 100, "y": 1.0001, "x": 0.5})
+        state = IncrementalInverseDistance(self.size, self.geotransform)
+        state.add_stations(residues)
+        state.remove_station("EE")
+
+        np.testing.assert_allclose(
+            state.field,
+            inverse_distance(residues[:4], self.size, self.geotransform),
+            rtol=1e-12,
+        )
+
+    def test_update_many_times(self):
+        """Test many updates of a station dominating a pixel do not drift"""
+        residues = [dict(point) for point in self.residues]
+        residues.append({"id": "EE", "value": 100, "y": 1.0001, "x": 0.5})
+        state = IncrementalInverseDistance(self.size, self.geotransform)
+        state.add_stations(residues)
+        for value in np.random.default_rng(3).uniform(-100, 100, 100000):
+            state.update_station("EE", value)
+        state.update_station("EE", 1.0)
+
+        field = state.field
+        state.rebuild()
+        np.testing.assert_allclose(field, state.field, rtol=0, atol=5e-13)
+
+    def test_incremental_3d(self):
+        """Test the incremental field with a DEM"""
+        dem = np.random.default_rng(4).uniform(0, 2, self.size)
+        state = IncrementalInverseDistance(
+            self.size, self.geotransform, dem=dem, penalization=2
+        )
+        state.add_stations(self.residues)
+        state.update_station("CC", -1)
+
+        residues = [dict(point) for point in self.residues]
+        residues[2]["value"] = -1
+        np.testing.assert_allclose(
+            state.field,
+            inverse_distance_3d(
+                residues, self.size, self.geotransform, dem, penalization=2
+            ),
+            rtol=1e-6,
+        )
+
+        with self.assertRaises(ValueError):
+            state.add_station("EE", 0.5, 0.5, 1)
@@ -3,10 +3,13 @@
 import unittest
 from datetime import datetime
 
-from numpy import array, zeros
+from numpy import array, array_equal, empty, float32, float64, int16, random, zeros
 
 # pylint: disable=E0611
-from pymica.methods.inverse_distance_3d import inverse_distance_3d
+from pymica.methods.inverse_distance_3d import (
+    inverse_distance_3d,
+    inverse_distance_3d_arrays,
+)
 
 
 class TestInverseDistance3D(unittest.TestCase):
@@ -121,3 +124,234 @@ class TestInverseDistance3D(unittest.TestCase):
         self.assertAlmostEqual(result[int(size[0] / 2)][int(size[1] / 2)], 1, 5)
         self.assertAlmostEqual(result[0][0], 0.013, 3)
         self.assertAlmostEqual(result[size[0] - 1][size[1] - 1], 0.013, 3)
+
+    def test_inverse_distance_3d_num_threads(self):
+        """Test inverse of the distance 3D parallel rows match the serial ones"""
+        rng = random.default_rng(0)
+        residues = [
+            {"id": str(i), "value": v, "x": x, "y": y, "altitude": 100 * z}
+            for i, (x, y, v, z) in enumerate(rng.uniform(0, 2, (50, 4)))
+        ]
+        residues.append(
+            {"id": "on_pixel", "value": 5.0, "x": 1.0, "y": 1.0, "altitude": 0}
+        )
+        geotransform = [0, 0.01, 0, 2, 0, -0.01]
+        size = [200, 200]
+        dem = rng.uniform(0, 200, size).astype(float32)
+
+        for precision in ["float64", "float32"]:
+            serial = inverse_distance_3d(
+                residues, size, geotransform, dem, precision=precision
+            )
+            parallel = inverse_distance_3d(
+                residues,
+                size,
+                geotransform,
+                dem,
+                precision=precision,
+                num_threads=4,
+            )
+            all_cores = inverse_distance_3d(
+                residues,
+                size,
+                geotransform,
+                dem,
+                precision=precision,
+                num_threads=0,
+            )
+
+            self.assertTrue(array_equal(serial, parallel))
+            self.assertTrue(array_equal(serial, all_cores))
+            self.assertEqual(parallel[100][100], 5.0)
+
+        with self.assertRaises(ValueError):
+            inverse_distance_3d(residues, size, geotransform, dem[:-1])
+
+    def test_inverse_distance_3d_arrays(self):
+        """Test inverse of the distance 3D with columnar input"""
+        expected = inverse_distance_3d(
+            self.residues, self.size, self.geotransform, self.dem
+        )
+
+        result = inverse_distance_3d_arrays(
+            array([0.0, 1.0, 2.0]),
+            array([0.0, 1.0, 2.0]),
+            array([1.0, 0.0, 0.0]),
+            array([0.0, 1.0, 2.0]),
+            self.size,
+            self.geotransform,
+            self.dem,
+        )
+        self.assertTrue(array_equal(result, expected))
+
+        structured = array(
+            [(0, 0, 1, 0), (1, 1, 0, 1), (2, 2, 0, 2)],
+            dtype=[("x", "f8"), ("y", "f8"), ("altitude", "i2"), ("value", "f8")],
+        )
+        result = inverse_distance_3d(structured, self.size, self.geotransform, self.dem)
+        self.assertTrue(array_equal(result, expected))
+
+    def test_inverse_distance_3d_out(self):
+        """Test inverse of the distance 3D written into an output buffer"""
+        expected = inverse_distance_3d(
+            self.residues, self.size, self.geotransform, self.dem
+        )
+
+        out = empty(self.size, dtype=float32)
+        result = inverse_distance_3d(
+            self.residues, self.size, self.geotransform, self.dem, out=out
+        )
+        self.assertIs(result, out)
+        self.assertTrue(array_equal(out, expected.astype(float32)))
+
+        with self.assertRaises(ValueError):
+            inverse_distance_3d(
+                self.residues, self.size, self.geotransform, self.dem, out=empty(25)
+            )
+
+    def test_inverse_distance_3d_mask(self):
+        """Test inverse of the distance 3D skipping the masked pixels"""
+        expected = inverse_distance_3d(
+            self.residues, self.size, self.geotransform, self.dem
+        )
+
+        mask = zeros(self.size, dtype=bool)
+        mask[1:4, 0:3] = True
+        result = inverse_distance_3d(
+            self.residues,
+            self.size,
+            self.geotransform,
+            self.dem,
+            mask=mask,
+            nodata=-9999,
+        )
+        self.assertTrue(array_equal(result[mask], expected[mask]))
+        self.assertTrue((result[~mask] == -9999).all())
+
+        with self.assertRaises(ValueError):
+            inverse_distance_3d(
+                self.residues, self.size, self.geotransform, self.dem, mask=zeros(25)
+            )
+
+    def test_inverse_distance_3d_real_power(self):
+        """Test inverse of the distance 3D with real powers and smoothing"""
+        x_pos, y_pos, z_pos, values = (
+            array([point[key] for point in self.residues])
+            for key in ("x", "y", "altitude", "value")
+        )
+
+        for power in [1, 1.5, 2.5, 3, 1.7]:
+            result = inverse_distance_3d(
+                self.residues,
+                self.size,
+                self.geotransform,
+                self.dem,
+                power=power,
+                smoothing=0.5,
+                penalization=2.5,
+            )
+            for j, i in [(0, 1), (3, 3), (4, 1)]:
+                x = self.geotransform[0] + i * self.geotransform[1]
+                y = self.geotransform[3] + j * self.geotransform[5]
+                dist_sq = (
+                    (x - x_pos) ** 2
+                    + (y - y_pos) ** 2
+                    + (2.5 * (self.dem[j][i] - z_pos)) ** 2
+                    + 0.25
+                )
+                weights = 1.0 / dist_sq ** (power / 2)
+                expected = (weights * values).sum() / weights.sum()
+                self.assertAlmostEqual(result[j][i], expected, 6)
+
+    def test_inverse_distance_3d_float32(self):
+        """Test inverse of the distance 3D with float32 weights"""
+        rng = random.default_rng(7)
+        x_pos = 400000 + rng.uniform(0, 20000, 300)
+        y_pos = 4600000 - rng.uniform(0, 20000, 300)
+        z_pos = rng.uniform(0, 1500, 300)
+        values = rng.uniform(0, 10, 300)
+        geotransform = [400000, 250, 0, 4600000, 0, -250]
+        size = [70, 90]
+        dem = rng.uniform(0, 1500, size)
+        # One station on top of a pixel
+        x_pos[0] = 400000 + 250 * 41
+        y_pos[0] = 4600000 - 250 * 13
+        mask = rng.uniform(size=size) > 0.2
+
+        for power in [2, 2.5, 3, 1.7]:
+            expected = inverse_distance_3d_arrays(
+                x_pos, y_pos, z_pos, values, size, geotransform, dem, power, 10
+            )
+            result = inverse_distance_3d_arrays(
+                x_pos,
+                y_pos,
+                z_pos,
+                values,
+                size,
+                geotransform,
+                dem,
+                power,
+                10,
+                precision="float32",
+            )
+            self.assertLess(abs(result - expected).max(), 1e-4)
+            self.assertEqual(result[13][41], values[0])
+
+        result = inverse_distance_3d_arrays(
+            x_pos,
+            y_pos,
+            z_pos,
+            values,
+            size,
+            geotransform,
+            dem,
+            out=empty(size, dtype=float32),
+            mask=mask,
+            nodata=-9999,
+            precision="float32",
+        )
+        self.assertTrue((result[~mask] == -9999).all())
+
+        with self.assertRaises(ValueError):
+            inverse_distance_3d(
+                self.residues,
+                self.size,
+                self.geotransform,
+                self.dem,
+                precision="float16",
+            )
+
+    def test_inverse_distance_3d_dem_dtypes(self):
+        """Test inverse of the distance 3D with int16 and float32 DEMs"""
+        rng = random.default_rng(11)
+        x_pos = rng.uniform(0, 20000, 50)
+        y_pos = rng.uniform(0, 20000, 50)
+        z_pos = rng.uniform(0, 1500, 50)
+        values = rng.uniform(0, 10, 50)
+        geotransform = [0, 250, 0, 20000, 0, -250]
+        size = [60, 70]
+        dem = rng.integers(0, 1500, size).astype(int16)
+
+        for precision in ["float64", "float32"]:
+            expected = inverse_distance_3d_arrays(
+                x_pos,
+                y_pos,
+                z_pos,
+                values,
+                size,
+                geotransform,
+                dem.astype(float64),
+                precision=precision,
+            )
+            for dem_dtype in [int16, float32]:
+                result = inverse_distance_3d_arrays(
+                    x_pos,
+                    y_pos,
+                    z_pos,
+                    values,
+                    size,
+                    geotransform,
+                    dem.astype(dem_dtype),
+                    precision=precision,
+                )
+                self.assertTrue(array_equal(result, expected))
@@ -0,0 +1,129 @@
+"""Tests for the coarse to fine inverse of the distance"""
+
+import unittest
+
+from numpy import abs as np_abs
+from numpy import array_equal, empty, float32, full, random
+
+# pylint: disable=E0611
+from pymica.methods.inverse_distance import inverse_distance_arrays
+from pymica.methods.inverse_distance_adaptive import (
+    inverse_distance_adaptive,
+    inverse_distance_adaptive_arrays,
+    fill_pixels,
+)
+
+
+class TestInverseDistanceAdaptive(unittest.TestCase):
+    """Test the coarse to fine inverse of the distance"""
+
+    rng = random.default_rng(1)
+    x_pos = rng.uniform(0, 20000, 40)
+    y_pos = rng.uniform(0, 20000, 40)
+    values = rng.normal(0, 1, 40)
+    geotransform = [0, 100, 0, 20000, 0, -100]
+    size = [203, 197]
+    # One station on top of the pixel (31, 52)
+    x_pos[0] = 5200
+    y_pos[0] = 16900
+
+    def test_inverse_distance_adaptive(self):
+        """Test the coarse to fine field against the exact one"""
+        expected = inverse_distance_arrays(
+            self.x_pos, self.y_pos, self.values, self.size, self.geotransform, 2.5
+        )
+
+        for factor in [4, 8, 16]:
+            result = inverse_distance_adaptive_arrays(
+                self.x_pos,
+                self.y_pos,
+                self.values,
+                self.size,
+                self.geotransform,
+                2.5,
+                factor=factor,
+                tolerance=0.05,
+            )
+            self.assertLess(np_abs(result - expected).max(), 0.05)
+            self.assertEqual(result[31][52], self.values[0])
+
+            result = inverse_distance_adaptive_arrays(
+                self.x_pos,
+                self.y_pos,
+                self.values,
+                self.size,
+                self.geotransform,
+                2.5,
+                factor=factor,
+                tolerance=0,
+            )
+            self.assertLess(np_abs(result - expected).max(), 1e-12)
+
+        result = inverse_distance_adaptive_arrays(
+            self.x_pos,
+            self.y_pos,
+            self.values,
+            self.size,
+            self.geotransform,
+            2.5,
+            factor=1,
+        )
+        self.assertTrue(array_equal(result, expected))
+
+    def test_inverse_distance_adaptive_mask(self):
+        """Test the coarse to fine field with a mask and an output buffer"""
+        data = [
+            {"x": x, "y": y, "value": value}
+            for x, y, value in zip(self.x_pos, self.y_pos, self.values)
+        ]
+        mask = self.rng.uniform(size=self.size) > 0.3
+        expected = inverse_distance_adaptive(
+            data, self.size, self.geotransform, factor=8, tolerance=0.05
+        )
+
+        out = empty(self.size, dtype=float32)
+        result = inverse_distance_adaptive(
+            data,
+            self.size,
+            self.geotransform,
+            factor=8,
+            tolerance=0.05,
+            out=out,
+            mask=mask,
+            nodata=-9999,
+        )
+        self.assertIs(result, out)
+        self.assertTrue((result[~mask] == -9999).all())
+        self.assertLess(np_abs(result[mask] - expected[mask]).max(), 1e-6)
+
+        with self.assertRaises(ValueError):
+            inverse_distance_adaptive(data, self.size, self.geotransform, factor=0)
+        with self.assertRaises(ValueError):
+            inverse_distance_adaptive(
+                data, self.size, self.geotransform, mask=mask[:-1]
+            )
+
+    def test_fill_pixels(self):
+        """Test that only the chosen pixels are computed, strip by strip"""
+        expected = inverse_distance_arrays(
+            self.x_pos, self.y_pos, self.values, self.size, self.geotransform, 2.5
+        )
+
+        def kernel(field_size, field_geotransform, field_out, field_mask):
+            return inverse_distance_arrays(
+                self.x_pos,
+                self.y_pos,
+                self.values,
+                field_size,
+                field_geotransform,
+                2.5,
+                out=field_out,
+                mask=field_mask,
+            )
+
+        pixels = self.rng.uniform(size=self.size) > 0.9
+        pixels[:40] = False
+        out = full(self.size, -9999.0)
+        fill_pixels(kernel, out, pixels, self.geotransform, strip_rows=16)
+        self.assertTrue((out[~pixels] == -9999).all())
+        self.assertLess(np_abs(out[pixels] - expected[pixels]).max(), 1e-12)
@@ -0,0 +1,176 @@
+"""Tests for the FFT approximate inverse of the distance."""
+
+import unittest
+from unittest import mock
+
+import numpy as np
+
+# pylint: disable=E0611
+from pymica.methods import inverse_distance_fft as fft_module
+from pymica.methods.inverse_distance import inverse_distance_arrays
+from pymica.methods.inverse_distance_fft import (
+    inverse_distance_fft,
+    inverse_distance_fft_arrays,
+    inverse_distance_fft_error,
+)
+
+
+class TestInverseDistanceFFT(unittest.TestCase):
+    """Test the FFT approximate inverse of the distance"""
+
+    rng = np.random.default_rng(6)
+    x_pos = rng.uniform(-500, 20500, 400)
+    y_pos = rng.uniform(-500, 15500, 400)
+    values = rng.uniform(0, 10, 400)
+    geotransform = [0, 100, 0, 15000, 0, -100]
+    size = [150, 200]
+
+    def test_inverse_distance_fft(self):
+        """Test the approximate field against the exact one"""
+        for power, smoothing in [(2, 0.0), (2.5, 0.0), (2, 300.0)]:
+            field = inverse_distance_fft_arrays(
+                self.x_pos,
+                self.y_pos,
+                self.values,
+                self.size,
+                self.geotransform,
+                power,
+                smoothing,
+            )
+            exact = inverse_distance_arrays(
+                self.x_pos,
+                self.y_pos,
+                self.values,
+                self.size,
+                self.geotransform,
+                power,
+                smoothing,
+            )
+            self.assertEqual(field.shape, (150, 200))
+            self.assertLess(np.abs(field - exact).mean(), 0.05)
+
+    def test_inverse_distance_fft_far_station(self):
+        """Test the stations out of the field"""
+        # Within half the field size from the field
+        x_pos = np.append(self.x_pos, 26000)
+        y_pos = np.append(self.y_pos, -4000)
+        values = np.append(self.values, 100.0)
+        with mock.patch.object(
+            fft_module, "fftconvolve", wraps=fft_module.fftconvolve
+        ) as fftconvolve:
+            field = inverse_distance_fft_arrays(
+                x_pos, y_pos, values, self.size, self.geotransform
+            )
+        # The splatted grid only extends to the stations
+        for call in fftconvolve.call_args_list:
+            self.assertLessEqual(call.args[0].shape[0], 200)
+            self.assertLessEqual(call.args[0].shape[1], 270)
+        exact = inverse_distance_arrays(
+            x_pos, y_pos, values, self.size, self.geotransform
+        )
+        self.assertLess(np.abs(field - exact).mean(), 0.05)
+
+        # Farther, only with a radius
+        x_pos[-1] = 5e6
+        with self.assertRaises(ValueError):
+            inverse_distance_fft_arrays(
+                x_pos, y_pos, values, self.size, self.geotransform
+            )
+        field = inverse_distance_fft_arrays(
+            x_pos, y_pos, values, self.size, self.geotransform, max_radius=3000
+        )
+        expected = inverse_distance_fft_arrays(
+            self.x_pos,
+            self.y_pos,
+            self.values,
+            self.size,
+            self.geotransform,
+            max_radius=3000,
+        )
+        self.assertTrue(np.array_equal(field, expected))
+
+    def test_inverse_distance_fft_high_power(self):
+        """Test the pixels far from the stations at a high power"""
+        data = np.array(
+            [(2000, 13000, 1.0), (2500, 12000, 3.0), (19000, 1000, 5.0)],
+            dtype=[("x", "f8"), ("y", "f8"), ("value", "f8")],
+        )
+        field = inverse_distance_fft(data, self.size, self.geotransform, power=8)
+        exact = inverse_distance_arrays(
+            data["x"], data["y"], data["value"], self.size, self.geotransform, 8
+        )
+        self.assertTrue((field > 0).all())
+        self.assertLess(np.abs(field - exact).mean(), 0.05)
+
+    def test_inverse_distance_fft_radius(self):
+        """Test the truncated kernel and the pixels without stations"""
+        data = np.array(
+            [(5000, 10000, 1.0), (5400, 10000, 3.0)],
+            dtype=[("x", "f8"), ("y", "f8"), ("value", "f8")],
+        )
+        field = inverse_distance_fft(
+            data, self.size, self.geotransform, max_radius=2000
+        )
+
+        self.assertAlmostEqual(field[50, 52], 2, 6)
+        self.assertEqual(field[140, 190], 0)
+
+    def test_inverse_distance_fft_out_mask(self):
+        """Test the output buffer and the mask"""
+        mask = np.zeros(self.size, dtype=bool)
+        mask[10:100, 20:120] = True
+        expected = inverse_distance_fft_arrays(
+            self.x_pos, self.y_pos, self.values, self.size, self.geotransform
+        )
+
+        out = np.empty(self.size, dtype=np.float32)
+        result = inverse_distance_fft_arrays(
+            self.x_pos,
+            self.y_pos,
+            self.values,
+            self.size,
+            self.geotransform,
+            out=out,
+            mask=mask,
+            nodata=-9999,
+        )
+        self.assertIs(result, out)
+        self.assertTrue(np.allclose(out[mask], expected[mask], atol=1e-5))
+        self.assertTrue((out[~mask] == -9999).all())
+
+        with self.assertRaises(ValueError):
+            inverse_distance_fft_arrays(
+                self.x_pos,
+                self.y_pos,
+                self.values,
+                self.size,
+                self.geotransform,
+                out=np.empty((4, 5)),
+            )
+
+    def test_inverse_distance_fft_error(self):
+        """Test the error measured against the exact method"""
+        error = inverse_distance_fft_error(
+            self.x_pos,
+            self.y_pos,
+            self.values,
+            self.size,
+            self.geotransform,
+            step=10,
+        )
+
+        field = inverse_distance_fft_arrays(
+            self.x_pos, self.y_pos, self.values, self.size, self.geotransform
+        )
+        exact = inverse_distance_arrays(
+            self.x_pos,
+            self.y_pos,
+            self.values,
+            [15, 20],
+            [0, 1000, 0, 15000, 0, -1000],
+        )
+        errors = np.abs(field[::10, ::10] - exact)
+
+        self.assertAlmostEqual(error["max"], errors.max())
+        self.assertAlmostEqual(error["mean"], errors.mean())
+        self.assertAlmostEqual(error["rmse"], np.sqrt((errors**2).mean()))
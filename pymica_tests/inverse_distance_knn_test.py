@@ -0,0 +1,210 @@
+"""Tests for the k nearest stations inverse of the distance"""
+
+import unittest
+
+from numpy import abs as np_abs
+from numpy import argsort, empty, float32, int16, random
+
+# pylint: disable=E0611
+from pymica.methods.inverse_distance import inverse_distance_arrays
+from pymica.methods.inverse_distance_3d import inverse_distance_3d_arrays
+from pymica.methods.inverse_distance_knn import (
+    inverse_distance_3d_knn,
+    inverse_distance_3d_knn_arrays,
+    inverse_distance_knn,
+    inverse_distance_knn_arrays,
+)
+
+
+class TestInverseDistanceKnn(unittest.TestCase):
+    """Test the k nearest stations inverse of the distance"""
+
+    rng = random.default_rng(5)
+    x_pos = rng.uniform(0, 20000, 60)
+    y_pos = rng.uniform(0, 20000, 60)
+    z_pos = rng.uniform(0, 1500, 60)
+    values = rng.normal(0, 1, 60)
+    geotransform = [0, 250, 0, 20000, 0, -250]
+    size = [83, 79]
+    dem = rng.uniform(0, 1500, size)
+    mask = rng.uniform(size=size) > 0.3
+    # One station on top of the pixel (11, 37)
+    x_pos[0] = 9250
+    y_pos[0] = 17250
+
+    def test_inverse_distance_3d_knn(self):
+        """Test the k nearest stations field against the exact one"""
+        for kwargs in [{}, {"smoothing": 300, "penalization": 5}, {"power": 1.7}]:
+            expected = inverse_distance_3d_arrays(
+                self.x_pos,
+                self.y_pos,
+                self.z_pos,
+                self.values,
+                self.size,
+                self.geotransform,
+                self.dem,
+                **kwargs
+            )
+            # More neighbours than stations uses all of them
+            result = inverse_distance_3d_knn_arrays(
+                self.x_pos,
+                self.y_pos,
+                self.z_pos,
+                self.values,
+                self.size,
+                self.geotransform,
+                self.dem,
+                100,
+                chunk_size=1000,
+                **kwargs
+            )
+            self.assertLess(np_abs(result - expected).max(), 1e-10)
+
+        result = inverse_distance_3d_knn_arrays(
+            self.x_pos,
+            self.y_pos,
+            self.z_pos,
+            self.values,
+            self.size,
+            self.geotransform,
+            self.dem,
+            6,
+            2.5,
+            num_threads=2,
+        )
+        self.assertEqual(result[11][37], self.values[0])
+        for row, col in [(0, 0), (40, 60), (82, 3)]:
+            x_pix = self.geotransform[0] + col * self.geotransform[1]
+            y_pix = self.geotransform[3] + row * self.geotransform[5]
+            dist2 = (
+                (x_pix - self.x_pos) ** 2
+                + (y_pix - self.y_pos) ** 2
+                + (30 * (self.dem[row][col] - self.z_pos)) ** 2
+            )
+            nearest = argsort(dist2)[:6]
+            weights = dist2[nearest] ** -1.25
+            self.assertAlmostEqual(
+                result[row][col],
+                (weights * self.values[nearest]).sum() / weights.sum(),
+                places=10,
+            )
+
+    def test_inverse_distance_3d_knn_dem_dtypes(self):
+        """Test int16 and float32 DEMs against the exact field"""
+        for dem in [self.dem.astype(int16), self.dem.astype(float32)]:
+            # The default integer-valued penalization times an int16 DEM over
+            # 1092 m does not fit in int16
+            expected = inverse_distance_3d_arrays(
+                self.x_pos,
+                self.y_pos,
+                self.z_pos,
+                self.values,
+                self.size,
+                self.geotransform,
+                dem,
+                penalization=30,
+            )
+            result = inverse_distance_3d_knn_arrays(
+                self.x_pos,
+                self.y_pos,
+                self.z_pos,
+                self.values,
+                self.size,
+                self.geotransform,
+                dem,
+                100,
+                penalization=30,
+            )
+            self.assertLess(np_abs(result - expected).max(), 1e-10)
+
+    def test_inverse_distance_3d_knn_mask(self):
+        """Test the k nearest stations field with a mask and an output buffer"""
+        data = [
+            {"x": x, "y": y, "altitude": z, "value": value}
+            for x, y, z, value in zip(self.x_pos, self.y_pos, self.z_pos, self.values)
+        ]
+        expected = inverse_distance_3d_knn(
+            data, self.size, self.geotransform, self.dem, 8
+        )
+
+        out = empty(self.size, dtype=float32)
+        result = inverse_distance_3d_knn(
+            data,
+            self.size,
+            self.geotransform,
+            self.dem,
+            8,
+            out=out,
+            mask=self.mask,
+            nodata=-9999,
+        )
+        self.assertIs(result, out)
+        self.assertTrue((result[~self.mask] == -9999).all())
+        self.assertLess(np_abs(result[self.mask] - expected[self.mask]).max(), 1e-5)
+
+        with self.assertRaises(ValueError):
+            inverse_distance_3d_knn(data, self.size, self.geotransform, self.dem, 0)
+        with self.assertRaises(ValueError):
+            inverse_distance_3d_knn(
+                data, self.size, self.geotransform, self.dem[:-1], 8
+            )
+        with self.assertRaises(ValueError):
+            inverse_distance_3d_knn(
+                data, self.size, self.geotransform, self.dem, 8, mask=self.mask[:-1]
+            )
+
+    def test_inverse_distance_knn(self):
+        """Test the k nearest stations 2D field against the exact one"""
+        for kwargs in [{}, {"smoothing": 300}, {"power": 1.7}]:
+            expected = inverse_distance_arrays(
+                self.x_pos,
+                self.y_pos,
+                self.values,
+                self.size,
+                self.geotransform,
+                **kwargs
+            )
+            result = inverse_distance_knn_arrays(
+                self.x_pos,
+                self.y_pos,
+                self.values,
+                self.size,
+                self.geotransform,
+                100,
+                chunk_size=1000,
+                **kwargs
+            )
+            self.assertLess(np_abs(result - expected).max(), 1e-10)
+
+        data = [
+            {"x": x, "y": y, "value": value}
+            for x, y, value in zip(self.x_pos, self.y_pos, self.values)
+        ]
+        expected = inverse_distance_arrays(
+            self.x_pos,
+            self.y_pos,
+            self.values,
+            self.size,
+            self.geotransform,
+            2.5,
+            k_nearest=6,
+            mask=self.mask,
+            nodata=-9999,
+        )
+        result = inverse_distance_knn(
+            data,
+            self.size,
+            self.geotransform,
+            6,
+            2.5,
+            num_threads=0,
+            mask=self.mask,
+            nodata=-9999,
+        )
+        self.assertLess(np_abs(result - expected).max(), 1e-10)
+
+        result = inverse_distance_knn(data, self.size, self.geotransform, 1)
+        self.assertEqual(result[11][37], self.values[0])
+
+        with self.assertRaises(ValueError):
+            inverse_distance_knn(data, self.size, self.geotransform, 0)
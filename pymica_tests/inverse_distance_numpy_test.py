@@ -0,0 +1,190 @@
+"""Tests for the NumPy inverse of the distance kernels"""
+
+import importlib
+import sys
+import unittest
+from unittest import mock
+
+from numpy import abs as np_abs
+from numpy import empty, float32, random
+
+# pylint: disable=E0611
+from pymica.methods import inverse_distance_fft
+from pymica.methods import inverse_distance_numpy
+from pymica.methods.inverse_distance import inverse_distance_arrays
+from pymica.methods.inverse_distance_3d import inverse_distance_3d_arrays
+
+
+class TestInverseDistanceNumpy(unittest.TestCase):
+    """Test the NumPy kernels against the compiled ones"""
+
+    rng = random.default_rng(3)
+    x_pos = rng.uniform(0, 2, 150)
+    y_pos = rng.uniform(0, 2, 150)
+    z_pos = rng.uniform(0, 3, 150)
+    values = rng.uniform(0, 10, 150)
+    geotransform = [0, 0.05, 0, 2, 0, -0.05]
+    size = [40, 45]
+    dem = rng.uniform(0, 3, size)
+    mask = rng.uniform(size=size) > 0.3
+    # One station on top of the pixel (7, 5)
+    x_pos[0] = 0.25
+    y_pos[0] = 1.65
+
+    def test_inverse_distance_numpy(self):
+        """Test the 2D NumPy kernel parity with the compiled one"""
+        for kwargs in [
+            {},
+            {"smoothing": 0.3},
+            {"power": 1.7},
+            {"power": 2.5, "k_nearest": 8},
+            {"max_radius": 0.3},
+            {"k_nearest": 5, "max_radius": 0.2},
+            {"mask": self.mask, "nodata": -9999},
+            {"out": empty(self.size, dtype=float32)},
+        ]:
+            expected = inverse_distance_arrays(
+                self.x_pos,
+                self.y_pos,
+                self.values,
+                self.size,
+                self.geotransform,
+                **kwargs
+            ).copy()
+            # A small budget to compute the field in many chunks
+            result = inverse_distance_numpy.inverse_distance_arrays(
+                self.x_pos,
+                self.y_pos,
+                self.values,
+                self.size,
+                self.geotransform,
+                memory_budget=100000,
+                **kwargs
+            )
+            self.assertLess(np_abs(result - expected).max(), 1e-6)
+            if not {"smoothing", "mask", "out"} & kwargs.keys():
+                self.assertEqual(result[7][5], self.values[0])
+
+        result = inverse_distance_numpy.inverse_distance_arrays(
+            self.x_pos,
+            self.y_pos,
+            self.values,
+            self.size,
+            self.geotransform,
+            mask=self.mask,
+            nodata=-9999,
+        )
+        self.assertTrue((result[~self.mask] == -9999).all())
+
+        with self.assertRaises(ValueError):
+            inverse_distance_numpy.inverse_distance_arrays(
+                self.x_pos, self.y_pos, self.values[:-1], self.size, self.geotransform
+            )
+
+    def test_inverse_distance_3d_numpy(self):
+        """Test the 3D NumPy kernel parity with the compiled one"""
+        for kwargs in [
+            {},
+            {"smoothing": 0.3, "penalization": 5},
+            {"power": 1.7},
+            {"mask": self.mask, "nodata": -9999},
+        ]:
+            expected = inverse_distance_3d_arrays(
+                self.x_pos,
+                self.y_pos,
+                self.z_pos,
+                self.values,
+                self.size,
+                self.geotransform,
+                self.dem,
+                **kwargs
+            )
+            result = inverse_distance_numpy.inverse_distance_3d_arrays(
+                self.x_pos,
+                self.y_pos,
+                self.z_pos,
+                self.values,
+                self.size,
+                self.geotransform,
+                self.dem,
+                memory_budget=100000,
+                **kwargs
+            )
+            self.assertLess(np_abs(result - expected).max(), 1e-6)
+            if "mask" not in kwargs:
+                self.assertEqual(result[7][5], self.values[0])
+
+        with self.assertRaises(ValueError):
+            inverse_distance_numpy.inverse_distance_3d_arrays(
+                self.x_pos,
+                self.y_pos,
+                self.z_pos,
+                self.values,
+                self.size,
+                self.geotransform,
+                self.dem[:-1],
+            )
+
+    def test_split_stations(self):
+        """Test a budget too small for the stations of a single pixel"""
+        for kwargs in [
+            {},
+            {"power": 1.7, "smoothing": 0.3},
+            {"power": 2.5, "k_nearest": 8},
+            {"k_nearest": 5, "max_radius": 0.2},
+            {"mask": self.mask, "nodata": -9999},
+        ]:
+            expected = inverse_distance_numpy.inverse_distance_arrays(
+                self.x_pos,
+                self.y_pos,
+                self.values,
+                self.size,
+                self.geotransform,
+                **kwargs
+            )
+            # 40 stations of a pixel at a time
+            result = inverse_distance_numpy.inverse_distance_arrays(
+                self.x_pos,
+                self.y_pos,
+                self.values,
+                self.size,
+                self.geotransform,
+                memory_budget=1920,
+                **kwargs
+            )
+            self.assertLess(np_abs(result - expected).max(), 1e-12)
+            if not {"smoothing", "mask"} & kwargs.keys():
+                self.assertEqual(result[7][5], self.values[0])
+
+        expected = inverse_distance_numpy.inverse_distance_3d_arrays(
+            self.x_pos,
+            self.y_pos,
+            self.z_pos,
+            self.values,
+            self.size,
+            self.geotransform,
+            self.dem,
+        )
+        result = inverse_distance_numpy.inverse_distance_3d_arrays(
+            self.x_pos,
+            self.y_pos,
+            self.z_pos,
+            self.values,
+            self.size,
+            self.geotransform,
+            self.dem,
+            memory_budget=1920,
+        )
+        self.assertLess(np_abs(result - expected).max(), 1e-12)
+        self.assertEqual(result[7][5], self.values[0])
+
+    def test_inverse_distance_numpy_fallback(self):
+        """Test the NumPy kernel is used when the compiled one is missing"""
+        with mock.patch.dict(sys.modules, {"pymica.methods.inverse_distance": None}):
+            module = importlib.reload(inverse_distance_fft)
+            self.assertIs(
+                module.inverse_distance_arrays,
+                inverse_distance_numpy.inverse_distance_arrays,
+            )
+        module = importlib.reload(inverse_distance_fft)
+        self.assertIs(module.inverse_distance_arrays, inverse_distance_arrays)
@@ -0,0 +1,133 @@
+"""Tests for the precomputed inverse of the distance operator."""
+
+import unittest
+
+import numpy as np
+
+# pylint: disable=E0611
+from pymica.methods.inverse_distance import inverse_distance_arrays
+from pymica.methods.inverse_distance_3d import inverse_distance_3d_arrays
+from pymica.methods.inverse_distance_operator import InverseDistanceOperator
+
+
+class TestInverseDistanceOperator(unittest.TestCase):
+    """Test the precomputed inverse of the distance operator"""
+
+    rng = np.random.default_rng(3)
+    x_pos = rng.uniform(0, 2, 12)
+    y_pos = rng.uniform(0, 2, 12)
+    z_pos = rng.uniform(0, 1, 12)
+    x_pos[0], y_pos[0] = 0.5, 1.5
+    stations = np.array(
+        list(zip(x_pos, y_pos, z_pos)),
+        dtype=[("x", "f8"), ("y", "f8"), ("altitude", "f8")],
+    )
+    values = rng.uniform(0, 10, (4, 12))
+    geotransform = [0, 0.1, 0, 2, 0, -0.1]
+    size = [20, 20]
+    dem = rng.uniform(0, 1, (20, 20))
+
+    def test_operator(self):
+        """Test the operator against inverse_distance for many timesteps"""
+        operator = InverseDistanceOperator(
+            self.stations, self.size, self.geotransform, power=2, chunk_size=50
+        )
+        fields = operator.apply(self.values)
+
+        self.assertEqual(fields.shape, (4, 20, 20))
+        for step, step_values in enumerate(self.values):
+            expected = inverse_distance_arrays(
+                self.x_pos, self.y_pos, step_values, self.size, self.geotransform
+            )
+            np.testing.assert_allclose(fields[step], expected, rtol=1e-12)
+        self.assertEqual(fields[2][5][5], self.values[2][0])
+
+        field = operator.apply(self.values[1])
+        self.assertEqual(field.shape, (20, 20))
+        np.testing.assert_allclose(field, fields[1], rtol=1e-12)
+
+    def test_operator_missing_stations(self):
+        """Test the operator renormalises the weights of missing stations"""
+        operator = InverseDistanceOperator(
+            self.stations, self.size, self.geotransform, power=4, smoothing=0.5
+        )
+        values = self.values.copy()
+        values[1, [0, 3]] = np.nan
+        fields = operator.apply(values)
+
+        keep = np.ones(12, dtype=bool)
+        keep[[0, 3]] = False
+        expected = inverse_distance_arrays(
+            self.x_pos[keep],
+            self.y_pos[keep],
+            self.values[1][keep],
+            self.size,
+            self.geotransform,
+            power=4,
+            smoothing=0.5,
+        )
+        np.testing.assert_allclose(fields[1], expected, rtol=1e-12)
+
+    def test_operator_3d(self):
+        """Test the operator against inverse_distance_3d"""
+        operator = InverseDistanceOperator(
+            self.stations,
+            self.size,
+            self.geotransform,
+            power=2,
+            smoothing=0,
+            dem=self.dem,
+            penalization=3,
+        )
+        fields = operator.apply(self.values)
+
+        for step, step_values in enumerate(self.values):
+            expected = inverse_distance_3d_arrays(
+                self.x_pos,
+                self.y_pos,
+                self.z_pos,
+                step_values,
+                self.size,
+                self.geotransform,
+                self.dem,
+                penalization=3,
+            )
+            # inverse_distance_3d rounds the field to float
+            np.testing.assert_allclose(fields[step], expected, rtol=1e-6)
+
+        with self.assertRaises(ValueError):
+            InverseDistanceOperator(
+                self.stations, self.size, self.geotransform, dem=self.dem[:5]
+            )
+
+    def test_operator_num_nearest(self):
+        """Test the sparse operator against the k nearest inverse_distance"""
+        operator = InverseDistanceOperator(
+            self.stations, self.size, self.geotransform, num_nearest=4
+        )
+        fields = operator.apply(self.values)
+
+        for step, step_values in enumerate(self.values):
+            expected = inverse_distance_arrays(
+                self.x_pos,
+                self.y_pos,
+                step_values,
+                self.size,
+                self.geotransform,
+                k_nearest=4,
+            )
+            np.testing.assert_allclose(fields[step], expected, rtol=1e-12)
+
+        with self.assertRaises(ValueError):
+            operator.apply(self.values[:, :5])
+        for num_nearest in [0, -2]:
+            with self.assertRaises(ValueError) as cm:
+                InverseDistanceOperator(
+                    self.stations,
+                    self.size,
+                    self.geotransform,
+                    num_nearest=num_nearest,
+                )
+            self.assertEqual(
+                "num_nearest must be a positive number of stations", str(cm.exception)
+            )
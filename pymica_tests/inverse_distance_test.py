@@ -3,9 +3,10 @@
 import unittest
 from datetime import datetime
 
-from numpy import array
+from numpy import argsort, array, array_equal, empty, float32, isnan, random, zeros
 
-from pymica.methods.inverse_distance import inverse_distance  # pylint: disable=E0611
+# pylint: disable=E0611
+from pymica.methods.inverse_distance import inverse_distance, inverse_distance_arrays
 
 
 class TestInverseDistance(unittest.TestCase):
@@ -66,3 +67,275 @@ class TestInverseDistance(unittest.TestCase):
         self.assertAlmostEqual(result[0][size[1] - 1], 2)
         self.assertAlmostEqual(result[size[0] - 1][0], 0)
         self.assertAlmostEqual(result[500][500], 1)
+
+    def test_inverse_distance_num_threads(self):
+        """Test inverse of the distance 2D parallel rows match the serial ones"""
+        rng = random.default_rng(0)
+        residues = [
+            {"id": str(i), "value": v, "x": x, "y": y}
+            for i, (x, y, v) in enumerate(rng.uniform(0, 2, (50, 3)))
+        ]
+        residues.append({"id": "on_pixel", "value": 5.0, "x": 1.0, "y": 1.0})
+        geotransform = [0, 0.01, 0, 2, 0, -0.01]
+        size = [200, 200]
+
+        serial = inverse_distance(residues, size, geotransform, num_threads=1)
+        parallel = inverse_distance(residues, size, geotransform, num_threads=4)
+        all_cores = inverse_distance(residues, size, geotransform, num_threads=0)
+
+        self.assertTrue(array_equal(serial, parallel))
+        self.assertTrue(array_equal(serial, all_cores))
+        self.assertEqual(parallel[100][100], 5.0)
+
+    def test_inverse_distance_arrays(self):
+        """Test inverse of the distance 2D with columnar input"""
+        expected = inverse_distance(self.residues, self.size, self.geotransform)
+
+        x_pos = array([0.0, 1.0, 2.0])
+        y_pos = array([0.0, 1.0, 2.0])
+        values = array([0.0, 1.0, 2.0])
+        result = inverse_distance_arrays(
+            x_pos, y_pos, values, self.size, self.geotransform
+        )
+        self.assertTrue(array_equal(result, expected))
+
+        structured = array(
+            [(0, 0, 0), (1, 1, 1), (2, 2, 2)],
+            dtype=[("x", "f8"), ("y", "f8"), ("value", "f4")],
+        )
+        result = inverse_distance(structured, self.size, self.geotransform)
+        self.assertTrue(array_equal(result, expected))
+
+        with self.assertRaises(ValueError):
+            inverse_distance_arrays(
+                x_pos[:2], y_pos, values, self.size, self.geotransform
+            )
+
+    def test_inverse_distance_k_nearest(self):
+        """Test inverse of the distance 2D limited to the k nearest stations"""
+        rng = random.default_rng(1)
+        x_pos = rng.uniform(0, 2, 40)
+        y_pos = rng.uniform(0, 2, 40)
+        values = rng.uniform(0, 10, 40)
+        geotransform = [-0.5, 0.1, 0, 2.5, 0, -0.1]
+        size = [30, 30]
+
+        result = inverse_distance_arrays(
+            x_pos, y_pos, values, size, geotransform, k_nearest=4
+        )
+
+        for j, i in [(0, 0), (12, 17), (29, 29), (20, 3)]:
+            x = geotransform[0] + i * geotransform[1]
+            y = geotransform[3] + j * geotransform[5]
+            dist_sq = (x - x_pos) ** 2 + (y - y_pos) ** 2
+            nearest = argsort(dist_sq)[:4]
+            weights = 1.0 / dist_sq[nearest]
+            expected = (weights * values[nearest]).sum() / weights.sum()
+            self.assertAlmostEqual(result[j][i], expected, 10)
+
+        all_stations = inverse_distance_arrays(
+            x_pos, y_pos, values, size, geotransform, k_nearest=40
+        )
+        self.assertTrue(
+            array_equal(
+                all_stations,
+                inverse_distance_arrays(x_pos, y_pos, values, size, geotransform),
+            )
+        )
+
+    def test_inverse_distance_max_radius(self):
+        """Test inverse of the distance 2D limited to a search radius"""
+        result = inverse_distance(
+            self.residues, self.size, self.geotransform, max_radius=0.8
+        )
+
+        self.assertEqual(result[0][4], 2)
+        self.assertEqual(result[2][2], 1)
+        self.assertAlmostEqual(result[1][3], 1.5)
+        # No station closer than 0.8
+        self.assertEqual(result[0][0], 0)
+
+        result = inverse_distance(
+            self.residues, self.size, self.geotransform, max_radius=1.2
+        )
+        self.assertAlmostEqual(result[1][4], 1.8333, 3)
+
+        result = inverse_distance(
+            self.residues, self.size, self.geotransform, k_nearest=1, max_radius=1.2
+        )
+        self.assertEqual(result[1][4], 2)
+        self.assertEqual(result[0][0], 0)
+
+        with self.assertRaises(ValueError):
+            inverse_distance(self.residues, self.size, self.geotransform, k_nearest=-1)
+
+    def test_inverse_distance_out(self):
+        """Test inverse of the distance 2D written into an output buffer"""
+        expected = inverse_distance(self.residues, self.size, self.geotransform)
+
+        out = empty(self.size)
+        result = inverse_distance(self.residues, self.size, self.geotransform, out=out)
+        self.assertIs(result, out)
+        self.assertTrue(array_equal(out, expected))
+
+        out = empty(self.size, dtype=float32)
+        inverse_distance(self.residues, self.size, self.geotransform, out=out)
+        self.assertEqual(out.dtype, float32)
+        self.assertTrue(array_equal(out, expected.astype(float32)))
+
+        with self.assertRaises(ValueError):
+            inverse_distance(
+                self.residues, self.size, self.geotransform, out=empty((4, 5))
+            )
+        with self.assertRaises(ValueError):
+            inverse_distance(
+                self.residues,
+                self.size,
+                self.geotransform,
+                out=empty(self.size, dtype="int32"),
+            )
+
+    def test_inverse_distance_tiles(self):
+        """Test inverse of the distance 2D over several tiles and station blocks"""
+        rng = random.default_rng(2)
+        x_pos = rng.uniform(0, 2, 600)
+        y_pos = rng.uniform(0, 2, 600)
+        values = rng.uniform(0, 10, 600)
+        geotransform = [0, 0.02, 0, 2, 0, -0.02]
+        size = [37, 150]
+
+        result = inverse_distance_arrays(x_pos, y_pos, values, size, geotransform)
+        smoothed = inverse_distance_arrays(
+            x_pos, y_pos, values, size, geotransform, power=4, smoothing=0.5
+        )
+
+        for j, i in [(0, 0), (36, 149), (17, 70), (20, 129)]:
+            x = geotransform[0] + i * geotransform[1]
+            y = geotransform[3] + j * geotransform[5]
+            dist_sq = (x - x_pos) ** 2 + (y - y_pos) ** 2
+            weights = 1.0 / dist_sq
+            expected = (weights * values).sum() / weights.sum()
+            self.assertAlmostEqual(result[j][i], expected, 10)
+
+            weights = 1.0 / (dist_sq + 0.25) ** 2
+            expected = (weights * values).sum() / weights.sum()
+            self.assertAlmostEqual(smoothed[j][i], expected, 10)
+
+    def test_inverse_distance_mask(self):
+        """Test inverse of the distance 2D skipping the masked pixels"""
+        rng = random.default_rng(3)
+        x_pos = rng.uniform(0, 2, 300)
+        y_pos = rng.uniform(0, 2, 300)
+        values = rng.uniform(0, 10, 300)
+        geotransform = [0, 0.02, 0, 2, 0, -0.02]
+        size = [70, 90]
+
+        mask = zeros(size, dtype=bool)
+        mask[5:40, 10:80] = True
+
+        for kwargs in [{}, {"k_nearest": 5}, {"max_radius": 0.3}]:
+            expected = inverse_distance_arrays(
+                x_pos, y_pos, values, size, geotransform, **kwargs
+            )
+            result = inverse_distance_arrays(
+                x_pos, y_pos, values, size, geotransform, mask=mask, **kwargs
+            )
+            self.assertTrue(array_equal(result[mask], expected[mask]))
+            self.assertTrue(isnan(result[~mask]).all())
+
+            result = inverse_distance_arrays(
+                x_pos,
+                y_pos,
+                values,
+                size,
+                geotransform,
+                mask=mask.astype("uint8"),
+                nodata=-9999,
+                **kwargs
+            )
+            self.assertTrue(array_equal(result[mask], expected[mask]))
+            self.assertTrue((result[~mask] == -9999).all())
+
+        with self.assertRaises(ValueError):
+            inverse_distance(
+                self.residues, self.size, self.geotransform, mask=zeros((4, 5))
+            )
+
+    def test_inverse_distance_real_power(self):
+        """Test inverse of the distance 2D with real powers"""
+        rng = random.default_rng(5)
+        x_pos = rng.uniform(0, 2, 200)
+        y_pos = rng.uniform(0, 2, 200)
+        values = rng.uniform(0, 10, 200)
+        geotransform = [0, 0.05, 0, 2, 0, -0.05]
+        size = [40, 40]
+
+        for power in [1, 1.5, 2.5, 3, 4.5, 1.7]:
+            for kwargs in [{}, {"k_nearest": 200}, {"max_radius": 10}]:
+                result = inverse_distance_arrays(
+                    x_pos,
+                    y_pos,
+                    values,
+                    size,
+                    geotransform,
+                    power=power,
+                    smoothing=0.5,
+                    **kwargs
+                )
+                for j, i in [(0, 0), (39, 39), (17, 23)]:
+                    x = geotransform[0] + i * geotransform[1]
+                    y = geotransform[3] + j * geotransform[5]
+                    dist_sq = (x - x_pos) ** 2 + (y - y_pos) ** 2 + 0.25
+                    weights = 1.0 / dist_sq ** (power / 2)
+                    expected = (weights * values).sum() / weights.sum()
+                    self.assertAlmostEqual(result[j][i], expected, 10)
+
+    def test_inverse_distance_float32(self):
+        """Test inverse of the distance 2D with float32 weights"""
+        rng = random.default_rng(7)
+        x_pos = 400000 + rng.uniform(0, 20000, 300)
+        y_pos = 4600000 - rng.uniform(0, 20000, 300)
+        values = rng.uniform(0, 10, 300)
+        geotransform = [400000, 250, 0, 4600000, 0, -250]
+        size = [70, 90]
+        # One station on top of a pixel
+        x_pos[0] = 400000 + 250 * 41
+        y_pos[0] = 4600000 - 250 * 13
+        mask = rng.uniform(size=size) > 0.2
+
+        for power in [2, 2.5, 3, 1.7]:
+            for smoothing in [0, 100]:
+                expected = inverse_distance_arrays(
+                    x_pos, y_pos, values, size, geotransform, power, smoothing
+                )
+                result = inverse_distance_arrays(
+                    x_pos,
+                    y_pos,
+                    values,
+                    size,
+                    geotransform,
+                    power,
+                    smoothing,
+                    precision="float32",
+                )
+                self.assertLess(abs(result - expected).max(), 1e-4)
+                if smoothing == 0:
+                    self.assertEqual(result[13][41], values[0])
+
+        result = inverse_distance_arrays(
+            x_pos,
+            y_pos,
+            values,
+            size,
+            geotransform,
+            out=empty(size, dtype=float32),
+            mask=mask,
+            nodata=-9999,
+            precision="float32",
+        )
+        self.assertTrue((result[~mask] == -9999).all())
+
+        with self.assertRaises(ValueError):
+            inverse_distance(
+                self.residues, self.size, self.geotransform, precision="float16"
+            )
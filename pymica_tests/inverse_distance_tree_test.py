@@ -0,0 +1,139 @@
+"""Tests for the tree approximate inverse of the distance."""
+
+import unittest
+
+import numpy as np
+
+# pylint: disable=E0611
+from pymica.methods.inverse_distance import inverse_distance_arrays
+from pymica.methods.inverse_distance_3d import inverse_distance_3d_arrays
+from pymica.methods.inverse_distance_tree import (
+    error_bound,
+    inverse_distance_tree,
+    inverse_distance_tree_arrays,
+    opening_angle,
+)
+
+
+class TestInverseDistanceTree(unittest.TestCase):
+    """Test the tree approximate inverse of the distance"""
+
+    rng = np.random.default_rng(7)
+    x_pos = rng.uniform(0, 20000, 700)
+    y_pos = rng.uniform(0, 15000, 700)
+    z_pos = rng.uniform(0, 500, 700)
+    values = rng.uniform(0, 10, 700)
+    geotransform = [0, 200, 0, 15000, 0, -200]
+    size = [75, 100]
+    dem = rng.uniform(0, 500, (75, 100))
+
+    def test_inverse_distance_tree(self):
+        """Test the approximate field against the exact one and its bound"""
+        for power, smoothing in [(2, 0.0), (2.5, 0.0), (1.7, 300.0)]:
+            exact = inverse_distance_arrays(
+                self.x_pos,
+                self.y_pos,
+                self.values,
+                self.size,
+                self.geotransform,
+                power,
+                smoothing,
+            )
+            for theta in [0.0, 0.3, 0.6]:
+                field = inverse_distance_tree_arrays(
+                    self.x_pos,
+                    self.y_pos,
+                    self.values,
+                    self.size,
+                    self.geotransform,
+                    power,
+                    smoothing,
+                    theta,
+                )
+                bound = error_bound(theta, power) * np.ptp(self.values)
+                self.assertLessEqual(np.abs(field - exact).max(), bound + 1e-10)
+
+    def test_inverse_distance_tree_3d(self):
+        """Test the approximate 3D field against the exact one and its bound"""
+        exact = inverse_distance_3d_arrays(
+            self.x_pos,
+            self.y_pos,
+            self.z_pos,
+            self.values,
+            self.size,
+            self.geotransform,
+            self.dem,
+            2,
+            0,
+            30,
+        )
+        for theta in [0.0, 0.4]:
+            field = inverse_distance_tree_arrays(
+                self.x_pos,
+                self.y_pos,
+                self.values,
+                self.size,
+                self.geotransform,
+                theta=theta,
+                zpos=self.z_pos,
+                dem=self.dem,
+                penalization=30,
+            )
+            bound = error_bound(theta, 2) * np.ptp(self.values)
+            # The exact 3D kernel rounds to single precision
+            self.assertLessEqual(np.abs(field - exact).max(), bound + 1e-5)
+
+        dem = self.dem.astype(np.int16)
+        expected = inverse_distance_tree_arrays(
+            self.x_pos,
+            self.y_pos,
+            self.values,
+            self.size,
+            self.geotransform,
+            zpos=self.z_pos,
+            dem=dem.astype(np.float64),
+        )
+        for dem_dtype in [np.int16, np.float32]:
+            field = inverse_distance_tree_arrays(
+                self.x_pos,
+                self.y_pos,
+                self.values,
+                self.size,
+                self.geotransform,
+                zpos=self.z_pos,
+                dem=dem.astype(dem_dtype),
+            )
+            self.assertTrue(np.array_equal(field, expected))
+
+    def test_inverse_distance_tree_coincident(self):
+        """Test pixels on top of a station and the masked pixels"""
+        data = [
+            {"x": 1000, "y": 14000, "altitude": 10, "value": 3},
+            {"x": 19000, "y": 1000, "altitude": 10, "value": 5},
+        ] + [
+            {"x": x, "y": y, "altitude": z, "value": v}
+            for x, y, z, v in zip(self.x_pos, self.y_pos, self.z_pos, self.values)
+        ]
+        mask = np.ones(self.size, dtype=bool)
+        mask[0] = False
+
+        field = inverse_distance_tree(
+            data, self.size, self.geotransform, theta=0.5, mask=mask, nodata=-1
+        )
+        self.assertEqual(field[5, 5], 3)
+        self.assertEqual(field[70, 95], 5)
+        self.assertTrue((field[0] == -1).all())
+
+        field = inverse_distance_tree(
+            data, self.size, self.geotransform, theta=0.5, dem=self.dem
+        )
+        self.assertEqual(field[5, 5], 3)
+        self.assertEqual(field[70, 95], 5)
+
+        with self.assertRaises(ValueError):
+            inverse_distance_tree(data, self.size, self.geotransform, theta=1)
+
+    def test_opening_angle(self):
+        """Test the opening angle for a tolerance"""
+        self.assertAlmostEqual(opening_angle(0.1, 2), 0.1)
+        self.assertAlmostEqual(error_bound(opening_angle(0.05, 2.5), 2.5), 0.05)
@@ -0,0 +1,77 @@
+"""Tests for the leave-one-out cross-validation of the inverse of the distance."""
+
+import unittest
+
+import numpy as np
+
+# pylint: disable=E0611
+from pymica.methods.inverse_distance import inverse_distance_arrays
+from pymica.methods.inverse_distance_3d import inverse_distance_3d_arrays
+from pymica.methods.leave_one_out import LeaveOneOut
+
+
+class TestLeaveOneOut(unittest.TestCase):
+    """Test the leave-one-out cross-validation"""
+
+    rng = np.random.default_rng(4)
+    x_pos = rng.uniform(0, 2, 30)
+    y_pos = rng.uniform(0, 2, 30)
+    z_pos = rng.uniform(0, 1, 30)
+    values = rng.uniform(0, 10, 30)
+    data = [
+        {"id": "S" + str(i), "x": x, "y": y, "altitude": z, "value": value}
+        for i, (x, y, z, value) in enumerate(zip(x_pos, y_pos, z_pos, values))
+    ]
+
+    def test_leave_one_out(self):
+        """Test the estimates against inverse_distance without each station"""
+        validation = LeaveOneOut(self.data, power=2, smoothing=0.5, chunk_size=7)
+        estimates = validation.get_estimates()
+
+        for i in range(30):
+            others = np.arange(30) != i
+            expected = inverse_distance_arrays(
+                self.x_pos[others],
+                self.y_pos[others],
+                self.values[others],
+                [1, 1],
+                [self.x_pos[i], 1, 0, self.y_pos[i], 0, -1],
+                smoothing=0.5,
+            )
+            self.assertAlmostEqual(estimates["S" + str(i)], expected[0, 0], 10)
+
+        errors = np.array(list(validation.get_errors().values()))
+        self.assertTrue(
+            np.allclose(errors, np.array(list(estimates.values())) - self.values)
+        )
+        self.assertAlmostEqual(validation.get_mae(), np.abs(errors).mean())
+        self.assertAlmostEqual(validation.get_rmse(), np.sqrt((errors**2).mean()))
+
+    def test_leave_one_out_3d(self):
+        """Test the 3D estimates against inverse_distance_3d without each station"""
+        validation = LeaveOneOut(self.data, power=2, penalization=30)
+        estimates = validation.get_estimates()
+
+        for i in range(30):
+            others = np.arange(30) != i
+            expected = inverse_distance_3d_arrays(
+                self.x_pos[others],
+                self.y_pos[others],
+                self.z_pos[others],
+                self.values[others],
+                [1, 1],
+                [self.x_pos[i], 1, 0, self.y_pos[i], 0, -1],
+                np.array([[self.z_pos[i]]]),
+            )
+            self.assertAlmostEqual(estimates["S" + str(i)], expected[0, 0], 10)
+
+    def test_leave_one_out_coincident(self):
+        """Test stations sharing their location"""
+        data = np.array(
+            [(0, 0, 1), (0, 0, 3), (1, 1, 5)],
+            dtype=[("x", "f8"), ("y", "f8"), ("value", "f8")],
+        )
+        validation = LeaveOneOut(data)
+
+        self.assertEqual(validation.get_estimates(), {0: 3, 1: 1, 2: 2})
+        self.assertEqual(validation.get_errors(), {0: 2, 1: -2, 2: -3})
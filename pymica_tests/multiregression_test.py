@@ -2,6 +2,9 @@
 
 import unittest
 
+import numpy as np
+from sklearn.linear_model import LinearRegression
+
 from pymica.methods.multiregression import MultiRegression
 
 
@@ -202,3 +205,100 @@ class TestMultiRegression(unittest.TestCase):
         )
         self.assertAlmostEqual(inst_regression.get_mae(), 0)
         self.assertAlmostEqual(inst_regression.get_mse(), 0)
+
+    def test_apply_regression_mask(self):
+        """Test applying the regression only to the masked pixels"""
+        inst_regression = MultiRegression(
+            self.general_data, x_vars=("altitude", "dist")
+        )
+        raster_data = np.array([np.arange(12.0).reshape(3, 4), np.zeros((3, 4))])
+        mask = np.zeros((3, 4), dtype=bool)
+        mask[1:, 1:3] = True
+
+        expected = inst_regression.apply_regression(raster_data, ["altitude", "dist"])
+        result = inst_regression.apply_regression(
+            raster_data, ["altitude", "dist"], mask=mask, nodata=-9999
+        )
+
+        self.assertTrue(np.allclose(result[mask], expected[mask]))
+        self.assertTrue((result[~mask] == -9999).all())
+
+    def test_apply_regression_dtypes(self):
+        """Test applying the regression to int16 and float32 predictors"""
+        inst_regression = MultiRegression(
+            self.general_data, x_vars=("altitude", "dist")
+        )
+        raster_data = np.array(
+            [np.arange(12.0).reshape(3, 4) * 100, np.arange(12.0).reshape(3, 4)]
+        )
+        expected = inst_regression.apply_regression(raster_data, ["altitude", "dist"])
+
+        for dtype in [np.int16, np.float32]:
+            result = inst_regression.apply_regression(
+                raster_data.astype(dtype), ["altitude", "dist"]
+            )
+            self.assertEqual(result.dtype, np.float64)
+            self.assertTrue(np.allclose(result, expected))
+
+    def test_stepwise_selection(self):
+        """Test the stepwise selection against refitting every candidate"""
+        rng = np.random.default_rng(4)
+        x_vars = ["altitude", "dist", "lat", "lon", "slope"]
+        x_data = rng.normal(size=(60, 5)) * [500, 20, 0.5, 0.5, 10]
+        y_data = x_data @ [0.006, -0.1, 0, 0.3, 0.02] + rng.normal(size=60)
+        data = [
+            dict(id=str(i), value=y_data[i], **dict(zip(x_vars, x_data[i])))
+            for i in range(60)
+        ]
+
+        for score_threshold in [0.001, 0.01, 0.05, 0.2]:
+            # Forward selection refitting a regression for each candidate
+            used_vars = []
+            left_vars = x_vars[:]
+            final_score = 0
+            while left_vars:
+                scores = []
+                for x_var in left_vars:
+                    columns = [x_vars.index(var) for var in used_vars + [x_var]]
+                    regr = LinearRegression().fit(x_data[:, columns], y_data)
+                    scores.append(regr.score(x_data[:, columns], y_data))
+                chosen_var = left_vars.pop(int(np.argmax(scores)))
+                if max(scores) - final_score > score_threshold:
+                    final_score = max(scores)
+                    used_vars.append(chosen_var)
+
+            inst_regression = MultiRegression(data, x_vars, score_threshold)
+            self.assertEqual(inst_regression.used_vars, used_vars)
+            columns = [x_vars.index(var) for var in used_vars]
+            regr = LinearRegression().fit(x_data[:, columns], y_data)
+            self.assertTrue(np.allclose(inst_regression.get_coefs()[0], regr.coef_))
+            self.assertAlmostEqual(inst_regression.get_score(), final_score)
+
+    def test_arrays(self):
+        """Test the observations stored as arrays"""
+        data = [
+            {"id": "AA", "value": 0, "dist": 4, "altitude": 0},
+            {"id": "BB", "value": 9, "dist": 3, "altitude": 0.5},
+            {"id": "CC", "value": 9, "dist": 2, "altitude": 1},
+            {"id": "DD", "value": 8, "dist": 1, "altitude": 2},
+            {"id": "EE", "value": 17, "dist": 0.5, "altitude": 3},
+        ]
+        inst_regression = MultiRegression(data, x_vars=("altitude", "dist"))
+
+        self.assertEqual(inst_regression.x_array.shape, (5, 2))
+        self.assertEqual(inst_regression.x_array.dtype, np.float64)
+        self.assertEqual(inst_regression.keys, ["AA", "BB", "CC", "DD", "EE"])
+        self.assertEqual(list(inst_regression.y_data), [0, 9, 9, 8, 17])
+        self.assertEqual(list(inst_regression.x_data["dist"]), [4, 3, 2, 1, 0.5])
+
+        residuals = inst_regression.get_residuals_array()
+        self.assertIsInstance(residuals, np.ndarray)
+        self.assertEqual(
+            inst_regression.get_residuals(), dict(zip(inst_regression.keys, residuals))
+        )
+        self.assertTrue(
+            np.array_equal(
+                residuals,
+                inst_regression.predict_points(data) - inst_regression.y_data,
+            )
+        )
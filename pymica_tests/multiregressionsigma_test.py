@@ -77,6 +77,77 @@ class TestMultiRegressionSigma(unittest.TestCase):
         )
         inst_regression.regr.predict([[0, 0, 0]])
 
+    def test_original_data(self):
+        """Test the residuals of the original data"""
+        data = [
+            {"id": "AA", "value": 1, "dist": 0, "altitude": 0},
+            {"id": "BB", "value": 4.5, "dist": 1, "altitude": 0.5},
+            {"id": "CC", "value": 6, "dist": 1, "altitude": 1},
+            {"id": "DD", "value": 7.5, "dist": 1, "altitude": 1.5},
+            {"id": "EE", "value": 8, "dist": 2, "altitude": 1},
+            {"id": "BAD", "value": 40, "dist": 0, "altitude": 1},
+        ]
+        inst = MultiRegressionSigma(data, x_vars=["altitude", "dist"])
+
+        self.assertIs(inst.original_data, data)
+        self.assertEqual(len(inst.data), 5)
+        residuals = inst.get_residuals()
+        self.assertEqual(list(residuals), [point["id"] for point in data])
+        self.assertAlmostEqual(residuals["BAD"], -36)
+
+        # Setting the original data changes the points with residuals
+        inst.original_data = data[2:4]
+        self.assertEqual(list(inst.get_residuals()), ["CC", "DD"])
+        self.assertEqual(len(inst.get_residuals_array()), 2)
+
+    def test_inliers(self):
+        """Test the inliers mask and the iterations"""
+        rng = np.random.default_rng(3)
+        altitude = rng.uniform(0, 1000, 40)
+        values = 20 - 0.0065 * altitude + rng.normal(0, 0.3, 40)
+        values[:3] += [6, -8, 3]
+        data = [
+            {"id": str(i), "value": values[i], "altitude": altitude[i]}
+            for i in range(40)
+        ]
+
+        inst = MultiRegressionSigma(data, x_vars=["altitude"])
+        self.assertEqual(inst.inliers.dtype, bool)
+        self.assertEqual(len(inst.inliers), 40)
+        self.assertFalse(inst.inliers[:3].any())
+        self.assertEqual(inst.keys, [str(i) for i in np.flatnonzero(inst.inliers)])
+        self.assertEqual(len(inst.data), inst.inliers.sum())
+        # Same result as fitting only the inliers
+        inliers_regression = MultiRegression(inst.data, x_vars=["altitude"])
+        self.assertEqual(inst.get_coefs()[0][0], inliers_regression.get_coefs()[0][0])
+        self.assertAlmostEqual(inst.get_score(), inliers_regression.get_score())
+
+        iterated = MultiRegressionSigma(data, x_vars=["altitude"], max_iterations=10)
+        self.assertLessEqual(iterated.inliers.sum(), inst.inliers.sum())
+        residuals = iterated.get_residuals_array()
+        sigma = np.std(residuals[iterated.inliers])
+        # Converged: the mask is the one of its own sigma value
+        self.assertTrue(
+            np.array_equal(
+                iterated.inliers,
+                (abs(residuals) < sigma * 1.5) | (abs(residuals) < 0.1),
+            )
+        )
+
+        # No point eliminated, the first regression is kept
+        data = [
+            {"id": "AA", "value": 0, "altitude": 0},
+            {"id": "BB", "value": 0.5, "altitude": 0.5},
+            {"id": "CC", "value": 1, "altitude": 1},
+        ]
+        inst = MultiRegressionSigma(data, x_vars=["altitude"], max_iterations=5)
+        self.assertTrue(inst.inliers.all())
+        self.assertIs(inst.data, data)
+
+        with self.assertRaises(ValueError) as cm:
+            MultiRegressionSigma(data, x_vars=["altitude"], max_iterations=0)
+        self.assertEqual("max_iterations must be 1 or greater.", str(cm.exception))
+
     def test_apply_regression(self):
         """Test apply MLR regression"""
         data = [
@@ -10,6 +10,7 @@ import numpy as np
 from genericpath import exists
 from osgeo import gdal, osr
 
+from pymica.methods.inverse_distance_tree import error_bound  # pylint: disable=E0611
 from pymica.pymica import PyMica
 
 
@@ -158,7 +159,8 @@ class TestPyMica(unittest.TestCase):
         with self.assertRaises(ValueError) as cm:
             PyMica("id3", "pymica_tests/data/config_interpolate.json")
         self.assertEqual(
-            'Methodology must be "id2d", "id3d", "mlr+id2d", "mlr+id3d" or "mlr"',
+            'Methodology must be "id2d", "id3d", "knn2d", "mlr+id2d", '
+            '"mlr+id3d", "mlr+knn2d" or "mlr"',
             str(cm.exception),
         )
 
@@ -367,6 +369,233 @@ class TestPyMica(unittest.TestCase):
             PyMica("id2d", "pymica_tests/data/config_test.json")
         self.assertEqual("EPSG must have a valid int value.", cm.exception.args[0])
 
+    def test_init_wrong_type_num_threads(self):
+        """Test init wrong type num_threads in configuration dictionary"""
+        config = {
+            "id2d": {
+                "id_power": 2.5,
+                "id_smoothing": 0.0,
+                "interpolation_bounds": [0, 0, 1000, 1000],
+                "resolution": 1000,
+                "EPSG": 25831,
+                "num_threads": "4",
+            }
+        }
+
+        with open("pymica_tests/data/config_test.json", "w", encoding="utf-8") as f:
+            json.dump(config, f)
+            f.close()
+
+        with self.assertRaises(TypeError) as cm:
+            PyMica("id2d", "pymica_tests/data/config_test.json")
+        self.assertEqual(
+            "num_threads must have a valid int value.", cm.exception.args[0]
+        )
+
+    def test_init_wrong_type_k_nearest(self):
+        """Test init wrong type id_k_nearest in configuration dictionary"""
+        config = {
+            "id2d": {
+                "id_power": 2.5,
+                "id_smoothing": 0.0,
+                "interpolation_bounds": [0, 0, 1000, 1000],
+                "resolution": 1000,
+                "EPSG": 25831,
+                "id_k_nearest": 4.5,
+            }
+        }
+
+        with open("pymica_tests/data/config_test.json", "w", encoding="utf-8") as f:
+            json.dump(config, f)
+            f.close()
+
+        with self.assertRaises(TypeError) as cm:
+            PyMica("id2d", "pymica_tests/data/config_test.json")
+        self.assertEqual(
+            "id_k_nearest must have a valid int value.", cm.exception.args[0]
+        )
+
+    def test_init_wrong_id_engine(self):
+        """Test init wrong id_engine in configuration dictionary"""
+        config = {
+            "id2d": {
+                "id_power": 2.5,
+                "id_smoothing": 0.0,
+                "interpolation_bounds": [0, 0, 1000, 1000],
+                "resolution": 1000,
+                "EPSG": 25831,
+                "id_engine": "fast",
+            }
+        }
+
+        with open("pymica_tests/data/config_test.json", "w", encoding="utf-8") as f:
+            json.dump(config, f)
+            f.close()
+
+        with self.assertRaises(ValueError) as cm:
+            PyMica("id2d", "pymica_tests/data/config_test.json")
+        self.assertEqual(
+            'id_engine must be "exact", "fft" or "tree".', cm.exception.args[0]
+        )
+
+    def test_init_wrong_adaptive_engine(self):
+        """Test init adaptive factor with an approximate id_engine"""
+        config = {
+            "id2d": {
+                "id_power": 2.5,
+                "id_smoothing": 0.0,
+                "interpolation_bounds": [0, 0, 1000, 1000],
+                "resolution": 1000,
+                "EPSG": 25831,
+                "id_engine": "fft",
+                "id_adaptive_factor": 8,
+            }
+        }
+
+        with open("pymica_tests/data/config_test.json", "w", encoding="utf-8") as f:
+            json.dump(config, f)
+            f.close()
+
+        with self.assertRaises(ValueError) as cm:
+            PyMica("id2d", "pymica_tests/data/config_test.json")
+        self.assertEqual(
+            "id_adaptive_factor is only available with the exact id_engine.",
+            cm.exception.args[0],
+        )
+
+    def test_init_wrong_k_nearest_3d_engine(self):
+        """Test init id_k_nearest with the 3D tree id_engine"""
+        config = {
+            "id3d": {
+                "id_power": 2.5,
+                "id_smoothing": 0.0,
+                "id_penalization": 30,
+                "variables_files": {"altitude": "pymica_tests/data/tifs/altitude.tif"},
+                "interpolation_bounds": [0, 0, 1000, 1000],
+                "resolution": 1000,
+                "EPSG": 25831,
+                "id_engine": "tree",
+                "id_k_nearest": 8,
+            }
+        }
+
+        with open("pymica_tests/data/config_test.json", "w", encoding="utf-8") as f:
+            json.dump(config, f)
+            f.close()
+
+        with self.assertRaises(ValueError) as cm:
+            PyMica("id3d", "pymica_tests/data/config_test.json")
+        self.assertEqual(
+            "id_k_nearest is not available with the tree id_engine.",
+            cm.exception.args[0],
+        )
+
+    def test_init_tree_tolerance(self):
+        """Test the tree opening angle derived from id_tree_tolerance"""
+        config = {
+            "id2d": {
+                "id_power": 2.5,
+                "id_smoothing": 0.0,
+                "interpolation_bounds": [0, 0, 1000, 1000],
+                "resolution": 1000,
+                "EPSG": 25831,
+                "id_engine": "tree",
+            }
+        }
+
+        with open("pymica_tests/data/config_test.json", "w", encoding="utf-8") as f:
+            json.dump(config, f)
+            f.close()
+
+        id2d = PyMica("id2d", "pymica_tests/data/config_test.json")
+        self.assertAlmostEqual(error_bound(id2d.tree_theta, 2.5), 1e-3)
+
+        config["id2d"]["id_tree_tolerance"] = 0
+        with open("pymica_tests/data/config_test.json", "w", encoding="utf-8") as f:
+            json.dump(config, f)
+            f.close()
+        self.assertEqual(
+            PyMica("id2d", "pymica_tests/data/config_test.json").tree_theta, 0
+        )
+
+        config["id2d"]["id_tree_tolerance"] = 1.5
+        with open("pymica_tests/data/config_test.json", "w", encoding="utf-8") as f:
+            json.dump(config, f)
+            f.close()
+        with self.assertRaises(ValueError) as cm:
+            PyMica("id2d", "pymica_tests/data/config_test.json")
+        self.assertEqual(
+            "id_tree_tolerance must be between 0 and 1.", cm.exception.args[0]
+        )
+
+    def test_init_wrong_precision(self):
+        """Test init wrong precision in configuration dictionary"""
+        config = {
+            "id3d": {
+                "id_power": 2.5,
+                "id_smoothing": 0.0,
+                "id_penalization": 30,
+                "interpolation_bounds": [0, 0, 1000, 1000],
+                "resolution": 1000,
+                "EPSG": 25831,
+                "precision": "float16",
+            }
+        }
+
+        with open("pymica_tests/data/config_test.json", "w", encoding="utf-8") as f:
+            json.dump(config, f)
+            f.close()
+
+        with self.assertRaises(ValueError) as cm:
+            PyMica("id3d", "pymica_tests/data/config_test.json")
+        self.assertEqual(
+            'precision must be "float32" or "float64".', cm.exception.args[0]
+        )
+
+    def test_init_wrong_type_nodata(self):
+        """Test init wrong type nodata in configuration dictionary"""
+        config = {
+            "id2d": {
+                "id_power": 2.5,
+                "id_smoothing": 0.0,
+                "interpolation_bounds": [0, 0, 1000, 1000],
+                "resolution": 1000,
+                "EPSG": 25831,
+                "nodata": "-9999",
+            }
+        }
+
+        with open("pymica_tests/data/config_test.json", "w", encoding="utf-8") as f:
+            json.dump(config, f)
+            f.close()
+
+        with self.assertRaises(TypeError) as cm:
+            PyMica("id2d", "pymica_tests/data/config_test.json")
+        self.assertEqual(
+            "nodata must have a valid numeric value.", cm.exception.args[0]
+        )
+
+    def test_init_mask_file_not_found(self):
+        """Test init mask_file not found"""
+        config = {
+            "id2d": {
+                "id_power": 2.5,
+                "id_smoothing": 0.0,
+                "interpolation_bounds": [0, 0, 1000, 1000],
+                "resolution": 1000,
+                "EPSG": 25831,
+                "mask_file": "notfound.tif",
+            }
+        }
+
+        with open("pymica_tests/data/config_test.json", "w", encoding="utf-8") as f:
+            json.dump(config, f)
+            f.close()
+
+        with self.assertRaises(FileNotFoundError) as cm:
+            PyMica("id2d", "pymica_tests/data/config_test.json")
+        self.assertEqual("No such file or directory: notfound.tif", str(cm.exception))
+
     def test_init_missing_variables_files(self):
         """Test init missing variables files in mlr"""
         config = {
@@ -490,6 +719,54 @@ class TestPyMica(unittest.TestCase):
         self.assertAlmostEqual(field[500, 500], 20.189, 2)
         self.assertAlmostEqual(field[750, 750], 22.393, 2)
 
+    def test_init_interpolate_knn2d(self):
+        """Test init interpolate knn2d"""
+        config = {
+            "knn2d": {
+                "id_power": 2,
+                "id_smoothing": 0.0,
+                "num_nearest": 1000,
+                "num_threads": 2,
+                "interpolation_bounds": [260000, 4488100, 530000, 4750000],
+                "resolution": 270,
+                "EPSG": 25831,
+            }
+        }
+
+        with open("pymica_tests/data/config_test.json", "w", encoding="utf-8") as f:
+            json.dump(config, f)
+            f.close()
+
+        # With all the stations, the same field as id2d
+        knn2d = PyMica("knn2d", "pymica_tests/data/config_test.json")
+        field = knn2d.interpolate(self.data)
+
+        self.assertEqual(field.shape, (970, 1000))
+        self.assertAlmostEqual(field[0, 0], 24.477, 2)
+        self.assertAlmostEqual(field[500, 500], 20.189, 2)
+        self.assertAlmostEqual(field[750, 750], 22.393, 2)
+
+    def test_init_wrong_num_nearest(self):
+        """Test init wrong num_nearest in configuration dictionary"""
+        config = {
+            "knn2d": {
+                "id_power": 2,
+                "id_smoothing": 0.0,
+                "num_nearest": 0,
+                "interpolation_bounds": [260000, 4488100, 530000, 4750000],
+                "resolution": 270,
+                "EPSG": 25831,
+            }
+        }
+
+        with open("pymica_tests/data/config_test.json", "w", encoding="utf-8") as f:
+            json.dump(config, f)
+            f.close()
+
+        with self.assertRaises(ValueError) as cm:
+            PyMica("knn2d", "pymica_tests/data/config_test.json")
+        self.assertEqual("num_nearest must be 1 or greater.", cm.exception.args[0])
+
     def test_init_interpolate_id3d(self):
         """Test interpolation id3d"""
         config = {
@@ -573,6 +850,33 @@ class TestPyMica(unittest.TestCase):
         self.assertAlmostEqual(field[555, 444], 20.000, 2)
         self.assertAlmostEqual(field[185, 814], 9.999, 2)
 
+    def test_init_interpolate_mlr_knn2d(self):
+        """Test interpolate mlr+knn2d"""
+        config = {
+            "mlr+knn2d": {
+                "clusters": "None",
+                "id_power": 2,
+                "id_smoothing": 0.0,
+                "num_nearest": 4,
+                "interpolation_bounds": [260000, 4488100, 530000, 4750000],
+                "resolution": 270,
+                "EPSG": 25831,
+                "variables_files": {"altitude": "pymica_tests/data/tifs/altitude.tif"},
+            }
+        }
+
+        with open("pymica_tests/data/config_test.json", "w", encoding="utf-8") as f:
+            json.dump(config, f)
+            f.close()
+
+        mlr_knn2d = PyMica("mlr+knn2d", "pymica_tests/data/config_test.json")
+        field = mlr_knn2d.interpolate(self.data)
+
+        self.assertEqual(field.shape, (970, 1000))
+        self.assertAlmostEqual(field[925, 74], 50.000, 2)
+        self.assertAlmostEqual(field[555, 444], 20.000, 2)
+        self.assertAlmostEqual(field[185, 814], 9.999, 2)
+
     def test_init_interpolate_mlr_id3d(self):
         """Test interpolate mlr+i3d"""
         config = {
@@ -599,6 +903,49 @@ class TestPyMica(unittest.TestCase):
         self.assertAlmostEqual(field[555, 444], 20.000, 2)
         self.assertAlmostEqual(field[185, 814], 9.999, 2)
 
+    def test_interpolate_to_file(self):
+        """Test interpolate mlr+id2d written strip by strip into a file, with every
+        id_engine"""
+        for id_engine in ["exact", "fft", "tree"]:
+            with self.subTest(id_engine=id_engine):
+                config = {
+                    "mlr+id2d": {
+                        "clusters": "None",
+                        "id_power": 2,
+                        "id_smoothing": 0.0,
+                        "id_engine": id_engine,
+                        "interpolation_bounds": [260000, 4488100, 530000, 4750000],
+                        "resolution": 270,
+                        "EPSG": 25831,
+                        "variables_files": {
+                            "altitude": "pymica_tests/data/tifs/altitude.tif"
+                        },
+                    }
+                }
+
+                with open(
+                    "pymica_tests/data/config_test.json", "w", encoding="utf-8"
+                ) as f:
+                    json.dump(config, f)
+                    f.close()
+
+                mlr_id2d = PyMica("mlr+id2d", "pymica_tests/data/config_test.json")
+                field = mlr_id2d.interpolate(self.data)
+
+                mlr_id2d.interpolate_to_file(
+                    self.data, "pymica_tests/data/tifs/strips.tif", strip_rows=100
+                )
+
+                d_s = gdal.Open("pymica_tests/data/tifs/strips.tif")
+                strips = d_s.ReadAsArray()
+                d_s = None
+                remove("pymica_tests/data/tifs/strips.tif")
+
+                self.assertEqual(strips.shape, (970, 1000))
+                self.assertTrue(
+                    np.allclose(strips, field.astype(np.float32), rtol=0, atol=1e-4)
+                )
+
     def test_init_interpolate_mlr_id3d_clusters(self):
         """Test init interpolation mlr+id3d with clusters"""
         config = {
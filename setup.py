@@ -2,6 +2,7 @@
 Run python setup.py --help for options
 '''
 import datetime
+import sys
 
 import numpy
 import setuptools
@@ -25,13 +26,44 @@ else:
     has_cython = True
     ext_extention = 'pyx'
 
+# The prange loops are compiled with OpenMP when the compiler supports it.
+# Apple's clang ships without OpenMP, so the loops run serially there.
+if sys.platform == 'win32':
+    openmp_compile_args = ['/openmp']
+    openmp_link_args = []
+elif sys.platform == 'darwin':
+    openmp_compile_args = []
+    openmp_link_args = []
+else:
+    openmp_compile_args = ['-fopenmp']
+    openmp_link_args = ['-fopenmp']
+
+# The float32 kernels take square roots in their vectorised loops, which GCC
+# and clang only vectorise when they do not have to set errno.
+if sys.platform == 'win32':
+    vector_compile_args = []
+else:
+    vector_compile_args = ['-fno-math-errno']
+
 ext_modules = [Extension("pymica.methods.inverse_distance",
                          ['pymica/methods/inverse_distance.' + ext_extention],
-                         include_dirs=[numpy.get_include()]),
+                         include_dirs=[numpy.get_include()],
+                         extra_compile_args=(openmp_compile_args
+                                             + vector_compile_args),
+                         extra_link_args=openmp_link_args),
                Extension("pymica.methods.inverse_distance_3d",
                          ['pymica/methods/inverse_distance_3d.'
                           + ext_extention],
-                         include_dirs=[numpy.get_include()])]
+                         include_dirs=[numpy.get_include()],
+                         extra_compile_args=(openmp_compile_args
+                                             + vector_compile_args),
+                         extra_link_args=openmp_link_args),
+               Extension("pymica.methods.inverse_distance_tree",
+                         ['pymica/methods/inverse_distance_tree.'
+                          + ext_extention],
+                         include_dirs=[numpy.get_include()],
+                         extra_compile_args=openmp_compile_args,
+                         extra_link_args=openmp_link_args)]
 
 for e in ext_modules:
     e.cython_directives = {"embedsignature": True}